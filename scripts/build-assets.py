@@ -0,0 +1,200 @@
+# Copyright (c) 2025-2026 Gene Ressler
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Runs the asset generators: models, river, shaders, and help index. With --watch, keeps
+running and rebuilds whatever a changed input affects.
+
+Generators are imported once and run in process, so imports and parsed state such as
+material libraries stay warm between rebuilds. A changed model rebuilds only that
+model. A changed generator script is reloaded, with its sibling modules, before its
+generator runs again. Change detection polls file stats, which needs only the standard
+library and works the same on every platform.
+"""
+
+from pathlib import Path
+import argparse
+import contextlib
+import importlib.util
+import sys
+import time
+import traceback
+
+ROOT = Path(__file__).resolve().parent.parent
+FEATURES = ROOT / "src" / "app" / "features"
+# Seconds between polls for changed inputs.
+DEFAULT_INTERVAL = 0.25
+
+
+class Generator:
+    """
+    One generator script, run in its own directory. Inputs are glob patterns relative to
+    it. Ignored patterns match names of files matching those that aren't inputs, such as
+    generated files and other scripts, which must not trigger rebuilds.
+    """
+
+    def __init__(self, name, directory, script, inputs, ignored=()):
+        self.name = name
+        self.directory = directory
+        self.script = script
+        self.inputs = inputs
+        self.ignored = ignored
+        self.module = None
+
+    def scan(self):
+        """Returns the modification time and size of each input, keyed by path."""
+        stats = {}
+        for pattern in self.inputs:
+            for path in self.directory.glob(pattern):
+                if any(path.match(pattern) for pattern in self.ignored):
+                    continue
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                stats[path.resolve()] = (stat.st_mtime_ns, stat.st_size)
+        return stats
+
+    def load(self):
+        """
+        Imports the generator script and any sibling modules it imported, replacing
+        those loaded before so edits to them take effect.
+        """
+        for name, module in list(sys.modules.items()):
+            file = getattr(module, "__file__", None)
+            if file and Path(file).parent == self.directory:
+                del sys.modules[name]
+        if str(self.directory) not in sys.path:
+            sys.path.insert(0, str(self.directory))
+        spec = importlib.util.spec_from_file_location(
+            f"{self.name}_generator", self.directory / self.script
+        )
+        self.module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(self.module)
+
+    def build(self, changed):
+        """Runs the generator for the given changed inputs, or for everything if None."""
+        if self.module is None or any(path.suffix == ".py" for path in changed or ()):
+            self.load()
+        self.run(changed)
+
+    def run(self, changed):
+        self.module.main()
+
+
+class ModelsGenerator(Generator):
+    def run(self, changed):
+        obj_files = [path.name for path in changed or () if path.suffix == ".obj"]
+        if changed is None or len(obj_files) < len(changed):
+            # Material libraries and scripts can affect any model. The build cache
+            # skips those that are unaffected.
+            obj_files = []
+        self.module.main(obj_files)
+
+
+class ShadersGenerator(Generator):
+    def run(self, changed):
+        self.module.main(False, False)
+
+
+GENERATORS = [
+    ModelsGenerator(
+        "models",
+        FEATURES / "fly-thru" / "models",
+        "build.py",
+        ["*.obj", "*.mtl", "*.py"],
+        ["river.py", "benchmark-*.py", "preview-*.py", "test_*.py"],
+    ),
+    Generator("river", FEATURES / "fly-thru" / "models", "river.py", ["river.py"]),
+    ShadersGenerator(
+        "shaders",
+        FEATURES / "fly-thru" / "shaders",
+        "build.py",
+        ["*.vert", "*.frag", "*.h", "*.py", "constants.ts", "shader.service.ts"],
+        ["constants.h", "test_*.py"],
+    ),
+    Generator(
+        "help",
+        FEATURES / "help" / "indexer",
+        "build.py",
+        ["../help-topic/help-topic.component.html", "stop-words.txt", "build.py"],
+    ),
+]
+
+
+def build(generator, changed=None):
+    """Runs one generator, reporting failures rather than raising them."""
+    start = time.perf_counter()
+    try:
+        with contextlib.chdir(generator.directory):
+            generator.build(changed)
+    except (Exception, SystemExit):
+        print(f"{generator.name}: failed", file=sys.stderr)
+        traceback.print_exc()
+        return
+    print(f"{generator.name}: built in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+
+def changedPaths(before, after):
+    return [
+        path
+        for path in before.keys() | after.keys()
+        if before.get(path) != after.get(path)
+    ]
+
+
+def watch(generators, interval):
+    """Polls the generators' inputs, rebuilding for changes until interrupted."""
+    snapshots = [generator.scan() for generator in generators]
+    print("watching for changes. Ctrl-C to stop.")
+    while True:
+        time.sleep(interval)
+        for i, generator in enumerate(generators):
+            snapshot = generator.scan()
+            changed = changedPaths(snapshots[i], snapshot)
+            if not changed:
+                continue
+            for path in sorted(changed):
+                print(f"{path.relative_to(ROOT)}: changed")
+            build(generator, changed)
+            # Rescan so the generator's own writes aren't taken for edits.
+            snapshots[i] = generator.scan()
+
+
+def main(names, watching, interval):
+    unknown = set(names) - {generator.name for generator in GENERATORS}
+    if unknown:
+        raise Exception(f"Unknown generators: {', '.join(sorted(unknown))}")
+    generators = [g for g in GENERATORS if not names or g.name in names]
+    for generator in generators:
+        build(generator)
+    if watching:
+        try:
+            watch(generators, interval)
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Runs the asset generators, optionally watching for changes."
+    )
+    parser.add_argument(
+        "generators",
+        nargs="*",
+        help=f"Generators to run: {', '.join(g.name for g in GENERATORS)}. Default is all.",
+    )
+    parser.add_argument(
+        "-w",
+        "--watch",
+        action="store_true",
+        help="Keep running and rebuild as inputs change.",
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=DEFAULT_INTERVAL,
+        help=f"Seconds between checks for changes. Default is {DEFAULT_INTERVAL}.",
+    )
+    args = parser.parse_args()
+    main(args.generators, args.watch, args.interval)
@@ -0,0 +1,187 @@
+# Copyright (c) 2025-2026 Gene Ressler
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# Compares the chunked OBJ parser in build.py with the original regex-per-line loop on a
+# large synthetic OBJ file: a terrain-like grid with texture coordinates, normals, and
+# triangle faces. With --memory, compares peak memory of default and compact storage
+# instead. Run with python3 benchmark-obj-parser.py.
+
+import argparse
+import contextlib
+import io
+import math
+import os
+import re
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import build
+
+
+def legacyParse(processor, in_file, ignore_tex_coords=True):
+    """The original Processor.process parsing loop, storing results as Processor does now."""
+    material = {}
+    for line in in_file:
+        option_match = build.OPTION_PATTERN.match(line)
+        if option_match:
+            processor.options[option_match.group(1)] = option_match.group(2)
+        line = re.sub(r"#.*$", "", line)
+        parts = line.split()
+        if len(parts) == 0:
+            continue
+        match parts[0]:
+            case "v":
+                processor.vertices.append(tuple(float(x) for x in parts[1:]))
+            case "vn":
+                processor.normals.append(tuple(float(x) for x in parts[1:]))
+            case "vt":
+                if not ignore_tex_coords:
+                    processor.texcoords.append(tuple(float(x) for x in parts[1:]))
+            case "f":
+                face = []
+                for vertex_spec in parts[1:]:
+                    quad = tuple(
+                        int(i) if len(i) > 0 else None for i in vertex_spec.split("/")
+                    ) + (bool(material) and material["index"],)
+                    face.append(quad)
+                    quad_index = processor.quad_index.get(quad)
+                    if quad_index == None:
+                        processor.quad_index[quad] = len(processor.quad_index) + 1
+                triangles = processor.triangulate(face)
+                for triangle in triangles:
+                    processor.faces.append(
+                        tuple(processor.quad_index[face[i]] for i in triangle)
+                    )
+            case "s":
+                if parts[1] != "off":
+                    print(f"unknown smooth: {line}", file=sys.stderr)
+                continue
+            case "usemtl":
+                material = processor.get_material(parts[1])
+            case "g":
+                print(f"ignore: {line}", end='')
+            case _:
+                print(f"unknown command: {line}", file=sys.stderr)
+                continue
+
+
+def writeGrid(out_file, megabytes, width=1000):
+    """Writes rows of a rolling height field grid until the file reaches the given size."""
+    print("# Synthetic benchmark terrain", file=out_file)
+    print("# option: normals = index", file=out_file)
+    print("g terrain", file=out_file)
+    limit = megabytes * 1_000_000
+    row = 0
+    while out_file.tell() < limit:
+        lines = []
+        for i in range(width):
+            x, z = i * 0.5, row * 0.5
+            y = 3 * math.sin(0.05 * x) * math.cos(0.07 * z)
+            lines.append(f"v {x:.6f} {y:.6f} {z:.6f}\n")
+            lines.append(f"vt {i / width:.6f} {row / width:.6f}\n")
+            lines.append(f"vn {-0.15 * math.cos(0.05 * x):.6f} 1.000000 0.000000\n")
+        if row > 0:
+            # Vertices are 1-based. Two triangles per cell between this row and the last.
+            base = (row - 1) * width + 1
+            for i in range(width - 1):
+                a, b = base + i, base + i + 1
+                c, d = a + width, b + width
+                lines.append(f"f {a}/{a}/{a} {c}/{c}/{c} {b}/{b}/{b}\n")
+                lines.append(f"f {b}/{b}/{b} {c}/{c}/{c} {d}/{d}/{d} # cell {i}\n")
+        out_file.write("".join(lines))
+        row += 1
+
+
+def timedParse(parse, obj_file, compact=False):
+    processor = build.Processor(compact)
+    with open(obj_file, "r") as in_file, contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        parse(processor, in_file)
+        seconds = time.perf_counter() - start
+    return processor, seconds
+
+
+def meshContent(processor):
+    """Parsed mesh in a form that doesn't depend on the storage kind."""
+    return (
+        [processor.vertices[i] for i in range(len(processor.vertices))],
+        [processor.normals[i] for i in range(len(processor.normals))],
+        list(processor.quad_index.keys()),
+        processor.triangleIndices(),
+        processor.options,
+    )
+
+
+def compareSpeed(obj_file, size, line_count, skip_legacy):
+    print(f"{'parser':>8} {'seconds':>9} {'lines/s':>11} {'MB/s':>7}")
+    parsers = [("chunked", build.Processor.parse)]
+    if not skip_legacy:
+        parsers.append(("legacy", legacyParse))
+    contents = []
+    for name, parse in parsers:
+        processor, seconds = timedParse(parse, obj_file)
+        contents.append(meshContent(processor))
+        print(
+            f"{name:>8} {seconds:>9.2f} {line_count / seconds:>11.0f} {size / 1e6 / seconds:>7.1f}"
+        )
+    assert all(content == contents[0] for content in contents[1:])
+
+
+def compareMemory(obj_file):
+    """Peak and retained traced memory while parsing with each storage kind."""
+    print(f"{'storage':>8} {'seconds':>9} {'peak MB':>9} {'kept MB':>9}")
+    contents = []
+    for name, compact in (("default", False), ("compact", True)):
+        tracemalloc.start()
+        processor, seconds = timedParse(build.Processor.parse, obj_file, compact)
+        kept, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{name:>8} {seconds:>9.2f} {peak / 1e6:>9.1f} {kept / 1e6:>9.1f}")
+        contents.append(meshContent(processor))
+        del processor
+    assert contents[0] == contents[1]
+
+
+def main(megabytes, obj_file, skip_legacy, memory):
+    temp_file = None
+    if obj_file is None:
+        with tempfile.NamedTemporaryFile("w", suffix=".obj", delete=False) as temp_file:
+            writeGrid(temp_file, megabytes)
+        obj_file = temp_file.name
+    try:
+        size = os.path.getsize(obj_file)
+        with open(obj_file, "r") as in_file:
+            line_count = sum(1 for _ in in_file)
+        print(f"{obj_file}: {size / 1e6:.1f} MB, {line_count} lines")
+        if memory:
+            compareMemory(obj_file)
+        else:
+            compareSpeed(obj_file, size, line_count, skip_legacy)
+    finally:
+        if temp_file is not None:
+            os.remove(temp_file.name)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmarks OBJ parsing.")
+    parser.add_argument(
+        "--megabytes",
+        type=int,
+        default=100,
+        help="Size of the synthetic OBJ file.",
+    )
+    parser.add_argument(
+        "--file", help="Parse this OBJ file rather than a synthetic one."
+    )
+    parser.add_argument(
+        "--skip-legacy", action="store_true", help="Time only the chunked parser."
+    )
+    parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="Compare memory use of default and compact storage rather than parse speed.",
+    )
+    args = parser.parse_args()
+    main(args.megabytes, args.file, args.skip_legacy, args.memory)
@@ -0,0 +1,125 @@
+# Copyright (c) 2025-2026 Gene Ressler
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# Compares triangulator.py with the original O(n^3) ear clipper on large random star-shaped
+# polygons, like the cap faces of wheel rims and tower footprints. Also times polygons
+# with holes, which the original can't handle. Run with python3 benchmark-triangulator.py.
+
+import argparse
+import math
+import random
+import time
+
+import triangulator
+
+
+def isLeftTurn(ax, ay, bx, by):
+    return ax * by - ay * bx >= 0
+
+
+def areSegmentsLeftTurn(r, q, p):
+    return isLeftTurn(q[0] - r[0], q[1] - r[1], p[0] - q[0], p[1] - q[1])
+
+
+def isPointInTriangle(p, t0, t1, t2):
+    return (
+        areSegmentsLeftTurn(t0, t1, p)
+        and areSegmentsLeftTurn(t1, t2, p)
+        and areSegmentsLeftTurn(t2, t0, p)
+    )
+
+
+def legacyTriangulate(points):
+    """The original Processor.triangulate loop, minus 3d flattening."""
+    triangles = []
+    flat_vertices = [(p, i) for i, p in enumerate(points)]
+    while len(flat_vertices) >= 3:
+        r, q = flat_vertices[-2], flat_vertices[-1]
+        for p in flat_vertices:
+            if areSegmentsLeftTurn(r[0], q[0], p[0]) and not any(
+                isPointInTriangle(x[0], r[0], q[0], p[0])
+                for x in flat_vertices
+                if x != q and x != r and x != p
+            ):
+                triangles.append((r[1], q[1], p[1]))
+                flat_vertices.remove(q)
+                break
+            r, q = q, p
+    return triangles
+
+
+def star(n, rng, center=(0, 0), radius=1.0):
+    """Counterclockwise star-shaped polygon with random radii, about half of them reflex."""
+    points = []
+    for i in range(n):
+        r = radius * (0.5 + 0.5 * rng.random())
+        theta = 2 * math.pi * i / n
+        points.append(
+            (center[0] + r * math.cos(theta), center[1] + r * math.sin(theta))
+        )
+    return points
+
+
+def area(points, triangles):
+    total = 0
+    for a, b, c in triangles:
+        (ax, ay), (bx, by), (cx, cy) = points[a], points[b], points[c]
+        total += 0.5 * ((bx - ax) * (cy - ay) - (by - ay) * (cx - ax))
+    return total
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def main(sizes, legacy_limit, seed):
+    rng = random.Random(seed)
+    print(
+        f"{'vertices':>9} {'holes':>6} {'new (s)':>10} {'legacy (s)':>11} {'speedup':>8}"
+    )
+    for n in sizes:
+        points = star(n, rng)
+        triangles, seconds = timed(triangulator.triangulate, points)
+        assert len(triangles) == n - 2
+        legacy = "-"
+        speedup = "-"
+        if n <= legacy_limit:
+            legacy_triangles, legacy_seconds = timed(legacyTriangulate, points)
+            assert math.isclose(area(points, triangles), area(points, legacy_triangles))
+            legacy = f"{legacy_seconds:.3f}"
+            speedup = f"{legacy_seconds / seconds:.0f}x"
+        print(f"{n:>9} {0:>6} {seconds:>10.3f} {legacy:>11} {speedup:>8}")
+    for n in sizes:
+        # Ring of small star-shaped holes inside a big one.
+        outer = star(n // 2, rng, radius=10)
+        hole_count = 8
+        holes = [
+            star(n // (2 * hole_count), rng, (2 * math.cos(t), 2 * math.sin(t)), 0.7)
+            for t in (2 * math.pi * i / hole_count for i in range(hole_count))
+        ]
+        points = outer + [p for hole in holes for p in hole]
+        triangles, seconds = timed(triangulator.triangulate, outer, holes)
+        assert len(triangles) == len(points) + 2 * hole_count - 2
+        expected_area = area(outer, [(0, i - 1, i) for i in range(2, len(outer))])
+        for hole in holes:
+            expected_area -= area(hole, [(0, i - 1, i) for i in range(2, len(hole))])
+        assert math.isclose(area(points, triangles), expected_area)
+        print(f"{len(points):>9} {hole_count:>6} {seconds:>10.3f} {'-':>11} {'-':>8}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmarks polygon triangulation.")
+    parser.add_argument(
+        "sizes", type=int, nargs="*", default=[250, 500, 1000, 2000, 5000, 10000]
+    )
+    parser.add_argument(
+        "--legacy-limit",
+        type=int,
+        default=1000,
+        help="Largest polygon to give the legacy triangulator.",
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    main(args.sizes, args.legacy_limit, args.seed)
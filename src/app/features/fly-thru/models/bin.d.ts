@@ -0,0 +1,8 @@
+/* Copyright (c) 2025-2026 Gene Ressler
+   SPDX-License-Identifier: GPL-3.0-or-later */
+
+/** Binary mesh files from `build.py --binary`, imported as bytes. See the loader option in angular.json. */
+declare module '*.bin' {
+  const bytes: Uint8Array;
+  export default bytes;
+}
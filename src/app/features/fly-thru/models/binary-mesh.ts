@@ -0,0 +1,63 @@
+/* Copyright (c) 2025-2026 Gene Ressler
+   SPDX-License-Identifier: GPL-3.0-or-later */
+
+import { MeshData } from '../rendering/mesh-rendering.service';
+
+/** Typed array constructors allowed in binary mesh data. */
+const ARRAY_TYPES = {
+  Int8Array,
+  Uint8Array,
+  Int16Array,
+  Uint16Array,
+  Int32Array,
+  Uint32Array,
+  Float32Array,
+};
+
+export type BinaryMeshArrayType = keyof typeof ARRAY_TYPES;
+
+/** Location of one typed array within a binary mesh file. Length is in elements. */
+export type BinaryMeshSection = {
+  type: BinaryMeshArrayType;
+  byteOffset: number;
+  length: number;
+};
+
+/** Descriptor of a binary mesh file emitted by `build.py --binary`. */
+export type BinaryMeshDescriptor = {
+  /** Path of the file relative to the module importing it. */
+  url: string;
+  byteLength: number;
+  sections: { [name: string]: BinaryMeshSection };
+};
+
+// "BDMS" read as a little-endian uint32.
+const MAGIC = 0x534d4442;
+const VERSION = 1;
+
+/** Returns mesh data with typed array views over the given buffer's sections. Nothing is copied. */
+export function buildBinaryMeshData(descriptor: BinaryMeshDescriptor, buffer: ArrayBuffer): MeshData {
+  const header = new DataView(buffer);
+  if (
+    buffer.byteLength !== descriptor.byteLength ||
+    header.getUint32(0, true) !== MAGIC ||
+    header.getUint32(4, true) !== VERSION
+  ) {
+    throw new Error(`Bad binary mesh data: ${descriptor.url}`);
+  }
+  const meshData: { [name: string]: ArrayBufferView } = {};
+  for (const [name, section] of Object.entries(descriptor.sections)) {
+    meshData[name] = new ARRAY_TYPES[section.type](buffer, section.byteOffset, section.length);
+  }
+  return meshData as unknown as MeshData;
+}
+
+/**
+ * Returns mesh data with typed array views over the bytes of a binary mesh file imported by the
+ * app build's binary loader. Copies only if the bytes don't fill their buffer.
+ */
+export function importBinaryMeshData(descriptor: BinaryMeshDescriptor, bytes: Uint8Array): MeshData {
+  const buffer =
+    bytes.byteOffset === 0 && bytes.byteLength === bytes.buffer.byteLength ? bytes.buffer : bytes.slice().buffer;
+  return buildBinaryMeshData(descriptor, buffer as ArrayBuffer);
+}
@@ -0,0 +1,76 @@
+# Copyright (c) 2025-2026 Gene Ressler
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Packs named typed arrays into a little-endian binary container that binary-mesh.ts can wrap
+with typed array views without copying.
+
+Layout:
+  0: magic "BDMS", uint32 version, uint32 section count, uint32 total byte length
+  16: one 32-byte table entry per section:
+      name (20 bytes ASCII, zero padded), uint32 WebGL type, uint32 byte offset, uint32 length
+  Section data follows, each starting at a multiple of ALIGNMENT.
+"""
+
+from array import array
+import struct
+import sys
+
+MAGIC = b"BDMS"
+VERSION = 1
+ALIGNMENT = 16
+HEADER_FORMAT = "<4sIII"
+ENTRY_FORMAT = "<20sIII"
+
+# Typed array name -> (array module type code, WebGL type enum).
+ARRAY_TYPES = {
+    "Int8Array": ("b", 0x1400),
+    "Uint8Array": ("B", 0x1401),
+    "Int16Array": ("h", 0x1402),
+    "Uint16Array": ("H", 0x1403),
+    "Int32Array": ("i", 0x1404),
+    "Uint32Array": ("I", 0x1405),
+    "Float32Array": ("f", 0x1406),
+}
+
+
+def align(offset):
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+def pack(sections):
+    """
+    Packs (name, typed array name, flat values) triples. Returns the container bytes and a
+    table of (name, typed array name, byte offset, length) for each section.
+    """
+    table = []
+    data = []
+    offset = align(
+        struct.calcsize(HEADER_FORMAT) + len(sections) * struct.calcsize(ENTRY_FORMAT)
+    )
+    for name, array_type, values in sections:
+        type_code, _ = ARRAY_TYPES[array_type]
+        items = array(type_code, values)
+        if sys.byteorder != "little":
+            items.byteswap()
+        table.append((name, array_type, offset, len(items)))
+        data.append((offset, items.tobytes()))
+        offset = align(offset + len(data[-1][1]))
+    result = bytearray(offset)
+    struct.pack_into(HEADER_FORMAT, result, 0, MAGIC, VERSION, len(sections), offset)
+    entry_offset = struct.calcsize(HEADER_FORMAT)
+    for name, array_type, byte_offset, length in table:
+        gl_type = ARRAY_TYPES[array_type][1]
+        struct.pack_into(
+            ENTRY_FORMAT,
+            result,
+            entry_offset,
+            name.encode("ascii"),
+            gl_type,
+            byte_offset,
+            length,
+        )
+        entry_offset += struct.calcsize(ENTRY_FORMAT)
+    for byte_offset, items in data:
+        result[byte_offset : byte_offset + len(items)] = items
+    return bytes(result), table
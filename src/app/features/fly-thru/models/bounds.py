@@ -0,0 +1,151 @@
+# Copyright (c) 2025-2026 Gene Ressler
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Bounding volumes for culling: boxes, spheres, and meshlets, which are clusters of
+adjacent triangles with their own spheres and normal cones.
+"""
+
+import math
+
+# Normal cones wider than this (as the minimum cosine between the axis and a triangle
+# normal) can't cull anything useful, so they're marked to never cull.
+MIN_CONE_COSINE = 0.1
+
+
+def sub(a, b):
+    return (a[0] - b[0], a[1] - b[1], a[2] - b[2])
+
+
+def cross(a, b):
+    return (
+        a[1] * b[2] - a[2] * b[1],
+        a[2] * b[0] - a[0] * b[2],
+        a[0] * b[1] - a[1] * b[0],
+    )
+
+
+def dot(a, b):
+    return a[0] * b[0] + a[1] * b[1] + a[2] * b[2]
+
+
+def distance(a, b):
+    return math.sqrt(dot(sub(a, b), sub(a, b)))
+
+
+def unit(v):
+    length = math.sqrt(dot(v, v))
+    return (v[0] / length, v[1] / length, v[2] / length) if length > 0 else None
+
+
+def boundingBox(points):
+    """Returns the (min, max) corners of the given points."""
+    return (
+        tuple(min(p[i] for p in points) for i in range(3)),
+        tuple(max(p[i] for p in points) for i in range(3)),
+    )
+
+
+def boundingSphere(points):
+    """
+    Returns a (center, radius) sphere containing the given points: the smaller of the
+    one around the bounding box and one grown by Ritter's method.
+    """
+    lo, hi = boundingBox(points)
+    box_center = tuple(0.5 * (lo[i] + hi[i]) for i in range(3))
+    box_radius = max(distance(box_center, p) for p in points)
+    # Ritter: start with the sphere on two far apart points, then grow to cover others.
+    a = max(points, key=lambda p: distance(points[0], p))
+    b = max(points, key=lambda p: distance(a, p))
+    center = tuple(0.5 * (a[i] + b[i]) for i in range(3))
+    radius = 0.5 * distance(a, b)
+    for p in points:
+        d = distance(center, p)
+        if d > radius:
+            new_radius = 0.5 * (radius + d)
+            shift = (new_radius - radius) / d
+            center = tuple(center[i] + (p[i] - center[i]) * shift for i in range(3))
+            radius = new_radius
+    # Cover rounding error.
+    radius = max(radius, max(distance(center, p) for p in points))
+    return (box_center, box_radius) if box_radius <= radius else (center, radius)
+
+
+def buildMeshlets(triangles, positions, max_triangles):
+    """
+    Groups triangles, (a, b, c) indices of positions, into meshlets of up to max_triangles
+    adjacent ones. Each grows from the first unused triangle by adding the neighbor that
+    needs the fewest new vertices, breaking ties by nearness to the meshlet's centroid to
+    keep it round. Triangles sharing a position are adjacent even across normal seams.
+    Returns the meshlets as lists of triangles.
+    """
+    centroids = [
+        tuple(sum(positions[v][i] for v in triangle) / 3 for i in range(3))
+        for triangle in triangles
+    ]
+    vertex_triangles = {}
+    for t, triangle in enumerate(triangles):
+        for v in triangle:
+            vertex_triangles.setdefault(positions[v], []).append(t)
+    used = [False] * len(triangles)
+    meshlets = []
+    next_unused = 0
+    while next_unused < len(triangles):
+        if used[next_unused]:
+            next_unused += 1
+            continue
+        meshlet = []
+        vertices = set()
+        candidates = {next_unused}
+        total = [0.0, 0.0, 0.0]
+        while candidates and len(meshlet) < max_triangles:
+            centroid = tuple(x / max(1, len(meshlet)) for x in total)
+            best = min(
+                candidates,
+                key=lambda t: (
+                    sum(positions[v] not in vertices for v in triangles[t]),
+                    dot(sub(centroids[t], centroid), sub(centroids[t], centroid)),
+                    t,
+                ),
+            )
+            candidates.discard(best)
+            used[best] = True
+            meshlet.append(triangles[best])
+            for i in range(3):
+                total[i] += centroids[best][i]
+            for v in triangles[best]:
+                p = positions[v]
+                if p not in vertices:
+                    vertices.add(p)
+                    candidates.update(t for t in vertex_triangles[p] if not used[t])
+        meshlets.append(meshlet)
+    return meshlets
+
+
+def normalCone(triangles, positions, center):
+    """
+    Returns the (apex, axis, cutoff) of a cone containing the normals of the given
+    triangles. The whole cluster faces away from an eye where
+    dot(unit(apex - eye), axis) >= cutoff. Cutoff is 1 where no eye qualifies.
+    """
+    normals = []
+    for a, b, c in triangles:
+        n = unit(
+            cross(sub(positions[b], positions[a]), sub(positions[c], positions[a]))
+        )
+        if n is not None:
+            normals.append((n, positions[a]))
+    axis = (
+        unit(tuple(sum(n[i] for n, _ in normals) for i in range(3)))
+        if normals
+        else None
+    )
+    if axis is None:
+        return center, (0.0, 0.0, 0.0), 1.0
+    min_cosine = min(1.0, min(dot(axis, n) for n, _ in normals))
+    if min_cosine <= MIN_CONE_COSINE:
+        return center, axis, 1.0
+    # Back the apex off from the center so every triangle's plane is in front of it.
+    offset = max(dot(sub(center, p), n) / dot(axis, n) for n, p in normals)
+    apex = tuple(center[i] - axis[i] * offset for i in range(3))
+    return apex, axis, math.sqrt(1 - min_cosine * min_cosine)
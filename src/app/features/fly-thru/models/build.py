@@ -1,11 +1,85 @@
 # Copyright (c) 2025-2026 Gene Ressler
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+import argparse
+import ast
+import contextlib
+import functools
+import hashlib
+import io
+import json
 import math
 import os
 import re
+import struct
 import sys
+import traceback
+
+import binary_mesh
+import bounds
+import cleanup
+import mesh_storage
+import quantize
+import simplify
+import triangulator
+import vertex_cache
+
+# Build manifest recording the input hash of each model's last successful build.
+CACHE_FILE = ".mesh-cache.json"
+# Per-model option directives are OBJ comments like "# option: normals = index":
+#   materialRefs = no      Omit material references.
+#   creaseAngle = 60       Don't smooth normals across angles over 60 degrees within
+#                          smoothing groups. Default is 180, smoothing everything.
+#   normals = index        Emit normal indices rather than normal vectors.
+#   vertexCache = forsyth  Reorder triangles, then vertices, for the GPU vertex cache.
+#   quantize = oct8        Emit int16 positions normalized to the bounding box, with
+#                          scale and offset, and octahedral normals in 2 int8s.
+#   quantize = oct16       Same, but with octahedral normals in 2 int16s. Quantized
+#                          meshes can only be drawn as colored meshes.
+#   bigIndices = uint32    Past MAX_UINT16_VERTICES vertices, emit 32-bit indices. Default.
+#   bigIndices = split     Past MAX_UINT16_VERTICES vertices, split into sub-meshes with
+#                          16-bit indices and emit their draw ranges as subMeshes.
+#   lod = 50,25,10         Also emit indices of simplified levels of detail with these
+#                          percentages of the triangles, sharing the vertex data.
+#   sortMaterials = yes    Sort triangles by material and emit drawRanges of material,
+#                          first index, and index count.
+#   meshlets = 64          Group triangles into clusters of up to 64 neighbors and emit
+#                          their index ranges with bounding spheres and normal cones.
+#   cleanup = yes          Weld positions nearer than weldDistance, then drop degenerate
+#                          and duplicate triangles and unused vertices. The --cleanup
+#                          flag makes yes the default.
+#   weldDistance = 0.001   Welding distance for cleanup. Default DEFAULT_WELD_DISTANCE.
+OPTION_PATTERN = re.compile(r"#\s*option:\s*(\w+)\s*=\s*([\w.,]+)")
+# Most vertices 16-bit indices can reach. WebGL 2 reserves 0xffff for primitive restart.
+MAX_UINT16_VERTICES = 0xFFFF
+# Approximate characters read per chunk of OBJ lines.
+CHUNK_SIZE = 1 << 20
+# Most face vertex specs the parser remembers before starting over.
+SPEC_CACHE_LIMIT = 1 << 12
+# Cleanup welding distance in model units (meters), well under the emitted precision.
+DEFAULT_WELD_DISTANCE = 1e-4
+# Sections holding one row per vertex, for reporting bytes saved by cleanup.
+VERTEX_SECTIONS = {"positions", "texCoords", "normalRefs", "normals", "materialRefs"}
+
+
+# Parsed material libraries keyed by absolute path and modification time.
+MATERIALS_LIBRARIES = {}
+
+
+def loadMaterialsLibrary(mtl_file_name):
+    """Returns the named material library, parsing each only once per process."""
+    key = (os.path.abspath(mtl_file_name), os.stat(mtl_file_name).st_mtime_ns)
+    material_lib = MATERIALS_LIBRARIES.get(key)
+    if material_lib is None:
+        material_lib = MATERIALS_LIBRARIES[key] = MaterialsLibrary(mtl_file_name)
+    return material_lib
+
+
+def seedMaterialsLibraries(material_libs):
+    """Worker process initializer that shares material libraries parsed by the parent."""
+    MATERIALS_LIBRARIES.update(material_libs)
 
 
 class MaterialsLibrary:
@@ -48,8 +122,11 @@ class MaterialsLibrary:
     def get(self, name):
         return self.materials[name]
 
+    def ts_file_name(self):
+        return Path(self.file_name).with_suffix(".ts").name
+
     def emit(self):
-        with open(Path(self.file_name).with_suffix(".ts").name, "w") as out_file:
+        with io.StringIO() as out_file:
             print("export const MATERIAL_CONFIG = new Float32Array([", file=out_file)
             print("  // Global alpha and padding", file=out_file)
             print("  1.0, 0, 0, 0,", file=out_file)
@@ -64,9 +141,36 @@ class MaterialsLibrary:
             for name, material in self.materials.items():
                 print(f"  {name} = {material["index"]},", file=out_file)
             print("};", file=out_file)
+            writeIfChanged(self.ts_file_name(), out_file.getvalue())
+
+
+def writeIfChanged(file_name, content):
+    """
+    Writes text or bytes to the named file unless it already has that content. Returns
+    whether written.
+    """
+    mode = "b" if isinstance(content, bytes) else ""
+    try:
+        with open(file_name, "r" + mode) as in_file:
+            if in_file.read() == content:
+                return False
+    except FileNotFoundError:
+        pass
+    with open(file_name, "w" + mode) as out_file:
+        out_file.write(content)
+    return True
+
+
+def hashFile(file_name):
+    with open(file_name, "rb") as in_file:
+        return hashlib.sha256(in_file.read()).hexdigest()
 
 
 def unitNormal(polygon):
+    """
+    Returns the polygon's unit normal by Newell's method, or +z if it has no area. Then
+    it's degenerate in every projection, so any will do.
+    """
     normal = [0, 0, 0]
     if len(polygon) < 3:
         return normal
@@ -77,6 +181,8 @@ def unitNormal(polygon):
         normal[2] += (vq[0] - vp[0]) * (vq[1] + vp[1])
         vq = vp
     normalLen = math.sqrt(normal[0] ** 2 + normal[1] ** 2 + normal[2] ** 2)
+    if normalLen == 0:
+        return (0, 0, 1)
     return tuple(c / normalLen for c in normal)
 
 
@@ -98,177 +204,769 @@ def buildFlattenToXyMatrix(n):
     )
 
 
-def dot(a, b):
-    return a[0] * b[0] + a[1] * b[1] + a[2] * b[2]
+def refArrayType(refs):
+    """Returns the smallest unsigned typed array name holding the given reference rows."""
+    return (
+        "Uint16Array"
+        if max((r[0] for r in refs), default=0) <= 0xFFFF
+        else "Uint32Array"
+    )
 
 
-def mulVec(a, x):
-    return (dot(a[0], x), dot(a[1], x), dot(a[2], x))
+def splitMesh(triangles, max_vertices):
+    """
+    Splits triangles, in order, into sub-meshes each using at most max_vertices vertices.
+    Returns the vertex order, with shared vertices repeated in each sub-mesh that uses
+    them, the triangles indexed relative to their sub-mesh's base vertex, and a
+    (first index, index count, base vertex, vertex count) draw range per sub-mesh.
+    """
+    order = []
+    local_triangles = []
+    ranges = []
+    local_index = {}
+    first_triangle = 0
 
+    def close():
+        index_count = 3 * (len(local_triangles) - first_triangle)
+        base_vertex = len(order) - len(local_index)
+        ranges.append((3 * first_triangle, index_count, base_vertex, len(local_index)))
 
-def isLeftTurn(ax, ay, bx, by):
-    return ax * by - ay * bx >= 0
+    for triangle in triangles:
+        new_count = len(set(v for v in triangle if v not in local_index))
+        if len(local_index) + new_count > max_vertices:
+            close()
+            first_triangle = len(local_triangles)
+            local_index = {}
+        for v in triangle:
+            if v not in local_index:
+                local_index[v] = len(local_index)
+                order.append(v)
+        local_triangles.append(tuple(local_index[v] for v in triangle))
+    close()
+    return order, local_triangles, ranges
 
 
-def areSegmentsLeftTurn(r, q, p):
-    return isLeftTurn(q[0] - r[0], q[1] - r[1], p[0] - q[0], p[1] - q[1])
+def dot(a, b):
+    return a[0] * b[0] + a[1] * b[1] + a[2] * b[2]
 
 
-def isPointInTriangle(p, t0, t1, t2):
-    return (
-        areSegmentsLeftTurn(t0, t1, p)
-        and areSegmentsLeftTurn(t1, t2, p)
-        and areSegmentsLeftTurn(t2, t0, p)
-    )
+def mulVec(a, x):
+    return (dot(a[0], x), dot(a[1], x), dot(a[2], x))
 
 
 class Processor:
-    def __init__(self):
-        self.vertices = [()]
-        self.texcoords = [()]
-        self.normals = [()]
-        # A quad consists of indices: (vertex, texcoord, normal, material).
-        self.quads = [()]
-        self.quad_index = {}
-        self.faces = [()]
+    def __init__(self, compact=False, cleanup=False):
+        """
+        Compact storage packs coordinates, quads, and triangles into arrays. It's slower
+        but uses a fraction of the memory for big meshes. Cleanup is the default for the
+        cleanup option.
+        """
+        self.cleanup = cleanup
+        if compact:
+            self.vertices = mesh_storage.CoordinateArray(3)
+            self.texcoords = mesh_storage.CoordinateArray(2)
+            self.normals = mesh_storage.CoordinateArray(3)
+            self.quad_index = mesh_storage.PackedQuadIndex()
+            self.faces = mesh_storage.TriangleArray()
+        else:
+            self.vertices = [()]
+            self.texcoords = [()]
+            self.normals = [()]
+            # A quad consists of indices: (vertex, texcoord, normal, material).
+            # Quads map to 1-based indices in insertion order.
+            self.quad_index = {}
+            # Triangles as triples of quad indices.
+            self.faces = []
         self.material_lib = None
         self.options = {}
+        # Levels of detail as (percentage, triangles, geometric error).
+        self.lods = []
+        # Meshlets as (first index, index count, sphere center, radius, apex, axis, cutoff).
+        self.meshlets = []
+        # Material sorted triangles as (material, first index, index count).
+        self.draw_ranges = []
+        # Smoothing groups as (first triangle, group) for each run of triangles. Zero is off.
+        self.smoothing_runs = [(0, 0)]
+        # Vertex and triangle counts before cleanup, if it was done.
+        self.cleanup_counts = None
 
     def get_material(self, name):
         return self.material_lib and self.material_lib.get(name)
 
     def triangulate(self, face):
+        """Returns triangles as index triples into the given face's quads."""
         if len(face) <= 3:
-            return [face]
-        triangles = []
+            return [tuple(range(len(face)))]
         vertices = tuple(self.vertices[quad[0]] for quad in face)
         n = unitNormal(vertices)
         # Flatten to 2d in the x-y plane
         m = buildFlattenToXyMatrix(n)
-        flat_vertices = [(mulVec(m, v)[0:2], i) for i, v in enumerate(vertices)]
-        while len(flat_vertices) >= 3:
-            # Find an ear. Assumes no holes or self-crossings.
-            r, q = flat_vertices[-2], flat_vertices[-1]
-            for p in flat_vertices:
-                if areSegmentsLeftTurn(r[0], q[0], p[0]) and not any(
-                    isPointInTriangle(x[0], r[0], q[0], p[0])
-                    for x in flat_vertices
-                    if x != q and x != r and x != p
-                ):
-                    # r, q, p is a left turn, so q is an ear
-                    triangles.append([face[r[1]], face[q[1]], face[p[1]]])
-                    flat_vertices.remove(q)
-                    break
-                r, q = q, p
-        return triangles
-
-    def process(self, in_file, out_file, ignore_tex_coords=True):
+        flat_vertices = [mulVec(m, v)[0:2] for v in vertices]
+        return triangulator.triangulate(flat_vertices)
+
+    def process(self, in_file, out_file, ignore_tex_coords=True, bin_path=None):
+        """
+        Compiles OBJ file content to TypeScript mesh data. See emit() for the meaning of
+        the binary path and the return value.
+        """
         print(f"{in_file.name} -> {out_file.name}:")
-        material = {}
-        for line in in_file:
-            option_match = re.match(r"#\s*option:\s*(\w+)\s*=\s*(\w+)", line)
-            if option_match:
-                self.options[option_match.group(1)] = option_match.group(2)
-            line = re.sub(r"#.*$", "", line)
-            parts = line.split()
-            if len(parts) == 0:
-                continue
-            match parts[0]:
-                case "v":
-                    self.vertices.append(tuple(float(x) for x in parts[1:]))
-                case "vn":
-                    self.normals.append(tuple(float(x) for x in parts[1:]))
-                case "vt":
-                    if not ignore_tex_coords:
-                        self.texcoords.append(tuple(float(x) for x in parts[1:]))
-                case "f":
+        self.parse(in_file, ignore_tex_coords)
+        self.transform()
+        return self.emit(in_file.name, out_file, ignore_tex_coords, bin_path)
+
+    def parse(self, in_file, ignore_tex_coords=True):
+        """
+        Reads OBJ file content in large chunks of lines. Hot commands are dispatched with
+        plain string tests rather than regular expressions, and each face vertex spec is
+        parsed only once per material.
+        """
+        vertices = self.vertices
+        normals = self.normals
+        texcoords = self.texcoords
+        quad_index = self.quad_index
+        faces = self.faces
+        material_index = False
+        # Vertex spec -> (quad, index) for the current material.
+        spec_quads = {}
+        for lines in iter(lambda: in_file.readlines(CHUNK_SIZE), []):
+            for line in lines:
+                if "#" in line:
+                    if line[0] == "#":
+                        option_match = OPTION_PATTERN.match(line)
+                        if option_match:
+                            self.options[option_match.group(1)] = option_match.group(2)
+                    newline = "\n" if line.endswith("\n") else ""
+                    line = line[: line.index("#")] + newline
+                parts = line.split()
+                if len(parts) == 0:
+                    continue
+                command = parts[0]
+                if command == "v":
+                    vertices.append(tuple(map(float, parts[1:])))
+                elif command == "f":
                     face = []
+                    refs = []
                     for vertex_spec in parts[1:]:
-                        quad = tuple(
-                            int(i) if len(i) > 0 else None
-                            for i in vertex_spec.split("/")
-                        ) + (bool(material) and material["index"],)
-                        face.append(quad)
-                        quad_index = self.quad_index.get(quad)
-                        if quad_index == None:
-                            self.quad_index[quad] = len(self.quads)
-                            self.quads.append(quad)
-                    triangles = self.triangulate(face)
-                    self.faces.extend(triangles)
-                case "s":
-                    if parts[1] != "off":
-                        print(f"unknown smooth: {line}", file=sys.stderr)
-                    continue
-                case "mtllib":
-                    if self.material_lib:
-                        raise Exception(
-                            f"One material lib allowed. Found second: {parts[1]}"
-                        )
-                    self.material_lib = MaterialsLibrary(parts[1])
-                case "usemtl":
-                    material = self.get_material(parts[1])
-                case "g":
-                    print(f"ignore: {line}", end='')
-                case _:
-                    print(f"unknown command: {line}", file=sys.stderr)
-                    continue
+                        spec_quad = spec_quads.get(vertex_spec)
+                        if spec_quad is None:
+                            quad = tuple(
+                                int(i) if i else None for i in vertex_spec.split("/")
+                            ) + (material_index,)
+                            index = quad_index.get(quad)
+                            if index is None:
+                                index = len(quad_index) + 1
+                                quad_index[quad] = index
+                            if len(spec_quads) >= SPEC_CACHE_LIMIT:
+                                spec_quads = {}
+                            spec_quad = spec_quads[vertex_spec] = (quad, index)
+                        face.append(spec_quad[0])
+                        refs.append(spec_quad[1])
+                    for triangle in self.triangulate(face):
+                        faces.append(tuple(refs[i] for i in triangle))
+                elif command == "vn":
+                    normals.append(tuple(map(float, parts[1:])))
+                elif command == "vt":
+                    if not ignore_tex_coords:
+                        texcoords.append(tuple(map(float, parts[1:])))
+                else:
+                    match command:
+                        case "s":
+                            if parts[1] == "off":
+                                group = 0
+                            elif parts[1].isdigit():
+                                group = int(parts[1])
+                            else:
+                                print(f"unknown smooth: {line}", file=sys.stderr)
+                                continue
+                            if group != self.smoothing_runs[-1][1]:
+                                self.smoothing_runs.append((len(faces), group))
+                        case "mtllib":
+                            if self.material_lib:
+                                raise Exception(
+                                    f"One material lib allowed. Found second: {parts[1]}"
+                                )
+                            self.material_lib = loadMaterialsLibrary(parts[1])
+                        case "usemtl":
+                            material = self.get_material(parts[1])
+                            material_index = bool(material) and material["index"]
+                            spec_quads = {}
+                        case "g":
+                            print(f"ignore: {line}", end='')
+                        case _:
+                            print(f"unknown command: {line}", file=sys.stderr)
+
+    def triangleIndices(self):
+        """Returns triangles as (a, b, c) zero-based indices into the quad order."""
+        return [tuple(i - 1 for i in triangle) for triangle in self.faces]
+
+    def setMesh(self, quads, triangles):
+        """Replaces the quads, in emission order, and triangles indexing them."""
+        self.quad_index = type(self.quad_index)()
+        for i, quad in enumerate(quads):
+            self.quad_index[quad] = i + 1
+        self.faces = type(self.faces)()
+        for triangle in triangles:
+            self.faces.append(tuple(i + 1 for i in triangle))
+
+    def transform(self):
+        """Applies optional transformations selected by option directives."""
+        # First, because it needs triangles in file order.
+        if any(group for _, group in self.smoothing_runs):
+            self.smoothNormals()
+        cleanup_option = self.options.get("cleanup", "yes" if self.cleanup else "no")
+        if cleanup_option.lower() == "yes":
+            self.cleanUp()
+        elif cleanup_option.lower() != "no":
+            raise Exception(f"Unknown cleanup option: {cleanup_option}")
+        vertex_cache_option = self.options.get("vertexCache", "").lower()
+        if vertex_cache_option == "forsyth":
+            self.optimizeVertexCache()
+        elif vertex_cache_option:
+            raise Exception(f"Unknown vertexCache option: {vertex_cache_option}")
+        sort_materials_option = self.options.get("sortMaterials", "no").lower()
+        if sort_materials_option == "yes":
+            self.sortMaterials()
+        elif sort_materials_option != "no":
+            raise Exception(f"Unknown sortMaterials option: {sort_materials_option}")
+        if "meshlets" in self.options:
+            self.buildMeshlets(self.options["meshlets"])
+        if "lod" in self.options:
+            self.buildLods(self.options["lod"])
+
+    def indexedMesh(self):
+        """
+        Returns quads in emission order, triangles indexing them, and sub-mesh draw ranges
+        or None if the mesh is drawn whole. Handles meshes too big for 16-bit indices as
+        the bigIndices option directs.
+        """
+        quads = list(self.quad_index.keys())
+        triangles = self.triangleIndices()
+        if len(quads) <= MAX_UINT16_VERTICES:
+            return quads, triangles, None
+        big_indices_option = self.options.get("bigIndices", "uint32").lower()
+        if big_indices_option == "uint32":
+            print(
+                f"warning: {len(quads)} vertices need 32-bit indices. Use bigIndices = split for 16-bit sub-meshes",
+                file=sys.stderr,
+            )
+            return quads, triangles, None
+        if big_indices_option != "split":
+            raise Exception(f"Unknown bigIndices option: {big_indices_option}")
+        order, triangles, ranges = splitMesh(triangles, MAX_UINT16_VERTICES)
+        print(
+            f"  big indices: {len(quads)} vertices split into {len(ranges)} sub-meshes with {len(order)} vertices"
+        )
+        return [quads[i] for i in order], triangles, ranges
+
+    def optimizeVertexCache(self):
+        """Reorders triangles for the GPU vertex cache, then vertices in order of use."""
+        quads = list(self.quad_index.keys())
+        triangles = self.triangleIndices()
+        acmr, atvr = vertex_cache.acmrAndAtvr(triangles, len(quads))
+        triangles = vertex_cache.optimizeTriangleOrder(triangles, len(quads))
+        order, triangles = vertex_cache.renumberVertices(triangles, len(quads))
+        self.setMesh([quads[i] for i in order], triangles)
+        new_acmr, new_atvr = vertex_cache.acmrAndAtvr(triangles, len(quads))
+        print(
+            f"  vertex cache: ACMR {acmr:.3f} -> {new_acmr:.3f}, ATVR {atvr:.3f} -> {new_atvr:.3f}"
+        )
+
+    def cleanUp(self):
+        """
+        Welds positions within the weldDistance option of each other, merging quads that
+        become equal. Then removes degenerate and duplicate triangles and renumbers quads
+        in order of use, dropping unused ones. See reportCleanup for the results.
+        """
+        try:
+            epsilon = float(self.options.get("weldDistance", DEFAULT_WELD_DISTANCE))
+        except ValueError:
+            raise Exception(f"Bad weldDistance option: {self.options['weldDistance']}")
+        if epsilon <= 0:
+            raise Exception(f"Bad weldDistance option: {self.options['weldDistance']}")
+        quads = list(self.quad_index.keys())
+        triangles = self.triangleIndices()
+        self.cleanup_counts = (len(quads), len(triangles))
+        vertex_ids = list(dict.fromkeys(quad[0] for quad in quads))
+        matches = cleanup.weldPoints([self.vertices[v] for v in vertex_ids], epsilon)
+        welds = {v: vertex_ids[match] for v, match in zip(vertex_ids, matches)}
+        welded_index = {}
+        quad_map = []
+        for quad in quads:
+            welded = (welds[quad[0]], quad[1], quad[2], quad[3])
+            quad_map.append(welded_index.setdefault(welded, len(welded_index)))
+        welded_quads = list(welded_index.keys())
+        triangles = cleanup.cleanTriangles(
+            [tuple(quad_map[i] for i in triangle) for triangle in triangles],
+            [quad[0] for quad in welded_quads],
+            self.vertices,
+            epsilon,
+        )
+        used_count = len({i for triangle in triangles for i in triangle})
+        order, triangles = vertex_cache.renumberVertices(triangles, len(welded_quads))
+        # Unused quads are last in the order.
+        self.setMesh([welded_quads[i] for i in order[:used_count]], triangles)
+
+    def reportCleanup(self, sections):
+        """Prints vertex and triangle counts before and after cleanup and bytes saved."""
+        vertex_count, triangle_count = self.cleanup_counts
+        new_vertex_count = len(self.quad_index)
+        new_triangle_count = len(self.faces)
+        vertex_bytes = index_bytes = 0
+        for section in sections:
+            size = struct.calcsize(binary_mesh.ARRAY_TYPES[section.array_type][0])
+            if section.name in VERTEX_SECTIONS and section.rows:
+                vertex_bytes += size * len(section.rows[0])
+            elif section.name == "indices":
+                index_bytes = 3 * size
+        saved = (vertex_count - new_vertex_count) * vertex_bytes + (
+            triangle_count - new_triangle_count
+        ) * index_bytes
+        print(
+            f"  cleanup: {vertex_count} -> {new_vertex_count} vertices, {triangle_count} -> {new_triangle_count} triangles, {saved} bytes saved"
+        )
+
+    def smoothNormals(self):
+        """
+        Replaces the normals of triangles in smoothing groups with smooth ones after
+        welding positions with equal coordinates. Reports the change in unique quads.
+        """
+        # NumPy is only needed for models with smoothing groups.
+        import numpy as np
+        import smoothing
+
+        try:
+            crease_degrees = float(self.options.get("creaseAngle", "180"))
+        except ValueError:
+            raise Exception(f"Bad creaseAngle option: {self.options['creaseAngle']}")
+        quads = list(self.quad_index.keys())
+        triangles = self.triangleIndices()
+        run_starts = [first for first, _ in self.smoothing_runs] + [len(triangles)]
+        groups = np.repeat(
+            [group for _, group in self.smoothing_runs], np.diff(run_starts)
+        )
+        smooth = np.flatnonzero(groups)
+        quad_vertices = np.array([quad[0] for quad in quads])
+        corner_vertices = quad_vertices[np.array(triangles, dtype=np.int64)[smooth]]
+        vertices, corners = np.unique(corner_vertices, return_inverse=True)
+        positions = np.array([self.vertices[int(v)] for v in vertices])
+        corners = smoothing.weldPositions(positions)[corners.reshape(-1)].reshape(-1, 3)
+        normals, corner_normals = smoothing.smoothNormals(
+            positions, corners, groups[smooth], crease_degrees
+        )
+        normal_base = len(self.normals)
+        for normal in normals:
+            self.normals.append(tuple(float(x) for x in normal))
+        corner_quads = [[quads[q] for q in triangle] for triangle in triangles]
+        for s, t in enumerate(smooth.tolist()):
+            corner_quads[t] = [
+                (
+                    (
+                        int(vertices[corners[s][c]]),
+                        quad[1],
+                        normal_base + int(corner_normals[s][c]),
+                        quad[3],
+                    )
+                    if corner_normals[s][c] >= 0
+                    else quad
+                )
+                for c, quad in enumerate(corner_quads[t])
+            ]
+        # Renumber quads in order of first use.
+        new_index = {}
+        new_triangles = [
+            tuple(new_index.setdefault(quad, len(new_index)) for quad in triangle)
+            for triangle in corner_quads
+        ]
+        self.setMesh(list(new_index), new_triangles)
+        print(
+            f"  smoothing: {len(quads)} -> {len(new_index)} unique quads ({100 * (1 - len(new_index) / len(quads)):.0f}% fewer), {len(normals)} normals"
+        )
+
+    def sortMaterials(self):
+        """Stably sorts triangles by material and records each material's index range."""
+        quads = list(self.quad_index.keys())
+        triangles = sorted(self.triangleIndices(), key=lambda t: int(quads[t[0]][3]))
+        self.setMesh(quads, triangles)
+        for i, triangle in enumerate(triangles):
+            material = int(quads[triangle[0]][3])
+            if self.draw_ranges and self.draw_ranges[-1][0] == material:
+                self.draw_ranges[-1][2] += 3
+            else:
+                self.draw_ranges.append([material, 3 * i, 3])
+        print(f"  sort materials: {len(self.draw_ranges)} draw ranges")
+
+    def buildMeshlets(self, meshlets_option):
+        """
+        Reorders triangles into meshlets of at most the given size and bounds them.
+        Meshlets don't cross material draw ranges.
+        """
+        try:
+            max_triangles = int(meshlets_option)
+        except ValueError:
+            raise Exception(f"Bad meshlets option: {meshlets_option}")
+        if max_triangles < 1:
+            raise Exception(f"Bad meshlets option: {meshlets_option}")
+        quads = list(self.quad_index.keys())
+        positions = [self.vertices[quad[0]] for quad in quads]
+        all_triangles = self.triangleIndices()
+        groups = [
+            all_triangles[first // 3 : (first + count) // 3]
+            for _, first, count in self.draw_ranges
+        ] or [all_triangles]
+        meshlets = [
+            meshlet
+            for group in groups
+            for meshlet in bounds.buildMeshlets(group, positions, max_triangles)
+        ]
+        triangles = []
+        for meshlet in meshlets:
+            points = [positions[v] for triangle in meshlet for v in triangle]
+            center, radius = bounds.boundingSphere(points)
+            apex, axis, cutoff = bounds.normalCone(meshlet, positions, center)
+            first_index = 3 * len(triangles)
+            triangles.extend(meshlet)
+            self.meshlets.append(
+                (first_index, 3 * len(meshlet), center, radius, apex, axis, cutoff)
+            )
+        self.setMesh(quads, triangles)
+        cullable = sum(1 for meshlet in self.meshlets if meshlet[6] < 1)
+        print(
+            f"  meshlets: {len(meshlets)}, {len(triangles) / len(meshlets):.1f} triangles each, {cullable} with normal cones"
+        )
+
+    def buildLods(self, lod_option):
+        """Simplifies the mesh to the comma-separated percentages of its triangles."""
+        try:
+            percentages = [int(p) for p in lod_option.split(",")]
+        except ValueError:
+            raise Exception(f"Bad lod option: {lod_option}")
+        if any(not 0 < p < 100 for p in percentages) or percentages != sorted(
+            percentages, reverse=True
+        ):
+            raise Exception(
+                f"lod percentages must decrease between 0 and 100: {lod_option}"
+            )
+        quads = list(self.quad_index.keys())
+        position_index = {}
+        for quad in quads:
+            position_index.setdefault(quad[0], len(position_index))
+        positions = [self.vertices[v] for v in position_index]
+        wedge_positions = [position_index[quad[0]] for quad in quads]
+        triangles = self.triangleIndices()
+        levels = simplify.buildLodChain(
+            positions, wedge_positions, triangles, percentages
+        )
+        previous_count = len(triangles)
+        for percentage, (lod_triangles, error) in zip(percentages, levels):
+            if len(lod_triangles) >= previous_count:
+                print(f"  lod {percentage}%: no further simplification. Omitted")
+                continue
+            previous_count = len(lod_triangles)
+            self.lods.append((percentage, lod_triangles, error))
+            print(
+                f"  lod {percentage}%: {len(lod_triangles)} of {len(triangles)} triangles, error {error:.3g}, switch at {simplify.switchDistance(error):.3g}"
+            )
+
+    def sections(self, ignore_tex_coords=True):
+        """Returns the mesh data arrays to emit, in order."""
         populated = [False, False, False, False]
         for key in self.quad_index.keys():
             for i, index in enumerate(key):
                 populated[i] = populated[i] or index != None
-        print(f"// Source: {in_file.name}", file=out_file)
-        print("// prettier-ignore", file=out_file)
-        prefix = Path(in_file.name).stem.replace("-", "_").upper()
-        print(f"export const {prefix}_MESH_DATA = {{", file=out_file)
-        if populated[0]:
-            print(f"  positions: new Float32Array([", file=out_file)
-            for index, quad in enumerate(self.quad_index.keys()):
-                p = self.vertices[quad[0]]
-                print(
-                    f"    {p[0]:.3f}, {p[1]:.3f}, {p[2]:.3f}, // {index}", file=out_file
+        quads, triangles, sub_meshes = self.indexedMesh()
+        sections = []
+        quantize_option = self.options.get("quantize", "").lower()
+        if quantize_option not in ("", "oct8", "oct16"):
+            raise Exception(f"Unknown quantize option: {quantize_option}")
+        if populated[0] and quantize_option:
+            positions, scale, offset, error = quantize.quantizePositions(
+                [self.vertices[quad[0]] for quad in quads]
+            )
+            print(f"  quantize: max position error {error:.3g}")
+            sections.append(
+                Section(
+                    "positions",
+                    "Int16Array",
+                    positions,
+                    lambda index, q: f"    {q[0]}, {q[1]}, {q[2]}, // {index}",
                 )
-            print("  ]),", file=out_file)
+            )
+            # Dequantize with position = normalized value * scale + offset.
+            for name, value in (("positionScale", scale), ("positionOffset", offset)):
+                sections.append(
+                    Section(
+                        name,
+                        "Float32Array",
+                        [value],
+                        lambda index, v: f"    {v[0]:.9g}, {v[1]:.9g}, {v[2]:.9g},",
+                    )
+                )
+        elif populated[0]:
+            sections.append(
+                Section(
+                    "positions",
+                    "Float32Array",
+                    [self.vertices[quad[0]] for quad in quads],
+                    lambda index, p: f"    {p[0]:.3f}, {p[1]:.3f}, {p[2]:.3f}, // {index}",
+                )
+            )
         if populated[1] and not ignore_tex_coords:
-            print(f"  texCoords: new Float32Array([", file=out_file)
-            for index, quad in enumerate(self.quad_index.keys()):
-                p = self.texcoords[quad[1]]
-                print(f"    {p[0]:.4f}, {p[1]:.4f}, // {index}", file=out_file)
-            print("  ]),", file=out_file)
+            sections.append(
+                Section(
+                    "texCoords",
+                    "Float32Array",
+                    [self.texcoords[quad[1]] for quad in quads],
+                    lambda index, p: f"    {p[0]:.4f}, {p[1]:.4f}, // {index}",
+                )
+            )
         if populated[2]:
             if self.options.get("normals", "").lower() == "index":
-                print(f"  normalRefs: new Uint16Array([", file=out_file)
-                for index, quad in enumerate(self.quad_index.keys()):
-                    p = self.normals[quad[2]]
-                    print(
-                        f"    {quad[2] - 1},  // {index}: {p[0]:.4g}, {p[1]:.4g}, {p[2]:.4g}",
-                        file=out_file,
+
+                def normal_ref_line(index, ref):
+                    p = self.normals[ref[0] + 1]
+                    return (
+                        f"    {ref[0]},  // {index}: {p[0]:.4g}, {p[1]:.4g}, {p[2]:.4g}"
+                    )
+
+                normal_refs = [(quad[2] - 1,) for quad in quads]
+                sections.append(
+                    Section(
+                        "normalRefs",
+                        refArrayType(normal_refs),
+                        normal_refs,
+                        normal_ref_line,
                     )
-                print("  ]),", file=out_file)
+                )
+            elif quantize_option:
+                bits = 8 if quantize_option == "oct8" else 16
+                normals, error = quantize.quantizeNormals(
+                    [normalize(self.normals[quad[2]]) for quad in quads], bits
+                )
+                print(f"  quantize: max normal error {error:.3g} degrees")
+                sections.append(
+                    Section(
+                        "normals",
+                        f"Int{bits}Array",
+                        normals,
+                        lambda index, q: f"    {q[0]}, {q[1]}, // {index}",
+                    )
+                )
             else:
-                print(f"  normals: new Float32Array([", file=out_file)
-                for index, quad in enumerate(self.quad_index.keys()):
-                    p = normalize(self.normals[quad[2]])
-                    print(
-                        f"    {p[0]:.4g}, {p[1]:.4g}, {p[2]:.4g}, // {index}",
-                        file=out_file,
+                sections.append(
+                    Section(
+                        "normals",
+                        "Float32Array",
+                        [normalize(self.normals[quad[2]]) for quad in quads],
+                        lambda index, p: f"    {p[0]:.4g}, {p[1]:.4g}, {p[2]:.4g}, // {index}",
                     )
-                print("  ]),", file=out_file)
+                )
         if populated[3] and self.options.get("materialRefs", "").lower() != "no":
+            material_refs = [(int(quad[3]),) for quad in quads]
+            sections.append(
+                Section(
+                    "materialRefs",
+                    refArrayType(material_refs),
+                    material_refs,
+                    lambda index, ref: f"    {ref[0]}, // {index}",
+                )
+            )
+        index_array_type = (
+            "Uint16Array"
+            if len(quads) <= MAX_UINT16_VERTICES or sub_meshes
+            else "Uint32Array"
+        )
+        sections.append(
+            Section(
+                "indices",
+                index_array_type,
+                triangles,
+                lambda index, i: f"    {i[0]}, {i[1]}, {i[2]},",
+            )
+        )
+        if sub_meshes and (self.lods or self.meshlets or self.draw_ranges):
+            raise Exception(
+                "lod, meshlets, and sortMaterials can't be used with bigIndices = split"
+            )
+        if self.draw_ranges:
+            sections.append(
+                Section(
+                    "drawRanges",
+                    "Uint32Array",
+                    self.draw_ranges,
+                    lambda index, r: f"    {r[0]}, {r[1]}, {r[2]}, // material, first index, count",
+                )
+            )
+        for level, (_, lod_triangles, _) in enumerate(self.lods, 1):
+            sections.append(
+                Section(
+                    f"lod{level}Indices",
+                    index_array_type,
+                    lod_triangles,
+                    lambda index, i: f"    {i[0]}, {i[1]}, {i[2]},",
+                )
+            )
+        if sub_meshes:
+            sections.append(
+                Section(
+                    "subMeshes",
+                    "Uint32Array",
+                    sub_meshes,
+                    lambda index, r: f"    {r[0]}, {r[1]}, {r[2]}, {r[3]}, // {index}: first index, count, base vertex, vertex count",
+                )
+            )
+        sections.extend(self.boundsSections(quads))
+        if self.cleanup_counts:
+            self.reportCleanup(sections)
+        return sections
+
+    def boundsSections(self, quads):
+        """
+        Returns sections with bounds of the whole mesh, of each material if there are
+        several, and of meshlets if any. Bounds are in model space, even when positions are
+        quantized.
+        """
+        positions = [self.vertices[quad[0]] for quad in quads]
+        if not positions:
+            return []
+
+        def boundsRow(points):
+            lo, hi = bounds.boundingBox(points)
+            center, radius = bounds.boundingSphere(points)
+            return lo + hi + center + (radius,)
+
+        def formatBounds(values):
+            return ", ".join(f"{x:.6g}" for x in values)
+
+        sections = [
+            Section(
+                "bounds",
+                "Float32Array",
+                [boundsRow(positions)],
+                lambda index, b: f"    {formatBounds(b)}, // min, max, sphere center, radius",
+            )
+        ]
+        materials = sorted(set(int(quad[3]) for quad in quads))
+        if len(materials) > 1 and self.options.get("materialRefs", "").lower() != "no":
+            sections.append(
+                Section(
+                    "materialBounds",
+                    "Float32Array",
+                    [
+                        (material,)
+                        + boundsRow(
+                            [p for p, q in zip(positions, quads) if q[3] == material]
+                        )
+                        for material in materials
+                    ],
+                    lambda index, b: f"    {b[0]}, {formatBounds(b[1:])}, // material, min, max, sphere center, radius",
+                )
+            )
+        if self.meshlets:
+            sections.append(
+                Section(
+                    "meshlets",
+                    "Uint32Array",
+                    [meshlet[:2] for meshlet in self.meshlets],
+                    lambda index, m: f"    {m[0]}, {m[1]}, // {index}: first index, count",
+                )
+            )
+            sections.append(
+                Section(
+                    "meshletBounds",
+                    "Float32Array",
+                    [
+                        center + (radius,) + apex + axis + (cutoff,)
+                        for _, _, center, radius, apex, axis, cutoff in self.meshlets
+                    ],
+                    lambda index, b: f"    {formatBounds(b)}, // {index}: center, radius, apex, axis, cutoff",
+                )
+            )
+        return sections
+
+    def emit(self, source_name, out_file, ignore_tex_coords=True, bin_path=None):
+        """
+        Prints mesh data as TypeScript. With a binary path, relative to the TypeScript,
+        returns the binary container bytes to be written there. The TypeScript then has
+        only a descriptor and mesh data wrapping the container, which the app build
+        imports as bytes.
+        """
+        sections = self.sections(ignore_tex_coords)
+        prefix = Path(source_name).stem.replace("-", "_").upper()
+        print(f"// Source: {source_name}", file=out_file)
+        if bin_path:
+            data, table = binary_mesh.pack(
+                [
+                    (section.name, section.array_type, section.values())
+                    for section in sections
+                ]
+            )
             print(
-                f"  materialRefs: new Uint16Array([",
+                "import { BinaryMeshDescriptor, importBinaryMeshData } from './binary-mesh';",
                 file=out_file,
             )
-            for index, quad in enumerate(self.quad_index.keys()):
-                print(f"    {quad[3]}, // {index}", file=out_file)
+            print(f"import {prefix}_MESH_BYTES from '{bin_path}';", file=out_file)
+            print(file=out_file)
+            print("// prettier-ignore", file=out_file)
+            print(
+                f"export const {prefix}_MESH_BINARY: BinaryMeshDescriptor = {{",
+                file=out_file,
+            )
+            print(f"  url: '{bin_path}',", file=out_file)
+            print(f"  byteLength: {len(data)},", file=out_file)
+            print("  sections: {", file=out_file)
+            for name, array_type, byte_offset, length in table:
+                print(
+                    f"    {name}: {{ type: '{array_type}', byteOffset: {byte_offset}, length: {length} }},",
+                    file=out_file,
+                )
+            print("  },", file=out_file)
+            print("};", file=out_file)
+            print(
+                f"export const {prefix}_MESH_DATA = importBinaryMeshData({prefix}_MESH_BINARY, {prefix}_MESH_BYTES);",
+                file=out_file,
+            )
+            self.emitLods(prefix, out_file)
+            return data
+        print("// prettier-ignore", file=out_file)
+        print(f"export const {prefix}_MESH_DATA = {{", file=out_file)
+        for section in sections:
+            print(f"  {section.name}: new {section.array_type}([", file=out_file)
+            for index, row in enumerate(section.rows):
+                print(section.format_row(index, row), file=out_file)
             print("  ]),", file=out_file)
-        print(f"  indices: new Uint16Array([", file=out_file)
-        for face in self.faces[1:]:
-            i = tuple(self.quad_index.get(f) - 1 for f in face)
-            print(f"    {i[0]}, {i[1]}, {i[2]},", file=out_file)
-        print("  ]),", file=out_file)
         print("};", file=out_file)
-        if self.material_lib:
-            self.material_lib.emit()
+        self.emitLods(prefix, out_file)
+        return None
+
+    def emitLods(self, prefix, out_file):
+        """
+        Prints level of detail metadata, finest first. Each names its indices in the mesh
+        data. Draw the first level whose switch distance the camera is beyond.
+        """
+        if not self.lods:
+            return
+        print(file=out_file)
+        print("// prettier-ignore", file=out_file)
+        print(f"export const {prefix}_LODS = [", file=out_file)
+        for level, (percentage, triangles, error) in enumerate(self.lods, 1):
+            print(
+                f"  {{ indices: 'lod{level}Indices', percentage: {percentage}, triangleCount: {len(triangles)}, geometricError: {error:.4g}, switchDistance: {simplify.switchDistance(error):.4g} }},",
+                file=out_file,
+            )
+        print("];", file=out_file)
+
+
+class Section:
+    """One typed array of mesh data, stored as rows, each printed on its own line."""
+
+    def __init__(self, name, array_type, rows, format_row):
+        self.name = name
+        self.array_type = array_type
+        self.rows = rows
+        self.format_row = format_row
+
+    def values(self):
+        return [value for row in self.rows for value in row]
 
 
 def normalize(v):
@@ -276,14 +974,281 @@ def normalize(v):
     return tuple(x / len for x in v)
 
 
-def main(obj_files=[]):
+class BuildResult:
+    """Outcome of compiling one OBJ file, possibly in a worker process."""
+
+    def __init__(self, obj_file, ts_file):
+        self.obj_file = obj_file
+        self.ts_file = ts_file
+        self.text = None
+        self.bin_file = None
+        self.binary = None
+        self.material_lib = None
+        self.stdout = ""
+        self.stderr = ""
+        self.error = None
+
+
+def buildModel(obj_file, bin_dir=None, compact=False, cleanup=False):
+    """
+    Compiles one OBJ file to TypeScript source text and, given a binary directory, binary
+    mesh data. Nothing is written here, so this is safe to run concurrently. Console output
+    is captured for replay in input order. See Processor for compact storage and cleanup.
+    """
+    result = BuildResult(obj_file, Path(obj_file).with_suffix(".ts"))
+    bin_path = None
+    if bin_dir is not None:
+        result.bin_file = Path(bin_dir) / Path(obj_file).with_suffix(".bin").name
+        relative_path = os.path.relpath(result.bin_file, result.ts_file.parent)
+        bin_path = Path(relative_path).as_posix()
+        if not bin_path.startswith("."):
+            bin_path = "./" + bin_path
+    stdout, stderr = io.StringIO(), io.StringIO()
+    with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+        try:
+            with open(obj_file, "r") as in_file:
+                out_file = io.StringIO()
+                out_file.name = str(result.ts_file)
+                processor = Processor(compact, cleanup)
+                result.binary = processor.process(in_file, out_file, bin_path=bin_path)
+                result.text = out_file.getvalue()
+                result.material_lib = processor.material_lib
+        except Exception:
+            result.error = traceback.format_exc()
+    result.stdout = stdout.getvalue()
+    result.stderr = stderr.getvalue()
+    return result
+
+
+def buildModels(obj_files, jobs=1, bin_dir=None, compact=False, cleanup=False):
+    """
+    Compiles the given OBJ files, using a pool of worker processes if jobs > 1. Results
+    are in input order regardless of completion order. Workers get the material libraries
+    the files use already parsed, so each is parsed once rather than once per worker.
+    """
+    build = functools.partial(
+        buildModel,
+        bin_dir=bin_dir,
+        compact=compact,
+        cleanup=cleanup,
+    )
+    if jobs <= 1 or len(obj_files) <= 1:
+        return [build(obj_file) for obj_file in obj_files]
+    for mtl_file_name in sorted(
+        {name for obj_file in obj_files for name in materialsLibraryNames(obj_file)}
+    ):
+        try:
+            loadMaterialsLibrary(mtl_file_name)
+        except OSError:
+            # Let the build report the problem.
+            pass
+    with ProcessPoolExecutor(
+        max_workers=min(jobs, len(obj_files)),
+        initializer=seedMaterialsLibraries,
+        initargs=(MATERIALS_LIBRARIES,),
+    ) as executor:
+        return list(executor.map(build, obj_files))
+
+
+def materialsLibraryNames(obj_file):
+    """Returns the names of material libraries the given OBJ file uses."""
+    names = []
+    try:
+        with open(obj_file, "r") as in_file:
+            for line in in_file:
+                parts = line.split()
+                if len(parts) == 2 and parts[0] == "mtllib":
+                    names.append(parts[1])
+    except OSError:
+        pass
+    return names
+
+
+def generatorModules():
+    """
+    Returns paths of this script and the modules beside it that it imports, directly or
+    through one another. Imports inside functions count. Other scripts here, such as
+    benchmarks and previews, don't affect the output.
+    """
+    directory = os.path.dirname(os.path.abspath(__file__))
+    modules = {os.path.abspath(__file__)}
+    pending = list(modules)
+    while pending:
+        with open(pending.pop(), "r") as in_file:
+            tree = ast.parse(in_file.read())
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                names = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+                names = [node.module]
+            else:
+                continue
+            for name in names:
+                module = os.path.join(directory, name.split(".")[0] + ".py")
+                if module not in modules and os.path.exists(module):
+                    modules.add(module)
+                    pending.append(module)
+    return sorted(modules)
+
+
+def generatorVersion():
+    """
+    Hash of this script and the modules it imports, so any change to the generator
+    invalidates cached builds.
+    """
+    hashes = [hashFile(module) for module in generatorModules()]
+    return hashlib.sha256("".join(hashes).encode()).hexdigest()
+
+
+def inputKey(obj_file, generator_version, settings=None):
+    """
+    Returns a hash of everything that determines the output of compiling the given OBJ
+    file: its content, its material library, its option directives, the generator, and
+    the given command line settings.
+    """
+    mtl_hashes = {}
+    options = {}
+    with open(obj_file, "r") as in_file:
+        for line in in_file:
+            option_match = OPTION_PATTERN.match(line)
+            if option_match:
+                options[option_match.group(1)] = option_match.group(2)
+            parts = line.split()
+            if len(parts) == 2 and parts[0] == "mtllib":
+                mtl_hashes[parts[1]] = hashFile(parts[1])
+    key = {
+        "generator": generator_version,
+        "obj": hashFile(obj_file),
+        "mtl": mtl_hashes,
+        "options": options,
+        "settings": settings if settings is not None else {},
+    }
+    return hashlib.sha256(json.dumps(key, sort_keys=True).encode()).hexdigest()
+
+
+def loadCache():
+    try:
+        with open(CACHE_FILE, "r") as in_file:
+            return json.load(in_file)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def isUpToDate(entry, key):
+    return (
+        entry is not None
+        and entry["key"] == key
+        and all(os.path.exists(output) for output in entry["outputs"])
+    )
+
+
+def main(
+    obj_files=(),
+    jobs=1,
+    force=False,
+    bin_dir=None,
+    compact=False,
+    cleanup=False,
+):
     if len(obj_files) == 0:
-        obj_files = [f for f in os.listdir(".") if f.endswith(".obj")]
+        obj_files = sorted(f for f in os.listdir(".") if f.endswith(".obj"))
+    cache = loadCache()
+    generator_version = generatorVersion()
+    settings = {"binDir": bin_dir, "cleanup": cleanup}
+    keys = {}
+    stale_files = []
     for obj_file in obj_files:
-        with open(obj_file, "r") as in_file:
-            path = Path(obj_file).with_suffix(".ts")
-            with open(path, "w") as out_file:
-                Processor().process(in_file, out_file)
+        try:
+            keys[obj_file] = inputKey(obj_file, generator_version, settings)
+        except OSError:
+            # Let the build report the problem.
+            keys[obj_file] = None
+        if not force and isUpToDate(cache.get(obj_file), keys[obj_file]):
+            print(f"{obj_file}: up to date")
+        else:
+            stale_files.append(obj_file)
+    if bin_dir is not None:
+        os.makedirs(bin_dir, exist_ok=True)
+    results = buildModels(stale_files, jobs, bin_dir, compact, cleanup)
+    material_libs = {}
+    failures = 0
+    for result in results:
+        print(result.stdout, end="")
+        print(result.stderr, end="", file=sys.stderr)
+        if result.error:
+            print(f"{result.obj_file}: failed\n{result.error}", end="", file=sys.stderr)
+            cache.pop(result.obj_file, None)
+            failures += 1
+            continue
+        if not writeIfChanged(result.ts_file, result.text):
+            print(f"{result.ts_file}: unchanged")
+        outputs = [str(result.ts_file)]
+        if result.bin_file:
+            if not writeIfChanged(result.bin_file, result.binary):
+                print(f"{result.bin_file}: unchanged")
+            outputs.append(str(result.bin_file))
+        if result.material_lib:
+            material_libs.setdefault(result.material_lib.file_name, result.material_lib)
+            outputs.append(result.material_lib.ts_file_name())
+        cache[result.obj_file] = {"key": keys[result.obj_file], "outputs": outputs}
+    for material_lib in material_libs.values():
+        material_lib.emit()
+    writeIfChanged(CACHE_FILE, json.dumps(cache, indent=2, sort_keys=True) + "\n")
+    if failures:
+        print(f"{failures} of {len(results)} models failed", file=sys.stderr)
+        sys.exit(1)
 
 
-main(sys.argv[1:])
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Compiles OBJ files to TypeScript mesh data."
+    )
+    parser.add_argument(
+        "obj_files",
+        nargs="*",
+        help="OBJ files to compile. Default is all in the current directory.",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes. Zero means one per CPU.",
+    )
+    parser.add_argument(
+        "-f",
+        "--force",
+        action="store_true",
+        help=f"Rebuild all models, ignoring {CACHE_FILE}.",
+    )
+    parser.add_argument(
+        "-b",
+        "--binary",
+        action="store_true",
+        help="Emit binary .bin mesh data, imported as bytes by small .ts files.",
+    )
+    parser.add_argument(
+        "--bin-dir",
+        default=".",
+        help="Where --binary writes .bin files. Default is beside the .ts files.",
+    )
+    parser.add_argument(
+        "-c",
+        "--compact",
+        action="store_true",
+        help="Store mesh data compactly while building. Slower, but much less memory.",
+    )
+    parser.add_argument(
+        "--cleanup",
+        action="store_true",
+        help="Clean up every model as if it had the cleanup = yes option.",
+    )
+    args = parser.parse_args()
+    main(
+        args.obj_files,
+        args.jobs if args.jobs > 0 else os.cpu_count(),
+        args.force,
+        args.bin_dir if args.binary else None,
+        args.compact,
+        args.cleanup,
+    )
@@ -0,0 +1,69 @@
+# Copyright (c) 2025-2026 Gene Ressler
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Mesh cleanup: welding of near-duplicate points with a uniform grid spatial hash and
+removal of degenerate and duplicate triangles.
+"""
+
+import math
+
+
+def weldPoints(points, epsilon):
+    """
+    Returns, for each point, the index of the first point within epsilon of it, which is
+    its own index if there is none. A grid of epsilon-sized cells means only the 27 cells
+    around each point need checking, so this is linear in the number of points.
+    """
+    cells = {}
+    result = []
+    for i, p in enumerate(points):
+        cx, cy, cz = (math.floor(x / epsilon) for x in p)
+        match = i
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for dz in (-1, 0, 1):
+                    for j in cells.get((cx + dx, cy + dy, cz + dz), ()):
+                        if math.dist(p, points[j]) <= epsilon and j < match:
+                            match = j
+        if match == i:
+            cells.setdefault((cx, cy, cz), []).append(i)
+        result.append(match)
+    return result
+
+
+def isDegenerate(a, b, c, epsilon):
+    """Whether triangle abc is thinner than epsilon, measured across its longest edge."""
+    u = (b[0] - a[0], b[1] - a[1], b[2] - a[2])
+    v = (c[0] - a[0], c[1] - a[1], c[2] - a[2])
+    w = (c[0] - b[0], c[1] - b[1], c[2] - b[2])
+    doubled_area = math.hypot(
+        u[1] * v[2] - u[2] * v[1],
+        u[2] * v[0] - u[0] * v[2],
+        u[0] * v[1] - u[1] * v[0],
+    )
+    longest = max(math.hypot(*u), math.hypot(*v), math.hypot(*w))
+    return longest == 0 or doubled_area / longest < epsilon
+
+
+def cleanTriangles(triangles, corner_positions, points, epsilon):
+    """
+    Returns the given (a, b, c) triangles without those that are degenerate or repeat an
+    earlier one with the same winding. Corner positions maps triangle indices to indices
+    of points, which may be shared by several triangle indices.
+    """
+    seen = set()
+    result = []
+    for triangle in triangles:
+        a, b, c = (corner_positions[i] for i in triangle)
+        if a == b or b == c or c == a:
+            continue
+        if isDegenerate(points[a], points[b], points[c], epsilon):
+            continue
+        # Rotate the smallest first to compare without losing the winding.
+        key = min((a, b, c), (b, c, a), (c, a, b))
+        if key in seen:
+            continue
+        seen.add(key)
+        result.append(triangle)
+    return result
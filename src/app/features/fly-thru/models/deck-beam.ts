@@ -96,4 +96,7 @@ export const DECK_BEAM_MESH_DATA = {
     20, 21, 22,
     21, 20, 23,
   ]),
+  bounds: new Float32Array([
+    -0.5, 0, -1, 0.5, 1, 1, 0, 0.5, 0, 1.22474, // min, max, sphere center, radius
+  ]),
 };
@@ -96,4 +96,11 @@ export const DECK_SLAB_MESH_DATA = {
     20, 21, 22,
     21, 20, 23,
   ]),
+  bounds: new Float32Array([
+    0, 0, -1, 1, 1, 1, 0.5, 0.5, 0, 1.22474, // min, max, sphere center, radius
+  ]),
+  materialBounds: new Float32Array([
+    5, 0, 1, -1, 1, 1, 1, 0.5, 1, 0, 1.11803, // material, min, max, sphere center, radius
+    7, 0, 0, -1, 1, 1, 1, 0.5, 0.5, 0, 1.22474, // material, min, max, sphere center, radius
+  ]),
 };
@@ -2520,4 +2520,14 @@ export const DUAL_WHEEL_MESH_DATA = {
     632, 630, 633,
     631, 633, 630,
   ]),
+  bounds: new Float32Array([
+    -0.5, -0.5, -0.23, 0.5, 0.5, 0.23, 0, 0, 0, 0.550364, // min, max, sphere center, radius
+  ]),
+  materialBounds: new Float32Array([
+    3, -0.3, -0.3, -0.23, 0.3, 0.3, 0.23, 0, 0, 0, 0.378021, // material, min, max, sphere center, radius
+    5, -0.5, -0.5, -0.23, 0.5, 0.5, 0.23, 0, 0, 0, 0.550364, // material, min, max, sphere center, radius
+    6, -0.24, -0.24, 0.024, 0.24, 0.24, 0.052, -1.87735e-08, 1.34104e-07, 0.024, 0.240001, // material, min, max, sphere center, radius
+    7, -0.2, -0.2, 0.07, 0.2, 0.2, 0.11, 1.37747e-08, 2.0662e-08, 0.07, 0.2, // material, min, max, sphere center, radius
+    8, -0.3, -0.3, -0.01, 0.3, 0.3, 0.03, 0, 0, 0.01, 0.300666, // material, min, max, sphere center, radius
+  ]),
 };
@@ -50,4 +50,7 @@ export const MEMBER_MESH_DATA = {
     12, 13, 14,
     13, 12, 15,
   ]),
+  bounds: new Float32Array([
+    0, -0.5, -0.5, 1, 0.5, 0.5, 0.5, 0, 0, 0.866025, // min, max, sphere center, radius
+  ]),
 };
@@ -0,0 +1,154 @@
+# Copyright (c) 2025-2026 Gene Ressler
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Compact replacements for the lists of tuples and tuple-keyed dict Processor uses by
+default. Each supports just the operations Processor needs, so it can use either kind.
+"""
+
+from array import array
+
+# Bits of vertex, texcoord, and normal indices packed in a 64-bit quad key.
+VERTEX_BITS = 22
+TEXCOORD_BITS = 21
+NORMAL_BITS = 21
+# Multiplier for Fibonacci hashing of 64-bit keys.
+GOLDEN_RATIO_64 = 0x9E3779B97F4A7C15
+MASK_64 = (1 << 64) - 1
+
+
+class CoordinateArray:
+    """
+    Sequence of fixed-size coordinate tuples stored flat in an array of doubles. Element
+    0 is an empty tuple, so OBJ's 1-based indices work directly. Extra coordinates are
+    dropped, and missing ones are zero.
+    """
+
+    def __init__(self, dimension):
+        self.dimension = dimension
+        self.values = array("d")
+
+    def append(self, coordinates):
+        values = tuple(coordinates[: self.dimension])
+        self.values.extend(values + (0.0,) * (self.dimension - len(values)))
+
+    def __getitem__(self, i):
+        if i == 0:
+            return ()
+        start = (i - 1) * self.dimension
+        if i < 0 or start >= len(self.values):
+            raise IndexError(f"coordinate index out of range: {i}")
+        return tuple(self.values[start : start + self.dimension])
+
+    def __len__(self):
+        return len(self.values) // self.dimension + 1
+
+
+def packQuad(quad):
+    """
+    Packs the vertex, texcoord, and normal indices of a quad into a 64-bit key. None
+    packs as 0, which OBJ's 1-based indices never use.
+    """
+    key = 0
+    shift = 0
+    for index, bits in zip(quad[:3], (VERTEX_BITS, TEXCOORD_BITS, NORMAL_BITS)):
+        if index is not None:
+            if not 0 < index < 1 << bits:
+                raise Exception(f"Index out of range for compact storage: {index}")
+            key |= index << shift
+        shift += bits
+    return key
+
+
+def unpackQuad(key, material):
+    v = key & ((1 << VERTEX_BITS) - 1)
+    t = (key >> VERTEX_BITS) & ((1 << TEXCOORD_BITS) - 1)
+    n = key >> (VERTEX_BITS + TEXCOORD_BITS)
+    return (v or None, t or None, n or None, material)
+
+
+class PackedQuadIndex:
+    """
+    Dict-like map from quads to 1-based indices, assigned in insertion order as Processor
+    does. Quads are stored as packed keys and materials in arrays. Lookup is by an open
+    addressing hash table of quad indices, so there are no per-quad Python objects.
+    """
+
+    def __init__(self):
+        self.packed_keys = array("Q")
+        self.materials = array("I")
+        self.slots = array("I", bytes(4 * 1024))
+        self.shift = 64 - 10
+
+    def find(self, key, material):
+        """Returns the slot holding the given quad or the empty one where it belongs."""
+        slots = self.slots
+        mask = len(slots) - 1
+        h = (
+            (key + material * GOLDEN_RATIO_64) * GOLDEN_RATIO_64 & MASK_64
+        ) >> self.shift
+        while True:
+            index = slots[h]
+            if (
+                index == 0
+                or self.packed_keys[index - 1] == key
+                and self.materials[index - 1] == material
+            ):
+                return h
+            h = (h + 1) & mask
+
+    def grow(self):
+        self.slots = array("I", bytes(8 * len(self.slots)))
+        self.shift -= 1
+        for i, (key, material) in enumerate(zip(self.packed_keys, self.materials)):
+            self.slots[self.find(key, material)] = i + 1
+
+    def __contains__(self, quad):
+        return self.get(quad) is not None
+
+    def __getitem__(self, quad):
+        index = self.get(quad)
+        if index is None:
+            raise KeyError(quad)
+        return index
+
+    def __setitem__(self, quad, index):
+        if index != len(self.packed_keys) + 1:
+            raise Exception(f"Quad index out of order: {index}")
+        key = packQuad(quad)
+        material = int(quad[3])
+        slot = self.find(key, material)
+        if self.slots[slot]:
+            raise Exception(f"Quad already indexed: {quad}")
+        self.packed_keys.append(key)
+        self.materials.append(material)
+        self.slots[slot] = index
+        if 2 * len(self.packed_keys) > len(self.slots):
+            self.grow()
+
+    def get(self, quad, default=None):
+        index = self.slots[self.find(packQuad(quad), int(quad[3]))]
+        return index if index else default
+
+    def keys(self):
+        return (unpackQuad(*item) for item in zip(self.packed_keys, self.materials))
+
+    def __len__(self):
+        return len(self.packed_keys)
+
+
+class TriangleArray:
+    """List-like sequence of index triples stored flat in an array of unsigned ints."""
+
+    def __init__(self):
+        self.values = array("I")
+
+    def append(self, triangle):
+        self.values.extend(triangle)
+
+    def __iter__(self):
+        values = self.values
+        return (tuple(values[i : i + 3]) for i in range(0, len(values), 3))
+
+    def __len__(self):
+        return len(self.values) // 3
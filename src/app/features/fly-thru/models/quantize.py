@@ -0,0 +1,95 @@
+# Copyright (c) 2025-2026 Gene Ressler
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Vertex attribute quantization: positions to normalized int16 relative to the bounding box
+and unit normals to octahedral encodings in two normalized int8s or int16s.
+"""
+
+import math
+import struct
+
+INT16_MAX = 32767
+
+
+def float32(x):
+    """Rounds to the nearest 32-bit float, as stored in a Float32Array."""
+    return struct.unpack("<f", struct.pack("<f", x))[0]
+
+
+def quantizePositions(positions):
+    """
+    Returns (quantized, scale, offset, max error) with quantized positions as int16 triples.
+    A shader with normalized short attributes recovers position = value * scale + offset.
+    """
+    lo = [min(p[i] for p in positions) for i in range(3)]
+    hi = [max(p[i] for p in positions) for i in range(3)]
+    offset = tuple(float32(0.5 * (lo[i] + hi[i])) for i in range(3))
+    scale = tuple(float32(0.5 * (hi[i] - lo[i])) for i in range(3))
+    quantized = []
+    max_error = 0.0
+    for p in positions:
+        q = tuple(
+            (
+                max(
+                    -INT16_MAX,
+                    min(INT16_MAX, round((p[i] - offset[i]) / scale[i] * INT16_MAX)),
+                )
+                if scale[i] > 0
+                else 0
+            )
+            for i in range(3)
+        )
+        quantized.append(q)
+        for i in range(3):
+            error = abs(q[i] / INT16_MAX * scale[i] + offset[i] - p[i])
+            max_error = max(max_error, error)
+    return quantized, scale, offset, max_error
+
+
+def octWrap(x, y):
+    return (
+        (1 - abs(y)) * (1 if x >= 0 else -1),
+        (1 - abs(x)) * (1 if y >= 0 else -1),
+    )
+
+
+def octDecode(x, y):
+    z = 1 - abs(x) - abs(y)
+    if z < 0:
+        x, y = octWrap(x, y)
+    length = math.sqrt(x * x + y * y + z * z)
+    return (x / length, y / length, z / length)
+
+
+def octEncode(n, bits):
+    """
+    Returns the octahedral encoding of unit normal n as two signed integers of the given
+    bit size. Tries each rounding direction and keeps the most accurate.
+    """
+    scale = (1 << (bits - 1)) - 1
+    l1 = abs(n[0]) + abs(n[1]) + abs(n[2])
+    x, y = n[0] / l1, n[1] / l1
+    if n[2] < 0:
+        x, y = octWrap(x, y)
+    best = None
+    best_dot = -2
+    for qx in (math.floor(x * scale), math.ceil(x * scale)):
+        for qy in (math.floor(y * scale), math.ceil(y * scale)):
+            d = octDecode(qx / scale, qy / scale)
+            dot = d[0] * n[0] + d[1] * n[1] + d[2] * n[2]
+            if dot > best_dot:
+                best_dot = dot
+                best = (qx, qy)
+    return best, math.degrees(math.acos(min(1.0, best_dot)))
+
+
+def quantizeNormals(normals, bits):
+    """Returns (encoded pairs, max error in degrees) for the given unit normals."""
+    encoded = []
+    max_error = 0.0
+    for n in normals:
+        q, error = octEncode(n, bits)
+        encoded.append(q)
+        max_error = max(max_error, error)
+    return encoded, max_error
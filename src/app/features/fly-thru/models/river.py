@@ -3,6 +3,8 @@
 
 import math
 
+import numpy as np
+
 type Vec = tuple[float, float]
 
 # First coordinate must be directly north of (0,0).
@@ -26,69 +28,166 @@ MAJOR_PERIOD = 183.0
 MAJOR_MAGNITUDE = 18.0
 MINOR_PERIOD = 17.0
 MINOR_MAGNITUDE = 7.0
+# Most distance between the perturbed axis and the chords of its adaptive sampling,
+# half the terrain grid spacing where the distance field is sampled.
+AXIS_CHORD_TOLERANCE = 1.5
+# Spacing of the dense samples of the perturbed axis that adaptive sampling chooses from.
+AXIS_DENSE_SPACING = 0.05
+# Terrain grid of TerrainModelService, where the distance field is sampled.
+TERRAIN_HALF_GRID_COUNT = 64
+TERRAIN_METERS_PER_GRID = 3.0
+# Half width of the water mesh.
+WATER_HALF_WIDTH = 32.0
+# Gaussian smoothing of the axis fattened for the water, in meters of arc length. Enough
+# that no bend is tighter than the half width, so the mitered banks never fold back.
+WATER_AXIS_SMOOTHING = 32.0
+WATER_CHORD_TOLERANCE = 1.0
+# Least distance from the axis the water must cover, which is the width of the river
+# surface. RIVER_EDGE_TO_CENTER_DISTANCE of TerrainModelService.
+WATER_EDGE_DISTANCE = 11.0
 
-def buildPerturbedAxis(axis: list[Vec], size: int) -> list[Vec]:
-    """
-    Return a perturbed version of the given polyline axis. Uses a sum of
-    sines as offset perpendicular to the unperturbed axis.
-    """
-    totalLength = 0
-    for a, b in zip(axis[1:], axis):
-        dx = a[0] - b[0]
-        dy = a[1] - b[1]
-        totalLength += math.sqrt(dx * dx + dy * dy)
-
-    purturbedAxis = []
-    ds = totalLength / (size - 1)
-    iSeg = -1
-    s = sSegStart = sSegEnd = segLength = 0.0
-    v = None
-    vp = None
-    for count in range(size):
-        # Advance to next axis segment as needed.
-        if s >= sSegEnd and iSeg + 1 < len(axis) - 1:
-            iSeg += 1
-            sSegStart = sSegEnd
-            d = sub(axis[iSeg + 1], axis[iSeg])
-            segLength = length(d)
-            sSegEnd += segLength
-            v = normalize(d)
-            vp = perp(v)
-        sSeg = s - sSegStart
-        tSeg = sSeg / segLength
-        p = add(axis[iSeg], scale(v, sSeg))
-        ofs = MAJOR_MAGNITUDE * math.sin(
-            s / MAJOR_PERIOD * 2 * math.pi
-        ) + MINOR_MAGNITUDE * math.sin(s / MINOR_PERIOD * 2 * math.pi)
-        # Reduce offset near segment ends.
-        ofs *= math.sin(tSeg * math.pi)
-        purturbedAxis.append(add(p, scale(vp, ofs)))
-        s += ds
-    return purturbedAxis
-
-
-def buildRiverAxis(halfSize: float) -> list[Vec]:
-    north = buildPerturbedAxis(RIVER_AXIS_NORTH, halfSize)
-    south = buildPerturbedAxis(RIVER_AXIS_SOUTH, halfSize)
-    north.reverse()
-    north.extend(south)
-    return north
-
-def fattenAxis(halfWidth: float) -> tuple[list[Vec], list[Vec]]:
-    axis = RIVER_AXIS
-    ofs = normalize(perp(sub(axis[1], axis[0])), halfWidth)
-    leftPoints = [add(axis[0], ofs)]
-    rightPoints = [add(axis[0], neg(ofs))]
-    for a, b, c in zip(axis[2:], axis[1:], axis):
-        pab = normalize(perp(sub(a, b)))
-        pbc = normalize(perp(sub(b, c)))
-        ofs = normalize(add(pab, pbc), halfWidth / math.sqrt(0.5 * (1 + dot(pab, pbc))))
-        leftPoints.append(add(b, ofs))
-        rightPoints.append(add(b, neg(ofs)))
-    ofs = normalize(perp(sub(axis[-1], axis[-2])), halfWidth)
-    leftPoints.append(add(axis[-1], ofs))    
-    rightPoints.append(add(axis[-1], neg(ofs)))
-    return (leftPoints, rightPoints)
+def perturbedAxisPoints(axis: list[Vec], s: np.ndarray) -> np.ndarray:
+    """
+    Returns points of a perturbed version of the given polyline axis at the given arc
+    lengths along it, as an (n, 2) array. Uses a sum of sines as offset perpendicular to
+    the unperturbed axis, reduced to zero at its vertices.
+    """
+    points = np.array(axis, dtype=float)
+    d = np.diff(points, axis=0)
+    segLengths = np.hypot(d[:, 0], d[:, 1])
+    sSegStarts = np.concatenate([[0], np.cumsum(segLengths)[:-1]])
+    iSeg = np.clip(np.searchsorted(sSegStarts, s, side="right") - 1, 0, len(d) - 1)
+    sSeg = s - sSegStarts[iSeg]
+    v = d[iSeg] / segLengths[iSeg, np.newaxis]
+    vp = np.stack([-v[:, 1], v[:, 0]], axis=1)
+    ofs = MAJOR_MAGNITUDE * np.sin(
+        s / MAJOR_PERIOD * 2 * np.pi
+    ) + MINOR_MAGNITUDE * np.sin(s / MINOR_PERIOD * 2 * np.pi)
+    # Reduce offset near segment ends.
+    ofs *= np.sin(sSeg / segLengths[iSeg] * np.pi)
+    return points[iSeg] + v * sSeg[:, np.newaxis] + vp * ofs[:, np.newaxis]
+
+def buildAdaptiveAxis(axis: list[Vec], tolerance: float) -> np.ndarray:
+    """
+    Returns points of the perturbed version of the given polyline axis with no chord
+    farther than tolerance from the curve. Starts with the axis vertices, where the
+    perturbation has kinks, then splits every chord that's too far from the curve at
+    its farthest point, after Douglas and Peucker. Bends get many points and straight
+    runs few. All chords are split at once in each pass.
+    """
+    points = np.array(axis, dtype=float)
+    d = np.diff(points, axis=0)
+    sVertices = np.concatenate([[0], np.cumsum(np.hypot(d[:, 0], d[:, 1]))])
+    count = math.ceil(sVertices[-1] / AXIS_DENSE_SPACING) + 1
+    s = np.union1d(np.linspace(0, sVertices[-1], count), sVertices)
+    dense = perturbedAxisPoints(axis, s)
+    return simplifyAxis(dense, np.searchsorted(s, sVertices), tolerance)
+
+def simplifyAxis(dense: np.ndarray, kept: np.ndarray, tolerance: float) -> np.ndarray:
+    """
+    Returns the points of a dense polyline to keep so no chord between kept points is
+    farther than tolerance from the dropped ones. Starts with the given indices of kept
+    points, which must include both ends, and refines as buildAdaptiveAxis describes.
+    """
+    while True:
+        # Chord of each dense point and the point's distance from it.
+        chord = np.clip(
+            np.searchsorted(kept, np.arange(len(dense)), side="right") - 1,
+            0,
+            len(kept) - 2,
+        )
+        a = dense[kept[chord]]
+        ab = dense[kept[chord + 1]] - a
+        ap = dense - a
+        abLength = np.hypot(ab[:, 0], ab[:, 1])
+        distance = np.abs(ab[:, 0] * ap[:, 1] - ab[:, 1] * ap[:, 0]) / np.maximum(
+            abLength, 1e-12
+        )
+        worst = np.maximum.reduceat(distance, kept[:-1])
+        # First farthest point of each chord that's too far.
+        farthest = distance == worst[chord]
+        candidates = np.flatnonzero(farthest & (distance > tolerance))
+        _, first = np.unique(chord[candidates], return_index=True)
+        if len(first) == 0:
+            return dense[kept]
+        kept = np.union1d(kept, candidates[first])
+
+def buildRiverAxis(tolerance: float) -> np.ndarray:
+    north = buildAdaptiveAxis(RIVER_AXIS_NORTH, tolerance)
+    south = buildAdaptiveAxis(RIVER_AXIS_SOUTH, tolerance)
+    return np.concatenate([north[::-1], south])
+
+def smoothAxis(axis: np.ndarray, sigma: float) -> np.ndarray:
+    """
+    Returns the axis resampled every AXIS_DENSE_SPACING and smoothed with a Gaussian of
+    the given standard deviation in arc length. The axis is extended straight past its
+    ends for the smoothing, so the ends stay put.
+    """
+    d = np.diff(axis, axis=0)
+    s = np.concatenate([[0], np.cumsum(np.hypot(d[:, 0], d[:, 1]))])
+    sDense = np.linspace(0, s[-1], math.ceil(s[-1] / AXIS_DENSE_SPACING) + 1)
+    dense = np.stack(
+        [np.interp(sDense, s, axis[:, 0]), np.interp(sDense, s, axis[:, 1])], axis=1
+    )
+    spacing = sDense[1] - sDense[0]
+    radius = math.ceil(3 * sigma / spacing)
+    kernel = np.exp(-0.5 * np.square(np.arange(-radius, radius + 1) * spacing / sigma))
+    kernel /= kernel.sum()
+    extended = np.concatenate(
+        [
+            2 * dense[0] - dense[radius:0:-1],
+            dense,
+            2 * dense[-1] - dense[-2 : -radius - 2 : -1],
+        ]
+    )
+    return np.stack(
+        [np.convolve(extended[:, k], kernel, mode="valid") for k in range(2)], axis=1
+    )
+
+def buildWaterAxis(axis: np.ndarray) -> np.ndarray:
+    """
+    Returns a gently bending axis for the water near the given one, sampled to within
+    WATER_CHORD_TOLERANCE. Fattening the river axis itself would fold back in its
+    bends, which are far tighter than the water's half width.
+    """
+    smoothed = smoothAxis(axis, WATER_AXIS_SMOOTHING)
+    ends = np.array([0, len(smoothed) - 1])
+    return simplifyAxis(smoothed, ends, WATER_CHORD_TOLERANCE)
+
+def fattenAxis(axis: np.ndarray, halfWidth: float) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Returns points and (a, b, c) triangles of a strip the given half width on each side
+    of the axis. Each axis point gets one left and one right point, offset along the
+    miter of its segments so the banks are half width from both. Points are all the left
+    ones followed by all the right ones. The axis must bend gently enough that its banks
+    don't fold back.
+    """
+    d = np.diff(axis, axis=0)
+    # Unit left perpendiculars of the segments.
+    p = (
+        np.stack([-d[:, 1], d[:, 0]], axis=1)
+        / np.hypot(d[:, 0], d[:, 1])[:, np.newaxis]
+    )
+    # Miters are lengthened by the secant of half the turn.
+    miters = p[:-1] + p[1:]
+    cosines = np.einsum("mk,mk->m", p[:-1], p[1:])
+    miters *= (
+        halfWidth / np.hypot(miters[:, 0], miters[:, 1]) / np.sqrt(0.5 * (1 + cosines))
+    )[:, np.newaxis]
+    ofs = np.concatenate([p[:1] * halfWidth, miters, p[-1:] * halfWidth])
+    points = np.concatenate([axis + ofs, axis - ofs])
+    left = np.arange(len(d))
+    right = left + len(axis)
+    triangles = np.concatenate(
+        [
+            np.stack([right, left + 1, right + 1], axis=1),
+            np.stack([left + 1, right, left], axis=1),
+        ]
+    )
+    for triangle in triangles:
+        if not isFrontFacing(*points[triangle]):
+            raise Exception(f"River banks fold back at {points[triangle[0]]}")
+    return points, triangles
 
 def sqr(x: float) -> float:
     return x * x
@@ -117,8 +216,57 @@ def neg(a: Vec) -> Vec:
 def perp(a: Vec) -> Vec:
     return (-a[1], a[0])
 
+def segmentDistances(points: np.ndarray, axis: np.ndarray) -> np.ndarray:
+    """Returns distances from (n, 2) points to each segment of the axis as (n, m)."""
+    a = axis[:-1]
+    ab = axis[1:] - a
+    ap = points[:, np.newaxis, :] - a
+    t = np.einsum("nmk,mk->nm", ap, ab) / np.maximum(
+        np.einsum("mk,mk->m", ab, ab), 1e-12
+    )
+    closest = a + np.clip(t, 0, 1)[:, :, np.newaxis] * ab
+    return np.linalg.norm(points[:, np.newaxis, :] - closest, axis=2)
+
+
+def westSigns(points: np.ndarray, axis: np.ndarray) -> np.ndarray:
+    """
+    Returns -1 for points west of the axis and 1 for others. West points see the axis an
+    odd number of times looking east, with the axis ends extended north and south.
+    """
+    far = 1e6
+    extended = np.concatenate([[(axis[0][0], -far)], axis, [(axis[-1][0], far)]])
+    a = extended[:-1]
+    b = extended[1:]
+    x = points[:, np.newaxis, 0]
+    z = points[:, np.newaxis, 1]
+    spans = (a[:, 1] > z) != (b[:, 1] > z)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        xCrossing = a[:, 0] + (z - a[:, 1]) * (b[:, 0] - a[:, 0]) / (b[:, 1] - a[:, 1])
+    crossings = np.count_nonzero(spans & (xCrossing > x), axis=1)
+    return np.where(crossings % 2 == 1, -1.0, 1.0)
+
+
+def buildDistanceField(axis: np.ndarray) -> np.ndarray:
+    """
+    Returns the signed distance to the axis from each terrain post, negative on the west
+    bank, indexed [j, i] for x = (j - TERRAIN_HALF_GRID_COUNT) * TERRAIN_METERS_PER_GRID
+    and z likewise with i. Same grid as TerrainModelService.synthesizeElevation.
+    """
+    postCount = 2 * TERRAIN_HALF_GRID_COUNT + 1
+    coords = (np.arange(postCount) - TERRAIN_HALF_GRID_COUNT) * TERRAIN_METERS_PER_GRID
+    x, z = np.meshgrid(coords, coords, indexing="ij")
+    points = np.stack([x.ravel(), z.ravel()], axis=1)
+    distances = segmentDistances(points, axis).min(axis=1) * westSigns(points, axis)
+    return distances.reshape(postCount, postCount)
+
+
+def isFrontFacing(a: Vec, b: Vec, c: Vec) -> bool:
+    """Whether the x-z triangle abc is counterclockwise seen from above, so not culled."""
+    return (b[0] - a[0]) * (c[1] - a[1]) - (b[1] - a[1]) * (c[0] - a[0]) < 0
+
 def main():
-    axis = buildRiverAxis(32)
+    axis = buildRiverAxis(AXIS_CHORD_TOLERANCE)
+    print(f"river axis: {len(axis)} points with chord tolerance {AXIS_CHORD_TOLERANCE}")
     with open("river.ts", "w") as outFile:
         print("// This file is generated. Edit river.py.", file=outFile)
 
@@ -130,24 +278,38 @@ def main():
         print("]);", file=outFile)
 
         # Polygon
-        leftPoints, rightPoints = fattenAxis(32)
+        waterAxis = buildWaterAxis(axis)
+        points, triangles = fattenAxis(waterAxis, WATER_HALF_WIDTH)
+        # Least distance from a river axis point to the banks of the water.
+        deviation = segmentDistances(axis, waterAxis).min(axis=1).max()
+        coverage = WATER_HALF_WIDTH - deviation
+        if coverage < WATER_EDGE_DISTANCE:
+            raise Exception(f"River water covers only {coverage:.1f} m of the river")
         print("// prettier-ignore", file=outFile)
         print("export const RIVER_MESH_DATA = {", file=outFile)
         print("  positions: new Float32Array([", file=outFile)
-        for i, p in enumerate(leftPoints):
+        for i, p in enumerate(points):
             print(f"    {p[0]:.2f}, {p[1]:.2f}, // {i}", file=outFile)
-        for i, p in enumerate(rightPoints):
-            print(f"    {p[0]:.2f}, {p[1]:.2f}, // {i + len(leftPoints)}", file=outFile)
         print("  ]),", file=outFile)
         print("  indices: new Uint16Array([", file=outFile)
-        for i in range(len(leftPoints) - 1):
-            se = i
-            ne = se + 1
-            sw = i + len(leftPoints)
-            nw = sw + 1
-            print(f"    {sw}, {ne}, {nw},", file=outFile)
-            print(f"    {ne}, {sw}, {se},", file=outFile)
+        for a, b, c in triangles:
+            print(f"    {a}, {b}, {c},", file=outFile)
         print("  ]),", file=outFile)
         print("};", file=outFile)
 
-main()
+        # Distance field, from the axis as rounded above.
+        roundedAxis = np.round(axis, 2)
+        field = buildDistanceField(roundedAxis)
+        print(
+            "// Signed distance from terrain post (i, j) to the axis at j * POST_COUNT + i, negative west.",
+            file=outFile,
+        )
+        print("// prettier-ignore", file=outFile)
+        print("export const RIVER_DISTANCE_FIELD = new Float32Array([", file=outFile)
+        for j, row in enumerate(field):
+            print(f"  {', '.join(f'{d:.2f}' for d in row)}, // {j}", file=outFile)
+        print("]);", file=outFile)
+    print(f"river water: {len(points)} points covering {coverage:.1f} m from the axis")
+
+if __name__ == "__main__":
+    main()
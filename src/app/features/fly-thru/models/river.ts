@@ -5,104 +5,267 @@
 // prettier-ignore
 export const RIVER_AXIS = new Float32Array([
   80.00, -190.00, // 0
-  76.19, -184.54, // 1
-  74.79, -176.75, // 2
-  63.61, -178.42, // 3
-  61.22, -171.58, // 4
-  53.82, -169.59, // 5
-  40.53, -173.30, // 6
-  43.16, -161.61, // 7
-  30.06, -165.13, // 8
-  28.77, -157.23, // 9
-  28.45, -148.40, // 10
-  22.54, -144.97, // 11
-  23.86, -134.55, // 12
-  20.23, -128.46, // 13
-  14.95, -123.26, // 14
-  16.45, -115.86, // 15
-  7.69, -111.80, // 16
-  15.97, -102.20, // 17
-  15.71, -95.37, // 18
-  11.23, -89.91, // 19
-  23.87, -78.89, // 20
-  12.53, -75.66, // 21
-  15.30, -67.85, // 22
-  12.74, -61.77, // 23
-  2.86, -58.07, // 24
-  -0.27, -52.18, // 25
-  0.20, -47.09, // 26
-  6.22, -41.15, // 27
-  14.74, -35.48, // 28
-  -0.61, -27.16, // 29
-  3.89, -21.05, // 30
-  0.00, -14.00, // 31
-  0.00, 16.00, // 32
-  -0.50, 25.14, // 33
-  4.47, 30.87, // 34
-  2.28, 41.08, // 35
-  13.87, 41.32, // 36
-  4.22, 45.28, // 37
-  1.88, 52.43, // 38
-  -9.42, 55.67, // 39
-  -9.98, 63.60, // 40
-  -11.32, 71.19, // 41
-  -16.05, 77.30, // 42
-  -6.52, 89.64, // 43
-  -15.39, 93.94, // 44
-  -6.79, 105.88, // 45
-  -15.05, 110.44, // 46
-  -16.96, 117.79, // 47
-  -15.62, 120.94, // 48
-  -7.28, 121.61, // 49
-  1.79, 121.05, // 50
-  7.22, 126.56, // 51
-  18.68, 122.03, // 52
-  18.96, 136.13, // 53
-  30.72, 131.08, // 54
-  29.22, 148.15, // 55
-  37.68, 148.61, // 56
-  39.82, 159.60, // 57
-  44.00, 167.20, // 58
-  51.74, 168.85, // 59
-  54.80, 178.31, // 60
-  65.18, 175.57, // 61
-  71.03, 180.39, // 62
-  80.00, 180.00, // 63
+  76.37, -185.09, // 1
+  74.66, -176.67, // 2
+  60.80, -177.89, // 3
+  60.69, -167.78, // 4
+  41.78, -174.44, // 5
+  42.84, -161.32, // 6
+  27.01, -165.01, // 7
+  30.75, -150.27, // 8
+  22.81, -146.68, // 9
+  23.95, -135.42, // 10
+  22.00, -130.00, // 11
+  15.15, -124.45, // 12
+  16.37, -115.75, // 13
+  7.31, -110.75, // 14
+  19.77, -97.77, // 15
+  9.48, -91.96, // 16
+  23.81, -78.47, // 17
+  11.16, -74.91, // 18
+  17.11, -63.62, // 19
+  4.26, -59.59, // 20
+  1.10, -53.37, // 21
+  -4.00, -50.00, // 22
+  2.45, -42.75, // 23
+  15.84, -37.14, // 24
+  -0.65, -27.11, // 25
+  3.93, -20.77, // 26
+  0.00, -14.00, // 27
+  0.00, 16.00, // 28
+  -1.57, 24.35, // 29
+  6.23, 27.32, // 30
+  -1.29, 40.51, // 31
+  15.00, 40.00, // 32
+  1.91, 46.55, // 33
+  0.75, 54.72, // 34
+  -14.19, 57.08, // 35
+  -5.96, 69.68, // 36
+  -19.13, 73.20, // 37
+  -5.71, 87.69, // 38
+  -15.71, 92.65, // 39
+  -6.78, 105.78, // 40
+  -14.99, 110.37, // 41
+  -16.46, 117.05, // 42
+  -20.00, 120.00, // 43
+  -10.99, 122.53, // 44
+  0.10, 119.48, // 45
+  5.19, 127.03, // 46
+  18.13, 121.40, // 47
+  19.05, 136.20, // 48
+  31.76, 131.93, // 49
+  29.56, 151.82, // 50
+  41.16, 148.62, // 51
+  39.46, 168.27, // 52
+  50.32, 164.65, // 53
+  52.81, 178.28, // 54
+  63.70, 175.09, // 55
+  69.85, 180.21, // 56
+  80.00, 180.00, // 57
 ]);
 // prettier-ignore
 export const RIVER_MESH_DATA = {
   positions: new Float32Array([
-    56.99, -212.24, // 0
-    -6.15, -146.92, // 1
-    -36.57, -53.33, // 2
-    -32.00, -12.23, // 3
-    -32.00, 25.18, // 4
-    -21.08, 42.64, // 5
-    -60.60, 132.96, // 6
-    63.54, 207.44, // 7
-    103.01, -167.76, // 8
-    50.15, -113.08, // 9
-    28.57, -46.67, // 10
-    32.00, -15.77, // 11
-    32.00, 6.82, // 12
-    51.08, 37.36, // 13
-    20.60, 107.04, // 14
-    96.46, 152.56, // 15
+    61.39, -216.04, // 0
+    15.11, -182.96, // 1
+    0.54, -163.18, // 2
+    -9.36, -139.99, // 3
+    -14.59, -118.55, // 4
+    -18.08, -83.76, // 5
+    -26.85, -37.29, // 6
+    -29.73, -3.71, // 7
+    -30.10, 33.87, // 8
+    -40.19, 63.92, // 9
+    -43.36, 90.61, // 10
+    -39.65, 117.75, // 11
+    -25.79, 139.72, // 12
+    1.61, 160.53, // 13
+    30.49, 190.70, // 14
+    48.06, 201.42, // 15
+    67.78, 209.57, // 16
+    98.61, -163.96, // 17
+    60.60, -136.81, // 18
+    56.48, -131.21, // 19
+    51.57, -119.70, // 20
+    48.64, -107.71, // 21
+    45.32, -74.62, // 22
+    36.64, -28.60, // 23
+    34.24, -0.65, // 24
+    33.79, 44.63, // 25
+    22.58, 78.03, // 26
+    21.15, 90.04, // 27
+    21.88, 95.33, // 28
+    22.15, 95.76, // 29
+    44.35, 112.62, // 30
+    70.96, 140.42, // 31
+    77.13, 144.19, // 32
+    92.22, 150.43, // 33
   ]),
   indices: new Uint16Array([
-    8, 1, 9,
-    1, 8, 0,
-    9, 2, 10,
-    2, 9, 1,
-    10, 3, 11,
-    3, 10, 2,
-    11, 4, 12,
-    4, 11, 3,
-    12, 5, 13,
-    5, 12, 4,
-    13, 6, 14,
-    6, 13, 5,
-    14, 7, 15,
-    7, 14, 6,
+    17, 1, 18,
+    18, 2, 19,
+    19, 3, 20,
+    20, 4, 21,
+    21, 5, 22,
+    22, 6, 23,
+    23, 7, 24,
+    24, 8, 25,
+    25, 9, 26,
+    26, 10, 27,
+    27, 11, 28,
+    28, 12, 29,
+    29, 13, 30,
+    30, 14, 31,
+    31, 15, 32,
+    32, 16, 33,
+    1, 17, 0,
+    2, 18, 1,
+    3, 19, 2,
+    4, 20, 3,
+    5, 21, 4,
+    6, 22, 5,
+    7, 23, 6,
+    8, 24, 7,
+    9, 25, 8,
+    10, 26, 9,
+    11, 27, 10,
+    12, 28, 11,
+    13, 29, 12,
+    14, 30, 13,
+    15, 31, 14,
+    16, 32, 15,
   ]),
 };
+// Signed distance from terrain post (i, j) to the axis at j * POST_COUNT + i, negative west.
+// prettier-ignore
+export const RIVER_DISTANCE_FIELD = new Float32Array([
+  -215.23, -214.12, -213.04, -212.00, -211.00, -210.03, -209.11, -208.22, -207.37, -206.56, -205.79, -205.07, -204.38, -203.74, -203.14, -202.58, -202.06, -201.59, -201.16, -200.78, -200.44, -200.14, -199.89, -199.69, -199.52, -199.41, -198.60, -197.65, -196.74, -195.88, -195.06, -194.28, -193.55, -192.85, -192.21, -191.61, -191.05, -190.54, -190.07, -189.65, -189.28, -188.96, -188.68, -188.45, -188.27, -188.13, -188.04, -188.00, -188.01, -188.07, -188.17, -188.32, -188.52, -188.77, -189.06, -189.40, -189.79, -190.22, -190.70, -191.23, -190.76, -189.69, -188.67, -187.69, -186.75, -185.85, -185.00, -184.20, -183.38, -182.40, -181.47, -180.58, -179.74, -178.94, -178.19, -177.48, -176.83, -176.22, -175.66, -175.16, -174.70, -174.29, -173.93, -173.63, -173.37, -173.17, -173.02, -172.92, -172.87, -172.88, -172.94, -173.05, -173.21, -173.42, -173.68, -174.00, -173.67, -173.28, -172.94, -172.65, -172.42, -172.24, -172.10, -172.03, -172.00, -172.03, -172.10, -172.24, -172.42, -172.65, -172.94, -173.28, -173.67, -174.11, -174.60, -175.14, -175.73, -176.37, -177.05, -177.79, -178.57, -179.40, -180.28, -181.20, -182.16, -183.17, -184.23, -185.32, -186.46, // 0
+  -212.46, -211.33, -210.24, -209.18, -208.17, -207.19, -206.25, -205.35, -204.49, -203.67, -202.89, -202.15, -201.46, -200.81, -200.20, -199.63, -199.11, -198.63, -198.19, -197.80, -197.46, -197.16, -196.90, -196.69, -196.53, -196.41, -195.76, -194.80, -193.88, -193.00, -192.17, -191.38, -190.63, -189.93, -189.27, -188.66, -188.10, -187.58, -187.11, -186.68, -186.30, -185.97, -185.69, -185.46, -185.27, -185.13, -185.04, -185.00, -185.01, -185.07, -185.17, -185.33, -185.53, -185.78, -186.08, -186.42, -186.82, -187.26, -187.75, -188.28, -187.96, -186.88, -185.84, -184.85, -183.89, -182.98, -182.12, -181.30, -180.53, -179.56, -178.61, -177.71, -176.85, -176.04, -175.28, -174.56, -173.90, -173.28, -172.71, -172.19, -171.73, -171.31, -170.95, -170.64, -170.38, -170.18, -170.02, -169.92, -169.87, -169.88, -169.94, -170.05, -170.21, -170.43, -170.70, -171.02, -170.70, -170.30, -169.96, -169.66, -169.43, -169.24, -169.11, -169.03, -169.00, -169.03, -169.11, -169.24, -169.43, -169.66, -169.96, -170.30, -170.70, -171.14, -171.64, -172.19, -172.79, -173.44, -174.14, -174.89, -175.68, -176.53, -177.42, -178.35, -179.33, -180.36, -181.43, -182.54, -183.70, // 1
+  -209.69, -208.55, -207.44, -206.37, -205.34, -204.35, -203.39, -202.48, -201.61, -200.78, -199.99, -199.24, -198.54, -197.87, -197.25, -196.68, -196.15, -195.66, -195.22, -194.83, -194.47, -194.17, -193.91, -193.70, -193.53, -193.41, -192.92, -191.95, -191.02, -190.13, -189.28, -188.48, -187.72, -187.01, -186.34, -185.72, -185.15, -184.62, -184.14, -183.71, -183.32, -182.99, -182.70, -182.46, -182.27, -182.13, -182.04, -182.00, -182.01, -182.07, -182.18, -182.33, -182.54, -182.79, -183.10, -183.45, -183.85, -184.30, -184.79, -185.33, -185.18, -184.08, -183.02, -182.01, -181.04, -180.12, -179.24, -178.41, -177.63, -176.73, -175.76, -174.84, -173.97, -173.15, -172.37, -171.64, -170.97, -170.34, -169.76, -169.24, -168.76, -168.34, -167.97, -167.65, -167.39, -167.18, -167.03, -166.92, -166.87, -166.88, -166.94, -167.05, -167.22, -167.44, -167.71, -168.04, -167.73, -167.32, -166.97, -166.68, -166.43, -166.24, -166.11, -166.03, -166.00, -166.03, -166.11, -166.24, -166.43, -166.68, -166.97, -167.32, -167.73, -168.18, -168.69, -169.25, -169.86, -170.52, -171.23, -171.99, -172.80, -173.66, -174.56, -175.51, -176.51, -177.55, -178.64, -179.77, -180.94, // 2
+  -206.93, -205.77, -204.65, -203.56, -202.52, -201.51, -200.55, -199.62, -198.73, -197.89, -197.09, -196.33, -195.62, -194.94, -194.32, -193.73, -193.19, -192.70, -192.25, -191.85, -191.49, -191.18, -190.92, -190.70, -190.53, -190.41, -190.10, -189.11, -188.16, -187.26, -186.40, -185.59, -184.82, -184.09, -183.41, -182.78, -182.20, -181.66, -181.18, -180.74, -180.35, -180.01, -179.71, -179.47, -179.28, -179.14, -179.04, -179.00, -179.01, -179.07, -179.18, -179.34, -179.55, -179.81, -180.11, -180.47, -180.88, -181.33, -181.84, -182.39, -182.40, -181.28, -180.21, -179.18, -178.20, -177.26, -176.37, -175.52, -174.73, -173.90, -172.92, -171.98, -171.10, -170.26, -169.47, -168.73, -168.04, -167.40, -166.81, -166.28, -165.80, -165.37, -164.99, -164.67, -164.40, -164.19, -164.03, -163.92, -163.87, -163.88, -163.94, -164.06, -164.23, -164.45, -164.73, -165.06, -164.76, -164.35, -163.99, -163.69, -163.44, -163.25, -163.11, -163.03, -163.00, -163.03, -163.11, -163.25, -163.44, -163.69, -163.99, -164.35, -164.76, -165.22, -165.74, -166.31, -166.93, -167.60, -168.32, -169.10, -169.92, -170.79, -171.71, -172.68, -173.69, -174.75, -175.86, -177.00, -178.19, // 3
+  -204.17, -203.00, -201.86, -200.76, -199.70, -198.68, -197.70, -196.76, -195.86, -195.01, -194.19, -193.42, -192.70, -192.02, -191.38, -190.79, -190.24, -189.74, -189.28, -188.87, -188.51, -188.20, -187.93, -187.71, -187.54, -187.41, -187.28, -186.27, -185.31, -184.39, -183.52, -182.69, -181.91, -181.18, -180.49, -179.85, -179.25, -178.71, -178.21, -177.77, -177.37, -177.02, -176.73, -176.48, -176.28, -176.14, -176.05, -176.00, -176.01, -176.07, -176.18, -176.34, -176.56, -176.82, -177.13, -177.50, -177.91, -178.37, -178.89, -179.45, -179.62, -178.49, -177.40, -176.36, -175.36, -174.41, -173.50, -172.64, -171.83, -171.07, -170.08, -169.13, -168.23, -167.37, -166.57, -165.82, -165.12, -164.47, -163.87, -163.32, -162.83, -162.39, -162.01, -161.68, -161.41, -161.19, -161.03, -160.92, -160.87, -160.88, -160.94, -161.06, -161.23, -161.46, -161.74, -162.08, -161.79, -161.37, -161.01, -160.70, -160.45, -160.25, -160.11, -160.03, -160.00, -160.03, -160.11, -160.25, -160.45, -160.70, -161.01, -161.37, -161.79, -162.26, -162.79, -163.37, -164.00, -164.68, -165.42, -166.21, -167.04, -167.93, -168.87, -169.85, -170.88, -171.96, -173.08, -174.24, -175.45, // 4
+  -201.42, -200.23, -199.08, -197.97, -196.89, -195.86, -194.86, -193.91, -193.00, -192.13, -191.30, -190.52, -189.78, -189.09, -188.44, -187.84, -187.29, -186.78, -186.31, -185.90, -185.53, -185.21, -184.94, -184.72, -184.54, -184.42, -184.34, -183.44, -182.46, -181.53, -180.65, -179.81, -179.01, -178.26, -177.56, -176.91, -176.31, -175.76, -175.25, -174.80, -174.39, -174.04, -173.74, -173.49, -173.29, -173.14, -173.05, -173.00, -173.01, -173.07, -173.18, -173.35, -173.57, -173.83, -174.15, -174.52, -174.94, -175.41, -175.93, -176.50, -176.86, -175.71, -174.60, -173.54, -172.53, -171.56, -170.63, -169.76, -168.94, -168.16, -167.24, -166.28, -165.36, -164.49, -163.67, -162.91, -162.19, -161.53, -160.92, -160.37, -159.87, -159.42, -159.03, -158.70, -158.42, -158.20, -158.03, -157.93, -157.87, -157.88, -157.94, -158.06, -158.24, -158.47, -158.76, -159.11, -158.82, -158.40, -158.03, -157.71, -157.46, -157.26, -157.11, -157.03, -157.00, -157.03, -157.11, -157.26, -157.46, -157.71, -158.03, -158.40, -158.82, -159.30, -159.84, -160.43, -161.07, -161.77, -162.52, -163.32, -164.17, -165.08, -166.03, -167.03, -168.07, -169.17, -170.31, -171.49, -172.72, // 5
+  -198.68, -197.48, -196.31, -195.18, -194.08, -193.03, -192.03, -191.06, -190.13, -189.25, -188.41, -187.62, -186.87, -186.17, -185.51, -184.90, -184.33, -183.82, -183.35, -182.92, -182.55, -182.23, -181.95, -181.72, -181.55, -181.42, -181.34, -180.61, -179.62, -178.68, -177.78, -176.92, -176.11, -175.35, -174.64, -173.98, -173.37, -172.80, -172.29, -171.83, -171.42, -171.06, -170.75, -170.50, -170.29, -170.14, -170.05, -170.00, -170.01, -170.07, -170.19, -170.36, -170.58, -170.85, -171.17, -171.55, -171.98, -172.46, -172.99, -173.57, -174.00, -172.93, -171.81, -170.73, -169.70, -168.71, -167.77, -166.89, -166.05, -165.26, -164.41, -163.43, -162.50, -161.61, -160.78, -160.00, -159.28, -158.60, -157.98, -157.42, -156.91, -156.45, -156.06, -155.71, -155.43, -155.21, -155.04, -154.93, -154.87, -154.88, -154.94, -155.07, -155.25, -155.48, -155.78, -156.13, -155.86, -155.43, -155.05, -154.73, -154.47, -154.26, -154.12, -154.03, -154.00, -154.03, -154.12, -154.26, -154.47, -154.73, -155.05, -155.43, -155.86, -156.35, -156.89, -157.50, -158.15, -158.86, -159.62, -160.44, -161.31, -162.23, -163.19, -164.21, -165.28, -166.39, -167.55, -168.75, -170.00, // 6
+  -195.95, -194.72, -193.54, -192.39, -191.29, -190.22, -189.20, -188.21, -187.28, -186.38, -185.53, -184.72, -183.96, -183.25, -182.58, -181.96, -181.38, -180.86, -180.38, -179.95, -179.57, -179.24, -178.96, -178.73, -178.55, -178.42, -178.34, -177.79, -176.79, -175.82, -174.91, -174.04, -173.22, -172.45, -171.72, -171.05, -170.43, -169.85, -169.33, -168.86, -168.44, -168.08, -167.76, -167.51, -167.30, -167.15, -167.05, -167.00, -167.01, -167.07, -167.19, -167.36, -167.59, -167.86, -168.19, -168.58, -169.01, -169.50, -170.04, -170.63, -171.00, -170.16, -169.02, -167.93, -166.88, -165.87, -164.92, -164.02, -163.16, -162.36, -161.59, -160.59, -159.64, -158.74, -157.89, -157.10, -156.36, -155.67, -155.04, -154.47, -153.95, -153.48, -153.08, -152.73, -152.44, -152.21, -152.04, -151.93, -151.87, -151.88, -151.95, -152.07, -152.25, -152.50, -152.80, -153.16, -152.90, -152.45, -152.07, -151.74, -151.48, -151.27, -151.12, -151.03, -151.00, -151.03, -151.12, -151.27, -151.48, -151.74, -152.07, -152.45, -152.90, -153.39, -153.95, -154.56, -155.23, -155.96, -156.73, -157.56, -158.45, -159.38, -160.37, -161.40, -162.48, -163.62, -164.79, -166.02, -167.29, // 7
+  -193.22, -191.98, -190.78, -189.61, -188.49, -187.41, -186.37, -185.37, -184.42, -183.51, -182.65, -181.83, -181.06, -180.33, -179.65, -179.02, -178.44, -177.90, -177.42, -176.98, -176.59, -176.26, -175.97, -175.74, -175.55, -175.42, -175.34, -174.98, -173.95, -172.98, -172.05, -171.16, -170.33, -169.54, -168.81, -168.12, -167.49, -166.90, -166.37, -165.89, -165.47, -165.10, -164.78, -164.51, -164.30, -164.15, -164.05, -164.00, -164.01, -164.08, -164.20, -164.37, -164.60, -164.88, -165.22, -165.60, -166.05, -166.54, -167.09, -167.69, -168.00, -167.40, -166.24, -165.13, -164.06, -163.04, -162.07, -161.15, -160.28, -159.46, -158.70, -157.76, -156.79, -155.87, -155.01, -154.20, -153.45, -152.75, -152.10, -151.52, -150.99, -150.52, -150.10, -149.75, -149.45, -149.22, -149.04, -148.93, -148.87, -148.88, -148.95, -149.07, -149.26, -149.51, -149.81, -150.18, -149.93, -149.48, -149.09, -148.76, -148.49, -148.27, -148.12, -148.03, -148.00, -148.03, -148.12, -148.27, -148.49, -148.76, -149.09, -149.48, -149.93, -150.44, -151.01, -151.63, -152.32, -153.05, -153.84, -154.69, -155.59, -156.54, -157.54, -158.60, -159.70, -160.85, -162.05, -163.29, -164.58, // 8
+  -190.51, -189.25, -188.02, -186.84, -185.70, -184.61, -183.55, -182.54, -181.57, -180.65, -179.77, -178.94, -178.15, -177.41, -176.72, -176.08, -175.49, -174.95, -174.45, -174.01, -173.62, -173.27, -172.98, -172.74, -172.56, -172.42, -172.34, -172.17, -171.13, -170.14, -169.19, -168.29, -167.44, -166.64, -165.89, -165.20, -164.55, -163.96, -163.42, -162.93, -162.50, -162.12, -161.79, -161.52, -161.31, -161.15, -161.05, -161.00, -161.01, -161.08, -161.20, -161.38, -161.61, -161.90, -162.24, -162.63, -163.09, -163.59, -164.15, -164.76, -165.00, -164.65, -163.47, -162.34, -161.25, -160.21, -159.23, -158.29, -157.40, -156.57, -155.79, -154.93, -153.94, -153.01, -152.13, -151.31, -150.54, -149.83, -149.17, -148.57, -148.03, -147.55, -147.13, -146.77, -146.47, -146.23, -146.05, -145.93, -145.87, -145.88, -145.95, -146.08, -146.27, -146.52, -146.83, -147.21, -146.97, -146.51, -146.11, -145.77, -145.50, -145.28, -145.12, -145.03, -145.00, -145.03, -145.12, -145.28, -145.50, -145.77, -146.11, -146.51, -146.97, -147.49, -148.07, -148.71, -149.40, -150.15, -150.96, -151.82, -152.74, -153.71, -154.73, -155.80, -156.92, -158.09, -159.31, -160.58, -161.89, // 9
+  -187.80, -186.52, -185.28, -184.08, -182.92, -181.81, -180.74, -179.71, -178.73, -177.79, -176.90, -176.05, -175.25, -174.50, -173.80, -173.15, -172.54, -171.99, -171.49, -171.04, -170.64, -170.29, -170.00, -169.75, -169.56, -169.43, -169.34, -169.31, -168.31, -167.30, -166.34, -165.42, -164.56, -163.75, -162.98, -162.27, -161.62, -161.01, -160.46, -159.97, -159.52, -159.14, -158.81, -158.53, -158.32, -158.15, -158.05, -158.00, -158.01, -158.08, -158.20, -158.38, -158.62, -158.91, -159.26, -159.67, -160.12, -160.64, -161.21, -161.80, -162.00, -161.91, -160.71, -159.55, -158.45, -157.39, -156.39, -155.43, -154.53, -153.68, -152.89, -152.11, -151.10, -150.15, -149.26, -148.42, -147.63, -146.91, -146.24, -145.63, -145.08, -144.58, -144.15, -143.79, -143.48, -143.23, -143.05, -142.93, -142.88, -142.88, -142.95, -143.08, -143.28, -143.53, -143.85, -144.24, -144.01, -143.54, -143.14, -142.79, -142.51, -142.28, -142.13, -142.03, -142.00, -142.03, -142.13, -142.28, -142.51, -142.79, -143.14, -143.54, -144.01, -144.54, -145.13, -145.78, -146.49, -147.26, -148.08, -148.96, -149.89, -150.88, -151.92, -153.01, -154.16, -155.35, -156.59, -157.88, -159.21, // 10
+  -185.10, -183.80, -182.54, -181.33, -180.15, -179.02, -177.93, -176.89, -175.89, -174.93, -174.03, -173.17, -172.36, -171.59, -170.88, -170.21, -169.60, -169.04, -168.53, -168.07, -167.66, -167.31, -167.01, -166.76, -166.57, -166.43, -166.34, -166.31, -165.50, -164.47, -163.49, -162.56, -161.68, -160.85, -160.08, -159.35, -158.69, -158.07, -157.51, -157.00, -156.55, -156.16, -155.82, -155.54, -155.32, -155.16, -155.05, -155.00, -155.01, -155.08, -155.21, -155.39, -155.63, -155.93, -156.28, -156.70, -157.17, -157.69, -158.27, -158.81, -159.00, -159.00, -157.95, -156.78, -155.65, -154.58, -153.55, -152.58, -151.66, -150.80, -149.99, -149.24, -148.27, -147.30, -146.39, -145.53, -144.73, -143.99, -143.31, -142.68, -142.12, -141.62, -141.18, -140.81, -140.49, -140.24, -140.06, -139.93, -139.88, -139.88, -139.95, -140.09, -140.29, -140.55, -140.88, -141.26, -141.06, -140.58, -140.16, -139.81, -139.52, -139.29, -139.13, -139.03, -139.00, -139.03, -139.13, -139.29, -139.52, -139.81, -140.16, -140.58, -141.06, -141.60, -142.20, -142.86, -143.59, -144.37, -145.21, -146.10, -147.05, -148.06, -149.12, -150.23, -151.40, -152.61, -153.87, -155.18, -156.54, // 11
+  -182.41, -181.09, -179.81, -178.58, -177.39, -176.24, -175.13, -174.07, -173.05, -172.08, -171.16, -170.29, -169.46, -168.69, -167.96, -167.28, -166.66, -166.09, -165.57, -165.10, -164.69, -164.33, -164.02, -163.77, -163.57, -163.43, -163.34, -163.31, -162.69, -161.64, -160.65, -159.70, -158.81, -157.97, -157.18, -156.44, -155.76, -155.13, -154.56, -154.04, -153.58, -153.18, -152.84, -152.55, -152.33, -152.16, -152.05, -152.00, -152.01, -152.08, -152.21, -152.40, -152.64, -152.95, -153.31, -153.73, -154.21, -154.74, -155.33, -155.82, -156.00, -156.00, -155.21, -154.01, -152.87, -151.77, -150.73, -149.74, -148.80, -147.92, -147.10, -146.33, -145.44, -144.46, -143.53, -142.65, -141.84, -141.08, -140.38, -139.74, -139.17, -138.66, -138.21, -137.83, -137.51, -137.25, -137.06, -136.93, -136.88, -136.88, -136.95, -137.09, -137.30, -137.56, -137.90, -138.29, -138.10, -137.61, -137.19, -136.82, -136.53, -136.30, -136.13, -136.03, -136.00, -136.03, -136.13, -136.30, -136.53, -136.82, -137.19, -137.61, -138.10, -138.65, -139.27, -139.95, -140.68, -141.48, -142.34, -143.25, -144.22, -145.25, -146.33, -147.46, -148.65, -149.88, -151.17, -152.50, -153.88, // 12
+  -179.72, -178.39, -177.09, -175.84, -174.63, -173.46, -172.34, -171.26, -170.23, -169.24, -168.30, -167.41, -166.57, -165.78, -165.05, -164.36, -163.72, -163.14, -162.61, -162.13, -161.71, -161.35, -161.03, -160.78, -160.58, -160.43, -160.34, -160.31, -159.89, -158.83, -157.81, -156.85, -155.94, -155.08, -154.28, -153.53, -152.83, -152.19, -151.61, -151.08, -150.62, -150.21, -149.86, -149.57, -149.34, -149.16, -149.05, -149.00, -149.01, -149.08, -149.21, -149.41, -149.66, -149.97, -150.34, -150.76, -151.25, -151.80, -152.40, -152.83, -153.00, -153.00, -152.47, -151.25, -150.09, -148.97, -147.91, -146.90, -145.95, -145.05, -144.21, -143.42, -142.62, -141.62, -140.67, -139.78, -138.94, -138.17, -137.46, -136.81, -136.22, -135.70, -135.24, -134.85, -134.52, -134.26, -134.06, -133.94, -133.88, -133.88, -133.96, -134.10, -134.30, -134.58, -134.92, -135.33, -135.15, -134.65, -134.21, -133.84, -133.54, -133.30, -133.14, -133.03, -133.00, -133.03, -133.14, -133.30, -133.54, -133.84, -134.21, -134.65, -135.15, -135.71, -136.34, -137.03, -137.79, -138.60, -139.47, -140.41, -141.40, -142.44, -143.54, -144.70, -145.91, -147.17, -148.48, -149.83, -151.24, // 13
+  -177.05, -175.70, -174.38, -173.11, -171.88, -170.69, -169.55, -168.45, -167.40, -166.40, -165.45, -164.54, -163.69, -162.88, -162.13, -161.43, -160.79, -160.19, -159.65, -159.17, -158.74, -158.37, -158.05, -157.79, -157.58, -157.43, -157.34, -157.31, -157.10, -156.02, -154.98, -154.00, -153.08, -152.20, -151.38, -150.62, -149.91, -149.25, -148.66, -148.12, -147.65, -147.23, -146.87, -146.58, -146.34, -146.17, -146.05, -146.00, -146.01, -146.09, -146.22, -146.41, -146.67, -146.99, -147.36, -147.80, -148.30, -148.85, -149.47, -149.84, -150.00, -150.00, -149.74, -148.51, -147.32, -146.18, -145.10, -144.07, -143.10, -142.18, -141.32, -140.52, -139.78, -138.79, -137.82, -136.91, -136.05, -135.26, -134.54, -133.87, -133.27, -132.74, -132.27, -131.87, -131.53, -131.27, -131.07, -130.94, -130.88, -130.88, -130.96, -131.10, -131.31, -131.60, -131.94, -132.36, -132.20, -131.69, -131.24, -130.86, -130.55, -130.31, -130.14, -130.03, -130.00, -130.03, -130.14, -130.31, -130.55, -130.86, -131.24, -131.69, -132.20, -132.77, -133.42, -134.12, -134.89, -135.72, -136.62, -137.57, -138.58, -139.65, -140.77, -141.95, -143.18, -144.46, -145.79, -147.18, -148.61, // 14
+  -174.39, -173.02, -171.68, -170.39, -169.14, -167.93, -166.77, -165.66, -164.59, -163.57, -162.60, -161.68, -160.81, -159.99, -159.22, -158.51, -157.85, -157.25, -156.70, -156.20, -155.77, -155.39, -155.06, -154.80, -154.59, -154.44, -154.34, -154.31, -154.31, -153.21, -152.16, -151.16, -150.22, -149.33, -148.49, -147.71, -146.99, -146.32, -145.72, -145.17, -144.68, -144.26, -143.89, -143.59, -143.35, -143.17, -143.06, -143.00, -143.01, -143.09, -143.22, -143.42, -143.68, -144.01, -144.39, -144.84, -145.34, -145.91, -146.54, -146.85, -147.00, -147.00, -147.00, -145.77, -144.56, -143.40, -142.29, -141.25, -140.25, -139.32, -138.44, -137.62, -136.87, -135.96, -134.97, -134.04, -133.17, -132.36, -131.62, -130.94, -130.33, -129.78, -129.30, -128.89, -128.55, -128.28, -128.07, -127.94, -127.88, -127.88, -127.96, -128.11, -128.33, -128.61, -128.97, -129.39, -129.25, -128.72, -128.27, -127.88, -127.57, -127.32, -127.14, -127.04, -127.00, -127.04, -127.14, -127.32, -127.57, -127.88, -128.27, -128.72, -129.25, -129.84, -130.50, -131.22, -132.00, -132.85, -133.76, -134.74, -135.77, -136.86, -138.00, -139.20, -140.46, -141.77, -143.13, -144.53, -145.99, // 15
+  -171.74, -170.35, -168.99, -167.67, -166.40, -165.18, -164.00, -162.86, -161.78, -160.74, -159.75, -158.82, -157.93, -157.10, -156.32, -155.59, -154.92, -154.30, -153.74, -153.24, -152.79, -152.41, -152.08, -151.81, -151.59, -151.44, -151.34, -151.31, -151.33, -150.42, -149.35, -148.33, -147.36, -146.45, -145.60, -144.81, -144.07, -143.39, -142.77, -142.21, -141.72, -141.28, -140.91, -140.60, -140.36, -140.17, -140.06, -140.00, -140.01, -140.09, -140.23, -140.43, -140.70, -141.03, -141.42, -141.88, -142.39, -142.97, -143.61, -143.86, -144.00, -144.00, -144.00, -143.04, -141.81, -140.62, -139.50, -138.43, -137.41, -136.46, -135.57, -134.73, -133.96, -133.14, -132.13, -131.18, -130.29, -129.47, -128.71, -128.01, -127.39, -126.83, -126.34, -125.92, -125.57, -125.29, -125.08, -124.94, -124.88, -124.88, -124.96, -125.11, -125.34, -125.63, -126.00, -126.43, -126.30, -125.77, -125.30, -124.90, -124.58, -124.33, -124.15, -124.04, -124.00, -124.04, -124.15, -124.33, -124.58, -124.90, -125.30, -125.77, -126.30, -126.91, -127.58, -128.32, -129.12, -129.99, -130.92, -131.91, -132.97, -134.08, -135.25, -136.47, -137.75, -139.09, -140.47, -141.90, -143.39, // 16
+  -169.11, -167.69, -166.31, -164.97, -163.68, -162.43, -161.23, -160.08, -158.98, -157.92, -156.92, -155.96, -155.06, -154.21, -153.42, -152.68, -151.99, -151.36, -150.79, -150.28, -149.82, -149.43, -149.09, -148.82, -148.60, -148.44, -148.35, -148.31, -148.34, -147.63, -146.54, -145.50, -144.52, -143.59, -142.72, -141.91, -141.16, -140.46, -139.83, -139.26, -138.76, -138.31, -137.93, -137.62, -137.36, -137.18, -137.06, -137.00, -137.01, -137.09, -137.23, -137.44, -137.71, -138.05, -138.45, -138.92, -139.45, -140.04, -140.65, -140.87, -141.00, -141.00, -141.00, -140.32, -139.06, -137.86, -136.71, -135.62, -134.58, -133.61, -132.70, -131.84, -131.05, -130.33, -129.30, -128.33, -127.42, -126.58, -125.80, -125.09, -124.45, -123.88, -123.37, -122.94, -122.58, -122.30, -122.08, -121.94, -121.88, -121.88, -121.96, -122.12, -122.35, -122.65, -123.02, -123.47, -123.36, -122.81, -122.33, -121.93, -121.59, -121.33, -121.15, -121.04, -121.00, -121.04, -121.15, -121.33, -121.59, -121.93, -122.33, -122.81, -123.36, -123.98, -124.66, -125.42, -126.24, -127.13, -128.08, -129.10, -130.17, -131.31, -132.50, -133.75, -135.06, -136.42, -137.83, -139.29, -140.80, // 17
+  -166.48, -165.04, -163.64, -162.28, -160.97, -159.70, -158.48, -157.31, -156.18, -155.11, -154.08, -153.11, -152.19, -151.33, -150.52, -149.76, -149.07, -148.43, -147.84, -147.32, -146.86, -146.45, -146.11, -145.83, -145.60, -145.44, -145.35, -145.31, -145.34, -144.85, -143.74, -142.68, -141.68, -140.73, -139.84, -139.01, -138.25, -137.54, -136.89, -136.31, -135.79, -135.34, -134.95, -134.63, -134.37, -134.18, -134.06, -134.00, -134.01, -134.09, -134.24, -134.45, -134.73, -135.07, -135.48, -135.96, -136.50, -137.10, -137.65, -137.88, -138.00, -138.00, -138.00, -137.62, -136.33, -135.11, -133.93, -132.82, -131.76, -130.77, -129.83, -128.96, -128.15, -127.41, -126.48, -125.48, -124.55, -123.69, -122.90, -122.17, -121.51, -120.93, -120.41, -119.97, -119.60, -119.31, -119.09, -118.94, -118.88, -118.88, -118.97, -119.13, -119.36, -119.67, -120.05, -120.51, -120.42, -119.85, -119.36, -118.95, -118.61, -118.34, -118.15, -118.04, -118.00, -118.04, -118.15, -118.34, -118.61, -118.95, -119.36, -119.85, -120.42, -121.05, -121.75, -122.53, -123.37, -124.28, -125.25, -126.29, -127.39, -128.55, -129.77, -131.05, -132.38, -133.76, -135.20, -136.69, -138.23, // 18
+  -163.87, -162.40, -160.98, -159.60, -158.26, -156.98, -155.73, -154.54, -153.39, -152.30, -151.26, -150.27, -149.33, -148.45, -147.62, -146.85, -146.14, -145.49, -144.90, -144.36, -143.89, -143.48, -143.12, -142.84, -142.61, -142.45, -142.35, -142.31, -142.34, -142.08, -140.94, -139.86, -138.84, -137.88, -136.97, -136.12, -135.34, -134.62, -133.96, -133.36, -132.83, -132.37, -131.97, -131.64, -131.38, -131.19, -131.06, -131.00, -131.02, -131.10, -131.24, -131.46, -131.75, -132.10, -132.52, -133.00, -133.56, -134.17, -134.66, -134.89, -135.00, -135.00, -135.00, -134.92, -133.62, -132.36, -131.16, -130.03, -128.95, -127.93, -126.97, -126.08, -125.26, -124.50, -123.66, -122.65, -121.70, -120.81, -120.00, -119.25, -118.58, -117.98, -117.45, -117.00, -116.62, -116.32, -116.09, -115.95, -115.88, -115.88, -115.97, -116.13, -116.37, -116.69, -117.08, -117.55, -117.48, -116.90, -116.40, -115.97, -115.62, -115.35, -115.16, -115.04, -115.00, -115.04, -115.16, -115.35, -115.62, -115.97, -116.40, -116.90, -117.48, -118.13, -118.85, -119.64, -120.50, -121.43, -122.43, -123.49, -124.62, -125.80, -127.05, -128.35, -129.71, -131.13, -132.59, -134.11, -135.68, // 19
+  -161.27, -159.78, -158.33, -156.93, -155.57, -154.26, -153.00, -151.78, -150.61, -149.50, -148.44, -147.43, -146.47, -145.58, -144.73, -143.95, -143.22, -142.56, -141.95, -141.40, -140.92, -140.50, -140.14, -139.85, -139.62, -139.45, -139.35, -139.31, -139.34, -139.32, -138.16, -137.06, -136.01, -135.03, -134.10, -133.24, -132.44, -131.70, -131.03, -130.42, -129.88, -129.40, -129.00, -128.66, -128.39, -128.19, -128.06, -128.00, -128.02, -128.10, -128.25, -128.47, -128.76, -129.12, -129.55, -130.05, -130.61, -131.24, -131.67, -131.91, -132.00, -132.00, -132.00, -132.00, -130.91, -129.63, -128.41, -127.24, -126.14, -125.10, -124.12, -123.21, -122.37, -121.59, -120.85, -119.82, -118.84, -117.94, -117.10, -116.34, -115.65, -115.03, -114.49, -114.03, -113.64, -113.33, -113.10, -112.95, -112.88, -112.88, -112.97, -113.14, -113.39, -113.71, -114.11, -114.59, -114.54, -113.95, -113.44, -113.00, -112.64, -112.36, -112.16, -112.04, -112.00, -112.04, -112.16, -112.36, -112.64, -113.00, -113.44, -113.95, -114.54, -115.21, -115.95, -116.76, -117.64, -118.60, -119.62, -120.70, -121.85, -123.07, -124.34, -125.67, -127.06, -128.50, -130.00, -131.55, -133.15, // 20
+  -158.33, -157.17, -155.70, -154.27, -152.89, -151.56, -150.27, -149.03, -147.84, -146.71, -145.63, -144.60, -143.62, -142.71, -141.85, -141.05, -140.31, -139.63, -139.01, -138.45, -137.96, -137.53, -137.16, -136.86, -136.62, -136.45, -136.35, -136.31, -136.34, -136.43, -135.38, -134.26, -133.20, -132.19, -131.24, -130.36, -129.54, -128.79, -128.10, -127.48, -126.92, -126.44, -126.02, -125.67, -125.40, -125.20, -125.06, -125.00, -125.02, -125.10, -125.26, -125.48, -125.78, -126.15, -126.59, -127.10, -127.68, -128.32, -128.67, -128.92, -129.00, -129.00, -129.00, -129.00, -128.22, -126.91, -125.66, -124.47, -123.34, -122.28, -121.28, -120.35, -119.48, -118.69, -117.96, -116.99, -116.00, -115.07, -114.21, -113.43, -112.72, -112.09, -111.54, -111.06, -110.66, -110.34, -110.11, -109.95, -109.88, -109.88, -109.97, -110.15, -110.40, -110.73, -111.15, -111.64, -111.61, -111.00, -110.48, -110.03, -109.66, -109.37, -109.17, -109.04, -109.00, -109.04, -109.17, -109.37, -109.66, -110.03, -110.48, -111.00, -111.61, -112.29, -113.05, -113.89, -114.79, -115.77, -116.81, -117.92, -119.10, -120.34, -121.64, -123.00, -124.42, -125.90, -127.42, -129.00, -130.63, // 21
+  -155.37, -154.58, -153.08, -151.63, -150.22, -148.86, -147.55, -146.29, -145.08, -143.93, -142.82, -141.77, -140.78, -139.84, -138.97, -138.15, -137.39, -136.70, -136.07, -135.50, -134.99, -134.55, -134.18, -133.87, -133.63, -133.46, -133.35, -133.31, -133.34, -133.43, -132.62, -131.47, -130.38, -129.36, -128.39, -127.49, -126.65, -125.88, -125.17, -124.54, -123.97, -123.47, -123.04, -122.69, -122.41, -122.20, -122.07, -122.00, -122.02, -122.10, -122.26, -122.49, -122.80, -123.18, -123.63, -124.15, -124.74, -125.40, -125.68, -125.93, -126.00, -126.00, -126.00, -126.00, -125.54, -124.20, -122.93, -121.71, -120.56, -119.47, -118.44, -117.49, -116.60, -115.79, -115.04, -114.18, -113.16, -112.21, -111.33, -110.53, -109.80, -109.15, -108.58, -108.09, -107.68, -107.36, -107.11, -106.95, -106.88, -106.89, -106.98, -107.15, -107.41, -107.76, -108.18, -108.69, -108.68, -108.06, -107.52, -107.06, -106.68, -106.38, -106.17, -106.04, -106.00, -106.04, -106.17, -106.38, -106.68, -107.06, -107.52, -108.06, -108.68, -109.38, -110.16, -111.02, -111.95, -112.95, -114.02, -115.16, -116.36, -117.63, -118.96, -120.35, -121.80, -123.31, -124.87, -126.48, -128.14, // 22
+  -152.42, -151.83, -150.48, -149.00, -147.57, -146.18, -144.85, -143.56, -142.33, -141.15, -140.03, -138.96, -137.94, -136.99, -136.09, -135.26, -134.49, -133.78, -133.13, -132.55, -132.03, -131.58, -131.20, -130.88, -130.64, -130.46, -130.35, -130.31, -130.34, -130.44, -129.87, -128.69, -127.58, -126.53, -125.54, -124.62, -123.76, -122.97, -122.25, -121.60, -121.02, -120.51, -120.07, -119.71, -119.42, -119.21, -119.07, -119.00, -119.02, -119.10, -119.27, -119.51, -119.82, -120.21, -120.67, -121.20, -121.81, -122.48, -122.69, -122.95, -123.00, -123.00, -123.00, -123.00, -122.87, -121.51, -120.20, -118.96, -117.78, -116.66, -115.62, -114.64, -113.73, -112.89, -112.13, -111.38, -110.33, -109.36, -108.45, -107.63, -106.88, -106.22, -105.63, -105.13, -104.71, -104.37, -104.12, -103.95, -103.88, -103.89, -103.98, -104.16, -104.43, -104.78, -105.22, -105.74, -105.76, -105.12, -104.56, -104.09, -103.70, -103.39, -103.17, -103.04, -103.00, -103.04, -103.17, -103.39, -103.70, -104.09, -104.56, -105.12, -105.76, -106.48, -107.28, -108.16, -109.11, -110.14, -111.23, -112.40, -113.64, -114.93, -116.30, -117.72, -119.20, -120.74, -122.33, -123.98, -125.67, // 23
+  -149.47, -148.95, -147.89, -146.38, -144.93, -143.52, -142.16, -140.85, -139.59, -138.39, -137.24, -136.15, -135.11, -134.14, -133.22, -132.37, -131.58, -130.85, -130.19, -129.60, -129.07, -128.61, -128.22, -127.90, -127.65, -127.46, -127.35, -127.31, -127.34, -127.44, -127.12, -125.92, -124.79, -123.71, -122.70, -121.76, -120.88, -120.07, -119.33, -118.66, -118.07, -117.55, -117.10, -116.73, -116.43, -116.21, -116.07, -116.00, -116.02, -116.11, -116.28, -116.52, -116.84, -117.24, -117.71, -118.26, -118.88, -119.51, -119.70, -119.96, -120.00, -120.00, -120.00, -120.00, -120.00, -118.83, -117.49, -116.22, -115.01, -113.87, -112.80, -111.79, -110.86, -110.00, -109.22, -108.52, -107.51, -106.51, -105.59, -104.74, -103.97, -103.28, -102.68, -102.16, -101.73, -101.38, -101.13, -100.96, -100.88, -100.89, -100.98, -101.17, -101.45, -101.81, -102.26, -102.79, -102.84, -102.18, -101.61, -101.12, -100.72, -100.40, -100.18, -100.04, -100.00, -100.04, -100.18, -100.40, -100.72, -101.12, -101.61, -102.18, -102.84, -103.58, -104.40, -105.30, -106.28, -107.34, -108.46, -109.66, -110.92, -112.25, -113.65, -115.10, -116.62, -118.19, -119.82, -121.49, -123.22, // 24
+  -146.52, -145.99, -145.23, -143.78, -142.30, -140.86, -139.48, -138.14, -136.86, -135.63, -134.46, -133.35, -132.29, -131.29, -130.36, -129.49, -128.68, -127.94, -127.26, -126.65, -126.11, -125.64, -125.24, -124.91, -124.65, -124.47, -124.35, -124.31, -124.34, -124.44, -124.39, -123.17, -122.00, -120.90, -119.87, -118.90, -118.00, -117.18, -116.42, -115.73, -115.12, -114.59, -114.13, -113.75, -113.44, -113.22, -113.07, -113.00, -113.02, -113.11, -113.28, -113.53, -113.86, -114.27, -114.76, -115.32, -115.95, -116.51, -116.71, -116.98, -117.00, -117.00, -117.00, -117.00, -117.00, -116.17, -114.80, -113.50, -112.26, -111.09, -109.99, -108.96, -108.00, -107.12, -106.32, -105.59, -104.70, -103.67, -102.72, -101.85, -101.06, -100.36, -99.74, -99.20, -98.76, -98.40, -98.13, -97.96, -97.88, -97.89, -97.99, -98.18, -98.46, -98.84, -99.30, -99.85, -99.92, -99.25, -98.66, -98.15, -97.74, -97.42, -97.19, -97.05, -97.00, -97.05, -97.19, -97.42, -97.74, -98.15, -98.66, -99.25, -99.92, -100.69, -101.53, -102.46, -103.46, -104.55, -105.70, -106.93, -108.23, -109.59, -111.02, -112.51, -114.06, -115.66, -117.32, -119.04, -120.80, // 25
+  -143.57, -143.04, -142.35, -141.20, -139.68, -138.22, -136.81, -135.45, -134.14, -132.89, -131.69, -130.55, -129.47, -128.46, -127.50, -126.61, -125.78, -125.02, -124.33, -123.71, -123.16, -122.68, -122.26, -121.93, -121.66, -121.47, -121.35, -121.31, -121.34, -121.45, -121.63, -120.42, -119.23, -118.11, -117.05, -116.06, -115.13, -114.28, -113.51, -112.81, -112.18, -111.63, -111.16, -110.77, -110.45, -110.22, -110.07, -110.00, -110.02, -110.11, -110.29, -110.55, -110.89, -111.31, -111.80, -112.38, -113.03, -113.51, -113.72, -114.00, -114.00, -114.00, -114.00, -114.00, -114.00, -113.52, -112.12, -110.79, -109.52, -108.32, -107.19, -106.13, -105.15, -104.24, -103.42, -102.67, -101.90, -100.85, -99.87, -98.97, -98.16, -97.43, -96.79, -96.24, -95.78, -95.42, -95.14, -94.96, -94.88, -94.89, -94.99, -95.19, -95.48, -95.87, -96.35, -96.91, -97.02, -96.32, -95.71, -95.19, -94.76, -94.43, -94.19, -94.05, -94.00, -94.05, -94.19, -94.43, -94.76, -95.19, -95.71, -96.32, -97.02, -97.80, -98.67, -99.62, -100.66, -101.77, -102.96, -104.22, -105.55, -106.94, -108.41, -109.93, -111.52, -113.16, -114.86, -116.61, -118.41, // 26
+  -140.62, -140.08, -139.47, -138.63, -137.09, -135.60, -134.16, -132.77, -131.43, -130.15, -128.93, -127.77, -126.67, -125.63, -124.65, -123.74, -122.89, -122.12, -121.41, -120.77, -120.20, -119.71, -119.29, -118.94, -118.67, -118.47, -118.35, -118.31, -118.34, -118.45, -118.63, -117.69, -116.47, -115.32, -114.23, -113.22, -112.27, -111.40, -110.60, -109.88, -109.24, -108.67, -108.19, -107.79, -107.47, -107.23, -107.07, -107.00, -107.02, -107.12, -107.30, -107.56, -107.91, -108.34, -108.85, -109.44, -110.11, -110.52, -110.73, -111.00, -111.00, -111.00, -111.00, -111.00, -111.00, -110.89, -109.46, -108.09, -106.79, -105.56, -104.40, -103.31, -102.31, -101.38, -100.53, -99.76, -99.08, -98.03, -97.02, -96.10, -95.26, -94.51, -93.85, -93.29, -92.81, -92.43, -92.15, -91.97, -91.88, -91.89, -92.00, -92.20, -92.50, -92.90, -93.39, -93.98, -94.11, -93.39, -92.76, -92.23, -91.79, -91.44, -91.20, -91.05, -91.00, -91.05, -91.20, -91.44, -91.79, -92.23, -92.76, -93.39, -94.11, -94.92, -95.82, -96.80, -97.86, -99.01, -100.22, -101.52, -102.88, -104.32, -105.82, -107.38, -109.00, -110.68, -112.41, -114.20, -116.04, // 27
+  -137.68, -137.12, -136.59, -135.76, -134.51, -132.99, -131.52, -130.10, -128.74, -127.43, -126.19, -125.00, -123.87, -122.81, -121.81, -120.87, -120.01, -119.21, -118.49, -117.83, -117.25, -116.75, -116.31, -115.96, -115.68, -115.48, -115.36, -115.31, -115.34, -115.45, -115.64, -114.97, -113.72, -112.54, -111.43, -110.39, -109.42, -108.52, -107.70, -106.96, -106.30, -105.72, -105.22, -104.81, -104.48, -104.24, -104.08, -104.00, -104.02, -104.12, -104.31, -104.58, -104.94, -105.38, -105.91, -106.51, -107.20, -107.52, -107.74, -108.00, -108.00, -108.00, -108.00, -108.00, -108.00, -108.00, -106.82, -105.41, -104.08, -102.82, -101.62, -100.51, -99.47, -98.51, -97.64, -96.85, -96.15, -95.22, -94.19, -93.24, -92.37, -91.60, -90.92, -90.33, -89.84, -89.45, -89.16, -88.97, -88.88, -88.89, -89.00, -89.21, -89.52, -89.94, -90.44, -91.05, -91.21, -90.47, -89.82, -89.27, -88.81, -88.46, -88.20, -88.05, -88.00, -88.05, -88.20, -88.46, -88.81, -89.27, -89.82, -90.47, -91.21, -92.05, -92.97, -93.98, -95.08, -96.25, -97.51, -98.84, -100.24, -101.71, -103.25, -104.85, -106.51, -108.23, -110.00, -111.83, -113.70, // 28
+  -134.74, -134.17, -133.67, -132.87, -131.94, -130.39, -128.90, -127.45, -126.06, -124.73, -123.45, -122.24, -121.08, -119.99, -118.97, -118.02, -117.13, -116.31, -115.57, -114.90, -114.30, -113.78, -113.34, -112.98, -112.69, -112.48, -112.36, -112.31, -112.34, -112.46, -112.65, -112.26, -110.98, -109.77, -108.63, -107.56, -106.57, -105.65, -104.81, -104.05, -103.37, -102.77, -102.26, -101.83, -101.49, -101.24, -101.08, -101.00, -101.02, -101.12, -101.32, -101.60, -101.97, -102.42, -102.96, -103.59, -104.29, -104.53, -104.75, -105.00, -105.00, -105.00, -105.00, -105.00, -105.00, -105.00, -104.19, -102.75, -101.38, -100.09, -98.86, -97.72, -96.65, -95.66, -94.76, -93.95, -93.22, -92.43, -91.36, -90.38, -89.49, -88.69, -87.99, -87.38, -86.88, -86.47, -86.17, -85.97, -85.88, -85.89, -86.00, -86.22, -86.55, -86.97, -87.50, -88.12, -88.32, -87.56, -86.88, -86.31, -85.84, -85.48, -85.21, -85.05, -85.00, -85.05, -85.21, -85.48, -85.84, -86.31, -86.88, -87.56, -88.32, -89.19, -90.14, -91.18, -92.31, -93.52, -94.81, -96.18, -97.62, -99.13, -100.70, -102.34, -104.04, -105.80, -107.62, -109.48, -111.40, // 29
+  -131.80, -131.22, -130.71, -129.99, -129.18, -127.82, -126.29, -124.81, -123.39, -122.03, -120.73, -119.49, -118.31, -117.19, -116.14, -115.16, -114.26, -113.42, -112.66, -111.97, -111.36, -110.82, -110.37, -109.99, -109.70, -109.49, -109.36, -109.31, -109.34, -109.46, -109.66, -109.57, -108.26, -107.02, -105.85, -104.75, -103.73, -102.79, -101.92, -101.14, -100.44, -99.82, -99.30, -98.86, -98.51, -98.25, -98.08, -98.01, -98.02, -98.13, -98.33, -98.62, -98.99, -99.46, -100.02, -100.66, -101.39, -101.53, -101.76, -102.00, -102.00, -102.00, -102.00, -102.00, -102.00, -102.00, -101.59, -100.11, -98.71, -97.37, -96.11, -94.93, -93.83, -92.82, -91.89, -91.05, -90.30, -89.65, -88.55, -87.54, -86.62, -85.79, -85.07, -84.44, -83.91, -83.50, -83.18, -82.98, -82.88, -82.89, -83.01, -83.24, -83.57, -84.01, -84.56, -85.20, -85.44, -84.65, -83.95, -83.36, -82.87, -82.49, -82.22, -82.05, -82.00, -82.05, -82.22, -82.49, -82.87, -83.36, -83.95, -84.65, -85.44, -86.33, -87.32, -88.39, -89.55, -90.80, -92.13, -93.54, -95.02, -96.57, -98.18, -99.86, -101.61, -103.41, -105.26, -107.17, -109.12, // 30
+  -128.87, -128.27, -127.75, -127.11, -126.28, -125.26, -123.70, -122.20, -120.75, -119.35, -118.02, -116.75, -115.54, -114.40, -113.32, -112.32, -111.39, -110.53, -109.75, -109.04, -108.41, -107.87, -107.40, -107.01, -106.71, -106.49, -106.36, -106.31, -106.35, -106.47, -106.67, -106.89, -105.55, -104.28, -103.08, -101.95, -100.90, -99.93, -99.04, -98.23, -97.51, -96.88, -96.34, -95.89, -95.52, -95.26, -95.08, -95.01, -95.02, -95.13, -95.34, -95.63, -96.03, -96.51, -97.08, -97.74, -98.40, -98.54, -98.77, -99.01, -99.00, -99.00, -99.00, -99.00, -99.00, -99.00, -99.00, -97.49, -96.05, -94.68, -93.38, -92.17, -91.03, -89.99, -89.03, -88.16, -87.39, -86.72, -85.75, -84.70, -83.75, -82.90, -82.15, -81.50, -80.95, -80.52, -80.19, -79.98, -79.88, -79.89, -80.01, -80.25, -80.60, -81.05, -81.62, -82.29, -82.57, -81.74, -81.02, -80.41, -79.91, -79.51, -79.23, -79.06, -79.00, -79.06, -79.23, -79.51, -79.91, -80.41, -81.02, -81.74, -82.57, -83.49, -84.50, -85.62, -86.82, -88.10, -89.47, -90.92, -92.44, -94.03, -95.69, -97.42, -99.20, -101.04, -102.94, -104.89, -106.89, // 31
+  -125.94, -125.33, -124.79, -124.24, -123.39, -122.62, -121.13, -119.60, -118.11, -116.69, -115.32, -114.02, -112.79, -111.62, -110.51, -109.49, -108.53, -107.65, -106.84, -106.12, -105.47, -104.91, -104.43, -104.03, -103.72, -103.50, -103.36, -103.31, -103.35, -103.47, -103.68, -103.98, -102.86, -101.55, -100.32, -99.16, -98.08, -97.08, -96.17, -95.34, -94.59, -93.94, -93.38, -92.91, -92.54, -92.27, -92.09, -92.01, -92.02, -92.14, -92.35, -92.66, -93.06, -93.56, -94.15, -94.83, -95.40, -95.55, -95.78, -96.01, -96.00, -96.00, -96.00, -96.00, -96.00, -96.00, -96.00, -94.89, -93.41, -92.00, -90.66, -89.41, -88.24, -87.16, -86.18, -85.28, -84.48, -83.78, -82.96, -81.88, -80.90, -80.01, -79.23, -78.56, -78.00, -77.54, -77.21, -76.98, -76.88, -76.89, -77.02, -77.26, -77.62, -78.10, -78.68, -79.38, -79.70, -78.85, -78.10, -77.47, -76.94, -76.53, -76.24, -76.06, -76.00, -76.06, -76.24, -76.53, -76.94, -77.47, -78.10, -78.85, -79.70, -80.65, -81.71, -82.86, -84.10, -85.42, -86.83, -88.32, -89.89, -91.53, -93.23, -95.00, -96.83, -98.72, -100.66, -102.65, -104.69, // 32
+  -123.01, -122.38, -121.83, -121.35, -120.51, -119.71, -118.59, -117.01, -115.50, -114.04, -112.64, -111.31, -110.04, -108.84, -107.72, -106.66, -105.68, -104.77, -103.95, -103.20, -102.54, -101.96, -101.46, -101.06, -100.74, -100.50, -100.36, -100.31, -100.35, -100.47, -100.69, -101.00, -100.18, -98.84, -97.58, -96.38, -95.27, -94.24, -93.30, -92.44, -91.68, -91.01, -90.43, -89.94, -89.56, -89.27, -89.09, -89.01, -89.02, -89.14, -89.36, -89.68, -90.09, -90.61, -91.22, -91.92, -92.40, -92.55, -92.80, -93.01, -93.00, -93.00, -93.00, -93.00, -93.00, -93.00, -93.00, -92.32, -90.79, -89.34, -87.97, -86.68, -85.47, -84.36, -83.33, -82.41, -81.58, -80.86, -80.19, -79.07, -78.05, -77.13, -76.32, -75.63, -75.04, -74.57, -74.22, -73.99, -73.88, -73.89, -74.03, -74.28, -74.66, -75.15, -75.76, -76.48, -76.84, -75.96, -75.19, -74.53, -73.98, -73.55, -73.25, -73.06, -73.00, -73.06, -73.25, -73.55, -73.98, -74.53, -75.19, -75.96, -76.84, -77.83, -78.92, -80.11, -81.39, -82.76, -84.22, -85.76, -87.37, -89.05, -90.80, -92.62, -94.49, -96.43, -98.41, -100.45, -102.53, // 33
+  -120.08, -119.44, -118.88, -118.38, -117.63, -116.81, -116.06, -114.45, -112.90, -111.41, -109.98, -108.62, -107.32, -106.09, -104.93, -103.84, -102.83, -101.90, -101.05, -100.29, -99.60, -99.01, -98.50, -98.08, -97.75, -97.51, -97.36, -97.31, -97.35, -97.48, -97.70, -98.02, -97.53, -96.15, -94.85, -93.62, -92.48, -91.42, -90.44, -89.56, -88.77, -88.07, -87.48, -86.98, -86.58, -86.28, -86.09, -86.01, -86.02, -86.15, -86.37, -86.70, -87.13, -87.66, -88.29, -89.02, -89.40, -89.56, -89.81, -90.01, -90.00, -90.00, -90.00, -90.00, -90.00, -90.00, -90.00, -89.75, -88.20, -86.71, -85.29, -83.96, -82.71, -81.56, -80.50, -79.54, -78.69, -77.94, -77.30, -76.27, -75.22, -74.27, -73.42, -72.70, -72.09, -71.60, -71.23, -70.99, -70.88, -70.89, -71.03, -71.30, -71.69, -72.20, -72.83, -73.58, -74.00, -73.08, -72.28, -71.59, -71.02, -70.58, -70.26, -70.06, -70.00, -70.06, -70.26, -70.58, -71.02, -71.59, -72.28, -73.08, -74.00, -75.03, -76.16, -77.39, -78.71, -80.13, -81.63, -83.22, -84.88, -86.61, -88.41, -90.27, -92.20, -94.18, -96.21, -98.29, -100.42, // 34
+  -117.16, -116.51, -115.93, -115.42, -114.75, -113.92, -113.16, -111.91, -110.33, -108.80, -107.34, -105.94, -104.60, -103.34, -102.15, -101.04, -100.00, -99.04, -98.17, -97.38, -96.67, -96.06, -95.54, -95.10, -94.76, -94.52, -94.37, -94.31, -94.35, -94.49, -94.72, -95.04, -94.89, -93.48, -92.14, -90.87, -89.69, -88.60, -87.60, -86.68, -85.87, -85.15, -84.53, -84.01, -83.60, -83.29, -83.10, -83.01, -83.02, -83.15, -83.38, -83.73, -84.17, -84.72, -85.38, -86.13, -86.41, -86.57, -86.83, -87.01, -87.00, -87.00, -87.00, -87.00, -87.00, -87.00, -87.00, -86.80, -85.64, -84.10, -82.63, -81.26, -79.97, -78.78, -77.68, -76.69, -75.80, -75.02, -74.36, -73.50, -72.40, -71.41, -70.53, -69.78, -69.14, -68.63, -68.25, -68.00, -67.88, -67.89, -68.04, -68.32, -68.72, -69.26, -69.92, -70.70, -71.17, -70.21, -69.38, -68.66, -68.07, -67.60, -67.27, -67.07, -67.00, -67.07, -67.27, -67.60, -68.07, -68.66, -69.38, -70.21, -71.17, -72.24, -73.41, -74.69, -76.06, -77.52, -79.08, -80.71, -82.42, -84.20, -86.05, -87.97, -89.94, -91.97, -94.05, -96.18, -98.35, // 35
+  -114.24, -113.57, -112.98, -112.46, -111.89, -111.03, -110.25, -109.40, -107.77, -106.21, -104.71, -103.27, -101.91, -100.61, -99.39, -98.24, -97.18, -96.19, -95.29, -94.48, -93.75, -93.12, -92.57, -92.13, -91.78, -91.52, -91.37, -91.31, -91.35, -91.49, -91.73, -92.06, -92.28, -90.82, -89.44, -88.14, -86.93, -85.80, -84.76, -83.82, -82.97, -82.23, -81.58, -81.05, -80.62, -80.31, -80.10, -80.01, -80.02, -80.16, -80.40, -80.75, -81.22, -81.79, -82.46, -83.24, -83.41, -83.57, -83.85, -84.01, -84.00, -84.00, -84.00, -84.00, -84.00, -84.00, -84.00, -83.85, -83.10, -81.51, -80.00, -78.58, -77.25, -76.01, -74.88, -73.85, -72.92, -72.11, -71.42, -70.73, -69.59, -68.56, -67.65, -66.86, -66.20, -65.67, -65.27, -65.01, -64.88, -64.89, -65.05, -65.34, -65.76, -66.32, -67.01, -67.82, -68.35, -67.36, -66.48, -65.73, -65.12, -64.63, -64.28, -64.07, -64.00, -64.07, -64.28, -64.63, -65.12, -65.73, -66.48, -67.36, -68.35, -69.46, -70.68, -72.01, -73.43, -74.95, -76.55, -78.24, -80.00, -81.84, -83.74, -85.70, -87.73, -89.81, -91.93, -94.11, -96.33, // 36
+  -111.33, -110.64, -110.03, -109.50, -109.03, -108.15, -107.34, -106.62, -105.24, -103.64, -102.10, -100.63, -99.23, -97.90, -96.64, -95.46, -94.36, -93.35, -92.42, -91.58, -90.83, -90.18, -89.62, -89.16, -88.79, -88.53, -88.37, -88.31, -88.35, -88.50, -88.74, -89.09, -89.53, -88.19, -86.77, -85.43, -84.17, -83.01, -81.93, -80.96, -80.08, -79.31, -78.64, -78.09, -77.65, -77.32, -77.10, -77.01, -77.03, -77.16, -77.41, -77.78, -78.26, -78.85, -79.56, -80.35, -80.41, -80.58, -80.86, -81.01, -81.00, -81.00, -81.00, -81.00, -81.00, -81.00, -81.00, -80.90, -80.38, -78.96, -77.40, -75.93, -74.55, -73.27, -72.09, -71.02, -70.06, -69.21, -68.49, -67.89, -66.81, -65.73, -64.78, -63.96, -63.26, -62.71, -62.29, -62.01, -61.88, -61.90, -62.06, -62.36, -62.81, -63.39, -64.11, -64.96, -65.38, -64.51, -63.60, -62.82, -62.17, -61.66, -61.29, -61.07, -61.00, -61.07, -61.29, -61.66, -62.17, -62.82, -63.60, -64.51, -65.55, -66.71, -67.98, -69.35, -70.83, -72.40, -74.06, -75.80, -77.62, -79.51, -81.47, -83.49, -85.56, -87.69, -89.87, -92.10, -94.37, // 37
+  -108.42, -107.72, -107.09, -106.54, -106.07, -105.27, -104.45, -103.70, -102.74, -101.10, -99.52, -98.01, -96.57, -95.20, -93.91, -92.69, -91.56, -90.51, -89.56, -88.69, -87.92, -87.24, -86.66, -86.19, -85.81, -85.54, -85.37, -85.31, -85.35, -85.50, -85.76, -86.12, -86.58, -85.59, -84.12, -82.73, -81.44, -80.23, -79.12, -78.11, -77.20, -76.40, -75.71, -75.13, -74.67, -74.33, -74.11, -74.01, -74.03, -74.17, -74.43, -74.81, -75.31, -75.93, -76.66, -77.35, -77.41, -77.59, -77.88, -78.01, -78.00, -78.00, -78.00, -78.00, -78.00, -78.00, -78.00, -77.95, -77.42, -76.44, -74.83, -73.30, -71.87, -70.54, -69.32, -68.20, -67.20, -66.32, -65.57, -64.94, -64.04, -62.92, -61.92, -61.06, -60.33, -59.75, -59.31, -59.02, -58.88, -58.90, -59.07, -59.38, -59.85, -60.47, -61.22, -62.11, -62.38, -61.68, -60.73, -59.91, -59.23, -58.69, -58.31, -58.08, -58.00, -58.08, -58.31, -58.69, -59.23, -59.91, -60.73, -61.68, -62.77, -63.98, -65.30, -66.73, -68.26, -69.89, -71.61, -73.41, -75.29, -77.23, -79.25, -81.32, -83.45, -85.63, -87.86, -90.14, -92.46, // 38
+  -105.52, -104.79, -104.15, -103.58, -103.11, -102.40, -101.55, -100.79, -100.11, -98.58, -96.96, -95.41, -93.93, -92.52, -91.19, -89.94, -88.77, -87.69, -86.70, -85.81, -85.01, -84.31, -83.71, -83.22, -82.83, -82.55, -82.37, -82.31, -82.36, -82.51, -82.77, -83.14, -83.62, -83.01, -81.49, -80.06, -78.72, -77.47, -76.32, -75.27, -74.33, -73.50, -72.78, -72.18, -71.70, -71.34, -71.11, -71.01, -71.03, -71.18, -71.45, -71.85, -72.37, -73.01, -73.76, -74.35, -74.42, -74.60, -74.91, -75.01, -75.00, -75.00, -75.00, -75.00, -75.00, -75.00, -75.00, -75.00, -74.46, -73.95, -72.28, -70.71, -69.23, -67.84, -66.57, -65.40, -64.36, -63.44, -62.65, -62.00, -61.29, -60.12, -59.08, -58.17, -57.41, -56.79, -56.33, -56.03, -55.88, -55.90, -56.08, -56.41, -56.90, -57.55, -58.34, -59.27, -59.38, -58.87, -57.87, -57.01, -56.29, -55.73, -55.33, -55.08, -55.00, -55.08, -55.33, -55.73, -56.29, -57.01, -57.87, -58.87, -60.01, -61.27, -62.65, -64.14, -65.73, -67.42, -69.20, -71.06, -73.00, -75.01, -77.08, -79.21, -81.39, -83.63, -85.91, -88.24, -90.60, // 39
+  -102.62, -101.87, -101.21, -100.63, -100.14, -99.54, -98.67, -97.88, -97.18, -96.09, -94.43, -92.83, -91.31, -89.86, -88.49, -87.20, -86.00, -84.88, -83.86, -82.93, -82.11, -81.38, -80.76, -80.25, -79.85, -79.56, -79.38, -79.31, -79.36, -79.52, -79.79, -80.18, -80.67, -80.45, -78.89, -77.41, -76.03, -74.73, -73.54, -72.45, -71.47, -70.60, -69.86, -69.23, -68.73, -68.36, -68.12, -68.01, -68.03, -68.18, -68.47, -68.88, -69.43, -70.09, -70.88, -71.35, -71.42, -71.61, -71.93, -72.01, -72.00, -72.00, -72.00, -72.00, -72.00, -72.00, -72.00, -72.00, -71.50, -71.05, -69.78, -68.15, -66.61, -65.17, -63.84, -62.62, -61.53, -60.57, -59.74, -59.06, -58.52, -57.34, -56.25, -55.30, -54.49, -53.84, -53.36, -53.04, -52.88, -52.90, -53.09, -53.44, -53.96, -54.64, -55.48, -56.29, -56.39, -56.08, -55.03, -54.12, -53.37, -52.77, -52.35, -52.09, -52.00, -52.09, -52.35, -52.77, -53.37, -54.12, -55.03, -56.08, -57.27, -58.59, -60.03, -61.59, -63.25, -65.00, -66.84, -68.77, -70.77, -72.84, -74.97, -77.16, -79.40, -81.69, -84.02, -86.40, -88.81, // 40
+  -99.73, -98.96, -98.28, -97.68, -97.17, -96.69, -95.79, -94.98, -94.25, -93.41, -91.92, -90.28, -88.72, -87.23, -85.81, -84.48, -83.24, -82.09, -81.03, -80.07, -79.21, -78.46, -77.82, -77.29, -76.87, -76.57, -76.38, -76.31, -76.36, -76.53, -76.81, -77.21, -77.72, -77.94, -76.32, -74.79, -73.36, -72.01, -70.77, -69.64, -68.62, -67.72, -66.94, -66.29, -65.76, -65.38, -65.12, -65.01, -65.03, -65.19, -65.49, -65.92, -66.49, -67.19, -68.01, -68.35, -68.42, -68.62, -68.95, -69.01, -69.00, -69.00, -69.00, -69.00, -69.00, -69.00, -69.00, -69.00, -68.55, -68.08, -67.32, -65.62, -64.02, -62.52, -61.13, -59.87, -58.72, -57.72, -56.85, -56.13, -55.56, -54.59, -53.44, -52.44, -51.59, -50.90, -50.39, -50.05, -49.88, -49.90, -50.10, -50.48, -51.03, -51.74, -52.62, -53.29, -53.40, -53.31, -52.20, -51.24, -50.45, -49.82, -49.37, -49.09, -49.00, -49.09, -49.37, -49.82, -50.45, -51.24, -52.20, -53.31, -54.56, -55.95, -57.45, -59.08, -60.80, -62.63, -64.54, -66.53, -68.59, -70.72, -72.92, -75.17, -77.47, -79.81, -82.20, -84.63, -87.09, // 41
+  -96.85, -96.05, -95.35, -94.73, -94.21, -93.78, -92.92, -92.08, -91.33, -90.68, -89.42, -87.76, -86.15, -84.61, -83.16, -81.78, -80.50, -79.31, -78.21, -77.22, -76.33, -75.55, -74.88, -74.33, -73.89, -73.58, -73.38, -73.31, -73.36, -73.54, -73.83, -74.25, -74.78, -75.43, -73.78, -72.20, -70.71, -69.32, -68.03, -66.85, -65.79, -64.85, -64.03, -63.35, -62.80, -62.39, -62.13, -62.01, -62.03, -62.20, -62.51, -62.97, -63.56, -64.29, -65.15, -65.35, -65.42, -65.64, -65.98, -66.01, -66.00, -66.00, -66.00, -66.00, -66.00, -66.00, -66.00, -66.00, -65.60, -65.10, -64.74, -63.14, -61.47, -59.91, -58.46, -57.13, -55.93, -54.87, -53.96, -53.20, -52.60, -51.86, -50.65, -49.59, -48.69, -47.97, -47.42, -47.06, -46.89, -46.90, -47.12, -47.51, -48.10, -48.86, -49.79, -50.29, -50.40, -50.57, -49.40, -48.38, -47.54, -46.87, -46.39, -46.10, -46.00, -46.10, -46.39, -46.87, -47.54, -48.38, -49.40, -50.57, -51.88, -53.34, -54.92, -56.61, -58.41, -60.31, -62.29, -64.35, -66.48, -68.68, -70.94, -73.25, -75.60, -78.01, -80.45, -82.93, -85.44, // 42
+  -93.97, -93.15, -92.42, -91.79, -91.25, -90.81, -90.05, -89.19, -88.42, -87.74, -86.70, -85.27, -83.61, -82.03, -80.52, -79.10, -77.78, -76.54, -75.41, -74.37, -73.45, -72.64, -71.94, -71.37, -70.92, -70.59, -70.39, -70.31, -70.36, -70.54, -70.85, -71.29, -71.84, -72.49, -71.28, -69.64, -68.10, -66.65, -65.31, -64.08, -62.97, -61.98, -61.13, -60.42, -59.84, -59.41, -59.14, -59.01, -59.03, -59.21, -59.54, -60.02, -60.64, -61.40, -62.30, -62.35, -62.43, -62.65, -63.01, -63.01, -63.00, -63.00, -63.00, -63.00, -63.00, -63.00, -63.00, -63.00, -62.65, -62.14, -61.76, -60.70, -58.96, -57.33, -55.82, -54.43, -53.17, -52.05, -51.09, -50.28, -49.65, -49.17, -47.89, -46.77, -45.81, -45.04, -44.46, -44.07, -43.89, -43.91, -44.13, -44.56, -45.18, -45.99, -46.98, -47.29, -47.41, -47.71, -46.62, -45.54, -44.64, -43.93, -43.42, -43.10, -43.00, -43.10, -43.42, -43.93, -44.64, -45.54, -46.62, -47.85, -49.24, -50.77, -52.43, -54.20, -56.08, -58.05, -60.11, -62.24, -64.44, -66.71, -69.03, -71.40, -73.82, -76.28, -78.77, -81.30, -83.86, // 43
+  -91.10, -90.26, -89.51, -88.85, -88.29, -87.83, -87.20, -86.31, -85.51, -84.81, -84.01, -82.71, -81.11, -79.47, -77.92, -76.45, -75.07, -73.79, -72.62, -71.55, -70.58, -69.74, -69.02, -68.42, -67.94, -67.60, -67.39, -67.31, -67.37, -67.56, -67.88, -68.33, -68.91, -69.49, -68.82, -67.12, -65.51, -64.01, -62.61, -61.33, -60.17, -59.14, -58.24, -57.49, -56.89, -56.44, -56.14, -56.01, -56.04, -56.22, -56.57, -57.07, -57.72, -58.52, -59.42, -59.35, -59.43, -59.66, -60.05, -60.01, -60.00, -60.00, -60.00, -60.00, -60.00, -60.00, -60.00, -60.00, -59.71, -59.17, -58.77, -58.31, -56.51, -54.80, -53.22, -51.75, -50.43, -49.25, -48.23, -47.38, -46.70, -46.21, -45.16, -43.96, -42.95, -42.12, -41.50, -41.09, -40.89, -40.91, -41.15, -41.61, -42.27, -43.14, -44.19, -44.29, -44.42, -44.74, -43.86, -42.72, -41.76, -41.00, -40.45, -40.11, -40.00, -40.11, -40.45, -41.00, -41.76, -42.72, -43.86, -45.18, -46.65, -48.26, -50.00, -51.86, -53.81, -55.87, -58.00, -60.21, -62.48, -64.82, -67.20, -69.63, -72.11, -74.63, -77.18, -79.76, -82.37, // 44
+  -88.24, -87.37, -86.59, -85.91, -85.34, -84.86, -84.36, -83.43, -82.61, -81.89, -81.27, -80.00, -78.63, -76.95, -75.34, -73.82, -72.40, -71.07, -69.85, -68.73, -67.73, -66.85, -66.09, -65.47, -64.97, -64.61, -64.39, -64.31, -64.37, -64.57, -64.90, -65.37, -65.98, -66.49, -66.40, -64.64, -62.97, -61.40, -59.94, -58.60, -57.38, -56.30, -55.36, -54.57, -53.94, -53.46, -53.15, -53.01, -53.04, -53.24, -53.60, -54.13, -54.82, -55.66, -56.42, -56.35, -56.44, -56.68, -57.08, -57.01, -57.00, -57.00, -57.00, -57.00, -57.00, -57.00, -57.00, -57.00, -56.76, -56.21, -55.79, -55.53, -54.10, -52.32, -50.66, -49.12, -47.72, -46.47, -45.39, -44.48, -43.76, -43.24, -42.46, -41.19, -40.10, -39.22, -38.55, -38.10, -37.89, -37.91, -38.17, -38.66, -39.38, -40.31, -41.37, -41.29, -41.43, -41.78, -41.15, -39.92, -38.90, -38.08, -37.48, -37.12, -37.00, -37.12, -37.48, -38.08, -38.90, -39.92, -41.15, -42.54, -44.10, -45.80, -47.63, -49.58, -51.62, -53.76, -55.97, -58.26, -60.61, -63.01, -65.46, -67.96, -70.49, -73.06, -75.66, -78.29, -80.95, // 45
+  -85.39, -84.49, -83.69, -82.98, -82.39, -81.89, -81.51, -80.57, -79.71, -78.96, -78.32, -77.30, -76.01, -74.46, -72.80, -71.22, -69.75, -68.37, -67.09, -65.93, -64.89, -63.97, -63.18, -62.52, -62.00, -61.63, -61.40, -61.31, -61.37, -61.58, -61.93, -62.43, -63.06, -63.49, -63.51, -62.20, -60.46, -58.83, -57.31, -55.90, -54.63, -53.49, -52.50, -51.66, -50.99, -50.49, -50.16, -50.01, -50.04, -50.25, -50.64, -51.20, -51.92, -52.81, -53.43, -53.35, -53.44, -53.70, -54.12, -54.01, -54.00, -54.00, -54.00, -54.00, -54.00, -54.00, -54.00, -54.00, -53.81, -53.26, -52.81, -52.54, -51.76, -49.90, -48.15, -46.53, -45.05, -43.72, -42.57, -41.60, -40.83, -40.27, -39.81, -38.45, -37.28, -36.33, -35.61, -35.12, -34.89, -34.92, -35.20, -35.73, -36.50, -37.50, -38.38, -38.29, -38.44, -38.81, -38.47, -37.16, -36.06, -35.17, -34.53, -34.13, -34.00, -34.13, -34.53, -35.17, -36.06, -37.16, -38.47, -39.96, -41.62, -43.42, -45.34, -47.38, -49.52, -51.74, -54.04, -56.40, -58.82, -61.29, -63.81, -66.37, -68.96, -71.59, -74.24, -76.92, -79.62, // 46
+  -82.55, -81.62, -80.78, -80.06, -79.44, -78.93, -78.53, -77.71, -76.83, -76.05, -75.38, -74.63, -73.29, -72.01, -70.29, -68.66, -67.12, -65.69, -64.36, -63.15, -62.06, -61.10, -60.27, -59.58, -59.04, -58.64, -58.40, -58.31, -58.37, -58.59, -58.96, -59.48, -60.15, -60.49, -60.51, -59.82, -58.01, -56.30, -54.71, -53.24, -51.89, -50.70, -49.65, -48.76, -48.05, -47.52, -47.17, -47.01, -47.04, -47.27, -47.68, -48.27, -49.04, -49.98, -50.43, -50.35, -50.45, -50.72, -51.16, -51.01, -51.00, -51.00, -51.00, -51.00, -51.00, -51.00, -51.00, -51.00, -50.86, -50.31, -49.84, -49.54, -49.43, -47.54, -45.70, -43.99, -42.42, -41.01, -39.78, -38.74, -37.91, -37.31, -36.94, -35.75, -34.50, -33.46, -32.67, -32.15, -31.89, -31.92, -32.23, -32.81, -33.65, -34.73, -35.39, -35.29, -35.45, -35.86, -35.85, -34.44, -33.24, -32.28, -31.58, -31.14, -31.00, -31.14, -31.58, -32.28, -33.24, -34.44, -35.85, -37.44, -39.20, -41.11, -43.14, -45.28, -47.51, -49.82, -52.20, -54.64, -57.14, -59.68, -62.27, -64.88, -67.54, -70.21, -72.92, -75.64, -78.39, // 47
+  -79.72, -78.75, -77.89, -77.14, -76.49, -75.96, -75.55, -74.87, -73.95, -73.14, -72.45, -71.87, -70.59, -69.30, -67.82, -66.13, -64.53, -63.04, -61.66, -60.39, -59.25, -58.24, -57.37, -56.65, -56.08, -55.66, -55.41, -55.31, -55.38, -55.61, -56.00, -56.54, -57.24, -57.49, -57.51, -57.49, -55.61, -53.82, -52.15, -50.61, -49.19, -47.93, -46.82, -45.88, -45.12, -44.55, -44.18, -44.01, -44.05, -44.28, -44.72, -45.35, -46.17, -47.17, -47.44, -47.35, -47.45, -47.74, -48.17, -48.01, -48.00, -48.00, -48.00, -48.00, -48.00, -48.00, -48.00, -48.00, -47.91, -47.36, -46.86, -46.55, -46.43, -45.25, -43.32, -41.51, -39.84, -38.34, -37.02, -35.90, -35.01, -34.35, -33.95, -33.10, -31.74, -30.62, -29.75, -29.17, -28.89, -28.93, -29.27, -29.91, -30.82, -32.00, -32.40, -32.29, -32.46, -32.91, -33.29, -31.76, -30.46, -29.41, -28.64, -28.16, -28.00, -28.16, -28.64, -29.41, -30.46, -31.76, -33.29, -35.00, -36.88, -38.90, -41.04, -43.28, -45.61, -48.01, -50.48, -53.00, -55.57, -58.18, -60.83, -63.51, -66.21, -68.94, -71.69, -74.46, -77.25, // 48
+  -76.90, -75.90, -75.01, -74.22, -73.55, -73.00, -72.57, -72.04, -71.08, -70.24, -69.52, -68.92, -67.92, -66.58, -65.35, -63.64, -61.98, -60.43, -58.98, -57.66, -56.46, -55.40, -54.49, -53.73, -53.12, -52.68, -52.41, -52.31, -52.38, -52.63, -53.04, -53.61, -54.35, -54.49, -54.52, -54.71, -53.26, -51.40, -49.65, -48.02, -46.53, -45.19, -44.01, -43.01, -42.20, -41.59, -41.19, -41.01, -41.05, -41.30, -41.77, -42.45, -43.32, -44.38, -44.44, -44.35, -44.46, -44.77, -45.18, -45.01, -45.00, -45.00, -45.00, -45.00, -45.00, -45.00, -45.00, -45.00, -44.96, -44.41, -43.89, -43.56, -43.43, -43.06, -41.02, -39.10, -37.33, -35.72, -34.30, -33.09, -32.12, -31.40, -30.96, -30.52, -29.04, -27.81, -26.85, -26.21, -25.90, -25.93, -26.31, -27.02, -28.03, -29.32, -29.41, -29.29, -29.48, -29.97, -30.75, -29.15, -27.73, -26.57, -25.71, -25.18, -25.00, -25.18, -25.71, -26.57, -27.73, -29.15, -30.81, -32.65, -34.66, -36.80, -39.05, -41.40, -43.83, -46.32, -48.88, -51.48, -54.12, -56.80, -59.51, -62.24, -65.00, -67.78, -70.58, -73.39, -76.22, // 49
+  -74.10, -73.06, -72.13, -71.32, -70.62, -70.04, -69.59, -69.22, -68.23, -67.35, -66.60, -65.97, -65.28, -63.88, -62.60, -61.20, -59.47, -57.85, -56.34, -54.95, -53.69, -52.58, -51.61, -50.81, -50.17, -49.70, -49.42, -49.31, -49.39, -49.64, -50.08, -50.69, -51.47, -51.49, -51.52, -51.72, -50.99, -49.04, -47.20, -45.49, -43.91, -42.49, -41.23, -40.16, -39.29, -38.64, -38.21, -38.01, -38.05, -38.33, -38.83, -39.56, -40.50, -41.63, -41.45, -41.35, -41.47, -41.80, -42.19, -42.01, -42.00, -42.00, -42.00, -42.00, -42.00, -42.00, -42.00, -42.00, -42.00, -41.46, -40.93, -40.57, -40.43, -40.52, -38.82, -36.79, -34.90, -33.17, -31.64, -30.32, -29.25, -28.47, -27.98, -27.81, -26.41, -25.04, -23.98, -23.25, -22.90, -22.94, -23.37, -24.16, -25.29, -26.71, -26.42, -26.29, -26.50, -27.05, -27.90, -26.63, -25.06, -23.77, -22.80, -22.20, -22.00, -22.20, -22.80, -23.77, -25.06, -26.63, -28.43, -30.41, -32.56, -34.83, -37.20, -39.66, -42.19, -44.78, -47.41, -50.09, -52.80, -55.54, -58.31, -61.10, -63.91, -66.73, -69.57, -72.42, -75.29, // 50
+  -71.31, -70.23, -69.27, -68.42, -67.69, -67.09, -66.62, -66.28, -65.38, -64.47, -63.68, -63.03, -62.51, -61.22, -59.88, -58.66, -57.01, -55.31, -53.73, -52.28, -50.95, -49.78, -48.76, -47.90, -47.22, -46.73, -46.42, -46.31, -46.39, -46.67, -47.13, -47.78, -48.60, -48.49, -48.52, -48.73, -48.80, -46.75, -44.82, -43.01, -41.34, -39.82, -38.48, -37.34, -36.40, -35.69, -35.23, -35.01, -35.06, -35.36, -35.90, -36.69, -37.70, -38.80, -38.46, -38.35, -38.48, -38.83, -39.20, -39.01, -39.00, -39.00, -39.00, -39.00, -39.00, -39.00, -39.00, -39.00, -39.00, -38.51, -37.96, -37.58, -37.43, -37.52, -36.73, -34.57, -32.56, -30.70, -29.03, -27.59, -26.42, -25.54, -25.00, -24.81, -23.85, -22.34, -21.13, -20.31, -19.91, -19.95, -20.44, -21.35, -22.62, -23.97, -23.44, -23.29, -23.53, -24.14, -25.10, -24.21, -22.47, -21.02, -19.92, -19.24, -19.00, -19.24, -19.92, -21.02, -22.47, -24.21, -26.17, -28.32, -30.61, -33.02, -35.51, -38.08, -40.71, -43.38, -46.10, -48.85, -51.62, -54.42, -57.25, -60.08, -62.94, -65.80, -68.68, -71.57, -74.46, // 51
+  -68.55, -67.42, -66.41, -65.53, -64.77, -64.14, -63.65, -63.29, -62.56, -61.60, -60.77, -60.09, -59.54, -58.58, -57.18, -55.90, -54.60, -52.83, -51.17, -49.64, -48.24, -47.00, -45.92, -45.01, -44.29, -43.76, -43.43, -43.31, -43.40, -43.69, -44.19, -44.88, -45.66, -45.49, -45.52, -45.75, -46.17, -44.55, -42.52, -40.61, -38.83, -37.22, -35.78, -34.54, -33.53, -32.76, -32.25, -32.02, -32.06, -32.39, -32.98, -33.84, -34.93, -35.84, -35.47, -35.35, -35.49, -35.87, -36.22, -36.01, -36.00, -36.00, -36.00, -36.00, -36.00, -36.00, -36.00, -36.00, -36.00, -35.56, -35.01, -34.59, -34.43, -34.53, -34.77, -32.49, -30.33, -28.33, -26.52, -24.93, -23.62, -22.64, -22.03, -21.81, -21.42, -19.71, -18.34, -17.38, -16.91, -16.97, -17.54, -18.59, -20.03, -21.06, -20.46, -20.29, -20.56, -21.26, -22.34, -21.69, -20.00, -18.36, -17.09, -16.28, -16.00, -16.28, -17.09, -18.36, -20.00, -21.93, -24.08, -26.40, -28.84, -31.38, -34.00, -36.67, -39.40, -42.15, -44.94, -47.76, -50.60, -53.45, -56.32, -59.20, -62.09, -64.98, -67.87, -70.76, -73.64, // 52
+  -65.80, -64.63, -63.57, -62.65, -61.85, -61.20, -60.68, -60.31, -59.74, -58.74, -57.87, -57.15, -56.58, -55.98, -54.51, -53.17, -51.97, -50.40, -48.66, -47.04, -45.57, -44.25, -43.10, -42.13, -41.36, -40.79, -40.44, -40.31, -40.40, -40.72, -41.25, -41.99, -42.67, -42.49, -42.53, -42.77, -43.22, -42.45, -40.31, -38.29, -36.40, -34.67, -33.12, -31.78, -30.68, -29.83, -29.27, -29.02, -29.07, -29.43, -30.08, -31.02, -32.20, -32.88, -32.48, -32.35, -32.50, -32.92, -33.24, -33.02, -33.00, -33.00, -33.00, -33.00, -33.00, -33.00, -33.00, -33.00, -33.00, -32.62, -32.06, -31.61, -31.43, -31.54, -31.93, -30.56, -28.25, -26.09, -24.11, -22.35, -20.89, -19.77, -19.06, -18.81, -19.04, -17.22, -15.63, -14.49, -13.92, -13.99, -14.68, -15.91, -17.58, -18.19, -17.49, -17.29, -17.61, -18.42, -19.66, -18.79, -17.69, -15.81, -14.32, -13.34, -13.00, -13.34, -14.32, -15.81, -17.69, -19.85, -22.20, -24.70, -27.29, -29.97, -32.70, -35.47, -38.28, -41.11, -43.97, -46.84, -49.73, -52.62, -55.50, -58.39, -61.28, -64.17, -67.06, -69.95, -72.83, // 53
+  -63.08, -61.85, -60.75, -59.78, -58.95, -58.26, -57.71, -57.32, -56.95, -55.90, -54.99, -54.23, -53.63, -53.19, -51.88, -50.47, -49.20, -48.03, -46.20, -44.50, -42.94, -41.53, -40.31, -39.27, -38.44, -37.83, -37.45, -37.31, -37.41, -37.75, -38.32, -39.12, -39.69, -39.49, -39.53, -39.79, -40.27, -40.40, -38.21, -36.07, -34.06, -32.20, -30.53, -29.07, -27.86, -26.93, -26.31, -26.02, -26.08, -26.48, -27.20, -28.23, -29.53, -29.94, -29.49, -29.35, -29.51, -29.98, -30.27, -30.02, -30.00, -30.00, -30.00, -30.00, -30.00, -30.00, -30.00, -30.00, -30.00, -29.67, -29.11, -28.63, -28.43, -28.55, -28.99, -28.81, -26.35, -24.02, -21.85, -19.90, -18.23, -16.94, -16.11, -15.81, -16.08, -14.91, -13.04, -11.65, -10.94, -11.02, -11.88, -13.38, -15.31, -15.37, -14.53, -14.29, -14.68, -15.64, -17.08, -15.94, -15.17, -13.45, -11.66, -10.44, -10.00, -10.44, -11.66, -13.45, -15.62, -18.03, -20.59, -23.26, -26.00, -28.79, -31.62, -34.48, -37.36, -40.25, -43.14, -46.03, -48.92, -51.80, -54.69, -57.58, -60.47, -63.36, -66.25, -69.13, -71.85, // 54
+  -60.38, -59.10, -57.95, -56.93, -56.05, -55.32, -54.75, -54.34, -54.09, -53.07, -52.11, -51.31, -50.67, -50.21, -49.29, -47.80, -46.46, -45.28, -43.81, -42.01, -40.36, -38.86, -37.55, -36.43, -35.54, -34.87, -34.46, -34.31, -34.42, -34.79, -35.41, -36.27, -36.70, -36.49, -36.53, -36.82, -37.34, -37.89, -36.24, -33.97, -31.83, -29.83, -28.02, -26.42, -25.08, -24.04, -23.35, -23.02, -23.09, -23.54, -24.35, -25.50, -26.93, -27.00, -26.51, -26.35, -26.53, -27.05, -27.29, -27.02, -27.00, -27.00, -27.00, -27.00, -27.00, -27.00, -27.00, -27.00, -27.00, -26.72, -26.17, -25.65, -25.43, -25.57, -26.05, -26.78, -24.67, -22.16, -19.79, -17.61, -15.70, -14.18, -13.18, -12.81, -13.14, -12.88, -10.67, -8.92, -7.96, -8.07, -9.22, -11.07, -13.11, -12.62, -11.60, -11.30, -11.78, -12.95, -14.59, -13.16, -12.24, -11.40, -9.22, -7.62, -7.00, -7.62, -9.22, -11.40, -13.89, -16.55, -19.31, -22.14, -25.00, -27.89, -30.78, -33.66, -36.55, -39.44, -42.33, -45.22, -48.11, -50.99, -53.88, -56.77, -59.66, -62.55, -65.46, -67.69, -69.38, // 55
+  -57.71, -56.37, -55.16, -54.09, -53.17, -52.40, -51.80, -51.36, -51.10, -50.27, -49.25, -48.40, -47.73, -47.23, -46.75, -45.18, -43.76, -42.50, -41.43, -39.60, -37.84, -36.24, -34.83, -33.62, -32.65, -31.93, -31.48, -31.31, -31.43, -31.83, -32.51, -33.44, -33.72, -33.50, -33.54, -33.85, -34.41, -35.23, -33.73, -32.02, -29.73, -27.59, -25.61, -23.85, -22.36, -21.19, -20.40, -20.02, -20.10, -20.62, -21.54, -22.83, -24.41, -24.08, -23.53, -23.35, -23.56, -24.14, -24.33, -24.02, -24.00, -24.00, -24.00, -24.00, -24.00, -24.00, -24.00, -24.00, -24.00, -23.77, -23.22, -22.68, -22.43, -22.59, -23.13, -23.92, -23.15, -20.57, -17.99, -15.56, -13.37, -11.54, -10.28, -9.81, -10.24, -11.30, -8.69, -6.43, -5.02, -5.19, -6.83, -8.87, -10.91, -10.03, -8.70, -8.30, -8.94, -10.43, -12.11, -10.49, -9.32, -8.66, -7.17, -5.00, -4.00, -5.00, -7.21, -9.85, -12.65, -15.52, -18.41, -21.30, -24.19, -27.08, -29.96, -32.85, -35.74, -38.63, -41.52, -44.41, -47.29, -50.19, -53.09, -56.00, -58.92, -61.85, -63.54, -65.20, -66.96, // 56
+  -55.08, -53.67, -52.40, -51.27, -50.30, -49.48, -48.84, -48.38, -48.10, -47.49, -46.41, -45.51, -44.79, -44.26, -43.94, -42.61, -41.10, -39.76, -38.61, -37.28, -35.40, -33.68, -32.16, -30.85, -29.78, -28.99, -28.50, -28.31, -28.44, -28.89, -29.63, -30.65, -30.75, -30.50, -30.54, -30.88, -31.50, -32.39, -31.26, -29.59, -27.80, -25.50, -23.35, -21.40, -19.72, -18.38, -17.46, -17.03, -17.12, -17.72, -18.79, -20.25, -22.02, -21.19, -20.55, -20.35, -20.59, -21.25, -21.38, -21.02, -21.00, -21.00, -21.00, -21.00, -21.00, -21.00, -21.00, -21.00, -21.00, -20.82, -20.27, -19.72, -19.43, -19.61, -20.23, -21.09, -20.22, -19.32, -16.55, -13.87, -11.35, -9.13, -7.47, -6.81, -7.41, -8.94, -7.44, -4.60, -2.22, -2.60, -4.63, -6.67, -8.71, -7.74, -5.92, -5.30, -6.26, -7.95, -9.63, -8.06, -6.46, -5.73, -5.09, -2.94, -1.00, -3.16, -6.05, -8.94, -11.82, -14.71, -17.60, -20.49, -23.38, -26.26, -29.15, -32.04, -34.93, -37.82, -40.72, -43.63, -46.56, -49.49, -52.43, -55.38, -57.88, -59.40, -61.03, -62.76, -64.58, // 57
+  -52.48, -51.00, -49.66, -48.47, -47.44, -46.58, -45.90, -45.41, -45.11, -44.73, -43.59, -42.63, -41.86, -41.30, -40.94, -40.09, -38.49, -37.05, -35.81, -34.79, -33.05, -31.20, -29.55, -28.12, -26.95, -26.07, -25.52, -25.31, -25.46, -25.95, -26.78, -27.90, -27.78, -27.50, -27.55, -27.92, -28.61, -29.58, -28.89, -27.07, -25.49, -23.60, -21.26, -19.10, -17.20, -15.65, -14.56, -14.04, -14.14, -14.87, -16.12, -17.80, -19.49, -18.32, -17.59, -17.35, -17.63, -18.39, -18.44, -18.03, -18.00, -18.00, -18.00, -18.00, -18.00, -18.00, -18.00, -18.00, -18.00, -17.87, -17.32, -16.77, -16.43, -16.64, -17.37, -18.32, -17.31, -16.78, -15.55, -12.67, -9.85, -7.18, -4.90, -3.81, -4.79, -6.43, -6.66, -3.77, -0.87, -0.39, -2.43, -4.47, -6.51, -6.08, -3.50, -2.32, -3.78, -5.46, -7.15, -6.16, -3.83, -2.80, -2.16, -1.02, 0.54, -2.35, -5.24, -8.12, -11.01, -13.90, -16.79, -19.68, -22.57, -25.45, -28.35, -31.27, -34.20, -37.14, -40.09, -43.04, -46.01, -48.97, -51.95, -53.81, -55.28, -56.87, -58.57, -60.37, -62.17, // 58
+  -49.93, -48.38, -46.96, -45.70, -44.60, -43.69, -42.96, -42.43, -42.12, -42.01, -40.80, -39.77, -38.94, -38.33, -37.96, -37.65, -35.93, -34.39, -33.05, -31.94, -30.81, -28.82, -27.02, -25.45, -24.15, -23.17, -22.55, -22.31, -22.48, -23.04, -23.96, -25.22, -24.81, -24.50, -24.56, -24.98, -25.74, -26.82, -26.34, -24.67, -22.91, -21.43, -19.42, -17.03, -14.87, -13.04, -11.70, -11.05, -11.18, -12.08, -13.60, -15.53, -16.88, -15.51, -14.64, -14.35, -14.68, -15.60, -15.52, -15.03, -15.00, -15.00, -15.00, -15.00, -15.00, -15.00, -15.00, -15.00, -15.00, -14.93, -14.37, -13.82, -13.43, -13.69, -14.57, -15.63, -14.43, -13.79, -13.79, -12.06, -9.10, -6.13, -3.18, -0.81, -2.27, -3.92, -5.56, -2.99, -0.09, 1.81, -0.23, -2.27, -4.31, -4.75, -2.06, 0.39, -1.30, -2.98, -4.67, -4.69, -2.07, 0.13, 0.77, 1.42, 1.35, -1.54, -4.42, -7.31, -10.20, -13.09, -15.98, -18.90, -21.84, -24.80, -27.76, -30.73, -33.71, -36.69, -39.67, -42.66, -45.65, -48.38, -49.77, -51.18, -52.72, -54.39, -56.16, -58.03, -59.41, // 59
+  -47.44, -45.80, -44.30, -42.96, -41.79, -40.81, -40.03, -39.47, -39.12, -39.01, -38.03, -36.93, -36.04, -35.38, -34.97, -34.81, -33.46, -31.80, -30.34, -29.13, -28.18, -26.57, -24.61, -22.87, -21.41, -20.30, -19.58, -19.31, -19.50, -20.15, -21.20, -22.60, -21.86, -21.51, -21.57, -22.05, -22.91, -23.95, -23.37, -22.40, -20.45, -18.79, -17.40, -15.26, -12.81, -10.63, -8.94, -8.06, -8.25, -9.43, -11.29, -13.29, -14.42, -12.79, -11.71, -11.35, -11.77, -12.89, -12.65, -12.04, -12.00, -12.00, -12.00, -12.00, -12.00, -12.00, -12.00, -12.00, -12.00, -11.98, -11.42, -10.87, -10.44, -10.76, -11.86, -13.02, -11.62, -10.82, -10.81, -11.59, -8.63, -5.66, -2.70, 0.26, 0.24, -1.40, -3.04, -2.22, 0.68, 3.58, 1.97, -0.07, -2.11, -3.41, -0.73, 1.96, 1.18, -0.50, -2.19, -3.23, -0.61, 2.01, 3.70, 4.35, 2.16, -0.73, -3.61, -6.55, -9.52, -12.51, -15.50, -18.50, -21.49, -24.49, -27.49, -30.49, -33.49, -36.30, -38.97, -41.68, -44.43, -45.77, -47.11, -48.59, -50.21, -51.96, -53.81, -55.48, -56.67, // 60
+  -45.00, -43.27, -41.68, -40.25, -39.01, -37.95, -37.12, -36.50, -36.13, -36.01, -35.31, -34.11, -33.15, -32.43, -31.98, -31.81, -31.07, -29.28, -27.69, -26.35, -25.30, -24.48, -22.33, -20.40, -18.75, -17.47, -16.63, -16.31, -16.54, -17.29, -18.51, -19.78, -18.92, -18.51, -18.58, -19.13, -20.12, -21.06, -20.40, -20.16, -18.16, -16.26, -14.73, -13.37, -11.10, -8.60, -6.40, -5.10, -5.39, -7.06, -9.05, -11.05, -12.20, -10.22, -8.84, -8.35, -8.91, -10.35, -9.85, -9.06, -9.00, -9.00, -9.00, -9.00, -9.00, -9.00, -9.00, -9.00, -9.00, -9.00, -8.48, -7.92, -7.44, -7.89, -9.33, -10.42, -8.93, -7.86, -7.85, -8.92, -8.16, -5.20, -2.23, 0.73, 2.75, 1.11, -0.53, -1.44, 1.46, 4.35, 4.17, 2.13, 0.09, -1.94, 0.61, 3.30, 3.66, 1.98, 0.29, -1.40, 0.85, 3.47, 6.09, 4.80, 1.91, -0.98, -3.87, -6.77, -9.68, -12.63, -15.60, -18.58, -21.56, -24.50, -27.00, -29.59, -32.26, -34.98, -37.74, -40.20, -41.82, -43.07, -44.48, -46.05, -47.76, -49.59, -51.53, -52.71, -53.96, // 61
+  -42.64, -40.81, -39.12, -37.59, -36.25, -35.12, -34.21, -33.55, -33.15, -33.01, -32.63, -31.33, -30.28, -29.50, -29.00, -28.81, -28.80, -26.86, -25.12, -23.64, -22.46, -21.63, -20.24, -18.09, -16.21, -14.70, -13.70, -13.31, -13.59, -14.50, -15.93, -17.01, -16.00, -15.51, -15.60, -16.26, -17.41, -18.21, -17.44, -17.16, -16.10, -13.92, -12.10, -10.69, -9.33, -6.94, -4.44, -2.24, -2.82, -4.82, -6.81, -8.81, -10.38, -7.96, -6.08, -5.35, -6.19, -7.91, -7.20, -6.08, -6.00, -6.00, -6.00, -6.00, -6.00, -6.00, -6.00, -6.00, -6.00, -6.00, -5.53, -4.97, -4.44, -5.16, -7.18, -7.81, -6.33, -4.95, -4.94, -6.51, -7.63, -4.73, -1.76, 1.20, 4.16, 3.62, 1.98, 0.34, 2.23, 5.13, 6.37, 4.33, 2.29, 0.26, 1.94, 4.63, 6.15, 4.46, 2.77, 1.08, 2.32, 4.94, 6.90, 4.01, 1.12, -1.78, -4.67, -7.56, -10.45, -13.35, -15.67, -17.90, -20.33, -22.89, -25.55, -28.28, -31.06, -33.87, -35.96, -37.92, -39.07, -40.40, -41.91, -43.57, -45.37, -47.29, -48.80, -49.96, -51.28, // 62
+  -40.36, -38.42, -36.62, -34.99, -33.55, -32.32, -31.33, -30.60, -30.16, -30.01, -30.01, -28.60, -27.44, -26.57, -26.02, -25.81, -25.95, -24.56, -22.65, -20.99, -19.66, -18.71, -18.22, -16.01, -13.85, -12.06, -10.81, -10.31, -10.67, -11.81, -13.52, -14.33, -13.12, -12.52, -12.63, -13.43, -14.80, -15.41, -14.49, -14.16, -14.38, -11.89, -9.68, -8.02, -6.66, -5.29, -2.79, -0.28, -0.58, -2.58, -4.57, -6.56, -8.68, -6.25, -3.72, -2.35, -3.73, -5.48, -4.60, -3.16, -3.00, -3.00, -3.00, -3.00, -3.00, -3.00, -3.00, -3.00, -3.00, -3.00, -2.58, -2.02, -1.47, -3.01, -5.79, -5.21, -3.72, -2.23, -2.27, -4.80, -4.66, -4.24, -1.30, 1.67, 4.63, 6.13, 4.49, 3.04, 3.76, 6.09, 8.57, 6.53, 4.50, 2.80, 3.56, 5.96, 8.63, 6.94, 5.25, 3.86, 4.38, 6.44, 6.11, 3.21, 0.32, -2.57, -5.46, -7.89, -9.57, -11.43, -13.69, -16.19, -18.84, -21.58, -24.39, -27.23, -29.64, -31.72, -33.94, -35.13, -36.36, -37.79, -39.40, -41.16, -43.06, -44.94, -46.01, -47.25, -48.64, // 63
+  -38.18, -36.13, -34.21, -32.45, -30.89, -29.55, -28.47, -27.67, -27.17, -27.01, -27.18, -25.92, -24.64, -23.67, -23.05, -22.81, -22.96, -22.44, -20.33, -18.46, -16.93, -15.82, -15.23, -14.27, -11.79, -9.62, -8.00, -7.31, -7.81, -9.30, -11.33, -11.81, -10.30, -9.54, -9.68, -10.70, -12.38, -12.71, -11.58, -11.16, -11.53, -10.33, -7.70, -5.46, -3.98, -2.62, -1.13, 1.37, 1.66, -0.33, -2.33, -4.48, -7.17, -4.69, -2.13, 0.43, -1.29, -3.05, -2.01, -0.50, 0.00, 0.00, 0.00, 0.00, 0.00, 0.00, 0.00, 0.00, 0.00, 0.00, 0.37, 0.92, 0.89, -1.92, -4.08, -2.60, -1.11, 0.37, -1.53, -2.46, -1.69, -1.27, -0.83, 2.14, 5.10, 8.06, 7.00, 6.00, 6.40, 7.99, 10.23, 8.74, 6.80, 5.75, 6.16, 7.80, 10.08, 9.42, 7.76, 6.82, 7.13, 8.48, 5.48, 2.48, -0.37, -2.05, -3.73, -5.40, -7.19, -9.51, -12.14, -14.90, -17.75, -20.63, -23.52, -25.40, -27.48, -29.71, -31.26, -32.37, -33.70, -35.24, -36.96, -38.83, -40.84, -42.12, -43.26, -44.57, -46.05, // 64
+  -36.12, -33.94, -31.89, -30.00, -28.31, -26.84, -25.64, -24.75, -24.20, -24.01, -24.20, -23.33, -21.89, -20.79, -20.09, -19.81, -19.98, -20.28, -18.20, -16.09, -14.30, -12.97, -12.25, -12.24, -10.18, -7.59, -5.40, -4.32, -5.11, -7.09, -9.17, -9.57, -7.64, -6.56, -6.77, -8.16, -10.24, -10.18, -8.73, -8.16, -8.66, -9.36, -6.49, -3.64, -1.31, 0.05, 1.41, 3.04, 3.90, 1.91, -0.48, -3.25, -5.70, -3.14, -0.57, 1.99, 1.14, -0.62, 0.59, 2.09, 3.00, 3.00, 3.00, 3.00, 3.00, 3.00, 3.00, 3.00, 3.00, 3.00, 3.32, 3.87, 1.95, -0.85, -1.48, 0.01, 1.49, 1.38, -1.62, -0.90, 1.28, 1.70, 2.13, 3.20, 5.74, 8.58, 9.69, 8.99, 9.26, 10.42, 12.23, 10.98, 9.46, 8.74, 9.01, 10.20, 12.04, 11.90, 10.49, 9.81, 10.03, 8.96, 6.20, 3.82, 2.11, 0.44, -1.24, -2.95, -5.43, -8.27, -11.19, -14.14, -17.11, -19.35, -21.17, -23.23, -25.49, -27.51, -28.44, -29.65, -31.10, -32.76, -34.60, -36.60, -38.30, -39.32, -40.54, -41.94, -43.50, // 65
+  -34.20, -31.89, -29.70, -27.66, -25.81, -24.19, -22.85, -21.85, -21.22, -21.01, -21.22, -20.84, -19.22, -17.96, -17.13, -16.81, -16.99, -17.30, -16.29, -13.97, -11.86, -10.22, -9.28, -9.26, -8.73, -6.10, -3.48, -1.33, -2.85, -4.93, -7.00, -7.84, -5.33, -3.63, -3.99, -6.00, -8.18, -7.98, -6.01, -5.16, -5.92, -7.32, -5.60, -2.73, 0.13, 2.72, 4.08, 5.44, 6.14, 3.45, 0.68, -2.09, -4.14, -1.58, 0.99, 3.55, 3.57, 2.08, 3.18, 4.69, 6.00, 6.00, 6.00, 6.00, 6.00, 6.00, 6.00, 6.00, 6.00, 6.00, 6.27, 5.82, 3.02, 0.22, 1.13, 2.61, 4.10, 1.28, -1.72, 0.44, 3.13, 4.67, 5.10, 5.72, 7.45, 9.80, 12.44, 11.98, 12.18, 13.09, 14.57, 13.49, 12.28, 11.73, 11.94, 12.86, 14.36, 14.47, 13.33, 12.80, 12.91, 10.33, 8.05, 6.28, 4.60, 2.92, 0.62, -2.13, -5.04, -8.01, -11.00, -13.90, -15.20, -16.94, -18.99, -21.27, -23.71, -24.63, -25.67, -27.00, -28.58, -30.38, -32.36, -34.48, -35.46, -36.56, -37.87, -39.36, -41.02, // 66
+  -32.45, -30.00, -27.66, -25.46, -23.43, -21.64, -20.13, -18.98, -18.26, -18.01, -18.26, -18.51, -16.66, -15.19, -14.20, -13.81, -14.01, -14.31, -14.40, -12.07, -9.74, -7.65, -6.34, -6.29, -6.71, -4.66, -2.03, 0.60, -0.69, -2.76, -4.84, -6.37, -3.75, -1.14, -1.76, -3.94, -6.12, -6.46, -3.77, -2.16, -3.27, -4.67, -4.70, -1.84, 1.03, 3.89, 6.75, 8.12, 7.37, 4.61, 1.84, -0.93, -2.58, -0.02, 2.55, 5.11, 6.01, 5.08, 5.78, 7.28, 8.79, 9.00, 9.00, 9.00, 9.00, 9.00, 9.00, 9.00, 9.00, 9.00, 9.21, 6.90, 4.32, 2.79, 3.73, 5.22, 4.19, 1.19, -0.90, 1.79, 4.47, 7.15, 8.07, 8.56, 9.79, 11.69, 13.98, 14.98, 15.14, 15.88, 17.12, 16.16, 15.17, 14.73, 14.89, 15.64, 16.89, 17.17, 16.23, 15.80, 14.53, 12.29, 10.43, 7.68, 4.93, 2.18, -0.58, -3.33, -6.08, -8.83, -10.21, -11.14, -12.72, -14.75, -17.07, -19.58, -20.98, -21.78, -22.94, -24.42, -26.16, -28.12, -30.24, -31.69, -32.64, -33.83, -35.24, -36.84, -38.61, // 67
+  -30.88, -28.30, -25.80, -23.43, -21.21, -19.21, -17.50, -16.16, -15.30, -15.01, -15.31, -16.03, -14.27, -12.52, -11.31, -10.81, -11.02, -11.33, -11.63, -10.18, -7.85, -5.52, -3.51, -3.32, -3.74, -3.21, -0.58, 2.05, 1.48, -0.60, -2.68, -4.75, -2.28, 0.33, 0.30, -1.88, -4.07, -5.63, -2.75, 0.14, -0.61, -2.01, -3.41, -0.94, 1.92, 4.79, 7.65, 10.51, 8.53, 5.77, 3.00, 0.23, -1.02, 1.54, 4.10, 6.67, 8.69, 8.07, 8.53, 9.88, 11.38, 12.00, 12.00, 12.00, 12.00, 12.00, 12.00, 12.00, 12.00, 12.00, 10.96, 8.56, 6.66, 5.78, 6.36, 7.09, 4.09, 1.09, 0.45, 3.13, 5.81, 8.49, 11.04, 11.48, 12.43, 13.97, 15.93, 17.97, 18.11, 18.73, 19.79, 18.93, 18.09, 17.72, 17.86, 18.49, 19.56, 19.97, 19.16, 17.51, 14.73, 11.98, 9.23, 6.48, 3.73, 0.98, -1.77, -4.52, -6.78, -6.96, -7.28, -8.53, -10.51, -12.90, -15.50, -17.60, -18.05, -18.97, -20.30, -21.96, -23.88, -26.00, -28.05, -28.81, -29.86, -31.16, -32.69, -34.41, -36.29, // 68
+  -29.54, -26.83, -24.18, -21.63, -19.21, -16.97, -15.00, -13.42, -12.38, -12.01, -12.38, -13.12, -12.16, -10.05, -8.49, -7.82, -8.04, -8.34, -8.64, -8.28, -5.96, -3.63, -1.30, -0.35, -0.77, -1.18, 0.87, 3.50, 3.64, 1.57, -0.51, -2.59, -0.80, 1.81, 2.36, 0.17, -2.01, -4.20, -1.93, 0.95, 2.04, 0.64, -0.76, -0.04, 2.82, 5.69, 8.55, 11.41, 9.69, 6.92, 4.16, 1.39, 0.54, 3.10, 5.66, 8.23, 10.79, 11.07, 11.41, 12.48, 13.98, 15.00, 15.00, 15.00, 15.00, 15.00, 15.00, 15.00, 15.00, 15.00, 12.80, 10.81, 9.38, 8.78, 9.17, 7.00, 4.00, 1.00, 1.79, 4.47, 7.15, 9.84, 12.52, 14.43, 15.20, 16.48, 18.17, 20.17, 21.09, 21.62, 22.55, 21.76, 21.04, 20.72, 20.84, 21.38, 22.32, 22.62, 19.65, 16.70, 13.76, 10.86, 8.03, 5.28, 2.53, -0.22, -2.97, -3.60, -3.78, -3.97, -4.43, -6.28, -8.79, -11.53, -14.38, -14.61, -15.15, -16.23, -17.77, -19.64, -21.77, -24.08, -25.12, -25.97, -27.13, -28.55, -30.21, -32.06, -34.08, // 69
+  -28.45, -25.63, -22.84, -20.12, -17.49, -15.00, -12.73, -10.82, -9.49, -9.01, -9.47, -10.21, -10.49, -7.94, -5.84, -4.82, -5.06, -5.36, -5.66, -5.46, -4.07, -1.74, 0.59, 2.62, 2.20, 1.79, 2.39, 4.95, 5.81, 3.73, 1.65, -0.43, 0.67, 3.28, 4.41, 2.23, 0.04, -2.14, -1.12, 1.77, 4.65, 3.30, 1.90, 1.08, 3.72, 6.58, 9.45, 12.31, 10.85, 8.08, 5.32, 2.85, 2.44, 4.66, 7.22, 9.79, 12.35, 14.07, 14.34, 15.21, 16.57, 18.00, 18.00, 18.00, 18.00, 18.00, 18.00, 18.00, 18.00, 17.04, 15.01, 13.36, 12.23, 11.77, 10.44, 7.62, 5.00, 3.16, 3.61, 5.83, 8.50, 11.18, 13.86, 16.55, 18.04, 19.13, 20.61, 22.39, 24.07, 24.54, 25.36, 24.64, 24.00, 23.72, 23.82, 24.30, 25.12, 22.40, 19.40, 16.40, 13.40, 10.40, 7.40, 4.40, 1.41, -0.23, -0.42, -0.60, -0.79, -0.97, -2.08, -4.91, -7.87, -10.85, -11.69, -11.62, -12.29, -13.61, -15.40, -17.53, -19.89, -21.63, -22.21, -23.17, -24.46, -26.03, -27.84, -29.84, -31.99, // 70
+  -27.21, -24.73, -21.83, -18.97, -16.15, -13.41, -10.81, -8.49, -6.71, -6.01, -6.57, -7.30, -8.04, -6.50, -3.78, -1.84, -2.07, -2.37, -2.68, -2.63, -1.62, 0.15, 2.48, 4.81, 5.18, 4.76, 4.95, 6.63, 7.97, 5.89, 3.82, 1.74, 2.16, 4.76, 6.47, 4.28, 2.10, -0.08, -0.31, 2.58, 5.47, 5.95, 4.55, 3.94, 5.31, 7.68, 10.38, 13.21, 12.02, 9.40, 7.09, 5.48, 5.28, 6.62, 8.81, 11.34, 13.91, 16.47, 17.29, 18.02, 19.19, 20.67, 21.00, 21.00, 21.00, 21.00, 21.00, 21.00, 21.00, 19.23, 17.46, 16.07, 15.14, 14.32, 11.66, 9.22, 7.21, 6.08, 6.32, 7.81, 10.00, 12.53, 15.20, 17.89, 20.57, 21.88, 23.18, 24.78, 26.62, 27.48, 28.21, 27.54, 26.96, 26.72, 26.81, 27.23, 25.56, 22.58, 19.61, 16.65, 13.70, 10.79, 7.94, 5.25, 3.19, 2.77, 2.58, 2.39, 2.21, 0.52, -2.33, -5.17, -8.04, -9.04, -8.71, -8.64, -9.53, -11.17, -13.30, -15.72, -18.30, -18.66, -19.33, -20.42, -21.87, -23.62, -25.60, -27.76, -30.06, // 71
+  -24.99, -22.98, -21.20, -18.24, -15.29, -12.36, -9.48, -6.70, -4.24, -3.01, -3.66, -4.40, -5.13, -5.27, -2.53, 0.20, 0.91, 0.61, 0.31, 0.19, 1.20, 2.24, 4.37, 6.70, 8.15, 7.73, 7.83, 8.99, 10.14, 8.06, 5.98, 4.41, 4.59, 6.38, 8.53, 6.34, 4.16, 1.97, 0.51, 3.39, 6.28, 8.60, 7.29, 6.92, 7.78, 9.55, 11.83, 14.38, 13.58, 11.33, 9.50, 8.37, 8.24, 9.15, 10.84, 13.02, 15.47, 18.03, 20.26, 20.88, 21.90, 23.27, 24.00, 24.00, 24.00, 24.00, 24.00, 24.00, 23.46, 21.62, 20.07, 18.86, 18.08, 15.81, 13.45, 11.40, 9.85, 9.06, 9.22, 10.30, 12.04, 14.21, 16.64, 19.24, 21.91, 24.60, 25.84, 27.29, 28.97, 30.43, 31.09, 30.45, 29.94, 29.72, 29.80, 29.00, 26.07, 23.16, 20.27, 17.42, 14.63, 11.94, 9.45, 7.34, 6.03, 5.76, 5.57, 5.25, 2.40, -0.44, -3.28, -6.13, -6.39, -6.06, -5.73, -5.68, -6.96, -9.08, -11.60, -14.30, -15.46, -15.70, -16.49, -17.75, -19.41, -21.35, -23.52, -25.86, -28.32, // 72
+  -22.95, -20.75, -18.76, -17.08, -14.99, -11.99, -8.99, -5.99, -2.99, -0.01, -0.75, -1.49, -2.23, -2.96, -1.30, 1.43, 3.90, 3.60, 3.29, 3.08, 4.03, 5.04, 6.40, 8.59, 10.92, 10.70, 10.77, 11.64, 12.30, 10.22, 8.38, 7.33, 7.44, 8.66, 10.58, 8.40, 6.21, 4.07, 3.22, 4.71, 7.21, 9.99, 10.17, 9.91, 10.53, 11.90, 13.80, 16.03, 15.57, 13.65, 12.17, 11.31, 11.22, 11.90, 13.25, 15.08, 17.24, 19.62, 22.15, 23.78, 24.68, 25.90, 27.00, 27.00, 27.00, 27.00, 27.00, 27.00, 25.81, 24.15, 22.77, 21.71, 20.00, 17.69, 15.62, 13.89, 12.65, 12.04, 12.17, 13.00, 14.42, 16.28, 18.44, 20.81, 23.32, 25.94, 28.57, 29.88, 31.43, 33.17, 33.99, 33.39, 32.92, 32.72, 32.63, 29.75, 26.90, 24.09, 21.33, 18.65, 16.07, 13.67, 11.55, 9.90, 8.98, 8.75, 7.14, 4.29, 1.45, -1.39, -4.06, -3.73, -3.40, -3.07, -2.74, -2.82, -4.90, -7.62, -10.50, -12.70, -12.46, -12.76, -13.71, -15.21, -17.11, -19.29, -21.67, -24.19, -26.80, // 73
+  -21.15, -18.73, -16.50, -14.56, -13.03, -12.05, -9.43, -6.51, -3.59, -0.67, 2.16, 1.42, 0.68, -0.06, -0.06, 2.67, 5.40, 6.58, 6.28, 6.06, 6.85, 7.87, 8.94, 10.63, 12.81, 13.69, 13.74, 14.43, 14.46, 12.53, 11.07, 10.30, 10.38, 11.29, 12.64, 10.45, 8.30, 6.69, 6.21, 7.10, 8.95, 11.31, 13.11, 12.90, 13.39, 14.49, 16.08, 18.04, 17.85, 16.20, 14.97, 14.28, 14.21, 14.75, 15.86, 17.42, 19.32, 21.47, 23.81, 26.28, 27.51, 28.60, 29.96, 30.00, 30.00, 30.00, 30.00, 30.00, 28.28, 26.77, 25.53, 24.21, 21.93, 19.85, 18.03, 16.55, 15.52, 15.03, 15.13, 15.81, 17.00, 18.60, 20.52, 22.67, 25.00, 27.46, 30.02, 32.55, 33.97, 35.59, 36.91, 36.33, 35.90, 35.72, 33.57, 30.78, 28.04, 25.35, 22.74, 20.24, 17.90, 15.78, 13.99, 12.66, 11.95, 9.10, 6.19, 3.34, 0.49, -1.41, -1.08, -0.75, -0.42, -0.09, 0.24, -1.25, -4.20, -7.19, -9.97, -9.71, -9.46, -9.85, -11.06, -12.87, -15.07, -17.51, -20.10, -22.79, -25.55, // 74
+  -19.63, -17.00, -14.52, -12.26, -10.39, -9.15, -8.79, -7.19, -4.27, -1.35, 1.57, 4.33, 3.59, 2.85, 2.27, 3.97, 6.64, 9.37, 9.26, 9.06, 9.67, 10.69, 11.70, 13.04, 14.87, 16.68, 16.72, 17.30, 16.72, 15.08, 13.89, 13.29, 13.35, 14.06, 14.69, 12.54, 10.73, 9.53, 9.20, 9.82, 11.24, 13.20, 15.49, 15.90, 16.30, 17.21, 18.58, 20.29, 20.31, 18.87, 17.83, 17.26, 17.20, 17.65, 18.59, 19.93, 21.61, 23.56, 25.71, 28.01, 30.36, 31.36, 32.61, 33.00, 33.00, 33.00, 33.00, 32.44, 30.84, 29.47, 28.35, 26.17, 24.08, 22.20, 20.59, 19.31, 18.44, 18.03, 18.11, 18.68, 19.70, 21.10, 22.80, 24.76, 26.91, 29.21, 31.62, 34.13, 36.59, 38.10, 39.77, 39.28, 38.89, 37.48, 34.74, 32.06, 29.43, 26.89, 24.44, 22.14, 20.02, 18.15, 16.61, 14.98, 11.99, 9.02, 6.06, 3.18, 1.24, 1.57, 1.90, 2.23, 2.56, 2.89, 0.84, -2.05, -4.94, -7.23, -6.98, -6.72, -6.47, -7.01, -8.64, -10.86, -13.39, -16.08, -18.87, -21.71, -24.10, // 75
+  -18.49, -15.67, -12.92, -10.33, -8.02, -6.32, -5.80, -6.04, -4.95, -2.03, 0.89, 3.81, 6.50, 5.76, 5.26, 6.19, 8.18, 10.65, 12.25, 12.06, 12.53, 13.51, 14.53, 15.65, 17.20, 19.10, 19.71, 20.20, 19.19, 17.77, 16.77, 16.28, 16.33, 16.92, 16.78, 14.88, 13.39, 12.45, 12.20, 12.67, 13.80, 15.44, 17.44, 18.90, 19.23, 20.02, 21.20, 22.72, 22.90, 21.64, 20.74, 20.25, 20.19, 20.58, 21.39, 22.57, 24.06, 25.82, 27.80, 29.94, 32.22, 34.16, 35.31, 36.00, 36.00, 36.00, 36.00, 34.96, 33.48, 32.22, 30.41, 28.32, 26.40, 24.70, 23.26, 22.14, 21.38, 21.02, 21.10, 21.59, 22.47, 23.71, 25.24, 27.02, 29.00, 31.14, 33.42, 35.81, 38.28, 40.67, 42.24, 42.24, 41.45, 38.76, 36.13, 33.55, 31.06, 28.65, 26.38, 24.25, 22.34, 20.68, 18.42, 15.52, 12.66, 9.89, 7.29, 5.15, 4.24, 4.55, 4.88, 5.21, 5.54, 2.93, 0.04, -2.85, -4.50, -4.25, -3.99, -3.73, -3.47, -4.41, -6.69, -9.39, -12.23, -15.13, -18.06, -19.94, -21.70, // 76
+  -17.78, -14.82, -11.89, -9.00, -6.22, -3.78, -2.81, -3.05, -3.29, -2.71, 0.21, 3.13, 6.05, 8.67, 8.25, 8.87, 10.36, 12.41, 14.79, 15.06, 15.43, 16.33, 17.35, 18.38, 19.72, 21.40, 22.70, 23.12, 21.78, 20.54, 19.69, 19.27, 19.31, 19.81, 19.07, 17.42, 16.17, 15.40, 15.20, 15.58, 16.51, 17.90, 19.65, 21.68, 22.19, 22.87, 23.91, 25.27, 25.58, 24.46, 23.66, 23.23, 23.19, 23.53, 24.24, 25.28, 26.63, 28.23, 30.05, 32.04, 34.18, 36.45, 38.05, 39.00, 39.00, 39.00, 39.00, 37.54, 36.17, 34.66, 32.56, 30.61, 28.84, 27.29, 26.00, 25.00, 24.33, 24.02, 24.08, 24.52, 25.30, 26.40, 27.78, 29.41, 31.24, 33.24, 35.38, 37.64, 40.00, 42.44, 44.78, 45.21, 42.83, 40.24, 37.70, 35.24, 32.87, 30.62, 28.49, 26.54, 24.80, 22.15, 19.34, 16.59, 13.96, 11.50, 9.36, 7.81, 7.24, 7.53, 7.86, 7.92, 5.03, 2.14, -0.76, -1.77, -1.52, -1.26, -1.00, -0.74, -0.48, -2.77, -5.75, -8.74, -11.74, -14.59, -15.82, -17.48, -19.47, // 77
+  -17.56, -14.56, -11.56, -8.56, -5.56, -2.57, 0.18, -0.06, -0.30, -0.54, -0.47, 2.45, 5.39, 8.36, 11.25, 11.72, 12.88, 14.58, 16.65, 18.05, 18.37, 19.16, 20.17, 21.19, 22.36, 23.85, 25.61, 25.87, 24.47, 23.38, 22.63, 22.26, 22.30, 22.74, 21.54, 20.09, 19.01, 18.37, 18.20, 18.52, 19.31, 20.51, 22.05, 23.88, 25.15, 25.76, 26.68, 27.91, 28.32, 27.32, 26.61, 26.23, 26.18, 26.49, 27.12, 28.06, 29.27, 30.74, 32.41, 34.27, 36.28, 38.42, 40.67, 42.00, 42.00, 42.00, 41.64, 40.19, 38.90, 36.80, 34.83, 33.02, 31.38, 29.97, 28.79, 27.89, 27.29, 27.02, 27.07, 27.46, 28.16, 29.15, 30.41, 31.91, 33.60, 35.47, 37.48, 39.62, 41.87, 44.20, 46.62, 46.92, 44.37, 41.87, 39.44, 37.10, 34.86, 32.73, 30.76, 28.81, 26.03, 23.30, 20.65, 18.10, 15.72, 13.59, 11.83, 10.65, 10.24, 10.52, 10.65, 7.67, 4.70, 1.82, 0.96, 1.21, 1.47, 1.73, 1.99, 2.25, -0.55, -3.39, -6.24, -9.09, -10.94, -11.80, -13.28, -15.22, -17.47, // 78
+  -17.85, -14.91, -12.00, -9.14, -6.31, -3.48, -0.65, 2.17, 2.69, 2.45, 2.21, 3.17, 5.74, 8.60, 11.52, 14.48, 15.57, 17.00, 18.80, 20.89, 21.33, 22.01, 23.00, 24.01, 25.08, 26.42, 28.02, 28.49, 27.23, 26.25, 25.58, 25.26, 25.29, 25.68, 24.12, 22.84, 21.90, 21.34, 21.20, 21.47, 22.16, 23.21, 24.59, 26.24, 28.11, 28.66, 29.50, 30.61, 31.12, 30.20, 29.56, 29.22, 29.18, 29.45, 30.02, 30.87, 31.98, 33.33, 34.88, 36.61, 38.50, 40.52, 42.66, 44.75, 45.00, 45.00, 44.25, 42.88, 41.04, 39.05, 37.20, 35.51, 34.00, 32.70, 31.62, 30.81, 30.27, 30.02, 30.07, 30.41, 31.05, 31.95, 33.11, 34.48, 36.06, 37.80, 39.70, 41.73, 43.86, 46.10, 48.41, 48.52, 46.05, 43.65, 41.33, 39.10, 36.98, 34.98, 32.73, 30.01, 27.35, 24.77, 22.29, 19.96, 17.82, 15.97, 14.51, 13.56, 13.24, 13.50, 11.29, 8.53, 6.01, 4.17, 3.94, 4.20, 4.46, 4.72, 4.20, 1.35, -1.50, -4.34, -6.91, -7.45, -8.00, -9.13, -10.98, -13.26, -15.79, // 79
+  -18.63, -15.80, -12.97, -10.14, -7.31, -4.48, -1.65, 1.18, 4.01, 5.44, 5.20, 5.66, 7.41, 9.79, 12.44, 15.22, 18.07, 19.58, 21.17, 23.04, 24.29, 24.89, 25.82, 26.83, 27.86, 29.07, 30.53, 31.18, 30.03, 29.14, 28.55, 28.26, 28.29, 28.22, 26.80, 25.65, 24.81, 24.32, 24.19, 24.44, 25.04, 25.98, 27.22, 28.71, 30.44, 31.59, 32.35, 33.37, 33.94, 33.11, 32.53, 32.21, 32.18, 32.43, 32.94, 33.72, 34.74, 35.98, 37.42, 39.04, 40.82, 42.73, 44.77, 46.90, 48.00, 48.00, 46.90, 45.28, 43.28, 41.40, 39.66, 38.08, 36.67, 35.47, 34.48, 33.73, 33.24, 33.02, 33.06, 33.38, 33.96, 34.79, 35.85, 37.12, 38.59, 40.22, 42.01, 43.93, 45.97, 48.10, 50.33, 50.24, 47.86, 45.56, 43.34, 41.22, 39.21, 36.72, 34.05, 31.45, 28.92, 26.49, 24.19, 22.06, 20.15, 18.53, 17.29, 16.50, 16.24, 15.24, 12.63, 10.24, 8.25, 7.03, 6.93, 7.19, 7.45, 6.09, 3.25, 0.40, -2.44, -3.42, -3.96, -4.50, -5.11, -6.74, -9.10, -11.75, -14.54, // 80
+  -17.18, -14.81, -12.72, -11.05, -8.31, -5.48, -2.65, 0.18, 3.01, 5.84, 8.19, 8.48, 9.74, 11.65, 13.95, 16.48, 19.15, 21.90, 23.68, 25.36, 27.27, 27.80, 28.64, 29.66, 30.67, 31.78, 33.12, 33.92, 32.86, 32.06, 31.52, 31.25, 31.28, 30.83, 29.53, 28.50, 27.75, 27.31, 27.19, 27.41, 27.95, 28.79, 29.91, 31.28, 32.87, 34.53, 35.23, 36.16, 36.80, 36.03, 35.49, 35.21, 35.18, 35.40, 35.88, 36.59, 37.54, 38.69, 40.03, 41.55, 43.22, 45.03, 46.97, 49.01, 51.00, 50.95, 49.52, 47.51, 45.61, 43.83, 42.19, 40.71, 39.40, 38.28, 37.36, 36.67, 36.22, 36.01, 36.06, 36.35, 36.88, 37.64, 38.63, 39.81, 41.18, 42.72, 44.41, 46.23, 48.17, 50.21, 52.35, 52.08, 49.79, 47.58, 45.46, 43.42, 40.76, 38.14, 35.58, 33.10, 30.71, 28.43, 26.30, 24.35, 22.64, 21.21, 20.13, 19.46, 19.24, 16.80, 14.48, 12.45, 10.87, 9.97, 9.92, 10.18, 8.68, 5.69, 2.74, 0.61, 0.07, -0.47, -1.01, -1.55, -2.50, -5.06, -7.93, -10.87, -13.84, // 81
+  -15.66, -13.03, -10.58, -8.51, -7.12, -6.47, -3.64, -0.81, 2.01, 4.84, 7.67, 10.50, 12.36, 13.92, 15.90, 18.16, 20.60, 23.18, 25.85, 27.82, 29.57, 30.73, 31.49, 32.48, 33.50, 34.54, 35.78, 36.70, 35.73, 34.99, 34.49, 34.25, 34.28, 33.50, 32.32, 31.37, 30.69, 30.30, 30.19, 30.39, 30.88, 31.64, 32.66, 33.92, 35.39, 37.05, 38.12, 38.99, 39.68, 38.96, 38.47, 38.21, 38.18, 38.38, 38.82, 39.48, 40.36, 41.43, 42.69, 44.12, 45.70, 47.41, 49.25, 51.20, 53.25, 53.60, 51.74, 49.82, 48.01, 46.32, 44.78, 43.38, 42.15, 41.11, 40.26, 39.62, 39.20, 39.01, 39.05, 39.32, 39.81, 40.52, 41.44, 42.54, 43.83, 45.28, 46.87, 48.60, 50.45, 52.40, 54.45, 54.03, 51.82, 49.70, 47.46, 44.83, 42.26, 39.74, 37.29, 34.93, 32.67, 30.54, 28.57, 26.79, 25.24, 23.97, 23.02, 22.43, 21.00, 18.72, 16.66, 14.93, 13.65, 12.94, 12.91, 12.22, 9.40, 6.74, 4.53, 3.56, 3.02, 2.48, 1.94, 0.89, -1.99, -4.87, -7.81, -10.79, -13.77, // 82
+  -14.61, -11.74, -8.96, -6.37, -4.35, -3.79, -3.76, -1.81, 1.02, 3.85, 6.68, 9.51, 12.34, 15.23, 18.13, 20.14, 22.37, 24.77, 27.28, 29.89, 31.98, 33.67, 34.37, 35.30, 36.32, 37.34, 38.48, 39.51, 38.61, 37.93, 37.47, 37.25, 37.27, 36.23, 35.14, 34.27, 33.65, 33.29, 33.19, 33.37, 33.81, 34.51, 35.46, 36.62, 37.98, 39.53, 41.03, 41.84, 42.57, 41.90, 41.45, 41.20, 41.18, 41.37, 41.77, 42.39, 43.21, 44.21, 45.39, 46.74, 48.23, 49.86, 51.61, 53.48, 55.44, 55.97, 54.04, 52.20, 50.48, 48.88, 47.41, 46.10, 44.94, 43.97, 43.17, 42.58, 42.19, 42.01, 42.05, 42.30, 42.76, 43.42, 44.27, 45.31, 46.52, 47.89, 49.40, 51.04, 52.80, 54.67, 56.64, 56.06, 53.94, 51.53, 48.94, 46.40, 43.91, 41.49, 39.15, 36.91, 34.78, 32.79, 30.96, 29.33, 27.92, 26.77, 25.93, 25.22, 22.96, 20.89, 19.07, 17.58, 16.50, 15.92, 15.90, 13.43, 10.93, 8.75, 7.19, 6.51, 5.97, 5.43, 2.93, 0.05, -2.83, -5.71, -8.59, -11.47, -14.34, // 83
+  -14.13, -11.14, -8.15, -5.17, -2.26, -0.79, -0.76, -0.72, 0.02, 2.86, 5.82, 8.81, 11.80, 14.80, 17.79, 20.79, 23.79, 26.60, 28.95, 31.42, 33.97, 36.17, 37.26, 38.13, 39.14, 40.16, 41.23, 42.35, 41.51, 40.87, 40.45, 40.25, 40.21, 39.00, 37.98, 37.18, 36.61, 36.28, 36.19, 36.36, 36.76, 37.41, 38.28, 39.36, 40.63, 42.08, 43.69, 44.71, 45.48, 44.85, 44.43, 44.20, 44.17, 44.35, 44.73, 45.31, 46.07, 47.02, 48.13, 49.40, 50.81, 52.36, 54.04, 55.82, 57.70, 58.26, 56.40, 54.64, 53.00, 51.48, 50.09, 48.85, 47.76, 46.84, 46.10, 45.54, 45.18, 45.01, 45.04, 45.28, 45.71, 46.32, 47.13, 48.10, 49.24, 50.54, 51.97, 53.54, 55.22, 57.01, 58.90, 58.18, 55.63, 53.07, 50.55, 48.09, 45.70, 43.38, 41.15, 39.02, 37.02, 35.15, 33.45, 31.94, 30.66, 29.62, 28.86, 27.20, 25.12, 23.25, 21.63, 20.32, 19.40, 18.91, 17.56, 15.15, 12.98, 11.21, 10.04, 9.46, 7.84, 4.97, 2.09, -0.79, -3.67, -6.55, -9.43, -12.31, -15.19, // 84
+  -14.25, -11.26, -8.27, -5.28, -2.29, 0.69, 2.24, 2.27, 2.31, 3.61, 6.22, 9.08, 12.00, 14.96, 17.93, 20.91, 23.89, 26.88, 29.87, 32.86, 35.58, 38.09, 40.17, 40.98, 41.96, 42.98, 44.01, 45.19, 44.42, 43.83, 43.44, 43.25, 42.93, 41.80, 40.85, 40.11, 39.58, 39.27, 39.19, 39.34, 39.72, 40.32, 41.13, 42.13, 43.32, 44.69, 46.20, 47.59, 48.39, 47.81, 47.41, 47.20, 47.17, 47.34, 47.70, 48.24, 48.96, 49.85, 50.90, 52.10, 53.44, 54.92, 56.51, 58.22, 60.03, 60.61, 58.82, 57.14, 55.57, 54.12, 52.80, 51.62, 50.60, 49.73, 49.03, 48.51, 48.17, 48.01, 48.04, 48.26, 48.66, 49.24, 50.00, 50.92, 52.00, 53.23, 54.59, 56.08, 57.69, 59.41, 61.22, 59.75, 57.21, 54.72, 52.29, 49.91, 47.61, 45.39, 43.26, 41.25, 39.35, 37.60, 36.02, 34.62, 33.44, 32.49, 31.44, 29.36, 27.44, 25.74, 24.29, 23.13, 22.32, 21.73, 19.38, 17.22, 15.35, 13.88, 12.95, 10.11, 7.12, 4.15, 1.24, -1.64, -4.22, -6.53, -8.83, -11.14, -13.64, // 85
+  -12.46, -11.08, -8.53, -5.55, -2.56, 0.43, 3.42, 5.27, 5.31, 5.99, 7.85, 10.26, 12.92, 15.70, 18.56, 21.45, 24.37, 27.30, 30.25, 33.21, 36.17, 39.14, 42.12, 43.85, 44.79, 45.80, 46.82, 47.93, 47.35, 46.79, 46.42, 46.25, 45.69, 44.62, 43.74, 43.04, 42.55, 42.27, 42.19, 42.33, 42.68, 43.24, 43.99, 44.94, 46.06, 47.34, 48.77, 50.34, 51.32, 50.77, 50.39, 50.19, 50.17, 50.33, 50.67, 51.17, 51.85, 52.69, 53.69, 54.83, 56.11, 57.51, 59.04, 60.68, 62.41, 63.01, 61.29, 59.68, 58.18, 56.80, 55.54, 54.42, 53.45, 52.63, 51.97, 51.48, 51.16, 51.01, 51.04, 51.24, 51.62, 52.17, 52.89, 53.76, 54.78, 55.95, 57.25, 58.67, 60.21, 61.85, 63.60, 61.37, 58.90, 56.49, 54.13, 51.85, 49.63, 47.51, 45.48, 43.56, 41.77, 40.13, 38.65, 37.35, 36.26, 35.39, 33.60, 31.65, 29.89, 28.33, 27.01, 25.98, 25.27, 23.61, 21.46, 19.53, 17.91, 16.25, 13.29, 10.35, 7.45, 4.69, 2.31, 0.00, -2.30, -4.61, -6.95, -9.60, -12.40, // 86
+  -10.03, -8.34, -7.40, -5.81, -2.82, 0.17, 3.16, 6.14, 8.31, 8.76, 10.12, 12.09, 14.42, 16.96, 19.63, 22.38, 25.19, 28.04, 30.92, 33.82, 36.73, 39.66, 42.60, 45.54, 47.62, 48.63, 49.64, 50.70, 50.28, 49.76, 49.41, 49.25, 48.47, 47.47, 46.64, 45.99, 45.53, 45.26, 45.19, 45.32, 45.65, 46.17, 46.88, 47.76, 48.82, 50.03, 51.39, 52.88, 54.19, 53.74, 53.38, 53.19, 53.17, 53.32, 53.64, 54.12, 54.76, 55.56, 56.50, 57.59, 58.80, 60.15, 61.61, 63.18, 64.85, 65.46, 63.81, 62.27, 60.83, 59.51, 58.31, 57.25, 56.32, 55.54, 54.92, 54.45, 54.15, 54.01, 54.04, 54.23, 54.59, 55.11, 55.79, 56.61, 57.58, 58.69, 59.93, 61.29, 62.77, 64.35, 65.54, 63.09, 60.70, 58.36, 56.08, 53.87, 51.75, 49.71, 47.78, 45.96, 44.27, 42.72, 41.33, 40.12, 39.10, 37.83, 35.87, 34.06, 32.42, 30.99, 29.80, 28.86, 27.85, 25.70, 23.74, 22.02, 19.81, 16.94, 14.12, 11.40, 8.85, 6.53, 4.23, 1.92, -0.38, -2.92, -5.85, -8.83, -11.82, // 87
+  -7.62, -5.84, -4.46, -3.87, -3.08, -0.10, 2.89, 5.88, 8.87, 11.65, 12.70, 14.32, 16.33, 18.61, 21.07, 23.66, 26.33, 29.07, 31.86, 34.68, 37.52, 40.40, 43.28, 46.19, 49.10, 51.45, 52.46, 53.49, 53.22, 52.73, 52.40, 52.24, 51.28, 50.33, 49.55, 48.94, 48.51, 48.26, 48.19, 48.31, 48.62, 49.11, 49.78, 50.61, 51.61, 52.76, 54.05, 55.47, 57.01, 56.71, 56.37, 56.19, 56.17, 56.31, 56.61, 57.07, 57.68, 58.43, 59.33, 60.37, 61.53, 62.82, 64.22, 65.72, 67.33, 67.96, 66.37, 64.88, 63.51, 62.24, 61.10, 60.08, 59.20, 58.46, 57.87, 57.43, 57.14, 57.01, 57.04, 57.22, 57.56, 58.05, 58.69, 59.48, 60.41, 61.47, 62.65, 63.95, 65.37, 66.89, 67.29, 64.91, 62.58, 60.32, 58.12, 55.99, 53.95, 52.00, 50.15, 48.42, 46.82, 45.36, 44.05, 42.92, 41.97, 40.09, 38.25, 36.55, 35.03, 33.71, 32.62, 31.77, 29.94, 27.96, 26.17, 23.60, 20.82, 18.10, 15.50, 13.07, 10.76, 8.45, 6.15, 3.16, 0.17, -2.83, -5.83, -8.83, -11.83, // 88
+  -5.21, -3.43, -1.64, -0.93, -0.33, 0.27, 2.69, 5.68, 8.68, 11.67, 14.67, 16.79, 18.53, 20.57, 22.82, 25.23, 27.75, 30.36, 33.04, 35.77, 38.54, 41.34, 44.16, 47.01, 49.88, 52.76, 55.29, 56.30, 56.17, 55.70, 55.39, 55.15, 54.11, 53.21, 52.47, 51.90, 51.49, 51.25, 51.19, 51.31, 51.60, 52.06, 52.69, 53.48, 54.42, 55.51, 56.74, 58.09, 59.57, 59.68, 59.36, 59.19, 59.17, 59.30, 59.59, 60.02, 60.60, 61.32, 62.18, 63.17, 64.28, 65.51, 66.86, 68.30, 69.85, 70.49, 68.96, 67.54, 66.21, 65.00, 63.91, 62.94, 62.10, 61.39, 60.83, 60.41, 60.13, 60.01, 60.03, 60.21, 60.53, 61.00, 61.61, 62.36, 63.25, 64.26, 65.39, 66.64, 68.00, 69.46, 69.12, 66.81, 64.55, 62.36, 60.23, 58.18, 56.22, 54.35, 52.59, 50.94, 49.42, 48.04, 46.81, 45.74, 44.32, 42.44, 40.70, 39.12, 37.70, 36.48, 35.47, 34.18, 32.18, 30.28, 27.52, 24.81, 22.18, 19.66, 17.29, 14.98, 12.10, 9.10, 6.10, 3.10, 0.10, -2.90, -5.90, -8.89, -11.89, // 89
+  -2.83, -1.01, 0.77, 2.01, 2.61, 3.21, 4.28, 6.58, 9.29, 12.14, 15.05, 17.98, 20.94, 22.76, 24.81, 27.05, 29.41, 31.89, 34.45, 37.07, 39.75, 42.47, 45.22, 48.01, 50.82, 53.65, 56.50, 59.13, 59.12, 58.68, 58.38, 57.95, 56.95, 56.10, 55.40, 54.86, 54.47, 54.25, 54.19, 54.30, 54.57, 55.01, 55.61, 56.35, 57.25, 58.29, 59.46, 60.75, 62.17, 62.65, 62.35, 62.19, 62.17, 62.30, 62.57, 62.98, 63.53, 64.22, 65.04, 65.99, 67.05, 68.23, 69.52, 70.92, 72.41, 73.06, 71.59, 70.21, 68.94, 67.78, 66.73, 65.80, 65.00, 64.33, 63.79, 63.39, 63.13, 63.01, 63.03, 63.20, 63.51, 63.95, 64.54, 65.25, 66.10, 67.07, 68.15, 69.35, 70.66, 72.07, 71.04, 68.79, 66.60, 64.47, 62.42, 60.45, 58.56, 56.77, 55.08, 53.51, 52.07, 50.76, 49.59, 48.55, 46.65, 44.87, 43.23, 41.74, 40.42, 39.28, 38.34, 36.41, 34.22, 31.52, 28.88, 26.31, 23.85, 21.04, 18.04, 15.04, 12.04, 9.04, 6.04, 3.04, 0.04, -2.96, -5.96, -8.96, -11.96, // 90
+  2.24, 1.40, 3.18, 4.95, 5.55, 6.15, 6.88, 8.51, 10.74, 13.28, 15.98, 18.77, 21.62, 24.50, 26.99, 29.06, 31.27, 33.61, 36.05, 38.56, 41.14, 43.78, 46.45, 49.17, 51.92, 54.69, 57.49, 60.30, 62.08, 61.66, 61.38, 60.76, 59.82, 59.01, 58.34, 57.82, 57.46, 57.25, 57.19, 57.30, 57.55, 57.97, 58.53, 59.25, 60.10, 61.09, 62.21, 63.45, 64.80, 65.63, 65.34, 65.19, 65.17, 65.29, 65.55, 65.94, 66.47, 67.13, 67.91, 68.82, 69.84, 70.98, 72.22, 73.56, 75.00, 75.66, 74.24, 72.92, 71.69, 70.58, 69.57, 68.68, 67.91, 67.27, 66.75, 66.37, 66.12, 66.01, 66.03, 66.19, 66.48, 66.91, 67.47, 68.15, 68.96, 69.89, 70.94, 72.09, 73.35, 74.71, 73.03, 70.84, 68.72, 66.66, 64.67, 62.77, 60.96, 59.24, 57.62, 56.12, 54.75, 53.50, 52.40, 50.86, 49.05, 47.37, 45.81, 44.41, 43.17, 42.10, 40.64, 38.23, 35.58, 32.99, 30.02, 27.02, 24.02, 21.02, 18.03, 15.03, 12.04, 9.06, 6.08, 3.16, 1.00, 3.16, 6.08, 9.06, 12.04, // 91
+  4.47, 4.12, 5.59, 7.38, 8.49, 9.09, 9.71, 10.93, 12.74, 14.95, 17.39, 19.99, 22.68, 25.45, 28.26, 31.11, 33.30, 35.50, 37.82, 40.22, 42.70, 45.25, 47.84, 50.48, 53.16, 55.87, 58.61, 61.38, 64.16, 64.64, 64.37, 63.59, 62.69, 61.92, 61.28, 60.79, 60.44, 60.24, 60.19, 60.29, 60.54, 60.93, 61.47, 62.15, 62.96, 63.90, 64.97, 66.16, 67.46, 68.61, 68.33, 68.19, 68.17, 68.29, 68.53, 68.91, 69.42, 70.04, 70.80, 71.67, 72.65, 73.74, 74.94, 76.23, 77.62, 78.29, 76.92, 75.64, 74.46, 73.39, 72.42, 71.57, 70.83, 70.21, 69.72, 69.35, 69.12, 69.01, 69.03, 69.18, 69.46, 69.87, 70.41, 71.06, 71.84, 72.73, 73.74, 74.85, 76.06, 77.27, 75.08, 72.96, 70.90, 68.90, 66.99, 65.15, 63.40, 61.75, 60.21, 58.77, 57.46, 56.28, 55.08, 53.25, 51.52, 49.92, 48.45, 47.12, 45.95, 44.87, 42.19, 39.20, 36.22, 33.24, 30.27, 27.29, 24.33, 21.38, 18.44, 15.52, 12.65, 9.85, 7.21, 5.00, 4.00, 5.00, 7.21, 9.85, 12.65, // 92
+  7.28, 7.07, 8.06, 9.79, 11.43, 12.03, 12.63, 13.58, 15.08, 16.98, 19.17, 21.55, 24.07, 26.69, 29.39, 32.13, 34.92, 37.54, 39.74, 42.03, 44.41, 46.86, 49.37, 51.94, 54.54, 57.19, 59.87, 62.58, 65.31, 67.62, 67.36, 66.44, 65.58, 64.84, 64.23, 63.76, 63.43, 63.24, 63.19, 63.29, 63.52, 63.90, 64.41, 65.06, 65.83, 66.74, 67.76, 68.90, 70.15, 71.51, 71.33, 71.18, 71.17, 71.28, 71.52, 71.88, 72.36, 72.97, 73.69, 74.52, 75.47, 76.52, 77.68, 78.93, 80.27, 80.95, 79.62, 78.39, 77.25, 76.22, 75.29, 74.46, 73.76, 73.16, 72.69, 72.34, 72.11, 72.01, 72.03, 72.17, 72.44, 72.84, 73.35, 73.98, 74.73, 75.58, 76.55, 77.62, 78.79, 79.33, 77.20, 75.14, 73.14, 71.21, 69.35, 67.58, 65.90, 64.31, 62.83, 61.45, 60.20, 59.07, 57.44, 55.69, 54.04, 52.51, 51.12, 49.86, 48.51, 45.54, 42.58, 39.62, 36.67, 33.73, 30.81, 27.89, 25.00, 22.14, 19.31, 16.55, 13.89, 11.40, 9.22, 7.62, 7.00, 7.62, 9.22, 11.40, 13.89, // 93
+  10.20, 10.05, 10.77, 12.21, 13.99, 14.97, 15.56, 16.35, 17.62, 19.27, 21.23, 23.40, 25.74, 28.21, 30.77, 33.40, 36.09, 38.83, 41.60, 43.97, 46.25, 48.61, 51.04, 53.52, 56.05, 58.63, 61.25, 63.90, 66.58, 69.28, 70.25, 69.30, 68.47, 67.77, 67.19, 66.74, 66.42, 66.24, 66.19, 66.28, 66.51, 66.86, 67.35, 67.97, 68.72, 69.59, 70.57, 71.66, 72.87, 74.17, 74.32, 74.18, 74.17, 74.28, 74.50, 74.85, 75.32, 75.90, 76.59, 77.39, 78.31, 79.32, 80.43, 81.64, 82.94, 83.63, 82.35, 81.15, 80.06, 79.06, 78.16, 77.37, 76.69, 76.12, 75.66, 75.33, 75.11, 75.01, 75.03, 75.17, 75.43, 75.80, 76.30, 76.90, 77.62, 78.45, 79.38, 80.41, 81.54, 81.44, 79.37, 77.37, 75.43, 73.56, 71.76, 70.05, 68.43, 66.91, 65.48, 64.16, 62.96, 61.65, 59.87, 58.18, 56.61, 55.15, 53.82, 51.97, 49.03, 46.10, 43.17, 40.26, 37.36, 34.48, 31.62, 28.79, 26.00, 23.26, 20.59, 18.03, 15.62, 13.45, 11.66, 10.44, 10.00, 10.44, 11.66, 13.45, 15.62, // 94
+  13.15, 13.04, 13.60, 14.76, 16.40, 17.91, 18.50, 19.20, 20.29, 21.74, 23.49, 25.47, 27.63, 29.94, 32.37, 34.88, 37.47, 40.11, 42.80, 45.53, 48.21, 50.48, 52.82, 55.22, 57.68, 60.19, 62.74, 65.33, 67.95, 70.61, 73.08, 72.17, 71.38, 70.70, 70.14, 69.71, 69.41, 69.24, 69.19, 69.28, 69.49, 69.84, 70.30, 70.90, 71.61, 72.44, 73.39, 74.44, 75.60, 76.86, 77.31, 77.18, 77.17, 77.27, 77.49, 77.82, 78.27, 78.83, 79.50, 80.27, 81.15, 82.13, 83.21, 84.38, 85.63, 86.33, 85.09, 83.93, 82.87, 81.91, 81.04, 80.28, 79.62, 79.08, 78.64, 78.31, 78.10, 78.01, 78.03, 78.16, 78.41, 78.77, 79.25, 79.83, 80.52, 81.32, 82.22, 83.22, 84.31, 83.61, 81.60, 79.65, 77.77, 75.95, 74.22, 72.57, 71.00, 69.53, 68.16, 66.90, 65.75, 64.05, 62.34, 60.72, 59.22, 57.83, 55.54, 52.63, 49.73, 46.84, 43.97, 41.11, 38.28, 35.47, 32.70, 29.97, 27.29, 24.70, 22.20, 19.85, 17.69, 15.81, 14.32, 13.34, 13.00, 13.34, 14.32, 15.81, 17.69, // 95
+  16.12, 16.03, 16.49, 17.46, 18.87, 20.59, 21.44, 22.08, 23.03, 24.32, 25.90, 27.71, 29.71, 31.87, 34.16, 36.55, 39.02, 41.57, 44.17, 46.82, 49.51, 52.23, 54.70, 57.03, 59.41, 61.85, 64.34, 66.86, 69.43, 72.03, 74.66, 75.05, 74.29, 73.64, 73.10, 72.69, 72.40, 72.23, 72.19, 72.27, 72.48, 72.81, 73.26, 73.83, 74.52, 75.32, 76.22, 77.24, 78.36, 79.57, 80.31, 80.18, 80.17, 80.27, 80.48, 80.80, 81.23, 81.77, 82.41, 83.16, 84.01, 84.96, 86.00, 87.13, 88.35, 89.05, 87.85, 86.73, 85.70, 84.77, 83.93, 83.20, 82.57, 82.04, 81.61, 81.30, 81.10, 81.01, 81.02, 81.15, 81.39, 81.74, 82.20, 82.76, 83.43, 84.20, 85.07, 86.03, 87.09, 85.84, 83.88, 81.98, 80.15, 78.39, 76.71, 75.12, 73.61, 72.19, 70.87, 69.66, 68.25, 66.50, 64.85, 63.30, 61.86, 59.20, 56.32, 53.45, 50.60, 47.76, 44.94, 42.15, 39.40, 36.67, 34.00, 31.38, 28.84, 26.40, 24.08, 21.93, 20.00, 18.36, 17.09, 16.28, 16.00, 16.28, 17.09, 18.36, 20.00, // 96
+  19.10, 19.03, 19.42, 20.25, 21.47, 23.02, 24.38, 24.99, 25.84, 26.99, 28.42, 30.08, 31.93, 33.95, 36.11, 38.38, 40.74, 43.18, 45.69, 48.26, 50.87, 53.52, 56.21, 58.93, 61.24, 63.61, 66.03, 68.50, 71.00, 73.55, 76.12, 77.94, 77.21, 76.58, 76.07, 75.67, 75.39, 75.23, 75.19, 75.27, 75.47, 75.78, 76.22, 76.76, 77.43, 78.20, 79.07, 80.05, 81.13, 82.30, 83.30, 83.18, 83.17, 83.26, 83.47, 83.78, 84.19, 84.71, 85.33, 86.06, 86.88, 87.79, 88.80, 89.90, 91.08, 91.79, 90.62, 89.54, 88.54, 87.64, 86.83, 86.12, 85.51, 85.00, 84.59, 84.29, 84.10, 84.01, 84.02, 84.15, 84.38, 84.72, 85.16, 85.70, 86.35, 87.09, 87.93, 88.87, 89.89, 88.10, 86.20, 84.35, 82.57, 80.87, 79.24, 77.70, 76.24, 74.87, 73.60, 72.43, 70.68, 69.00, 67.41, 65.80, 62.94, 60.08, 57.25, 54.42, 51.62, 48.85, 46.10, 43.38, 40.71, 38.08, 35.51, 33.02, 30.61, 28.32, 26.17, 24.21, 22.47, 21.02, 19.92, 19.24, 19.00, 19.24, 19.92, 21.02, 22.47, // 97
+  22.09, 22.02, 22.36, 23.09, 24.17, 25.55, 27.20, 27.92, 28.68, 29.73, 31.03, 32.55, 34.27, 36.16, 38.19, 40.35, 42.60, 44.94, 47.36, 49.84, 52.37, 54.95, 57.58, 60.23, 62.92, 65.46, 67.81, 70.22, 72.66, 75.15, 77.68, 80.23, 80.13, 79.53, 79.04, 78.65, 78.39, 78.23, 78.19, 78.27, 78.46, 78.76, 79.18, 79.71, 80.34, 81.08, 81.93, 82.88, 83.92, 85.05, 86.28, 86.18, 86.17, 86.26, 86.46, 86.75, 87.16, 87.66, 88.26, 88.96, 89.75, 90.64, 91.61, 92.68, 93.82, 94.54, 93.41, 92.36, 91.39, 90.52, 89.74, 89.05, 88.46, 87.97, 87.57, 87.28, 87.09, 87.01, 87.02, 87.14, 87.37, 87.69, 88.12, 88.65, 89.27, 89.99, 90.80, 91.71, 92.33, 90.41, 88.56, 86.76, 85.03, 83.38, 81.80, 80.31, 78.90, 77.58, 76.35, 74.86, 73.15, 71.53, 69.57, 66.73, 63.91, 61.10, 58.31, 55.54, 52.80, 50.09, 47.41, 44.78, 42.19, 39.66, 37.20, 34.83, 32.56, 30.41, 28.43, 26.63, 25.06, 23.77, 22.80, 22.20, 22.00, 22.20, 22.80, 23.77, 25.06, // 98
+  25.08, 25.02, 25.32, 25.96, 26.93, 28.18, 29.68, 30.86, 31.55, 32.51, 33.70, 35.11, 36.71, 38.48, 40.40, 42.44, 44.59, 46.83, 49.15, 51.55, 54.00, 56.51, 59.06, 61.65, 64.28, 66.94, 69.63, 72.02, 74.41, 76.84, 79.31, 81.82, 83.06, 82.48, 82.00, 81.64, 81.38, 81.23, 81.19, 81.26, 81.45, 81.74, 82.14, 82.65, 83.26, 83.98, 84.80, 85.71, 86.72, 87.82, 89.00, 89.18, 89.17, 89.26, 89.45, 89.73, 90.12, 90.61, 91.19, 91.87, 92.64, 93.50, 94.44, 95.47, 96.59, 97.31, 96.21, 95.19, 94.25, 93.41, 92.65, 91.98, 91.41, 90.93, 90.55, 90.27, 90.09, 90.01, 90.02, 90.14, 90.35, 90.67, 91.08, 91.59, 92.20, 92.89, 93.68, 94.56, 94.63, 92.76, 90.95, 89.21, 87.53, 85.92, 84.39, 82.94, 81.58, 80.30, 79.05, 77.32, 75.67, 73.39, 70.58, 67.78, 65.00, 62.24, 59.51, 56.80, 54.12, 51.48, 48.88, 46.32, 43.83, 41.40, 39.05, 36.80, 34.66, 32.65, 30.81, 29.15, 27.73, 26.57, 25.71, 25.18, 25.00, 25.18, 25.71, 26.57, 27.73, // 99
+  28.07, 28.02, 28.28, 28.86, 29.73, 30.87, 32.25, 33.80, 34.45, 35.32, 36.42, 37.73, 39.23, 40.89, 42.69, 44.63, 46.68, 48.83, 51.06, 53.37, 55.74, 58.17, 60.65, 63.18, 65.75, 68.35, 70.99, 73.65, 76.24, 78.61, 81.03, 83.48, 85.97, 85.43, 84.98, 84.62, 84.37, 84.23, 84.19, 84.26, 84.44, 84.72, 85.11, 85.60, 86.19, 86.88, 87.67, 88.56, 89.53, 90.60, 91.75, 92.18, 92.17, 92.25, 92.44, 92.72, 93.09, 93.56, 94.13, 94.78, 95.53, 96.36, 97.28, 98.28, 99.36, 100.09, 99.02, 98.03, 97.12, 96.30, 95.57, 94.92, 94.37, 93.90, 93.54, 93.26, 93.09, 93.01, 93.02, 93.13, 93.34, 93.65, 94.05, 94.54, 95.13, 95.80, 96.57, 97.42, 96.97, 95.15, 93.39, 91.69, 90.05, 88.49, 87.01, 85.60, 84.28, 83.05, 81.49, 79.81, 77.25, 74.46, 71.69, 68.94, 66.21, 63.51, 60.83, 58.18, 55.57, 53.00, 50.48, 48.01, 45.61, 43.28, 41.04, 38.90, 36.88, 35.00, 33.29, 31.76, 30.46, 29.41, 28.64, 28.16, 28.00, 28.16, 28.64, 29.41, 30.46, // 100
+  31.06, 31.02, 31.26, 31.78, 32.57, 33.62, 34.89, 36.36, 37.36, 38.17, 39.19, 40.41, 41.81, 43.37, 45.08, 46.91, 48.87, 50.92, 53.07, 55.29, 57.58, 59.94, 62.35, 64.82, 67.32, 69.86, 72.44, 75.05, 77.69, 80.36, 82.81, 85.22, 87.66, 88.39, 87.95, 87.61, 87.37, 87.23, 87.19, 87.26, 87.43, 87.70, 88.08, 88.55, 89.12, 89.79, 90.56, 91.41, 92.36, 93.39, 94.51, 95.18, 95.17, 95.25, 95.43, 95.70, 96.06, 96.52, 97.07, 97.70, 98.42, 99.23, 100.13, 101.10, 102.15, 102.88, 101.84, 100.88, 100.00, 99.20, 98.49, 97.86, 97.32, 96.88, 96.52, 96.25, 96.08, 96.01, 96.02, 96.13, 96.33, 96.63, 97.02, 97.49, 98.06, 98.72, 99.46, 100.28, 99.35, 97.57, 95.85, 94.20, 92.61, 91.09, 89.65, 88.29, 87.01, 85.67, 83.93, 81.15, 78.39, 75.64, 72.92, 70.21, 67.54, 64.88, 62.27, 59.68, 57.14, 54.64, 52.20, 49.82, 47.51, 45.28, 43.14, 41.11, 39.20, 37.44, 35.85, 34.44, 33.24, 32.28, 31.58, 31.14, 31.00, 31.14, 31.58, 32.28, 33.24, // 101
+  34.06, 34.01, 34.23, 34.71, 35.44, 36.40, 37.58, 38.95, 40.28, 41.03, 41.99, 43.13, 44.44, 45.91, 47.53, 49.27, 51.14, 53.10, 55.16, 57.31, 59.52, 61.81, 64.15, 66.54, 68.99, 71.47, 73.99, 76.55, 79.14, 81.76, 84.40, 87.02, 89.41, 91.35, 90.92, 90.59, 90.36, 90.23, 90.19, 90.26, 90.42, 90.69, 91.05, 91.51, 92.06, 92.71, 93.45, 94.28, 95.20, 96.20, 97.28, 98.18, 98.17, 98.25, 98.42, 98.68, 99.04, 99.48, 100.01, 100.63, 101.33, 102.11, 102.98, 103.93, 104.95, 105.69, 104.68, 103.74, 102.88, 102.11, 101.41, 100.81, 100.28, 99.85, 99.50, 99.25, 99.08, 99.01, 99.02, 99.13, 99.32, 99.61, 99.98, 100.45, 101.00, 101.64, 102.36, 103.16, 101.76, 100.02, 98.35, 96.73, 95.19, 93.71, 92.31, 90.99, 89.75, 87.85, 85.09, 82.35, 79.62, 76.92, 74.24, 71.59, 68.96, 66.37, 63.81, 61.29, 58.82, 56.40, 54.04, 51.74, 49.52, 47.38, 45.34, 43.42, 41.62, 39.96, 38.47, 37.16, 36.06, 35.17, 34.53, 34.13, 34.00, 34.13, 34.53, 35.17, 36.06, // 102
+  37.05, 37.01, 37.22, 37.66, 38.33, 39.22, 40.31, 41.59, 43.05, 43.92, 44.81, 45.88, 47.12, 48.51, 50.04, 51.70, 53.48, 55.36, 57.34, 59.41, 61.55, 63.76, 66.03, 68.36, 70.74, 73.17, 75.63, 78.14, 80.67, 83.24, 85.84, 88.46, 91.11, 93.61, 93.90, 93.58, 93.35, 93.22, 93.19, 93.25, 93.41, 93.67, 94.02, 94.47, 95.00, 95.63, 96.35, 97.15, 98.04, 99.02, 100.07, 101.18, 101.17, 101.24, 101.41, 101.67, 102.01, 102.44, 102.95, 103.55, 104.24, 105.00, 105.84, 106.77, 107.76, 108.50, 107.52, 106.61, 105.77, 105.02, 104.35, 103.75, 103.25, 102.83, 102.49, 102.24, 102.08, 102.00, 102.02, 102.12, 102.31, 102.59, 102.96, 103.41, 103.94, 104.56, 105.26, 105.95, 104.20, 102.50, 100.87, 99.30, 97.79, 96.36, 94.99, 93.71, 91.79, 89.05, 86.33, 83.63, 80.95, 78.29, 75.66, 73.06, 70.49, 67.96, 65.46, 63.01, 60.61, 58.26, 55.97, 53.76, 51.62, 49.58, 47.63, 45.80, 44.10, 42.54, 41.15, 39.92, 38.90, 38.08, 37.48, 37.12, 37.00, 37.12, 37.48, 38.08, 38.90, // 103
+  40.05, 40.01, 40.20, 40.61, 41.23, 42.06, 43.08, 44.28, 45.65, 46.82, 47.65, 48.66, 49.83, 51.15, 52.60, 54.19, 55.88, 57.69, 59.59, 61.58, 63.65, 65.79, 67.99, 70.26, 72.58, 74.94, 77.35, 79.80, 82.29, 84.81, 87.36, 89.94, 92.54, 95.17, 96.88, 96.57, 96.35, 96.22, 96.19, 96.25, 96.41, 96.66, 96.99, 97.43, 97.95, 98.56, 99.25, 100.04, 100.90, 101.85, 102.87, 103.97, 104.17, 104.24, 104.40, 104.65, 104.99, 105.40, 105.90, 106.49, 107.15, 107.89, 108.72, 109.61, 110.58, 111.33, 110.37, 109.48, 108.67, 107.94, 107.28, 106.71, 106.21, 105.80, 105.48, 105.23, 105.08, 105.00, 105.02, 105.12, 105.30, 105.57, 105.93, 106.37, 106.89, 107.49, 108.17, 108.38, 106.67, 105.01, 103.42, 101.88, 100.42, 99.02, 97.70, 95.75, 93.04, 90.34, 87.66, 85.00, 82.37, 79.76, 77.18, 74.63, 72.11, 69.63, 67.20, 64.82, 62.48, 60.21, 58.00, 55.87, 53.81, 51.86, 50.00, 48.26, 46.65, 45.18, 43.86, 42.72, 41.76, 41.00, 40.45, 40.11, 40.00, 40.11, 40.45, 41.00, 41.76, // 104
+  43.05, 43.01, 43.19, 43.57, 44.15, 44.92, 45.88, 47.01, 48.30, 49.73, 50.52, 51.47, 52.57, 53.82, 55.21, 56.72, 58.34, 60.08, 61.90, 63.82, 65.82, 67.89, 70.03, 72.23, 74.49, 76.79, 79.15, 81.54, 83.98, 86.45, 88.95, 91.48, 94.04, 96.63, 99.24, 99.56, 99.34, 99.22, 99.19, 99.25, 99.40, 99.64, 99.97, 100.39, 100.89, 101.49, 102.16, 102.92, 103.76, 104.68, 105.68, 106.75, 107.17, 107.24, 107.40, 107.64, 107.96, 108.37, 108.86, 109.42, 110.07, 110.79, 111.59, 112.47, 113.41, 114.16, 113.23, 112.36, 111.57, 110.86, 110.22, 109.66, 109.18, 108.78, 108.46, 108.23, 108.07, 108.00, 108.02, 108.12, 108.30, 108.56, 108.90, 109.33, 109.84, 110.42, 111.09, 110.84, 109.16, 107.54, 105.99, 104.49, 103.06, 101.70, 99.74, 97.05, 94.37, 91.71, 89.07, 86.45, 83.86, 81.30, 78.77, 76.28, 73.82, 71.40, 69.03, 66.71, 64.44, 62.24, 60.11, 58.05, 56.08, 54.20, 52.43, 50.77, 49.24, 47.85, 46.62, 45.54, 44.64, 43.93, 43.42, 43.10, 43.00, 43.10, 43.42, 43.93, 44.64, // 105
+  46.04, 46.01, 46.17, 46.53, 47.07, 47.80, 48.70, 49.77, 50.99, 52.35, 53.39, 54.30, 55.34, 56.53, 57.85, 59.30, 60.85, 62.52, 64.27, 66.12, 68.05, 70.06, 72.13, 74.27, 76.47, 78.72, 81.01, 83.36, 85.74, 88.16, 90.62, 93.10, 95.62, 98.17, 100.73, 102.55, 102.34, 102.22, 102.19, 102.25, 102.39, 102.63, 102.95, 103.35, 103.85, 104.42, 105.08, 105.82, 106.64, 107.53, 108.50, 109.55, 110.17, 110.24, 110.39, 110.63, 110.94, 111.34, 111.81, 112.36, 112.99, 113.70, 114.48, 115.33, 116.25, 117.00, 116.09, 115.25, 114.48, 113.78, 113.16, 112.61, 112.15, 111.76, 111.45, 111.22, 111.07, 111.00, 111.02, 111.11, 111.29, 111.54, 111.88, 112.29, 112.79, 113.36, 114.00, 113.32, 111.68, 110.10, 108.58, 107.12, 105.73, 103.75, 101.07, 98.41, 95.77, 93.15, 90.55, 87.98, 85.44, 82.93, 80.45, 78.01, 75.60, 73.25, 70.94, 68.68, 66.48, 64.35, 62.29, 60.31, 58.41, 56.61, 54.92, 53.34, 51.88, 50.57, 49.40, 48.38, 47.54, 46.87, 46.39, 46.10, 46.00, 46.10, 46.39, 46.87, 47.54, // 106
+  49.04, 49.01, 49.16, 49.50, 50.01, 50.70, 51.55, 52.55, 53.71, 55.01, 56.29, 57.14, 58.14, 59.27, 60.53, 61.91, 63.40, 65.00, 66.69, 68.48, 70.34, 72.29, 74.30, 76.38, 78.51, 80.71, 82.95, 85.24, 87.57, 89.94, 92.35, 94.79, 97.27, 99.77, 102.30, 104.85, 105.34, 105.22, 105.19, 105.25, 105.39, 105.62, 105.93, 106.32, 106.80, 107.36, 108.00, 108.72, 109.51, 110.39, 111.33, 112.35, 113.17, 113.24, 113.39, 113.61, 113.92, 114.31, 114.77, 115.31, 115.92, 116.61, 117.37, 118.20, 119.10, 119.85, 118.96, 118.14, 117.39, 116.71, 116.10, 115.57, 115.12, 114.74, 114.44, 114.21, 114.07, 114.00, 114.02, 114.11, 114.28, 114.53, 114.86, 115.26, 115.74, 116.30, 116.93, 115.83, 114.22, 112.68, 111.19, 109.77, 107.78, 105.12, 102.47, 99.85, 97.25, 94.67, 92.11, 89.59, 87.09, 84.63, 82.20, 79.81, 77.47, 75.17, 72.92, 70.72, 68.59, 66.53, 64.54, 62.63, 60.80, 59.08, 57.45, 55.95, 54.56, 53.31, 52.20, 51.24, 50.45, 49.82, 49.37, 49.09, 49.00, 49.09, 49.37, 49.82, 50.45, // 107
+  52.04, 52.01, 52.15, 52.47, 52.95, 53.60, 54.41, 55.36, 56.46, 57.70, 59.06, 60.00, 60.95, 62.03, 63.24, 64.56, 65.99, 67.53, 69.16, 70.88, 72.69, 74.57, 76.52, 78.54, 80.62, 82.75, 84.94, 87.18, 89.46, 91.78, 94.15, 96.54, 98.97, 101.43, 103.92, 106.44, 108.33, 108.22, 108.19, 108.25, 108.38, 108.60, 108.91, 109.29, 109.76, 110.30, 110.92, 111.62, 112.40, 113.25, 114.17, 115.16, 116.17, 116.23, 116.38, 116.60, 116.90, 117.28, 117.73, 118.25, 118.85, 119.52, 120.26, 121.07, 121.95, 122.71, 121.84, 121.04, 120.30, 119.64, 119.05, 118.53, 118.09, 117.72, 117.43, 117.21, 117.07, 117.00, 117.02, 117.11, 117.27, 117.52, 117.83, 118.23, 118.70, 119.24, 119.85, 118.36, 116.79, 115.28, 113.83, 111.83, 109.18, 106.55, 103.94, 101.36, 98.79, 96.25, 93.74, 91.26, 88.81, 86.40, 84.02, 81.69, 79.40, 77.16, 74.97, 72.84, 70.77, 68.77, 66.84, 65.00, 63.25, 61.59, 60.03, 58.59, 57.27, 56.08, 55.03, 54.12, 53.37, 52.77, 52.35, 52.09, 52.00, 52.09, 52.35, 52.77, 53.37, // 108
+  55.04, 55.01, 55.15, 55.44, 55.90, 56.52, 57.28, 58.19, 59.24, 60.42, 61.72, 62.87, 63.78, 64.82, 65.97, 67.24, 68.62, 70.09, 71.67, 73.33, 75.08, 76.90, 78.79, 80.76, 82.78, 84.86, 87.00, 89.18, 91.41, 93.69, 96.00, 98.35, 100.74, 103.16, 105.61, 108.08, 110.58, 111.22, 111.19, 111.24, 111.38, 111.59, 111.89, 112.26, 112.71, 113.24, 113.85, 114.53, 115.29, 116.12, 117.02, 117.99, 119.02, 119.23, 119.37, 119.59, 119.88, 120.25, 120.69, 121.20, 121.78, 122.44, 123.16, 123.95, 124.81, 125.57, 124.72, 123.94, 123.22, 122.58, 122.00, 121.49, 121.06, 120.70, 120.42, 120.20, 120.07, 120.00, 120.02, 120.10, 120.27, 120.50, 120.81, 121.20, 121.66, 122.18, 122.50, 120.91, 119.37, 117.90, 115.88, 113.25, 110.64, 108.05, 105.48, 102.93, 100.40, 97.91, 95.44, 93.01, 90.60, 88.24, 85.91, 83.63, 81.39, 79.21, 77.08, 75.01, 73.00, 71.06, 69.20, 67.42, 65.73, 64.14, 62.65, 61.27, 60.01, 58.87, 57.87, 57.01, 56.29, 55.73, 55.33, 55.08, 55.00, 55.08, 55.33, 55.73, 56.29, // 109
+  58.03, 58.01, 58.14, 58.42, 58.86, 59.44, 60.17, 61.03, 62.03, 63.16, 64.40, 65.76, 66.63, 67.62, 68.73, 69.94, 71.27, 72.69, 74.21, 75.82, 77.51, 79.27, 81.11, 83.02, 84.99, 87.02, 89.10, 91.24, 93.42, 95.65, 97.92, 100.22, 102.57, 104.94, 107.35, 109.78, 112.25, 114.22, 114.19, 114.24, 114.37, 114.58, 114.87, 115.23, 115.67, 116.19, 116.78, 117.45, 118.19, 118.99, 119.87, 120.82, 121.83, 122.23, 122.37, 122.58, 122.86, 123.22, 123.65, 124.15, 124.72, 125.36, 126.07, 126.84, 127.68, 128.44, 127.61, 126.85, 126.15, 125.51, 124.95, 124.46, 124.04, 123.69, 123.41, 123.20, 123.07, 123.00, 123.02, 123.10, 123.26, 123.49, 123.79, 124.17, 124.62, 125.13, 125.03, 123.48, 121.98, 119.95, 117.34, 114.74, 112.16, 109.60, 107.07, 104.56, 102.08, 99.62, 97.20, 94.81, 92.46, 90.14, 87.86, 85.63, 83.45, 81.32, 79.25, 77.23, 75.29, 73.41, 71.61, 69.89, 68.26, 66.73, 65.30, 63.98, 62.77, 61.68, 60.73, 59.91, 59.23, 58.69, 58.31, 58.08, 58.00, 58.08, 58.31, 58.69, 59.23, // 110
+  61.03, 61.01, 61.13, 61.40, 61.81, 62.37, 63.06, 63.89, 64.85, 65.92, 67.12, 68.43, 69.49, 70.44, 71.50, 72.67, 73.95, 75.32, 76.79, 78.34, 79.98, 81.69, 83.48, 85.33, 87.25, 89.23, 91.26, 93.35, 95.48, 97.66, 99.88, 102.15, 104.44, 106.78, 109.15, 111.54, 113.97, 116.42, 117.19, 117.24, 117.37, 117.57, 117.85, 118.21, 118.64, 119.14, 119.72, 120.37, 121.09, 121.88, 122.73, 123.66, 124.65, 125.23, 125.36, 125.57, 125.85, 126.20, 126.62, 127.10, 127.66, 128.28, 128.98, 129.73, 130.55, 131.32, 130.51, 129.76, 129.07, 128.46, 127.91, 127.42, 127.01, 126.67, 126.40, 126.19, 126.06, 126.00, 126.02, 126.10, 126.25, 126.48, 126.78, 127.14, 127.58, 128.08, 127.59, 126.07, 124.04, 121.43, 118.85, 116.28, 113.74, 111.22, 108.72, 106.25, 103.81, 101.40, 99.02, 96.67, 94.37, 92.10, 89.87, 87.69, 85.56, 83.49, 81.47, 79.51, 77.62, 75.80, 74.06, 72.40, 70.83, 69.35, 67.98, 66.71, 65.55, 64.51, 63.60, 62.82, 62.17, 61.66, 61.29, 61.07, 61.00, 61.07, 61.29, 61.66, 62.17, // 111
+  64.03, 64.01, 64.12, 64.38, 64.78, 65.31, 65.97, 66.76, 67.68, 68.71, 69.86, 71.11, 72.36, 73.27, 74.29, 75.42, 76.65, 77.98, 79.39, 80.90, 82.48, 84.15, 85.88, 87.68, 89.55, 91.48, 93.46, 95.50, 97.59, 99.72, 101.90, 104.12, 106.38, 108.67, 110.99, 113.35, 115.74, 118.16, 120.19, 120.24, 120.36, 120.56, 120.84, 121.18, 121.60, 122.09, 122.66, 123.29, 123.99, 124.76, 125.60, 126.51, 127.47, 128.23, 128.36, 128.56, 128.83, 129.17, 129.58, 130.06, 130.60, 131.21, 131.89, 132.63, 133.43, 134.20, 133.41, 132.67, 132.00, 131.40, 130.86, 130.39, 129.99, 129.65, 129.39, 129.19, 129.06, 129.00, 129.02, 129.10, 129.25, 129.47, 129.76, 130.12, 130.54, 131.03, 130.17, 128.13, 125.54, 122.97, 120.42, 117.89, 115.38, 112.89, 110.44, 108.00, 105.60, 103.23, 100.90, 98.60, 96.33, 94.11, 91.93, 89.81, 87.73, 85.70, 83.74, 81.84, 80.00, 78.24, 76.55, 74.95, 73.43, 72.01, 70.68, 69.46, 68.35, 67.36, 66.48, 65.73, 65.12, 64.63, 64.28, 64.07, 64.00, 64.07, 64.28, 64.63, 65.12, // 112
+  67.03, 67.01, 67.12, 67.36, 67.74, 68.25, 68.88, 69.64, 70.52, 71.51, 72.62, 73.82, 75.13, 76.11, 77.10, 78.19, 79.38, 80.66, 82.03, 83.48, 85.02, 86.63, 88.32, 90.08, 91.89, 93.77, 95.71, 97.70, 99.74, 101.83, 103.96, 106.14, 108.35, 110.61, 112.89, 115.21, 117.56, 119.94, 122.35, 123.24, 123.36, 123.55, 123.82, 124.16, 124.57, 125.05, 125.60, 126.22, 126.90, 127.66, 128.48, 129.36, 130.31, 131.23, 131.35, 131.55, 131.82, 132.15, 132.55, 133.02, 133.55, 134.14, 134.81, 135.53, 136.32, 137.09, 136.31, 135.59, 134.94, 134.35, 133.82, 133.36, 132.97, 132.64, 132.38, 132.19, 132.06, 132.00, 132.02, 132.09, 132.24, 132.46, 132.74, 133.09, 133.51, 133.99, 132.23, 129.65, 127.09, 124.56, 122.04, 119.54, 117.07, 114.62, 112.20, 109.81, 107.45, 105.12, 102.83, 100.57, 98.35, 96.18, 94.05, 91.97, 89.94, 87.97, 86.05, 84.20, 82.42, 80.71, 79.08, 77.52, 76.06, 74.69, 73.41, 72.24, 71.17, 70.21, 69.38, 68.66, 68.07, 67.60, 67.27, 67.07, 67.00, 67.07, 67.27, 67.60, 68.07, // 113
+  70.03, 70.01, 70.11, 70.35, 70.71, 71.20, 71.81, 72.53, 73.38, 74.33, 75.39, 76.56, 77.82, 78.97, 79.92, 80.97, 82.12, 83.36, 84.68, 86.10, 87.59, 89.15, 90.79, 92.50, 94.27, 96.11, 98.00, 99.94, 101.94, 103.98, 106.07, 108.21, 110.38, 112.59, 114.84, 117.12, 119.43, 121.77, 124.14, 126.24, 126.36, 126.54, 126.80, 127.13, 127.53, 128.00, 128.54, 129.15, 129.82, 130.55, 131.35, 132.22, 133.15, 134.13, 134.35, 134.54, 134.80, 135.13, 135.52, 135.97, 136.50, 137.08, 137.73, 138.44, 139.21, 139.98, 139.22, 138.51, 137.87, 137.30, 136.78, 136.33, 135.94, 135.62, 135.37, 135.18, 135.06, 135.00, 135.01, 135.09, 135.24, 135.45, 135.72, 136.07, 136.47, 136.34, 133.78, 131.23, 128.70, 126.19, 123.71, 121.25, 118.81, 116.40, 114.02, 111.66, 109.34, 107.06, 104.80, 102.59, 100.42, 98.29, 96.21, 94.18, 92.20, 90.27, 88.41, 86.61, 84.88, 83.22, 81.63, 80.13, 78.71, 77.39, 76.16, 75.03, 74.00, 73.08, 72.28, 71.59, 71.02, 70.58, 70.26, 70.06, 70.00, 70.06, 70.26, 70.58, 71.02, // 114
+  73.03, 73.01, 73.11, 73.33, 73.68, 74.15, 74.73, 75.43, 76.24, 77.16, 78.19, 79.31, 80.53, 81.84, 82.76, 83.77, 84.88, 86.08, 87.36, 88.73, 90.18, 91.70, 93.30, 94.96, 96.69, 98.48, 100.32, 102.22, 104.18, 106.18, 108.23, 110.32, 112.45, 114.62, 116.83, 119.07, 121.35, 123.65, 125.99, 128.35, 129.35, 129.54, 129.79, 130.11, 130.50, 130.96, 131.49, 132.08, 132.73, 133.46, 134.24, 135.08, 135.99, 136.96, 137.35, 137.53, 137.79, 138.11, 138.49, 138.94, 139.44, 140.02, 140.65, 141.34, 142.10, 142.87, 142.13, 141.44, 140.81, 140.25, 139.74, 139.30, 138.92, 138.61, 138.36, 138.18, 138.06, 138.00, 138.01, 138.09, 138.23, 138.44, 138.71, 139.04, 139.44, 137.91, 135.37, 132.85, 130.36, 127.88, 125.43, 123.00, 120.60, 118.23, 115.88, 113.57, 111.29, 109.04, 106.83, 104.66, 102.53, 100.45, 98.41, 96.43, 94.49, 92.62, 90.80, 89.05, 87.37, 85.76, 84.22, 82.76, 81.39, 80.11, 78.92, 77.83, 76.84, 75.96, 75.19, 74.53, 73.98, 73.55, 73.25, 73.06, 73.00, 73.06, 73.25, 73.55, 73.98, // 115
+  76.03, 76.01, 76.11, 76.32, 76.66, 77.10, 77.67, 78.34, 79.12, 80.01, 80.99, 82.08, 83.26, 84.53, 85.60, 86.58, 87.66, 88.82, 90.06, 91.39, 92.80, 94.28, 95.83, 97.45, 99.13, 100.88, 102.68, 104.54, 106.45, 108.41, 110.42, 112.47, 114.56, 116.69, 118.86, 121.07, 123.30, 125.57, 127.87, 130.20, 132.35, 132.53, 132.78, 133.09, 133.47, 133.92, 134.44, 135.01, 135.66, 136.36, 137.13, 137.96, 138.84, 139.79, 140.34, 140.53, 140.77, 141.09, 141.46, 141.90, 142.40, 142.96, 143.58, 144.26, 145.00, 145.77, 145.04, 144.37, 143.75, 143.20, 142.71, 142.27, 141.90, 141.60, 141.35, 141.17, 141.06, 141.00, 141.01, 141.09, 141.23, 141.43, 141.69, 142.02, 142.04, 139.52, 137.01, 134.53, 132.06, 129.62, 127.20, 124.81, 122.44, 120.10, 117.80, 115.52, 113.28, 111.07, 108.90, 106.78, 104.69, 102.65, 100.66, 98.72, 96.83, 95.00, 93.23, 91.53, 89.89, 88.32, 86.83, 85.42, 84.10, 82.86, 81.71, 80.65, 79.70, 78.85, 78.10, 77.47, 76.94, 76.53, 76.24, 76.06, 76.00, 76.06, 76.24, 76.53, 76.94, // 116
+  79.03, 79.01, 79.10, 79.31, 79.63, 80.06, 80.60, 81.25, 82.01, 82.86, 83.82, 84.86, 86.01, 87.24, 88.46, 89.41, 90.45, 91.57, 92.78, 94.07, 95.44, 96.88, 98.39, 99.97, 101.61, 103.31, 105.08, 106.89, 108.76, 110.68, 112.64, 114.66, 116.71, 118.80, 120.93, 123.10, 125.30, 127.54, 129.80, 132.10, 134.42, 135.52, 135.76, 136.07, 136.45, 136.88, 137.39, 137.95, 138.58, 139.27, 140.02, 140.83, 141.70, 142.63, 143.34, 143.52, 143.76, 144.07, 144.43, 144.86, 145.35, 145.90, 146.51, 147.17, 147.90, 148.68, 147.96, 147.30, 146.70, 146.15, 145.67, 145.25, 144.89, 144.59, 144.35, 144.17, 144.06, 144.00, 144.01, 144.09, 144.22, 144.42, 144.68, 145.00, 143.67, 141.17, 138.70, 136.24, 133.81, 131.40, 129.02, 126.66, 124.33, 122.02, 119.75, 117.52, 115.31, 113.15, 111.02, 108.93, 106.89, 104.89, 102.94, 101.04, 99.20, 97.42, 95.69, 94.03, 92.44, 90.92, 89.47, 88.10, 86.82, 85.62, 84.50, 83.49, 82.57, 81.74, 81.02, 80.41, 79.91, 79.51, 79.23, 79.06, 79.00, 79.06, 79.23, 79.51, 79.91, // 117
+  82.02, 82.01, 82.10, 82.30, 82.61, 83.02, 83.55, 84.17, 84.90, 85.73, 86.65, 87.66, 88.77, 89.96, 91.24, 92.24, 93.25, 94.34, 95.52, 96.77, 98.10, 99.50, 100.97, 102.51, 104.11, 105.78, 107.50, 109.27, 111.10, 112.98, 114.91, 116.88, 118.89, 120.95, 123.04, 125.18, 127.34, 129.54, 131.77, 134.03, 136.32, 138.51, 138.75, 139.05, 139.42, 139.85, 140.34, 140.89, 141.51, 142.19, 142.92, 143.72, 144.57, 145.48, 146.33, 146.51, 146.75, 147.05, 147.41, 147.83, 148.31, 148.84, 149.44, 150.09, 150.80, 151.57, 150.88, 150.23, 149.64, 149.11, 148.64, 148.22, 147.87, 147.57, 147.34, 147.17, 147.05, 147.00, 147.01, 147.09, 147.22, 147.41, 147.67, 147.83, 145.34, 142.87, 140.43, 138.00, 135.60, 133.23, 130.87, 128.55, 126.25, 123.99, 121.75, 119.55, 117.39, 115.26, 113.17, 111.13, 109.12, 107.17, 105.26, 103.41, 101.61, 99.86, 98.18, 96.57, 95.02, 93.54, 92.13, 90.80, 89.55, 88.39, 87.32, 86.33, 85.44, 84.65, 83.95, 83.36, 82.87, 82.49, 82.22, 82.05, 82.00, 82.05, 82.22, 82.49, 82.87, // 118
+  85.02, 85.01, 85.09, 85.29, 85.59, 85.99, 86.49, 87.10, 87.80, 88.60, 89.49, 90.48, 91.55, 92.70, 93.94, 95.09, 96.07, 97.13, 98.27, 99.49, 100.78, 102.15, 103.58, 105.08, 106.64, 108.27, 109.95, 111.69, 113.48, 115.32, 117.20, 119.14, 121.12, 123.13, 125.19, 127.29, 129.42, 131.58, 133.78, 136.01, 138.26, 140.55, 141.74, 142.03, 142.39, 142.81, 143.29, 143.84, 144.44, 145.10, 145.82, 146.60, 147.44, 148.33, 149.28, 149.50, 149.74, 150.03, 150.38, 150.79, 151.26, 151.79, 152.38, 153.02, 153.71, 154.47, 153.81, 153.17, 152.59, 152.07, 151.60, 151.20, 150.85, 150.56, 150.33, 150.16, 150.05, 150.00, 150.01, 150.08, 150.21, 150.40, 150.65, 149.51, 147.05, 144.62, 142.20, 139.81, 137.44, 135.09, 132.77, 130.48, 128.22, 125.99, 123.79, 121.63, 119.50, 117.41, 115.36, 113.36, 111.40, 109.48, 107.62, 105.80, 104.04, 102.34, 100.70, 99.13, 97.62, 96.18, 94.81, 93.52, 92.31, 91.18, 90.14, 89.19, 88.32, 87.56, 86.88, 86.31, 85.84, 85.48, 85.21, 85.05, 85.00, 85.05, 85.21, 85.48, 85.84, // 119
+  88.02, 88.01, 88.09, 88.28, 88.57, 88.96, 89.44, 90.03, 90.71, 91.48, 92.35, 93.30, 94.34, 95.46, 96.66, 97.94, 98.89, 99.92, 101.03, 102.22, 103.48, 104.81, 106.21, 107.67, 109.20, 110.78, 112.43, 114.13, 115.88, 117.68, 119.53, 121.43, 123.37, 125.35, 127.37, 129.43, 131.53, 133.66, 135.82, 138.02, 140.24, 142.50, 144.73, 145.02, 145.37, 145.78, 146.25, 146.78, 147.37, 148.02, 148.73, 149.49, 150.31, 151.19, 152.12, 152.50, 152.73, 153.01, 153.36, 153.76, 154.22, 154.74, 155.31, 155.94, 156.63, 157.37, 156.73, 156.11, 155.54, 155.03, 154.57, 154.18, 153.83, 153.55, 153.33, 153.16, 153.05, 153.00, 153.01, 153.08, 153.21, 153.39, 153.64, 151.24, 148.81, 146.40, 144.01, 141.65, 139.31, 137.00, 134.71, 132.46, 130.23, 128.04, 125.87, 123.75, 121.66, 119.60, 117.59, 115.62, 113.70, 111.83, 110.00, 108.23, 106.51, 104.85, 103.25, 101.71, 100.24, 98.84, 97.51, 96.25, 95.08, 93.98, 92.97, 92.05, 91.21, 90.47, 89.82, 89.27, 88.81, 88.46, 88.20, 88.05, 88.00, 88.05, 88.20, 88.46, 88.81, // 120
+  91.02, 91.01, 91.09, 91.27, 91.55, 91.92, 92.40, 92.96, 93.62, 94.37, 95.21, 96.14, 97.14, 98.23, 99.40, 100.65, 101.73, 102.73, 103.81, 104.97, 106.19, 107.49, 108.85, 110.28, 111.77, 113.32, 114.93, 116.59, 118.31, 120.07, 121.89, 123.75, 125.65, 127.60, 129.59, 131.61, 133.68, 135.77, 137.90, 140.06, 142.26, 144.48, 146.73, 148.00, 148.34, 148.75, 149.21, 149.73, 150.31, 150.95, 151.64, 152.39, 153.19, 154.05, 154.97, 155.49, 155.72, 156.00, 156.34, 156.73, 157.18, 157.69, 158.25, 158.87, 159.54, 160.27, 159.66, 159.05, 158.49, 157.99, 157.54, 157.15, 156.82, 156.54, 156.32, 156.16, 156.05, 156.00, 156.01, 156.08, 156.20, 156.39, 155.43, 153.00, 150.60, 148.22, 145.87, 143.53, 141.23, 138.95, 136.69, 134.47, 132.28, 130.12, 127.99, 125.90, 123.84, 121.83, 119.85, 117.92, 116.04, 114.20, 112.41, 110.68, 109.00, 107.38, 105.82, 104.32, 102.88, 101.52, 100.22, 99.01, 97.86, 96.80, 95.82, 94.92, 94.11, 93.39, 92.76, 92.23, 91.79, 91.44, 91.20, 91.05, 91.00, 91.05, 91.20, 91.44, 91.79, // 121
+  94.02, 94.01, 94.09, 94.26, 94.53, 94.89, 95.35, 95.90, 96.54, 97.27, 98.08, 98.98, 99.96, 101.02, 102.16, 103.37, 104.57, 105.55, 106.60, 107.73, 108.92, 110.19, 111.52, 112.91, 114.37, 115.88, 117.46, 119.08, 120.76, 122.49, 124.27, 126.10, 127.97, 129.88, 131.83, 133.83, 135.85, 137.92, 140.02, 142.15, 144.31, 146.50, 148.72, 150.96, 151.32, 151.72, 152.17, 152.68, 153.25, 153.87, 154.55, 155.29, 156.08, 156.92, 157.82, 158.48, 158.70, 158.98, 159.31, 159.70, 160.15, 160.64, 161.20, 161.80, 162.46, 163.17, 162.59, 161.99, 161.45, 160.95, 160.51, 160.13, 159.80, 159.53, 159.31, 159.15, 159.05, 159.00, 159.01, 159.08, 159.20, 159.38, 157.20, 154.81, 152.43, 150.08, 147.76, 145.45, 143.18, 140.93, 138.71, 136.52, 134.36, 132.23, 130.14, 128.08, 126.06, 124.08, 122.15, 120.25, 118.41, 116.61, 114.86, 113.16, 111.52, 109.93, 108.41, 106.94, 105.55, 104.22, 102.96, 101.77, 100.66, 99.62, 98.67, 97.80, 97.02, 96.32, 95.71, 95.19, 94.76, 94.43, 94.19, 94.05, 94.00, 94.05, 94.19, 94.43, 94.76, // 122
+  97.02, 97.01, 97.08, 97.25, 97.51, 97.87, 98.31, 98.84, 99.46, 100.17, 100.96, 101.83, 102.79, 103.82, 104.92, 106.10, 107.35, 108.38, 109.40, 110.50, 111.66, 112.90, 114.20, 115.56, 116.98, 118.47, 120.00, 121.60, 123.24, 124.94, 126.68, 128.48, 130.31, 132.19, 134.11, 136.07, 138.06, 140.09, 142.16, 144.26, 146.39, 148.55, 150.74, 152.95, 154.30, 154.69, 155.13, 155.63, 156.19, 156.80, 157.47, 158.19, 158.97, 159.80, 160.68, 161.48, 161.69, 161.97, 162.29, 162.67, 163.11, 163.60, 164.14, 164.74, 165.38, 166.08, 165.53, 164.94, 164.40, 163.92, 163.49, 163.11, 162.79, 162.52, 162.31, 162.15, 162.05, 162.00, 162.01, 162.08, 162.20, 161.40, 159.01, 156.65, 154.30, 151.98, 149.68, 147.41, 145.17, 142.95, 140.76, 138.60, 136.47, 134.38, 132.32, 130.30, 128.32, 126.37, 124.47, 122.61, 120.80, 119.04, 117.32, 115.66, 114.06, 112.51, 111.02, 109.59, 108.23, 106.93, 105.70, 104.55, 103.46, 102.46, 101.53, 100.69, 99.92, 99.25, 98.66, 98.15, 97.74, 97.42, 97.19, 97.05, 97.00, 97.05, 97.19, 97.42, 97.74, // 123
+  100.02, 100.00, 100.08, 100.24, 100.50, 100.84, 101.27, 101.79, 102.39, 103.08, 103.85, 104.69, 105.62, 106.63, 107.70, 108.85, 110.07, 111.22, 112.21, 113.28, 114.42, 115.62, 116.89, 118.22, 119.62, 121.07, 122.57, 124.13, 125.75, 127.41, 129.12, 130.88, 132.68, 134.53, 136.41, 138.34, 140.30, 142.30, 144.33, 146.40, 148.50, 150.63, 152.79, 154.98, 157.19, 157.66, 158.10, 158.59, 159.13, 159.74, 160.39, 161.10, 161.86, 162.67, 163.54, 164.45, 164.69, 164.95, 165.27, 165.65, 166.07, 166.55, 167.09, 167.67, 168.31, 169.00, 168.47, 167.89, 167.36, 166.88, 166.46, 166.09, 165.77, 165.51, 165.30, 165.15, 165.05, 165.00, 165.01, 165.08, 165.19, 163.22, 160.86, 158.52, 156.20, 153.91, 151.64, 149.40, 147.19, 145.00, 142.84, 140.72, 138.62, 136.56, 134.54, 132.55, 130.60, 128.69, 126.82, 125.00, 123.22, 121.49, 119.82, 118.19, 116.62, 115.10, 113.65, 112.25, 110.92, 109.66, 108.46, 107.34, 106.28, 105.30, 104.40, 103.58, 102.84, 102.18, 101.61, 101.12, 100.72, 100.40, 100.18, 100.04, 100.00, 100.04, 100.18, 100.40, 100.72, // 124
+  103.02, 103.00, 103.08, 103.24, 103.48, 103.82, 104.24, 104.74, 105.32, 105.99, 106.74, 107.56, 108.47, 109.44, 110.49, 111.62, 112.81, 114.06, 115.03, 116.08, 117.19, 118.36, 119.60, 120.91, 122.27, 123.69, 125.16, 126.69, 128.27, 129.90, 131.58, 133.30, 135.07, 136.89, 138.74, 140.64, 142.57, 144.53, 146.54, 148.57, 150.64, 152.74, 154.87, 157.03, 159.22, 160.63, 161.06, 161.54, 162.08, 162.67, 163.31, 164.01, 164.76, 165.56, 166.41, 167.30, 167.68, 167.94, 168.25, 168.62, 169.04, 169.51, 170.04, 170.61, 171.24, 171.91, 171.41, 170.84, 170.32, 169.85, 169.43, 169.07, 168.76, 168.50, 168.30, 168.15, 168.05, 168.00, 168.01, 168.07, 167.43, 165.08, 162.74, 160.43, 158.14, 155.88, 153.64, 151.43, 149.24, 147.09, 144.96, 142.86, 140.80, 138.77, 136.78, 134.83, 132.91, 131.03, 129.20, 127.41, 125.67, 123.98, 122.33, 120.74, 119.20, 117.72, 116.30, 114.93, 113.64, 112.40, 111.23, 110.14, 109.11, 108.16, 107.28, 106.48, 105.76, 105.12, 104.56, 104.09, 103.70, 103.39, 103.17, 103.04, 103.00, 103.04, 103.17, 103.39, 103.70, // 125
+  106.02, 106.00, 106.08, 106.23, 106.47, 106.79, 107.20, 107.69, 108.26, 108.91, 109.64, 110.44, 111.32, 112.27, 113.30, 114.39, 115.55, 116.78, 117.86, 118.88, 119.97, 121.12, 122.33, 123.60, 124.93, 126.32, 127.77, 129.26, 130.81, 132.41, 134.06, 135.75, 137.49, 139.27, 141.10, 142.96, 144.86, 146.80, 148.77, 150.78, 152.81, 154.89, 156.99, 159.11, 161.27, 163.45, 164.03, 164.50, 165.03, 165.61, 166.24, 166.92, 167.66, 168.44, 169.28, 170.16, 170.67, 170.92, 171.23, 171.59, 172.01, 172.47, 172.99, 173.55, 174.17, 174.83, 174.35, 173.79, 173.28, 172.82, 172.41, 172.05, 171.75, 171.49, 171.29, 171.14, 171.05, 171.00, 171.01, 171.07, 169.29, 166.96, 164.66, 162.37, 160.11, 157.88, 155.67, 153.48, 151.33, 149.20, 147.11, 145.04, 143.01, 141.01, 139.05, 137.13, 135.25, 133.41, 131.61, 129.85, 128.14, 126.48, 124.87, 123.31, 121.80, 120.35, 118.96, 117.63, 116.36, 115.16, 114.02, 112.95, 111.95, 111.02, 110.16, 109.38, 108.68, 108.06, 107.52, 107.06, 106.68, 106.38, 106.17, 106.04, 106.00, 106.04, 106.17, 106.38, 106.68, // 126
+  109.02, 109.00, 109.07, 109.22, 109.46, 109.77, 110.17, 110.64, 111.20, 111.83, 112.54, 113.32, 114.18, 115.11, 116.11, 117.18, 118.31, 119.51, 120.70, 121.70, 122.76, 123.88, 125.06, 126.31, 127.61, 128.97, 130.39, 131.86, 133.38, 134.95, 136.56, 138.23, 139.93, 141.68, 143.48, 145.31, 147.18, 149.09, 151.03, 153.00, 155.01, 157.06, 159.13, 161.23, 163.36, 165.51, 166.99, 167.46, 167.98, 168.55, 169.17, 169.84, 170.56, 171.33, 172.15, 173.02, 173.66, 173.91, 174.21, 174.57, 174.98, 175.43, 175.94, 176.49, 177.10, 177.75, 177.29, 176.74, 176.24, 175.79, 175.39, 175.03, 174.73, 174.48, 174.29, 174.14, 174.05, 174.00, 174.01, 173.51, 171.19, 168.88, 166.60, 164.35, 162.11, 159.91, 157.72, 155.57, 153.44, 151.35, 149.28, 147.25, 145.25, 143.28, 141.35, 139.46, 137.61, 135.80, 134.03, 132.31, 130.63, 129.00, 127.42, 125.90, 124.42, 123.00, 121.64, 120.34, 119.10, 117.92, 116.81, 115.77, 114.79, 113.89, 113.05, 112.29, 111.61, 111.00, 110.48, 110.03, 109.66, 109.37, 109.17, 109.04, 109.00, 109.04, 109.17, 109.37, 109.66, // 127
+  112.02, 112.00, 112.07, 112.22, 112.45, 112.75, 113.14, 113.60, 114.14, 114.76, 115.45, 116.21, 117.05, 117.95, 118.93, 119.97, 121.08, 122.25, 123.48, 124.52, 125.56, 126.65, 127.81, 129.03, 130.31, 131.64, 133.03, 134.47, 135.96, 137.50, 139.08, 140.72, 142.39, 144.12, 145.88, 147.68, 149.52, 151.40, 153.31, 155.26, 157.24, 159.25, 161.30, 163.37, 165.47, 167.60, 169.75, 170.42, 170.93, 171.49, 172.10, 172.76, 173.47, 174.23, 175.03, 175.89, 176.65, 176.90, 177.20, 177.55, 177.94, 178.39, 178.89, 179.44, 180.03, 180.68, 180.24, 179.69, 179.20, 178.76, 178.36, 178.02, 177.72, 177.48, 177.28, 177.14, 177.05, 177.00, 177.01, 175.41, 173.11, 170.84, 168.58, 166.35, 164.15, 161.97, 159.81, 157.69, 155.59, 153.52, 151.49, 149.48, 147.51, 145.58, 143.68, 141.82, 140.00, 138.22, 136.48, 134.79, 133.15, 131.55, 130.00, 128.50, 127.06, 125.67, 124.34, 123.07, 121.85, 120.70, 119.62, 118.60, 117.64, 116.76, 115.95, 115.21, 114.54, 113.95, 113.44, 113.00, 112.64, 112.36, 112.16, 112.04, 112.00, 112.04, 112.16, 112.36, 112.64, // 128
+]);
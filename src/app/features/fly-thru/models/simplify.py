@@ -0,0 +1,288 @@
+# Copyright (c) 2025-2026 Gene Ressler
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Level of detail chains by quadric error metric half-edge collapse after Garland and
+Heckbert, "Surface Simplification Using Quadric Error Metrics."
+
+Collapses move one position onto a neighbor, so every level indexes the original vertex
+buffer. A vertex buffer entry (quad) is a wedge: one position with one set of attributes.
+Positions with several wedges lie on normal or material seams. A collapse must map each
+wedge of the removed position to a single wedge of the kept one through the triangles
+they share, which keeps seams intact and lets them shorten only along themselves.
+"""
+
+import heapq
+import math
+
+# Weight of the planes that hold open borders in place, relative to surface planes.
+BORDER_WEIGHT = 10.0
+# Used to find the distance where a level's error projects to LOD_PIXEL_ERROR pixels.
+# Matches the fly-thru projection in viewport.service.ts.
+LOD_FOV_Y_DEGREES = 45
+LOD_SCREEN_HEIGHT = 1080
+LOD_PIXEL_ERROR = 1.0
+# Far clipping distance in viewport.service.ts. Coarser levels would never be seen.
+LOD_MAX_DISTANCE = 400
+
+
+def sub(a, b):
+    return (a[0] - b[0], a[1] - b[1], a[2] - b[2])
+
+
+def cross(a, b):
+    return (
+        a[1] * b[2] - a[2] * b[1],
+        a[2] * b[0] - a[0] * b[2],
+        a[0] * b[1] - a[1] * b[0],
+    )
+
+
+def dot(a, b):
+    return a[0] * b[0] + a[1] * b[1] + a[2] * b[2]
+
+
+def planeQuadric(n, p, weight=1.0):
+    """Quadric of squared distance to the plane through p with unit normal n."""
+    a, b, c = n
+    d = -dot(n, p)
+    return [
+        weight * x
+        for x in (a * a, a * b, a * c, a * d, b * b, b * c, b * d, c * c, c * d, d * d)
+    ]
+
+
+def addQuadric(q, r):
+    for i in range(10):
+        q[i] += r[i]
+
+
+def quadricError(q, p):
+    x, y, z = p
+    return max(
+        0.0,
+        q[0] * x * x
+        + 2 * q[1] * x * y
+        + 2 * q[2] * x * z
+        + 2 * q[3] * x
+        + q[4] * y * y
+        + 2 * q[5] * y * z
+        + 2 * q[6] * y
+        + q[7] * z * z
+        + 2 * q[8] * z
+        + q[9],
+    )
+
+
+def switchDistance(geometric_error):
+    """Camera distance beyond which the given error projects to under LOD_PIXEL_ERROR."""
+    half_fov = math.radians(LOD_FOV_Y_DEGREES) / 2
+    return (
+        geometric_error * LOD_SCREEN_HEIGHT / (2 * math.tan(half_fov) * LOD_PIXEL_ERROR)
+    )
+
+
+def maxUsefulError():
+    """Geometric error with switch distance LOD_MAX_DISTANCE."""
+    return LOD_MAX_DISTANCE / switchDistance(1.0)
+
+
+class Simplifier:
+    def __init__(self, positions, wedge_positions, triangles):
+        """
+        Positions are (x, y, z) tuples. Wedge positions gives the position index of each
+        wedge. Triangles are (a, b, c) wedge indices.
+        """
+        self.positions = positions
+        self.wedge_positions = wedge_positions
+        self.triangles = [list(t) for t in triangles]
+        self.alive = [True] * len(triangles)
+        self.live_count = len(triangles)
+        self.position_triangles = [set() for _ in positions]
+        for t, triangle in enumerate(self.triangles):
+            for w in triangle:
+                self.position_triangles[wedge_positions[w]].add(t)
+        self.quadrics = [[0.0] * 10 for _ in positions]
+        self.versions = [0] * len(positions)
+        self.removed = [False] * len(positions)
+        self.border = [False] * len(positions)
+        self.max_error = 0.0
+        self.addQuadrics()
+        self.heap = []
+        for p in range(len(positions)):
+            self.pushEdges(p)
+
+    def trianglePositions(self, t):
+        return [self.wedge_positions[w] for w in self.triangles[t]]
+
+    def normal(self, a, b, c):
+        pa, pb, pc = self.positions[a], self.positions[b], self.positions[c]
+        return cross(sub(pb, pa), sub(pc, pa))
+
+    def addQuadrics(self):
+        edge_triangles = {}
+        for t in range(len(self.triangles)):
+            a, b, c = self.trianglePositions(t)
+            n = self.normal(a, b, c)
+            length = math.sqrt(dot(n, n))
+            if length == 0:
+                continue
+            n = (n[0] / length, n[1] / length, n[2] / length)
+            q = planeQuadric(n, self.positions[a])
+            for p in (a, b, c):
+                addQuadric(self.quadrics[p], q)
+            for u, v in ((a, b), (b, c), (c, a)):
+                edge_triangles.setdefault((min(u, v), max(u, v)), []).append(n)
+        # Open border edges get perpendicular planes so borders keep their shape.
+        for (u, v), normals in edge_triangles.items():
+            if len(normals) != 1:
+                continue
+            self.border[u] = self.border[v] = True
+            e = sub(self.positions[v], self.positions[u])
+            m = cross(e, normals[0])
+            length = math.sqrt(dot(m, m))
+            if length == 0:
+                continue
+            m = (m[0] / length, m[1] / length, m[2] / length)
+            q = planeQuadric(m, self.positions[u], BORDER_WEIGHT)
+            addQuadric(self.quadrics[u], q)
+            addQuadric(self.quadrics[v], q)
+
+    def neighbors(self, p):
+        result = set()
+        for t in self.position_triangles[p]:
+            result.update(self.trianglePositions(t))
+        result.discard(p)
+        return result
+
+    def collapseCost(self, p, q):
+        merged = list(self.quadrics[p])
+        addQuadric(merged, self.quadrics[q])
+        return quadricError(merged, self.positions[q])
+
+    def pushEdges(self, p):
+        for q in self.neighbors(p):
+            for a, b in ((p, q), (q, p)):
+                heapq.heappush(
+                    self.heap,
+                    (
+                        self.collapseCost(a, b),
+                        a,
+                        b,
+                        self.versions[a],
+                        self.versions[b],
+                    ),
+                )
+
+    def wedgeMap(self, p, q):
+        """
+        Returns the map from p's wedges to q's for collapsing p onto q, or None if some
+        wedge of p would have no single partner.
+        """
+        wedge_map = {}
+        p_wedges = set()
+        for t in self.position_triangles[p]:
+            triangle = self.triangles[t]
+            p_wedge = next(w for w in triangle if self.wedge_positions[w] == p)
+            p_wedges.add(p_wedge)
+            q_wedge = next((w for w in triangle if self.wedge_positions[w] == q), None)
+            if q_wedge is None:
+                continue
+            if wedge_map.setdefault(p_wedge, q_wedge) != q_wedge:
+                return None
+        return wedge_map if len(wedge_map) == len(p_wedges) else None
+
+    def isCollapseValid(self, p, q):
+        if self.border[p]:
+            # Border positions may only slide along the border.
+            shared = [
+                t for t in self.position_triangles[p] if q in self.trianglePositions(t)
+            ]
+            if not self.border[q] or len(shared) != 1:
+                return False
+        # Link condition: the only positions adjacent to both are the third corners of
+        # the triangles being removed. Otherwise the collapse pinches the surface.
+        thirds = set()
+        for t in self.position_triangles[p]:
+            positions = self.trianglePositions(t)
+            if q in positions:
+                thirds.update(positions)
+        thirds.discard(p)
+        thirds.discard(q)
+        if self.neighbors(p) & self.neighbors(q) != thirds:
+            return False
+        # No surviving triangle may flip.
+        for t in self.position_triangles[p]:
+            positions = self.trianglePositions(t)
+            if q in positions:
+                continue
+            before = self.normal(*positions)
+            after = self.normal(*(q if x == p else x for x in positions))
+            if dot(before, after) <= 0:
+                return False
+        return True
+
+    def collapse(self, p, q, wedge_map):
+        for t in list(self.position_triangles[p]):
+            triangle = self.triangles[t]
+            positions = self.trianglePositions(t)
+            if q in positions:
+                self.alive[t] = False
+                self.live_count -= 1
+                for x in positions:
+                    self.position_triangles[x].discard(t)
+            else:
+                self.triangles[t] = [wedge_map.get(w, w) for w in triangle]
+                self.position_triangles[q].add(t)
+        self.position_triangles[p].clear()
+        self.removed[p] = True
+        addQuadric(self.quadrics[q], self.quadrics[p])
+        self.versions[q] += 1
+        self.pushEdges(q)
+
+    def run(self, target_count, max_error):
+        """
+        Collapses edges in order of cost until at most target_count triangles remain or
+        the next collapse would exceed max_error.
+        """
+        while self.live_count > target_count and self.heap:
+            cost, p, q, p_version, q_version = self.heap[0]
+            if cost > max_error * max_error:
+                return
+            heapq.heappop(self.heap)
+            if (
+                self.removed[p]
+                or self.removed[q]
+                or self.versions[p] != p_version
+                or self.versions[q] != q_version
+            ):
+                continue
+            wedge_map = self.wedgeMap(p, q)
+            if wedge_map is None or not self.isCollapseValid(p, q):
+                continue
+            self.collapse(p, q, wedge_map)
+            self.max_error = max(self.max_error, math.sqrt(cost))
+
+    def liveTriangles(self):
+        return [
+            tuple(triangle)
+            for triangle, alive in zip(self.triangles, self.alive)
+            if alive
+        ]
+
+
+def buildLodChain(positions, wedge_positions, triangles, percentages):
+    """
+    Returns (triangles, geometric error) for each given percentage of the original
+    triangle count, in the given decreasing order. Each level continues from the one
+    before. A level stops short of its target when no valid collapse remains or error
+    would exceed maxUsefulError(). Geometric error is the root of the largest quadric
+    error so far, a bound on the distance from the original surface's planes.
+    """
+    simplifier = Simplifier(positions, wedge_positions, triangles)
+    max_error = maxUsefulError()
+    levels = []
+    for percentage in percentages:
+        simplifier.run(len(triangles) * percentage // 100, max_error)
+        levels.append((simplifier.liveTriangles(), simplifier.max_error))
+    return levels
@@ -0,0 +1,79 @@
+# Copyright (c) 2025-2026 Gene Ressler
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Smooth vertex normals for OBJ smoothing groups, computed for all faces at once with
+NumPy. Each corner's normal is the angle-weighted sum of the normals of faces in its
+smoothing group sharing its position, omitting faces beyond the crease angle from its
+own face.
+"""
+
+import numpy as np
+
+
+def weldPositions(positions):
+    """
+    Returns, for each of the given (n, 3) positions, the index of the first one with
+    exactly the same coordinates.
+    """
+    _, first, inverse = np.unique(
+        positions, axis=0, return_index=True, return_inverse=True
+    )
+    return first[inverse.reshape(-1)]
+
+
+def faceNormalsAndAngles(positions, triangles):
+    """Returns unit face normals, zero for degenerate faces, and corner angles."""
+    corners = positions[triangles]
+    edges = np.roll(corners, -1, axis=1) - corners
+    normals = np.cross(edges[:, 0], -edges[:, 2])
+    lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+    normals = np.divide(normals, lengths, out=np.zeros_like(normals), where=lengths > 0)
+    # The angle at each corner is between its outgoing and incoming edges.
+    outgoing = edges
+    incoming = -np.roll(edges, 1, axis=1)
+    angles = np.arctan2(
+        np.linalg.norm(np.cross(outgoing, incoming), axis=2),
+        np.einsum("ijk,ijk->ij", outgoing, incoming),
+    )
+    return normals, angles
+
+
+def smoothNormals(positions, triangles, groups, crease_degrees=180.0):
+    """
+    Given (n, 3) positions, (t, 3) triangles indexing them, and a nonzero smoothing
+    group for each triangle, returns unique unit normals and a (t, 3) array of each
+    corner's index into them. The index is -1 for corners with only degenerate faces
+    around them in their group.
+    """
+    face_normals, angles = faceNormalsAndAngles(positions, triangles)
+    corner_count = triangles.size
+    corner_faces = np.repeat(np.arange(len(triangles)), 3)
+    # Corners sharing a position and smoothing group form a cluster.
+    keys = np.stack([triangles.reshape(-1), np.repeat(groups, 3)], axis=1)
+    _, clusters = np.unique(keys, axis=0, return_inverse=True)
+    clusters = clusters.reshape(-1)
+    order = np.argsort(clusters, kind="stable")
+    sizes = np.bincount(clusters)
+    starts = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+    # Pair each corner with every corner of its cluster, itself included.
+    pair_counts = sizes[clusters]
+    i = np.repeat(np.arange(corner_count), pair_counts)
+    offsets = np.arange(len(i)) - np.repeat(
+        np.cumsum(pair_counts) - pair_counts, pair_counts
+    )
+    j = order[starts[clusters[i]] + offsets]
+    fi = face_normals[corner_faces[i]]
+    fj = face_normals[corner_faces[j]]
+    # Small tolerance so coplanar faces never crease from rounding.
+    keep = np.einsum("ij,ij->i", fi, fj) >= np.cos(np.radians(crease_degrees)) - 1e-9
+    sums = np.zeros((corner_count, 3))
+    np.add.at(sums, i[keep], fj[keep] * angles.reshape(-1)[j[keep], np.newaxis])
+    lengths = np.linalg.norm(sums, axis=1)
+    valid = lengths > 0
+    normals = sums[valid] / lengths[valid, np.newaxis]
+    # Merge normals equal to within rounding.
+    unique, inverse = np.unique(np.round(normals, 6), axis=0, return_inverse=True)
+    indices = np.full(corner_count, -1)
+    indices[valid] = inverse.reshape(-1)
+    return unique, indices.reshape(triangles.shape)
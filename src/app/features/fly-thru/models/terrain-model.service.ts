@@ -7,8 +7,7 @@ import { Utility } from '../../../shared/classes/utility';
 import { MeshData } from '../rendering/mesh-rendering.service';
 import { SiteConstants } from '../../../shared/classes/site-constants';
 import { BridgeService } from '../../../shared/services/bridge.service';
-import { RIVER_AXIS } from './river';
-import { Geometry } from '../../../shared/classes/graphics';
+import { RIVER_DISTANCE_FIELD } from './river';
 import { BitVector } from '../../../shared/core/bitvector';
 import { Material } from './materials';
 
@@ -393,8 +392,8 @@ export class TerrainModelService {
     // the abutment as visible so triangles spanning abutment to water aren't elided.
     const bridgeHalfWidth = 0.5 * conditions.spanLength + metersPerGrid;
     let isVisible = Math.abs(z) > SiteConstants.DECK_HALF_WIDTH || Math.abs(x) < bridgeHalfWidth;
-    // Distance to river center line.
-    const tWater = getDistanceToRiver(x, z);
+    // Distance to river center line, baked for each post by river.py.
+    const tWater = Math.abs(RIVER_DISTANCE_FIELD[j * TerrainModelService.POST_COUNT + i]);
     // Distance to center of road.
     const tRoadway = Math.abs(z);
     // Coefficient varies from 0 at water edge to 1 at the corner of the bluf above the water.
@@ -483,21 +482,6 @@ export class TerrainModelService {
       rtn.elevation = y;
     }
     return y;
-
-    function getDistanceToRiver(x: number, z: number): number {
-      let distance = Number.POSITIVE_INFINITY;
-      for (let i = 2; i < RIVER_AXIS.length; i += 2) {
-        const ax = RIVER_AXIS[i - 2];
-        const ay = RIVER_AXIS[i - 1];
-        const bx = RIVER_AXIS[i];
-        const by = RIVER_AXIS[i + 1];
-        const segmentDistance = Geometry.pointSegmentDistance2D(x, z, ax, ay, bx, by);
-        if (segmentDistance < distance) {
-          distance = segmentDistance;
-        }
-      }
-      return distance;
-    }
   }
 
   /** Returns mesh data for the current terrain. */
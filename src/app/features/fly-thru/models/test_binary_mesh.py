@@ -0,0 +1,80 @@
+# Copyright (c) 2025-2026 Gene Ressler
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import struct
+
+import pytest
+
+import binary_mesh
+
+SECTIONS = [
+    ("positions", "Float32Array", [0.5, -1.25, 3.0, 7.75, 2.0, -0.125, 1.5]),
+    ("normals", "Int8Array", [127, -127, 0]),
+    ("materialRefs", "Uint16Array", [0, 1, 65535]),
+    ("indices", "Uint32Array", [0, 1, 2, 70000, 4294967295]),
+    ("empty", "Int16Array", []),
+]
+
+
+@pytest.fixture
+def packed():
+    return binary_mesh.pack(SECTIONS)
+
+
+def testHeader(packed):
+    data, _ = packed
+    magic, version, count, byte_length = struct.unpack_from(
+        binary_mesh.HEADER_FORMAT, data, 0
+    )
+    assert magic == b"BDMS"
+    # What binary-mesh.ts compares with the first word.
+    assert struct.unpack_from("<I", data, 0)[0] == 0x534D4442
+    assert version == binary_mesh.VERSION
+    assert count == len(SECTIONS)
+    assert byte_length == len(data)
+    assert struct.calcsize(binary_mesh.HEADER_FORMAT) == 16
+    assert struct.calcsize(binary_mesh.ENTRY_FORMAT) == 32
+
+
+def testSectionTable(packed):
+    data, table = packed
+    entry_size = struct.calcsize(binary_mesh.ENTRY_FORMAT)
+    for k, (name, array_type, byte_offset, length) in enumerate(table):
+        entry = struct.unpack_from(binary_mesh.ENTRY_FORMAT, data, 16 + k * entry_size)
+        assert entry == (
+            name.encode("ascii").ljust(20, b"\0"),
+            binary_mesh.ARRAY_TYPES[array_type][1],
+            byte_offset,
+            length,
+        )
+    assert [(name, array_type) for name, array_type, _, _ in table] == [
+        (name, array_type) for name, array_type, _ in SECTIONS
+    ]
+
+
+def testAlignment(packed):
+    data, table = packed
+    assert len(data) % binary_mesh.ALIGNMENT == 0
+    end = 16 + len(SECTIONS) * 32
+    for _, array_type, byte_offset, length in table:
+        assert byte_offset % binary_mesh.ALIGNMENT == 0
+        assert byte_offset >= end
+        item_size = struct.calcsize(binary_mesh.ARRAY_TYPES[array_type][0])
+        end = byte_offset + length * item_size
+    assert end <= len(data)
+
+
+def testSectionData(packed):
+    data, table = packed
+    for (_, _, values), (_, array_type, byte_offset, length) in zip(SECTIONS, table):
+        type_code = binary_mesh.ARRAY_TYPES[array_type][0]
+        assert length == len(values)
+        unpacked = struct.unpack_from(f"<{length}{type_code}", data, byte_offset)
+        assert list(unpacked) == values
+
+
+def testNoSections():
+    data, table = binary_mesh.pack([])
+    assert table == []
+    assert len(data) == 16
+    assert struct.unpack_from(binary_mesh.HEADER_FORMAT, data, 0)[2:] == (0, 16)
@@ -0,0 +1,87 @@
+# Copyright (c) 2025-2026 Gene Ressler
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import math
+import random
+
+import cleanup
+
+EPSILON = 1e-4
+
+
+def testWeldWithinDistance():
+    points = [
+        (0, 0, 0),
+        (1, 2, 3),
+        (0.6 * EPSILON, 0, 0),
+        (1, 2 - 0.5 * EPSILON, 3 + 0.5 * EPSILON),
+        (0, 0, -EPSILON),
+    ]
+    assert cleanup.weldPoints(points, EPSILON) == [0, 1, 0, 1, 0]
+
+
+def testNoWeldBeyondDistance():
+    points = [(0, 0, 0), (1.01 * EPSILON, 0, 0), (0, -1.5 * EPSILON, 0)]
+    assert cleanup.weldPoints(points, EPSILON) == [0, 1, 2]
+
+
+def testWeldAcrossCellBoundaries():
+    # Straddle the grid cell edge at zero in every axis.
+    points = [(-0.25 * EPSILON,) * 3, (0.25 * EPSILON,) * 3]
+    assert cleanup.weldPoints(points, EPSILON) == [0, 0]
+
+
+def testWeldDoesNotChain():
+    # Each point is within epsilon of the last, but only the second of the first.
+    points = [(0.9 * EPSILON * i, 0, 0) for i in range(4)]
+    assert cleanup.weldPoints(points, EPSILON) == [0, 0, 2, 2]
+
+
+def testWeldMatchesBruteForce():
+    rng = random.Random(1)
+    points = [
+        tuple(rng.randrange(20) * 0.4 * EPSILON for _ in range(3)) for _ in range(500)
+    ]
+    welded = cleanup.weldPoints(points, EPSILON)
+    for i, p in enumerate(points):
+        # The first earlier point kept as a representative that's within epsilon.
+        expected = next(
+            (
+                j
+                for j in range(i)
+                if welded[j] == j and math.dist(p, points[j]) <= EPSILON
+            ),
+            i,
+        )
+        assert welded[i] == expected
+
+
+def testDegenerate():
+    assert cleanup.isDegenerate((0, 0, 0), (0, 0, 0), (0, 0, 0), EPSILON)
+    assert cleanup.isDegenerate((0, 0, 0), (1, 0, 0), (2, 0.5 * EPSILON, 0), EPSILON)
+    assert not cleanup.isDegenerate((0, 0, 0), (1, 0, 0), (2, 3 * EPSILON, 0), EPSILON)
+    assert not cleanup.isDegenerate((0, 0, 0), (1, 0, 0), (0, 1, 0), EPSILON)
+    # Small but not thin.
+    assert not cleanup.isDegenerate(
+        (0, 0, 0), (0, 0, 2 * EPSILON), (0, 2 * EPSILON, 0), EPSILON
+    )
+
+
+def testCleanTriangles():
+    points = [(0, 0, 0), (1, 0, 0), (0, 1, 0), (2, 0, 0), (1, 1, 0)]
+    # Corners 5 and 6 share points with 0 and 1, as after welding.
+    corner_positions = [0, 1, 2, 3, 4, 0, 1]
+    triangles = [
+        (0, 1, 2),
+        (5, 6, 2),  # Same points and winding as the first.
+        (1, 2, 0),  # Rotation of the first.
+        (0, 2, 1),  # Opposite winding, so kept.
+        (0, 5, 2),  # Collapsed by welding.
+        (0, 1, 3),  # Collinear.
+        (1, 3, 4),
+    ]
+    assert cleanup.cleanTriangles(triangles, corner_positions, points, EPSILON) == [
+        (0, 1, 2),
+        (0, 2, 1),
+        (1, 3, 4),
+    ]
@@ -0,0 +1,105 @@
+# Copyright (c) 2025-2026 Gene Ressler
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import math
+import random
+
+import pytest
+
+import quantize
+
+
+def randomPoints(count, seed):
+    rng = random.Random(seed)
+    return [
+        (rng.uniform(-50, 120), rng.uniform(0, 3), rng.uniform(-1e3, 1e3))
+        for _ in range(count)
+    ]
+
+
+def randomNormals(count, seed):
+    rng = random.Random(seed)
+    normals = []
+    while len(normals) < count:
+        v = [rng.gauss(0, 1) for _ in range(3)]
+        length = math.sqrt(sum(x * x for x in v))
+        if length > 1e-6:
+            normals.append(tuple(x / length for x in v))
+    return normals
+
+
+def angle(a, b):
+    dot = sum(x * y for x, y in zip(a, b))
+    return math.degrees(math.acos(max(-1.0, min(1.0, dot))))
+
+
+def testFloat32():
+    assert quantize.float32(0.5) == 0.5
+    assert quantize.float32(0.1) != 0.1
+    assert quantize.float32(0.1) == pytest.approx(0.1, rel=1e-7)
+
+
+def testPositionsRoundTrip():
+    points = randomPoints(1000, 1)
+    quantized, scale, offset, max_error = quantize.quantizePositions(points)
+    assert len(quantized) == len(points)
+    actual_error = 0.0
+    for p, q in zip(points, quantized):
+        for i in range(3):
+            assert -quantize.INT16_MAX <= q[i] <= quantize.INT16_MAX
+            # What the shader's normalized short attribute gives back.
+            decoded = q[i] / quantize.INT16_MAX * scale[i] + offset[i]
+            error = abs(decoded - p[i])
+            # Half a quantization step, plus slack for the float32 scale and offset.
+            assert error <= 0.5 * scale[i] / quantize.INT16_MAX + 1e-6 * scale[i]
+            actual_error = max(actual_error, error)
+    assert max_error == pytest.approx(actual_error)
+
+
+def testPositionsUseFullRange():
+    quantized, _, _, _ = quantize.quantizePositions(randomPoints(100, 2))
+    for i in range(3):
+        values = [q[i] for q in quantized]
+        assert min(values) <= -quantize.INT16_MAX + 1
+        assert max(values) >= quantize.INT16_MAX - 1
+
+
+def testFlatPositions():
+    points = [(x, 2.5, -x) for x in range(10)]
+    quantized, scale, offset, max_error = quantize.quantizePositions(points)
+    assert scale[1] == 0
+    assert offset[1] == 2.5
+    assert all(q[1] == 0 for q in quantized)
+    assert max_error < 1e-3
+
+
+def testOctDecodeIsUnit():
+    for x in (-1, -0.5, 0, 0.25, 1):
+        for y in (-1, -0.75, 0, 0.5, 1):
+            n = quantize.octDecode(x, y)
+            assert sum(c * c for c in n) == pytest.approx(1)
+
+
+def testAxesEncodeExactly():
+    for i in range(3):
+        for sign in (-1, 1):
+            n = tuple(sign if j == i else 0 for j in range(3))
+            (qx, qy), error = quantize.octEncode(n, 8)
+            assert error == pytest.approx(0, abs=1e-5)
+            assert quantize.octDecode(qx / 127, qy / 127) == pytest.approx(n)
+
+
+@pytest.mark.parametrize("bits", [8, 10, 16])
+def testNormalsRoundTrip(bits):
+    normals = randomNormals(5000, bits)
+    encoded, max_error = quantize.quantizeNormals(normals, bits)
+    scale = (1 << (bits - 1)) - 1
+    actual_error = 0.0
+    for n, (qx, qy) in zip(normals, encoded):
+        assert -scale <= qx <= scale and -scale <= qy <= scale
+        actual_error = max(
+            actual_error, angle(n, quantize.octDecode(qx / scale, qy / scale))
+        )
+    assert max_error == pytest.approx(actual_error, abs=1e-6)
+    # The best of the four roundings stays within about 1.4 encoding steps of angle.
+    assert max_error < math.degrees(1.5 / scale)
@@ -0,0 +1,123 @@
+# Copyright (c) 2025-2026 Gene Ressler
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import math
+
+import pytest
+
+import triangulator
+
+
+def triangleArea(points, triangle):
+    """Signed area of the indexed triangle, positive when counterclockwise."""
+    (ax, ay), (bx, by), (cx, cy) = (points[i] for i in triangle)
+    return 0.5 * ((bx - ax) * (cy - ay) - (by - ay) * (cx - ax))
+
+
+def polygonArea(points):
+    return 0.5 * abs(
+        sum(
+            px * qy - qx * py
+            for (px, py), (qx, qy) in zip(points, points[1:] + points[:1])
+        )
+    )
+
+
+def isInTriangle(points, triangle, p):
+    (ax, ay), (bx, by), (cx, cy) = (points[i] for i in triangle)
+    d1 = (bx - ax) * (p[1] - ay) - (by - ay) * (p[0] - ax)
+    d2 = (cx - bx) * (p[1] - by) - (cy - by) * (p[0] - bx)
+    d3 = (ax - cx) * (p[1] - cy) - (ay - cy) * (p[0] - cx)
+    return d1 > 0 and d2 > 0 and d3 > 0
+
+
+def checkTriangulation(points, holes, triangles):
+    """Checks count, winding, and area of a triangulation of points minus holes."""
+    all_points = points + [p for hole in holes for p in hole]
+    assert len(triangles) == len(all_points) + 2 * len(holes) - 2
+    assert all(0 <= i < len(all_points) for triangle in triangles for i in triangle)
+    assert all(triangleArea(all_points, triangle) > 0 for triangle in triangles)
+    area = polygonArea(points) - sum(polygonArea(hole) for hole in holes)
+    total = sum(triangleArea(all_points, triangle) for triangle in triangles)
+    assert total == pytest.approx(area)
+
+
+def star(count, inner, outer, center=(0, 0)):
+    points = []
+    for i in range(2 * count):
+        r = outer if i % 2 == 0 else inner
+        angle = math.pi * i / count
+        points.append(
+            (center[0] + r * math.cos(angle), center[1] + r * math.sin(angle))
+        )
+    return points
+
+
+def testTooFewPoints():
+    assert triangulator.triangulate([]) == []
+    assert triangulator.triangulate([(0, 0), (1, 0)]) == []
+
+
+def testSquare():
+    points = [(0, 0), (1, 0), (1, 1), (0, 1)]
+    checkTriangulation(points, [], triangulator.triangulate(points))
+
+
+def testConvexPolygon():
+    points = [
+        (math.cos(a), math.sin(a)) for a in (2 * math.pi * i / 17 for i in range(17))
+    ]
+    checkTriangulation(points, [], triangulator.triangulate(points))
+
+
+def testStar():
+    points = star(9, 0.3, 1.0)
+    checkTriangulation(points, [], triangulator.triangulate(points))
+
+
+def testComb():
+    # Deep notches leave ears only at the teeth.
+    points = [(0, 0), (9, 0), (9, 5)]
+    for x in range(8, 0, -2):
+        points += [(x, 5), (x, 1), (x - 1, 1), (x - 1, 5)]
+    points.append((0, 5))
+    checkTriangulation(points, [], triangulator.triangulate(points))
+
+
+def testClockwisePolygon():
+    points = star(5, 0.5, 1.0)[::-1]
+    checkTriangulation(points, [], triangulator.triangulate(points))
+
+
+def testCollinearPoints():
+    points = [(0, 0), (1, 0), (2, 0), (3, 0), (3, 1), (2, 1), (1, 1), (0, 1)]
+    checkTriangulation(points, [], triangulator.triangulate(points))
+
+
+def testHole():
+    points = [(0, 0), (10, 0), (10, 10), (0, 10)]
+    hole = [(4, 4), (4, 6), (6, 6), (6, 4)]
+    triangles = triangulator.triangulate(points, [hole])
+    checkTriangulation(points, [hole], triangles)
+    all_points = points + hole
+    assert not any(isInTriangle(all_points, t, (5, 5)) for t in triangles)
+
+
+def testHoles():
+    points = star(8, 6, 10)
+    holes = [
+        [(-2, -1), (-2, 1), (-1, 1), (-1, -1)],
+        [(1, -1), (1, 1), (2, 1), (2, -1)],
+        star(4, 0.4, 0.8, (0, 3))[::-1],
+    ]
+    triangles = triangulator.triangulate(points, holes)
+    checkTriangulation(points, holes, triangles)
+    all_points = points + [p for hole in holes for p in hole]
+    for center in [(-1.5, 0), (1.5, 0), (0, 3)]:
+        assert not any(isInTriangle(all_points, t, center) for t in triangles)
+
+
+def testLargePolygon():
+    # Enough reflex vertices that the blocker grid has many cells.
+    points = star(500, 0.8, 1.0)
+    checkTriangulation(points, [], triangulator.triangulate(points))
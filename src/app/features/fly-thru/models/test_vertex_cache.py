@@ -0,0 +1,82 @@
+# Copyright (c) 2025-2026 Gene Ressler
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import random
+
+import vertex_cache
+
+
+def gridTriangles(columns, rows):
+    """Triangles of a grid of quads, row by row, and the vertex count."""
+    triangles = []
+    for j in range(rows):
+        for i in range(columns):
+            a = j * (columns + 1) + i
+            b, c, d = a + 1, a + columns + 1, a + columns + 2
+            triangles += [(a, b, d), (a, d, c)]
+    return triangles, (columns + 1) * (rows + 1)
+
+
+def shuffled(triangles, seed):
+    result = list(triangles)
+    random.Random(seed).shuffle(result)
+    return result
+
+
+def checkOptimized(triangles, vertex_count):
+    result = vertex_cache.optimizeTriangleOrder(triangles, vertex_count)
+    # Same triangles with the same winding, each once.
+    assert sorted(result) == sorted(triangles)
+    acmr, _ = vertex_cache.acmrAndAtvr(triangles, vertex_count)
+    new_acmr, _ = vertex_cache.acmrAndAtvr(result, vertex_count)
+    assert new_acmr <= acmr
+    return new_acmr
+
+
+def testEmpty():
+    assert vertex_cache.optimizeTriangleOrder([], 0) == []
+
+
+def testShuffledGrid():
+    triangles, vertex_count = gridTriangles(24, 24)
+    acmr = checkOptimized(shuffled(triangles, 1), vertex_count)
+    # A shuffled grid misses nearly every vertex. An optimized one shares most.
+    assert acmr < 1.0
+
+
+def testRowOrderGrid():
+    triangles, vertex_count = gridTriangles(40, 10)
+    checkOptimized(triangles, vertex_count)
+
+
+def testDisconnectedPieces():
+    triangles = []
+    vertex_count = 0
+    for _ in range(10):
+        piece, count = gridTriangles(3, 3)
+        triangles += [tuple(v + vertex_count for v in t) for t in piece]
+        vertex_count += count
+    # Unused vertices don't matter.
+    checkOptimized(shuffled(triangles, 2), vertex_count + 5)
+
+
+def testRenumberVertices():
+    triangles, vertex_count = gridTriangles(5, 4)
+    triangles = vertex_cache.optimizeTriangleOrder(
+        shuffled(triangles, 3), vertex_count + 2
+    )
+    order, renumbered = vertex_cache.renumberVertices(triangles, vertex_count + 2)
+    assert sorted(order) == list(range(vertex_count + 2))
+    assert [tuple(order[v] for v in t) for t in renumbered] == triangles
+    # First use order, then the unused vertices.
+    first_uses = [v for t in renumbered for v in t]
+    assert sorted(set(first_uses)) == list(range(vertex_count))
+    assert order[-2:] == [vertex_count, vertex_count + 1]
+
+
+def testCacheMissCount():
+    assert vertex_cache.cacheMissCount([(0, 1, 2)]) == 3
+    assert vertex_cache.cacheMissCount([(0, 1, 2), (2, 1, 3)]) == 4
+    # FIFO eviction: vertex 3 pushes out 0, and reloading 0 pushes out 1, etc.
+    assert vertex_cache.cacheMissCount([(0, 1, 2), (1, 2, 3), (0, 1, 2)], 3) == 7
+    assert vertex_cache.cacheMissCount([(0, 1, 2), (1, 2, 3), (1, 2, 3)], 3) == 4
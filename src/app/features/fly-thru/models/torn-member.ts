@@ -98,4 +98,11 @@ export const TORN_MEMBER_MESH_DATA = {
     22, 23, 18,
     18, 23, 21,
   ]),
+  bounds: new Float32Array([
+    0, -0.5, -0.5, 0.5, 0.5, 0.5, 0.2, 0, 0, 0.734847, // min, max, sphere center, radius
+  ]),
+  materialBounds: new Float32Array([
+    2, 0, -0.5, -0.5, 0.5, 0.5, 0.5, 0.2, 0, 0, 0.734847, // material, min, max, sphere center, radius
+    7, 0.4, -0.5, -0.5, 0.5, 0.5, 0.5, 0.4, 0, 0, 0.707107, // material, min, max, sphere center, radius
+  ]),
 };
@@ -0,0 +1,293 @@
+# Copyright (c) 2025-2026 Gene Ressler
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Ear clipping triangulation of simple polygons, optionally with holes.
+
+Vertices live in a circular doubly linked list, so clipping an ear is O(1). Only reflex
+(and collinear) vertices can block an ear, so just those are kept in a uniform grid and
+an ear test looks only at the grid cells overlapping the candidate triangle. Holes are
+joined to the outer boundary by bridge edges before clipping, as in Mapbox's earcut.
+"""
+
+import math
+import sys
+
+
+class Node:
+    __slots__ = ("index", "x", "y", "prev", "next", "cell")
+
+    def __init__(self, index, x, y):
+        self.index = index
+        self.x = x
+        self.y = y
+        self.prev = None
+        self.next = None
+        # Grid cell key if this vertex is a potential ear blocker, else None.
+        self.cell = None
+
+
+def turn(a, b, c):
+    """Twice the signed area of triangle abc. Positive for a left (counterclockwise) turn."""
+    return (b.x - a.x) * (c.y - b.y) - (b.y - a.y) * (c.x - b.x)
+
+
+def signedArea(points):
+    area = 0
+    qx, qy = points[-1]
+    for px, py in points:
+        area += (qx - px) * (qy + py)
+        qx, qy = px, py
+    return area
+
+
+def linkedList(points, start_index, counterclockwise):
+    """Builds a circular list of nodes for the points with the requested orientation."""
+    order = range(len(points))
+    if (signedArea(points) > 0) != counterclockwise:
+        order = reversed(order)
+    last = None
+    for i in order:
+        node = Node(start_index + i, *points[i])
+        if last:
+            node.prev = last
+            last.next = node
+        else:
+            first = node
+        last = node
+    last.next = first
+    first.prev = last
+    return first
+
+
+def removeNode(node):
+    node.next.prev = node.prev
+    node.prev.next = node.next
+
+
+def isPointInTriangle(p, a, b, c):
+    """Inclusive test for p in counterclockwise triangle abc."""
+    return turn(a, b, p) >= 0 and turn(b, c, p) >= 0 and turn(c, a, p) >= 0
+
+
+def isSamePoint(a, b):
+    return a.x == b.x and a.y == b.y
+
+
+class BlockerGrid:
+    """Uniform grid of the vertices that might lie inside a candidate ear."""
+
+    def __init__(self, head, count):
+        min_x = min_y = math.inf
+        max_x = max_y = -math.inf
+        node = head
+        while True:
+            min_x = min(min_x, node.x)
+            max_x = max(max_x, node.x)
+            min_y = min(min_y, node.y)
+            max_y = max(max_y, node.y)
+            node = node.next
+            if node is head:
+                break
+        self.min_x = min_x
+        self.min_y = min_y
+        # Aim for about one vertex per cell.
+        size = max(max_x - min_x, max_y - min_y, 1e-12)
+        self.cell_size = size / max(1, math.isqrt(count))
+        self.cells = {}
+
+    def key(self, x, y):
+        return (
+            int((x - self.min_x) / self.cell_size),
+            int((y - self.min_y) / self.cell_size),
+        )
+
+    def add(self, node):
+        node.cell = self.key(node.x, node.y)
+        self.cells.setdefault(node.cell, set()).add(node)
+
+    def remove(self, node):
+        self.cells[node.cell].discard(node)
+        node.cell = None
+
+    def update(self, node):
+        """Adds or removes the node according to whether it's still a potential blocker."""
+        is_blocker = turn(node.prev, node, node.next) <= 0
+        if is_blocker and node.cell is None:
+            self.add(node)
+        elif not is_blocker and node.cell is not None:
+            self.remove(node)
+
+    def isEar(self, ear, allow_degenerate):
+        a, b, c = ear.prev, ear, ear.next
+        area = turn(a, b, c)
+        if area < 0 or (area == 0 and not allow_degenerate):
+            return False
+        x0, y0 = self.key(min(a.x, b.x, c.x), min(a.y, b.y, c.y))
+        x1, y1 = self.key(max(a.x, b.x, c.x), max(a.y, b.y, c.y))
+        for i in range(x0, x1 + 1):
+            for j in range(y0, y1 + 1):
+                for p in self.cells.get((i, j), ()):
+                    if (
+                        not isSamePoint(p, a)
+                        and not isSamePoint(p, b)
+                        and not isSamePoint(p, c)
+                        and isPointInTriangle(p, a, b, c)
+                    ):
+                        return False
+        return True
+
+
+def clipEars(head, count, triangles):
+    grid = BlockerGrid(head, count)
+    node = head
+    while True:
+        grid.update(node)
+        node = node.next
+        if node is head:
+            break
+    # Start with the last vertex and walk forward. For convex polygons this makes a fan
+    # around the first vertex.
+    ear = head.prev
+    misses = 0
+    allow_degenerate = False
+    while count > 2:
+        if misses >= count:
+            if not allow_degenerate:
+                # Only zero-area ears are left. Accept them.
+                allow_degenerate = True
+                misses = 0
+                continue
+            # No ear anywhere means the polygon self-intersects. Clip anyway.
+            print(f"warning: no ear found in {count}-gon", file=sys.stderr)
+        elif not grid.isEar(ear, allow_degenerate):
+            ear = ear.next
+            misses += 1
+            continue
+        prev, next = ear.prev, ear.next
+        triangles.append((prev.index, ear.index, next.index))
+        if ear.cell is not None:
+            grid.remove(ear)
+        removeNode(ear)
+        count -= 1
+        grid.update(prev)
+        grid.update(next)
+        ear = prev
+        misses = 0
+        allow_degenerate = False
+
+
+def locallyInside(a, b):
+    """Whether the diagonal from a to b lies inside the polygon near a."""
+    if turn(a.prev, a, a.next) > 0:
+        return turn(a, b, a.next) <= 0 and turn(a, a.prev, b) <= 0
+    return turn(a, b, a.prev) > 0 or turn(a, a.next, b) > 0
+
+
+def findHoleBridge(hole, outer):
+    """Returns an outer vertex visible from the given rightmost hole vertex."""
+    hx, hy = hole.x, hole.y
+    qx = math.inf
+    bridge = None
+    # Cast a ray to the right and find the nearest outer edge it hits. The edge endpoint
+    # with larger x is a candidate connection.
+    p = outer
+    while True:
+        if p.y <= hy <= p.next.y and p.next.y != p.y:
+            x = p.x + (hy - p.y) * (p.next.x - p.x) / (p.next.y - p.y)
+            if hx <= x < qx:
+                qx = x
+                bridge = p if p.x > p.next.x else p.next
+                if x == hx:
+                    return bridge
+        p = p.next
+        if p is outer:
+            break
+    if bridge is None:
+        return None
+    # Any reflex vertex inside the triangle formed by the hole vertex, the ray hit, and the
+    # candidate blocks it. Take the blocking vertex with the least angle to the ray.
+    mx, my = bridge.x, bridge.y
+    tan_min = math.inf
+    # Counterclockwise triangle of the hole vertex, the ray hit, and the candidate.
+    ray = Node(-1, hx, hy)
+    hit = Node(-1, qx, hy)
+    candidate = Node(-1, mx, my)
+    triangle = (ray, hit, candidate) if hy < my else (hit, ray, candidate)
+    stop = bridge
+    p = bridge
+    while True:
+        if hx <= p.x <= mx and hx != p.x and isPointInTriangle(p, *triangle):
+            tan = abs(hy - p.y) / (p.x - hx)
+            if locallyInside(p, hole) and (
+                tan < tan_min or (tan == tan_min and p.x < bridge.x)
+            ):
+                bridge = p
+                tan_min = tan
+        p = p.next
+        if p is stop:
+            break
+    return bridge
+
+
+def splitPolygon(a, b):
+    """Joins a and b with a two-way bridge, duplicating both. Returns the copy of b."""
+    a2 = Node(a.index, a.x, a.y)
+    b2 = Node(b.index, b.x, b.y)
+    an = a.next
+    bp = b.prev
+    a.next = b
+    b.prev = a
+    a2.next = an
+    an.prev = a2
+    b2.next = a2
+    a2.prev = b2
+    bp.next = b2
+    b2.prev = bp
+    return b2
+
+
+def eliminateHoles(outer, holes, start_index):
+    """Bridges each hole into the outer list. Returns the added vertex count."""
+    rightmost = []
+    for hole in holes:
+        node = head = linkedList(hole, start_index, False)
+        start_index += len(hole)
+        best = node
+        while True:
+            if node.x > best.x or (node.x == best.x and node.y < best.y):
+                best = node
+            node = node.next
+            if node is head:
+                break
+        rightmost.append(best)
+    # Bridging right to left keeps earlier bridges from blocking later ones.
+    rightmost.sort(key=lambda node: (-node.x, node.y))
+    added = 0
+    for hole in rightmost:
+        bridge = findHoleBridge(hole, outer)
+        if bridge is None:
+            print("warning: hole outside polygon ignored", file=sys.stderr)
+            continue
+        splitPolygon(bridge, hole)
+        added += 2
+    return added
+
+
+def triangulate(points, holes=()):
+    """
+    Triangulates a simple polygon given as a list of (x, y) points, typically counter-
+    clockwise, minus the given holes, each also a list of points. Returns (a, b, c) index
+    triples in counterclockwise order, where hole points are numbered after the outer
+    ones, hole by hole.
+    """
+    if len(points) < 3:
+        return []
+    head = linkedList(points, 0, True)
+    count = len(points)
+    if holes:
+        count += sum(len(hole) for hole in holes)
+        count += eliminateHoles(head, holes, len(points))
+    triangles = []
+    clipEars(head, count, triangles)
+    return triangles
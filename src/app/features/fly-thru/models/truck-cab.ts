@@ -1599,9 +1599,9 @@ export const TRUCK_CAB_MESH_DATA = {
     124, 125, 122,
     123, 124, 122,
     127, 128, 129,
-    133, 134, 130,
-    132, 133, 130,
-    131, 132, 130,
+    134, 130, 131,
+    133, 134, 131,
+    132, 133, 131,
     137, 138, 135,
     136, 137, 135,
     139, 140, 141,
@@ -1702,9 +1702,9 @@ export const TRUCK_CAB_MESH_DATA = {
     286, 287, 284,
     285, 286, 284,
     288, 289, 290,
-    292, 293, 288,
-    291, 292, 288,
-    290, 291, 288,
+    293, 288, 290,
+    292, 293, 290,
+    291, 292, 290,
     296, 297, 294,
     295, 296, 294,
     300, 301, 298,
@@ -1738,9 +1738,9 @@ export const TRUCK_CAB_MESH_DATA = {
     346, 347, 344,
     345, 346, 344,
     348, 349, 350,
-    352, 353, 348,
-    351, 352, 348,
-    350, 351, 348,
+    353, 348, 350,
+    352, 353, 350,
+    351, 352, 350,
     356, 357, 354,
     355, 356, 354,
     360, 361, 358,
@@ -1836,4 +1836,18 @@ export const TRUCK_CAB_MESH_DATA = {
     335, 505, 504,
     332, 335, 504,
   ]),
+  bounds: new Float32Array([
+    -0.79922, 0.523945, -1.66001, 1.50078, 3.27394, 1.65602, 0.0934423, 1.81714, -0.0038849, 2.14803, // min, max, sphere center, radius
+  ]),
+  materialBounds: new Float32Array([
+    1, 1.20078, 0.773945, -1.152, 1.30078, 0.923945, 1.148, 1.25078, 0.848945, -0.002, 1.15353, // material, min, max, sphere center, radius
+    3, 1.20078, 0.523945, -1.152, 1.50078, 1.62394, 1.148, 1.25078, 1.07394, -0.002, 1.27573, // material, min, max, sphere center, radius
+    4, 0.79246, 0.523945, -1.452, 1.50078, 2.62394, 1.148, 1.00078, 1.57394, -0.152, 1.683, // material, min, max, sphere center, radius
+    5, -0.39922, 0.773945, -1.152, 1.50078, 2.82394, 1.148, 0.55078, 1.79894, -0.002, 1.68986, // material, min, max, sphere center, radius
+    7, 1.20078, 0.523945, -1.152, 1.50078, 0.523945, 1.148, 1.25078, 0.523945, -0.002, 1.15109, // material, min, max, sphere center, radius
+    8, -0.79922, 1.02394, -1.66001, 1.00078, 2.62394, 1.65602, 0.10078, 1.82394, -0.001995, 1.94522, // material, min, max, sphere center, radius
+    9, -0.79922, 0.523945, -1.302, 1.20078, 3.27394, 1.298, 0.20078, 1.89894, -0.002, 2.14024, // material, min, max, sphere center, radius
+    10, -0.79922, 0.523945, -1.152, 1.40078, 1.02394, 1.148, 0.379104, 0.778458, -0.00970071, 1.44952, // material, min, max, sphere center, radius
+    11, 0.729155, 1.6184, -1.66001, 1.00078, 2.62394, -1.152, 0.864968, 2.12117, -1.406, 0.579432, // material, min, max, sphere center, radius
+  ]),
 };
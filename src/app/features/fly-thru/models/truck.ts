@@ -2887,4 +2887,19 @@ export const TRUCK_MESH_DATA = {
     794, 795, 796,
     795, 794, 797,
   ]),
+  bounds: new Float32Array([
+    -5.99922, 0.37394, -1.66001, 1.50078, 3.42394, 1.65602, -2.45487, 1.60499, -0.120967, 4.23775, // min, max, sphere center, radius
+  ]),
+  materialBounds: new Float32Array([
+    1, 1.20078, 0.77394, -1.152, 1.30078, 0.92394, 1.148, 1.25078, 0.84894, -0.002, 1.15353, // material, min, max, sphere center, radius
+    3, -0.39922, 0.52394, -1.152, 1.50078, 2.82394, 1.148, 0.47578, 1.57394, -0.002, 1.76228, // material, min, max, sphere center, radius
+    4, -5.99922, 0.77394, -1.302, 1.50078, 3.42394, 1.298, -2.24922, 2.09894, -0.002, 4.18427, // material, min, max, sphere center, radius
+    5, -5.99922, 0.52394, -1.302, 1.50078, 2.62394, 1.298, -2.30246, 0.900715, 0.152057, 3.97435, // material, min, max, sphere center, radius
+    6, 0.00078, 0.72394, -0.802, 0.50078, 1.02394, 0.798, 0.25078, 0.87394, -0.002, 0.851469, // material, min, max, sphere center, radius
+    7, -5.99922, 0.37394, -1.302, 1.50078, 1.02394, 1.298, -2.24922, 0.69894, -0.002, 3.98223, // material, min, max, sphere center, radius
+    8, -5.99922, 0.47394, -1.66001, 1.00078, 3.42394, 1.65602, -2.62475, 1.88133, -0.0276844, 3.94007, // material, min, max, sphere center, radius
+    9, -5.99922, 1.12394, -1.302, -0.79922, 3.27394, 1.298, -3.39922, 2.19894, -0.002, 3.09929, // material, min, max, sphere center, radius
+    10, -5.99922, 0.52394, -1.152, 1.40078, 1.02394, 1.148, -2.29922, 0.77394, -0.002, 3.82818, // material, min, max, sphere center, radius
+    11, 0.00078, 1.62394, -1.152, 1.40078, 2.72394, 1.148, 0.60078, 2.12394, -0.002, 1.39014, // material, min, max, sphere center, radius
+  ]),
 };
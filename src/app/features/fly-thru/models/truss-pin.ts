@@ -348,4 +348,7 @@ export const TRUSS_PIN_MESH_DATA = {
     89, 10, 90,
     8, 10, 89,
   ]),
+  bounds: new Float32Array([
+    -0.1, -0.1, -1, 0.1, 0.1, 1, 0, 0, 0, 1.00499, // min, max, sphere center, radius
+  ]),
 };
@@ -792,4 +792,7 @@ export const UTILITY_TOWER_MESH_DATA = {
     218, 219, 220,
     219, 218, 221,
   ]),
+  bounds: new Float32Array([
+    -0.35, 0, -2.51354, 0.35, 15.2, 2.51354, 0, 7.6, 0, 7.60805, // min, max, sphere center, radius
+  ]),
 };
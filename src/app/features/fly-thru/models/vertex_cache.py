@@ -0,0 +1,121 @@
+# Copyright (c) 2025-2026 Gene Ressler
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Triangle reordering for the GPU post-transform vertex cache using Tom Forsyth's "Linear-
+Speed Vertex Cache Optimisation" and vertex renumbering for fetch locality.
+"""
+
+CACHE_SIZE = 32
+CACHE_DECAY_POWER = 1.5
+LAST_TRIANGLE_SCORE = 0.75
+VALENCE_BOOST_SCALE = 2.0
+VALENCE_BOOST_POWER = 0.5
+
+# Cache size used to report ACMR and ATVR. Small to model older hardware.
+REPORT_CACHE_SIZE = 16
+
+
+def vertexScore(cache_position, remaining_triangles):
+    if remaining_triangles == 0:
+        return -1.0
+    score = 0.0
+    if cache_position >= 0:
+        if cache_position < 3:
+            # Vertices of the last triangle get a fixed score so the next one doesn't
+            # simply reuse its edge and make strips.
+            score = LAST_TRIANGLE_SCORE
+        else:
+            scale = 1.0 / (CACHE_SIZE - 3)
+            score = (1.0 - (cache_position - 3) * scale) ** CACHE_DECAY_POWER
+    # Boost vertices with few triangles left to finish them off.
+    return score + VALENCE_BOOST_SCALE * remaining_triangles**-VALENCE_BOOST_POWER
+
+
+def optimizeTriangleOrder(triangles, vertex_count):
+    """Returns the given (a, b, c) vertex index triangles reordered for cache reuse."""
+    vertex_triangles = [[] for _ in range(vertex_count)]
+    for t, triangle in enumerate(triangles):
+        for v in triangle:
+            vertex_triangles[v].append(t)
+    remaining = [len(ts) for ts in vertex_triangles]
+    cache_position = [-1] * vertex_count
+    vertex_scores = [vertexScore(-1, remaining[v]) for v in range(vertex_count)]
+    emitted = [False] * len(triangles)
+    cache = []
+    result = []
+    scan_start = 0
+    best = -1
+    while len(result) < len(triangles):
+        if best < 0:
+            # Nothing adjacent to the cache. Start over with the next in input order,
+            # which keeps this linear for meshes with many small pieces.
+            while emitted[scan_start]:
+                scan_start += 1
+            best = scan_start
+        emitted[best] = True
+        result.append(triangles[best])
+        for v in triangles[best]:
+            remaining[v] -= 1
+            vertex_triangles[v].remove(best)
+        # Move the triangle's vertices to the front of the LRU cache.
+        new_cache = list(triangles[best])
+        new_cache.extend(v for v in cache if v not in triangles[best])
+        evicted = new_cache[CACHE_SIZE:]
+        cache = new_cache[:CACHE_SIZE]
+        for v in evicted:
+            cache_position[v] = -1
+        touched = set()
+        for position, v in enumerate(cache):
+            cache_position[v] = position
+        for v in cache + evicted:
+            vertex_scores[v] = vertexScore(cache_position[v], remaining[v])
+            touched.update(vertex_triangles[v])
+        # The next triangle is the best one touching the cache, if any.
+        best = -1
+        best_score = -1.0
+        for t in sorted(touched):
+            score = sum(vertex_scores[v] for v in triangles[t])
+            if score > best_score:
+                best_score = score
+                best = t
+    return result
+
+
+def renumberVertices(triangles, vertex_count):
+    """
+    Returns a vertex order with vertices in order of first use, followed by any unused
+    ones, and the triangles renumbered accordingly.
+    """
+    new_index = [-1] * vertex_count
+    order = []
+    for triangle in triangles:
+        for v in triangle:
+            if new_index[v] < 0:
+                new_index[v] = len(order)
+                order.append(v)
+    for v in range(vertex_count):
+        if new_index[v] < 0:
+            new_index[v] = len(order)
+            order.append(v)
+    return order, [tuple(new_index[v] for v in triangle) for triangle in triangles]
+
+
+def cacheMissCount(triangles, cache_size=REPORT_CACHE_SIZE):
+    """Simulates a FIFO post-transform cache and returns the number of misses."""
+    cache = []
+    misses = 0
+    for triangle in triangles:
+        for v in triangle:
+            if v not in cache:
+                misses += 1
+                cache.append(v)
+                if len(cache) > cache_size:
+                    cache.pop(0)
+    return misses
+
+
+def acmrAndAtvr(triangles, vertex_count):
+    """Average cache miss ratio per triangle and average transformed vertex ratio."""
+    misses = cacheMissCount(triangles)
+    return misses / max(1, len(triangles)), misses / max(1, vertex_count)
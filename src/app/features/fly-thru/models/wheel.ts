@@ -1530,4 +1530,14 @@ export const WHEEL_MESH_DATA = {
     358, 356, 359,
     357, 359, 356,
   ]),
+  bounds: new Float32Array([
+    -0.5, -0.5, 0, 0.5, 0.5, 0.28, -2.45295e-09, 1.59853e-08, 0.1, 0.509902, // min, max, sphere center, radius
+  ]),
+  materialBounds: new Float32Array([
+    3, -0.3, -0.3, 0, 0.3, 0.3, 0.24, -3.37454e-10, 3.40679e-09, 0.1, 0.316228, // material, min, max, sphere center, radius
+    5, -0.5, -0.5, 0, 0.5, 0.5, 0.2, 0, 0, 0.1, 0.509902, // material, min, max, sphere center, radius
+    6, -0.24, -0.24, 0.194, 0.24, 0.24, 0.222, -1.87735e-08, 1.34104e-07, 0.194, 0.240001, // material, min, max, sphere center, radius
+    7, -0.2, -0.2, 0.24, 0.2, 0.2, 0.28, 1.37747e-08, 2.0662e-08, 0.24, 0.2, // material, min, max, sphere center, radius
+    8, -0.3, -0.3, 0.16, 0.3, 0.3, 0.2, 0, 0, 0.18, 0.300666, // material, min, max, sphere center, radius
+  ]),
 };
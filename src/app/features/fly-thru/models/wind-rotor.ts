@@ -658,4 +658,7 @@ export const WIND_ROTOR_MESH_DATA = {
     190, 149, 148,
     191, 189, 188,
   ]),
+  bounds: new Float32Array([
+    -38.6372, -44.5, -3.9968e-15, 38.7362, 22.593, 2, 0.0495, -10.9535, 1, 50.9817, // min, max, sphere center, radius
+  ]),
 };
@@ -743,4 +743,7 @@ export const WIND_TOWER_MESH_DATA = {
     203, 204, 205,
     204, 203, 206,
   ]),
+  bounds: new Float32Array([
+    -3.6731, -1.07159e-15, -6, 3.6731, 71.9991, 7, 0.627834, 36.1889, 1.21004, 36.5372, // min, max, sphere center, radius
+  ]),
 };
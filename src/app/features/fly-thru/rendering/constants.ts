@@ -11,3 +11,12 @@ export const WATER_TEXTURE_UNIT = 1;
 export const SKYBOX_TEXTURE_UNIT = 2;
 export const FACIA_TEXTURE_UNIT = 3;
 export const DEPTH_TEXTURE_UNIT = 4;
+
+/** Texture unit of each sampler uniform by name. Shader programs are bound to these once when linked. */
+export const SAMPLER_TEXTURE_UNITS: { [samplerName: string]: number } = {
+  icons: OVERLAY_TEXTURE_UNIT,
+  water: WATER_TEXTURE_UNIT,
+  skybox: SKYBOX_TEXTURE_UNIT,
+  meshTexture: FACIA_TEXTURE_UNIT,
+  depthMap: DEPTH_TEXTURE_UNIT,
+};
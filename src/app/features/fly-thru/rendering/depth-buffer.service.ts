@@ -83,14 +83,15 @@ export class DepthBufferService {
     gl.bindFramebuffer(gl.FRAMEBUFFER, null);
   }
 
-  /** Binds the depth texture in given shader program if we're not rendering for depth only. */
-  public bindDepthTexture(program: WebGLProgram): void {
+  /**
+   * Binds the depth texture for shader programs if we're not rendering for depth only. Their depth map
+   * samplers are bound to its unit when linked.
+   */
+  public bindDepthTexture(): void {
     if (this.glService.isRenderingDepth) {
       return;
     }
     const gl = this.glService.gl;
-    const location = gl.getUniformLocation(program, 'depthMap')!;
-    gl.uniform1i(location, DEPTH_TEXTURE_UNIT);
     gl.activeTexture(gl.TEXTURE0 + DEPTH_TEXTURE_UNIT);
     gl.bindTexture(gl.TEXTURE_2D, this.depthTexture);
   }
@@ -113,9 +114,8 @@ export class DepthBufferService {
     gl.disable(gl.DEPTH_TEST);
     gl.disable(gl.CULL_FACE);
 
-    const program = this.shaderService.getProgram('depth_texture');
-    gl.useProgram(program);
-    this.bindDepthTexture(program);
+    gl.useProgram(this.shaderService.getProgram('depth_texture'));
+    this.bindDepthTexture();
     gl.bindVertexArray(this.vertexArray);
 
     gl.drawArrays(gl.TRIANGLES, 0, TEX_COORDS.length >>> 1);
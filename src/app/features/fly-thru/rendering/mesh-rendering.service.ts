@@ -11,20 +11,42 @@ import {
   IN_DIRECTION_LOCATION,
   IN_INSTANCE_COLOR_LOCATION,
   IN_NORMAL_REF_LOCATION,
+  IN_POSITION_OFFSET_LOCATION,
+  IN_POSITION_SCALE_LOCATION,
+  INSTANCED_SHADER_FEATURE,
+  MATERIAL_REFS_SHADER_FEATURE,
+  QUANTIZED_SHADER_FEATURE,
+  SHADOWS_SHADER_FEATURE,
 } from '../shaders/constants';
 import { ShaderService } from '../shaders/shader.service';
 import { GlService } from './gl.service';
 import { FACIA_TEXTURE_UNIT, WATER_TEXTURE_UNIT } from './constants';
 import { DepthBufferService } from './depth-buffer.service';
+import { FlyThruSettingsService } from './fly-thru-settings.service';
 import { TextureService, TextureUrl } from './texture.service';
 
 export type MeshData = {
-  positions: Float32Array;
-  normals?: Float32Array;
-  normalRefs?: Uint16Array;
+  // Int16Array if quantized by models/build.py. Then normals are octahedral pairs in normalized int8s or int16s.
+  positions: Float32Array | Int16Array;
+  normals?: Float32Array | Int8Array | Int16Array;
+  normalRefs?: Uint16Array | Uint32Array;
   texCoords?: Float32Array;
-  materialRefs?: Uint16Array;
-  indices: Uint16Array;
+  materialRefs?: Uint16Array | Uint32Array;
+  // Uint32Array for meshes with more vertices than 16 bits can index, unless split into sub-meshes.
+  indices: Uint16Array | Uint32Array;
+  // Per sub-mesh: first index, index count, base vertex, and vertex count. Indices are relative to the base vertex.
+  subMeshes?: Uint32Array;
+  // For quantized positions, position = normalized value * scale + offset.
+  positionScale?: Float32Array;
+  positionOffset?: Float32Array;
+  // Culling volumes from models/build.py. Box min and max, then sphere center and radius.
+  bounds?: Float32Array;
+  // Per material: index, then as bounds.
+  materialBounds?: Float32Array;
+  // Per meshlet: first index and index count.
+  meshlets?: Uint32Array;
+  // Per meshlet: sphere center and radius, normal cone apex, axis, and cutoff.
+  meshletBounds?: Float32Array;
   // For instanced drawing, one mat4 per instance.
   instanceModelTransforms?: Float32Array;
   instanceColors?: Float32Array;
@@ -39,17 +61,25 @@ export type MeshData = {
   };
 };
 
+/** A range of a split mesh's indices with a vertex array whose per-vertex attributes start at its base vertex. */
+export type SubMesh = {
+  vertexArray: WebGLVertexArrayObject;
+  firstIndex: number;
+  indexCount: number;
+};
+
 export type Mesh = {
   vertexArray: WebGLVertexArrayObject;
   indexBuffer: WebGLBuffer;
+  indexType: number;
   elementCount: number;
+  subMeshes?: SubMesh[];
 
   positionBuffer?: WebGLBuffer;
   normalBuffer?: WebGLBuffer;
   normalRefBuffer?: WebGLBuffer;
   materialRefBuffer?: WebGLBuffer;
   texture?: WebGLTexture;
-  textureUniformLocation?: WebGLUniformLocation;
   texCoordBuffer?: WebGLBuffer;
   instanceModelTransformBuffer?: WebGLBuffer;
   instanceModelTransforms?: Float32Array; // Backing data.
@@ -57,12 +87,14 @@ export type Mesh = {
   instanceColors?: Float32Array; // Backing data.
   instanceCount?: number;
   instanceLimit?: number;
+  positionScale?: Float32Array;
+  positionOffset?: Float32Array;
 };
 
 export type WireData = {
   positions: Float32Array;
   directions: Float32Array;
-  indices: Uint16Array;
+  indices: Uint16Array | Uint32Array;
   // For instanced drawing, one mat4 per instance.
   instanceModelTransforms?: Float32Array;
   usage?: {
@@ -75,7 +107,9 @@ export type WireData = {
 export type Wire = {
   vertexArray: WebGLVertexArrayObject;
   indexBuffer: WebGLBuffer;
+  indexType: number;
   elementCount: number;
+  subMeshes?: SubMesh[];
   positionBuffer: WebGLBuffer;
   directionBuffer: WebGLBuffer;
   instanceModelTransformBuffer?: WebGLBuffer;
@@ -93,11 +127,22 @@ const GL_INT_TYPES: number[] = [
   WebGL2RenderingContext.UNSIGNED_INT
 ];
 
+const GL_TYPE_BYTE_SIZES: { [type: number]: number } = {
+  [WebGL2RenderingContext.BYTE]: 1,
+  [WebGL2RenderingContext.UNSIGNED_BYTE]: 1,
+  [WebGL2RenderingContext.SHORT]: 2,
+  [WebGL2RenderingContext.UNSIGNED_SHORT]: 2,
+  [WebGL2RenderingContext.INT]: 4,
+  [WebGL2RenderingContext.UNSIGNED_INT]: 4,
+  [WebGL2RenderingContext.FLOAT]: 4,
+};
+
 /** Container for the WebGL details of rendering meshes: one-time preparation and per-frame drawing. */
 @Injectable({ providedIn: 'root' })
 export class MeshRenderingService {
   constructor(
     private readonly depthBufferService: DepthBufferService,
+    private readonly flyThruSettingsService: FlyThruSettingsService,
     private readonly glService: GlService,
     private readonly shaderService: ShaderService,
     private readonly textureService: TextureService,
@@ -108,8 +153,30 @@ export class MeshRenderingService {
     const gl = this.glService.gl;
     const vertexArray = gl.createVertexArray()!;
     gl.bindVertexArray(vertexArray);
-    const positionBuffer = this.prepareBuffer(IN_POSITION_LOCATION, meshData.positions, meshData.usage?.positions);
-    const normalBuffer = this.prepareBuffer(IN_NORMAL_LOCATION, meshData.normals!, meshData.usage?.normals);
+    let positionBuffer, normalBuffer;
+    if (meshData.positionScale) {
+      positionBuffer = this.prepareBuffer(
+        IN_POSITION_LOCATION,
+        meshData.positions,
+        meshData.usage?.positions,
+        3,
+        gl.SHORT,
+        0,
+        true,
+      );
+      normalBuffer = this.prepareBuffer(
+        IN_NORMAL_LOCATION,
+        meshData.normals!,
+        meshData.usage?.normals,
+        2,
+        meshData.normals instanceof Int8Array ? gl.BYTE : gl.SHORT,
+        0,
+        true,
+      );
+    } else {
+      positionBuffer = this.prepareBuffer(IN_POSITION_LOCATION, meshData.positions, meshData.usage?.positions);
+      normalBuffer = this.prepareBuffer(IN_NORMAL_LOCATION, meshData.normals!, meshData.usage?.normals);
+    }
     let instanceColorBuffer, materialRefBuffer;
     // If both are provided, we're favoring the instance colors.
     if (meshData.instanceColors) {
@@ -127,7 +194,7 @@ export class MeshRenderingService {
         meshData.materialRefs!,
         meshData.usage?.materialRefs,
         1,
-        gl.UNSIGNED_SHORT,
+        this.unsignedType(meshData.materialRefs!),
       );
     }
     const indexBuffer = this.prepareIndexBuffer(meshData.indices);
@@ -137,6 +204,7 @@ export class MeshRenderingService {
     );
     const elementCount = meshData.indices.length;
     const instanceCount = meshData.instanceModelTransforms ? meshData.instanceModelTransforms.length / 16 : 0;
+    const subMeshes = this.prepareSubMeshes(vertexArray, indexBuffer, meshData.subMeshes);
 
     gl.bindBuffer(gl.ARRAY_BUFFER, null);
     gl.bindVertexArray(null);
@@ -144,13 +212,17 @@ export class MeshRenderingService {
     const mesh: Mesh = {
       vertexArray,
       indexBuffer,
+      indexType: this.unsignedType(meshData.indices),
       elementCount,
+      subMeshes,
       instanceCount,
       positionBuffer,
       normalBuffer,
       materialRefBuffer,
       instanceColorBuffer,
       instanceModelTransformBuffer,
+      positionScale: meshData.positionScale,
+      positionOffset: meshData.positionOffset,
     };
     if (updatable) {
       mesh.instanceModelTransforms = meshData.instanceModelTransforms;
@@ -162,34 +234,26 @@ export class MeshRenderingService {
   /** Renders a previously prepared color facet mesh.  */
   public renderColoredMesh(mesh: Mesh): void {
     const gl = this.glService.gl;
-    const program = this.shaderService.getProgram(
-      mesh.instanceColorBuffer
-        ? 'instance_colored_mesh'
-        : mesh.instanceCount
-          ? 'colored_mesh_instances'
-          : 'colored_mesh',
-    );
+    const materialFeature = mesh.instanceColorBuffer ? 0 : MATERIAL_REFS_SHADER_FEATURE;
+    const quantizedFeature = mesh.positionScale ? QUANTIZED_SHADER_FEATURE : 0;
+    const features = this.instancedFeature(mesh) | materialFeature | quantizedFeature | this.shadowsFeature;
+    const program = this.shaderService.getProgram('colored_mesh', features);
     gl.useProgram(program);
-    this.depthBufferService.bindDepthTexture(program);
-    gl.bindVertexArray(mesh.vertexArray);
-    gl.bindBuffer(gl.ELEMENT_ARRAY_BUFFER, mesh.indexBuffer);
-    if (mesh.instanceCount) {
-      gl.drawElementsInstanced(
-        gl.TRIANGLES,
-        mesh.elementCount,
-        gl.UNSIGNED_SHORT,
-        0,
-        mesh.instanceLimit ?? mesh.instanceCount,
-      );
-    } else {
-      gl.drawElements(gl.TRIANGLES, mesh.elementCount, gl.UNSIGNED_SHORT, 0);
+    this.depthBufferService.bindDepthTexture();
+    if (mesh.positionScale) {
+      // Constant attribute values aren't vertex array state, so they're set for each draw.
+      gl.vertexAttrib3fv(IN_POSITION_SCALE_LOCATION, mesh.positionScale);
+      gl.vertexAttrib3fv(IN_POSITION_OFFSET_LOCATION, mesh.positionOffset!);
     }
+    const instanceCount = mesh.instanceCount ? mesh.instanceLimit ?? mesh.instanceCount : undefined;
+    this.drawElements(gl.TRIANGLES, mesh, instanceCount);
     gl.bindBuffer(gl.ARRAY_BUFFER, null);
     gl.bindVertexArray(null);
   }
 
   /** Prepares a mesh for an updatable buckled member bending in a parabola. */
   public prepareBuckledMemberMesh(meshData: MeshData): Mesh {
+    this.checkNotQuantized(meshData);
     const gl = this.glService.gl;
     const vertexArray = gl.createVertexArray()!;
     gl.bindVertexArray(vertexArray);
@@ -199,7 +263,7 @@ export class MeshRenderingService {
       meshData.normalRefs!,
       meshData.usage?.normalRefs,
       1,
-      gl.UNSIGNED_SHORT,
+      this.unsignedType(meshData.normalRefs!),
     );
     const indexBuffer = this.prepareIndexBuffer(meshData.indices);
     const instanceModelTransformBuffer = this.prepareInstanceModelTransformBuffer(
@@ -208,12 +272,15 @@ export class MeshRenderingService {
     );
     const elementCount = meshData.indices.length;
     const instanceCount = meshData.instanceModelTransforms ? meshData.instanceModelTransforms.length / 16 : 0;
+    const subMeshes = this.prepareSubMeshes(vertexArray, indexBuffer, meshData.subMeshes);
     gl.bindBuffer(gl.ELEMENT_ARRAY_BUFFER, null);
     gl.bindVertexArray(null);
     return {
       vertexArray,
       indexBuffer,
+      indexType: this.unsignedType(meshData.indices),
       elementCount,
+      subMeshes,
       instanceCount,
       positionBuffer,
       normalRefBuffer,
@@ -225,18 +292,17 @@ export class MeshRenderingService {
   /** Renders a buckled member mesh. */
   public renderBuckledMemberMesh(mesh: Mesh) {
     const gl = this.glService.gl;
-    const program = this.shaderService.getProgram('buckling_member');
+    const program = this.shaderService.getProgram('buckling_member', this.shadowsFeature);
     gl.useProgram(program);
-    this.depthBufferService.bindDepthTexture(program);
-    gl.bindVertexArray(mesh.vertexArray);
-    gl.bindBuffer(gl.ELEMENT_ARRAY_BUFFER, mesh.indexBuffer);
-    gl.drawElementsInstanced(gl.TRIANGLES, mesh.elementCount, gl.UNSIGNED_SHORT, 0, mesh.instanceCount!);
+    this.depthBufferService.bindDepthTexture();
+    this.drawElements(gl.TRIANGLES, mesh, mesh.instanceCount!);
     gl.bindBuffer(gl.ELEMENT_ARRAY_BUFFER, null);
     gl.bindVertexArray(null);
   }
 
   /** Prepares a colored mesh for drawing. Not updatable. */
   public prepareTexturedMesh(meshData: MeshData, textureUrl: TextureUrl): Mesh {
+    this.checkNotQuantized(meshData);
     const gl = this.glService.gl;
 
     const vertexArray = gl.createVertexArray()!;
@@ -251,27 +317,20 @@ export class MeshRenderingService {
     );
     const texture = this.textureService.getTexture(textureUrl);
 
-    let programName, instanceCount;
-    if (meshData.instanceModelTransforms) {
-      programName = 'textured_mesh_instances';
-      instanceCount = meshData.instanceModelTransforms.length / 16;
-    } else {
-      programName = 'textured_mesh';
-      instanceCount = 0;
-    }
-    const program = this.shaderService.getProgram(programName);
-    const textureUniformLocation = gl.getUniformLocation(program, 'meshTexture')!;
+    const instanceCount = meshData.instanceModelTransforms ? meshData.instanceModelTransforms.length / 16 : 0;
     const elementCount = meshData.indices.length;
+    const subMeshes = this.prepareSubMeshes(vertexArray, indexBuffer, meshData.subMeshes);
 
     // Not clearing texture and vertex array bindings because I don't understand semantics re async image load.
 
     return {
       vertexArray,
       indexBuffer,
+      indexType: this.unsignedType(meshData.indices),
       elementCount,
+      subMeshes,
       instanceCount,
       texture,
-      textureUniformLocation,
       positionBuffer,
       normalBuffer,
       texCoordBuffer,
@@ -281,23 +340,15 @@ export class MeshRenderingService {
 
   public renderTexturedMesh(mesh: Mesh): void {
     const gl = this.glService.gl;
-    const program = this.shaderService.getProgram(mesh.instanceCount ? 'textured_mesh_instances' : 'textured_mesh');
+    const program = this.shaderService.getProgram('textured_mesh', this.instancedFeature(mesh) | this.shadowsFeature);
     gl.useProgram(program);
-    this.depthBufferService.bindDepthTexture(program);
-    gl.bindVertexArray(mesh.vertexArray);
-    // TODO: Experiment with doing this once, not once per frame. Possible because we have fewer textures than units?
-    // Then no texture location would be needed in the mesh data.
+    this.depthBufferService.bindDepthTexture();
+    // The program's sampler is bound to the texture unit when linked.
     if (this.glService.isRenderingDisplay) {
-      gl.uniform1i(mesh.textureUniformLocation!, FACIA_TEXTURE_UNIT);
       gl.activeTexture(gl.TEXTURE0 + FACIA_TEXTURE_UNIT);
       gl.bindTexture(gl.TEXTURE_2D, mesh.texture!);
     }
-    gl.bindBuffer(gl.ELEMENT_ARRAY_BUFFER, mesh.indexBuffer);
-    if (mesh.instanceCount) {
-      gl.drawElementsInstanced(gl.TRIANGLES, mesh.elementCount, gl.UNSIGNED_SHORT, 0, mesh.instanceCount);
-    } else {
-      gl.drawElements(gl.TRIANGLES, mesh.elementCount, gl.UNSIGNED_SHORT, 0);
-    }
+    this.drawElements(gl.TRIANGLES, mesh, mesh.instanceCount || undefined);
     gl.bindBuffer(gl.ARRAY_BUFFER, null);
     gl.bindVertexArray(null);
   }
@@ -333,6 +384,7 @@ export class MeshRenderingService {
 
   /** Prepares a terrain mesh. */
   public prepareTerrainMesh(meshData: MeshData): Mesh {
+    this.checkNotQuantized(meshData);
     const gl = this.glService.gl;
 
     const vertexArray = gl.createVertexArray()!;
@@ -340,23 +392,23 @@ export class MeshRenderingService {
     const positionBuffer = this.prepareBuffer(IN_POSITION_LOCATION, meshData.positions, meshData.usage?.positions);
     const normalBuffer = this.prepareBuffer(IN_NORMAL_LOCATION, meshData.normals!, meshData.usage?.normals);
     const indexBuffer = this.prepareIndexBuffer(meshData.indices);
+    const indexType = this.unsignedType(meshData.indices);
     const elementCount = meshData.indices.length;
+    const subMeshes = this.prepareSubMeshes(vertexArray, indexBuffer, meshData.subMeshes);
 
     gl.bindBuffer(gl.ARRAY_BUFFER, null);
     gl.bindVertexArray(null);
 
-    return { vertexArray, indexBuffer, elementCount, positionBuffer, normalBuffer };
+    return { vertexArray, indexBuffer, indexType, elementCount, subMeshes, positionBuffer, normalBuffer };
   }
 
   /** Renders a previously prepared terrain mesh.  */
   public renderTerrainMesh(mesh: Mesh) {
     const gl = this.glService.gl;
-    const program = this.shaderService.getProgram('terrain');
+    const program = this.shaderService.getProgram('terrain', this.shadowsFeature);
     gl.useProgram(program);
-    this.depthBufferService.bindDepthTexture(program);
-    gl.bindVertexArray(mesh.vertexArray);
-    gl.bindBuffer(gl.ELEMENT_ARRAY_BUFFER, mesh.indexBuffer);
-    gl.drawElements(gl.TRIANGLES, mesh.elementCount, gl.UNSIGNED_SHORT, 0);
+    this.depthBufferService.bindDepthTexture();
+    this.drawElements(gl.TRIANGLES, mesh);
     gl.bindBuffer(gl.ARRAY_BUFFER, null);
     gl.bindVertexArray(null);
   }
@@ -370,27 +422,22 @@ export class MeshRenderingService {
 
     const positionBuffer = this.prepareBuffer(IN_POSITION_LOCATION, meshData.positions, meshData.usage?.positions, 2);
     const indexBuffer = this.prepareIndexBuffer(meshData.indices);
+    const indexType = this.unsignedType(meshData.indices);
     const texture = this.textureService.getTexture('img/water.jpg');
-    const program = this.shaderService.getProgram('river');
-    const textureUniformLocation = gl.getUniformLocation(program, 'water')!;
     const elementCount = meshData.indices.length;
 
-    return { vertexArray, indexBuffer, elementCount, texture, textureUniformLocation, positionBuffer };
+    return { vertexArray, indexBuffer, indexType, elementCount, texture, positionBuffer };
   }
 
   /** Renders the already prepared river mesh. */
   public renderRiverMesh(mesh: Mesh) {
     const gl = this.glService.gl;
-    const program = this.shaderService.getProgram('river');
+    const program = this.shaderService.getProgram('river', this.shadowsFeature);
     gl.useProgram(program);
-    this.depthBufferService.bindDepthTexture(program);
-    // TODO: Experiment with doing this once, not once per frame. Possible because we have fewer textures than units?
-    gl.uniform1i(mesh.textureUniformLocation!, WATER_TEXTURE_UNIT);
+    this.depthBufferService.bindDepthTexture();
     gl.activeTexture(gl.TEXTURE0 + WATER_TEXTURE_UNIT);
     gl.bindTexture(gl.TEXTURE_2D, mesh.texture!);
-    gl.bindVertexArray(mesh.vertexArray);
-    gl.bindBuffer(gl.ELEMENT_ARRAY_BUFFER, mesh.indexBuffer);
-    gl.drawElements(gl.TRIANGLES, mesh.elementCount, gl.UNSIGNED_SHORT, 0);
+    this.drawElements(gl.TRIANGLES, mesh);
     gl.bindBuffer(gl.ELEMENT_ARRAY_BUFFER, null);
     gl.bindVertexArray(null);
   }
@@ -417,6 +464,7 @@ export class MeshRenderingService {
       positionBuffer,
       directionBuffer,
       indexBuffer,
+      indexType: this.unsignedType(wireData.indices),
       elementCount,
       instanceCount,
       instanceModelTransformBuffer,
@@ -430,14 +478,8 @@ export class MeshRenderingService {
   /** Renders the already prepared wire. */
   public renderWire(wire: Wire) {
     const gl = this.glService.gl;
-    gl.useProgram(this.shaderService.getProgram(wire.instanceCount ? 'wire_instances' : 'wire'));
-    gl.bindVertexArray(wire.vertexArray);
-    gl.bindBuffer(gl.ELEMENT_ARRAY_BUFFER, wire.indexBuffer);
-    if (wire.instanceCount) {
-      gl.drawElementsInstanced(gl.LINES, wire.elementCount, gl.UNSIGNED_SHORT, 0, wire.instanceCount);
-    } else {
-      gl.drawElements(gl.LINES, wire.elementCount, gl.UNSIGNED_SHORT, 0);
-    }
+    gl.useProgram(this.shaderService.getProgram('wire', this.instancedFeature(wire)));
+    this.drawElements(gl.LINES, wire, wire.instanceCount || undefined);
     gl.bindBuffer(gl.ARRAY_BUFFER, null);
     gl.bindVertexArray(null);
   }
@@ -464,6 +506,7 @@ export class MeshRenderingService {
     // nb: mesh texture is owned by TextureService and so not deleted here.
     const gl = this.glService.gl;
     gl.deleteVertexArray(mesh.vertexArray);
+    mesh.subMeshes?.forEach(subMesh => gl.deleteVertexArray(subMesh.vertexArray));
     gl.deleteBuffer(mesh.indexBuffer);
     if (mesh.positionBuffer) {
       gl.deleteBuffer(mesh.positionBuffer);
@@ -488,6 +531,24 @@ export class MeshRenderingService {
     }
   }
 
+  /** Shader feature bits for shadows unless they're turned off. */
+  private get shadowsFeature(): number {
+    return this.flyThruSettingsService.settings.noShadows ? 0 : SHADOWS_SHADER_FEATURE;
+  }
+
+  /** Shader feature bits for instanced drawing of the given mesh or wire if it has instances. */
+  private instancedFeature(meshOrWire: Mesh | Wire): number {
+    return meshOrWire.instanceCount ? INSTANCED_SHADER_FEATURE : 0;
+  }
+
+  /** Only colored mesh shaders decode quantized positions and normals. */
+  private checkNotQuantized(meshData: MeshData): void {
+    if (meshData.positionScale) {
+      throw new Error('Quantized mesh data is only supported for colored meshes');
+    }
+  }
+
+  /** Prepares an attribute buffer. Normalized integer data is read as floats in [-1, 1], else as integers. */
   private prepareBuffer(
     location: number,
     data: ArrayBufferView,
@@ -495,13 +556,16 @@ export class MeshRenderingService {
     size: number = 3,
     type: number = this.glService.gl.FLOAT,
     divisor: number = 0,
+    normalized: boolean = false,
   ): WebGLBuffer {
     const gl = this.glService.gl;
     const buffer = gl.createBuffer()!;
     gl.bindBuffer(gl.ARRAY_BUFFER, buffer);
     gl.bufferData(gl.ARRAY_BUFFER, data, usage);
     gl.enableVertexAttribArray(location);
-    if (GL_INT_TYPES.includes(type)) {
+    if (normalized) {
+      gl.vertexAttribPointer(location, size, type, true, 0, 0);
+    } else if (GL_INT_TYPES.includes(type)) {
       gl.vertexAttribIPointer(location, size, type, 0, 0);
     } else {
       gl.vertexAttribPointer(location, size, type, false, 0, 0);
@@ -532,7 +596,102 @@ export class MeshRenderingService {
     return buffer;
   }
 
-  private prepareIndexBuffer(data: Uint16Array): WebGLBuffer {
+  /** Returns the GL type of the given indices or references. */
+  private unsignedType(array: Uint16Array | Uint32Array): number {
+    return array instanceof Uint32Array ? this.glService.gl.UNSIGNED_INT : this.glService.gl.UNSIGNED_SHORT;
+  }
+
+  /**
+   * Draws all the elements of a mesh or wire, instanced if an instance count is given. A split mesh is drawn a
+   * sub-mesh at a time.
+   */
+  private drawElements(mode: number, meshOrWire: Mesh | Wire, instanceCount?: number): void {
+    const gl = this.glService.gl;
+    const bytesPerIndex = GL_TYPE_BYTE_SIZES[meshOrWire.indexType];
+    const subMeshes = meshOrWire.subMeshes ?? [
+      { vertexArray: meshOrWire.vertexArray, firstIndex: 0, indexCount: meshOrWire.elementCount },
+    ];
+    for (const { vertexArray, firstIndex, indexCount } of subMeshes) {
+      gl.bindVertexArray(vertexArray);
+      gl.bindBuffer(gl.ELEMENT_ARRAY_BUFFER, meshOrWire.indexBuffer);
+      const offset = firstIndex * bytesPerIndex;
+      if (instanceCount === undefined) {
+        gl.drawElements(mode, indexCount, meshOrWire.indexType, offset);
+      } else {
+        gl.drawElementsInstanced(mode, indexCount, meshOrWire.indexType, offset, instanceCount);
+      }
+    }
+  }
+
+  /**
+   * Returns a vertex array for each of the given sub-meshes, copying the attributes of the given one with per-vertex
+   * attributes offset to the sub-mesh's base vertex. WebGL 2 has no base vertex draws, so this lets 16-bit indices
+   * reach all vertices of a split mesh. Buffers are shared. None if the mesh isn't split.
+   */
+  private prepareSubMeshes(
+    vertexArray: WebGLVertexArrayObject,
+    indexBuffer: WebGLBuffer,
+    subMeshes: Uint32Array | undefined,
+  ): SubMesh[] | undefined {
+    if (!subMeshes) {
+      return undefined;
+    }
+    const gl = this.glService.gl;
+    gl.bindVertexArray(vertexArray);
+    const attributes: {
+      location: number;
+      buffer: WebGLBuffer;
+      size: number;
+      type: number;
+      normalized: boolean;
+      integer: boolean;
+      stride: number;
+      divisor: number;
+      offset: number;
+    }[] = [];
+    const locationCount: number = gl.getParameter(gl.MAX_VERTEX_ATTRIBS);
+    for (let location = 0; location < locationCount; ++location) {
+      if (!gl.getVertexAttrib(location, gl.VERTEX_ATTRIB_ARRAY_ENABLED)) {
+        continue;
+      }
+      attributes.push({
+        location,
+        buffer: gl.getVertexAttrib(location, gl.VERTEX_ATTRIB_ARRAY_BUFFER_BINDING) as WebGLBuffer,
+        size: gl.getVertexAttrib(location, gl.VERTEX_ATTRIB_ARRAY_SIZE) as number,
+        type: gl.getVertexAttrib(location, gl.VERTEX_ATTRIB_ARRAY_TYPE) as number,
+        normalized: gl.getVertexAttrib(location, gl.VERTEX_ATTRIB_ARRAY_NORMALIZED) as boolean,
+        integer: gl.getVertexAttrib(location, gl.VERTEX_ATTRIB_ARRAY_INTEGER) as boolean,
+        stride: gl.getVertexAttrib(location, gl.VERTEX_ATTRIB_ARRAY_STRIDE) as number,
+        divisor: gl.getVertexAttrib(location, gl.VERTEX_ATTRIB_ARRAY_DIVISOR) as number,
+        offset: gl.getVertexAttribOffset(location, gl.VERTEX_ATTRIB_ARRAY_POINTER),
+      });
+    }
+    const result: SubMesh[] = [];
+    for (let i = 0; i < subMeshes.length; i += 4) {
+      const baseVertex = subMeshes[i + 2];
+      const subMeshVertexArray = gl.createVertexArray()!;
+      gl.bindVertexArray(subMeshVertexArray);
+      for (const { location, buffer, size, type, normalized, integer, stride, divisor, offset } of attributes) {
+        // Instance attributes aren't offset.
+        const vertexOffset = divisor ? 0 : baseVertex * (stride || size * GL_TYPE_BYTE_SIZES[type]);
+        gl.bindBuffer(gl.ARRAY_BUFFER, buffer);
+        gl.enableVertexAttribArray(location);
+        if (integer) {
+          gl.vertexAttribIPointer(location, size, type, stride, offset + vertexOffset);
+        } else {
+          gl.vertexAttribPointer(location, size, type, normalized, stride, offset + vertexOffset);
+        }
+        gl.vertexAttribDivisor(location, divisor);
+      }
+      gl.bindBuffer(gl.ELEMENT_ARRAY_BUFFER, indexBuffer);
+      result.push({ vertexArray: subMeshVertexArray, firstIndex: subMeshes[i], indexCount: subMeshes[i + 1] });
+    }
+    gl.bindBuffer(gl.ARRAY_BUFFER, null);
+    gl.bindVertexArray(vertexArray);
+    return result;
+  }
+
+  private prepareIndexBuffer(data: Uint16Array | Uint32Array): WebGLBuffer {
     const gl = this.glService.gl;
     const buffer = gl.createBuffer()!;
     gl.bindBuffer(gl.ELEMENT_ARRAY_BUFFER, buffer);
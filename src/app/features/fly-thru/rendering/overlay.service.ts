@@ -37,7 +37,6 @@ export type OverlayDescriptor = {
 export type Overlay = {
   vertexArray: WebGLVertexArrayObject;
   texture?: WebGLTexture;
-  textureUniformLocation: WebGLUniformLocation;
   positionBuffer: WebGLBuffer;
   alphaBuffer: WebGLBuffer;
   positions: Float32Array;
@@ -107,14 +106,10 @@ export class OverlayService {
     gl.vertexAttribPointer(IN_ALPHA_LOCATION, 1, gl.FLOAT, false, 0, 0);
     gl.vertexAttribDivisor(IN_ALPHA_LOCATION, 1);
 
-    const program = this.shaderService.getProgram('overlay');
-    const textureUniformLocation = gl.getUniformLocation(program, 'icons')!;
-
     const overlay: Overlay = {
       vertexArray,
       positionBuffer,
       alphaBuffer,
-      textureUniformLocation,
       positions,
       arePositionsDirty: true,
       alphas,
@@ -164,8 +159,6 @@ export class OverlayService {
     gl.useProgram(this.shaderService.getProgram('overlay'));
     gl.bindVertexArray(overlay.vertexArray);
 
-    // TODO: Experiment with doing this once, not once per frame. Possible because we have fewer textures than units?
-    gl.uniform1i(overlay.textureUniformLocation, OVERLAY_TEXTURE_UNIT);
     gl.activeTexture(gl.TEXTURE0 + OVERLAY_TEXTURE_UNIT);
     gl.bindTexture(gl.TEXTURE_2D_ARRAY, overlay.texture);
 
@@ -53,7 +53,6 @@ export class SkyRenderingService {
 
   private indexBuffer!: WebGLBuffer;
   private skyBoxTexture!: WebGLTexture;
-  private skyBoxUniformLocation!: WebGLUniformLocation;
   private vertexArray!: WebGLVertexArrayObject;
 
   constructor(
@@ -66,8 +65,6 @@ export class SkyRenderingService {
   public prepare() {
     const gl = this.glService.gl;
     this.skyBoxTexture = this.textureService.getTexture('skybox');
-    const program = this.shaderService.getProgram('sky');
-    this.skyBoxUniformLocation = gl.getUniformLocation(program, 'skybox')!;
     this.vertexArray = Utility.assertNotNull(gl.createVertexArray());
     gl.bindVertexArray(this.vertexArray);
     const positionBuffer = Utility.assertNotNull(gl.createBuffer());
@@ -89,8 +86,6 @@ export class SkyRenderingService {
     const gl = this.glService.gl;
     gl.useProgram(this.shaderService.getProgram('sky'));
     gl.depthFunc(gl.LEQUAL);
-    // TODO: Experiment with doing this once, not once per frame. Possible because we have fewer textures than units?
-    gl.uniform1i(this.skyBoxUniformLocation, SKYBOX_TEXTURE_UNIT);
     gl.activeTexture(gl.TEXTURE0 + SKYBOX_TEXTURE_UNIT);
     gl.bindTexture(gl.TEXTURE_CUBE_MAP, this.skyBoxTexture);
     gl.bindVertexArray(this.vertexArray);
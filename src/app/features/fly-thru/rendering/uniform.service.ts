@@ -3,7 +3,6 @@
 
 import { Injectable } from '@angular/core';
 import { Utility } from '../../../shared/classes/utility';
-import { ShaderService } from '../shaders/shader.service';
 import { MATERIAL_CONFIG } from '../models/materials';
 import {
   TRANSFORMS_UBO_BINDING_INDEX,
@@ -12,6 +11,8 @@ import {
   TIME_UBO_BINDING_INDEX,
   SKYBOX_TRANSFORMS_UBO_BINDING_INDEX,
 } from '../shaders/constants';
+import { getBlockMember } from '../shaders/shader-reflection';
+import { UNIFORM_BLOCK_LAYOUTS } from '../shaders/shaders';
 import { mat4 } from 'gl-matrix';
 import { GlService } from './gl.service';
 import { UNIT_LIGHT_DIRECTION } from './constants';
@@ -43,11 +44,11 @@ export class UniformService {
   private modelTransformStackPointer: number = 0;
   /** Preallocated model transform stack. Typed array creation is slow. */
   private readonly modelTransformStack = [mat4.create(), mat4.create(), mat4.create(), mat4.create()];
-  // One backing store buffer matching the uniform block with two matrix views.
-  private readonly transformsUniformStore = new ArrayBuffer(192); // 3 each 4x4 floats
-  private readonly modelViewMatrix = new Float32Array(this.transformsUniformStore, 0, 16);
-  private readonly modelViewProjectionMatrix = new Float32Array(this.transformsUniformStore, 64, 16);
-  private readonly depthMapLookupMatrix = new Float32Array(this.transformsUniformStore, 128, 16);
+  // One backing store buffer matching the uniform block with three matrix views at the member offsets.
+  private readonly transformsUniformStore = new ArrayBuffer(UNIFORM_BLOCK_LAYOUTS['Transforms'].size);
+  private readonly modelViewMatrix = this.transformsMatrix('modelView');
+  private readonly modelViewProjectionMatrix = this.transformsMatrix('modelViewProjection');
+  private readonly depthMapLookupMatrix = this.transformsMatrix('depthMapLookup');
   private readonly skyboxTransformsFloats = new Float32Array(16);
   // prettier-ignore
   private readonly lightConfig = new Float32Array([
@@ -61,78 +62,28 @@ export class UniformService {
   // Last 3 of chunk aren't currently used.
   public readonly time = new Float32Array(4);
 
-  constructor(
-    private readonly glService: GlService,
-    private readonly shaderService: ShaderService,
-  ) {}
+  constructor(private readonly glService: GlService) {}
 
-  /** Sets up all uniforms except textures. */
+  /**
+   * Sets up buffers for all uniform blocks. Shader service binds programs' blocks to them when linked.
+   * Textures are bound elsewhere.
+   */
   public prepareUniforms(): void {
     const gl = this.glService.gl;
-    const bucklingMemberProgram = this.shaderService.getProgram('buckling_member');
-    const facetMeshProgram = this.shaderService.getProgram('colored_mesh');
-    const facetMeshInstancesProgram = this.shaderService.getProgram('colored_mesh_instances');
-    const instanceColoredMeshProgram = this.shaderService.getProgram('instance_colored_mesh');
-    const riverProgram = this.shaderService.getProgram('river');
-    const skyProgram = this.shaderService.getProgram('sky');
-    const terrainProgram = this.shaderService.getProgram('terrain');
-    const texturedMeshProgram = this.shaderService.getProgram('textured_mesh');
-    const texturedMeshInstancesProgram = this.shaderService.getProgram('textured_mesh_instances');
-    const wireProgram = this.shaderService.getProgram('wire');
-    const wireInstancesProgram = this.shaderService.getProgram('wire_instances');
-
-    this.transformsBuffer = this.setUpUniformBlock(
-      [
-        bucklingMemberProgram,
-        facetMeshProgram,
-        facetMeshInstancesProgram,
-        instanceColoredMeshProgram,
-        riverProgram,
-        terrainProgram,
-        texturedMeshProgram,
-        texturedMeshInstancesProgram,
-        wireProgram,
-        wireInstancesProgram,
-      ],
-      'Transforms',
-      TRANSFORMS_UBO_BINDING_INDEX,
-    );
-    gl.bufferData(gl.UNIFORM_BUFFER, this.transformsUniformStore.byteLength, gl.DYNAMIC_DRAW);
-
+    this.transformsBuffer = this.setUpUniformBlock('Transforms', TRANSFORMS_UBO_BINDING_INDEX, gl.DYNAMIC_DRAW);
     this.skyboxTransformsBuffer = this.setUpUniformBlock(
-      [skyProgram],
       'SkyboxTransforms',
       SKYBOX_TRANSFORMS_UBO_BINDING_INDEX,
+      gl.DYNAMIC_DRAW,
     );
-    gl.bufferData(gl.UNIFORM_BUFFER, this.skyboxTransformsFloats.buffer.byteLength, gl.DYNAMIC_DRAW);
-
-    this.lightConfigBuffer = this.setUpUniformBlock(
-      [
-        bucklingMemberProgram,
-        facetMeshProgram,
-        facetMeshInstancesProgram,
-        instanceColoredMeshProgram,
-        riverProgram,
-        terrainProgram,
-        texturedMeshProgram,
-        texturedMeshInstancesProgram,
-        wireProgram,
-        wireInstancesProgram,
-      ],
-      'LightConfig',
-      LIGHT_CONFIG_UBO_BINDING_INDEX,
-    );
-    gl.bufferData(gl.UNIFORM_BUFFER, this.lightConfig.byteLength, gl.STATIC_DRAW);
-
+    this.lightConfigBuffer = this.setUpUniformBlock('LightConfig', LIGHT_CONFIG_UBO_BINDING_INDEX, gl.STATIC_DRAW);
     this.materialConfigBuffer = this.setUpUniformBlock(
-      [facetMeshProgram, facetMeshInstancesProgram],
       'MaterialConfig',
       MATERIAL_CONFIG_UBO_BINDING_INDEX,
+      gl.STATIC_DRAW,
+      MATERIAL_CONFIG,
     );
-    gl.bufferData(gl.UNIFORM_BUFFER, MATERIAL_CONFIG, gl.STATIC_DRAW);
-
-    this.timeBuffer = this.setUpUniformBlock([riverProgram], 'Time', TIME_UBO_BINDING_INDEX);
-    gl.bufferData(gl.UNIFORM_BUFFER, this.time, gl.DYNAMIC_DRAW);
+    this.timeBuffer = this.setUpUniformBlock('Time', TIME_UBO_BINDING_INDEX, gl.DYNAMIC_DRAW, this.time);
   }
 
   /** The current model matrix top of stack. */
@@ -216,12 +167,25 @@ export class UniformService {
     gl.bufferSubData(gl.UNIFORM_BUFFER, 0, this.time.buffer);
   }
 
-  /** Does boilerplate setup operations for a uniform block. */
-  private setUpUniformBlock(programs: WebGLProgram[], name: string, bindingIndex: number): WebGLBuffer {
+  /**
+   * Creates a buffer for the named uniform block with its std140 size, bound to the given index. Initializes
+   * it with given data, else leaves it empty.
+   */
+  private setUpUniformBlock(name: string, bindingIndex: number, usage: GLenum, data?: Float32Array): WebGLBuffer {
     const gl = this.glService.gl;
     const buffer = Utility.assertNotNull(gl.createBuffer());
     gl.bindBufferBase(gl.UNIFORM_BUFFER, bindingIndex, buffer);
-    programs.forEach(program => gl.uniformBlockBinding(program, gl.getUniformBlockIndex(program, name), bindingIndex));
+    const size = UNIFORM_BLOCK_LAYOUTS[name].size;
+    if (data && data.byteLength < size) {
+      throw new Error(`Uniform block ${name} data is ${data.byteLength} bytes. Need ${size}.`);
+    }
+    gl.bufferData(gl.UNIFORM_BUFFER, data ?? size, usage);
     return buffer;
   }
+
+  /** Returns a view of the transforms uniform store for the named matrix member. */
+  private transformsMatrix(memberName: string): Float32Array {
+    const member = getBlockMember(UNIFORM_BLOCK_LAYOUTS['Transforms'], memberName);
+    return new Float32Array(this.transformsUniformStore, member.offset, member.size >>> 2);
+  }
 }
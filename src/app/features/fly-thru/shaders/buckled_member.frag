@@ -11,11 +11,15 @@ layout(std140) uniform LightConfig {
   float shadowWeight;
 } light;
 
+#ifdef SHADOWS
 uniform sampler2DShadow depthMap;
+#endif
 
 in vec3 vertex;
 in vec3 normal;
+#ifdef SHADOWS
 in vec4 depthMapLookup;
+#endif
 out vec4 fragmentColor;
 
 const vec3 COLOR = vec3(1.0, 0.0, 0.0);
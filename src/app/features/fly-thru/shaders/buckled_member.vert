@@ -14,12 +14,12 @@ layout(std140) uniform Transforms {
 // Make VScode happy.
 #ifndef IN_POSITION_LOCATION
 #define IN_POSITION_LOCATION 0
-#define IN_NORMAL_REF 1
+#define IN_NORMAL_REF_LOCATION 1
 #define IN_INSTANCE_MODEL_TRANSFORM_LOCATION 4
 #endif
 
 layout(location = IN_POSITION_LOCATION) in vec3 inPosition;
-layout(location = IN_NORMAL_REF) in uint inNormalRef;
+layout(location = IN_NORMAL_REF_LOCATION) in uint inNormalRef;
 layout(location = IN_INSTANCE_MODEL_TRANSFORM_LOCATION) in mat4 inModelTransform;
 
 const mat4 UNIT_SQUARE = mat4(
@@ -1,115 +1,344 @@
 # Copyright (c) 2025-2026 Gene Ressler
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+import hashlib
+import json
 import os
 import re
 import sys
 
+import minify
+import preprocess
+import reflect
+import variants
+
 """
 Builds shaders.ts and constants.h.
 
-Converts each .vert and .frag file content to a multiline string, processing include directives, 
-preserving line numbers of the top level file.
+Converts each .vert and .frag file content to a multiline string, processing include directives,
+preserving line numbers of the top level file. Unless told not to, expands macros and evaluates
+conditionals (preprocess.py), then minifies the result with a GLSL tokenizer (minify.py).
+
+Builds each variant of each shader that a program spec in shader.service.ts lists, with the
+variant's features defined. Identical variants share one export. See variants.py. Emits tables
+of the shaders of each program, the programs of each spec's variants by feature mask, and the
+reflection of each program, checking that its shaders' interfaces agree. See reflect.py.
+
+Builds are incremental. The cache file records each shader's transitive includes, a hash
+of all its inputs, and the text and reflection of each variant. Only shaders with changed inputs
+are processed again. If none changed, shaders.ts isn't rewritten.
 """
 
+CACHE_FILE = ".shader-cache.json"
+SHADER_SERVICE_FILE = "shader.service.ts"
+CONSTANTS_FILE = "constants.ts"
+EMPTY_FRAGMENT_SHADER = "EMPTY_FRAGMENT_SHADER"
+INCLUDE_PATTERN = re.compile(r'build_include\s+"([^"]+)"$')
+
+
+class Sources:
+    """
+    Shader source files read during one build, each at most once, with the files each
+    includes directly and their expansions with includes.
+    """
 
-def readFileWithIncludes(file_name, depth=0):
-    if depth > 3:
-        raise Exception("Recursion too deep")
-    with open(file_name, "r") as input:
-        lines = input.readlines()
+    def __init__(self):
+        self.lines = {}
+        self.includes = {}
+        self.expansions = {}
+
+    def read(self, file_name):
+        """Reads the named file and finds its include directives unless already done."""
+        if file_name in self.lines:
+            return
+        with open(file_name, "r") as input:
+            lines = input.readlines()
+        includes = {}
         for index, line in enumerate(lines):
-            include_match = re.search(r'build_include\s+"([^"]+)"$', line)
+            include_match = INCLUDE_PATTERN.search(line)
             if include_match:
+                includes[index] = include_match.group(1)
+        self.lines[file_name] = lines
+        self.includes[file_name] = includes
+
+    def transitiveIncludes(self, file_name, depth=0):
+        """Returns the set of files the named one includes, directly or not."""
+        if depth > 3:
+            raise Exception("Recursion too deep")
+        self.read(file_name)
+        result = set()
+        for include_file_name in self.includes[file_name].values():
+            result.add(include_file_name)
+            result |= self.transitiveIncludes(include_file_name, depth + 1)
+        return result
+
+    def hash(self, file_name):
+        return hashlib.sha256("".join(self.lines[file_name]).encode()).hexdigest()
+
+    def readFileWithIncludes(self, file_name, depth=0):
+        if depth > 3:
+            raise Exception("Recursion too deep")
+        if file_name not in self.expansions:
+            self.read(file_name)
+            lines = self.lines[file_name].copy()
+            for index, include_file_name in self.includes[file_name].items():
                 lines[index] = (
-                    f"{readFileWithIncludes(include_match.group(1), depth + 1)}#line {index + 2}\n"
+                    f"{self.readFileWithIncludes(include_file_name, depth + 1)}#line {index + 2}\n"
                 )
-        return "".join(lines)
+            self.expansions[file_name] = "".join(lines)
+        return self.expansions[file_name]
+
+
+def writeIfChanged(file_name, content):
+    """Writes text to the named file unless it already has that content. Returns whether written."""
+    try:
+        with open(file_name, "r") as input:
+            if input.read() == content:
+                return False
+    except FileNotFoundError:
+        pass
+    with open(file_name, "w") as output:
+        output.write(content)
+    return True
+
+
+def buildConstants():
+    """Returns the text of constants.h, translated from constants.ts."""
+    lines = ["// This file is generated. Edit constants.ts instead.\n"]
+    with open(CONSTANTS_FILE, "r") as input:
+        for line in input.readlines():
+            if "build_stop_translation" in line:
+                break
+            lineStripped = line.strip()
+            if len(lineStripped) == 0 or lineStripped.startswith("//"):
+                continue
+            line = re.sub(
+                r"export\s+const\s+(\w+)\s*=\s*([^;]+);", r"#define \1 \2", line
+            )
+            lines.append(line)
+    return "".join(lines)
+
+
+def exportName(file_name, mask=0, features=None):
+    """Returns the name of the shaders.ts constant for the given shader file variant."""
+    var_name = os.path.splitext(file_name)[0].upper().replace("-", "_")
+    if mask:
+        var_name = variants.variantName(var_name, mask, features)
+    if file_name.endswith(".vert"):
+        var_name += "_VERTEX_SHADER"
+    elif file_name.endswith(".frag"):
+        var_name += "_FRAGMENT_SHADER"
+    return var_name
+
+
+def buildEntry(file_name, text, defines, noCompress, noProcessDefines):
+    """
+    Returns the shaders.ts text for the given shader file with includes expanded and the
+    named feature macros defined, and the text's reflection.
+    """
+    processed_text = preprocess.preprocess(text, defines)
+    reflection = reflect.reflectShader(processed_text, file_name.endswith(".vert"))
+    if noProcessDefines:
+        text = variants.withDefines(text, defines)
+    else:
+        text = processed_text
+    if not noCompress:
+        text = minify.minify(text)
+    if file_name.endswith(".vert"):
+        checkVertexShader(text)
+    return text, reflection
 
 
-def processDefines(text):
-    matches = re.findall(r"#define\s+(\w+)\s+(.*)", text)
-    text = re.sub(r"#define .*", "", text)
-    # Support two levels of #define expansion
-    for token, replacement in matches:
-        text = text.replace(token, replacement)
-    for token, replacement in matches:
-        text = text.replace(token, replacement)
-    return text
+def resolveShaders(shaders, requested, features):
+    """
+    Returns the text and reflection of each shaders.ts export by name and the export of
+    each shader variant by (unvaried export name, requested mask). Variants with identical
+    text share the export of the first.
+    """
+    exports = {}
+    names_by_hash = {}
+    shader_exports = {}
+    for file_name, entry in shaders.items():
+        name = exportName(file_name)
+        for mask in sorted(requested.get(name, {0})):
+            # Features the shader doesn't mention don't vary it.
+            variant_mask = mask & entry["mentioned"]
+            variant = entry["variants"][str(variant_mask)]
+            text_hash = hashlib.sha256(variant["text"].encode()).hexdigest()
+            if text_hash not in names_by_hash:
+                export_name = exportName(file_name, variant_mask, features)
+                names_by_hash[text_hash] = export_name
+                exports[export_name] = variant
+            shader_exports[name, mask] = names_by_hash[text_hash]
+    return exports, shader_exports
 
 
-def main(noCompress, noProcessDefines):
+def buildTables(specs, exports, shader_exports, features):
+    """
+    Returns the shaders.ts text of tables of the shaders of all programs, the programs of
+    all spec variants, reflections of all programs, and the widest layout of each uniform
+    block.
+    """
+    known = {name for name, _ in shader_exports}
+    for spec in specs:
+        shaders = [spec["vertex"], spec["fragment"]]
+        if spec["depthVertex"]:
+            shaders += [spec["depthVertex"], EMPTY_FRAGMENT_SHADER]
+        for shader in shaders:
+            if shader not in known:
+                raise Exception(f"{spec['name']}: missing shader {shader}")
+    program_shaders, program_variants = variants.resolvePrograms(
+        specs, shader_exports, EMPTY_FRAGMENT_SHADER, features
+    )
+    programs = {}
+    block_layouts = {}
+    for name, shaders in program_shaders.items():
+        vertex = exports[shaders["vertexShader"]]["reflection"]
+        fragment = exports[shaders["fragmentShader"]]["reflection"]
+        program = reflect.reflectProgram(name, vertex, fragment)
+        for block in program["blocks"]:
+            reflect.mergeBlockLayout(block_layouts, block)
+        # Layouts are listed once for all programs.
+        programs[name] = {**program, "blocks": [b["name"] for b in program["blocks"]]}
+    shaders_type = "{ [programName: string]: ProgramShaders }"
+    variants_type = "{ [specName: string]: { [features: number]: ProgramVariant } }"
+    programs_type = "{ [programName: string]: ProgramReflection }"
+    blocks_type = "{ [blockName: string]: UniformBlockReflection }"
+    return (
+        "\n// Shaders of each distinct program the specs in shader.service.ts need.\n"
+        f"export const PROGRAM_SHADERS: {shaders_type} = "
+        f"{reflect.toTypeScript(program_shaders)};\n"
+        "\n// Display and depth program of each spec variant by feature bits.\n"
+        f"export const PROGRAM_VARIANTS: {variants_type} = "
+        f"{reflect.toTypeScript(program_variants)};\n"
+        "\n// Interfaces of the programs.\n"
+        f"export const PROGRAM_REFLECTIONS: {programs_type} = "
+        f"{reflect.toTypeScript(programs)};\n"
+        "\n// Layout of each uniform block including all members any program declares.\n"
+        f"export const UNIFORM_BLOCK_LAYOUTS: {blocks_type} = "
+        f"{reflect.toTypeScript(block_layouts)};\n"
+    )
+
+
+def checkVertexShader(text):
+    """Reports uniforms and inputs defined more than once."""
+    uniforms = {}
+    ins = {}
+
+    matches = re.findall(r"uniform\s+(\w+)\s+(\w+)", text)
+    for match in matches:
+        uniformType, uniformId = match
+        if uniformId in uniforms or uniformId in ins:
+            print(f'  redefinition of "{uniformId}"')
+        uniforms[uniformId] = uniformType
+
+    matches = re.findall(
+        r"layout\s+\(location\s+=\s+(\d+)\)\s+in\s+(\w+)\s+(\w+)", text
+    )
+    for match in matches:
+        inLocation, inType, inId = match
+        if inId in uniforms or inId in ins:
+            print(f' redefinition of "{inId}"')
+        ins[inId] = (inLocation, inType)
+
+
+def inputKey(file_name, includes, sources, generator_version, settings):
+    """
+    Returns a hash of everything that determines the given shader's entry: its content,
+    that of everything it includes, the generator, and the command line settings.
+    """
+    key = {
+        "generator": generator_version,
+        "hashes": {name: sources.hash(name) for name in [file_name, *includes]},
+        "settings": settings,
+    }
+    return hashlib.sha256(json.dumps(key, sort_keys=True).encode()).hexdigest()
+
+
+def hashFile(file_name):
+    with open(file_name, "rb") as input:
+        return hashlib.sha256(input.read()).hexdigest()
+
+
+def generatorVersion():
+    """Returns a hash of this script and the modules beside it."""
+    directory = os.path.dirname(os.path.abspath(__file__))
+    modules = sorted(f for f in os.listdir(directory) if f.endswith(".py"))
+    hashes = [hashFile(os.path.join(directory, module)) for module in modules]
+    return hashlib.sha256("".join(hashes).encode()).hexdigest()
+
+
+def loadCache():
+    try:
+        with open(CACHE_FILE, "r") as input:
+            return json.load(input)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def main(noCompress, noProcessDefines, force=False):
     # Build constants.h from constants.ts. First so shader includes see any changes.
-    with open("constants.ts", "r") as input:
-        with open("constants.h", "w") as output:
-            print("// This file is generated. Edit constants.ts instead.", file=output)
-            for line in input.readlines():
-                if "build_stop_translation" in line:
-                    break
-                lineStripped = line.strip()
-                if len(lineStripped) == 0 or lineStripped.startswith("//"):
-                    continue
-                line = re.sub(
-                    r"export\s+const\s+(\w+)\s*=\s*([^;]+);", r"#define \1 \2", line
-                )
-                print(line, end="", file=output)
+    writeIfChanged("constants.h", buildConstants())
 
     shader_files = [f for f in os.listdir(".") if f.endswith((".vert", ".frag"))]
     # Sort key puts vertex before fragment shaders for readability.
     shader_files.sort(key=lambda file: file.replace(".vert", ".VERT"))
-    with open("shaders.ts", "w") as output:
-        print(
-            "// This file is generated. Edit .vert and .frag files instead.",
-            file=output,
-        )
-        file_count = 0
-        for file_name in shader_files:
-            print(f"{file_name}:")
-            file_count += 1
-            text = readFileWithIncludes(file_name)
-            if not noProcessDefines:
-                text = processDefines(text)
-            var_name = os.path.splitext(file_name)[0].upper().replace("-", "_")
-            if file_name.endswith(".vert"):
-                var_name += "_VERTEX_SHADER"
-            elif file_name.endswith(".frag"):
-                var_name += "_FRAGMENT_SHADER"
-            if not noCompress:
-                text = re.sub(r"#line.*", "", text)  # elide line directive
-                text = re.sub(r"#ifndef[\s\S]*?#endif", "", text)  # assume ifndef false
-                text = re.sub(r"//[^\n]*\n", " ", text)  # elide comments
-                text = re.sub(r"(#.*)", r"\1@", text)  # protect directive newlines
-                text = re.sub(r"\s+", " ", text)  # compress spaces including newlines
-                text = re.sub(r"\s?([=,*+\-/{}()])\s?", r"\1", text)  # unneeded spaces
-                text = re.sub(r"@", r"\n", text)  # unprotect directives
-                text = re.sub(r"^ ", r"", text, flags=re.MULTILINE)  # elide lead space
-                text = re.sub(r"; ", ";\n", text)  # add readability break after ;
-                text = re.sub(r"{", "{\n", text)  # add readability break after {
-            if file_count > 1:
-                print(file=output)
-            print(f"export const {var_name} = ", file=output)
-            print(f"`{text}`;", file=output)
-
-            uniforms = {}
-            ins = {}
-            if not file_name.endswith(".vert"):
-                continue
-
-            matches = re.findall(r"uniform\s+(\w+)\s+(\w+)", text)
-            for match in matches:
-                uniformType, uniformId = match
-                if uniformId in uniforms or uniformId in ins:
-                    print(f'  redefinition of "{uniformId}"')
-                uniforms[uniformId] = uniformType
+    cache = loadCache()
+    generator_version = generatorVersion()
+    features = variants.parseFeatures(CONSTANTS_FILE)
+    specs = variants.parseProgramSpecs(SHADER_SERVICE_FILE, features)
+    requested = variants.requestedMasks(specs, EMPTY_FRAGMENT_SHADER)
+    sources = Sources()
+    # Program specs are read for program and reflection tables.
+    new_cache = {"programSpecs": hashFile(SHADER_SERVICE_FILE), "shaders": {}}
+    for file_name in shader_files:
+        includes = sorted(sources.transitiveIncludes(file_name))
+        masks = sorted(requested.get(exportName(file_name), {0}))
+        settings = {
+            "noCompress": noCompress,
+            "noProcessDefines": noProcessDefines,
+            "features": features,
+            "masks": masks,
+        }
+        key = inputKey(file_name, includes, sources, generator_version, settings)
+        entry = cache.get("shaders", {}).get(file_name)
+        if not force and entry is not None and entry["key"] == key:
+            print(f"{file_name}: up to date")
+        else:
+            text = sources.readFileWithIncludes(file_name)
+            mentioned = variants.mentionedFeatures(text, features)
+            entry = {"key": key, "mentioned": mentioned, "variants": {}}
+            for variant_mask in sorted({mask & mentioned for mask in masks}):
+                print(f"{exportName(file_name, variant_mask, features)}:")
+                defines = variants.featureNames(variant_mask, features)
+                variant_text, reflection = buildEntry(
+                    file_name, text, defines, noCompress, noProcessDefines
+                )
+                variant = {"text": variant_text, "reflection": reflection}
+                entry["variants"][str(variant_mask)] = variant
+        new_cache["shaders"][file_name] = {**entry, "includes": includes}
 
-            matches = re.findall(
-                r"layout\s+\(location\s+=\s+(\d+)\)\s+in\s+(\w+)\s+(\w+)", text
-            )
-            for match in matches:
-                inLocation, inType, inId = match
-                if inId in uniforms or inId in ins:
-                    print(f' redefinition of "{inId}"')
-                ins[inId] = (inLocation, inType)
+    # Removed shaders count as changes, too.
+    if new_cache == cache and os.path.exists("shaders.ts"):
+        print("shaders.ts: up to date")
+        return
+    exports, shader_exports = resolveShaders(new_cache["shaders"], requested, features)
+    entries = [
+        f"export const {name} = \n`{export['text']}`;\n"
+        for name, export in exports.items()
+    ]
+    types = "ProgramReflection, ProgramShaders, ProgramVariant, UniformBlockReflection"
+    text = "// This file is generated. Edit .vert and .frag files instead.\n"
+    text += f"import {{ {types} }} from './shader-reflection';\n\n"
+    text += "\n".join(entries)
+    text += buildTables(specs, exports, shader_exports, features)
+    writeIfChanged("shaders.ts", text)
+    writeIfChanged(CACHE_FILE, json.dumps(new_cache, indent=2, sort_keys=True) + "\n")
 
 
-main("--no-compress" in sys.argv, "--no-process-defines" in sys.argv)
+if __name__ == "__main__":
+    main(
+        "--no-compress" in sys.argv,
+        "--no-process-defines" in sys.argv,
+        "--force" in sys.argv,
+    )
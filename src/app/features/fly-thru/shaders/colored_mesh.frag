@@ -11,6 +11,7 @@ layout(std140) uniform LightConfig {
   float shadowWeight;
 } light;
 
+#ifdef MATERIAL_REFS
 // Pack struct manually into vec4s to work around known hardware bugs.
 struct MaterialSpec {
   #define COLOR spec.xyz
@@ -22,21 +23,40 @@ layout(std140) uniform MaterialConfig {
   float globalAlpha;
   MaterialSpec specs[12];
 } materialConfig;
+#endif
 
+#ifdef SHADOWS
 uniform sampler2DShadow depthMap;
+#endif
 
 in vec3 vertex;
 in vec3 normal;
+#ifdef SHADOWS
 in vec4 depthMapLookup;
+#endif
+#ifdef MATERIAL_REFS
 flat in uint materialRef;
+#else
+in vec3 materialColor;
+#endif
 out vec4 fragmentColor;
 
+#ifndef MATERIAL_REFS
+const float MEMBER_SHININESS = 20.0;
+#endif
+
 void main() {
+#ifdef MATERIAL_REFS
   MaterialSpec materialSpec = materialConfig.specs[materialRef];
 
   #define ARG_materialColor materialSpec.COLOR
   #define ARG_materialShininess materialSpec.SHININESS
   #define ARG_materialAlpha materialConfig.globalAlpha
+#else
+  #define ARG_materialColor materialColor
+  #define ARG_materialShininess MEMBER_SHININESS
+  #define ARG_materialAlpha 1.0f
+#endif
 
   // build_include "lighting.h"
 }
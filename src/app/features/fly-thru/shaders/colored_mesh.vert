@@ -15,22 +15,71 @@ layout(std140) uniform Transforms {
 #define IN_POSITION_LOCATION 0
 #define IN_NORMAL_LOCATION 1
 #define IN_MATERIAL_REF_LOCATION 2
+#define IN_INSTANCE_COLOR_LOCATION 2
+#define IN_INSTANCE_MODEL_TRANSFORM_LOCATION 4
+#define IN_POSITION_SCALE_LOCATION 8
+#define IN_POSITION_OFFSET_LOCATION 9
 #endif
 
 layout(location = IN_POSITION_LOCATION) in vec3 inPosition;
+#ifdef QUANTIZED
+// Normalized int16 positions and octahedral normals in normalized int8s or int16s. See models/quantize.py.
+layout(location = IN_NORMAL_LOCATION) in vec2 inNormal;
+layout(location = IN_POSITION_SCALE_LOCATION) in vec3 inPositionScale;
+layout(location = IN_POSITION_OFFSET_LOCATION) in vec3 inPositionOffset;
+#else
 layout(location = IN_NORMAL_LOCATION) in vec3 inNormal;
+#endif
+#ifdef MATERIAL_REFS
 layout(location = IN_MATERIAL_REF_LOCATION) in uint inMaterialRef;
+#else
+layout(location = IN_INSTANCE_COLOR_LOCATION) in vec3 inColor;
+#endif
+#ifdef INSTANCED
+layout(location = IN_INSTANCE_MODEL_TRANSFORM_LOCATION) in mat4 inModelTransform;
+#endif
 
 out vec3 vertex;
 out vec3 normal;
 out vec4 depthMapLookup;
+#ifdef MATERIAL_REFS
 flat out uint materialRef;
+#else
+out vec3 materialColor;
+#endif
+
+#ifdef QUANTIZED
+vec3 octDecode(vec2 encoded) {
+  vec3 n = vec3(encoded, 1.0f - abs(encoded.x) - abs(encoded.y));
+  // Unfold the lower hemisphere.
+  float t = max(-n.z, 0.0f);
+  n.x += n.x >= 0.0f ? -t : t;
+  n.y += n.y >= 0.0f ? -t : t;
+  return normalize(n);
+}
+#endif
 
 void main() {
-  vec4 inPositionHomogeneous = vec4(inPosition, 1.0f);
+#ifdef QUANTIZED
+  vec3 position = inPosition * inPositionScale + inPositionOffset;
+  vec3 meshNormal = octDecode(inNormal);
+#else
+  vec3 position = inPosition;
+  vec3 meshNormal = inNormal;
+#endif
+#ifdef INSTANCED
+  vec4 inPositionHomogeneous = inModelTransform * vec4(position, 1.0f);
+  normal = mat3(transforms.modelView) * mat3(inModelTransform) * meshNormal;
+#else
+  vec4 inPositionHomogeneous = vec4(position, 1.0f);
+  normal = mat3(transforms.modelView) * meshNormal;
+#endif
   gl_Position = transforms.modelViewProjection * inPositionHomogeneous;
   vertex = vec3(transforms.modelView * inPositionHomogeneous);
   depthMapLookup = transforms.depthMapLookup * inPositionHomogeneous;
-  normal = mat3(transforms.modelView) * inNormal;
+#ifdef MATERIAL_REFS
   materialRef = inMaterialRef;
+#else
+  materialColor = inColor;
+#endif
 }
@@ -8,3 +8,5 @@
 #define IN_ALPHA_LOCATION 2
 #define IN_TEX_COORD_LOCATION 3
 #define IN_INSTANCE_MODEL_TRANSFORM_LOCATION 4
+#define IN_POSITION_SCALE_LOCATION 8
+#define IN_POSITION_OFFSET_LOCATION 9
@@ -15,6 +15,10 @@ export const IN_TEX_COORD_LOCATION = 3;
 export const IN_INSTANCE_MODEL_TRANSFORM_LOCATION = 4;
 // Above uses 5,6,7 implicitly.
 
+// Dequantization of int16 positions. Constant attributes set per draw, not arrays.
+export const IN_POSITION_SCALE_LOCATION = 8;
+export const IN_POSITION_OFFSET_LOCATION = 9;
+
 // build_stop_translation
 
 export const TRANSFORMS_UBO_BINDING_INDEX = 0;
@@ -22,3 +26,18 @@ export const LIGHT_CONFIG_UBO_BINDING_INDEX = 1;
 export const MATERIAL_CONFIG_UBO_BINDING_INDEX = 2;
 export const TIME_UBO_BINDING_INDEX = 3;
 export const SKYBOX_TRANSFORMS_UBO_BINDING_INDEX = 4;
+
+/** Binding index of each uniform block by name. */
+export const UNIFORM_BLOCK_BINDING_INDICES: { [blockName: string]: number } = {
+  Transforms: TRANSFORMS_UBO_BINDING_INDEX,
+  LightConfig: LIGHT_CONFIG_UBO_BINDING_INDEX,
+  MaterialConfig: MATERIAL_CONFIG_UBO_BINDING_INDEX,
+  Time: TIME_UBO_BINDING_INDEX,
+  SkyboxTransforms: SKYBOX_TRANSFORMS_UBO_BINDING_INDEX,
+};
+
+// Shader variant features. Each is a bit. See PROGRAM_SPECS in shader.service.ts.
+export const INSTANCED_SHADER_FEATURE = 1;
+export const SHADOWS_SHADER_FEATURE = 2;
+export const MATERIAL_REFS_SHADER_FEATURE = 4;
+export const QUANTIZED_SHADER_FEATURE = 8;
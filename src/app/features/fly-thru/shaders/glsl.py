@@ -0,0 +1,138 @@
+# Copyright (c) 2025-2026 Gene Ressler
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+GLSL ES 3.00 tokenizer and vocabulary shared by the shader build's passes.
+
+Tokens keep their text exactly, so joining the texts of all tokens reproduces the
+source. A directive is one token running from # to the end of its line, including
+backslash continuations.
+"""
+
+from collections import namedtuple
+import re
+
+Token = namedtuple("Token", "kind text")
+
+# Kinds of tokens.
+SPACE = "space"
+COMMENT = "comment"
+DIRECTIVE = "directive"
+IDENTIFIER = "identifier"
+NUMBER = "number"
+OPERATOR = "operator"
+
+TOKEN_PATTERN = re.compile(
+    r"""
+    (?P<space>\s+)
+    | (?P<comment>//[^\n]*|/\*[\s\S]*?\*/)
+    | (?P<directive>\#(?:[^\n\\]|\\\n?)*)
+    | (?P<identifier>[A-Za-z_]\w*)
+    | (?P<number>
+        0[xX][0-9a-fA-F]+[uU]?
+        | (?:\d+\.\d*|\.\d+)(?:[eE][+-]?\d+)?[fF]?
+        | \d+[eE][+-]?\d+[fF]?
+        | \d+[uU]?)
+    | (?P<operator>
+        <<=|>>=|\+\+|--|<<|>>|<=|>=|==|!=|&&|\|\||\^\^
+        | \+=|-=|\*=|/=|%=|&=|\|=|\^=
+        | [-+*/%<>=!~&|^?:;,.(){}\[\]])
+    """,
+    re.VERBOSE,
+)
+
+KEYWORDS = {
+    # Keywords.
+    "attribute", "bool", "break", "bvec2", "bvec3", "bvec4", "case", "centroid", "const",
+    "continue", "default", "discard", "do", "else", "false", "flat", "float", "for",
+    "highp", "if", "in", "inout", "int", "invariant", "isampler2D", "isampler2DArray",
+    "isampler3D", "isamplerCube", "ivec2", "ivec3", "ivec4", "layout", "lowp", "mat2",
+    "mat2x2", "mat2x3", "mat2x4", "mat3", "mat3x2", "mat3x3", "mat3x4", "mat4",
+    "mat4x2", "mat4x3", "mat4x4", "mediump", "out", "precision", "return",
+    "sampler2D", "sampler2DArray", "sampler2DArrayShadow", "sampler2DShadow",
+    "sampler3D", "samplerCube", "samplerCubeShadow", "smooth", "struct", "switch",
+    "true", "uint", "uniform", "usampler2D", "usampler2DArray", "usampler3D",
+    "usamplerCube", "uvec2", "uvec3", "uvec4", "varying", "vec2", "vec3", "vec4",
+    "void", "while",
+    # Reserved for future use.
+    "active", "asm", "cast", "class", "common", "dvec2", "dvec3", "dvec4", "enum",
+    "extern", "external", "filter", "fixed", "fvec2", "fvec3", "fvec4", "goto", "half",
+    "hvec2", "hvec3", "hvec4", "iimage1D", "iimage2D", "iimage3D", "image1D",
+    "image2D", "image3D", "inline", "input", "interface", "long", "namespace",
+    "noinline", "output", "packed", "partition", "public", "resource", "sample",
+    "sampler1D", "sampler1DShadow", "sampler2DRect", "sampler2DRectShadow",
+    "sampler3DRect", "samplerBuffer", "short", "sizeof", "static", "superp", "template",
+    "this", "typedef", "uimage1D", "uimage2D", "uimage3D", "union", "unsigned", "using",
+    "volatile",
+}  # fmt: skip
+
+TYPES = {
+    "bool", "bvec2", "bvec3", "bvec4", "float", "int", "isampler2D", "isampler2DArray",
+    "isampler3D", "isamplerCube", "ivec2", "ivec3", "ivec4", "mat2", "mat2x2", "mat2x3",
+    "mat2x4", "mat3", "mat3x2", "mat3x3", "mat3x4", "mat4", "mat4x2", "mat4x3",
+    "mat4x4", "sampler2D", "sampler2DArray", "sampler2DArrayShadow", "sampler2DShadow",
+    "sampler3D", "samplerCube", "samplerCubeShadow", "uint", "usampler2D",
+    "usampler2DArray", "usampler3D", "usamplerCube", "uvec2", "uvec3", "uvec4", "vec2",
+    "vec3", "vec4", "void",
+}  # fmt: skip
+
+SCALAR_TYPES = {"bool", "float", "int", "uint"}
+
+# Qualifiers that make a global declaration part of a shader's interface.
+INTERFACE_QUALIFIERS = {
+    "attribute", "centroid", "flat", "in", "invariant", "layout", "out", "smooth",
+    "uniform", "varying",
+}  # fmt: skip
+
+BUILTIN_FUNCTIONS = {
+    "abs", "acos", "acosh", "all", "any", "asin", "asinh", "atan", "atanh", "ceil",
+    "clamp", "cos", "cosh", "cross", "dFdx", "dFdy", "degrees", "determinant",
+    "distance", "dot", "equal", "exp", "exp2", "faceforward", "floatBitsToInt",
+    "floatBitsToUint", "floor", "fract", "fwidth", "greaterThan", "greaterThanEqual",
+    "intBitsToFloat", "inverse", "inversesqrt", "isinf", "isnan", "length", "lessThan",
+    "lessThanEqual", "log", "log2", "matrixCompMult", "max", "min", "mix", "mod",
+    "modf", "normalize", "not", "notEqual", "outerProduct", "packHalf2x16",
+    "packSnorm2x16", "packUnorm2x16", "pow", "radians", "reflect", "refract", "round",
+    "roundEven", "sign", "sin", "sinh", "smoothstep", "sqrt", "step", "tan", "tanh",
+    "texelFetch", "texelFetchOffset", "texture", "textureGrad", "textureGradOffset",
+    "textureLod", "textureLodOffset", "textureOffset", "textureProj",
+    "textureProjGrad", "textureProjGradOffset", "textureProjLod",
+    "textureProjLodOffset", "textureProjOffset", "textureSize", "transpose", "trunc",
+    "uintBitsToFloat", "unpackHalf2x16", "unpackSnorm2x16", "unpackUnorm2x16",
+}  # fmt: skip
+
+IDENTIFIER_PATTERN = re.compile(r"[A-Za-z_]\w*")
+
+
+def tokenize(text):
+    """Returns the tokens of the given GLSL source."""
+    tokens = []
+    position = 0
+    at_line_start = True
+    while position < len(text):
+        match = TOKEN_PATTERN.match(text, position)
+        if match is None:
+            line = text.count("\n", 0, position) + 1
+            raise Exception(f"Bad GLSL character {text[position]!r} on line {line}")
+        kind = match.lastgroup
+        token_text = match.group()
+        if kind == DIRECTIVE and not at_line_start:
+            raise Exception(f"# not at line start: {token_text}")
+        tokens.append(Token(kind, token_text))
+        if kind == SPACE:
+            at_line_start = at_line_start or "\n" in token_text
+        elif kind != COMMENT:
+            at_line_start = False
+        position = match.end()
+    return tokens
+
+
+def parseDirective(text):
+    """Returns the name and the rest of the given directive, continuations joined."""
+    match = re.match(r"#\s*(\w*)\s*(.*)", re.sub(r"\\\n", " ", text), re.DOTALL)
+    return match.group(1), match.group(2).strip()
+
+
+def directiveIdentifiers(text):
+    """Returns the identifiers in the given directive's text, including its name."""
+    return set(IDENTIFIER_PATTERN.findall(text))
@@ -7,10 +7,10 @@
 //  .color
 //  .ambientIntensity
 //  .shadowWeight
-// sampler2DShadow depthMap
+// sampler2DShadow depthMap (with SHADOWS)
 // vec3 vertex
 // vec3 normal
-// vec3 depthMapLookup
+// vec3 depthMapLookup (with SHADOWS)
 //
 // Args:
 // vec3 ARG_materialColor
@@ -0,0 +1,685 @@
+# Copyright (c) 2025-2026 Gene Ressler
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Token-based GLSL minifier for the shader build.
+
+Removes comments, whitespace, and #line directives and evaluates #ifdef and #ifndef.
+Folds arithmetic on literals and inlines scalar global constants. Drops functions,
+global constants, struct types, and struct members that main doesn't reach. Renames
+functions, global constants and variables, struct types, parameters, and locals to the
+shortest names not used otherwise.
+
+The interface the host and the other stage see is untouched: uniforms, uniform blocks
+with their types and members, ins, outs, and layouts. So are names in directives left
+in the source, since macros may refer to them.
+"""
+
+from collections import Counter
+import itertools
+import math
+import re
+import string
+import struct
+
+import glsl
+from glsl import DIRECTIVE, IDENTIFIER, NUMBER, OPERATOR, Token
+
+FLOAT_PATTERN = re.compile(
+    r"-?(?:(?:\d+\.\d*|\.\d+)(?:[eE][+-]?\d+)?|\d+[eE][+-]?\d+)[fF]?"
+)
+INT_PATTERN = re.compile(r"-?(?:0|[1-9]\d*)")
+UINT_PATTERN = re.compile(r"(?:0|[1-9]\d*)[uU]")
+# Tokens before a sum or difference that bind less tightly, so it can be folded.
+ADDITIVE_CONTEXT = {
+    "(", "[", ",", "=", ";", "{", "}", "?", ":", "return", "+=", "-=", "*=", "/=",
+    "%=", "==", "!=", "<", ">", "<=", ">=", "&&", "||", "^^", "&", "|", "^", "<<",
+    ">>",
+}  # fmt: skip
+MULTIPLICATIVE_OPERATORS = {"*", "/", "%"}
+# Adjacent characters of consecutive tokens that would read as one token or a comment.
+FUSING_PAIRS = {
+    "++", "--", "+=", "-=", "*=", "/=", "%=", "&=", "|=", "^=", "<<", ">>", "<=",
+    ">=", "==", "!=", "&&", "||", "^^", "//", "/*",
+}  # fmt: skip
+PRECISION_QUALIFIERS = {"highp", "mediump", "lowp"}
+
+
+class Item:
+    """
+    A top-level declaration or directive. Kind is directive, precision, interface,
+    function, prototype, struct, constant, or variable. Names are those it declares.
+    """
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.kind, self.names = classify([t for t in tokens if t.kind != DIRECTIVE])
+
+    def references(self):
+        """Returns identifiers used here other than as members, including in directives."""
+        result = set()
+        for token, is_member in withMemberFlags(self.tokens):
+            if token.kind == IDENTIFIER and not is_member:
+                result.add(token.text)
+            elif token.kind == DIRECTIVE:
+                result |= glsl.directiveIdentifiers(token.text)
+        return result
+
+
+def interfaceNames(item):
+    """
+    Returns names an interface declaration makes global. Those of a block's members are
+    global only if it has no instance name.
+    """
+    code = [t for t in item.tokens if t.kind != DIRECTIVE]
+    start = next((k for k, t in enumerate(code) if t.text == "{"), None)
+    if start is None:
+        return item.references()
+    end = matchingIndex(code, start)
+    if not any(t.kind == IDENTIFIER for t in code[end + 1 :]):
+        return item.references()
+    outside = Item(code[:start] + code[end + 1 :])
+    # Types of members may be structs.
+    member_types = {
+        code[k].text
+        for k in range(start + 1, end)
+        if code[k].kind == IDENTIFIER and code[k - 1].text in ("{", ";")
+    }
+    directives = {
+        name
+        for token in item.tokens
+        if token.kind == DIRECTIVE
+        for name in glsl.directiveIdentifiers(token.text)
+    }
+    return outside.references() | member_types | directives
+
+
+def withMemberFlags(tokens):
+    """Yields each token with whether it follows a dot, so it names a member or swizzle."""
+    previous = None
+    for token in tokens:
+        yield token, previous == "."
+        if token.kind != DIRECTIVE:
+            previous = token.text
+
+
+def classify(code):
+    """Returns the kind of the given top-level declaration and the names it declares."""
+    if not code:
+        return "directive", []
+    head = []
+    for token in code:
+        if token.text in ("(", "{", "=", "["):
+            break
+        head.append(token.text)
+    stop = code[len(head)].text if len(head) < len(code) else ";"
+    if head[0] == "precision":
+        return "precision", []
+    if any(text in glsl.INTERFACE_QUALIFIERS for text in head):
+        return "interface", []
+    if head[0] == "struct":
+        # A struct declaring a variable too isn't worth minifying.
+        if code[-2].text != "}":
+            return "interface", []
+        return "struct", [head[1]]
+    if code[-1].text == "}":
+        return "function", [head[-1]]
+    if stop == "(":
+        return "prototype", [head[-1]]
+    kind = "constant" if head[0] == "const" else "variable"
+    k = 0
+    while code[k].text in ("const", *PRECISION_QUALIFIERS):
+        k += 1
+    return kind, declarators(code, skipArraySize(code, k + 1))
+
+
+def skipArraySize(code, k):
+    """Returns the index after the array size starting at k, if any, else k."""
+    if k < len(code) and code[k].text == "[":
+        return matchingIndex(code, k) + 1
+    return k
+
+
+def matchingIndex(code, k):
+    """Returns the index of the bracket closing the one at k."""
+    depth = 0
+    for j in range(k, len(code)):
+        if code[j].text in ("(", "[", "{"):
+            depth += 1
+        elif code[j].text in (")", "]", "}"):
+            depth -= 1
+            if depth == 0:
+                return j
+    raise Exception(f"Unbalanced {code[k].text}")
+
+
+def declarators(code, k, type_names=glsl.TYPES):
+    """
+    Returns the names declared by the declaration whose first name is at k: that one
+    and those after commas up to the end of the declaration.
+    """
+    names = [code[k].text]
+    depth = 0
+    for j in range(k + 1, len(code) - 1):
+        text = code[j].text
+        if text in ("(", "[", "{"):
+            depth += 1
+        elif text in (")", "]", "}"):
+            depth -= 1
+            if depth < 0:
+                break
+        elif text == ";" and depth == 0:
+            break
+        elif text == "," and depth == 0:
+            following = code[j + 1]
+            if isDeclarable(following, type_names):
+                names.append(following.text)
+    return names
+
+
+def isDeclarable(token, type_names):
+    return (
+        token.kind == IDENTIFIER
+        and token.text not in glsl.KEYWORDS
+        and token.text not in type_names
+    )
+
+
+def evaluateConditionals(tokens):
+    """
+    Drops #line directives and evaluates #ifdef, #ifndef, #else, and #endif, keeping
+    tokens of groups that are in. A macro is defined if an earlier #define names it. An
+    operand that isn't an identifier is the value of a macro already expanded.
+    """
+    defined = set()
+    # Whether the enclosing group is in and whether this one's condition held.
+    stack = []
+    is_in = True
+    result = []
+    for token in tokens:
+        if token.kind != DIRECTIVE:
+            if is_in:
+                result.append(token)
+            continue
+        name, rest = glsl.parseDirective(token.text)
+        operand = rest.split()[0] if rest else ""
+        if name in ("ifdef", "ifndef"):
+            is_defined = operand in defined or not glsl.IDENTIFIER_PATTERN.fullmatch(
+                operand
+            )
+            condition = is_defined == (name == "ifdef")
+            stack.append((is_in, condition))
+            is_in = is_in and condition
+        elif name == "else":
+            if not stack:
+                raise Exception("#else without #ifdef or #ifndef")
+            is_outer_in, condition = stack[-1]
+            stack[-1] = (is_outer_in, not condition)
+            is_in = is_outer_in and not condition
+        elif name == "endif":
+            if not stack:
+                raise Exception("#endif without #ifdef or #ifndef")
+            is_in, _ = stack.pop()
+        elif name in ("if", "elif"):
+            raise Exception(f"Minifier can't evaluate #{name}")
+        elif is_in and name != "line":
+            if name == "define":
+                defined.add(operand.split("(")[0])
+            elif name == "undef":
+                defined.discard(operand)
+            result.append(token)
+    if stack:
+        raise Exception("Missing #endif")
+    return result
+
+
+def splitItems(tokens):
+    """Returns the top-level items made of the given tokens, which have no whitespace."""
+    items = []
+    current = []
+    depth = 0
+    brace_start = None
+    for token in tokens:
+        if token.kind == DIRECTIVE and not current:
+            items.append(Item([token]))
+            continue
+        current.append(token)
+        if token.kind != OPERATOR:
+            continue
+        is_end = False
+        if token.text in ("(", "[", "{"):
+            if token.text == "{" and depth == 0:
+                brace_start = len(current) - 1
+            depth += 1
+        elif token.text in (")", "]", "}"):
+            depth -= 1
+            # Function bodies end declarations without a semicolon.
+            is_end = (
+                depth == 0
+                and token.text == "}"
+                and current[brace_start - 1].text == ")"
+            )
+        elif token.text == ";" and depth == 0:
+            is_end = True
+        if is_end:
+            items.append(Item(current))
+            current = []
+    if current:
+        raise Exception(f"Incomplete declaration: {' '.join(t.text for t in current)}")
+    return items
+
+
+def literal(text):
+    """Returns the type and value of a foldable literal or (None, None)."""
+    if FLOAT_PATTERN.fullmatch(text):
+        return "float", float(text.rstrip("fF"))
+    if INT_PATTERN.fullmatch(text):
+        return "int", int(text)
+    if UINT_PATTERN.fullmatch(text):
+        return "uint", int(text[:-1])
+    return None, None
+
+
+def toFloat32(value):
+    return struct.unpack("<f", struct.pack("<f", value))[0]
+
+
+def formatFloat(value):
+    """Returns the shortest GLSL float literal with the float32 value nearest the given one."""
+    value = toFloat32(value)
+    for precision in range(1, 10):
+        text = f"{value:.{precision}g}"
+        if toFloat32(float(text)) == value:
+            break
+    mantissa, _, exponent = text.partition("e")
+    if not exponent and "." not in mantissa:
+        mantissa += "."
+    mantissa = re.sub(r"^(-?)0\.(?=\d)", r"\1.", mantissa)
+    return f"{mantissa}e{int(exponent)}" if exponent else mantissa
+
+
+def formatLiteral(type, value):
+    """Returns the literal for the given value, or None if out of range for its type."""
+    if type == "float":
+        if not math.isfinite(value) or abs(value) > 3.4e38:
+            return None
+        return formatFloat(value)
+    if type == "uint":
+        return f"{value % 2**32}u"
+    return str(value) if -(2**31) <= value < 2**31 else None
+
+
+def applyOperator(operator, type, a, b):
+    if operator == "*":
+        return a * b
+    if operator == "+":
+        return a + b
+    if operator == "-":
+        return a - b
+    if b == 0 or a < 0 or b < 0:
+        return None
+    if operator == "%":
+        return None if type == "float" else a % b
+    return a / b if type == "float" else a // b
+
+
+def foldOnce(tokens):
+    """Folds one parenthesized literal or operation on literals. Returns whether any."""
+    for k in range(1, len(tokens) - 1):
+        token = tokens[k]
+        if token.kind != NUMBER:
+            continue
+        previous = tokens[k - 1].text
+        before = tokens[k - 2] if k >= 2 else None
+        # Parentheses around a literal not being called or negative.
+        if (
+            previous == "("
+            and tokens[k + 1].text == ")"
+            and (before is None or before.kind != IDENTIFIER)
+            and (before is None or before.text not in (")", "]"))
+            and not token.text.startswith("-")
+        ):
+            tokens[k - 1 : k + 2] = [token]
+            return True
+        if k + 3 >= len(tokens):
+            continue
+        operator = tokens[k + 1].text
+        operand = tokens[k + 2]
+        following = tokens[k + 3].text
+        if operand.kind != NUMBER:
+            continue
+        if operator in MULTIPLICATIVE_OPERATORS:
+            if previous in MULTIPLICATIVE_OPERATORS | {"~", "!"}:
+                continue
+            if previous == "-" and operator == "%":
+                continue
+        elif operator in ("+", "-"):
+            if (
+                previous not in ADDITIVE_CONTEXT
+                or following in MULTIPLICATIVE_OPERATORS
+            ):
+                continue
+        else:
+            continue
+        type, a = literal(token.text)
+        operand_type, b = literal(operand.text)
+        if type is None or type != operand_type:
+            continue
+        if type == "float":
+            a, b = toFloat32(a), toFloat32(b)
+        value = applyOperator(operator, type, a, b)
+        text = None if value is None else formatLiteral(type, value)
+        if text is None:
+            continue
+        tokens[k : k + 3] = [Token(NUMBER, text)]
+        return True
+    return False
+
+
+def foldConstants(tokens):
+    """Folds arithmetic on literals in place and shortens float literals."""
+    while foldOnce(tokens):
+        pass
+    for k, token in enumerate(tokens):
+        type, value = literal(token.text)
+        if type == "float":
+            tokens[k] = Token(NUMBER, formatFloat(value))
+
+
+def functionLocals(item, type_names):
+    """Returns the names of the given function's parameters and locals."""
+    code = [t for t in item.tokens if t.kind != DIRECTIVE]
+    start = next(k for k, t in enumerate(code) if t.text == "(")
+    names = set()
+    for k in range(start, len(code) - 1):
+        if code[k].kind != IDENTIFIER or code[k].text not in type_names:
+            continue
+        j = skipArraySize(code, k + 1)
+        if isDeclarable(code[j], type_names):
+            names.update(declarators(code, j, type_names))
+    return names
+
+
+def inlineScalarConstants(items, locals_by_function):
+    """
+    Replaces uses of global scalar constants initialized with literals by the literals.
+    The constants' declarations become unreferenced.
+    """
+    shadowed = set().union(*locals_by_function.values())
+    macro_names = set()
+    for item in items:
+        for token in item.tokens:
+            if token.kind == DIRECTIVE:
+                macro_names |= glsl.directiveIdentifiers(token.text)
+    values = {}
+    for item in items:
+        code = [t.text for t in item.tokens if t.kind != DIRECTIVE]
+        if item.kind != "constant" or len(item.names) != 1:
+            continue
+        name = item.names[0]
+        # const [precision] type name = literal ;
+        k = 2 if code[1] not in PRECISION_QUALIFIERS else 3
+        if (
+            code[k - 1] in glsl.SCALAR_TYPES
+            and code[k : k + 2] == [name, "="]
+            and len(code) == k + 4
+            and (
+                literal(code[k + 2])[0] is not None or code[k + 2] in ("true", "false")
+            )
+            and name not in shadowed
+            and name not in macro_names
+        ):
+            values[name] = code[k + 2]
+    if not values:
+        return
+    for item in items:
+        if item.kind == "constant" and item.names[0] in values:
+            continue
+        item.tokens = [
+            (
+                Token(literalKind(values[token.text]), values[token.text])
+                if token.kind == IDENTIFIER and not is_member and token.text in values
+                else token
+            )
+            for token, is_member in withMemberFlags(item.tokens)
+        ]
+
+
+def literalKind(text):
+    return IDENTIFIER if text in ("true", "false") else NUMBER
+
+
+def reachableItems(items):
+    """Returns items main reaches, directly or not, with all that can't be dropped."""
+    declared = {}
+    for item in items:
+        if item.kind in ("function", "prototype", "constant", "struct"):
+            for name in item.names:
+                declared.setdefault(name, []).append(item)
+    roots = [
+        item
+        for item in items
+        if item.kind not in ("function", "prototype", "constant", "struct")
+        or item.names == ["main"]
+    ]
+    reached = set(map(id, roots))
+    pending = list(roots)
+    while pending:
+        for name in pending.pop().references():
+            for item in declared.get(name, ()):
+                if id(item) not in reached:
+                    reached.add(id(item))
+                    pending.append(item)
+    return [item for item in items if id(item) in reached]
+
+
+def interfaceStructNames(items):
+    """Returns names of structs used by the interface, directly or in other structs."""
+    structs = {item.names[0]: item for item in items if item.kind == "struct"}
+    result = set()
+    pending = [
+        name
+        for item in items
+        if item.kind in ("interface", "directive", "precision")
+        for name in item.references()
+        if name in structs
+    ]
+    while pending:
+        name = pending.pop()
+        if name not in result:
+            result.add(name)
+            pending.extend(n for n in structs[name].references() if n in structs)
+    return result
+
+
+def dropUnusedMembers(items, interface_structs):
+    """Drops members of non-interface structs that no reachable code accesses."""
+    used = set()
+    constructed = set()
+    for item in items:
+        code = [t for t in item.tokens if t.kind != DIRECTIVE]
+        for k, (token, is_member) in enumerate(withMemberFlags(code)):
+            if is_member:
+                used.add(token.text)
+            elif k + 1 < len(code) and code[k + 1].text == "(":
+                constructed.add(token.text)
+        for token in item.tokens:
+            if token.kind == DIRECTIVE:
+                used |= glsl.directiveIdentifiers(token.text)
+    type_names = glsl.TYPES | {i.names[0] for i in items if i.kind == "struct"}
+    for item in items:
+        if item.kind != "struct" or item.names[0] in interface_structs | constructed:
+            continue
+        tokens = item.tokens
+        start = next(k for k, t in enumerate(tokens) if t.text == "{") + 1
+        end = len(tokens) - 2
+        members = []
+        member = []
+        for token in tokens[start:end]:
+            member.append(token)
+            if token.text == ";" or token.kind == DIRECTIVE:
+                members.append(member)
+                member = []
+        kept = []
+        for member in members:
+            code = [t for t in member if t.kind != DIRECTIVE]
+            if code:
+                k = 1 if code[0].text not in PRECISION_QUALIFIERS else 2
+                names = declarators(code, skipArraySize(code, k), type_names)
+                if not any(name in used for name in names):
+                    continue
+            kept.append(member)
+        if not any(t.kind != DIRECTIVE for member in kept for t in member):
+            # Structs can't be empty.
+            kept.insert(0, next(m for m in members if m[0].kind != DIRECTIVE))
+        item.tokens = tokens[:start] + [t for m in kept for t in m] + tokens[end:]
+
+
+def shortNames(excluded):
+    """Yields identifiers from shortest up, skipping those excluded or reserved."""
+    first = string.ascii_letters
+    rest = string.ascii_letters + string.digits + "_"
+    for length in itertools.count(1):
+        for tail in itertools.product(rest, repeat=length - 1):
+            for head in first:
+                name = head + "".join(tail)
+                if name not in excluded and "__" not in name:
+                    yield name
+
+
+def assignNames(counts, excluded):
+    """Maps the counted names to short ones, shortest to the most used."""
+    names = shortNames(excluded)
+    return {name: next(names) for name, _ in counts.most_common()}
+
+
+def renameAll(items, interface_structs, type_names):
+    """Renames non-interface declarations throughout the items."""
+    preserved = set()
+    excluded = glsl.KEYWORDS | glsl.TYPES | glsl.BUILTIN_FUNCTIONS
+    for item in items:
+        for token, is_member in withMemberFlags(item.tokens):
+            if token.kind == DIRECTIVE:
+                preserved |= glsl.directiveIdentifiers(token.text)
+            elif token.kind == IDENTIFIER and not is_member:
+                excluded.add(token.text)
+        if item.kind == "interface":
+            preserved |= interfaceNames(item)
+        elif item.kind in ("precision", "directive"):
+            preserved |= item.references()
+    excluded |= preserved
+    global_names = set()
+    for item in items:
+        if item.kind == "struct" and item.names[0] in interface_structs:
+            continue
+        if item.kind != "function" or item.names != ["main"]:
+            global_names.update(item.names)
+    global_names -= preserved
+    locals_by_function = {
+        id(item): functionLocals(item, type_names) - preserved - glsl.BUILTIN_FUNCTIONS
+        for item in items
+        if item.kind == "function"
+    }
+    # Leave globals and locals shadowing them alone. Either might be meant by a name.
+    shadowed = global_names & set().union(*locals_by_function.values())
+    global_names -= shadowed
+    for names in locals_by_function.values():
+        names -= shadowed
+    global_counts = Counter(
+        token.text
+        for item in items
+        for token, is_member in withMemberFlags(item.tokens)
+        if token.text in global_names and not is_member
+    )
+    global_map = assignNames(global_counts, excluded)
+    excluded |= set(global_map.values())
+    struct_names = {i.names[0] for i in items if i.kind == "struct"} & global_names
+    for item in items:
+        if item.kind in ("interface", "precision", "directive"):
+            continue
+        names = global_map
+        if item.kind == "function":
+            local_names = locals_by_function[id(item)]
+            local_counts = Counter(
+                token.text
+                for token, is_member in withMemberFlags(item.tokens)
+                if token.text in local_names and not is_member
+            )
+            names = {**global_map, **assignNames(local_counts, excluded)}
+        elif item.kind == "struct":
+            # Member names aren't renamed, only types.
+            names = {n: global_map[n] for n in struct_names}
+        item.tokens = [
+            (
+                Token(IDENTIFIER, names[token.text])
+                if token.kind == IDENTIFIER and not is_member and token.text in names
+                else token
+            )
+            for token, is_member in withMemberFlags(item.tokens)
+        ]
+
+
+def needsSpace(previous, following):
+    if re.match(r"\w", previous[-1]) and re.match(r"\w|\.\d", following):
+        return True
+    return previous[-1] + following[0] in FUSING_PAIRS
+
+
+def formatItems(items):
+    """
+    Returns source text of the items with only the spaces needed to separate tokens,
+    with line breaks after items, semicolons, and open braces for readability.
+    """
+    pieces = []
+    previous = None
+    paren_depth = 0
+    for token in (token for item in items for token in [*item.tokens, None]):
+        if token is None:
+            if pieces and not pieces[-1].endswith("\n"):
+                pieces.append("\n")
+            previous = None
+            continue
+        if token.kind == DIRECTIVE:
+            if pieces and not pieces[-1].endswith("\n"):
+                pieces.append("\n")
+            pieces.append(token.text + "\n")
+            previous = None
+            continue
+        if previous is not None and needsSpace(previous, token.text):
+            pieces.append(" ")
+        pieces.append(token.text)
+        previous = token.text
+        if token.text == "(":
+            paren_depth += 1
+        elif token.text == ")":
+            paren_depth -= 1
+        elif token.text == "{" or token.text == ";" and paren_depth == 0:
+            pieces.append("\n")
+            previous = None
+    return "".join(pieces).rstrip("\n")
+
+
+def minify(text):
+    """Returns a minified equivalent of the given GLSL source with includes expanded."""
+    tokens = [
+        token
+        for token in glsl.tokenize(text)
+        if token.kind not in (glsl.SPACE, glsl.COMMENT)
+    ]
+    items = splitItems(evaluateConditionals(tokens))
+    type_names = glsl.TYPES | {i.names[0] for i in items if i.kind == "struct"}
+    for item in items:
+        foldConstants(item.tokens)
+    locals_by_function = {
+        id(item): functionLocals(item, type_names)
+        for item in items
+        if item.kind == "function"
+    }
+    inlineScalarConstants(items, locals_by_function)
+    for item in items:
+        foldConstants(item.tokens)
+    items = reachableItems(items)
+    interface_structs = interfaceStructNames(items)
+    dropUnusedMembers(items, interface_structs)
+    renameAll(items, interface_structs, type_names)
+    return formatItems(items)
@@ -0,0 +1,340 @@
+# Copyright (c) 2025-2026 Gene Ressler
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+GLSL preprocessor for the shader build. Expands object-like macros and evaluates
+#if, #ifdef, #ifndef, #elif, #else, and #endif in one pass over tokens.
+
+Expansion is recursive. A macro whose expansion reaches itself is an error. Each
+macro's expansion is computed once and reused until a #define or #undef changes
+what it could be.
+
+Macros named ARG_* are parameters of included code such as lighting.h. They're
+scoped like local variables, ending with the brace block they're defined in, so
+every function can pass its own.
+
+Feature macros of shader variants are predefined as 1. See variants.py.
+
+Directives other than #version, #extension, #pragma, and #line are consumed. Lines
+they and excluded groups occupied are kept blank so line numbers don't change.
+"""
+
+import glsl
+from glsl import COMMENT, DIRECTIVE, IDENTIFIER, NUMBER, OPERATOR, SPACE, Token
+
+# Directives passed on to the GLSL compiler.
+KEPT_DIRECTIVES = {"version", "extension", "pragma", "line"}
+SCOPED_PREFIX = "ARG_"
+PREDEFINED = {"GL_ES": "1", "__VERSION__": "300"}
+# Binary operators of #if expressions by precedence, loosest first.
+BINARY_PRECEDENCE = {
+    "||": 1,
+    "&&": 2,
+    "|": 3,
+    "^": 4,
+    "&": 5,
+    "==": 6,
+    "!=": 6,
+    "<": 7,
+    ">": 7,
+    "<=": 7,
+    ">=": 7,
+    "<<": 8,
+    ">>": 8,
+    "+": 9,
+    "-": 9,
+    "*": 10,
+    "/": 10,
+    "%": 10,
+}
+
+
+def fuses(previous, following):
+    """Returns whether the given token texts would tokenize as one if adjacent."""
+    match = glsl.TOKEN_PATTERN.match(previous + following)
+    return match is not None and match.end() > len(previous)
+
+
+def significant(tokens):
+    return [t for t in tokens if t.kind not in (SPACE, COMMENT)]
+
+
+class Preprocessor:
+    def __init__(self, defines=()):
+        # Body tokens without whitespace and the brace depth of definition by name.
+        self.macros = {}
+        self.depths = {}
+        # Memoized expansions by macro name.
+        self.expansions = {}
+        for name, body in PREDEFINED.items():
+            self.macros[name] = significant(glsl.tokenize(body))
+        for name in defines:
+            self.macros[name] = [Token(NUMBER, "1")]
+        self.line = 1
+
+    def error(self, message):
+        raise Exception(f"Line {self.line}: {message}")
+
+    def define(self, rest, depth):
+        name_match = glsl.IDENTIFIER_PATTERN.match(rest)
+        if not name_match:
+            self.error(f"Bad #define {rest}")
+        name = name_match.group()
+        if rest[name_match.end() : name_match.end() + 1] == "(":
+            self.error(f"Function-like macros aren't supported: {name}")
+        body = significant(glsl.tokenize(rest[name_match.end() :]))
+        if name in PREDEFINED or name.startswith("GL_") or "__" in name:
+            self.error(f"Reserved macro name: {name}")
+        if name in self.macros and self.macros[name] != body:
+            self.error(f"Macro {name} redefined differently")
+        self.macros[name] = body
+        self.depths[name] = depth
+        self.expansions.clear()
+
+    def undefine(self, name):
+        self.macros.pop(name, None)
+        self.depths.pop(name, None)
+        self.expansions.clear()
+
+    def endScope(self, depth):
+        """Undefines scoped macros defined deeper than the given brace depth."""
+        ended = [
+            name
+            for name, defined_depth in self.depths.items()
+            if defined_depth > depth and name.startswith(SCOPED_PREFIX)
+        ]
+        for name in ended:
+            self.undefine(name)
+
+    def expand(self, name, active=()):
+        """Returns the tokens the named macro expands to, fully expanded."""
+        if name in active:
+            self.error(f"Recursive macro: {' -> '.join((*active, name))}")
+        if name not in self.expansions:
+            self.expansions[name] = self.expandTokens(
+                self.macros[name], (*active, name)
+            )
+        return self.expansions[name]
+
+    def expandTokens(self, tokens, active=()):
+        result = []
+        for token in tokens:
+            if token.kind == IDENTIFIER and token.text in self.macros:
+                result.extend(self.expand(token.text, active))
+            else:
+                result.append(token)
+        return result
+
+    def evaluate(self, expression):
+        """Returns the value of the given #if expression."""
+        tokens = significant(glsl.tokenize(expression))
+        # Replace defined operators before expansion, which would change their operands.
+        resolved = []
+        k = 0
+        while k < len(tokens):
+            if tokens[k].text != "defined":
+                resolved.append(tokens[k])
+                k += 1
+                continue
+            parenthesized = k + 1 < len(tokens) and tokens[k + 1].text == "("
+            operand = k + 2 if parenthesized else k + 1
+            if operand >= len(tokens) or tokens[operand].kind != IDENTIFIER:
+                self.error(f"Bad defined in #if {expression}")
+            if parenthesized and (
+                operand + 1 >= len(tokens) or tokens[operand + 1].text != ")"
+            ):
+                self.error(f"Bad defined in #if {expression}")
+            is_defined = tokens[operand].text in self.macros
+            resolved.append(Token(NUMBER, "1" if is_defined else "0"))
+            k = operand + 2 if parenthesized else operand + 1
+        tokens = self.expandTokens(resolved)
+        value, k = self.parseExpression(tokens, 0, 1, expression)
+        if k != len(tokens):
+            self.error(f"Unexpected {tokens[k].text} in #if {expression}")
+        return value
+
+    def parseExpression(self, tokens, k, min_precedence, expression):
+        """
+        Returns the value of the expression at k, stopping at operators looser than the
+        given precedence, and the index after it.
+        """
+        value, k = self.parseUnary(tokens, k, expression)
+        while k < len(tokens):
+            operator = tokens[k].text
+            precedence = BINARY_PRECEDENCE.get(operator)
+            if precedence is None or precedence < min_precedence:
+                break
+            right, k = self.parseExpression(tokens, k + 1, precedence + 1, expression)
+            value = self.applyBinary(operator, value, right, expression)
+        return value, k
+
+    def parseUnary(self, tokens, k, expression):
+        if k >= len(tokens):
+            self.error(f"Incomplete #if {expression}")
+        token = tokens[k]
+        if token.text in ("+", "-", "!", "~"):
+            value, k = self.parseUnary(tokens, k + 1, expression)
+            if token.text == "-":
+                value = -value
+            elif token.text == "!":
+                value = int(not value)
+            elif token.text == "~":
+                value = ~value
+            return value, k
+        if token.text == "(":
+            value, k = self.parseExpression(tokens, k + 1, 1, expression)
+            if k >= len(tokens) or tokens[k].text != ")":
+                self.error(f"Missing ) in #if {expression}")
+            return value, k + 1
+        if token.kind == NUMBER:
+            return self.integer(token.text, expression), k + 1
+        if token.kind == IDENTIFIER:
+            self.error(f"Undefined identifier {token.text} in #if {expression}")
+        self.error(f"Unexpected {token.text} in #if {expression}")
+
+    def integer(self, text, expression):
+        digits = text.rstrip("uU")
+        try:
+            if len(digits) > 1 and digits[0] == "0" and digits[1] not in "xX":
+                return int(digits, 8)
+            return int(digits, 0)
+        except ValueError:
+            self.error(f"Not an integer: {text} in #if {expression}")
+
+    def applyBinary(self, operator, a, b, expression):
+        if operator in ("/", "%") and b == 0:
+            self.error(f"Division by zero in #if {expression}")
+        match operator:
+            case "||":
+                return int(bool(a) or bool(b))
+            case "&&":
+                return int(bool(a) and bool(b))
+            case "|":
+                return a | b
+            case "^":
+                return a ^ b
+            case "&":
+                return a & b
+            case "==":
+                return int(a == b)
+            case "!=":
+                return int(a != b)
+            case "<":
+                return int(a < b)
+            case ">":
+                return int(a > b)
+            case "<=":
+                return int(a <= b)
+            case ">=":
+                return int(a >= b)
+            case "<<":
+                return a << b
+            case ">>":
+                return a >> b
+            case "+":
+                return a + b
+            case "-":
+                return a - b
+            case "*":
+                return a * b
+            case "/":
+                # C division truncates toward zero.
+                return abs(a) // abs(b) * (1 if (a < 0) == (b < 0) else -1)
+            case "%":
+                return a - b * self.applyBinary("/", a, b, expression)
+
+    def run(self, text):
+        """Returns the given shader source with macros expanded and conditionals evaluated."""
+        output = []
+        # Text of the last token output if nothing but macro expansions followed it.
+        previous = None
+        # For each open conditional, whether its enclosing group is in, whether
+        # some group of it was already taken, and whether #else was seen.
+        stack = []
+        is_in = True
+        depth = 0
+
+        def emit(token):
+            nonlocal previous
+            if previous is not None and fuses(previous, token.text):
+                output.append(" ")
+            output.append(token.text)
+            previous = token.text
+
+        for token in glsl.tokenize(text):
+            newline_count = token.text.count("\n")
+            if token.kind == DIRECTIVE:
+                name, rest = glsl.parseDirective(token.text)
+                is_in = self.directive(name, rest, token, stack, is_in, depth, output)
+                output.append("\n" * newline_count)
+                previous = None
+            elif not is_in:
+                output.append("\n" * newline_count)
+            elif token.kind == IDENTIFIER and token.text in self.macros:
+                for expanded in self.expand(token.text):
+                    emit(expanded)
+            elif token.kind in (SPACE, COMMENT):
+                output.append(token.text)
+                previous = None
+            else:
+                emit(token)
+                if token.kind == OPERATOR and token.text == "{":
+                    depth += 1
+                elif token.kind == OPERATOR and token.text == "}":
+                    depth -= 1
+                    self.endScope(depth)
+            self.line += newline_count
+        if stack:
+            self.error("Missing #endif")
+        return "".join(output)
+
+    def directive(self, name, rest, token, stack, is_in, depth, output):
+        """Handles a directive. Returns whether code after it is in."""
+        operand = rest.split()[0] if rest else ""
+        if name in ("ifdef", "ifndef", "if"):
+            if not is_in:
+                condition = False
+            elif name == "if":
+                condition = self.evaluate(rest) != 0
+            else:
+                condition = (operand in self.macros) == (name == "ifdef")
+            stack.append([is_in, condition, False])
+            return is_in and condition
+        if name in ("elif", "else", "endif"):
+            if not stack:
+                self.error(f"#{name} without #if")
+            is_outer_in, is_taken, is_else_seen = stack[-1]
+            if is_else_seen and name != "endif":
+                self.error(f"#{name} after #else")
+            if name == "endif":
+                stack.pop()
+                return is_outer_in
+            condition = not is_taken and is_outer_in
+            if condition and name == "elif":
+                condition = self.evaluate(rest) != 0
+            stack[-1] = [is_outer_in, is_taken or condition, name == "else"]
+            return is_outer_in and condition
+        if not is_in:
+            return False
+        if name == "define":
+            self.define(rest, depth)
+        elif name == "undef":
+            self.undefine(operand)
+        elif name == "error":
+            self.error(f"#error {rest}")
+        elif name == "line":
+            output.append(token.text)
+            self.line = int(operand) - 1
+        elif name in KEPT_DIRECTIVES:
+            output.append(token.text)
+        elif name:
+            self.error(f"Unknown directive #{name}")
+        return True
+
+
+def preprocess(text, defines=()):
+    """
+    Returns the given shader source with macros expanded and conditionals evaluated. The
+    named macros are predefined as 1.
+    """
+    return Preprocessor(defines).run(text)
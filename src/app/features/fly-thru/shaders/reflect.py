@@ -0,0 +1,288 @@
+# Copyright (c) 2025-2026 Gene Ressler
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Reflects the interfaces of shaders and of the programs linked from them.
+
+A shader's reflection lists its default block uniforms, samplers, std140 uniform blocks
+with the offset and size of each member, vertex attributes with their locations, and
+varyings. A program's merges those of its vertex and fragment shaders, after checking
+that each fragment input has a matching vertex output.
+
+Reflection reads shaders with defines expanded, so locations and array sizes are
+integer literals.
+"""
+
+import re
+
+import glsl
+from glsl import DIRECTIVE, SPACE, COMMENT
+import minify
+
+# Alignments and sizes in bytes of std140 scalars and vectors by component count.
+VECTOR_LAYOUTS = {1: (4, 4), 2: (8, 8), 3: (16, 12), 4: (16, 16)}
+# Uniform blocks, arrays in them, and structs are aligned and padded to a vec4.
+VEC4_ALIGNMENT = 16
+VECTOR_PATTERN = re.compile(r"[biu]?vec([234])")
+MATRIX_PATTERN = re.compile(r"mat([234])(?:x([234]))?")
+
+
+def roundUp(n, alignment):
+    return (n + alignment - 1) // alignment * alignment
+
+
+def typeLayout(type, structs):
+    """Returns the std140 alignment and size of the given type, which isn't an array."""
+    if type in glsl.SCALAR_TYPES:
+        return VECTOR_LAYOUTS[1]
+    match = VECTOR_PATTERN.fullmatch(type)
+    if match:
+        return VECTOR_LAYOUTS[int(match.group(1))]
+    match = MATRIX_PATTERN.fullmatch(type)
+    if match:
+        # Laid out as an array of column vectors.
+        columns = int(match.group(1))
+        return VEC4_ALIGNMENT, columns * VEC4_ALIGNMENT
+    if type in structs:
+        members = layoutMembers(structs[type], structs)
+        alignment = roundUp(max(m["alignment"] for m in members), VEC4_ALIGNMENT)
+        end = members[-1]["offset"] + members[-1]["size"]
+        return alignment, roundUp(end, alignment)
+    raise Exception(f"No std140 layout for {type}")
+
+
+def layoutMembers(declarations, structs):
+    """
+    Returns the given member declarations, (type, name, length) with None length if not
+    an array, with std140 alignment, offset, and size added. Arrays have a stride, too.
+    """
+    members = []
+    offset = 0
+    for type, name, length in declarations:
+        alignment, size = typeLayout(type, structs)
+        array = {}
+        if length is not None:
+            alignment = roundUp(alignment, VEC4_ALIGNMENT)
+            array = {"length": length, "stride": roundUp(size, alignment)}
+            size = array["stride"] * length
+        offset = roundUp(offset, alignment)
+        member = {"name": name, "type": type, "offset": offset, "size": size}
+        members.append({**member, **array, "alignment": alignment})
+        offset += size
+    return members
+
+
+def parseLayout(code, k):
+    """Returns the layout qualifiers starting at k and the index after them."""
+    end = minify.matchingIndex(code, k + 1)
+    qualifiers = {}
+    for part in " ".join(t.text for t in code[k + 2 : end]).split(","):
+        name, _, value = part.partition("=")
+        if value.strip() and not re.fullmatch(r"\s*\d+\s*", value):
+            raise Exception(f"Layout qualifier isn't an integer: {part.strip()}")
+        qualifiers[name.strip()] = int(value) if value.strip() else True
+    return qualifiers, end + 1
+
+
+def parseArrayLength(code, k):
+    """Returns the length of the array whose size starts at k, if any, and the index after it."""
+    if k >= len(code) or code[k].text != "[":
+        return None, k
+    end = minify.matchingIndex(code, k)
+    size = "".join(t.text for t in code[k + 1 : end])
+    if not re.fullmatch(r"\d+", size):
+        raise Exception(f"Array size isn't an integer: {size}")
+    return int(size), end + 1
+
+
+def parseDeclaration(code):
+    """
+    Returns the qualifiers, layout qualifiers, type, and declarators (name, length) of the
+    given declaration, which has no trailing semicolon or initializers.
+    """
+    qualifiers = []
+    layout = {}
+    k = 0
+    while (
+        code[k].text in glsl.INTERFACE_QUALIFIERS
+        or code[k].text in minify.PRECISION_QUALIFIERS
+    ):
+        if code[k].text == "layout":
+            layout, k = parseLayout(code, k)
+        else:
+            qualifiers.append(code[k].text)
+            k += 1
+    type = code[k].text
+    declarators = []
+    k += 1
+    while k < len(code):
+        name = code[k].text
+        length, k = parseArrayLength(code, k + 1)
+        declarators.append((name, length))
+        if k < len(code) and code[k].text == ",":
+            k += 1
+    return qualifiers, layout, type, declarators
+
+
+def parseMembers(code):
+    """Returns the (type, name, length) of each member declared in the given block body."""
+    members = []
+    start = 0
+    for k, token in enumerate(code):
+        if token.text == ";":
+            _, _, type, declarators = parseDeclaration(code[start:k])
+            members.extend((type, name, length) for name, length in declarators)
+            start = k + 1
+    return members
+
+
+def reflectShader(text, is_vertex):
+    """Returns the reflection of the given shader source with defines expanded."""
+    tokens = [t for t in glsl.tokenize(text) if t.kind not in (SPACE, COMMENT)]
+    items = minify.splitItems(minify.evaluateConditionals(tokens))
+    structs = {}
+    reflection = {
+        "uniforms": [],
+        "samplers": [],
+        "blocks": [],
+        "attributes": [],
+        "inputs": [],
+        "outputs": [],
+    }
+    for item in items:
+        code = [t for t in item.tokens if t.kind != DIRECTIVE]
+        if item.kind == "struct":
+            end = minify.matchingIndex(code, 2)
+            structs[item.names[0]] = parseMembers(code[3:end])
+        if item.kind != "interface":
+            continue
+        brace = next((k for k, t in enumerate(code) if t.text == "{"), None)
+        if brace is not None:
+            end = minify.matchingIndex(code, brace)
+            qualifiers, layout, name, _ = parseDeclaration(code[:brace])
+            if "uniform" not in qualifiers:
+                raise Exception(f"Only uniform blocks are supported: {name}")
+            if not layout.get("std140"):
+                raise Exception(f"Uniform block {name} isn't std140")
+            members = layoutMembers(parseMembers(code[brace + 1 : end]), structs)
+            instance = code[end + 1].text if code[end + 1].text != ";" else None
+            end_offset = members[-1]["offset"] + members[-1]["size"]
+            for member in members:
+                del member["alignment"]
+            block = {"name": name, "instance": instance}
+            block.update(size=roundUp(end_offset, VEC4_ALIGNMENT), members=members)
+            reflection["blocks"].append(block)
+            continue
+        qualifiers, layout, type, declarators = parseDeclaration(code[:-1])
+        for name, length in declarators:
+            variable = {"name": name, "type": type}
+            if length is not None:
+                variable["length"] = length
+            if "uniform" in qualifiers:
+                is_sampler = "sampler" in type
+                reflection["samplers" if is_sampler else "uniforms"].append(variable)
+            elif "in" in qualifiers and is_vertex:
+                if "location" not in layout:
+                    raise Exception(f"Attribute {name} has no location")
+                reflection["attributes"].append(
+                    {**variable, "location": layout["location"]}
+                )
+            elif "in" in qualifiers or "out" in qualifiers:
+                if "flat" in qualifiers:
+                    variable["flat"] = True
+                if "location" in layout:
+                    variable["location"] = layout["location"]
+                reflection["inputs" if "in" in qualifiers else "outputs"].append(
+                    variable
+                )
+    return reflection
+
+
+def mergeBlockLayout(layouts, block):
+    """
+    Records the layout of the given block in the given ones by name. Programs may declare
+    a block with members missing from the end, so the longest is kept. Others must match
+    a prefix of it.
+    """
+    other = layouts.setdefault(block["name"], block)
+    shorter, longer = sorted([block, other], key=lambda b: len(b["members"]))
+    if longer["members"][: len(shorter["members"])] != shorter["members"]:
+        raise Exception(f"Uniform block {block['name']} has conflicting layouts")
+    layouts[block["name"]] = longer
+
+
+def reflectProgram(name, vertex, fragment):
+    """Returns the reflection of a program linked from shaders with the given reflections."""
+    outputs = {output["name"]: output for output in vertex["outputs"]}
+    varyings = []
+    for input in fragment["inputs"]:
+        output = outputs.get(input["name"])
+        if output is None:
+            raise Exception(
+                f"{name}: fragment input {input['name']} has no vertex output"
+            )
+        if output != input:
+            raise Exception(
+                f"{name}: vertex output {output} doesn't match fragment input {input}"
+            )
+        varyings.append(input)
+    blocks = {}
+    samplers = {}
+    uniforms = {}
+    for shader in (vertex, fragment):
+        for kind, by_name in (
+            ("blocks", blocks),
+            ("samplers", samplers),
+            ("uniforms", uniforms),
+        ):
+            for variable in shader[kind]:
+                if by_name.setdefault(variable["name"], variable) != variable:
+                    raise Exception(
+                        f"{name}: {variable['name']} declared differently in its shaders"
+                    )
+    return {
+        "attributes": vertex["attributes"],
+        "varyings": varyings,
+        "uniforms": list(uniforms.values()),
+        "samplers": list(samplers.values()),
+        "blocks": list(blocks.values()),
+        "outputs": fragment["outputs"],
+    }
+
+
+def toTypeScript(value, indent=0, column=0, width=120):
+    """
+    Returns the given JSON-like value as a TypeScript literal laid out roughly as prettier
+    would: on one line if it fits in the width, else one element per line. The literal
+    starts at the given column of a line indented by the given amount.
+    """
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if value is None:
+        return "null"
+    if isinstance(value, (int, float)):
+        return str(value)
+    if isinstance(value, str):
+        return f"'{value}'"
+    inner = indent + 2
+    if isinstance(value, dict):
+        parts = []
+        for key, v in value.items():
+            prefix = f"{tsKey(str(key))}: "
+            parts.append(prefix + toTypeScript(v, inner, inner + len(prefix), width))
+        open, close = "{ ", " }"
+    else:
+        parts = [toTypeScript(v, inner, inner, width) for v in value]
+        open, close = "[", "]"
+    if not parts:
+        return "{}" if isinstance(value, dict) else "[]"
+    inline = open + ", ".join(parts) + close
+    # Allow for a comma after.
+    if "\n" not in inline and column + len(inline) < width:
+        return inline
+    lines = "".join(f"{' ' * inner}{part},\n" for part in parts)
+    return f"{open.strip()}\n{lines}{' ' * indent}{close.strip()}"
+
+
+def tsKey(key):
+    return key if re.fullmatch(r"[A-Za-z_$][\w$]*|\d+", key) else f"'{key}'"
@@ -17,11 +17,15 @@ layout(std140) uniform Time {
 } time;
 
 uniform sampler2D water;
+#ifdef SHADOWS
 uniform sampler2DShadow depthMap;
+#endif
 
 in vec3 vertex;
 in vec3 normal;
+#ifdef SHADOWS
 in vec4 depthMapLookup;
+#endif
 in vec2 texCoord;
 out vec4 fragmentColor;
 
@@ -0,0 +1,71 @@
+/* Copyright (c) 2025-2026 Gene Ressler
+   SPDX-License-Identifier: GPL-3.0-or-later */
+
+/** Types of the shader program and reflection tables build.py emits into shaders.ts. */
+
+/** A uniform, sampler, varying, or fragment output. Length is present only for arrays. */
+export type VariableReflection = {
+  name: string;
+  type: string;
+  length?: number;
+  flat?: boolean;
+  location?: number;
+};
+
+export type AttributeReflection = {
+  name: string;
+  type: string;
+  location: number;
+};
+
+/** A std140 uniform block member. Byte offset and size are from the block start. Arrays have a stride. */
+export type UniformBlockMemberReflection = {
+  name: string;
+  type: string;
+  offset: number;
+  size: number;
+  length?: number;
+  stride?: number;
+};
+
+/** A std140 uniform block. Size is in bytes. */
+export type UniformBlockReflection = {
+  name: string;
+  instance: string | null;
+  size: number;
+  members: UniformBlockMemberReflection[];
+};
+
+/**
+ * The interface of a linked program. Varyings are vertex outputs matched with fragment inputs by the
+ * build. Blocks are names of those in `UNIFORM_BLOCK_LAYOUTS`.
+ */
+export type ProgramReflection = {
+  attributes: AttributeReflection[];
+  varyings: VariableReflection[];
+  uniforms: VariableReflection[];
+  samplers: VariableReflection[];
+  blocks: string[];
+  outputs: VariableReflection[];
+};
+
+/** Vertex and fragment shader export names of a program. */
+export type ProgramShaders = {
+  vertexShader: string;
+  fragmentShader: string;
+};
+
+/** Display and depth program names of a program spec variant. */
+export type ProgramVariant = {
+  display: string;
+  depth?: string;
+};
+
+/** Returns the named member of the given block layout or throws if there's none. */
+export function getBlockMember(layout: UniformBlockReflection, memberName: string): UniformBlockMemberReflection {
+  const member = layout.members.find(member => member.name === memberName);
+  if (!member) {
+    throw new Error(`Missing uniform block member: ${layout.name}.${memberName}`);
+  }
+  return member;
+}
@@ -3,7 +3,11 @@
 
 import { Utility } from '../../../shared/classes/utility';
 import { GlService } from '../rendering/gl.service';
+import { SAMPLER_TEXTURE_UNITS } from '../rendering/constants';
+import { UNIFORM_BLOCK_BINDING_INDICES } from './constants';
+import { ProgramReflection } from './shader-reflection';
 import * as shaderSources from './shaders';
+import { PROGRAM_REFLECTIONS, PROGRAM_SHADERS, PROGRAM_VARIANTS } from './shaders';
 import { Injectable } from '@angular/core';
 
 export type ProgramSpec = {
@@ -11,8 +15,11 @@ export type ProgramSpec = {
   displayVertexShaderName: string;
   depthVertexShaderName?: string;
   fragmentShaderName: string;
+  variants?: string[];
 };
 export type Programs = { [key: string]: WebGLProgram };
+/** Display and depth programs of a spec's variants, indexed by feature bits. Sparse. */
+type ProgramVariants = { display: WebGLProgram[]; depth: WebGLProgram[] };
 type CompileFailure = {
   compileKind: 'failure';
   program: string;
@@ -30,8 +37,14 @@ type CompileMissing = {
 
 /**
  * Specs for shader programs. Each may result in a display program and also an optional depth-only program
- * with empty fragment shader for the shadow buffer. A spec with name `foo` and a `depthVertexShaderName`
- * produces programs with lookup keys `foo`  and `foo_depth`.
+ * with empty fragment shader for the shadow buffer. Programs are fetched by spec name and feature bits.
+ *
+ * Variants are sets of `*_SHADER_FEATURE` names in `constants.ts`, separated by spaces. The shaders of each
+ * are built with its features defined as macros. Only listed variants are built. The default is one variant
+ * with no features.
+ *
+ * The shader build reads these to emit `PROGRAM_SHADERS`, `PROGRAM_VARIANTS`, and `PROGRAM_REFLECTIONS`, so
+ * keep the format: one object per spec with quoted string values.
  */
 // TODO: For performance, specialized depth shaders could skip color attribute setup.
 const PROGRAM_SPECS: ProgramSpec[] = [
@@ -40,30 +53,33 @@ const PROGRAM_SPECS: ProgramSpec[] = [
     displayVertexShaderName: 'BUCKLED_MEMBER_VERTEX_SHADER',
     depthVertexShaderName: 'BUCKLED_MEMBER_VERTEX_SHADER',
     fragmentShaderName: 'BUCKLED_MEMBER_FRAGMENT_SHADER',
+    variants: ['', 'SHADOWS'],
   },
   {
     name: 'colored_mesh',
     displayVertexShaderName: 'COLORED_MESH_VERTEX_SHADER',
     depthVertexShaderName: 'COLORED_MESH_VERTEX_SHADER',
     fragmentShaderName: 'COLORED_MESH_FRAGMENT_SHADER',
-  },
-  {
-    name: 'colored_mesh_instances',
-    displayVertexShaderName: 'COLORED_MESH_INSTANCES_VERTEX_SHADER',
-    depthVertexShaderName: 'COLORED_MESH_INSTANCES_VERTEX_SHADER',
-    fragmentShaderName: 'COLORED_MESH_FRAGMENT_SHADER',
+    variants: [
+      'MATERIAL_REFS',
+      'MATERIAL_REFS SHADOWS',
+      'INSTANCED MATERIAL_REFS',
+      'INSTANCED MATERIAL_REFS SHADOWS',
+      'INSTANCED',
+      'INSTANCED SHADOWS',
+      'MATERIAL_REFS QUANTIZED',
+      'MATERIAL_REFS QUANTIZED SHADOWS',
+      'INSTANCED MATERIAL_REFS QUANTIZED',
+      'INSTANCED MATERIAL_REFS QUANTIZED SHADOWS',
+      'INSTANCED QUANTIZED',
+      'INSTANCED QUANTIZED SHADOWS',
+    ],
   },
   {
     name: 'depth_texture',
     displayVertexShaderName: 'DEPTH_TEXTURE_VERTEX_SHADER',
     fragmentShaderName: 'DEPTH_TEXTURE_FRAGMENT_SHADER',
   },
-  {
-    name: 'instance_colored_mesh',
-    displayVertexShaderName: 'INSTANCE_COLORED_MESH_VERTEX_SHADER',
-    depthVertexShaderName: 'INSTANCE_COLORED_MESH_VERTEX_SHADER',
-    fragmentShaderName: 'INSTANCE_COLORED_MESH_FRAGMENT_SHADER',
-  },
   {
     name: 'overlay',
     displayVertexShaderName: 'OVERLAY_VERTEX_SHADER',
@@ -73,11 +89,13 @@ const PROGRAM_SPECS: ProgramSpec[] = [
     name: 'terrain',
     displayVertexShaderName: 'TERRAIN_VERTEX_SHADER',
     fragmentShaderName: 'TERRAIN_FRAGMENT_SHADER',
+    variants: ['', 'SHADOWS'],
   },
   {
     name: 'river',
     displayVertexShaderName: 'RIVER_VERTEX_SHADER',
     fragmentShaderName: 'RIVER_FRAGMENT_SHADER',
+    variants: ['', 'SHADOWS'],
   },
   {
     name: 'sky',
@@ -89,55 +107,88 @@ const PROGRAM_SPECS: ProgramSpec[] = [
     displayVertexShaderName: 'TEXTURED_MESH_VERTEX_SHADER',
     depthVertexShaderName: 'TEXTURED_MESH_VERTEX_SHADER',
     fragmentShaderName: 'TEXTURED_MESH_FRAGMENT_SHADER',
-  },
-  {
-    name: 'textured_mesh_instances',
-    displayVertexShaderName: 'TEXTURED_MESH_INSTANCES_VERTEX_SHADER',
-    depthVertexShaderName: 'TEXTURED_MESH_INSTANCES_VERTEX_SHADER',
-    fragmentShaderName: 'TEXTURED_MESH_FRAGMENT_SHADER',
+    variants: ['', 'SHADOWS', 'INSTANCED', 'INSTANCED SHADOWS'],
   },
   {
     name: 'wire',
     displayVertexShaderName: 'WIRE_VERTEX_SHADER',
+    depthVertexShaderName: 'WIRE_VERTEX_SHADER',
     fragmentShaderName: 'WIRE_FRAGMENT_SHADER',
-  },
-  {
-    name: 'wire_instances',
-    displayVertexShaderName: 'WIRE_INSTANCES_VERTEX_SHADER',
-    depthVertexShaderName: 'WIRE_INSTANCES_VERTEX_SHADER',
-    fragmentShaderName: 'WIRE_FRAGMENT_SHADER',
+    variants: ['', 'INSTANCED'],
   },
 ];
 
 @Injectable({ providedIn: 'root' })
 export class ShaderService {
-  private programs: Programs | undefined;
+  private programs: { [specName: string]: ProgramVariants } | undefined;
 
   constructor(private readonly glService: GlService) {}
 
-  /** Compiles and links all`PROGRAM_SPECS`. A program can then be fetched with `getProgram(key)*.  */
+  /**
+   * Compiles and links the programs of all `PROGRAM_SPECS` variants, binding samplers and uniform blocks as
+   * `PROGRAM_REFLECTIONS` describes. A program can then be fetched with `getProgram(name, features)`.
+   */
   public prepareShaders(): void {
+    const gl = this.glService.gl;
     const shaders = this.compileShaders();
-    const emptyFragmentShader = shaders['EMPTY_FRAGMENT_SHADER'];
     const programs: Programs = {};
     const failed: (CompileFailure | CompileMissing)[] = [];
-    for (const { name, displayVertexShaderName, depthVertexShaderName, fragmentShaderName } of PROGRAM_SPECS) {
-      appendResult(name, this.linkProgram(name, shaders[displayVertexShaderName], shaders[fragmentShaderName]));
-      if (depthVertexShaderName) {
-        const depthName = name + '_depth';
-        appendResult(depthName, this.linkProgram(depthName, shaders[depthVertexShaderName], emptyFragmentShader));
-      }
+    // Variants with the same shaders share a program, so each is linked once.
+    for (const [name, { vertexShader, fragmentShader }] of Object.entries(PROGRAM_SHADERS)) {
+      appendResult(name, this.linkProgram(name, shaders[vertexShader], shaders[fragmentShader]));
     }
     if (failed.length > 0) {
       console.error('shaders:', failed);
     }
-    this.programs = programs;
+    this.programs = {};
+    for (const { name } of PROGRAM_SPECS) {
+      const variants = PROGRAM_VARIANTS[name];
+      if (!variants) {
+        throw new Error(`Missing program variants: ${name}. Rebuild shaders.ts.`);
+      }
+      const programVariants: ProgramVariants = { display: [], depth: [] };
+      for (const [features, { display, depth }] of Object.entries(variants)) {
+        programVariants.display[Number(features)] = programs[display];
+        if (depth) {
+          programVariants.depth[Number(features)] = programs[depth];
+        }
+      }
+      this.programs[name] = programVariants;
+    }
+    gl.useProgram(null);
+
+    /**
+     * Binds samplers of the given program to their texture units and uniform blocks to their binding indices.
+     * Both are program state, so rendering needs only to bind textures and buffers.
+     */
+    function bindInterface(name: string, program: WebGLProgram) {
+      const reflection: ProgramReflection | undefined = PROGRAM_REFLECTIONS[name];
+      if (!reflection) {
+        throw new Error(`Missing shader reflection: ${name}. Rebuild shaders.ts.`);
+      }
+      gl.useProgram(program);
+      for (const { name: samplerName } of reflection.samplers) {
+        const unit = SAMPLER_TEXTURE_UNITS[samplerName];
+        if (unit === undefined) {
+          throw new Error(`Missing texture unit for sampler: ${samplerName}`);
+        }
+        gl.uniform1i(gl.getUniformLocation(program, samplerName), unit);
+      }
+      for (const blockName of reflection.blocks) {
+        const bindingIndex = UNIFORM_BLOCK_BINDING_INDICES[blockName];
+        if (bindingIndex === undefined) {
+          throw new Error(`Missing binding index for uniform block: ${blockName}`);
+        }
+        gl.uniformBlockBinding(program, gl.getUniformBlockIndex(program, blockName), bindingIndex);
+      }
+    }
 
     /** Appends the result of a single shader compilation. */
     function appendResult(name: string, linkResult: CompileFailure | CompileMissing | CompileSuccess) {
       switch (linkResult.compileKind) {
         case 'success':
           programs[name] = linkResult.program;
+          bindInterface(name, linkResult.program);
           break;
         case 'failure':
         case 'missing':
@@ -147,14 +198,15 @@ export class ShaderService {
     }
   }
 
-  /** Gets the given program or throws if it's not present. */
-  public getProgram(name: string): WebGLProgram {
-    if (this.glService.isRenderingDepth) {
-      name += '_depth';
-    }
-    const program = this.programs?.[name];
+  /**
+   * Gets the variant of the named program with given `*_SHADER_FEATURE` bits, the depth program if rendering
+   * depth. Throws if it's not present.
+   */
+  public getProgram(name: string, features: number = 0): WebGLProgram {
+    const variants = this.programs?.[name];
+    const program = (this.glService.isRenderingDepth ? variants?.depth : variants?.display)?.[features];
     if (!program) {
-      throw new Error(`Missing shader: ${name}`);
+      throw new Error(`Missing shader: ${name} with features ${features}`);
     }
     return program;
   }
@@ -164,9 +216,14 @@ export class ShaderService {
     const gl = this.glService.gl;
     const result: { [key: string]: WebGLShader } = {};
     for (const exportName in shaderSources) {
+      const source = shaderSources[exportName as keyof typeof shaderSources];
+      // Skip reflection tables.
+      if (typeof source !== 'string') {
+        continue;
+      }
       const shaderKind = exportName.includes('VERTEX') ? gl.VERTEX_SHADER : gl.FRAGMENT_SHADER;
       const shader = Utility.assertNotNull(gl.createShader(shaderKind));
-      gl.shaderSource(shader, shaderSources[exportName as keyof typeof shaderSources]);
+      gl.shaderSource(shader, source);
       gl.compileShader(shader);
       result[exportName] = shader;
     }
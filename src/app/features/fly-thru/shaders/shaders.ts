@@ -2,29 +2,33 @@
    SPDX-License-Identifier: GPL-3.0-or-later */
 
 // This file is generated. Edit .vert and .frag files instead.
+import { ProgramReflection, ProgramShaders, ProgramVariant, UniformBlockReflection } from './shader-reflection';
+
 export const BUCKLED_MEMBER_VERTEX_SHADER = 
 `#version 300 es
 precision mediump float;
 layout(std140)uniform Transforms{
 mat4 modelView;
 mat4 modelViewProjection;
-mat4 depthMapLookup;}transforms;
+mat4 depthMapLookup;
+}transforms;
 layout(location=0)in vec3 inPosition;
 layout(location=1)in uint inNormalRef;
 layout(location=4)in mat4 inModelTransform;
-const mat4 UNIT_SQUARE=mat4(0,0,0,1,1,0,0,1,1,1,0,1,0,1,0,1);
+const mat4 a=mat4(0,0,0,1,1,0,0,1,1,1,0,1,0,1,0,1);
 out vec3 vertex;
 out vec3 normal;
 out vec4 depthMapLookup;
 void main(){
-vec4 p=inModelTransform*vec4(inPosition,1.0f);
-vec4 position=vec4(p.x/p.w,p.y/p.w,p.z,1.0f);
-mat4 u=inModelTransform*UNIT_SQUARE;
-vec3 rawNormal=inNormalRef==0u ? vec3(0,0,1): inNormalRef==1u ? vec3(0,0,-1): inNormalRef==2u ? vec3(u[2][0]/u[2][3]-u[1][0]/u[1][3],u[2][1]/u[2][3]-u[1][1]/u[1][3],0): inNormalRef==3u ? vec3(u[3][0]/u[3][3]-u[0][0]/u[0][3],u[3][1]/u[3][3]-u[0][1]/u[0][3],0): inNormalRef==4u ? vec3(u[1][0]/u[1][3]-u[2][0]/u[2][3],u[1][1]/u[1][3]-u[2][1]/u[2][3],0): vec3(u[0][0]/u[0][3]-u[3][0]/u[3][3],u[0][1]/u[0][3]-u[3][1]/u[3][3],0);
-gl_Position=transforms.modelViewProjection*position;
-vertex=vec3(transforms.modelView*position);
-normal=mat3(transforms.modelView)*normalize(rawNormal);
-depthMapLookup=transforms.depthMapLookup*position;}`;
+vec4 c=inModelTransform*vec4(inPosition,1.);
+vec4 d=vec4(c.x/c.w,c.y/c.w,c.z,1.);
+mat4 b=inModelTransform*a;
+vec3 e=inNormalRef==0u?vec3(0,0,1):inNormalRef==1u?vec3(0,0,-1):inNormalRef==2u?vec3(b[2][0]/b[2][3]-b[1][0]/b[1][3],b[2][1]/b[2][3]-b[1][1]/b[1][3],0):inNormalRef==3u?vec3(b[3][0]/b[3][3]-b[0][0]/b[0][3],b[3][1]/b[3][3]-b[0][1]/b[0][3],0):inNormalRef==4u?vec3(b[1][0]/b[1][3]-b[2][0]/b[2][3],b[1][1]/b[1][3]-b[2][1]/b[2][3],0):vec3(b[0][0]/b[0][3]-b[3][0]/b[3][3],b[0][1]/b[0][3]-b[3][1]/b[3][3],0);
+gl_Position=transforms.modelViewProjection*d;
+vertex=vec3(transforms.modelView*d);
+normal=mat3(transforms.modelView)*normalize(e);
+depthMapLookup=transforms.depthMapLookup*d;
+}`;
 
 export const BUCKLED_MEMBER_FRAGMENT_SHADER = 
 `#version 300 es
@@ -35,87 +39,114 @@ vec3 unitDirection;
 float brightness;
 vec3 color;
 float ambientIntensity;
-float shadowWeight;}light;
+float shadowWeight;
+}light;
+in vec3 vertex;
+in vec3 normal;
+out vec4 fragmentColor;
+const vec3 a=vec3(1.,0.,0.);
+void main(){
+vec3 b=normalize(normal);
+float c=dot(b,light.unitDirection);
+vec3 e=normalize(2.*c*b-light.unitDirection);
+vec3 f=normalize(-vertex);
+float d=1.;
+float g=pow(d*max(dot(e,f),0.),2e1);
+float h=mix(light.ambientIntensity,1.,d*max(0.,c));
+vec3 i=light.color*(g+h*a);
+fragmentColor=vec4(light.brightness*i,1.);
+}`;
+
+export const BUCKLED_MEMBER_SHADOWS_FRAGMENT_SHADER = 
+`#version 300 es
+precision mediump float;
+precision mediump sampler2DShadow;
+layout(std140)uniform LightConfig{
+vec3 unitDirection;
+float brightness;
+vec3 color;
+float ambientIntensity;
+float shadowWeight;
+}light;
 uniform sampler2DShadow depthMap;
 in vec3 vertex;
 in vec3 normal;
 in vec4 depthMapLookup;
 out vec4 fragmentColor;
-const vec3 COLOR=vec3(1.0,0.0,0.0);
-const float SHININESS=20.0;
+const vec3 a=vec3(1.,0.,0.);
 void main(){
-vec3 unitNormal=normalize(normal);
-float normalDotLight=dot(unitNormal,light.unitDirection);
-vec3 unitReflection=normalize(2.0f*normalDotLight*unitNormal-light.unitDirection);
-vec3 unitEye=normalize(-vertex);
-float shadow=light.shadowWeight < 1.0f ? mix(light.shadowWeight,1.0f,textureProj(depthMap,depthMapLookup)): 1.0f;
-float specularIntensity=pow(shadow*max(dot(unitReflection,unitEye),0.0f),SHININESS);
-float diffuseIntensity=mix(light.ambientIntensity,1.0f,shadow*max(0.0f,normalDotLight));
-vec3 color=light.color*(specularIntensity+diffuseIntensity*COLOR);
-fragmentColor=vec4(light.brightness*color,1.0f);}`;
+vec3 b=normalize(normal);
+float c=dot(b,light.unitDirection);
+vec3 e=normalize(2.*c*b-light.unitDirection);
+vec3 f=normalize(-vertex);
+float d=light.shadowWeight<1.?mix(light.shadowWeight,1.,textureProj(depthMap,depthMapLookup)):1.;
+float g=pow(d*max(dot(e,f),0.),2e1);
+float h=mix(light.ambientIntensity,1.,d*max(0.,c));
+vec3 i=light.color*(g+h*a);
+fragmentColor=vec4(light.brightness*i,1.);
+}`;
 
-export const COLORED_MESH_VERTEX_SHADER = 
+export const COLORED_MESH_INSTANCED_VERTEX_SHADER = 
 `#version 300 es
 precision mediump float;
 layout(std140)uniform Transforms{
 mat4 modelView;
 mat4 modelViewProjection;
-mat4 depthMapLookup;}transforms;
+mat4 depthMapLookup;
+}transforms;
 layout(location=0)in vec3 inPosition;
 layout(location=1)in vec3 inNormal;
-layout(location=2)in uint inMaterialRef;
+layout(location=2)in vec3 inColor;
+layout(location=4)in mat4 inModelTransform;
 out vec3 vertex;
 out vec3 normal;
 out vec4 depthMapLookup;
-flat out uint materialRef;
+out vec3 materialColor;
 void main(){
-vec4 inPositionHomogeneous=vec4(inPosition,1.0f);
-gl_Position=transforms.modelViewProjection*inPositionHomogeneous;
-vertex=vec3(transforms.modelView*inPositionHomogeneous);
-depthMapLookup=transforms.depthMapLookup*inPositionHomogeneous;
-normal=mat3(transforms.modelView)*inNormal;
-materialRef=inMaterialRef;}`;
+vec3 b=inPosition;
+vec3 c=inNormal;
+vec4 a=inModelTransform*vec4(b,1.);
+normal=mat3(transforms.modelView)*mat3(inModelTransform)*c;
+gl_Position=transforms.modelViewProjection*a;
+vertex=vec3(transforms.modelView*a);
+depthMapLookup=transforms.depthMapLookup*a;
+materialColor=inColor;
+}`;
 
-export const COLORED_MESH_FRAGMENT_SHADER = 
+export const COLORED_MESH_MATERIAL_REFS_VERTEX_SHADER = 
 `#version 300 es
 precision mediump float;
-precision mediump sampler2DShadow;
-layout(std140)uniform LightConfig{
-vec3 unitDirection;
-float brightness;
-vec3 color;
-float ambientIntensity;
-float shadowWeight;}light;
-struct MaterialSpec{
-vec4 spec;};
-layout(std140)uniform MaterialConfig{
-float globalAlpha;
-MaterialSpec specs[12];}materialConfig;
-uniform sampler2DShadow depthMap;
-in vec3 vertex;
-in vec3 normal;
-in vec4 depthMapLookup;
-flat in uint materialRef;
-out vec4 fragmentColor;
+layout(std140)uniform Transforms{
+mat4 modelView;
+mat4 modelViewProjection;
+mat4 depthMapLookup;
+}transforms;
+layout(location=0)in vec3 inPosition;
+layout(location=1)in vec3 inNormal;
+layout(location=2)in uint inMaterialRef;
+out vec3 vertex;
+out vec3 normal;
+out vec4 depthMapLookup;
+flat out uint materialRef;
 void main(){
-MaterialSpec materialSpec=materialConfig.specs[materialRef];
-vec3 unitNormal=normalize(normal);
-float normalDotLight=dot(unitNormal,light.unitDirection);
-vec3 unitReflection=normalize(2.0f*normalDotLight*unitNormal-light.unitDirection);
-vec3 unitEye=normalize(-vertex);
-float shadow=light.shadowWeight < 1.0f ? mix(light.shadowWeight,1.0f,textureProj(depthMap,depthMapLookup)): 1.0f;
-float specularIntensity=pow(shadow*max(dot(unitReflection,unitEye),0.0f),materialSpec.spec.w);
-float diffuseIntensity=mix(light.ambientIntensity,1.0f,shadow*max(0.0f,normalDotLight));
-vec3 color=light.color*(specularIntensity+diffuseIntensity*materialSpec.spec.xyz);
-fragmentColor=vec4(light.brightness*color,materialConfig.globalAlpha);}`;
+vec3 b=inPosition;
+vec3 c=inNormal;
+vec4 a=vec4(b,1.);
+normal=mat3(transforms.modelView)*c;
+gl_Position=transforms.modelViewProjection*a;
+vertex=vec3(transforms.modelView*a);
+depthMapLookup=transforms.depthMapLookup*a;
+materialRef=inMaterialRef;
+}`;
 
-export const COLORED_MESH_INSTANCES_VERTEX_SHADER = 
+export const COLORED_MESH_INSTANCED_MATERIAL_REFS_VERTEX_SHADER = 
 `#version 300 es
 precision mediump float;
 layout(std140)uniform Transforms{
 mat4 modelView;
 mat4 modelViewProjection;
-mat4 depthMapLookup;}transforms;
+mat4 depthMapLookup;
+}transforms;
 layout(location=0)in vec3 inPosition;
 layout(location=1)in vec3 inNormal;
 layout(location=2)in uint inMaterialRef;
@@ -125,66 +156,151 @@ out vec3 normal;
 out vec4 depthMapLookup;
 flat out uint materialRef;
 void main(){
-vec4 inPositionHomogeneous=inModelTransform*vec4(inPosition,1.0f);
-gl_Position=transforms.modelViewProjection*inPositionHomogeneous;
-vertex=vec3(transforms.modelView*inPositionHomogeneous);
-normal=mat3(transforms.modelView)*mat3(inModelTransform)*inNormal;
-depthMapLookup=transforms.depthMapLookup*inPositionHomogeneous;
-materialRef=inMaterialRef;}`;
+vec3 b=inPosition;
+vec3 c=inNormal;
+vec4 a=inModelTransform*vec4(b,1.);
+normal=mat3(transforms.modelView)*mat3(inModelTransform)*c;
+gl_Position=transforms.modelViewProjection*a;
+vertex=vec3(transforms.modelView*a);
+depthMapLookup=transforms.depthMapLookup*a;
+materialRef=inMaterialRef;
+}`;
 
-export const DEPTH_TEXTURE_VERTEX_SHADER = 
+export const COLORED_MESH_INSTANCED_QUANTIZED_VERTEX_SHADER = 
 `#version 300 es
 precision mediump float;
-layout(location=0)in vec2 inTexCoord;
-out vec2 texCoord;
+layout(std140)uniform Transforms{
+mat4 modelView;
+mat4 modelViewProjection;
+mat4 depthMapLookup;
+}transforms;
+layout(location=0)in vec3 inPosition;
+layout(location=1)in vec2 inNormal;
+layout(location=8)in vec3 inPositionScale;
+layout(location=9)in vec3 inPositionOffset;
+layout(location=2)in vec3 inColor;
+layout(location=4)in mat4 inModelTransform;
+out vec3 vertex;
+out vec3 normal;
+out vec4 depthMapLookup;
+out vec3 materialColor;
+vec3 a(vec2 d){
+vec3 b=vec3(d,1.-abs(d.x)-abs(d.y));
+float c=max(-b.z,0.);
+b.x+=b.x>=0.?-c:c;
+b.y+=b.y>=0.?-c:c;
+return normalize(b);
+}
 void main(){
-texCoord=inTexCoord;
-gl_Position=vec4(inTexCoord*2.0f-1.0f,0,1.0f);}`;
+vec3 c=inPosition*inPositionScale+inPositionOffset;
+vec3 d=a(inNormal);
+vec4 b=inModelTransform*vec4(c,1.);
+normal=mat3(transforms.modelView)*mat3(inModelTransform)*d;
+gl_Position=transforms.modelViewProjection*b;
+vertex=vec3(transforms.modelView*b);
+depthMapLookup=transforms.depthMapLookup*b;
+materialColor=inColor;
+}`;
 
-export const DEPTH_TEXTURE_FRAGMENT_SHADER = 
+export const COLORED_MESH_MATERIAL_REFS_QUANTIZED_VERTEX_SHADER = 
 `#version 300 es
 precision mediump float;
-precision mediump sampler2DShadow;
-uniform sampler2DShadow depthMap;
-in vec2 texCoord;
-out vec4 fragmentColor;
-const float increment=1.0f/8.0f;
-void main(){
-float intensity=0.0f;
-for(float f=increment;
-f <=1.0f;
-f+=increment){
-intensity+=texture(depthMap,vec3(texCoord,f));}intensity*=increment;
-fragmentColor=vec4(intensity,intensity,intensity,1.0f);}`;
-
-export const EMPTY_FRAGMENT_SHADER = 
-`#version 300 es
+layout(std140)uniform Transforms{
+mat4 modelView;
+mat4 modelViewProjection;
+mat4 depthMapLookup;
+}transforms;
+layout(location=0)in vec3 inPosition;
+layout(location=1)in vec2 inNormal;
+layout(location=8)in vec3 inPositionScale;
+layout(location=9)in vec3 inPositionOffset;
+layout(location=2)in uint inMaterialRef;
+out vec3 vertex;
+out vec3 normal;
+out vec4 depthMapLookup;
+flat out uint materialRef;
+vec3 a(vec2 d){
+vec3 b=vec3(d,1.-abs(d.x)-abs(d.y));
+float c=max(-b.z,0.);
+b.x+=b.x>=0.?-c:c;
+b.y+=b.y>=0.?-c:c;
+return normalize(b);
+}
 void main(){
+vec3 c=inPosition*inPositionScale+inPositionOffset;
+vec3 d=a(inNormal);
+vec4 b=vec4(c,1.);
+normal=mat3(transforms.modelView)*d;
+gl_Position=transforms.modelViewProjection*b;
+vertex=vec3(transforms.modelView*b);
+depthMapLookup=transforms.depthMapLookup*b;
+materialRef=inMaterialRef;
 }`;
 
-export const INSTANCE_COLORED_MESH_VERTEX_SHADER = 
+export const COLORED_MESH_INSTANCED_MATERIAL_REFS_QUANTIZED_VERTEX_SHADER = 
 `#version 300 es
+precision mediump float;
 layout(std140)uniform Transforms{
 mat4 modelView;
 mat4 modelViewProjection;
-mat4 depthMapLookup;}transforms;
+mat4 depthMapLookup;
+}transforms;
 layout(location=0)in vec3 inPosition;
-layout(location=1)in vec3 inNormal;
-layout(location=2)in vec3 inColor;
+layout(location=1)in vec2 inNormal;
+layout(location=8)in vec3 inPositionScale;
+layout(location=9)in vec3 inPositionOffset;
+layout(location=2)in uint inMaterialRef;
 layout(location=4)in mat4 inModelTransform;
 out vec3 vertex;
 out vec3 normal;
 out vec4 depthMapLookup;
-out vec3 materialColor;
+flat out uint materialRef;
+vec3 a(vec2 d){
+vec3 b=vec3(d,1.-abs(d.x)-abs(d.y));
+float c=max(-b.z,0.);
+b.x+=b.x>=0.?-c:c;
+b.y+=b.y>=0.?-c:c;
+return normalize(b);
+}
 void main(){
-vec4 inPositionHomogeneous=inModelTransform*vec4(inPosition,1.0f);
-gl_Position=transforms.modelViewProjection*inPositionHomogeneous;
-vertex=vec3(transforms.modelView*inPositionHomogeneous);
-normal=mat3(transforms.modelView)*mat3(inModelTransform)*inNormal;
-depthMapLookup=transforms.depthMapLookup*inPositionHomogeneous;
-materialColor=inColor;}`;
+vec3 c=inPosition*inPositionScale+inPositionOffset;
+vec3 d=a(inNormal);
+vec4 b=inModelTransform*vec4(c,1.);
+normal=mat3(transforms.modelView)*mat3(inModelTransform)*d;
+gl_Position=transforms.modelViewProjection*b;
+vertex=vec3(transforms.modelView*b);
+depthMapLookup=transforms.depthMapLookup*b;
+materialRef=inMaterialRef;
+}`;
+
+export const COLORED_MESH_FRAGMENT_SHADER = 
+`#version 300 es
+precision mediump float;
+precision mediump sampler2DShadow;
+layout(std140)uniform LightConfig{
+vec3 unitDirection;
+float brightness;
+vec3 color;
+float ambientIntensity;
+float shadowWeight;
+}light;
+in vec3 vertex;
+in vec3 normal;
+in vec3 materialColor;
+out vec4 fragmentColor;
+void main(){
+vec3 a=normalize(normal);
+float b=dot(a,light.unitDirection);
+vec3 d=normalize(2.*b*a-light.unitDirection);
+vec3 e=normalize(-vertex);
+float c=1.;
+float f=pow(c*max(dot(d,e),0.),2e1);
+float g=mix(light.ambientIntensity,1.,c*max(0.,b));
+vec3 h=light.color*(f+g*materialColor);
+fragmentColor=vec4(light.brightness*h,1.);
+}`;
 
-export const INSTANCE_COLORED_MESH_FRAGMENT_SHADER = 
+export const COLORED_MESH_SHADOWS_FRAGMENT_SHADER = 
 `#version 300 es
 precision mediump float;
 precision mediump sampler2DShadow;
@@ -193,24 +309,127 @@ vec3 unitDirection;
 float brightness;
 vec3 color;
 float ambientIntensity;
-float shadowWeight;}light;
+float shadowWeight;
+}light;
 uniform sampler2DShadow depthMap;
 in vec3 vertex;
 in vec3 normal;
 in vec4 depthMapLookup;
 in vec3 materialColor;
 out vec4 fragmentColor;
-const float MEMBER_SHININESS=20.0;
-void main(){
-vec3 unitNormal=normalize(normal);
-float normalDotLight=dot(unitNormal,light.unitDirection);
-vec3 unitReflection=normalize(2.0f*normalDotLight*unitNormal-light.unitDirection);
-vec3 unitEye=normalize(-vertex);
-float shadow=light.shadowWeight < 1.0f ? mix(light.shadowWeight,1.0f,textureProj(depthMap,depthMapLookup)): 1.0f;
-float specularIntensity=pow(shadow*max(dot(unitReflection,unitEye),0.0f),MEMBER_SHININESS);
-float diffuseIntensity=mix(light.ambientIntensity,1.0f,shadow*max(0.0f,normalDotLight));
-vec3 color=light.color*(specularIntensity+diffuseIntensity*materialColor);
-fragmentColor=vec4(light.brightness*color,1.0f);}`;
+void main(){
+vec3 a=normalize(normal);
+float b=dot(a,light.unitDirection);
+vec3 d=normalize(2.*b*a-light.unitDirection);
+vec3 e=normalize(-vertex);
+float c=light.shadowWeight<1.?mix(light.shadowWeight,1.,textureProj(depthMap,depthMapLookup)):1.;
+float f=pow(c*max(dot(d,e),0.),2e1);
+float g=mix(light.ambientIntensity,1.,c*max(0.,b));
+vec3 h=light.color*(f+g*materialColor);
+fragmentColor=vec4(light.brightness*h,1.);
+}`;
+
+export const COLORED_MESH_MATERIAL_REFS_FRAGMENT_SHADER = 
+`#version 300 es
+precision mediump float;
+precision mediump sampler2DShadow;
+layout(std140)uniform LightConfig{
+vec3 unitDirection;
+float brightness;
+vec3 color;
+float ambientIntensity;
+float shadowWeight;
+}light;
+struct MaterialSpec{
+vec4 spec;
+};
+layout(std140)uniform MaterialConfig{
+float globalAlpha;
+MaterialSpec specs[12];
+}materialConfig;
+in vec3 vertex;
+in vec3 normal;
+flat in uint materialRef;
+out vec4 fragmentColor;
+void main(){
+MaterialSpec a=materialConfig.specs[materialRef];
+vec3 b=normalize(normal);
+float c=dot(b,light.unitDirection);
+vec3 e=normalize(2.*c*b-light.unitDirection);
+vec3 f=normalize(-vertex);
+float d=1.;
+float g=pow(d*max(dot(e,f),0.),a.spec.w);
+float h=mix(light.ambientIntensity,1.,d*max(0.,c));
+vec3 i=light.color*(g+h*a.spec.xyz);
+fragmentColor=vec4(light.brightness*i,materialConfig.globalAlpha);
+}`;
+
+export const COLORED_MESH_SHADOWS_MATERIAL_REFS_FRAGMENT_SHADER = 
+`#version 300 es
+precision mediump float;
+precision mediump sampler2DShadow;
+layout(std140)uniform LightConfig{
+vec3 unitDirection;
+float brightness;
+vec3 color;
+float ambientIntensity;
+float shadowWeight;
+}light;
+struct MaterialSpec{
+vec4 spec;
+};
+layout(std140)uniform MaterialConfig{
+float globalAlpha;
+MaterialSpec specs[12];
+}materialConfig;
+uniform sampler2DShadow depthMap;
+in vec3 vertex;
+in vec3 normal;
+in vec4 depthMapLookup;
+flat in uint materialRef;
+out vec4 fragmentColor;
+void main(){
+MaterialSpec a=materialConfig.specs[materialRef];
+vec3 b=normalize(normal);
+float c=dot(b,light.unitDirection);
+vec3 e=normalize(2.*c*b-light.unitDirection);
+vec3 f=normalize(-vertex);
+float d=light.shadowWeight<1.?mix(light.shadowWeight,1.,textureProj(depthMap,depthMapLookup)):1.;
+float g=pow(d*max(dot(e,f),0.),a.spec.w);
+float h=mix(light.ambientIntensity,1.,d*max(0.,c));
+vec3 i=light.color*(g+h*a.spec.xyz);
+fragmentColor=vec4(light.brightness*i,materialConfig.globalAlpha);
+}`;
+
+export const DEPTH_TEXTURE_VERTEX_SHADER = 
+`#version 300 es
+precision mediump float;
+layout(location=0)in vec2 inTexCoord;
+out vec2 texCoord;
+void main(){
+texCoord=inTexCoord;
+gl_Position=vec4(inTexCoord*2.-1.,0,1.);
+}`;
+
+export const DEPTH_TEXTURE_FRAGMENT_SHADER = 
+`#version 300 es
+precision mediump float;
+precision mediump sampler2DShadow;
+uniform sampler2DShadow depthMap;
+in vec2 texCoord;
+out vec4 fragmentColor;
+void main(){
+float a=0.;
+for(float b=.125;b<=1.;b+=.125){
+a+=texture(depthMap,vec3(texCoord,b));
+}a*=.125;
+fragmentColor=vec4(a,a,a,1.);
+}`;
+
+export const EMPTY_FRAGMENT_SHADER = 
+`#version 300 es
+void main(){
+}`;
 
 export const OVERLAY_VERTEX_SHADER = 
 `#version 300 es
@@ -221,11 +440,12 @@ layout(location=3)in vec2 inTexCoord;
 out vec3 texCoord;
 out float alpha;
 void main(){
-float xScale=inPosition[2];
-float yScale=inPosition[3];
-gl_Position=vec4(inTexCoord.x*xScale+inPosition.x,inTexCoord.y*yScale+inPosition.y,0,1);
+float a=inPosition[2];
+float b=inPosition[3];
+gl_Position=vec4(inTexCoord.x*a+inPosition.x,inTexCoord.y*b+inPosition.y,0,1);
 texCoord=vec3(inTexCoord,gl_InstanceID);
-alpha=inAlpha;}`;
+alpha=inAlpha;
+}`;
 
 export const OVERLAY_FRAGMENT_SHADER = 
 `#version 300 es
@@ -236,9 +456,11 @@ in vec3 texCoord;
 in float alpha;
 out vec4 fragmentColor;
 void main(){
-if(alpha < 0.01){
-discard;}fragmentColor=texture(icons,texCoord);
-fragmentColor.a*=alpha;}`;
+if(alpha<.01){
+discard;
+}fragmentColor=texture(icons,texCoord);
+fragmentColor.a*=alpha;
+}`;
 
 export const RIVER_VERTEX_SHADER = 
 `#version 300 es
@@ -246,20 +468,21 @@ precision mediump float;
 layout(std140)uniform Transforms{
 mat4 modelView;
 mat4 modelViewProjection;
-mat4 depthMapLookup;}transforms;
+mat4 depthMapLookup;
+}transforms;
 layout(location=0)in vec2 inPosition;
 out vec3 vertex;
 out vec3 normal;
 out vec4 depthMapLookup;
 out vec2 texCoord;
-const float TEX_SCALE=0.2;
 void main(){
-vec4 inPositionHomogeneous=vec4(inPosition.x,0.0f,inPosition.y,1.0f);
-gl_Position=transforms.modelViewProjection*inPositionHomogeneous;
-vertex=vec3(transforms.modelView*inPositionHomogeneous);
-normal=mat3(transforms.modelView)*vec3(0.0f,1.0f,0.0f);
-depthMapLookup=transforms.depthMapLookup*inPositionHomogeneous;
-texCoord=TEX_SCALE*inPosition;}`;
+vec4 a=vec4(inPosition.x,0.,inPosition.y,1.);
+gl_Position=transforms.modelViewProjection*a;
+vertex=vec3(transforms.modelView*a);
+normal=mat3(transforms.modelView)*vec3(0.,1.,0.);
+depthMapLookup=transforms.depthMapLookup*a;
+texCoord=.2*inPosition;
+}`;
 
 export const RIVER_FRAGMENT_SHADER = 
 `#version 300 es
@@ -270,9 +493,44 @@ vec3 unitDirection;
 float brightness;
 vec3 color;
 float ambientIntensity;
-float shadowWeight;}light;
+float shadowWeight;
+}light;
 layout(std140)uniform Time{
-float clock;}time;
+float clock;
+}time;
+uniform sampler2D water;
+in vec3 vertex;
+in vec3 normal;
+in vec2 texCoord;
+out vec4 fragmentColor;
+const vec2 a=vec2(.03125,.09375);
+void main(){
+vec3 e=texture(water,fract(texCoord)+a*time.clock).rgb;
+vec3 b=normalize(normal);
+float c=dot(b,light.unitDirection);
+vec3 f=normalize(2.*c*b-light.unitDirection);
+vec3 g=normalize(-vertex);
+float d=1.;
+float h=pow(d*max(dot(f,g),0.),4e1);
+float i=mix(light.ambientIntensity,1.,d*max(0.,c));
+vec3 j=light.color*(h+i*e);
+fragmentColor=vec4(light.brightness*j,1.);
+}`;
+
+export const RIVER_SHADOWS_FRAGMENT_SHADER = 
+`#version 300 es
+precision mediump float;
+precision mediump sampler2DShadow;
+layout(std140)uniform LightConfig{
+vec3 unitDirection;
+float brightness;
+vec3 color;
+float ambientIntensity;
+float shadowWeight;
+}light;
+layout(std140)uniform Time{
+float clock;
+}time;
 uniform sampler2D water;
 uniform sampler2DShadow depthMap;
 in vec3 vertex;
@@ -280,30 +538,33 @@ in vec3 normal;
 in vec4 depthMapLookup;
 in vec2 texCoord;
 out vec4 fragmentColor;
-const vec2 WATER_VELOCITY=vec2(1.0f/32.0f,3.0f/32.0f);
-void main(){
-vec3 texColor=texture(water,fract(texCoord)+WATER_VELOCITY*time.clock).rgb;
-vec3 unitNormal=normalize(normal);
-float normalDotLight=dot(unitNormal,light.unitDirection);
-vec3 unitReflection=normalize(2.0f*normalDotLight*unitNormal-light.unitDirection);
-vec3 unitEye=normalize(-vertex);
-float shadow=light.shadowWeight < 1.0f ? mix(light.shadowWeight,1.0f,textureProj(depthMap,depthMapLookup)): 1.0f;
-float specularIntensity=pow(shadow*max(dot(unitReflection,unitEye),0.0f),40.0f);
-float diffuseIntensity=mix(light.ambientIntensity,1.0f,shadow*max(0.0f,normalDotLight));
-vec3 color=light.color*(specularIntensity+diffuseIntensity*texColor);
-fragmentColor=vec4(light.brightness*color,1.0f);}`;
+const vec2 a=vec2(.03125,.09375);
+void main(){
+vec3 e=texture(water,fract(texCoord)+a*time.clock).rgb;
+vec3 b=normalize(normal);
+float c=dot(b,light.unitDirection);
+vec3 f=normalize(2.*c*b-light.unitDirection);
+vec3 g=normalize(-vertex);
+float d=light.shadowWeight<1.?mix(light.shadowWeight,1.,textureProj(depthMap,depthMapLookup)):1.;
+float h=pow(d*max(dot(f,g),0.),4e1);
+float i=mix(light.ambientIntensity,1.,d*max(0.,c));
+vec3 j=light.color*(h+i*e);
+fragmentColor=vec4(light.brightness*j,1.);
+}`;
 
 export const SKY_VERTEX_SHADER = 
 `#version 300 es
 precision mediump float;
 layout(std140)uniform SkyboxTransforms{
-mat4 viewRotationProjection;}transforms;
+mat4 viewRotationProjection;
+}transforms;
 layout(location=0)in vec3 inPosition;
 out vec3 texCoord;
 void main(){
-vec4 homogenousPosition=transforms.viewRotationProjection*vec4(inPosition,1);
-gl_Position=homogenousPosition.xyww;
-texCoord=vec3(-inPosition.x,inPosition.y,-inPosition.z);}`;
+vec4 a=transforms.viewRotationProjection*vec4(inPosition,1);
+gl_Position=a.xyww;
+texCoord=vec3(-inPosition.x,inPosition.y,-inPosition.z);
+}`;
 
 export const SKY_FRAGMENT_SHADER = 
 `#version 300 es
@@ -312,25 +573,28 @@ uniform samplerCube skybox;
 in vec3 texCoord;
 out vec4 fragmentColor;
 void main(){
-fragmentColor=texture(skybox,texCoord);}`;
+fragmentColor=texture(skybox,texCoord);
+}`;
 
 export const TERRAIN_VERTEX_SHADER = 
 `#version 300 es
 layout(std140)uniform Transforms{
 mat4 modelView;
 mat4 modelViewProjection;
-mat4 depthMapLookup;}transforms;
+mat4 depthMapLookup;
+}transforms;
 layout(location=0)in vec3 inPosition;
 layout(location=1)in vec3 inNormal;
 out vec3 normal;
 out vec4 depthMapLookup;
 out float yModelNormal;
 void main(){
-vec4 inPositionHomogeneous=vec4(inPosition,1.0f);
-gl_Position=transforms.modelViewProjection*inPositionHomogeneous;
+vec4 a=vec4(inPosition,1.);
+gl_Position=transforms.modelViewProjection*a;
 normal=mat3(transforms.modelView)*inNormal;
 yModelNormal=inNormal.y;
-depthMapLookup=transforms.depthMapLookup*inPositionHomogeneous;}`;
+depthMapLookup=transforms.depthMapLookup*a;
+}`;
 
 export const TERRAIN_FRAGMENT_SHADER = 
 `#version 300 es
@@ -341,31 +605,62 @@ vec3 unitDirection;
 float brightness;
 vec3 color;
 float ambientIntensity;
-float shadowWeight;}light;
+float shadowWeight;
+}light;
+in vec3 normal;
+in float yModelNormal;
+out vec4 fragmentColor;
+const vec3 b=.6*vec3(.13,.4,.33);
+const vec3 a=.6*vec3(.87,.78,.52);
+const vec3 c=b-a;
+void main(){
+vec3 d=normalize(normal);
+float e=dot(d,light.unitDirection);
+float f=1.;
+float g=mix(light.ambientIntensity*.2,1.,f*max(0.,e));
+float h=pow(yModelNormal,6.);
+vec3 i=a+c*h;
+vec3 j=g*light.color*i;
+fragmentColor=vec4(light.brightness*j,1.);
+}`;
+
+export const TERRAIN_SHADOWS_FRAGMENT_SHADER = 
+`#version 300 es
+precision mediump float;
+precision mediump sampler2DShadow;
+layout(std140)uniform LightConfig{
+vec3 unitDirection;
+float brightness;
+vec3 color;
+float ambientIntensity;
+float shadowWeight;
+}light;
 uniform sampler2DShadow depthMap;
 in vec3 normal;
 in vec4 depthMapLookup;
 in float yModelNormal;
 out vec4 fragmentColor;
-const vec3 NORMAL_TERRAIN_COLOR=0.6f*vec3(0.13f,0.4f,0.33f);
-const vec3 ERODED_TERRAIN_COLOR=0.6f*vec3(0.87f,0.78f,0.52f);
-const vec3 EROSION_DIFF=NORMAL_TERRAIN_COLOR-ERODED_TERRAIN_COLOR;
-void main(){
-vec3 unitNormal=normalize(normal);
-float normalDotLight=dot(unitNormal,light.unitDirection);
-float shadow=light.shadowWeight < 1.0f ? mix(light.shadowWeight,1.0f,textureProj(depthMap,depthMapLookup)): 1.0f;
-float diffuseIntensity=mix(light.ambientIntensity*0.2f,1.0f,shadow*max(0.0f,normalDotLight));
-float normalTerrainColorWeight=pow(yModelNormal,6.0f);
-vec3 terrainColor=ERODED_TERRAIN_COLOR+EROSION_DIFF*normalTerrainColorWeight;
-vec3 color=diffuseIntensity*light.color*terrainColor;
-fragmentColor=vec4(light.brightness*color,1.0f);}`;
+const vec3 b=.6*vec3(.13,.4,.33);
+const vec3 a=.6*vec3(.87,.78,.52);
+const vec3 c=b-a;
+void main(){
+vec3 d=normalize(normal);
+float e=dot(d,light.unitDirection);
+float f=light.shadowWeight<1.?mix(light.shadowWeight,1.,textureProj(depthMap,depthMapLookup)):1.;
+float g=mix(light.ambientIntensity*.2,1.,f*max(0.,e));
+float h=pow(yModelNormal,6.);
+vec3 i=a+c*h;
+vec3 j=g*light.color*i;
+fragmentColor=vec4(light.brightness*j,1.);
+}`;
 
 export const TEXTURED_MESH_VERTEX_SHADER = 
 `#version 300 es
 layout(std140)uniform Transforms{
 mat4 modelView;
 mat4 modelViewProjection;
-mat4 depthMapLookup;}transforms;
+mat4 depthMapLookup;
+}transforms;
 layout(location=0)in vec3 inPosition;
 layout(location=1)in vec3 inNormal;
 layout(location=3)in vec2 inTexCoord;
@@ -373,11 +668,34 @@ out vec3 normal;
 out vec4 depthMapLookup;
 out vec2 texCoord;
 void main(){
-vec4 inPositionHomogeneous=vec4(inPosition,1.0f);
-gl_Position=transforms.modelViewProjection*inPositionHomogeneous;
+vec4 a=vec4(inPosition,1.);
 normal=mat3(transforms.modelView)*inNormal;
-depthMapLookup=transforms.depthMapLookup*inPositionHomogeneous;
-texCoord=inTexCoord;}`;
+gl_Position=transforms.modelViewProjection*a;
+depthMapLookup=transforms.depthMapLookup*a;
+texCoord=inTexCoord;
+}`;
+
+export const TEXTURED_MESH_INSTANCED_VERTEX_SHADER = 
+`#version 300 es
+layout(std140)uniform Transforms{
+mat4 modelView;
+mat4 modelViewProjection;
+mat4 depthMapLookup;
+}transforms;
+layout(location=0)in vec3 inPosition;
+layout(location=1)in vec3 inNormal;
+layout(location=3)in vec2 inTexCoord;
+layout(location=4)in mat4 inModelTransform;
+out vec3 normal;
+out vec4 depthMapLookup;
+out vec2 texCoord;
+void main(){
+vec4 a=inModelTransform*vec4(inPosition,1.);
+normal=mat3(transforms.modelView)*mat3(inModelTransform)*inNormal;
+gl_Position=transforms.modelViewProjection*a;
+depthMapLookup=transforms.depthMapLookup*a;
+texCoord=inTexCoord;
+}`;
 
 export const TEXTURED_MESH_FRAGMENT_SHADER = 
 `#version 300 es
@@ -388,7 +706,33 @@ vec3 unitDirection;
 float brightness;
 vec3 color;
 float ambientIntensity;
-float shadowWeight;}light;
+float shadowWeight;
+}light;
+uniform sampler2D meshTexture;
+in vec3 normal;
+in vec2 texCoord;
+out vec4 fragmentColor;
+void main(){
+vec3 a=normalize(normal);
+float b=dot(a,light.unitDirection);
+float c=1.;
+float d=mix(light.ambientIntensity,1.,c*max(0.,b));
+vec3 e=texture(meshTexture,texCoord).rgb;
+vec3 f=d*e*light.color;
+fragmentColor=vec4(light.brightness*f,1.);
+}`;
+
+export const TEXTURED_MESH_SHADOWS_FRAGMENT_SHADER = 
+`#version 300 es
+precision mediump float;
+precision mediump sampler2DShadow;
+layout(std140)uniform LightConfig{
+vec3 unitDirection;
+float brightness;
+vec3 color;
+float ambientIntensity;
+float shadowWeight;
+}light;
 uniform sampler2D meshTexture;
 uniform sampler2DShadow depthMap;
 in vec3 normal;
@@ -396,48 +740,49 @@ in vec4 depthMapLookup;
 in vec2 texCoord;
 out vec4 fragmentColor;
 void main(){
-vec3 unitNormal=normalize(normal);
-float normalDotLight=dot(unitNormal,light.unitDirection);
-float shadow=light.shadowWeight < 1.0f ? mix(light.shadowWeight,1.0f,textureProj(depthMap,depthMapLookup)): 1.0f;
-float diffuseIntensity=mix(light.ambientIntensity,1.0f,shadow*max(0.0f,normalDotLight));
-vec3 materialColor=texture(meshTexture,texCoord).rgb;
-vec3 color=diffuseIntensity*materialColor*light.color;
-fragmentColor=vec4(light.brightness*color,1.0f);}`;
+vec3 a=normalize(normal);
+float b=dot(a,light.unitDirection);
+float c=light.shadowWeight<1.?mix(light.shadowWeight,1.,textureProj(depthMap,depthMapLookup)):1.;
+float d=mix(light.ambientIntensity,1.,c*max(0.,b));
+vec3 e=texture(meshTexture,texCoord).rgb;
+vec3 f=d*e*light.color;
+fragmentColor=vec4(light.brightness*f,1.);
+}`;
 
-export const TEXTURED_MESH_INSTANCES_VERTEX_SHADER = 
+export const WIRE_VERTEX_SHADER = 
 `#version 300 es
 layout(std140)uniform Transforms{
 mat4 modelView;
 mat4 modelViewProjection;
-mat4 depthMapLookup;}transforms;
+}transforms;
 layout(location=0)in vec3 inPosition;
-layout(location=1)in vec3 inNormal;
-layout(location=3)in vec2 inTexCoord;
-layout(location=4)in mat4 inModelTransform;
-out vec3 normal;
-out vec4 depthMapLookup;
-out vec2 texCoord;
+layout(location=1)in vec3 inDirection;
+out vec3 vertex;
+out vec3 direction;
 void main(){
-vec4 inPositionHomogeneous=inModelTransform*vec4(inPosition,1.0f);
-gl_Position=transforms.modelViewProjection*inPositionHomogeneous;
-normal=mat3(transforms.modelView)*mat3(inModelTransform)*inNormal;
-depthMapLookup=transforms.depthMapLookup*inPositionHomogeneous;
-texCoord=inTexCoord;}`;
+vec4 a=vec4(inPosition,1.);
+direction=mat3(transforms.modelView)*inDirection;
+gl_Position=transforms.modelViewProjection*a;
+vertex=vec3(transforms.modelView*a);
+}`;
 
-export const WIRE_VERTEX_SHADER = 
+export const WIRE_INSTANCED_VERTEX_SHADER = 
 `#version 300 es
 layout(std140)uniform Transforms{
 mat4 modelView;
-mat4 modelViewProjection;}transforms;
+mat4 modelViewProjection;
+}transforms;
 layout(location=0)in vec3 inPosition;
 layout(location=1)in vec3 inDirection;
+layout(location=4)in mat4 inModelTransform;
 out vec3 vertex;
 out vec3 direction;
 void main(){
-vec4 inPositionHomogeneous=vec4(inPosition,1.0f);
-gl_Position=transforms.modelViewProjection*inPositionHomogeneous;
-vertex=vec3(transforms.modelView*inPositionHomogeneous);
-direction=mat3(transforms.modelView)*inDirection;}`;
+vec4 a=inModelTransform*vec4(inPosition,1.);
+direction=mat3(transforms.modelView)*mat3(inModelTransform)*inDirection;
+gl_Position=transforms.modelViewProjection*a;
+vertex=vec3(transforms.modelView*a);
+}`;
 
 export const WIRE_FRAGMENT_SHADER = 
 `#version 300 es
@@ -446,35 +791,755 @@ layout(std140)uniform LightConfig{
 vec3 unitDirection;
 float brightness;
 vec3 color;
-float ambientIntensity;}light;
+float ambientIntensity;
+}light;
 in vec3 vertex;
 in vec3 direction;
 out vec4 fragmentColor;
-const vec3 WIRE_COLOR=vec3(0.3f,0.2f,0.2f);
-const float WIRE_SHININESS=30.0;
+const vec3 a=vec3(.3,.2,.2);
 void main(){
-vec3 unitDirection=normalize(direction);
-vec3 unitEye=normalize(-vertex);
-vec3 unitNormal=normalize(unitEye-dot(unitEye,unitDirection)*unitDirection);
-float normalDotLight=dot(unitNormal,light.unitDirection);
-vec3 unitReflection=normalize(2.0f*normalDotLight*unitNormal-light.unitDirection);
-float specularIntensity=pow(max(dot(unitReflection,unitEye),0.0f),WIRE_SHININESS);
-float diffuseIntensity=mix(light.ambientIntensity,1.0f,max(0.0f,normalDotLight));
-vec3 color=light.color*(specularIntensity+diffuseIntensity*WIRE_COLOR);
-fragmentColor=vec4(light.brightness*color,1.0f);}`;
+vec3 c=normalize(direction);
+vec3 b=normalize(-vertex);
+vec3 d=normalize(b-dot(b,c)*c);
+float e=dot(d,light.unitDirection);
+vec3 f=normalize(2.*e*d-light.unitDirection);
+float g=pow(max(dot(f,b),0.),3e1);
+float h=mix(light.ambientIntensity,1.,max(0.,e));
+vec3 i=light.color*(g+h*a);
+fragmentColor=vec4(light.brightness*i,1.);
+}`;
 
-export const WIRE_INSTANCES_VERTEX_SHADER = 
-`#version 300 es
-layout(std140)uniform Transforms{
-mat4 modelView;
-mat4 modelViewProjection;}transforms;
-layout(location=0)in vec3 inPosition;
-layout(location=1)in vec3 inDirection;
-layout(location=4)in mat4 inModelTransform;
-out vec3 vertex;
-out vec3 direction;
-void main(){
-vec4 position=inModelTransform*vec4(inPosition,1.0f);
-gl_Position=transforms.modelViewProjection*position;
-vertex=vec3(transforms.modelView*position);
-direction=mat3(transforms.modelView)*mat3(inModelTransform)*inDirection;}`;
+// Shaders of each distinct program the specs in shader.service.ts need.
+export const PROGRAM_SHADERS: { [programName: string]: ProgramShaders } = {
+  buckling_member: { vertexShader: 'BUCKLED_MEMBER_VERTEX_SHADER', fragmentShader: 'BUCKLED_MEMBER_FRAGMENT_SHADER' },
+  buckling_member_depth: { vertexShader: 'BUCKLED_MEMBER_VERTEX_SHADER', fragmentShader: 'EMPTY_FRAGMENT_SHADER' },
+  buckling_member_shadows: {
+    vertexShader: 'BUCKLED_MEMBER_VERTEX_SHADER',
+    fragmentShader: 'BUCKLED_MEMBER_SHADOWS_FRAGMENT_SHADER',
+  },
+  colored_mesh_instanced: {
+    vertexShader: 'COLORED_MESH_INSTANCED_VERTEX_SHADER',
+    fragmentShader: 'COLORED_MESH_FRAGMENT_SHADER',
+  },
+  colored_mesh_instanced_depth: {
+    vertexShader: 'COLORED_MESH_INSTANCED_VERTEX_SHADER',
+    fragmentShader: 'EMPTY_FRAGMENT_SHADER',
+  },
+  colored_mesh_instanced_shadows: {
+    vertexShader: 'COLORED_MESH_INSTANCED_VERTEX_SHADER',
+    fragmentShader: 'COLORED_MESH_SHADOWS_FRAGMENT_SHADER',
+  },
+  colored_mesh_material_refs: {
+    vertexShader: 'COLORED_MESH_MATERIAL_REFS_VERTEX_SHADER',
+    fragmentShader: 'COLORED_MESH_MATERIAL_REFS_FRAGMENT_SHADER',
+  },
+  colored_mesh_material_refs_depth: {
+    vertexShader: 'COLORED_MESH_MATERIAL_REFS_VERTEX_SHADER',
+    fragmentShader: 'EMPTY_FRAGMENT_SHADER',
+  },
+  colored_mesh_instanced_material_refs: {
+    vertexShader: 'COLORED_MESH_INSTANCED_MATERIAL_REFS_VERTEX_SHADER',
+    fragmentShader: 'COLORED_MESH_MATERIAL_REFS_FRAGMENT_SHADER',
+  },
+  colored_mesh_instanced_material_refs_depth: {
+    vertexShader: 'COLORED_MESH_INSTANCED_MATERIAL_REFS_VERTEX_SHADER',
+    fragmentShader: 'EMPTY_FRAGMENT_SHADER',
+  },
+  colored_mesh_shadows_material_refs: {
+    vertexShader: 'COLORED_MESH_MATERIAL_REFS_VERTEX_SHADER',
+    fragmentShader: 'COLORED_MESH_SHADOWS_MATERIAL_REFS_FRAGMENT_SHADER',
+  },
+  colored_mesh_instanced_shadows_material_refs: {
+    vertexShader: 'COLORED_MESH_INSTANCED_MATERIAL_REFS_VERTEX_SHADER',
+    fragmentShader: 'COLORED_MESH_SHADOWS_MATERIAL_REFS_FRAGMENT_SHADER',
+  },
+  colored_mesh_instanced_quantized: {
+    vertexShader: 'COLORED_MESH_INSTANCED_QUANTIZED_VERTEX_SHADER',
+    fragmentShader: 'COLORED_MESH_FRAGMENT_SHADER',
+  },
+  colored_mesh_instanced_quantized_depth: {
+    vertexShader: 'COLORED_MESH_INSTANCED_QUANTIZED_VERTEX_SHADER',
+    fragmentShader: 'EMPTY_FRAGMENT_SHADER',
+  },
+  colored_mesh_instanced_shadows_quantized: {
+    vertexShader: 'COLORED_MESH_INSTANCED_QUANTIZED_VERTEX_SHADER',
+    fragmentShader: 'COLORED_MESH_SHADOWS_FRAGMENT_SHADER',
+  },
+  colored_mesh_material_refs_quantized: {
+    vertexShader: 'COLORED_MESH_MATERIAL_REFS_QUANTIZED_VERTEX_SHADER',
+    fragmentShader: 'COLORED_MESH_MATERIAL_REFS_FRAGMENT_SHADER',
+  },
+  colored_mesh_material_refs_quantized_depth: {
+    vertexShader: 'COLORED_MESH_MATERIAL_REFS_QUANTIZED_VERTEX_SHADER',
+    fragmentShader: 'EMPTY_FRAGMENT_SHADER',
+  },
+  colored_mesh_instanced_material_refs_quantized: {
+    vertexShader: 'COLORED_MESH_INSTANCED_MATERIAL_REFS_QUANTIZED_VERTEX_SHADER',
+    fragmentShader: 'COLORED_MESH_MATERIAL_REFS_FRAGMENT_SHADER',
+  },
+  colored_mesh_instanced_material_refs_quantized_depth: {
+    vertexShader: 'COLORED_MESH_INSTANCED_MATERIAL_REFS_QUANTIZED_VERTEX_SHADER',
+    fragmentShader: 'EMPTY_FRAGMENT_SHADER',
+  },
+  colored_mesh_shadows_material_refs_quantized: {
+    vertexShader: 'COLORED_MESH_MATERIAL_REFS_QUANTIZED_VERTEX_SHADER',
+    fragmentShader: 'COLORED_MESH_SHADOWS_MATERIAL_REFS_FRAGMENT_SHADER',
+  },
+  colored_mesh_instanced_shadows_material_refs_quantized: {
+    vertexShader: 'COLORED_MESH_INSTANCED_MATERIAL_REFS_QUANTIZED_VERTEX_SHADER',
+    fragmentShader: 'COLORED_MESH_SHADOWS_MATERIAL_REFS_FRAGMENT_SHADER',
+  },
+  depth_texture: { vertexShader: 'DEPTH_TEXTURE_VERTEX_SHADER', fragmentShader: 'DEPTH_TEXTURE_FRAGMENT_SHADER' },
+  overlay: { vertexShader: 'OVERLAY_VERTEX_SHADER', fragmentShader: 'OVERLAY_FRAGMENT_SHADER' },
+  terrain: { vertexShader: 'TERRAIN_VERTEX_SHADER', fragmentShader: 'TERRAIN_FRAGMENT_SHADER' },
+  terrain_shadows: { vertexShader: 'TERRAIN_VERTEX_SHADER', fragmentShader: 'TERRAIN_SHADOWS_FRAGMENT_SHADER' },
+  river: { vertexShader: 'RIVER_VERTEX_SHADER', fragmentShader: 'RIVER_FRAGMENT_SHADER' },
+  river_shadows: { vertexShader: 'RIVER_VERTEX_SHADER', fragmentShader: 'RIVER_SHADOWS_FRAGMENT_SHADER' },
+  sky: { vertexShader: 'SKY_VERTEX_SHADER', fragmentShader: 'SKY_FRAGMENT_SHADER' },
+  textured_mesh: { vertexShader: 'TEXTURED_MESH_VERTEX_SHADER', fragmentShader: 'TEXTURED_MESH_FRAGMENT_SHADER' },
+  textured_mesh_depth: { vertexShader: 'TEXTURED_MESH_VERTEX_SHADER', fragmentShader: 'EMPTY_FRAGMENT_SHADER' },
+  textured_mesh_instanced: {
+    vertexShader: 'TEXTURED_MESH_INSTANCED_VERTEX_SHADER',
+    fragmentShader: 'TEXTURED_MESH_FRAGMENT_SHADER',
+  },
+  textured_mesh_instanced_depth: {
+    vertexShader: 'TEXTURED_MESH_INSTANCED_VERTEX_SHADER',
+    fragmentShader: 'EMPTY_FRAGMENT_SHADER',
+  },
+  textured_mesh_shadows: {
+    vertexShader: 'TEXTURED_MESH_VERTEX_SHADER',
+    fragmentShader: 'TEXTURED_MESH_SHADOWS_FRAGMENT_SHADER',
+  },
+  textured_mesh_instanced_shadows: {
+    vertexShader: 'TEXTURED_MESH_INSTANCED_VERTEX_SHADER',
+    fragmentShader: 'TEXTURED_MESH_SHADOWS_FRAGMENT_SHADER',
+  },
+  wire: { vertexShader: 'WIRE_VERTEX_SHADER', fragmentShader: 'WIRE_FRAGMENT_SHADER' },
+  wire_depth: { vertexShader: 'WIRE_VERTEX_SHADER', fragmentShader: 'EMPTY_FRAGMENT_SHADER' },
+  wire_instanced: { vertexShader: 'WIRE_INSTANCED_VERTEX_SHADER', fragmentShader: 'WIRE_FRAGMENT_SHADER' },
+  wire_instanced_depth: { vertexShader: 'WIRE_INSTANCED_VERTEX_SHADER', fragmentShader: 'EMPTY_FRAGMENT_SHADER' },
+};
+
+// Display and depth program of each spec variant by feature bits.
+export const PROGRAM_VARIANTS: { [specName: string]: { [features: number]: ProgramVariant } } = {
+  buckling_member: {
+    0: { display: 'buckling_member', depth: 'buckling_member_depth' },
+    2: { display: 'buckling_member_shadows', depth: 'buckling_member_depth' },
+  },
+  colored_mesh: {
+    1: { display: 'colored_mesh_instanced', depth: 'colored_mesh_instanced_depth' },
+    3: { display: 'colored_mesh_instanced_shadows', depth: 'colored_mesh_instanced_depth' },
+    4: { display: 'colored_mesh_material_refs', depth: 'colored_mesh_material_refs_depth' },
+    5: { display: 'colored_mesh_instanced_material_refs', depth: 'colored_mesh_instanced_material_refs_depth' },
+    6: { display: 'colored_mesh_shadows_material_refs', depth: 'colored_mesh_material_refs_depth' },
+    7: { display: 'colored_mesh_instanced_shadows_material_refs', depth: 'colored_mesh_instanced_material_refs_depth' },
+    9: { display: 'colored_mesh_instanced_quantized', depth: 'colored_mesh_instanced_quantized_depth' },
+    11: { display: 'colored_mesh_instanced_shadows_quantized', depth: 'colored_mesh_instanced_quantized_depth' },
+    12: { display: 'colored_mesh_material_refs_quantized', depth: 'colored_mesh_material_refs_quantized_depth' },
+    13: {
+      display: 'colored_mesh_instanced_material_refs_quantized',
+      depth: 'colored_mesh_instanced_material_refs_quantized_depth',
+    },
+    14: {
+      display: 'colored_mesh_shadows_material_refs_quantized',
+      depth: 'colored_mesh_material_refs_quantized_depth',
+    },
+    15: {
+      display: 'colored_mesh_instanced_shadows_material_refs_quantized',
+      depth: 'colored_mesh_instanced_material_refs_quantized_depth',
+    },
+  },
+  depth_texture: { 0: { display: 'depth_texture' } },
+  overlay: { 0: { display: 'overlay' } },
+  terrain: { 0: { display: 'terrain' }, 2: { display: 'terrain_shadows' } },
+  river: { 0: { display: 'river' }, 2: { display: 'river_shadows' } },
+  sky: { 0: { display: 'sky' } },
+  textured_mesh: {
+    0: { display: 'textured_mesh', depth: 'textured_mesh_depth' },
+    1: { display: 'textured_mesh_instanced', depth: 'textured_mesh_instanced_depth' },
+    2: { display: 'textured_mesh_shadows', depth: 'textured_mesh_depth' },
+    3: { display: 'textured_mesh_instanced_shadows', depth: 'textured_mesh_instanced_depth' },
+  },
+  wire: {
+    0: { display: 'wire', depth: 'wire_depth' },
+    1: { display: 'wire_instanced', depth: 'wire_instanced_depth' },
+  },
+};
+
+// Interfaces of the programs.
+export const PROGRAM_REFLECTIONS: { [programName: string]: ProgramReflection } = {
+  buckling_member: {
+    attributes: [
+      { name: 'inPosition', type: 'vec3', location: 0 },
+      { name: 'inNormalRef', type: 'uint', location: 1 },
+      { name: 'inModelTransform', type: 'mat4', location: 4 },
+    ],
+    varyings: [{ name: 'vertex', type: 'vec3' }, { name: 'normal', type: 'vec3' }],
+    uniforms: [],
+    samplers: [],
+    blocks: ['Transforms', 'LightConfig'],
+    outputs: [{ name: 'fragmentColor', type: 'vec4' }],
+  },
+  buckling_member_depth: {
+    attributes: [
+      { name: 'inPosition', type: 'vec3', location: 0 },
+      { name: 'inNormalRef', type: 'uint', location: 1 },
+      { name: 'inModelTransform', type: 'mat4', location: 4 },
+    ],
+    varyings: [],
+    uniforms: [],
+    samplers: [],
+    blocks: ['Transforms'],
+    outputs: [],
+  },
+  buckling_member_shadows: {
+    attributes: [
+      { name: 'inPosition', type: 'vec3', location: 0 },
+      { name: 'inNormalRef', type: 'uint', location: 1 },
+      { name: 'inModelTransform', type: 'mat4', location: 4 },
+    ],
+    varyings: [
+      { name: 'vertex', type: 'vec3' },
+      { name: 'normal', type: 'vec3' },
+      { name: 'depthMapLookup', type: 'vec4' },
+    ],
+    uniforms: [],
+    samplers: [{ name: 'depthMap', type: 'sampler2DShadow' }],
+    blocks: ['Transforms', 'LightConfig'],
+    outputs: [{ name: 'fragmentColor', type: 'vec4' }],
+  },
+  colored_mesh_instanced: {
+    attributes: [
+      { name: 'inPosition', type: 'vec3', location: 0 },
+      { name: 'inNormal', type: 'vec3', location: 1 },
+      { name: 'inColor', type: 'vec3', location: 2 },
+      { name: 'inModelTransform', type: 'mat4', location: 4 },
+    ],
+    varyings: [
+      { name: 'vertex', type: 'vec3' },
+      { name: 'normal', type: 'vec3' },
+      { name: 'materialColor', type: 'vec3' },
+    ],
+    uniforms: [],
+    samplers: [],
+    blocks: ['Transforms', 'LightConfig'],
+    outputs: [{ name: 'fragmentColor', type: 'vec4' }],
+  },
+  colored_mesh_instanced_depth: {
+    attributes: [
+      { name: 'inPosition', type: 'vec3', location: 0 },
+      { name: 'inNormal', type: 'vec3', location: 1 },
+      { name: 'inColor', type: 'vec3', location: 2 },
+      { name: 'inModelTransform', type: 'mat4', location: 4 },
+    ],
+    varyings: [],
+    uniforms: [],
+    samplers: [],
+    blocks: ['Transforms'],
+    outputs: [],
+  },
+  colored_mesh_instanced_shadows: {
+    attributes: [
+      { name: 'inPosition', type: 'vec3', location: 0 },
+      { name: 'inNormal', type: 'vec3', location: 1 },
+      { name: 'inColor', type: 'vec3', location: 2 },
+      { name: 'inModelTransform', type: 'mat4', location: 4 },
+    ],
+    varyings: [
+      { name: 'vertex', type: 'vec3' },
+      { name: 'normal', type: 'vec3' },
+      { name: 'depthMapLookup', type: 'vec4' },
+      { name: 'materialColor', type: 'vec3' },
+    ],
+    uniforms: [],
+    samplers: [{ name: 'depthMap', type: 'sampler2DShadow' }],
+    blocks: ['Transforms', 'LightConfig'],
+    outputs: [{ name: 'fragmentColor', type: 'vec4' }],
+  },
+  colored_mesh_material_refs: {
+    attributes: [
+      { name: 'inPosition', type: 'vec3', location: 0 },
+      { name: 'inNormal', type: 'vec3', location: 1 },
+      { name: 'inMaterialRef', type: 'uint', location: 2 },
+    ],
+    varyings: [
+      { name: 'vertex', type: 'vec3' },
+      { name: 'normal', type: 'vec3' },
+      { name: 'materialRef', type: 'uint', flat: true },
+    ],
+    uniforms: [],
+    samplers: [],
+    blocks: ['Transforms', 'LightConfig', 'MaterialConfig'],
+    outputs: [{ name: 'fragmentColor', type: 'vec4' }],
+  },
+  colored_mesh_material_refs_depth: {
+    attributes: [
+      { name: 'inPosition', type: 'vec3', location: 0 },
+      { name: 'inNormal', type: 'vec3', location: 1 },
+      { name: 'inMaterialRef', type: 'uint', location: 2 },
+    ],
+    varyings: [],
+    uniforms: [],
+    samplers: [],
+    blocks: ['Transforms'],
+    outputs: [],
+  },
+  colored_mesh_instanced_material_refs: {
+    attributes: [
+      { name: 'inPosition', type: 'vec3', location: 0 },
+      { name: 'inNormal', type: 'vec3', location: 1 },
+      { name: 'inMaterialRef', type: 'uint', location: 2 },
+      { name: 'inModelTransform', type: 'mat4', location: 4 },
+    ],
+    varyings: [
+      { name: 'vertex', type: 'vec3' },
+      { name: 'normal', type: 'vec3' },
+      { name: 'materialRef', type: 'uint', flat: true },
+    ],
+    uniforms: [],
+    samplers: [],
+    blocks: ['Transforms', 'LightConfig', 'MaterialConfig'],
+    outputs: [{ name: 'fragmentColor', type: 'vec4' }],
+  },
+  colored_mesh_instanced_material_refs_depth: {
+    attributes: [
+      { name: 'inPosition', type: 'vec3', location: 0 },
+      { name: 'inNormal', type: 'vec3', location: 1 },
+      { name: 'inMaterialRef', type: 'uint', location: 2 },
+      { name: 'inModelTransform', type: 'mat4', location: 4 },
+    ],
+    varyings: [],
+    uniforms: [],
+    samplers: [],
+    blocks: ['Transforms'],
+    outputs: [],
+  },
+  colored_mesh_shadows_material_refs: {
+    attributes: [
+      { name: 'inPosition', type: 'vec3', location: 0 },
+      { name: 'inNormal', type: 'vec3', location: 1 },
+      { name: 'inMaterialRef', type: 'uint', location: 2 },
+    ],
+    varyings: [
+      { name: 'vertex', type: 'vec3' },
+      { name: 'normal', type: 'vec3' },
+      { name: 'depthMapLookup', type: 'vec4' },
+      { name: 'materialRef', type: 'uint', flat: true },
+    ],
+    uniforms: [],
+    samplers: [{ name: 'depthMap', type: 'sampler2DShadow' }],
+    blocks: ['Transforms', 'LightConfig', 'MaterialConfig'],
+    outputs: [{ name: 'fragmentColor', type: 'vec4' }],
+  },
+  colored_mesh_instanced_shadows_material_refs: {
+    attributes: [
+      { name: 'inPosition', type: 'vec3', location: 0 },
+      { name: 'inNormal', type: 'vec3', location: 1 },
+      { name: 'inMaterialRef', type: 'uint', location: 2 },
+      { name: 'inModelTransform', type: 'mat4', location: 4 },
+    ],
+    varyings: [
+      { name: 'vertex', type: 'vec3' },
+      { name: 'normal', type: 'vec3' },
+      { name: 'depthMapLookup', type: 'vec4' },
+      { name: 'materialRef', type: 'uint', flat: true },
+    ],
+    uniforms: [],
+    samplers: [{ name: 'depthMap', type: 'sampler2DShadow' }],
+    blocks: ['Transforms', 'LightConfig', 'MaterialConfig'],
+    outputs: [{ name: 'fragmentColor', type: 'vec4' }],
+  },
+  colored_mesh_instanced_quantized: {
+    attributes: [
+      { name: 'inPosition', type: 'vec3', location: 0 },
+      { name: 'inNormal', type: 'vec2', location: 1 },
+      { name: 'inPositionScale', type: 'vec3', location: 8 },
+      { name: 'inPositionOffset', type: 'vec3', location: 9 },
+      { name: 'inColor', type: 'vec3', location: 2 },
+      { name: 'inModelTransform', type: 'mat4', location: 4 },
+    ],
+    varyings: [
+      { name: 'vertex', type: 'vec3' },
+      { name: 'normal', type: 'vec3' },
+      { name: 'materialColor', type: 'vec3' },
+    ],
+    uniforms: [],
+    samplers: [],
+    blocks: ['Transforms', 'LightConfig'],
+    outputs: [{ name: 'fragmentColor', type: 'vec4' }],
+  },
+  colored_mesh_instanced_quantized_depth: {
+    attributes: [
+      { name: 'inPosition', type: 'vec3', location: 0 },
+      { name: 'inNormal', type: 'vec2', location: 1 },
+      { name: 'inPositionScale', type: 'vec3', location: 8 },
+      { name: 'inPositionOffset', type: 'vec3', location: 9 },
+      { name: 'inColor', type: 'vec3', location: 2 },
+      { name: 'inModelTransform', type: 'mat4', location: 4 },
+    ],
+    varyings: [],
+    uniforms: [],
+    samplers: [],
+    blocks: ['Transforms'],
+    outputs: [],
+  },
+  colored_mesh_instanced_shadows_quantized: {
+    attributes: [
+      { name: 'inPosition', type: 'vec3', location: 0 },
+      { name: 'inNormal', type: 'vec2', location: 1 },
+      { name: 'inPositionScale', type: 'vec3', location: 8 },
+      { name: 'inPositionOffset', type: 'vec3', location: 9 },
+      { name: 'inColor', type: 'vec3', location: 2 },
+      { name: 'inModelTransform', type: 'mat4', location: 4 },
+    ],
+    varyings: [
+      { name: 'vertex', type: 'vec3' },
+      { name: 'normal', type: 'vec3' },
+      { name: 'depthMapLookup', type: 'vec4' },
+      { name: 'materialColor', type: 'vec3' },
+    ],
+    uniforms: [],
+    samplers: [{ name: 'depthMap', type: 'sampler2DShadow' }],
+    blocks: ['Transforms', 'LightConfig'],
+    outputs: [{ name: 'fragmentColor', type: 'vec4' }],
+  },
+  colored_mesh_material_refs_quantized: {
+    attributes: [
+      { name: 'inPosition', type: 'vec3', location: 0 },
+      { name: 'inNormal', type: 'vec2', location: 1 },
+      { name: 'inPositionScale', type: 'vec3', location: 8 },
+      { name: 'inPositionOffset', type: 'vec3', location: 9 },
+      { name: 'inMaterialRef', type: 'uint', location: 2 },
+    ],
+    varyings: [
+      { name: 'vertex', type: 'vec3' },
+      { name: 'normal', type: 'vec3' },
+      { name: 'materialRef', type: 'uint', flat: true },
+    ],
+    uniforms: [],
+    samplers: [],
+    blocks: ['Transforms', 'LightConfig', 'MaterialConfig'],
+    outputs: [{ name: 'fragmentColor', type: 'vec4' }],
+  },
+  colored_mesh_material_refs_quantized_depth: {
+    attributes: [
+      { name: 'inPosition', type: 'vec3', location: 0 },
+      { name: 'inNormal', type: 'vec2', location: 1 },
+      { name: 'inPositionScale', type: 'vec3', location: 8 },
+      { name: 'inPositionOffset', type: 'vec3', location: 9 },
+      { name: 'inMaterialRef', type: 'uint', location: 2 },
+    ],
+    varyings: [],
+    uniforms: [],
+    samplers: [],
+    blocks: ['Transforms'],
+    outputs: [],
+  },
+  colored_mesh_instanced_material_refs_quantized: {
+    attributes: [
+      { name: 'inPosition', type: 'vec3', location: 0 },
+      { name: 'inNormal', type: 'vec2', location: 1 },
+      { name: 'inPositionScale', type: 'vec3', location: 8 },
+      { name: 'inPositionOffset', type: 'vec3', location: 9 },
+      { name: 'inMaterialRef', type: 'uint', location: 2 },
+      { name: 'inModelTransform', type: 'mat4', location: 4 },
+    ],
+    varyings: [
+      { name: 'vertex', type: 'vec3' },
+      { name: 'normal', type: 'vec3' },
+      { name: 'materialRef', type: 'uint', flat: true },
+    ],
+    uniforms: [],
+    samplers: [],
+    blocks: ['Transforms', 'LightConfig', 'MaterialConfig'],
+    outputs: [{ name: 'fragmentColor', type: 'vec4' }],
+  },
+  colored_mesh_instanced_material_refs_quantized_depth: {
+    attributes: [
+      { name: 'inPosition', type: 'vec3', location: 0 },
+      { name: 'inNormal', type: 'vec2', location: 1 },
+      { name: 'inPositionScale', type: 'vec3', location: 8 },
+      { name: 'inPositionOffset', type: 'vec3', location: 9 },
+      { name: 'inMaterialRef', type: 'uint', location: 2 },
+      { name: 'inModelTransform', type: 'mat4', location: 4 },
+    ],
+    varyings: [],
+    uniforms: [],
+    samplers: [],
+    blocks: ['Transforms'],
+    outputs: [],
+  },
+  colored_mesh_shadows_material_refs_quantized: {
+    attributes: [
+      { name: 'inPosition', type: 'vec3', location: 0 },
+      { name: 'inNormal', type: 'vec2', location: 1 },
+      { name: 'inPositionScale', type: 'vec3', location: 8 },
+      { name: 'inPositionOffset', type: 'vec3', location: 9 },
+      { name: 'inMaterialRef', type: 'uint', location: 2 },
+    ],
+    varyings: [
+      { name: 'vertex', type: 'vec3' },
+      { name: 'normal', type: 'vec3' },
+      { name: 'depthMapLookup', type: 'vec4' },
+      { name: 'materialRef', type: 'uint', flat: true },
+    ],
+    uniforms: [],
+    samplers: [{ name: 'depthMap', type: 'sampler2DShadow' }],
+    blocks: ['Transforms', 'LightConfig', 'MaterialConfig'],
+    outputs: [{ name: 'fragmentColor', type: 'vec4' }],
+  },
+  colored_mesh_instanced_shadows_material_refs_quantized: {
+    attributes: [
+      { name: 'inPosition', type: 'vec3', location: 0 },
+      { name: 'inNormal', type: 'vec2', location: 1 },
+      { name: 'inPositionScale', type: 'vec3', location: 8 },
+      { name: 'inPositionOffset', type: 'vec3', location: 9 },
+      { name: 'inMaterialRef', type: 'uint', location: 2 },
+      { name: 'inModelTransform', type: 'mat4', location: 4 },
+    ],
+    varyings: [
+      { name: 'vertex', type: 'vec3' },
+      { name: 'normal', type: 'vec3' },
+      { name: 'depthMapLookup', type: 'vec4' },
+      { name: 'materialRef', type: 'uint', flat: true },
+    ],
+    uniforms: [],
+    samplers: [{ name: 'depthMap', type: 'sampler2DShadow' }],
+    blocks: ['Transforms', 'LightConfig', 'MaterialConfig'],
+    outputs: [{ name: 'fragmentColor', type: 'vec4' }],
+  },
+  depth_texture: {
+    attributes: [{ name: 'inTexCoord', type: 'vec2', location: 0 }],
+    varyings: [{ name: 'texCoord', type: 'vec2' }],
+    uniforms: [],
+    samplers: [{ name: 'depthMap', type: 'sampler2DShadow' }],
+    blocks: [],
+    outputs: [{ name: 'fragmentColor', type: 'vec4' }],
+  },
+  overlay: {
+    attributes: [
+      { name: 'inPosition', type: 'vec4', location: 0 },
+      { name: 'inAlpha', type: 'float', location: 2 },
+      { name: 'inTexCoord', type: 'vec2', location: 3 },
+    ],
+    varyings: [{ name: 'texCoord', type: 'vec3' }, { name: 'alpha', type: 'float' }],
+    uniforms: [],
+    samplers: [{ name: 'icons', type: 'sampler2DArray' }],
+    blocks: [],
+    outputs: [{ name: 'fragmentColor', type: 'vec4' }],
+  },
+  terrain: {
+    attributes: [{ name: 'inPosition', type: 'vec3', location: 0 }, { name: 'inNormal', type: 'vec3', location: 1 }],
+    varyings: [{ name: 'normal', type: 'vec3' }, { name: 'yModelNormal', type: 'float' }],
+    uniforms: [],
+    samplers: [],
+    blocks: ['Transforms', 'LightConfig'],
+    outputs: [{ name: 'fragmentColor', type: 'vec4' }],
+  },
+  terrain_shadows: {
+    attributes: [{ name: 'inPosition', type: 'vec3', location: 0 }, { name: 'inNormal', type: 'vec3', location: 1 }],
+    varyings: [
+      { name: 'normal', type: 'vec3' },
+      { name: 'depthMapLookup', type: 'vec4' },
+      { name: 'yModelNormal', type: 'float' },
+    ],
+    uniforms: [],
+    samplers: [{ name: 'depthMap', type: 'sampler2DShadow' }],
+    blocks: ['Transforms', 'LightConfig'],
+    outputs: [{ name: 'fragmentColor', type: 'vec4' }],
+  },
+  river: {
+    attributes: [{ name: 'inPosition', type: 'vec2', location: 0 }],
+    varyings: [{ name: 'vertex', type: 'vec3' }, { name: 'normal', type: 'vec3' }, { name: 'texCoord', type: 'vec2' }],
+    uniforms: [],
+    samplers: [{ name: 'water', type: 'sampler2D' }],
+    blocks: ['Transforms', 'LightConfig', 'Time'],
+    outputs: [{ name: 'fragmentColor', type: 'vec4' }],
+  },
+  river_shadows: {
+    attributes: [{ name: 'inPosition', type: 'vec2', location: 0 }],
+    varyings: [
+      { name: 'vertex', type: 'vec3' },
+      { name: 'normal', type: 'vec3' },
+      { name: 'depthMapLookup', type: 'vec4' },
+      { name: 'texCoord', type: 'vec2' },
+    ],
+    uniforms: [],
+    samplers: [{ name: 'water', type: 'sampler2D' }, { name: 'depthMap', type: 'sampler2DShadow' }],
+    blocks: ['Transforms', 'LightConfig', 'Time'],
+    outputs: [{ name: 'fragmentColor', type: 'vec4' }],
+  },
+  sky: {
+    attributes: [{ name: 'inPosition', type: 'vec3', location: 0 }],
+    varyings: [{ name: 'texCoord', type: 'vec3' }],
+    uniforms: [],
+    samplers: [{ name: 'skybox', type: 'samplerCube' }],
+    blocks: ['SkyboxTransforms'],
+    outputs: [{ name: 'fragmentColor', type: 'vec4' }],
+  },
+  textured_mesh: {
+    attributes: [
+      { name: 'inPosition', type: 'vec3', location: 0 },
+      { name: 'inNormal', type: 'vec3', location: 1 },
+      { name: 'inTexCoord', type: 'vec2', location: 3 },
+    ],
+    varyings: [{ name: 'normal', type: 'vec3' }, { name: 'texCoord', type: 'vec2' }],
+    uniforms: [],
+    samplers: [{ name: 'meshTexture', type: 'sampler2D' }],
+    blocks: ['Transforms', 'LightConfig'],
+    outputs: [{ name: 'fragmentColor', type: 'vec4' }],
+  },
+  textured_mesh_depth: {
+    attributes: [
+      { name: 'inPosition', type: 'vec3', location: 0 },
+      { name: 'inNormal', type: 'vec3', location: 1 },
+      { name: 'inTexCoord', type: 'vec2', location: 3 },
+    ],
+    varyings: [],
+    uniforms: [],
+    samplers: [],
+    blocks: ['Transforms'],
+    outputs: [],
+  },
+  textured_mesh_instanced: {
+    attributes: [
+      { name: 'inPosition', type: 'vec3', location: 0 },
+      { name: 'inNormal', type: 'vec3', location: 1 },
+      { name: 'inTexCoord', type: 'vec2', location: 3 },
+      { name: 'inModelTransform', type: 'mat4', location: 4 },
+    ],
+    varyings: [{ name: 'normal', type: 'vec3' }, { name: 'texCoord', type: 'vec2' }],
+    uniforms: [],
+    samplers: [{ name: 'meshTexture', type: 'sampler2D' }],
+    blocks: ['Transforms', 'LightConfig'],
+    outputs: [{ name: 'fragmentColor', type: 'vec4' }],
+  },
+  textured_mesh_instanced_depth: {
+    attributes: [
+      { name: 'inPosition', type: 'vec3', location: 0 },
+      { name: 'inNormal', type: 'vec3', location: 1 },
+      { name: 'inTexCoord', type: 'vec2', location: 3 },
+      { name: 'inModelTransform', type: 'mat4', location: 4 },
+    ],
+    varyings: [],
+    uniforms: [],
+    samplers: [],
+    blocks: ['Transforms'],
+    outputs: [],
+  },
+  textured_mesh_shadows: {
+    attributes: [
+      { name: 'inPosition', type: 'vec3', location: 0 },
+      { name: 'inNormal', type: 'vec3', location: 1 },
+      { name: 'inTexCoord', type: 'vec2', location: 3 },
+    ],
+    varyings: [
+      { name: 'normal', type: 'vec3' },
+      { name: 'depthMapLookup', type: 'vec4' },
+      { name: 'texCoord', type: 'vec2' },
+    ],
+    uniforms: [],
+    samplers: [{ name: 'meshTexture', type: 'sampler2D' }, { name: 'depthMap', type: 'sampler2DShadow' }],
+    blocks: ['Transforms', 'LightConfig'],
+    outputs: [{ name: 'fragmentColor', type: 'vec4' }],
+  },
+  textured_mesh_instanced_shadows: {
+    attributes: [
+      { name: 'inPosition', type: 'vec3', location: 0 },
+      { name: 'inNormal', type: 'vec3', location: 1 },
+      { name: 'inTexCoord', type: 'vec2', location: 3 },
+      { name: 'inModelTransform', type: 'mat4', location: 4 },
+    ],
+    varyings: [
+      { name: 'normal', type: 'vec3' },
+      { name: 'depthMapLookup', type: 'vec4' },
+      { name: 'texCoord', type: 'vec2' },
+    ],
+    uniforms: [],
+    samplers: [{ name: 'meshTexture', type: 'sampler2D' }, { name: 'depthMap', type: 'sampler2DShadow' }],
+    blocks: ['Transforms', 'LightConfig'],
+    outputs: [{ name: 'fragmentColor', type: 'vec4' }],
+  },
+  wire: {
+    attributes: [{ name: 'inPosition', type: 'vec3', location: 0 }, { name: 'inDirection', type: 'vec3', location: 1 }],
+    varyings: [{ name: 'vertex', type: 'vec3' }, { name: 'direction', type: 'vec3' }],
+    uniforms: [],
+    samplers: [],
+    blocks: ['Transforms', 'LightConfig'],
+    outputs: [{ name: 'fragmentColor', type: 'vec4' }],
+  },
+  wire_depth: {
+    attributes: [{ name: 'inPosition', type: 'vec3', location: 0 }, { name: 'inDirection', type: 'vec3', location: 1 }],
+    varyings: [],
+    uniforms: [],
+    samplers: [],
+    blocks: ['Transforms'],
+    outputs: [],
+  },
+  wire_instanced: {
+    attributes: [
+      { name: 'inPosition', type: 'vec3', location: 0 },
+      { name: 'inDirection', type: 'vec3', location: 1 },
+      { name: 'inModelTransform', type: 'mat4', location: 4 },
+    ],
+    varyings: [{ name: 'vertex', type: 'vec3' }, { name: 'direction', type: 'vec3' }],
+    uniforms: [],
+    samplers: [],
+    blocks: ['Transforms', 'LightConfig'],
+    outputs: [{ name: 'fragmentColor', type: 'vec4' }],
+  },
+  wire_instanced_depth: {
+    attributes: [
+      { name: 'inPosition', type: 'vec3', location: 0 },
+      { name: 'inDirection', type: 'vec3', location: 1 },
+      { name: 'inModelTransform', type: 'mat4', location: 4 },
+    ],
+    varyings: [],
+    uniforms: [],
+    samplers: [],
+    blocks: ['Transforms'],
+    outputs: [],
+  },
+};
+
+// Layout of each uniform block including all members any program declares.
+export const UNIFORM_BLOCK_LAYOUTS: { [blockName: string]: UniformBlockReflection } = {
+  Transforms: {
+    name: 'Transforms',
+    instance: 'transforms',
+    size: 192,
+    members: [
+      { name: 'modelView', type: 'mat4', offset: 0, size: 64 },
+      { name: 'modelViewProjection', type: 'mat4', offset: 64, size: 64 },
+      { name: 'depthMapLookup', type: 'mat4', offset: 128, size: 64 },
+    ],
+  },
+  LightConfig: {
+    name: 'LightConfig',
+    instance: 'light',
+    size: 48,
+    members: [
+      { name: 'unitDirection', type: 'vec3', offset: 0, size: 12 },
+      { name: 'brightness', type: 'float', offset: 12, size: 4 },
+      { name: 'color', type: 'vec3', offset: 16, size: 12 },
+      { name: 'ambientIntensity', type: 'float', offset: 28, size: 4 },
+      { name: 'shadowWeight', type: 'float', offset: 32, size: 4 },
+    ],
+  },
+  MaterialConfig: {
+    name: 'MaterialConfig',
+    instance: 'materialConfig',
+    size: 208,
+    members: [
+      { name: 'globalAlpha', type: 'float', offset: 0, size: 4 },
+      { name: 'specs', type: 'MaterialSpec', offset: 16, size: 192, length: 12, stride: 16 },
+    ],
+  },
+  Time: { name: 'Time', instance: 'time', size: 16, members: [{ name: 'clock', type: 'float', offset: 0, size: 4 }] },
+  SkyboxTransforms: {
+    name: 'SkyboxTransforms',
+    instance: 'transforms',
+    size: 64,
+    members: [{ name: 'viewRotationProjection', type: 'mat4', offset: 0, size: 64 }],
+  },
+};
@@ -1,3 +1,7 @@
-// Common shadow depth map lookup.
+// Common shadow depth map lookup. Variants without the SHADOWS feature skip it.
 #define SHADOW 1
+#ifdef SHADOWS
 float shadow = light.shadowWeight < 1.0f ? mix(light.shadowWeight, 1.0f, textureProj(depthMap, depthMapLookup)) : 1.0f;
+#else
+float shadow = 1.0f;
+#endif
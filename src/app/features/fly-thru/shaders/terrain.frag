@@ -11,10 +11,14 @@ layout(std140) uniform LightConfig {
   float shadowWeight;
 } light;
 
+#ifdef SHADOWS
 uniform sampler2DShadow depthMap;
+#endif
 
 in vec3 normal;
+#ifdef SHADOWS
 in vec4 depthMapLookup;
+#endif
 in float yModelNormal;
 out vec4 fragmentColor;
 
@@ -0,0 +1,141 @@
+# Copyright (c) 2025-2026 Gene Ressler
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import glob
+import os
+import re
+
+import pytest
+
+import glsl
+import minify
+
+DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+SOURCE_FILES = sorted(
+    os.path.basename(f)
+    for pattern in ("*.vert", "*.frag", "*.h")
+    for f in glob.glob(os.path.join(DIRECTORY, pattern))
+)
+
+
+def readFile(file_name):
+    with open(os.path.join(DIRECTORY, file_name), "r") as input:
+        return input.read()
+
+
+def builtShaders():
+    """Returns (name, text) of the minified shaders in shaders.ts."""
+    return re.findall(r"export const (\w+) = \n`([^`]*)`;", readFile("shaders.ts"))
+
+
+def code(text):
+    return [t for t in glsl.tokenize(text) if t.kind != glsl.SPACE]
+
+
+def tokenTexts(tokens):
+    return "".join(t.text for t in tokens)
+
+
+@pytest.mark.parametrize("file_name", SOURCE_FILES)
+def testTokenizeRoundTrip(file_name):
+    text = readFile(file_name)
+    assert tokenTexts(glsl.tokenize(text)) == text
+
+
+def testTokenKinds():
+    text = "#define A \\\n  1\nx+=0x1Fu*.5e-3/* c */;// d\n"
+    assert [(t.kind, t.text) for t in glsl.tokenize(text)] == [
+        (glsl.DIRECTIVE, "#define A \\\n  1"),
+        (glsl.SPACE, "\n"),
+        (glsl.IDENTIFIER, "x"),
+        (glsl.OPERATOR, "+="),
+        (glsl.NUMBER, "0x1Fu"),
+        (glsl.OPERATOR, "*"),
+        (glsl.NUMBER, ".5e-3"),
+        (glsl.COMMENT, "/* c */"),
+        (glsl.OPERATOR, ";"),
+        (glsl.COMMENT, "// d"),
+        (glsl.SPACE, "\n"),
+    ]
+    assert glsl.parseDirective("#  define A \\\n  1") == ("define", "A    1")
+
+
+def testTokenizeErrors():
+    with pytest.raises(Exception, match="Bad GLSL character '@' on line 2"):
+        glsl.tokenize("x;\ny@z;")
+    with pytest.raises(Exception, match="# not at line start"):
+        glsl.tokenize("x; #define A")
+
+
+def testFoldConstants():
+    tokens = code("x=2*3+1-4;y=a*2*3;z=(2.5);w=f(2);v=1.5e0*2.;u=7/2;t=1./3.;")
+    minify.foldConstants(tokens)
+    # Products with a non-literal on the left aren't reassociated.
+    assert tokenTexts(tokens) == "x=3;y=a*2*3;z=2.5;w=f(2);v=3.;u=3;t=.33333334;"
+
+
+def testEvaluateConditionals():
+    tokens = code(
+        "#define A\n#ifdef A\na;\n#ifndef A\nb;\n#else\nc;\n#endif\n"
+        "#else\nd;\n#endif\n#line 3\n#ifdef B\ne;\n#endif\n"
+    )
+    result = minify.evaluateConditionals(tokens)
+    assert [t.text for t in result] == ["#define A", "a", ";", "c", ";"]
+    with pytest.raises(Exception, match="Missing #endif"):
+        minify.evaluateConditionals(code("#ifdef A\n"))
+    with pytest.raises(Exception, match="can't evaluate #if"):
+        minify.evaluateConditionals(code("#if A\n#endif\n"))
+
+
+def testMinify():
+    text = """#version 300 es
+precision mediump float;
+// A comment.
+uniform vec3 tint;
+in vec2 texCoord;
+out vec4 fragmentColor;
+const float SCALE = 2.0 * 4.0;
+float unused(float value) { return value; }
+float brighten(float value) { return value * SCALE + (1.0 - 0.5); }
+void main() {
+  float brightness = brighten(texCoord.x);
+#ifdef MISSING
+  brightness = 0.0;
+#else
+  brightness *= 0.5e1;
+#endif
+  fragmentColor = vec4(tint * brightness, 1.0);
+}
+"""
+    assert minify.minify(text) == """#version 300 es
+precision mediump float;
+uniform vec3 tint;
+in vec2 texCoord;
+out vec4 fragmentColor;
+float a(float b){
+return b*8.+.5;
+}
+void main(){
+float b=a(texCoord.x);
+b*=5.;
+fragmentColor=vec4(tint*b,1.);
+}"""
+
+
+@pytest.mark.parametrize("name, text", builtShaders())
+def testMinifiedShadersReparse(name, text):
+    """
+    Minifying minified output reparses it. The result is the same but for names, since
+    those in use aren't reassigned, and those consistently.
+    """
+    before = code(text)
+    after = code(minify.minify(text))
+    assert len(after) == len(before)
+    renames = {}
+    for old, new in zip(before, after):
+        assert old.kind == new.kind
+        if old.kind == glsl.IDENTIFIER:
+            assert renames.setdefault(old.text, new.text) == new.text
+        else:
+            assert old.text == new.text
+    assert len(set(renames.values())) == len(renames)
@@ -0,0 +1,135 @@
+# Copyright (c) 2025-2026 Gene Ressler
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import pytest
+
+import glsl
+import preprocess
+
+
+@pytest.mark.parametrize(
+    "expression, value",
+    [
+        ("1+2*3", 7),
+        ("(1+2)*3", 9),
+        ("2-1-1", 0),
+        ("6/3/2", 1),
+        ("-7/2", -3),
+        ("7/-2", -3),
+        ("-7%2", -1),
+        ("1<<4>>2", 4),
+        ("~0", -1),
+        ("!0&&1", 1),
+        ("0||!1", 0),
+        ("3>2==1", 1),
+        ("1|2^3&6", 1),
+        ("010+0x10", 24),
+        ("5u*2u", 10),
+        ("__VERSION__>=300&&GL_ES", 1),
+    ],
+)
+def testEvaluate(expression, value):
+    assert preprocess.Preprocessor().evaluate(expression) == value
+
+
+def testEvaluateDefined():
+    preprocessor = preprocess.Preprocessor(["SHADOWS"])
+    preprocessor.define("LEVEL 2+1", 0)
+    assert preprocessor.evaluate("defined(SHADOWS)&&defined LEVEL") == 1
+    assert preprocessor.evaluate("defined(MISSING)||!defined(SHADOWS)") == 0
+    # Expansion substitutes tokens, as in C, so this is 2+1*2.
+    assert preprocessor.evaluate("LEVEL*2") == 4
+    assert preprocessor.evaluate("SHADOWS+LEVEL") == 4
+
+
+@pytest.mark.parametrize(
+    "expression, message",
+    [
+        ("MISSING", "Undefined identifier MISSING"),
+        ("1/0", "Division by zero"),
+        ("(1", r"Missing \)"),
+        ("1+", "Incomplete #if"),
+        ("1 2", "Unexpected 2"),
+        ("defined(A", "Bad defined"),
+        ("1.5", "Not an integer"),
+    ],
+)
+def testEvaluateErrors(expression, message):
+    with pytest.raises(Exception, match=message):
+        preprocess.Preprocessor().evaluate(expression)
+
+
+def testConditionals():
+    text = (
+        "#define A B+1\n#define B 2\n"
+        "#if A==3\nx;\n#if 0\nhidden;\n#endif\n#elif 1\ny;\n#else\nz;\n#endif\n"
+        "#ifdef B\nw;\n#endif\n#ifndef B\nv;\n#endif\n"
+    )
+    result = preprocess.preprocess(text)
+    assert result.split() == ["x;", "w;"]
+    # Lines of directives and excluded groups stay, blank.
+    assert result.count("\n") == text.count("\n")
+
+
+def testExpansion():
+    text = "#define M -1\n#define N x\n#define P N.y\nx=-M;\ny=P;\nvec2 M2;\n"
+    # Spaces keep expansions from fusing with neighboring tokens.
+    assert preprocess.preprocess(text) == "\n\n\nx=- -1;\ny=x.y;\nvec2 M2;\n"
+
+
+def testUndefAndRedefine():
+    text = "#define A 1\n#undef A\n#define A 2\nA;\n#define A 2\n"
+    assert preprocess.preprocess(text).split() == ["2;"]
+    with pytest.raises(Exception, match="Line 2: Macro A redefined differently"):
+        preprocess.preprocess("#define A 1\n#define A 2\n")
+
+
+def testScopedMacros():
+    text = "{\n#define ARG_X 1\nf(ARG_X);\n}\n#ifdef ARG_X\nbad;\n#endif\n"
+    assert preprocess.preprocess(text).split() == ["{", "f(1);", "}"]
+
+
+def testFeatureDefines():
+    text = (
+        "#if defined(SHADOWS)\nshadows;\n#endif\n#ifdef INSTANCED\ninstanced;\n#endif\n"
+    )
+    assert preprocess.preprocess(text, ["SHADOWS"]).split() == ["shadows;"]
+
+
+def testKeptDirectives():
+    text = "#version 300 es\n#extension GL_X : enable\n#pragma optimize(on)\n#line 10\nx;\n"
+    assert preprocess.preprocess(text) == text
+
+
+@pytest.mark.parametrize(
+    "text, message",
+    [
+        ("#define A B\n#define B A\nA;\n", "Line 3: Recursive macro: A -> B -> A"),
+        ("#define F(x) x\n", "Function-like macros"),
+        ("#define GL_X 1\n", "Reserved macro name"),
+        ("#ifdef A\n", "Missing #endif"),
+        ("#endif\n", "#endif without #if"),
+        ("#if 1\n#else\n#elif 1\n#endif\n", "#elif after #else"),
+        ("\n#error Stop\n", "Line 2: #error Stop"),
+        ('#include "a.h"\n', "Unknown directive #include"),
+    ],
+)
+def testErrors(text, message):
+    with pytest.raises(Exception, match=message):
+        preprocess.preprocess(text)
+
+
+def testFuses():
+    assert preprocess.fuses("+", "+")
+    assert preprocess.fuses("a", "b")
+    assert preprocess.fuses("1", ".5")
+    assert not preprocess.fuses("a", "+")
+    assert not preprocess.fuses(")", "(")
+
+
+def testOutputTokenizes():
+    text = "#define ONE 1.\n#define TWO ONE+ONE\nfloat x=TWO*-ONE;\n"
+    result = preprocess.preprocess(text)
+    assert [t.text for t in preprocess.significant(glsl.tokenize(result))] == [
+        "float", "x", "=", "1.", "+", "1.", "*", "-", "1.", ";"
+    ]  # fmt: skip
@@ -12,10 +12,14 @@ layout(std140) uniform LightConfig {
 } light;
 
 uniform sampler2D meshTexture;
+#ifdef SHADOWS
 uniform sampler2DShadow depthMap;
+#endif
 
 in vec3 normal;
+#ifdef SHADOWS
 in vec4 depthMapLookup;
+#endif
 in vec2 texCoord;
 out vec4 fragmentColor;
 
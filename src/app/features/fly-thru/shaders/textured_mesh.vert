@@ -13,20 +13,29 @@ layout(std140) uniform Transforms {
 #define IN_POSITION_LOCATION 0
 #define IN_NORMAL_LOCATION 1
 #define IN_TEX_COORD_LOCATION 3
+#define IN_INSTANCE_MODEL_TRANSFORM_LOCATION 4
 #endif
 
 layout(location = IN_POSITION_LOCATION) in vec3 inPosition;
 layout(location = IN_NORMAL_LOCATION) in vec3 inNormal;
 layout(location = IN_TEX_COORD_LOCATION) in vec2 inTexCoord;
+#ifdef INSTANCED
+layout(location = IN_INSTANCE_MODEL_TRANSFORM_LOCATION) in mat4 inModelTransform;
+#endif
 
 out vec3 normal;
 out vec4 depthMapLookup;
 out vec2 texCoord;
 
 void main() {
+#ifdef INSTANCED
+  vec4 inPositionHomogeneous = inModelTransform * vec4(inPosition, 1.0f);
+  normal = mat3(transforms.modelView) * mat3(inModelTransform) * inNormal;
+#else
   vec4 inPositionHomogeneous = vec4(inPosition, 1.0f);
-  gl_Position = transforms.modelViewProjection * inPositionHomogeneous;
   normal = mat3(transforms.modelView) * inNormal;
+#endif
+  gl_Position = transforms.modelViewProjection * inPositionHomogeneous;
   depthMapLookup = transforms.depthMapLookup * inPositionHomogeneous;
   texCoord = inTexCoord;
 }
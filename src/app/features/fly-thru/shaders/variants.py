@@ -0,0 +1,156 @@
+# Copyright (c) 2025-2026 Gene Ressler
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Shader variants. Features are bits declared in constants.ts as `<NAME>_SHADER_FEATURE`.
+A program spec in shader.service.ts may list variants, each a set of feature names. Its
+shaders are built once per variant with each of the variant's features defined as a
+macro, so shader code selects with #ifdef.
+
+Only variants some spec lists are built. Features a shader never mentions are first
+dropped from its variants. Variants with identical shader text share one export, and
+variants with the same shaders share one program.
+"""
+
+import re
+
+import glsl
+from glsl import DIRECTIVE, IDENTIFIER
+
+FEATURE_PATTERN = re.compile(r"export\s+const\s+(\w+)_SHADER_FEATURE\s*=\s*(\d+);")
+
+
+def parseFeatures(file_name):
+    """Returns the bit of each shader feature declared in the given constants source by name."""
+    with open(file_name, "r") as input:
+        text = input.read()
+    features = {}
+    for name, bit in FEATURE_PATTERN.findall(text):
+        bit = int(bit)
+        if bit & (bit - 1) or bit == 0:
+            raise Exception(f"Shader feature {name} isn't a single bit: {bit}")
+        if bit in features.values():
+            raise Exception(f"Shader feature {name} reuses bit {bit}")
+        features[name] = bit
+    return features
+
+
+def featureMask(names, features):
+    mask = 0
+    for name in names:
+        if name not in features:
+            raise Exception(f"Unknown shader feature: {name}")
+        mask |= features[name]
+    return mask
+
+
+def featureNames(mask, features):
+    """Returns the names of features in the given mask in bit order."""
+    return [
+        name for name, bit in sorted(features.items(), key=lambda f: f[1]) if mask & bit
+    ]
+
+
+def variantName(name, mask, features):
+    """Returns the given name with those of the features in the mask appended."""
+    return "_".join([name, *featureNames(mask, features)])
+
+
+def mentionedFeatures(text, features):
+    """Returns the mask of features named anywhere in the given shader source."""
+    identifiers = set()
+    for token in glsl.tokenize(text):
+        if token.kind == IDENTIFIER:
+            identifiers.add(token.text)
+        elif token.kind == DIRECTIVE:
+            identifiers |= glsl.directiveIdentifiers(token.text)
+    return featureMask(identifiers & features.keys(), features)
+
+
+def withDefines(text, names):
+    """Returns the given shader source with the named macros defined after #version."""
+    if not names:
+        return text
+    version, newline, rest = text.partition("\n")
+    defines = "".join(f"#define {name} 1\n" for name in names)
+    return f"{version}{newline}{defines}#line 2\n{rest}"
+
+
+def parseProgramSpecs(file_name, features):
+    """
+    Returns the specs of PROGRAM_SPECS in the given shader service source. Each has name,
+    vertex, fragment, and depth vertex shader export names and the feature masks of its
+    variants. Depth vertex is None if the spec has none.
+    """
+    with open(file_name, "r") as input:
+        text = input.read()
+    specs_match = re.search(r"PROGRAM_SPECS[^=]*=\s*\[(.*?)\n\];", text, re.DOTALL)
+    if not specs_match:
+        raise Exception(f"No PROGRAM_SPECS in {file_name}")
+    specs = []
+    for spec_text in re.findall(r"\{([^{}]*)\}", specs_match.group(1)):
+        spec = dict(re.findall(r"(\w+):\s*'(\w+)'", spec_text))
+        variants_match = re.search(r"variants:\s*\[([^\]]*)\]", spec_text)
+        variants = (
+            re.findall(r"'([\w ]*)'", variants_match.group(1))
+            if variants_match
+            else [""]
+        )
+        specs.append(
+            {
+                "name": spec["name"],
+                "vertex": spec["displayVertexShaderName"],
+                "depthVertex": spec.get("depthVertexShaderName"),
+                "fragment": spec["fragmentShaderName"],
+                "masks": [featureMask(v.split(), features) for v in variants],
+            }
+        )
+    return specs
+
+
+def requestedMasks(specs, empty_fragment_shader):
+    """Returns the set of feature masks of each shader export name the specs use."""
+    requested = {}
+    for spec in specs:
+        for mask in spec["masks"]:
+            for shader in (spec["vertex"], spec["fragment"]):
+                requested.setdefault(shader, set()).add(mask)
+            if spec["depthVertex"]:
+                requested.setdefault(spec["depthVertex"], set()).add(mask)
+                requested.setdefault(empty_fragment_shader, set()).add(mask)
+    return requested
+
+
+def resolvePrograms(specs, shader_exports, empty_fragment_shader, features):
+    """
+    Returns the vertex and fragment shader export of each program by name and the display
+    and depth program of each spec's variants by feature mask. Given is the export of each
+    shader variant by (export name, mask). Variants with the same shaders share a program,
+    named for the first.
+    """
+    program_shaders = {}
+    names_by_shaders = {}
+    program_variants = {}
+
+    def program(name, vertex, fragment, mask):
+        shaders = (shader_exports[vertex, mask], shader_exports[fragment, mask])
+        if shaders not in names_by_shaders:
+            names_by_shaders[shaders] = name
+            program_shaders[name] = {
+                "vertexShader": shaders[0],
+                "fragmentShader": shaders[1],
+            }
+        return names_by_shaders[shaders]
+
+    for spec in specs:
+        variants = program_variants.setdefault(spec["name"], {})
+        for mask in sorted(spec["masks"]):
+            name = variantName(spec["name"], mask, features).lower()
+            variant = {"display": program(name, spec["vertex"], spec["fragment"], mask)}
+            if spec["depthVertex"]:
+                depth_name = f"{name}_depth"
+                variant["depth"] = program(
+                    depth_name, spec["depthVertex"], empty_fragment_shader, mask
+                )
+            variants[mask] = variant
+    return program_shaders, program_variants
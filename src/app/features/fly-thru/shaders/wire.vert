@@ -12,17 +12,26 @@ layout(std140) uniform Transforms {
 #define IN_POSITION_LOCATION 0
 #define IN_DIRECTION_LOCATION 1
 #define IN_MATERIAL_REF_LOCATION 2
+#define IN_INSTANCE_MODEL_TRANSFORM_LOCATION 4
 #endif
 
 layout(location = IN_POSITION_LOCATION) in vec3 inPosition;
 layout(location = IN_DIRECTION_LOCATION) in vec3 inDirection;
+#ifdef INSTANCED
+layout(location = IN_INSTANCE_MODEL_TRANSFORM_LOCATION) in mat4 inModelTransform;
+#endif
 
 out vec3 vertex;
 out vec3 direction;
 
 void main() {
+#ifdef INSTANCED
+  vec4 inPositionHomogeneous = inModelTransform * vec4(inPosition, 1.0f);
+  direction = mat3(transforms.modelView) * mat3(inModelTransform) * inDirection;
+#else
   vec4 inPositionHomogeneous = vec4(inPosition, 1.0f);
+  direction = mat3(transforms.modelView) * inDirection;
+#endif
   gl_Position = transforms.modelViewProjection * inPositionHomogeneous;
   vertex = vec3(transforms.modelView * inPositionHomogeneous);
-  direction = mat3(transforms.modelView) * inDirection;
 }
@@ -10,7 +10,6 @@ import {
 } from '@angular/core';
 import { HelpIndexService, HelpTopic } from '../indexer/help-index.service';
 import { jqxListBoxModule } from 'jqwidgets-ng/jqxlistbox';
-import { Results } from '@orama/orama';
 import { CurrentTopicService } from '../current-topic.service';
 
 @Component({
@@ -22,9 +21,12 @@ import { CurrentTopicService } from '../current-topic.service';
 })
 export class HelpSearchComponent {
   private static readonly NOTHING_YET = [{ topic: '', title: 'Nothing so far...' }];
+  /** Pause in typing after which the typeahead list is replaced by all search hits. */
+  private static readonly FULL_SEARCH_DELAY_MS = 150;
   @ViewChild('searchTermInput') searchTermInput!: ElementRef<HTMLInputElement>;
 
   source: any = HelpSearchComponent.NOTHING_YET;
+  fullSearchTimeout: any;
 
   constructor(
     private readonly changeDetector: ChangeDetectorRef,
@@ -33,20 +35,30 @@ export class HelpSearchComponent {
   ) {}
 
   public clear(): void {
+    clearTimeout(this.fullSearchTimeout);
     this.searchTermInput.nativeElement.value = '';
   }
   
   handleSearchTermInputInput(_event: Event): void {
     const searchTerm = this.searchTermInput.nativeElement.value;
+    // Show the top few hits on every keystroke. Once typing pauses, show them all.
+    clearTimeout(this.fullSearchTimeout);
     if (searchTerm.length <= 1) {
-      this.source = HelpSearchComponent.NOTHING_YET;
+      this.showTopics([]);
     } else {
-      const result: Results<HelpTopic> = this.helpIndexService.search(searchTerm);
-      this.source =
-        result.hits.length === 0
-          ? HelpSearchComponent.NOTHING_YET
-          : result.hits.map(hit => ({ topicId: hit.id, title: hit.document.title }));
+      this.showTopics(this.helpIndexService.typeahead(searchTerm));
+      this.fullSearchTimeout = setTimeout(
+        () => this.showTopics(this.helpIndexService.search(searchTerm)),
+        HelpSearchComponent.FULL_SEARCH_DELAY_MS,
+      );
     }
+  }
+
+  private showTopics(topics: HelpTopic[]): void {
+    this.source =
+      topics.length === 0
+        ? HelpSearchComponent.NOTHING_YET
+        : topics.map(topic => ({ topicId: topic.id, title: topic.title }));
     this.changeDetector.detectChanges();
   }
 
@@ -3,7 +3,7 @@
 
 import { AfterViewInit, ChangeDetectionStrategy, Component, ViewChild } from '@angular/core';
 import { jqxListBoxComponent, jqxListBoxModule } from 'jqwidgets-ng/jqxlistbox';
-import { HELP_INDEX_DATA } from '../indexer/index-data';
+import { HELP_SEARCH_INDEX } from '../indexer/index-data';
 import { CurrentTopicService } from '../current-topic.service';
 
 @Component({
@@ -16,7 +16,7 @@ import { CurrentTopicService } from '../current-topic.service';
 export class HelpTopicListComponent implements AfterViewInit {
   @ViewChild('topicListBox') topicListBox!: jqxListBoxComponent;
 
-  readonly source: any = HELP_INDEX_DATA;
+  readonly source: any = HELP_SEARCH_INDEX.topics;
 
   constructor(private readonly currentTopicService: CurrentTopicService) {}
 
@@ -32,7 +32,7 @@ export class HelpTopicListComponent implements AfterViewInit {
   }
 
   private selectTopicId(topicId: string): void {
-    const index = HELP_INDEX_DATA.findIndex(value => value.id === topicId);
+    const index = HELP_SEARCH_INDEX.topics.findIndex(value => value.id === topicId);
     if (index >= 0) {
       this.topicListBox.ensureVisible(index);
       this.topicListBox.selectedIndex(index);
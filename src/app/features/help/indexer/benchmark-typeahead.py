@@ -0,0 +1,93 @@
+# Copyright (c) 2025-2026 Gene Ressler
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# Compares per-keystroke latency of the typeahead table in build.py with scoring every
+# term a prefix begins, as search did before the table. Each word of a recorded query list
+# is typed a letter at a time from two letters, as the help search box starts searching.
+# Both give the same topics, which is checked. Run with python3 benchmark-typeahead.py.
+
+import argparse
+import time
+
+import build
+
+
+def scoredTypeahead(terms, fields, entries, word):
+    """Typeahead without the table: ranks the summed scores of all terms the word begins."""
+    term_range = build.termRange(terms, word.lower())
+    return build.rankTopics(
+        build.prefixScores(term_range, fields), build.TYPEAHEAD_LIMIT
+    )
+
+
+def keystrokes(words):
+    return [word[:end] for word in words for end in range(2, len(word) + 1)]
+
+
+def percentile(sorted_values, fraction):
+    return sorted_values[
+        min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    ]
+
+
+def timedQueries(query, prefixes, terms, fields, entries, repeats):
+    """Returns the results of the given queries and their latencies in microseconds."""
+    results = []
+    latencies = []
+    for prefix in prefixes:
+        best = float("inf")
+        for _ in range(repeats):
+            start = time.perf_counter()
+            result = query(terms, fields, entries, prefix)
+            best = min(best, time.perf_counter() - start)
+        results.append(result)
+        latencies.append(best * 1e6)
+    return results, sorted(latencies)
+
+
+def main(queries_file, repeats):
+    indexer = build.Indexer()
+    with open("../help-topic/help-topic.component.html", "r") as file:
+        indexer.feed(file.read())
+    topics, terms, fields = build.buildIndex(indexer.data)
+    start = time.perf_counter()
+    entries = build.buildTypeahead(terms, fields)
+    build_seconds = time.perf_counter() - start
+    encoded_size = len(build.encodeTypeahead(entries))
+    print(
+        f"{len(topics)} topics, {len(terms)} terms, {len(entries)} typeahead entries, "
+        f"{encoded_size / 1000:.1f} KB, built in {build_seconds:.2f} s"
+    )
+    with open(queries_file, "r") as file:
+        prefixes = keystrokes(file.read().split())
+    print(f"{len(prefixes)} keystrokes, best of {repeats}, microseconds")
+    print(f"{'query':>8} {'mean':>8} {'p50':>8} {'p95':>8} {'max':>8}")
+    all_results = []
+    for name, query in (("table", build.typeahead), ("scored", scoredTypeahead)):
+        results, latencies = timedQueries(
+            query, prefixes, terms, fields, entries, repeats
+        )
+        all_results.append(results)
+        mean = sum(latencies) / len(latencies)
+        print(
+            f"{name:>8} {mean:>8.1f} {percentile(latencies, 0.5):>8.1f} "
+            f"{percentile(latencies, 0.95):>8.1f} {latencies[-1]:>8.1f}"
+        )
+    assert all_results[0] == all_results[1]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmarks help search typeahead.")
+    parser.add_argument(
+        "--queries",
+        default="typeahead-queries.txt",
+        help="Recorded query words, separated by whitespace.",
+    )
+    parser.add_argument(
+        "--repeats",
+        type=int,
+        default=5,
+        help="Times each keystroke is queried. The fastest counts.",
+    )
+    args = parser.parse_args()
+    main(args.queries, args.repeats)
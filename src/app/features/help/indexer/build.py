@@ -1,7 +1,9 @@
 # Copyright (c) 2025-2026 Gene Ressler
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+import bisect
 from html.parser import HTMLParser
+import math
 import re
 import pprint
 
@@ -14,9 +16,6 @@ def readStopWords():
         return f.read()
 
 
-DONT_INDEX = readStopWords()
-
-
 def attrsToStr(attrs):
     result = " ".join(
         f'{tag}="{value}"' for (tag, value) in attrs if tag not in ["border", "align"]
@@ -33,14 +32,14 @@ class Indexer(HTMLParser):
         self.current_title = "[none]"
         self.text = ""
         self.data = {}
-        self.ignore_set = set(DONT_INDEX.split())
+        self.ignore_set = set(readStopWords().split())
 
     def indent(self, *args):
         print(" " * self.spaces, *args)
 
     def handle_starttag(self, tag, attrs):
         if DEBUG == True:
-            self.indent("start:", tag,  (attrs))
+            self.indent("start:", tag, (attrs))
             self.spaces += 1
         match tag:
             case "ng-template":
@@ -68,7 +67,10 @@ class Indexer(HTMLParser):
                     )
                     # collapse whitespace finally
                     text = re.sub(r"\s+", " ", text)
-                self.data[self.current_name] = (self.current_title.strip(), text.strip())
+                self.data[self.current_name] = (
+                    self.current_title.strip(),
+                    text.strip(),
+                )
                 self.text = ""
             case "h1":
                 self.state = "in-text"
@@ -124,34 +126,226 @@ def quote(s):
     return f"`{s}`" if "'" in s else f"'{s}'"
 
 
-PREAMBLE = """type HelpIndexData = {
-  id: string,
-  title: string,
-  text: string,
+# Must match TOKEN_SEPARATOR in help-index.service.ts.
+TOKEN_SEPARATOR = re.compile(r"[^a-z0-9_'-]+")
+FIELDS = ("title", "text")
+BASE36_DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+CHUNK_SIZE = 100
+# BM25 parameters and field boosts. Must match help-index.service.ts.
+BM25_K = 1.2
+BM25_B = 0.75
+BM25_D = 0.5
+BOOSTS = {"title": 3, "text": 1}
+# Topics kept for each typeahead prefix and the fewest terms a prefix must begin to be kept.
+# Narrower prefixes are cheap to score when typed.
+TYPEAHEAD_LIMIT = 20
+TYPEAHEAD_MIN_TERMS = 4
+
+
+def tokenize(text):
+    """Returns the search tokens of the given text."""
+    return [token for token in TOKEN_SEPARATOR.split(text.lower()) if token]
+
+
+def base36(n):
+    digits = ""
+    while True:
+        n, digit = divmod(n, 36)
+        digits = BASE36_DIGITS[digit] + digits
+        if n == 0:
+            return digits
+
+
+def buildIndex(data):
+    """
+    Returns an inverted index of the given (title, text) of topics by id: topics as
+    (id, title) sorted by title, the sorted terms of all fields, and per field the token
+    count of each topic and the postings of each term, (topic index, term count) pairs in
+    topic order.
+    """
+    topics = sorted(data.items(), key=lambda item: item[1][0].lower())
+    postings = {field: {} for field in FIELDS}
+    lengths = {field: [] for field in FIELDS}
+    for index, (_, values) in enumerate(topics):
+        for field, value in zip(FIELDS, values):
+            tokens = tokenize(value)
+            lengths[field].append(len(tokens))
+            for token in sorted(set(tokens)):
+                postings[field].setdefault(token, []).append(
+                    (index, tokens.count(token))
+                )
+    terms = sorted(set().union(*postings.values()))
+    fields = {
+        field: (lengths[field], [postings[field].get(term, []) for term in terms])
+        for field in FIELDS
+    }
+    return [(id, title) for id, (title, _) in topics], terms, fields
+
+
+def encodePostings(postings):
+    """
+    Returns the given postings as comma-separated base 36 topic index deltas, each
+    followed by a colon and the term count unless it's one.
+    """
+    entries = []
+    previous = 0
+    for index, count in postings:
+        entry = base36(index - previous)
+        entries.append(entry if count == 1 else f"{entry}:{base36(count)}")
+        previous = index
+    return ",".join(entries)
+
+
+def termRange(terms, prefix):
+    """Returns the (start, end) indices of the given sorted terms that begin with the prefix."""
+    return (
+        bisect.bisect_left(terms, prefix),
+        bisect.bisect_left(terms, prefix + "\U0010ffff"),
+    )
+
+
+def prefixScores(term_range, fields):
+    """
+    Returns the score of each topic for a search of a word beginning the given range of
+    terms as HelpIndexService.search computes it: the sum over terms and fields of boosted
+    BM25 scores, added in the same order so the floats agree.
+    """
+    topic_count = len(fields["title"][0])
+    averages = {
+        field: sum(lengths) / topic_count for field, (lengths, _) in fields.items()
+    }
+    scores = [0.0] * topic_count
+    for term_index in range(*term_range):
+        for field, (lengths, postings) in fields.items():
+            term_postings = postings[term_index]
+            n = len(term_postings)
+            idf = math.log(1 + (topic_count - n + 0.5) / (n + 0.5))
+            for topic, tf in term_postings:
+                length_norm = 1 - BM25_B + BM25_B * lengths[topic] / averages[field]
+                tf_part = tf * (BM25_K + 1) / (tf + BM25_K * length_norm)
+                scores[topic] += BOOSTS[field] * idf * (BM25_D + tf_part)
+    return scores
+
+
+def rankTopics(scores, limit):
+    """Returns the indices of topics with positive scores, best first, ties in index order."""
+    ranked = sorted(
+        (i for i, s in enumerate(scores) if s > 0), key=lambda i: -scores[i]
+    )
+    return ranked[:limit]
+
+
+def buildTypeahead(terms, fields):
+    """
+    Returns the best topics for each prefix of the terms beginning at least
+    TYPEAHEAD_MIN_TERMS of them, keyed by the range of terms it begins. Prefixes beginning
+    the same terms share an entry, so there's one per node of the terms' radix tree.
+    """
+    entries = {}
+    for term in terms:
+        for end in range(1, len(term) + 1):
+            term_range = termRange(terms, term[:end])
+            if term_range[1] - term_range[0] < TYPEAHEAD_MIN_TERMS:
+                break
+            if term_range not in entries:
+                scores = prefixScores(term_range, fields)
+                entries[term_range] = rankTopics(scores, TYPEAHEAD_LIMIT)
+    return dict(sorted(entries.items()))
+
+
+def typeahead(terms, fields, entries, word):
+    """
+    Returns the indices of the best topics for a search of the given word, best first. The
+    reference for HelpIndexService.typeahead: the word's entry if it has one, else scored.
+    """
+    term_range = termRange(terms, word.lower())
+    if term_range in entries:
+        return entries[term_range]
+    return rankTopics(prefixScores(term_range, fields), TYPEAHEAD_LIMIT)
+
+
+def encodeTypeahead(entries):
+    """
+    Returns the given typeahead entries separated by semicolons, each the base 36 start
+    and end of its term range separated by a comma, a colon, and comma-separated base 36
+    topic indices.
+    """
+    return ";".join(
+        f"{base36(start)},{base36(end)}:{','.join(base36(t) for t in topics)}"
+        for (start, end), topics in entries.items()
+    )
+
+
+def chunked(s, indent):
+    """Returns the given string as a TypeScript concatenation of chunks."""
+    chunks = [quote(s[i : i + CHUNK_SIZE]) for i in range(0, len(s), CHUNK_SIZE)]
+    return f" +\n{' ' * indent}".join(chunks) if chunks else "''"
+
+
+def numbers(values, indent):
+    """Returns the given numbers as a TypeScript array literal wrapped at the chunk size."""
+    lines = []
+    line = ""
+    for value in values:
+        if len(line) >= CHUNK_SIZE:
+            lines.append(line)
+            line = ""
+        line += f"{value}, "
+    lines.append(line)
+    inner = "".join(f"{' ' * (indent + 2)}{line.rstrip()}\n" for line in lines)
+    return f"[\n{inner}{' ' * indent}]"
+
+
+PREAMBLE = """export type HelpSearchField = {
+  // Token count of the field in each topic.
+  lengths: number[],
+  // Postings of each term separated by semicolons. Each is comma-separated base 36 topic index deltas, each
+  // followed by a colon and the term count unless it's one.
+  postings: string,
 };
 
-export const HELP_INDEX_DATA: HelpIndexData[] = ["""
-
-indexer = Indexer()
-with open("../help-topic/help-topic.component.html", "r") as file:
-    indexer.feed(file.read())
-
-if DEBUG:
-    pprint.pp(indexer.data)
-else:
-    with open("index-data.ts", "w") as f:
-        print(PREAMBLE, file=f)
-        chunk_size = 100
-        for id, (title, text) in sorted(
-            indexer.data.items(), key=lambda item: item[1][0].lower()
-        ):
-            text_chunks = [
-                f"{quote(text[i:i + chunk_size])}"
-                for i in range(0, len(text), chunk_size)
-            ]
-            print("  {", file=f)
-            print(f"    id: '{id}',", file=f)
-            print(f"    title: {quote(title)},", file=f)
-            print(f"    text: {' +\n          '.join(text_chunks)}", file=f)
+export type HelpSearchIndex = {
+  topics: { id: string, title: string }[],
+  // Sorted terms of all fields separated by spaces.
+  terms: string,
+  fields: { title: HelpSearchField, text: HelpSearchField },
+  // Best topics of word prefixes beginning several terms, separated by semicolons. Each is the base 36 start and
+  // end of the range of terms the prefixes begin separated by a comma, then a colon and comma-separated base 36
+  // topic indices, best first.
+  typeahead: string,
+};
+
+export const HELP_SEARCH_INDEX: HelpSearchIndex = {"""
+
+
+def main():
+    indexer = Indexer()
+    with open("../help-topic/help-topic.component.html", "r") as file:
+        indexer.feed(file.read())
+
+    if DEBUG:
+        pprint.pp(indexer.data)
+    else:
+        topics, terms, fields = buildIndex(indexer.data)
+        with open("index-data.ts", "w") as f:
+            print(PREAMBLE, file=f)
+            print("  topics: [", file=f)
+            for id, title in topics:
+                print(f"    {{ id: '{id}', title: {quote(title)} }},", file=f)
+            print("  ],", file=f)
+            print(f"  terms: {chunked(' '.join(terms), 9)},", file=f)
+            print("  fields: {", file=f)
+            for field, (lengths, postings) in fields.items():
+                encoded = ";".join(encodePostings(p) for p in postings)
+                print(f"    {field}: {{", file=f)
+                print(f"      lengths: {numbers(lengths, 6)},", file=f)
+                print(f"      postings: {chunked(encoded, 16)},", file=f)
+                print("    },", file=f)
             print("  },", file=f)
-        print("];", file=f)
+            typeahead = encodeTypeahead(buildTypeahead(terms, fields))
+            print(f"  typeahead: {chunked(typeahead, 13)},", file=f)
+            print("};", file=f)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+/* Copyright (c) 2025-2026 Gene Ressler
+   SPDX-License-Identifier: GPL-3.0-or-later */
+
+import { TestBed } from '@angular/core/testing';
+import { HelpIndexService, HelpTopic } from './help-index.service';
+import { HELP_SEARCH_INDEX } from './index-data';
+
+// As in the service and build.py.
+const TYPEAHEAD_LIMIT = 20;
+
+describe('HelpIndexService', () => {
+  let service: HelpIndexService;
+
+  beforeEach(() => {
+    TestBed.configureTestingModule({});
+    service = TestBed.inject(HelpIndexService);
+  });
+
+  it('should be created', () => {
+    expect(service).toBeTruthy();
+  });
+
+  it('should find topics with words beginning with the search words', () => {
+    const hits = service.search('title:abutment');
+    expect(hits.length).toBeGreaterThan(1);
+    for (const hit of hits) {
+      expect(hit.title.toLowerCase()).withContext(hit.id).toContain('abutment');
+    }
+    const scores = hits.map(hit => hit.score);
+    expect(scores).toEqual([...scores].sort((a, b) => b - a));
+    expect(service.search('xyzzy')).toEqual([]);
+  });
+
+  it('should have typeahead topics that are the top search hits', () => {
+    const terms = HELP_SEARCH_INDEX.terms.split(' ');
+    const entries = HELP_SEARCH_INDEX.typeahead.split(';');
+    expect(entries.length).toBeGreaterThan(0);
+    for (const entry of entries) {
+      const colon = entry.indexOf(':');
+      const [start, end] = entry.slice(0, colon).split(',');
+      // The terms of the range are sorted, so the prefix of the first and last begins exactly those.
+      const prefix = commonPrefix(terms[parseInt(start, 36)], terms[parseInt(end, 36) - 1]);
+      const expected = ids(service.search(prefix).slice(0, TYPEAHEAD_LIMIT));
+      const precomputed = entry
+        .slice(colon + 1)
+        .split(',')
+        .map(index => HELP_SEARCH_INDEX.topics[parseInt(index, 36)].id);
+      expect(precomputed).withContext(prefix).toEqual(expected);
+      expect(ids(service.typeahead(prefix))).withContext(prefix).toEqual(expected);
+    }
+  });
+
+  it('should give the top search hits as typeahead for words not precomputed', () => {
+    for (const term of ['truss', 'load test', 'title:deck', 'zzz']) {
+      expect(ids(service.typeahead(term)))
+        .withContext(term)
+        .toEqual(ids(service.search(term).slice(0, TYPEAHEAD_LIMIT)));
+    }
+  });
+});
+
+function commonPrefix(a: string, b: string): string {
+  let length = 0;
+  while (length < a.length && a[length] === b[length]) {
+    ++length;
+  }
+  return a.slice(0, length);
+}
+
+function ids(topics: HelpTopic[]): string[] {
+  return topics.map(topic => topic.id);
+}
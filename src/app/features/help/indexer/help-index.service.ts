@@ -2,40 +2,145 @@
    SPDX-License-Identifier: GPL-3.0-or-later */
 
 import { Injectable } from '@angular/core';
-import { HELP_INDEX_DATA } from './index-data';
-import { create, search, insertMultiple, Results, TypedDocument, Orama, SearchParams } from '@orama/orama';
+import { HELP_SEARCH_INDEX, HelpSearchField } from './index-data';
 
-export type HelpTopic = TypedDocument<Orama<typeof HELP_SCHEMA>>;
+export type HelpTopic = { id: string; title: string };
+export type HelpSearchHit = HelpTopic & { score: number };
 
-const HELP_SCHEMA = {
-  id: 'string',
-  title: 'string',
-  text: 'string',
-} as const;
+/** A field of the index ready for search. Postings are decoded when a search needs them. */
+type SearchField = {
+  lengths: number[];
+  averageLength: number;
+  postings: string[];
+  boost: number;
+};
 
+// Must match TOKEN_SEPARATOR in build.py.
+const TOKEN_SEPARATOR = /[^a-z0-9_'-]+/;
+// BM25 parameters. Orama's defaults, which the index replaced. These, the boost, and the typeahead limit must match
+// build.py.
+const BM25_K = 1.2;
+const BM25_B = 0.75;
+const BM25_D = 0.5;
+const TITLE_BOOST = 3;
+const HIT_LIMIT = 100;
+const TYPEAHEAD_LIMIT = 20;
+
+/** Searches the inverted help index that the build generates, scoring with BM25. */
 @Injectable({ providedIn: 'root' })
 export class HelpIndexService {
-
-  private readonly helpDb: Orama<typeof HELP_SCHEMA>;
+  private readonly terms: string[];
+  private readonly titleField: SearchField;
+  private readonly textField: SearchField;
+  /** Encoded best topics of typeahead prefixes keyed by the range of terms they begin. See rangeKey(). */
+  private readonly typeaheadTopics = new Map<number, string>();
 
   constructor() {
-    this.helpDb = create({ schema: HELP_SCHEMA });
-    insertMultiple(this.helpDb, HELP_INDEX_DATA, 300);
+    this.terms = HELP_SEARCH_INDEX.terms.split(' ');
+    this.titleField = loadField(HELP_SEARCH_INDEX.fields.title, TITLE_BOOST);
+    this.textField = loadField(HELP_SEARCH_INDEX.fields.text, 1);
+    for (const entry of HELP_SEARCH_INDEX.typeahead.split(';')) {
+      const colon = entry.indexOf(':');
+      const [start, end] = entry.slice(0, colon).split(',');
+      this.typeaheadTopics.set(this.rangeKey(parseInt(start, 36), parseInt(end, 36)), entry.slice(colon + 1));
+    }
+  }
+
+  /**
+   * Returns the best topics for the given term as it's being typed, at most TYPEAHEAD_LIMIT. A single word beginning
+   * several terms is looked up in the table the build precomputes, since scoring all those terms on every keystroke
+   * is the slowest search. Otherwise it's the top of search(), which has the same order.
+   */
+  public typeahead(term: string): HelpTopic[] {
+    const words = tokenize(term);
+    if (words.length === 1 && !term.startsWith('title:')) {
+      const start = this.firstTermIndex(words[0]);
+      const end = this.firstTermIndex(words[0] + '\u{10ffff}');
+      const topics = this.typeaheadTopics.get(this.rangeKey(start, end));
+      if (topics !== undefined) {
+        return topics.split(',').map(index => HELP_SEARCH_INDEX.topics[parseInt(index, 36)]);
+      }
+    }
+    return this.search(term).slice(0, TYPEAHEAD_LIMIT);
   }
 
-  public search(term: string): Results<HelpTopic> {
-    let properties: 'title'[] | '*' = '*';
+  /**
+   * Returns topics matching any word of the given term, best first. Words match terms they're prefixes of. A
+   * `title:` prefix limits the search to titles.
+   */
+  public search(term: string): HelpSearchHit[] {
+    let fields = [this.titleField, this.textField];
     if (term.startsWith('title:')) {
       term = term.slice(6);
-      properties = ['title'];
+      fields = [this.titleField];
     }
-    const searchParams: SearchParams<Orama<typeof HELP_SCHEMA>> = {
-      term,
-      properties,
-      boost: { title: 3 },
-      limit: 100,
-      // causes non-intuitive results imo: tolerance: 1,
+    const topics = HELP_SEARCH_INDEX.topics;
+    const scores = new Float64Array(topics.length);
+    for (const word of new Set(tokenize(term))) {
+      for (let i = this.firstTermIndex(word); i < this.terms.length && this.terms[i].startsWith(word); ++i) {
+        for (const field of fields) {
+          addScores(scores, field, i);
+        }
+      }
     }
-    return search(this.helpDb, searchParams) as Results<HelpTopic>; // Ignore Promise<> alternate.
+    const hits: HelpSearchHit[] = [];
+    scores.forEach((score, i) => {
+      if (score > 0) {
+        hits.push({ ...topics[i], score });
+      }
+    });
+    // Stable, so ties stay in title order.
+    return hits.sort((a, b) => b.score - a.score).slice(0, HIT_LIMIT);
+  }
+
+  /** Returns the index of the first term not less than the given word. */
+  private firstTermIndex(word: string): number {
+    let lo = 0;
+    let hi = this.terms.length;
+    while (lo < hi) {
+      const mid = (lo + hi) >>> 1;
+      if (this.terms[mid] < word) {
+        lo = mid + 1;
+      } else {
+        hi = mid;
+      }
+    }
+    return lo;
+  }
+
+  private rangeKey(start: number, end: number): number {
+    return start * (this.terms.length + 1) + end;
+  }
+}
+
+function tokenize(text: string): string[] {
+  return text
+    .toLowerCase()
+    .split(TOKEN_SEPARATOR)
+    .filter(token => token.length > 0);
+}
+
+function loadField(field: HelpSearchField, boost: number): SearchField {
+  const lengths = field.lengths;
+  const averageLength = lengths.reduce((sum, length) => sum + length, 0) / lengths.length;
+  return { lengths, averageLength, postings: field.postings.split(';'), boost };
+}
+
+/** Adds the BM25 score of the given field's term to that of each topic having it. */
+function addScores(scores: Float64Array, field: SearchField, termIndex: number): void {
+  const postings = field.postings[termIndex];
+  if (!postings) {
+    return;
+  }
+  const entries = postings.split(',');
+  const topicCount = scores.length;
+  const idf = Math.log(1 + (topicCount - entries.length + 0.5) / (entries.length + 0.5));
+  let topic = 0;
+  for (const entry of entries) {
+    const [delta, count] = entry.split(':');
+    topic += parseInt(delta, 36);
+    const tf = count ? parseInt(count, 36) : 1;
+    const lengthNorm = 1 - BM25_B + (BM25_B * field.lengths[topic]) / field.averageLength;
+    scores[topic] += field.boost * idf * (BM25_D + (tf * (BM25_K + 1)) / (tf + BM25_K * lengthNorm));
   }
 }
@@ -1,1972 +1,962 @@
-type HelpIndexData = {
-  id: string,
-  title: string,
-  text: string,
+export type HelpSearchField = {
+  // Token count of the field in each topic.
+  lengths: number[],
+  // Postings of each term separated by semicolons. Each is comma-separated base 36 topic index deltas, each
+  // followed by a colon and the term count unless it's one.
+  postings: string,
 };
 
-export const HELP_INDEX_DATA: HelpIndexData[] = [
-  {
-    id: 'glos_aashto',
-    title: 'AASHTO',
-    text: 'aashto american association state highway transportation officials governing body writes publishes d' +
-          'esign codes highway bridges united states'
-  },
-  {
-    id: 'hlp_aashto_h20x44',
-    title: 'AASHTO H25 truck loading',
-    text: 'aashto h25 loading hypothetical cargo truck similar one pictured truck two axles spaced approximatel' +
-          'y 4 meters apart truck total weight 225 kilonewtons kn 44 kn applied front axle 181 kn rear aashto t' +
-          'ruck loading used design bridge axle weights generally increased factor called dynamic load allowanc' +
-          'e accounts effects moving load structural engineer designs actual bridge must ensure members structu' +
-          're safely carry forces generated one aashto truck loading applied every traffic lane bridge deck tru' +
-          'ck loading positioned anywhere along length bridge indicated design specifications bridge designer a' +
-          'llows design bridge either two highway loading conditions two lanes highway traffic represented one ' +
-          'h25 truck lane single 480 kn permit loading centered laterally roadway first load case two traffic l' +
-          'anes two main trusses must carry weight one lane thus loading used bridge designer consists one h25 ' +
-          'truck total weight 225 kn second case single truck centered roadway two main trusses must carry one ' +
-          'half total truck weight thus permit loading used bridge designer consists 240 kn 120 kn applied axle' +
-          ' location cases dynamic load allowance 1.33'
-  },
-  {
-    id: 'hlp_browser',
-    title: 'About your browser...',
-    text: 'best make bridge designer work computing devices mouse similar gadget plus broad range date browser ' +
-          'software work phones sorry dont support pure touch devices like smart phones pads mouse browsers dat' +
-          'e versions fine based recent chromium google chrome microsoft edge chromium open source opera firefo' +
-          'x chromium firefox based browsers may work fine unfortunately cant support apple safari screen resol' +
-          'ution least 1200 800 pixels better mouse accurate mouse like pointing device example track pad track' +
-          ' ball fine fix problems switch browsers upgrade startup warning complained unsupported browser missi' +
-          'ng html css features try installing current version one supported browsers device unable try latest ' +
-          'possible version google chrome thats best chance success adjust settings hardware needed startup war' +
-          'ning included screen resolution mouse youll need adjust replace hardware pro tips screen resolution ' +
-          'usually choice check operating systems display settings screen resolutions around minimum set browse' +
-          'r full screen mode use possible pixels many devices support adding mouse often dollars check web tak' +
-          'e chances bridge designer might okay current browser despite warnings though features likely disable' +
-          'd work poorly youll notified disabled features. give try clicking cancel warning dialog'
-  },
-  {
-    id: 'glos_abutment',
-    title: 'Abutment',
-    text: 'abutment stone concrete wall supports one end bridge span abutment also acts retaining wall holding ' +
-          'back earth embankments approaches bridge abutment part substructure bridge'
-  },
-  {
-    id: 'hlp_animation_controls',
-    title: 'Animation controls',
-    text: 'column seven faded icons displayed top animation image light mouse gets close walk click icon drag w' +
-          'alk animation pan click icon drag shift horizontally vertically without going forward back head turn' +
-          ' click icon drag turn head standing still home click move back starting view whole bridge truck view' +
-          ' click icon see truck driver traverses bridge drag turn head click walk pan head turn home quit truc' +
-          'k view pause/play click pause unpause animation test failed click see failure settings click show hi' +
-          'de settings dialog selecting animation settings view menu'
-  },
-  {
-    id: 'hlp_animation_settings',
-    title: 'Animation settings',
-    text: 'dialog provides options modify animations appearance move around animation play/pause see animation ' +
-          'controls shadows controls whether sun casts shadows within simulated scene sky controls whether sky ' +
-          'drawn clouds sun hills horizon simple blue background terrain controls whether ground water around b' +
-          'ridge drawn wind turbine controls whether wind generator close bridge drawn abutments controls wheth' +
-          'er bridge abutments road surfaces drawn truck controls whether cartoon truck loading shown hidden co' +
-          'lors controls whether member forces depicted colors box checked compression represented red tension ' +
-          'blue load moves across bridge deck color brightness corresponds intense loading load indicated flat ' +
-          'gray exaggeration controls whether member deflections exaggerated make visible unchecked animation r' +
-          'ealistic checked changes shape truss load multiplied 20 order make visible move speed slider change ' +
-          'speed truck move brightness slider account differences displays making whole image darker brighter n' +
-          'otes tips smoothness animation depends speed computers processor graphics system motion looks jerky ' +
-          'try turning animation features shadows likely greatest effect slowing truck speed makes easier see m' +
-          'embers take release load test proceeds turning colors exaggeration provides realistic view bridge jo' +
-          'b'
-  },
-  {
-    id: 'glos_arch_abutments',
-    title: 'Arch abutments',
-    text: 'bridge designer arch abutments substructure elements use arch supports hold bridge transmit weight s' +
-          'oil'
-  },
-  {
-    id: 'glos_arch_supports',
-    title: 'Arch supports',
-    text: 'arch supports consist pin end span arch supports allow lateral movement bridge thus provide restrain' +
-          't simple supports'
-  },
-  {
-    id: 'glos_asphalt',
-    title: 'Asphalt',
-    text: 'asphalt mixture gravel bitumen product petroleum refining process asphalt commonly used pavement wea' +
-          'ring surface bridge decks'
-  },
-  {
-    id: 'hlp_3dprint_assembly',
-    title: 'Assembling your bridge model',
-    text: 'instructions assume youve already printed parts model using instructions exporting obj files prepare' +
-          ' build things youll need assemble printed parts flat clean work surface protected glue spills paper ' +
-          'shelf paper large paper bag flattened work cyanoacrylate glue crazy glue another plastic glue bond p' +
-          'arts xacto knife box cutter single edge razor blade trim parts needed fine sand paper 150 220 grit n' +
-          'ail file tool expand holes diameter equal minimum feature size slightly larger theyre small fit corr' +
-          'esponding pins tapered xacto blade work micro drill bit pin vice tool spin bit ideal careful begin l' +
-          'aying parts type good way avoid confusion draw grid nine boxes three inches square build surface cov' +
-          'ering paper label 1 9 sort parts ref name qty 1 support cross member 2 5 2 deck end panel 2 3 deck m' +
-          'id panel varies 4 pin cross member varies 5 join deck beam 1 7 truss 2 8 abutment 2 9 pier 0 1 impor' +
-          'tant notes tell difference deck end mid panels looking tabs slots fit together mid panel end panels ' +
-          'tabs abutments look bit different picture one associated anchorage case extra step tab support cross' +
-          ' member pillow used connect anchored members build steps complete model step use trimming tool and/o' +
-          'r hole drill make joint fit well gaps excessive tightness applying glue may take time patient glue t' +
-          'wo support cross members 1 slots two deck end panels 2 set aside grid square 2 dry bridge pier deck ' +
-          'height glue another support cross member 1 deck mid panel 3 otherwise go next step set aside grid sq' +
-          'uare 3 dry glue pin cross member 4 deck join beam 5 glue remaining pin cross members 4 remaining dec' +
-          'k mid panels 3 numbers match glue deck join beam 5 onto one deck end panels 2 return assembly square' +
-          ' 5 dry take break wait glue applied far solid dry fit whole deck arranging deck panels 2 3 4 5 top s' +
-          'ide shown diagram glue end panels go end deck level pier panel one must also right position use tool' +
-          's ensure panels fit together completely test pair panels make sure joint pins farther apart deck joi' +
-          'nts truss wont able attach remove material panel tabs sandpaper file keep panels dry fit left right ' +
-          'order avoid confusion assembling deck tune cross member pins truss holes needed pin fits hole should' +
-          'er shown. tuning means using cutter sandpaper nail file hole drill needle needed make pin hole sizes' +
-          ' match identify insides trusses smooth flat assembled inside surfaces point toward deck opposite sid' +
-          'es thickened gusset joint. >outside truss point away deck attach two leftmost deck joints trusses 7 ' +
-          'four pins deck join beam assembly 5 . make sure inside truss points toward deck take break wait deck' +
-          ' join beam connections trusses solid add deck panels one time working right deck join beam assembly ' +
-          'gluing go sure keep panels correct order dry fitted take break let deck panels dry completely add re' +
-          'st pin cross members 4 truss joints make sure skip support joints abutments pier anchorages well get' +
-          ' later glue support cross member 1 pillows triangular sections abutment 8 tab fits slot bridge ancho' +
-          'rages theres second tab second support cross member glue pillow finally bridge pier glue last pillow' +
-          ' tab attach truss abutments fit abutment pins corresponding truss pin holes includes anchorage pins ' +
-          'bridge glue yet make sure abutments sitting flat surface add drop glue joint take break make sure br' +
-          'ide attachment abutments solid attache glue piers pins truss one make sure abutments pier sitting fl' +
-          'at surface glue sets youre done notes tips consider printing blueprint bridge assembly instructions ' +
-          'paper truss configuration ready reference steps ticking go strangely satisfying bridge parts particu' +
-          'larly big spans anchorages tiny youre feeling crafty try printing truss two pieces obtain bridge twi' +
-          'ce scale one print would allow need cut truss half slicer software print half separately glue togeth' +
-          'er first step assembly assembling bridge model challenging methodical work steadily something goes w' +
-          'rong reprint parts need try good luck project'
-  },
-  {
-    id: 'glos_astm',
-    title: 'ASTM',
-    text: 'american society testing materials astm profit organization manufacturers consumers researchers gove' +
-          'rnment officials purpose write standards production testing use building materials astm standards en' +
-          'sure materials uniformly understood engineering properties appropriate level quality'
-  },
-  {
-    id: 'hlp_auto_correct_errors',
-    title: 'Auto-correct errors check box',
-    text: 'checking menu entry tools auto correct errors causes bridge designer attempt repairs common minor er' +
-          'rors automatically load test notes tips usually best enable auto correction feature cant harm undesi' +
-          'red changes makes removed undo analysis complete'
-  },
-  {
-    id: 'glos_bearing',
-    title: 'Bearing',
-    text: 'bearing another word support supports joints structure attached foundation'
-  },
-  {
-    id: 'glos_bridge_design_file',
-    title: 'Bridge design file',
-    text: 'bridge design file specially formatted text file created bridge designer save bridge design future u' +
-          'se'
-  },
-  {
-    id: 'hlp_bridge_design_window',
-    title: 'Bridge design window',
-    text: 'bridge design window graphical environment create test optimize record bridge design diagram shows m' +
-          'ajor functional components make bridge design window learn component click corresponding area diagra' +
-          'm notes tips best keep bridge design window maximized working design reducing window size makes draw' +
-          'ing editing structural model difficult'
-  },
-  {
-    id: 'glos_buckling',
-    title: 'Buckling',
-    text: 'buckling principal failure mode member loaded compression member buckles bends sideways compressed a' +
-          'xially failure usually sudden catastrophic members long slender particularly susceptible buckling'
-  },
-  {
-    id: 'glos_cable_anchorages',
-    title: 'Cable anchorages',
-    text: 'cable anchorage foundation structure cables suspension bridge connected cables support weight suspen' +
-          'sion bridge anchorages massive often extend far surface earth bridge designer cable anchorages repre' +
-          'sented pinned supports'
-  },
-  {
-    id: 'hlp_change_member_properties',
-    title: 'Change the properties of a member',
-    text: 'change properties member structural model click select tool design tools palette select member want ' +
-          'modify either clicking member clicking entry member list member turn light blue selected click drop ' +
-          'button member properties list property want change material cross section member size select materia' +
-          'l cross section member size respective list new property assigned selected member notes tips change ' +
-          'properties several members simultaneously use multiple selection choose new material cross section m' +
-          'ember size appropriate member properties list increase decrease size selected members next larger sm' +
-          'aller one select members want modify click increase member size button decrease member size button u' +
-          'se multiple selection either button selected members wont necessarily end size. theyll increase decr' +
-          'ease independently want change properties members structural model click select button choose new ma' +
-          'terial cross section member size change properties member appearance member change drawing board cha' +
-          'nging material cause color displayed member change changing size cause width member change according' +
-          'ly changing cross section solid bar hollow tube cause displayed member change single line double lin' +
-          'e vice versa'
-  },
-  {
-    id: 'hlp_choose_optimum',
-    title: 'Choose the optimum design',
-    text: 'design bridge go back one step go forward one step bridge designer optimum design one costs least co' +
-          'nsidered many different alternative site truss configurations possible choose one lowest total cost ' +
-          'final design notes tips design actual bridge many criteria would taken account selecting desirable a' +
-          'lternative include aesthetics ease construction ease maintenance local availability materials enviro' +
-          'nmental impact'
-  },
-  {
-    id: 'glos_chords',
-    title: 'Chords',
-    text: 'chords main horizontal load carrying members truss truss bridge top chords normally carry compressio' +
-          'n bottom chords normally carry tension'
-  },
-  {
-    id: 'glos_client',
-    title: 'Client',
-    text: 'client person organization hires professional like engineer doctor lawyer perform specialized servic' +
-          'e'
-  },
-  {
-    id: 'hlp_component_parts',
-    title: 'Component parts of a truss bridge',
-    text: 'major component parts typical truss bridge chords top bottom verticals also called vertical members ' +
-          'diagonals also called diagonal members floor beams deck pinned support also called fixed bearing rol' +
-          'ler support also called expansion bearing abutments piers component parts illustrated 3 dimensional ' +
-          'view elevation side view notes tips number standard truss configurations commonly used bridge struct' +
-          'ures defined primarily geometry vertical diagonal members'
-  },
-  {
-    id: 'glos_compression',
-    title: 'Compression',
-    text: 'compression internal axial member force tends >>>shorten<<< member'
-  },
-  {
-    id: 'hlp_compressive_strength',
-    title: 'Compressive strength',
-    text: 'compressive strength member internal force causes become unsafe compression actual member force exce' +
-          'eds compressive strength member might fail compressive strength calculations performed bridge design' +
-          'er based buckling failure mode compressive strength represented symbol ϕp n measured units force kil' +
-          'onewtons abbreviated kn compressive strength calculated using following equations λ ≤ 2.25 ϕp n = ϕ ' +
-          '0.66 λ f y λ > 2.25 ϕp n = ϕ 0.88 f y ⁄ λ λ = f y al 2 ⁄ π 2 ei dimensionless parameter differentiat' +
-          'es inelastic λ ≤ 2.25 elastic λ > 2.25 buckling failure modes ϕ = 0.90 resistance factor member comp' +
-          'ression f y yield stress cross sectional area member π 3.14159.. e modulus elasticity material momen' +
-          't inertia member l length member notes tips equations taken 1994 aashto lrfd bridge design specifica' +
-          'tions see graph compressive strength function member length see member analysis report menu testing ' +
-          'bridge obtain numerical values f y e given material given cross section member size first test bridg' +
-          'e select member analysis report menu use toolbar button bridge designer calculates compressive stren' +
-          'gth member structural model load test compressive strength member always less tensile strength membe' +
-          'r relatively long slender difference quite substantial number 0.88 equation accounts fact actual str' +
-          'uctural members never perfectly straight slight crookedness actual structural members buckle interna' +
-          'l force average 12% lower theory predicts'
-  },
-  {
-    id: 'glos_concrete',
-    title: 'Concrete',
-    text: 'concrete mixture portland cement sand gravel water perhaps special additives concrete hardens forms ' +
-          'solid rock like substance used build many kinds structures'
-  },
-  {
-    id: 'glos_connections',
-    title: 'Connections',
-    text: 'connection assembly steel plates bolts and/or welds attach two members together structure connection' +
-          's real structure represented joints bridge designer structural models'
-  },
-  {
-    id: 'hlp_context_widgets',
-    title: 'Context widgets',
-    text: 'drawing board provides controls called context widgets speed work theyre invoked right clicking mous' +
-          'e location right click determines controls appear right click selected member shows dialog controls ' +
-          'support editing selected members member properties lists increase member size button decrease member' +
-          ' size button delete selection button view/hide member list button right click anywhere else shows me' +
-          'nu controls common editing needs design tools selector select button view/hide member list button gr' +
-          'id resolution buttons'
-  },
-  {
-    id: 'hlp_cost',
-    title: 'Cost of the design',
-    text: 'bridge designer automatically calculates cost bridge design create cost continuously updated display' +
-          'ed status toolbar cost calculated bridge designer accurately represent total cost actual bridge proj' +
-          'ect rather intended give general appreciation competing factors influence cost typical engineering p' +
-          'roject learning tool total cost bridge design consists two major components site cost truss cost sit' +
-          'e cost turn sum three components excavation cost deck cost support cost truss cost also includes thr' +
-          'ee components material cost connection cost product cost cost components described specific numerica' +
-          'l cost factors listed design specifications site cost site cost consists costs associated selection ' +
-          'site configuration deck height span length support configuration bridge excavation cost select deck ' +
-          'height determine amount soil must excavated achieve correct highway elevation lower deck excavation ' +
-          'required real world construction excavation priced cubic yard cubic meter bridge designer determines' +
-          ' required volume soil excavation based selected deck elevation deck cost selection deck height also ' +
-          'determines overall span length bridge higher deck results longer span increases truss cost cost rein' +
-          'forced concrete deck bridge designer also select material deck made either medium strength high stre' +
-          'ngth concrete medium strength concrete costs less high strength concrete lower strength requires dec' +
-          'k thicker thicker deck weighs thinner high strength concrete deck thus increase loading truss increa' +
-          'sed loading cause truss cost increase result cheaper deck tends require expensive truss vice versa e' +
-          'ither case cost deck specified lump sum cost 4 meter deck panel support cost select type abutments p' +
-          'iers cable anchorages used bridge bridge designer determines costs associated constructing supports ' +
-          'support configuration unique cost given type abutment standard arch cost tends increase span length ' +
-          'longer spans weigh shorter spans thus transmit greater loads supports general standard abutments cos' +
-          't less arch abutments given span length costs arch abutments piers also vary significantly height hi' +
-          'gher abutments piers use material shorter ones cost cable anchorages single lump sum cost truss cost' +
-          ' truss cost consists costs associated structural steel members connections make two main trusses pri' +
-          'ncipal load carrying elements bridge material cost structural steel normally priced weight mass e.g.' +
-          ' dollars per pound dollars per kilogram thus cost structure depends part total weight material used ' +
-          'build bridge designer calculates material cost determining total mass three available materials carb' +
-          'on steel high strength steel quenched tempered steel structural model multiplying mass material type' +
-          ' corresponding unit cost dollars per kilogram adding together get total material cost noted design s' +
-          'pecifications three different types steel different unit cost carbon steel least expensive quenched ' +
-          'tempered steel expensive given material hollow tubes expensive per kilogram solid bars connection co' +
-          'st real structures cost fabricating building connections join members together significant thus brid' +
-          'ge designer includes cost per joint part total cost structure actual three dimensional bridge two ma' +
-          'in trusses number connections used basis calculation double number joints two dimensional structural' +
-          ' model product cost structural design construction economical design often one simply minimizes mate' +
-          'rial cost often total cost structure reduced standardizing materials member sizes members structure ' +
-          'different materials sizes cost ordering fabricating constructing members relatively high many member' +
-          's fabrication construction costs relatively lower reason bridge designer includes cost per product p' +
-          'art total cost truss product defined unique combination material cross section member size structura' +
-          'l model cost calculations see cost factors cost per kilogram cost per joint cost per product site co' +
-          'st actual cost calculations current design click report cost calculations button site design wizard ' +
-          'also displays detailed calculations component site cost minimizing total cost attempt minimize total' +
-          ' cost bridge design find never minimize site cost material cost connection cost product cost simulta' +
-          'neously minimizing total cost always compromise among four competing factors minimize site cost woul' +
-          'd simply select site configuration costs least least expensive site configuration requires simply su' +
-          'pported truss spanning full 44 meters configuration require relatively heavy truss one high material' +
-          ' cost minimize material cost must make member light possibly without failing truss configurations ac' +
-          'hieving condition requires use solid bars hollow tubes wide variety different sizes minimizing mater' +
-          'ial cost requires use lot different products result product cost quite high minimize connection cost' +
-          ' must use smallest possible number joints minimize number joints inevitably long members structural ' +
-          'model long member subjected compressive loading require large member size keep failing member gets l' +
-          'onger compressive strength decreases significantly. thus minimizing connection cost usually results ' +
-          'high material cost minimize product cost would need use single material cross section size every mem' +
-          'ber structural model single member size would large enough ensure heavily loaded member structure fa' +
-          'il result many members would much stronger therefore much heavier really need material cost would ex' +
-          'tremely high clearly tradeoffs among site cost material cost connection cost product cost minimizing' +
-          ' one always increases one others task designer find best compromise'
-  },
-  {
-    id: 'hlp_crossxsection',
-    title: 'Cross-section',
-    text: 'cross section shape formed cutting member perpendicular axis cross section solid bar square measurin' +
-          'g w side cross section hollow tube open square measuring w side wall thickness cross sectional area ' +
-          'member surface area cross section picture light blue shaded region'
-  },
-  {
-    id: 'glos_cut',
-    title: 'Cut',
-    text: 'cut excavation lowers elevation roadway existing surface land'
-  },
-  {
-    id: 'hlp_truss_configuration',
-    title: 'Decide on a truss configuration',
-    text: 'design bridge go back one step go forward one step youve selected site configuration must decide ove' +
-          'rall configuration bridge bridge designer allows truss configuration long stable notes tips developi' +
-          'ng stable structural model tricky recommend new inexperienced users start standard truss configurati' +
-          'on decide use standard truss configuration load display template help correctly draw joints members'
-  },
-  {
-    id: 'glos_deck',
-    title: 'Deck',
-    text: 'deck floor bridge directly supports vehicles pedestrians crossing bridge bridge decks usually made r' +
-          'einforced concrete'
-  },
-  {
-    id: 'hlp_deck_truss',
-    title: 'Deck truss',
-    text: 'deck truss one deck located level top chord. vehicles crossing deck truss bridge supported trusses'
-  },
-  {
-    id: 'glos_deck_truss',
-    title: 'Deck truss',
-    text: 'deck truss deck located top chord vehicles supported trusses cross bridge'
-  },
-  {
-    id: 'hlp_decrease_member',
-    title: 'Decrease member size button',
-    text: 'click decrease member size button decrease size currently selected member next smaller notes tips de' +
-          'crease member size button located member properties toolbar one member selected clicking button decr' +
-          'ease size selected members even different sizes example 50mm member 90mm member 120mm member selecte' +
-          'd clicking button change 45mm 80mm 110mm respectively use decrease member size button member size li' +
-          'st updated reflect change use decrease member size button two member properties lists material cross' +
-          ' section type change'
-  },
-  {
-    id: 'hlp_delete_joint',
-    title: 'Delete a joint',
-    text: 'delete joint structural model click select tool design tools palette click joint want delete turn li' +
-          'ght blue indicate selected click delete button notes tips must working drawing board delete joint de' +
-          'lete key keyboard performs function delete button toolbar delete one joint time multiple selection j' +
-          'oints allowed delete joint members attached joint also deleted cannot delete joints created automati' +
-          'cally bridge designer started design also delete joint structural model erasing accidentally delete ' +
-          'joint click undo button restore'
-  },
-  {
-    id: 'hlp_delete_member',
-    title: 'Delete a member',
-    text: 'delete member structural model click select tool design tools palette select member want delete eith' +
-          'er clicking member clicking entry member list member turn light blue indicate selected click delete ' +
-          'button delete selected member notes tips must drawing board mode delete member want delete one membe' +
-          'r time use multiple selection click delete button delete key keyboard performs function delete butto' +
-          'n toolbar delete member members higher member numbers re numbered fill gap also remove member struct' +
-          'ural model erasing accidentally delete member click undo button restore'
-  },
-  {
-    id: 'hlp_delete',
-    title: 'Delete button',
-    text: 'click delete button delete currently selected joint delete currently selected member notes tips dele' +
-          'te button located main toolbar also available edit menu use delete key keyboard perform exactly func' +
-          'tion delete button also use eraser tool delete joints members'
-  },
-  {
-    id: 'hlp_design_specifications',
-    title: 'Design specifications',
-    text: 'specifications listed built bridge designer follow design process bridge designer ensure satisfy spe' +
-          'cifications listed better understand sorts requirements constraints engineers consider design real b' +
-          'ridges problem youre civil engineer working state department transportation assigned responsibility ' +
-          'design truss bridge carry two lane highway across river valley shown design objective satisfy specif' +
-          'ications listed keeping total cost project low possible bridge configuration bridge may cross valley' +
-          ' elevation high water level 24 meters high water level elevation bridge deck 24 meters excavation ri' +
-          'ver banks required achieve correct highway elevation amount excavation required deck elevation deter' +
-          'mined automatically bridge designer provide clearance overhead power lines shown highest point bridg' +
-          'e may exceed elevation 32.5 meters high water level 8.5 meters top river banks bridge substructure m' +
-          'ay consist either standard abutments simple supports arch abutments arch supports necessary bridge m' +
-          'ay also use one intermediate pier located near center valley necessary bridge may also use cable anc' +
-          'horages located 8 meters behind one abutments main truss 100 joints 200 members bridge flat reinforc' +
-          'ed concrete deck two types concrete available medium strength concrete requires deck thickness 23 ce' +
-          'ntimeters 0.23 meter high strength concrete requires deck thickness 15 centimeters 0.15 meter either' +
-          ' case deck supported transverse floor beams spaced 4 meter intervals see component parts truss bridg' +
-          'e information terms. accommodate floor beams structural model must row deck support joints spaced 4 ' +
-          'meters apart deck level joints created automatically begin new design bridge deck 10 meters wide all' +
-          'owing accommodate two lanes traffic member properties materials member truss made carbon steel high ' +
-          'strength low alloy steel quenched tempered steel cross sections members truss either solid bars holl' +
-          'ow tubes types cross sections square member size cross sections available variety standard sizes loa' +
-          'ds bridge must capable safely carrying following loads weight reinforced concrete deck weight 5 cm t' +
-          'hick asphalt wearing surface might applied time future weight steel floor beams supplemental bracing' +
-          ' members apply 12.0 kn load deck support joint weight main trusses weight either two possible truck ' +
-          'loadings one standard h25 truck loading per lane including appropriate allowance dynamic effects mov' +
-          'ing load since bridge carries two lanes traffic main truss must safely carry one h25 vehicle placed ' +
-          'anywhere along length deck. single 480 kn permit loading including allowance dynamic effects moving ' +
-          'load since permit loading assumed centered laterally main truss must safely carry one half total veh' +
-          'icle weight placed anywhere along length deck structural safety bridge comply structural safety prov' +
-          'isions 1994 lrfd aashto bridge design specification lrfd refers load resistance factor design. inclu' +
-          'des material densities load combinations tensile strength members compressive strength members cost ' +
-          'cost design calculated using following factors material cost carbon steel bars $4.50 per kilogram ca' +
-          'rbon steel tubes $6.30 per kilogram high strength steel bars $5.00 per kilogram high strength steel ' +
-          'tubes $7.00 per kilogram quenched tempered steel bars $5.55 per kilogram quenched tempered steel tub' +
-          'es $7.75 per kilogram connection cost $500.00 per joint product cost $1000.00 per product site cost ' +
-          'reinforced concrete deck medium strength $5 150 per 4 meter panel reinforced concrete deck high stre' +
-          'ngth $5 300 per 4 meter panel excavation $1.00 per cubic meter see site design wizard excavation vol' +
-          'ume supports abutments pier cost varies see site design wizard specific values cable anchorages $6 0' +
-          '00 per anchorage notes tips bridge designer ensures design satisfies design specifications listed dr' +
-          'awing board automatically set bridge correct span length height supports bridge designer automatical' +
-          'ly calculates loads resulting member forces run load test performs aashto structural safety checks m' +
-          'embers structural model strong enough tells ones need strengthened also calculates cost design aasht' +
-          'o safety standards simplified considerably bridge designer thats one important reason software educa' +
-          'tional use information see realistic bd'
-  },
-  {
-    id: 'hlp_design_tools',
-    title: 'Design tools palette',
-    text: 'design tools palette free floating toolbar positioned anywhere bridge design window contains followi' +
-          'ng tools creating modifying structural model joint tool member tool select tool eraser tool notes ti' +
-          'ps move design tools palette new location click drag title bar palette'
-  },
-  {
-    id: 'glos_diagonals',
-    title: 'Diagonals',
-    text: 'diagonals truss members oriented diagonally usually connect top bottom chords'
-  },
-  {
-    id: 'glos_displacement',
-    title: 'Displacement',
-    text: 'displacement movement joint occurs loads applied structure'
-  },
-  {
-    id: 'hlp_draw_joint',
-    title: 'Draw joints',
-    text: 'design bridge go back one step go forward one step create structural model must first draw joints co' +
-          'nnections structural members joined together draw joint select joint tool design tools palette posit' +
-          'ion mouse pointer location drawing board want add joint click left mouse button create new joint not' +
-          'es tips draw joint must drawing board mode joints placed snap points drawing board joints cannot pla' +
-          'ced outside maximum minimum elevation restrictions noted design specifications two joints cannot pla' +
-          'ced location accidentally place joint wrong location click undo button remove also delete joint move' +
-          ' joint new location start new design series joints created automatically project setup wizard joints' +
-          ' support deck cant moved deleted movable joints black outline light grey center immovable joints gre' +
-          'y outline white center joints create cannot attached abutments piers words cant create additional su' +
-          'pports supports permitted created automatically project setup wizard site configurations high pier j' +
-          'oints cannot drawn pier structural model limited 50 joints'
-  },
-  {
-    id: 'hlp_draw_member',
-    title: 'Draw members',
-    text: 'design bridge go back one step go forward one step drawn joints connect truss draw members make stru' +
-          'cture members must drawn joint joint draw member select member tool design tools palette position mo' +
-          'use pointer joint highlighted show ready connected click left mouse button hold drag mouse pointer a' +
-          'nother joint release button new member created first joint second notes tips draw member must drawin' +
-          'g board mode create new member member properties currently displayed member properties lists automat' +
-          'ically assigned new member changed later see change properties member information create new members' +
-          ' member numbers assigned automatically display member numbers click view member numbers button two m' +
-          'embers cannot drawn pair joints attempt draw member crosses one joints ends two members automaticall' +
-          'y created theyll properties accidentally draw member wrong location click undo button remove delete ' +
-          'member site configurations high pier members cannot drawn intermediate pier structural model 120 mem' +
-          'bers'
-  },
-  {
-    id: 'hlp_drawing_board',
-    title: 'Drawing board',
-    text: 'drawing board portion bridge design window create structural model drawing joints members mouse usin' +
-          'g drawing board also edit structural model moving adding deleting joints changing member properties ' +
-          'adding deleting members notes tips use drawing board button return drawing board load test bridge ab' +
-          'utments floor beams concrete deck asphalt road surface high water level displayed drawing board time' +
-          's see component parts truss bridge information terms. size position based site configuration youve s' +
-          'elected drawing board covered drawing grid cant see there. draw joints create structural model mouse' +
-          ' snaps grid line intersections called snap points joints drawn snap points drawing grid set low medi' +
-          'um high resolution use grid resolution buttons switch among three often easiest create structural mo' +
-          'del using low resolution grid switch medium high resolution settings editing horizontal vertical rul' +
-          'ers displayed left bottom edges drawing board help accurately position joints structural model symme' +
-          'try guides displayed drawing board help position joints structural model symmetrical title block dis' +
-          'played lower right hand corner drawing board title block shows name bridge design project name desig' +
-          'ner project identification name number designer project names changed time start new design may chos' +
-          'e display truss template drawing board help easily design stable structural model'
-  },
-  {
-    id: 'hlp_drawing_board_button',
-    title: 'Drawing board button',
-    text: 'click drawing board button return drawing board mode load test notes tips drawing board button locat' +
-          'ed main toolbar also available test menu drawing board button load test button work pair. one presse' +
-          'd time'
-  },
-  {
-    id: 'glos_drawing_grid',
-    title: 'Drawing grid',
-    text: 'drawing grid invisible set snap points drawing board lie intersections two sets parallel lines one h' +
-          'orizontal one vertical lines spaced 0.25 0.5 1.0 meters apart depending current grid resolution join' +
-          'ts located snap points grid locations indicated ticks vertical horizontal rulers located left bottom' +
-          ' edges drawing board'
-  },
-  {
-    id: 'glos_dynamic_load_allowance',
-    title: 'Dynamic load allowance',
-    text: 'dynamic load allowance factor used bridge design represent effect moving loads bridge designer uses ' +
-          'dynamic load allowance 33% means moving truck causes 33% force bridge members stationary truck'
-  },
-  {
-    id: 'hlp_erase',
-    title: 'Erase a joint or member',
-    text: 'erase joint member structural model click eraser tool design tools palette click joint member want e' +
-          'rase notes tips must drawing board mode erase joint member erase one joint member time erase joint m' +
-          'embers attached joint also erased cannot erase joints created automatically bridge designer started ' +
-          'new design erase member members higher member numbers re numbered fill gap also delete joint delete ' +
-          'member remove structural model accidentally erase joint member click undo button restore'
-  },
-  {
-    id: 'hlp_erase_tool',
-    title: 'Eraser tool',
-    text: 'use eraser tool erase joint member directly without select first notes tips eraser tool located desi' +
-          'gn tools palette also available tools menu eraser tool use mouse pointer appears pencil cross showin' +
-          'g cursor location move eraser tool drawing board joints members highlighted indicate item erased lef' +
-          't button click'
-  },
-  {
-    id: 'hlp_export_to_3dprint',
-    title: 'Export files to 3d print',
-    text: 'use 3d print button file menu item export files obj format imported 3d printer slicer program printe' +
-          'd result parts realistic scale model bridge suitable display dialog appear asking important paramete' +
-          'rs smallest printable feature size model bridge members printed scale thin print minimum feature siz' +
-          'e given millimeters used instead scale size cases one millimeter minimum larger values sacrifice sca' +
-          'le appearance slightly make printing assembly easier wiggle room 3d printers place bit much material' +
-          ' around small features like holes pegs used align model bridge parts value used adjust sizes good fi' +
-          't every printer different trial error may needed find good value 0.20mm starting point parts fit tig' +
-          'htly try larger wiggle room value vice versa scale establishes models overall size move slider try d' +
-          'ifferent values. dialog show resulting maximum object dimensions make sure maximums fit within print' +
-          'ers build volume base file name determines start obj file name containing bridge parts ready click o' +
-          'k three files sent browsers downloads folder base_file_name trusses.obj base_file_name abutments.obj' +
-          ' base_file_name cross members.obj base_file_name substituted name dialog file contains collection pi' +
-          'eces placed theyre likely fit print volume however guaranteed may want arrange print batches differe' +
-          'ntly use youre slicer software printer usual import obj files print parts item file separate object ' +
-          'obj file format slicer software let position individually delete ones dont fit single print necessar' +
-          'y sometimes splitting command required see separate objects prusa slicer example requires highlight ' +
-          'import press button multi colored bridge e.g one color trusses another cross members third deck also' +
-          ' organize objects per intended color errors kinds bridges complex export often cause short members h' +
-          'appens dialog display error notes tips bridge complex export try increasing scale far printer allows' +
-          ' example use diagonal bed described cases allow export succeed biggest pieces model usually trusses ' +
-          'goal make biggest possible model try printing trusses one time oriented diagonally printer bed minim' +
-          'um feature size consider using multiple printers nozzle size thats least one millimeter. example noz' +
-          'zle 0.4mm try 1.2 1.6 see tips assembling bridge model important details youve printed parts'
-  },
-  {
-    id: 'hlp_find_opt_substructure',
-    title: 'Find the optimum site configuration and load case',
-    text: 'design bridge go back one step go forward one step point design process optimized design one particu' +
-          'lar site configuration load case one particular combination deck height span length support configur' +
-          'ation deck material truck loading. wont know design truly optimal considered site configurations loa' +
-          'd cases bridge designer allows 98 possible site configurations consisting various combinations deck ' +
-          'elevation support type support height also four possible load cases consisting various combinations ' +
-          'deck material truck loading total cost bridge equals site cost plus truss cost site configuration su' +
-          'pports bridge different way thus different site cost load case different effect steel truss thus lik' +
-          'ely result different truss cost even though site cost makes major portion bridges total cost picking' +
-          ' configuration lowest site cost necessarily result lowest total cost site configurations low site co' +
-          'st tend relatively high truss costs vice versa site configuration high deck elevation generally rela' +
-          'tively low site cost requires little excavation yet configuration high deck elevation also greater s' +
-          'pan length longer spans require larger heavier trusses leads higher truss costs arch abutments cost ' +
-          'standard abutments tall arch abutments cost short ones thus site configurations use arches tend high' +
-          'er site cost v shape river valley allows arch abutments reduce span length given deck height taller ' +
-          'abutment shorter span arch abutments also provide lateral restraint standard abutments factors tend ' +
-          'lower truss cost arches building pier middle river quite expensive thus configurations piers signifi' +
-          'cantly higher site costs without pier also divides one long span two short ones two short trusses us' +
-          'ually much less expensive single long one cable anchorages also expensive provide additional support' +
-          ' thus reduce truss cost significantly example cable supports cable stayed bridge choice deck materia' +
-          'l affects site cost loads applied load test medium strength concrete less expensive high strength co' +
-          'ncrete results thicker deck heavier high strength concrete expensive results thinner deck lighter th' +
-          'us less expensive deck material tends result higher truss cost expensive deck material results lower' +
-          ' truss cost choice truck loading effect site cost significant effect truss cost lesson learned engin' +
-          'eering design always involves tradeoffs tradeoff cost structure cost supporting substructure critica' +
-          'lly important aspect real world bridge designs site configuration load case result lowest total cost' +
-          ' way answer question trial error combined careful logical reasoning find optimum substructure config' +
-          'uration click new design button project setup wizard displayed select one site configurations load c' +
-          'ases havent tried yet best change one variable time draw valid conclusions effect change example sup' +
-          'pose first design single span standard abutments deck height 24 meters second design might try arch ' +
-          'leave deck height 24 meters cost difference two trials directly attributed different support type ch' +
-          'ange support type deck height simultaneously wont know factors affects cost repeat previous eight st' +
-          'eps design process new site configuration load case decide truss configuration draw joints draw memb' +
-          'ers load test design strengthen unsafe members optimize member properties optimize shape truss optim' +
-          'ize truss configuration compare results two trials draw logical conclusion one variable changed seco' +
-          'nd trial particular deck height standard abutments arch abutments result lower cost large difference' +
-          ' two large might able draw general conclusion two support types two results close youll probably nee' +
-          'd trials try another site configuration load case change one characteristic second trial 4 meter hig' +
-          'h arch might use 12 meter 16 meter height next trial repeat entire design process optimize truss new' +
-          ' site configuration compare results previous trials use comparison logical basis new exploration con' +
-          'duct trials able eliminate uneconomical site configurations load cases youve eliminated one optimum'
-  },
-  {
-    id: 'hlp_try_new_configuration',
-    title: 'Find the optimum truss configuration',
-    text: 'design bridge go back one step go forward one step design iterative process achieve optimal design p' +
-          'robably need try many different truss configurations might guess millions possible configurations pr' +
-          'obably wont time try find optimum without modeling testing every possible truss configuration one ap' +
-          'proach consider alternative configurations systematic way select configuration optimize member prope' +
-          'rties carefully observe changes configuration affected cost design keep track changes produce reduct' +
-          'ions cost use observations guide selection next configuration find optimum truss configuration try d' +
-          'ifferent deck location first design deck truss try corresponding truss vice versa try different stan' +
-          'dard truss configuration example first design pratt truss try howe warren configuration try reducing' +
-          ' lengths compression members truss compressive strength member function length member gets longer co' +
-          'mpressive strength decreases substantially much less resistance buckling reason cost truss design so' +
-          'metimes reduced shortening one compression members example lets start standard warren truss top chor' +
-          'ds simple span truss bridge always compression might able reduce cost warren truss subdividing top c' +
-          'hord members like consider standard pratt truss configuration top chords verticals normally compress' +
-          'ion could subdivide top chords verticals like length compression member reduced half designer usuall' +
-          'y able use much smaller member size achieve required compressive strength note also subdivide member' +
-          ' always need add additional joints members maintain stability stable truss generally must made serie' +
-          's interconnected triangles subdivide compression member bridge designer must normally delete compres' +
-          'sion member want subdivide add new joint near midpoint member deleted add two new members replace or' +
-          'iginal member add additional members ensure stability optimize member properties new members reducin' +
-          'g length compression members may may reduce total cost design depending whether cost saving using sm' +
-          'aller member sizes enough offset increased cost additional joints members try reducing number joints' +
-          ' cost design includes fixed cost per joint thus may able reduce total cost reducing number joints st' +
-          'ructural model example consider standard howe deck truss configuration improved simply removing join' +
-          't midpoint bottom chord like delete joint three attached members deleted well need add single new me' +
-          'mber replace two bottom chord members deleted modification often effective tension members like bott' +
-          'om chord members example tensile strength function length removing joint top chord truss shown less ' +
-          'likely effective deleting top chord joint replacing two chord members one would double length compre' +
-          'ssion member making much weaker would need much larger size steel make member strong enough pass loa' +
-          'd test benefit reduced number joints would probably lost try inventing truss configuration copy conf' +
-          'iguration actual bridge examples real bridge configurations might consider trusses shown could also ' +
-          'designed deck truss notes tips youre confident place new joint exactly member divide go ahead bridge' +
-          ' designer automatically split member new joint verify watching member list otherwise use delete add ' +
-          'procedure'
-  },
-  {
-    id: 'glos_floor_beams',
-    title: 'Floor beams',
-    text: 'floor beams transverse members support bridge deck transmit loads deck joints main trusses'
-  },
-  {
-    id: 'glos_footing',
-    title: 'Footing',
-    text: 'footing base abutment pier foundation rests directly soil transmits load structure soil'
-  },
-  {
-    id: 'glos_forces',
-    title: 'Forces',
-    text: 'force push pull weight common example force force measured pounds us system measurement newtons si s' +
-          'ystem bridge designer forces kilonewtons kn'
-  },
-  {
-    id: 'glossary',
-    title: 'Glossary',
-    text: 'aashto abutment arch abutments arch supports asphalt astm b bearing bridge design file buckling c ca' +
-          'ble anchorages chords client compression concrete connections cut d deck deck truss diagonals displa' +
-          'cement drawing grid dynamic load allowance f floor beams footing forces j joints k kilonewton kn l l' +
-          'oad factors load test loads m mass density member force member numbers member properties member size' +
-          ' members modulus elasticity moment inertia p pier r reinforced concrete resistance factor safe sessi' +
-          'on simple supports site cost slope snap points span standard abutments structural analysis structura' +
-          'l model substructure supports symmetrical template tension truss u unsafe v verticals w wearing surf' +
-          'ace y yield stress yielding'
-  },
-  {
-    id: 'hlp_go_back',
-    title: 'Go back button',
-    text: 'click go back button display previous design iteration drawing board notes tips go back button locat' +
-          'ed main toolbar also available edit menu used go back button display previous design iteration use g' +
-          'o forward button display recent iteration also use go iteration button display design iteration brid' +
-          'ge designer remembers design iterations long remember work checked edit menu unchecked iterations lo' +
-          'st time browser refreshed restarted'
-  },
-  {
-    id: 'hlp_go_forward',
-    title: 'Go forward button',
-    text: 'click go forward button display recent design iteration drawing board notes tips go forward button l' +
-          'ocated main toolbar also available edit menu go forward button activated used go back button least a' +
-          'lso use go iteration button display design iteration bridge designer remembers design iterations lon' +
-          'g remember work checked edit menu unchecked iterations lost time browser refreshed restarted'
-  },
-  {
-    id: 'hlp_go_to',
-    title: 'Go to iteration button',
-    text: 'click go iteration button display design iteration browser use browser load drawing board design ite' +
-          'ration browser displayed select iteration click ok alternately double click iteration notes tips use' +
-          ' tree view tab see design iterations related go iteration button located main toolbar also available' +
-          ' edit menu design iteration browser provides preview window help select iteration actually loading d' +
-          'rawing board also display previous design iterations go back button bridge designer remembers design' +
-          ' iterations long remember work checked edit menu unchecked iterations lost time browser refreshed re' +
-          'started'
-  },
-  {
-    id: 'hlp_grid_resolution',
-    title: 'Grid resolution buttons',
-    text: 'use grid resolution buttons set resolution drawing grid drawing board covered invisible grid draw mo' +
-          've joints mouse snaps grid intersections select low medium high resolution pressing respective butto' +
-          'n low resolution setting grid 1.0 meter spacing medium high resolution 0.5 meter 0.25 meters respect' +
-          'ively notes tips grid resolution buttons located display toolbar theyre also available view menu con' +
-          'text menu click grid resolution button tick marks rulers drawing updated show corresponding grid spa' +
-          'cing often best create structural model using low resolution grid easier control joint member placem' +
-          'ent mode begin optimizing design might switch medium high resolution refine shape structural model p' +
-          'recisely always select joint use keyboard arrows move 0.25 meter increments allows small adjustments' +
-          ' regardless current grid resolution setting'
-  },
-  {
-    id: 'hlp_how_wpbd_works',
-    title: 'How the bridge designer works',
-    text: 'bridge designer intended educational purposes use bridge designer experience engineering design proc' +
-          'ess simplified form design highway bridge much way practicing civil engineers design real highway br' +
-          'idges presented requirement design steel truss bridge carry two lane highway across river may choose' +
-          ' wide variety different site configurations bridge cause bridge carry loads different way different ' +
-          'site cost develop design bridge drawing picture computer screen first design attempt complete bridge' +
-          ' designer test bridge see strong enough carry specified highway loads test includes full color anima' +
-          'tion showing truck crossing bridge design strong enough truck able cross successfully structure coll' +
-          'apse bridge collapses strengthen changing properties structural components make bridge changing conf' +
-          'iguration bridge bridge successfully carry highway loading without collapsing continue refine design' +
-          ' objective minimizing cost still ensuring strong enough carry specified loads bridge designer gives ' +
-          'complete flexibility create designs using shape configuration want creating design quick experiment ' +
-          'many different alternative configurations work toward best possible one process youll use quite simi' +
-          'lar one used practicing civil engineers design real structures indeed bridge designer quite similar ' +
-          'computer aided design cad software used practicing engineers help way cad software helps taking care' +
-          ' heavy duty mathematical calculations concentrate creative part design process good luck notes tips ' +
-          'learn bridge designer cloud edition differs earlier versions see whats new bridge designer . bridge ' +
-          'designer developed brigadier general retired stephen ressler re engineered twice open source brigadi' +
-          'er general retired eugene ressler distributed freely provisions gnu public license version 3 intende' +
-          'd solely educational use'
-  },
-  {
-    id: 'hlp_how_to',
-    title: 'How to design a bridge',
-    text: 'use bridge designer experience engineering design process simplified form design steel truss bridge ' +
-          'much way practicing civil engineers design real highway bridges objective create optimal bridge desi' +
-          'gn optimal design one satisfies design specifications passes simulated load test costs little possib' +
-          'le diagram shows effective method develop optimal design learn methodology click block diagram detai' +
-          'led description particular step or.. click browse design process one step time'
-  },
-  {
-    id: 'hlp_increase_member',
-    title: 'Increase member size button',
-    text: 'click increase member size button increase size currently selected members next larger notes tips in' +
-          'crease member size button located member properties toolbar one member selected clicking button incr' +
-          'ease size selected members even different example 50mm member 90mm member 120mm member selected clic' +
-          'king button change 55mm 100mm 130mm respectively use increase member size button member size list up' +
-          'dated reflect change use increase member size button two member properties lists material cross sect' +
-          'ion type changed'
-  },
-  {
-    id: 'hlp_joint_tool',
-    title: 'Joint tool',
-    text: 'use joint tool draw joints create structural model notes tips joint tool located design tools palett' +
-          'e also available tools menu joint tool selected mouse pointer appears cross hair'
-  },
-  {
-    id: 'glos_joints',
-    title: 'Joints',
-    text: 'joint point ends two members connected truss joint assumed act like frictionless pin hinge allows co' +
-          'nnected members rotate'
-  },
-  {
-    id: 'glos_kilonewton',
-    title: 'Kilonewton',
-    text: 'kilonewton kn measurement force si metric system kilonewton 1000 newtons equivalent 225 pounds'
-  },
-  {
-    id: 'glos_kn',
-    title: 'kN',
-    text: 'kn abbreviation kilonewton metric unit force. equivalent 225 pounds'
-  },
-  {
-    id: 'hlp_load_a_template',
-    title: 'Load and display a template',
-    text: 'bridge designer includes variety truss templates load display drawing board light gray outlines trac' +
-          'e template joints members create stable structural model load display template click load template f' +
-          'ile menu select template click ok else double click template displayed drawing board notes tips must' +
-          ' drawing board mode load template template loaded hide clicking template button toolbar view menu en' +
-          'try'
-  },
-  {
-    id: 'hlp_load_combinations',
-    title: 'Load combinations',
-    text: 'structural engineers use load combinations account fact structures often experience several differen' +
-          't types loads time example bridge must simultaneously carry weight plus weight traffic pedestrians c' +
-          'rossing it. bridge might also need carry loads caused high winds snow ice even earthquake highly unl' +
-          'ikely extreme loads occur time reason structural design codes specify several different load combina' +
-          'tions corresponds particular extreme event really heavy truck loading really strong earthquake examp' +
-          'le load combination extreme loading combined average loads might present time 1994 aashto bridge des' +
-          'ign specification requires bridge engineers check eleven different load combinations bridge design b' +
-          'ridge designer uses one total load = 1.25 w + 1.5 w w + 1.75 1 + dla w = weight structure including ' +
-          'deck structural components w w = weight asphalt wearing surface = weight aashto truck loading dla = ' +
-          'dynamic load allowance numbers 1.25 1.5 1.75 load factors notes tips fact bridge designer considers ' +
-          'one eleven different code specified load combinations one important reason software educational use ' +
-          'reasons see realistic bridge designer'
-  },
-  {
-    id: 'glos_load_factors',
-    title: 'Load factors',
-    text: 'load factor number greater one multiplied design load order represent extreme loading structure exam' +
-          'ple load factor 1.75 multiplied standard aashto h25 truck loading represent extremely heavy truck re' +
-          'presents heaviest truck might reasonably expected cross bridge lifetime different kinds loads differ' +
-          'ent load factors loads unpredictable others example weight bridge predictable weight heavy truck loa' +
-          'd factor bridge weight much lower'
-  },
-  {
-    id: 'hlp_load_template',
-    title: 'Load template',
-    text: 'click load template button load standard truss template display drawing board notes tips load templa' +
-          'te button available file menu'
-  },
-  {
-    id: 'glos_load_test',
-    title: 'Load test',
-    text: 'bridge designer load test simulation shows well design would perform built placed service load test ' +
-          'bridge subjected self weight weight standard aashto h25 truck loading. every member structural model' +
-          ' checked structural safety'
-  },
-  {
-    id: 'hlp_load_test3',
-    title: 'Load test animation',
-    text: 'load test animation graphical simulation bridge undergoing load test start animation click load test' +
-          ' button animation begins bridge subjected weight steel structural elements concrete deck asphalt wea' +
-          'ring surface self weight applied aashto h25 truck moves across bridge left right loads applied bridg' +
-          'e bends displacements bridge may exaggerated factor 10 illustrate truss members shorten elongate car' +
-          'ry load member forces increase members change color red compression blue tension intense color close' +
-          'r member failure one members found unsafe animation shows members failing bridge might look begins c' +
-          'ollapse notes tips pause rewind restart animation time using animation controls change appearance lo' +
-          'ad test animation opt show changing load test options whenever member found unsafe load test animati' +
-          'on depicts failure member either yielding buckling failure mode entirely realistic engineers always ' +
-          'build margin safety structural members margin represented load factors code specified load combinati' +
-          'ons resistance factors equations tensile strength compressive strength unsafe member might fail migh' +
-          't continue carry load reduced margin safety actual bridge possible one members fail without causing ' +
-          'total collapse structure however member found unsafe bridge designer considers design unsuccessful'
-  },
-  {
-    id: 'hlp_load_test_button',
-    title: 'Load test button',
-    text: 'click load test button load test current design notes tips load test button located main toolbar als' +
-          'o available test menu load test button drawing board button work tandem one depressed given time cli' +
-          'ck one remains depressed click exception youve turned show animation option test menu causes mode sw' +
-          'itch back drawing board immediately test complete'
-  },
-  {
-    id: 'hlp_load_test_options',
-    title: 'Load test options',
-    text: 'auto correct errors check box test menu causes bridge designer attempt identify source instability u' +
-          'nstable structural model modify load tested modifications might include deleting unattached joint me' +
-          'mber adding new required members. modifications might successful depending type extent instability s' +
-          'till best keep option switched unless theres good reason turn show animation check box test menu swi' +
-          'tched load test animation displayed every load test animation shown user returned immediately drawin' +
-          'g board mode load test exaggeration check box animation settings switched bending bridge exaggerated' +
-          ' factor 20 show clearly truss members shorten elongate carry load option displacements exaggerated m' +
-          'ember colors check box animation settings switched members change color animation show magnitude mem' +
-          'ber force red compression blue tension intense color closer member failure switched members change c' +
-          'olor animation notes tips animation starts exaggeration member colors options turned make bridge app' +
-          'ear realistic possible shadows animation tax graphics hardware computer animation slow rough turning' +
-          ' may improvement'
-  },
-  {
-    id: 'hlp_load_test_status',
-    title: 'Load test status',
-    text: 'current status design displayed icon status toolbar design always one three possible states construc' +
-          'tion structural model yet completed changed since last load test unsafe structural model load tested' +
-          ' one members strong enough safely carry specified loads safe structural model load tested members st' +
-          'rong enough safely carry specified loads notes tips anytime make change structural model status chan' +
-          'ge construction another load test run get detailed numerical results recent load test click report l' +
-          'oad test results button member list also summary'
-  },
-  {
-    id: 'hlp_run_load_test',
-    title: 'Load test your design',
-    text: 'design bridge go back one step go forward one step complete stable structural model must run simulat' +
-          'ed load test ensure members design strong enough carry loads prescribed design specification 5 load ' +
-          'test design click load test button sit back watch bridge designer perform load test display animatio' +
-          'n update load test status display walk ride test using animation controls ready click drawing board ' +
-          'button return continue work design notes tips click load test button bridge designer automatically p' +
-          'erform following actions create pin roller supports appropriate locations structural model calculate' +
-          ' weight members apply forces structure loads calculate weight concrete bridge deck asphalt wearing s' +
-          'urface floor beams see design specification 5 information apply corresponding loads structure apply ' +
-          'aashto h25 truck loading structure multiple positions representing movement truck across bridge chec' +
-          'k structural model stability structural model unstable bridge designer attempt fix problem unsuccess' +
-          'ful stop load test inform problem provide suggestions return drawing board perform structural analys' +
-          'is considering combined effects bridge self weight truck loading truck position calculate displaceme' +
-          'nt joint member force member structural model member compare calculated member forces truck position' +
-          's determine absolute maximum tension force absolute maximum compression force. critical forces deter' +
-          'mine whether given member safe calculate tensile strength compressive strength member member compare' +
-          ' absolute maximum tension force tensile strength compare absolute maximum compression force compress' +
-          'ive strength force exceeds strength either case member unsafe member safe prepare display load test ' +
-          'animation update load test status display save time run load test without displaying animation see l' +
-          'oad test options turn automatic fixing stability problems also explained'
-  },
-  {
-    id: 'glos_loads',
-    title: 'Loads',
-    text: 'loads forces applied structure highway bridge loads include weight vehicles cross bridge weight brid' +
-          'ge cases weight snow ice structure forces caused high winds earthquakes'
-  },
-  {
-    id: 'hlp_local_contest',
-    title: 'Local contest code',
-    text: 'bridge designer includes support local bridge design contests 6 character local contest code may ent' +
-          'ered design project setup wizard code causes automatic selection site conditions including load case' +
-          ' task design best possible bridge conditions future enhancement bridge designer depends suitable fun' +
-          'ding automatically produce scoreboard designs code youll manually track whos winning enter local con' +
-          'test code click new design button display project setup wizard step 2 wizard check yes enter code te' +
-          'xt box notes tips first three characters local contest code used uniquely identify contest e.g. nhs ' +
-          'northampton high school next two two digit number representing site configuration i.e. deck elevatio' +
-          'n supports final character letter b c d designating load case load case consists one two truck avail' +
-          'able loadings combined one two available concrete deck thicknesses soon valid 6 character local cont' +
-          'est code entered design project setup wizard corresponding site configuration load case displayed pr' +
-          'eview window'
-  },
-  {
-    id: 'glos_mass_density',
-    title: 'Mass density',
-    text: 'mass density material mass per unit volume mass density steel significantly higher concrete asphalt'
-  },
-  {
-    id: 'hlp_material_densities',
-    title: 'Material density',
-    text: 'density material mass per unit volume bridge designer uses material densities specified 1994 aashto ' +
-          'bridge design specifications follows reinforced concrete 2400 kg per cubic meter asphalt 2250 kg per' +
-          ' cubic meter steel types 7850 kg per cubic meter'
-  },
-  {
-    id: 'hlp_materials',
-    title: 'Materials',
-    text: 'bridge designer allows use three different materials design carbon steel common grade structural ste' +
-          'el composed primarily iron 0.26% carbon high strength low alloy steel increasingly popular structura' +
-          'l steel similar carbon steel significantly stronger higher strength attained small amounts manganese' +
-          ' columbium vanadium alloying elements added manufacturing process quenched tempered low alloy steel ' +
-          'high strength steel similar high strength low alloy steel strength increased special heat treating p' +
-          'rocess notes tips material best choice given structural design answer depends largely relative impor' +
-          'tance cost strength yield stress design carbon steel least expensive three alternatives also lowest ' +
-          'strength high strength low alloy steel somewhat expensive 40% stronger carbon steel quenched tempere' +
-          'd low alloy steel strongest expensive three three materials approximately density modulus elasticity' +
-          ' best material often varies structure structure design may use one youll need experiment determine m' +
-          'aterials best design determine numerical values yield stress mass density modulus elasticity given m' +
-          'aterial select member analysis report menu testing bridge determine costs materials check cost calcu' +
-          'lations report'
-  },
-  {
-    id: 'glos_member_force',
-    title: 'Member force',
-    text: 'member force internal force developed member result loads applied structure member force either tens' +
-          'ion compression'
-  },
-  {
-    id: 'hlp_member_list',
-    title: 'Member list',
-    text: 'member list grid optionally displayed right hand side bridge design window member list reduces space' +
-          ' available drawing board hide clicking small close button upper right make space editing structural ' +
-          'model member list following lists members current structural model lists engineering properties incl' +
-          'uding length material cross section member size slenderness ratio member provides recent load test r' +
-          'esults member allows selecting one members order edit allows sorting members grid column notes tips ' +
-          'member list load test results shown ratios member force strength compression tension ratio greater o' +
-          'ne member unsafe members unsafe tension highlighted blue unsafe compression highlighted red ratio le' +
-          'ss one member safe ratio much less one member much stronger needs probably uneconomical addition clo' +
-          'se button member list hidden restored view member list menu item select member click corresponding r' +
-          'ow member list selected member highlighted light blue member list drawing board click drag mouse but' +
-          'ton select range members alternately select range clicking one member holding shift key clicking sec' +
-          'ond member selects clicked members members select one member range hold ctrl key clicking rows membe' +
-          'r list sort member list click heading column sort example sort members length click heading length c' +
-          'olumn first time click column heading list sorted ascending order click sorted descending order thir' +
-          'd click restores default sort order number member list used efficiently optimize member properties s' +
-          'tructural model. immediately following load test sort compression load test results clicking compres' +
-          'sion force/strength column heading. list sorted safe least safe unsafe members bottom list highlight' +
-          'ed red excessively strong i.e. uneconomical members top select block members needs made larger small' +
-          'er using click drag shift key selection use increase member size button decrease member size button ' +
-          'change selected rows repeat tension load test results'
-  },
-  {
-    id: 'hlp_view_member_list',
-    title: 'Member list hide and restore',
-    text: 'member list hidden provide space drawing bridge design use close button upper right click button app' +
-          'ears place reopen notes tips view menus member list item also hides restores member list'
-  },
-  {
-    id: 'glos_member_numbers',
-    title: 'Member numbers',
-    text: 'every member structural model member number. numbers assigned order create members . physical signif' +
-          'icance member numbers used reference member properties load test results reported member number'
-  },
-  {
-    id: 'glos_member_properties',
-    title: 'Member properties',
-    text: 'properties member 1 material made 2 type cross section e.g solid tube 3 cross section size'
-  },
-  {
-    id: 'hlp_member_properties',
-    title: 'Member properties lists',
-    text: 'use three member properties lists define material cross section member size member structural model ' +
-          'choose member property click drop button reveal list items click item want member size list also upd' +
-          'ated using increase member size decrease member size buttons notes tips member properties lists loca' +
-          'ted member properties toolbar adding new members material cross section size currently displayed mem' +
-          'ber properties lists automatically assigned new member created editing structural model member prope' +
-          'rties lists used change properties currently selected members members selected member properties lis' +
-          'ts show properties used largest number members current design'
-  },
-  {
-    id: 'glos_member_size',
-    title: 'Member size',
-    text: 'size member dimensions cross section millimeters'
-  },
-  {
-    id: 'hlp_member_tool',
-    title: 'Member tool',
-    text: 'use member tool draw members create structural model notes tips member tool located design tools pal' +
-          'ette also available tools menu member tool selected mouse pointer appears pencil'
-  },
-  {
-    id: 'glos_members',
-    title: 'Members',
-    text: 'members individual structural elements make truss connected joints'
-  },
-  {
-    id: 'hlp_menu_bar',
-    title: 'Menu bar',
-    text: 'menu bar located top bridge design window immediately title bar menu bar provides following commands' +
-          ' file new design open file save file save open sample design load template print design export files' +
-          ' 3d print recently opened files exit edit select delete undo redo go back go forward go iteration in' +
-          'crease member size decrease member size remember work view design tools animation settings member li' +
-          'st rulers title block member numbers symmetry guides template grid resolution drawing tools joint to' +
-          'ol member tool select tool eraser tool test drawing board load test show animation auto correct erro' +
-          'rs report cost calculations load test results member analysis help tip day'
-  },
-  {
-    id: 'glos_modulus_of_elasticity',
-    title: 'Modulus of elasticity',
-    text: 'modulus elasticity measure materials stiffness resistance deformation material high modulus elastici' +
-          'ty deforms little loaded vice versa modulus elasticity represented symbol e expressed units force pe' +
-          'r unit area'
-  },
-  {
-    id: 'glos_moment_of_inertia',
-    title: 'Moment of inertia',
-    text: 'moment inertia measure members resistance bending buckling function shape dimensions member cross se' +
-          'ction represented symbol expressed units length raised fourth power'
-  },
-  {
-    id: 'hlp_move_joint',
-    title: 'Move a joint',
-    text: 'move joint mouse click select tool design tools palette position mouse pointer joint want move press' +
-          ' left mouse button hold move mouse pointer new joint location release button joint redrawn new locat' +
-          'ion move joint keyboard click select tool design tools palette click joint want move selected joint ' +
-          'turn light blue use arrow keys keyboard move joint desired direction 0.25 meter increments notes tip' +
-          's must drawing board mode move joint joint already members attached members automatically reposition' +
-          'ed along joint joints created automatically bridge designer start new design cannot moved cannot mov' +
-          'e one joint top another joint site configurations high pier joints cannot moved onto pier joint drag' +
-          'ged mouse joint moves increments corresponding current resolution drawing grid joint moved keyboard ' +
-          'moves 0.25 meter increments regardless current grid resolution thus keyboard technique good making s' +
-          'mall adjustments position joint'
-  },
-  {
-    id: 'hlp_multiple_selection',
-    title: 'Multiple selection of members',
-    text: 'use multiple selection change properties several members simultaneously delete several members simul' +
-          'taneously five different ways multiple selection drag box click select tool design tools palette hol' +
-          'ding left button mouse drag box around members want select release mouse button members entirely enc' +
-          'losed within box selected drag left right members completely inside box selected drag right left mem' +
-          'bers either inside box touching selected ctrl click drawing board click select tool design tools pal' +
-          'ette hold ctrl key keyboard drawing board individually click members want select ctrl click member l' +
-          'ist hold ctrl key keyboard member list individually click members want select shift click member lis' +
-          't block selection member list click one member start block. hold shift key keyboard member list clic' +
-          'k second member complete block members listed first second inclusive selected click drag member list' +
-          ' block selection member list click one member start block. drag release select desired block select ' +
-          'click select button main toolbar every member structural model selected notes tips selected members ' +
-          'turn light blue drawing board member list de select selected members click anywhere drawing board me' +
-          'mber de select single member without de selecting remaining members multiple selection hold ctrl key' +
-          ' click member want de select'
-  },
-  {
-    id: 'hlp_new_design',
-    title: 'New design button',
-    text: 'click new design button start new bridge design click button project setup wizard displayed notes ti' +
-          'ps new design button located main toolbar also available file menu'
-  },
-  {
-    id: 'hlp_open_sample_design',
-    title: 'Open a sample design',
-    text: 'bridge designer includes variety sample designs open modify load test stable truss configurations no' +
-          'ne optimized minimum cost load sample design click open sample design entry file menu select sample ' +
-          'design click ok double click sample design displayed drawing board notes tips must drawing board mod' +
-          'e load sample design current structural model saved prompted save sample design loaded'
-  },
-  {
-    id: 'hlp_open_existing',
-    title: 'Open an existing bridge design file',
-    text: 'open existing bridge design file click open file button main toolbar choose disk drive folder filena' +
-          'me want open click ok notes tips file extension bridge design files created bridge designer .bdc sor' +
-          'ry cloud edition files compatible earlier bridge designer files current design saved prompted save o' +
-          'pen file browser security makes file save restore little different applications installed computer e' +
-          'specially true firefox chrome edge chromium based browsers provide better experience'
-  },
-  {
-    id: 'hlp_open_file',
-    title: 'Open file button',
-    text: 'click open file button open existing bridge design file notes tips open file button located main too' +
-          'lbar also available file menu'
-  },
-  {
-    id: 'hlp_optimize_member_selection',
-    title: 'Optimize the member properties',
-    text: 'design bridge go back one step go forward one step structural model unsafe members design successful' +
-          ' however design optimal minimize cost first step optimizing design minimize cost current truss confi' +
-          'guration optimizing member properties material cross section member size stage design process change' +
-          ' shape configuration current structural model optimize member properties ensure understand bridge de' +
-          'signer calculates cost design particular understand trade material cost product cost minimize materi' +
-          'al cost several approaches might use minimize material cost following procedure recommended inexperi' +
-          'enced designers start using lowest cost weakest available material carbon steel members select appro' +
-          'priate cross section member usually best use solid bars tension members hollow tubes compression mem' +
-          'bers information see solid bar hollow tube use systematic trial error procedure determine smallest p' +
-          'ossible member size every member structural model starting successful design decrease size every mem' +
-          'ber next smaller available size see change properties member information. run load test member fails' +
-          ' size small change back previous larger size member safe decrease size run load test keep reducing s' +
-          'ize running load test member fails increase size one use process systematically every member structu' +
-          'ral model ensure every member small inexpensive possibly without failing finally go back check using' +
-          ' either two materials high strength steel quenched tempered steel reduce overall cost design steels ' +
-          'significantly higher yield stress carbon steel using allow reduce size members without reducing stre' +
-          'ngth high strength steel quenched tempered steel expensive dollars per kilogram carbon steel need us' +
-          'e trial error determine benefit increased strength sufficient offset greater cost high strength stee' +
-          'ls permissible use two three different materials design adjusted materials cross sections member siz' +
-          'es minimize material cost design sure run load test ensure members safe optimize based product cost ' +
-          'minimized material cost probably introduced large number different products design thus even though ' +
-          'material cost low product cost probably quite high total cost almost certainly optimum use following' +
-          ' procedure find best balance two competing cost factors check cost calculations report see many prod' +
-          'ucts currently included design particular identify products used members structural model change pro' +
-          'perties particular members match next larger next stronger available product current design example ' +
-          'suppose design includes two 40 mm solid carbon steel bars four 60 mm solid carbon steel bars change ' +
-          'two 40 mm bars 60 mm bars modification increase material cost somewhat reduce number products one mo' +
-          'dification probably reduce safety structure since making two 40 mm members stronger reduction produc' +
-          't cost exceeds increase material cost change good one reject change clicking undo button continue tr' +
-          'ial error process selectively increasing member sizes using stronger materials reduce total number p' +
-          'roducts design generally find reducing number products creates substantial cost savings first howeve' +
-          'r degree standardization increases cost savings get progressively less ultimately much standardizati' +
-          'on cause total cost design rise design minimizes total cost optimum moving next step design process ' +
-          'sure run load test one time even modifications involved making members larger increasing size member' +
-          ' makes member stronger heavier member weights increase total weight truss increases result increase ' +
-          'load member forces also increase members previously safe might become unsafe notes tips optimize mem' +
-          'ber properties efficiently taking full advantage sorting multiple selection capabilities member list'
-  },
-  {
-    id: 'hlp_optimize_configuration',
-    title: 'Optimize the shape of the truss',
-    text: 'design bridge go back one step go forward one step point design process optimized member properties ' +
-          'one specific truss configuration probably configurations result economical designs design inherently' +
-          ' iterative process achieve truly optimal design need experiment many different configurations carefu' +
-          'lly observe changes truss geometry affect cost design try totally new truss configuration first opti' +
-          'mize shape current structural model change shape truss moving one joints dragging new location mouse' +
-          ' keyboard modification easy produce significant reductions cost design optimize shape current struct' +
-          'ural model try changing depth truss example suppose started standard pratt truss current design migh' +
-          't try reducing depth might try increasing depth first glance reducing depth truss might seem like be' +
-          'tter alternative reducing depth make verticals diagonals shorter since members require less material' +
-          ' cost decrease. however reducing depth truss also causes member force top bottom chords increase thu' +
-          's probably need increase size cost top bottom chord members ensure design still passes load test inc' +
-          'rease depth truss opposite effects occur verticals diagonals get longer thus increase cost member fo' +
-          'rces top bottom chords decrease allowing use smaller less expensive members chords trade two competi' +
-          'ng factors 1 member force top bottom chords 2 length verticals diagonals every truss optimum depth r' +
-          'epresents best compromise two factors best way find optimum depth design trial error try changing ov' +
-          'erall shape truss example suppose started standard pratt truss current design try moving top chord j' +
-          'oints create rounded shape often minor adjustment reduce cost design significantly truss rounded sha' +
-          'pe member forces tend nearly equal every member top chord thus get shape right use single optimum me' +
-          'mber size entire top chord resulting substantial reduction product cost changing rounded shape also ' +
-          'effective bottom chord deck truss notes tips whenever change shape truss need repeat previous three ' +
-          'steps design process 1 run load test 2 identify strengthen unsafe members 3 optimize member properti' +
-          'es determine whether change effective reducing cost design iteration tracking feature bridge designe' +
-          'r helps track optimization steps revert previous one current one didnt work'
-  },
-  {
-    id: 'glos_pier',
-    title: 'Pier',
-    text: 'pier part bridge substructure provides intermediate support multi span bridge'
-  },
-  {
-    id: 'hlp_pinned_support',
-    title: 'Pinned support',
-    text: 'pinned support represented symbol prevents joint structural model moving horizontally vertically'
-  },
-  {
-    id: 'hlp_print_drawing',
-    title: 'Print a drawing',
-    text: 'click print button main toolbar prepare black white drawing design pdf format saved printed printer ' +
-          'notes tips printed drawing shows configuration truss annotated member numbers dimensions member prop' +
-          'erties shown tabular format bottom page'
-  },
-  {
-    id: 'hlp_print_load_test',
-    title: 'Print or copy the load test results',
-    text: 'print report recent load test ensure printer connected line click report load test results button st' +
-          'atus toolbar load test results report shown table separate window click print button follow browsers' +
-          ' printing instructions send report printer notes tips report also copied clipboard clicking copy but' +
-          'ton since data tab delimited text format pasted directly spreadsheet google sheets microsoft excel o' +
-          'thers'
-  },
-  {
-    id: 'hlp_printer',
-    title: 'Printers and printing',
-    text: 'print bridge report bridge designer creates pdf file asks browser preview send printer cases window ' +
-          'pops show printed youll need press another button send alternately download pdf chrome buttons look ' +
-          'like'
-  },
-  {
-    id: 'hlp_purposes',
-    title: 'Purposes',
-    text: 'purposes bridge designer provide opportunity learn engineering design process provide realistic hand' +
-          's experience help understand civil engineers design structures demonstrate engineers use computer to' +
-          'ol improve effectiveness efficiency design process provide tool visualizing structural behavior tool' +
-          ' help understand structures work notes tips overview software functions see bridge designer works br' +
-          'idge designer developed brigadier general retired stephen ressler subsequent versions developed brig' +
-          'adier general retired gene ressler versions distributed freely provisions gnu general public license' +
-          ' intended solely educational use'
-  },
-  {
-    id: 'hlp_record_design',
-    title: 'Record your design',
-    text: 'design bridge go back one step youve completed design record document efforts use reference future d' +
-          'esigns record final design save design bridge design file print drawing design print load test resul' +
-          'ts export files 3d print design notes tips dont wait design complete save bridge design file save ea' +
-          'rly save often case... keep remember work checked unless theres great reason bridge designer remembe' +
-          'r design even computer fails'
-  },
-  {
-    id: 'hlp_redo',
-    title: 'Redo button',
-    text: 'click redo button restore change structural model previously undone redo multiple changes clicking a' +
-          'rrow right selecting previous change notes tips redo button located main toolbar also found edit men' +
-          'u redo button works together undo button'
-  },
-  {
-    id: 'glos_reinforced_concrete',
-    title: 'Reinforced concrete',
-    text: 'reinforced concrete concrete steel rods embedded inside added strength concrete strong compression c' +
-          'omparatively weak tension reinforcing bars substantially increase ability concrete carry tension'
-  },
-  {
-    id: 'hlp_remember_my_work',
-    title: 'Remember my work',
-    text: 'bridge designer keep track work still even refresh close restart browser computer fails enable featu' +
-          're check remember work entry bottom edit menu best keep checked nearly time exception using shared l' +
-          'ogin id others computer unchecking box leave prevents seeing design'
-  },
-  {
-    id: 'hlp_report_cost',
-    title: 'Report cost calculations button',
-    text: 'click report cost calculations button show cost current design calculated report shown table printed' +
-          ' copied clipboard notes tips cost calculations report button located status toolbar next bridges cos' +
-          't also available report menu use print button make pdf file browser easily send printer use copy but' +
-          'ton send report computers clipboard formatted paste easily spreadsheet programs example google sheet' +
-          's'
-  },
-  {
-    id: 'hlp_report_load_test',
-    title: 'Report load test results button',
-    text: 'click report load test results button display detailed numerical results recent load test report sho' +
-          'wn table printed copied computers clipboard use report basis strengthening failed members optimizing' +
-          ' members structural model notes tips report load test results button located status toolbar also ava' +
-          'ilable report menu report includes following member structural model absolute maximum compression fo' +
-          'rce member kilonewtons kn compressive strength member kn compression status ok buckles absolute maxi' +
-          'mum tension force member kn tensile strength member kn tension status ok yields use print button mak' +
-          'e pdf file browser easily send printer use copy button send report computers clipboard formatted pas' +
-          'te easily spreadsheet programs example google sheets'
-  },
-  {
-    id: 'hlp_member_details',
-    title: 'Report member analysis button',
-    text: 'click report member analysis button display member analysis report interactive explorer shows detail' +
-          'ed engineering information materials cross sections sizes members current design also shows member s' +
-          'trength vs forces acted member previous load test member analysis includes material properties yield' +
-          ' stress modulus elasticity mass density cross section properties cross sectional area moment inertia' +
-          ' graph member strength vs length tension yielding compression buckling maximum member length passing' +
-          ' slenderness test also shown cost per meter member made selected material cross section size members' +
-          ' grouped material cross section use material specification menu top pick one graphs show correspondi' +
-          'ng strength vs length curve member material group data spike labeled number shown spikes except one ' +
-          'ghosts drawn pale colors pick member highlight slider labeled select member see ghost spikes entire ' +
-          'bridge rather one material group uncheck focus box members failing slenderness check close dotted ve' +
-          'rtical magenta line maximum length member material spec allowed notes tips currently selected member' +
-          ' also highlighted member list drawing board check top either force range data spike higher correspon' +
-          'ding strength member fails. otherwise carries load successfully forces range vary truck load moves a' +
-          'cross bridge force ranges may hard see forces near zero'
-  },
-  {
-    id: 'glos_resistance_factor',
-    title: 'Resistance factor',
-    text: 'resistance factor dimensionless number used calculation tensile compressive strength structural memb' +
-          'ers resistance factor provides margin safety design accounts uncertainty material strength member di' +
-          'mensions construction quality resistance factor always less equal one'
-  },
-  {
-    id: 'hlp_restrictions',
-    title: 'Restrictions on the use of Bridge Designer',
-    text: 'bridge designer intended educational use warranty kind expressed implied authors use software commer' +
-          'cial construction purposes prohibited notes tips understand bridge designer good designing real brid' +
-          'ge see realistic bd try would invite disaster destruction injury death need design real bridge must ' +
-          'obtain services registered professional civil engineer'
-  },
-  {
-    id: 'hlp_roller_support',
-    title: 'Roller support',
-    text: 'roller support represented symbol prevents joint structural model moving vertically joint still free' +
-          ' move horizontally however'
-  },
-  {
-    id: 'hlp_rulers',
-    title: 'Rulers',
-    text: 'horizontal vertical rulers displayed left bottom edges drawing board rulers allow accurately determi' +
-          'ne position mouse draw move joints structural model notes tips rulers calibrated meters marks rulers' +
-          ' show locations snap points drawing grid snap points three possible resolutions low medium high swit' +
-          'ch among grid resolution buttons measurement marks rulers reflect current setting low resolution eas' +
-          'iest new users also creating first rough version design medium fine require little skill mouse let t' +
-          'une design get lowest possible price switch among grid resolution buttons measurement marks rulers c' +
-          'hange accordingly hide display rulers using view rulers button hide rulers drawing board becomes sli' +
-          'ghtly larger help computer screen fewer pixels rulers show limits drawing grid defined design specif' +
-          'ications horizontal ruler begins zero ends specified span length vertical ruler reflects specified m' +
-          'inimum maximum elevations ground level'
-  },
-  {
-    id: 'glos_safe',
-    title: 'Safe',
-    text: 'member safe internal member force less strength member tension compression'
-  },
-  {
-    id: 'hlp_save_as',
-    title: 'Save as button',
-    text: 'click save button save current design new file name notes tips save button file menu want change fil' +
-          'e name associated current design use save file button'
-  },
-  {
-    id: 'hlp_save_file',
-    title: 'Save file button',
-    text: 'click save button save current design bridge design file saved model previously prompted file name s' +
-          'aved bridge previously clicking save button causes design saved file notes tips save button located ' +
-          'main toolbar also file menu wish save structural model new filename use save button'
-  },
-  {
-    id: 'hlp_save_your_design',
-    title: 'Save the current design',
-    text: 'time design process save current design bridge design file three different ways save design previous' +
-          'ly saved design click save file button main toolbar follow prompts provided browser previously saved' +
-          ' design want save new work click save file button previously saved design want save new file name cl' +
-          'ick save button file menu follow prompts provided browser notes tips typing ctrl shortcut selecting ' +
-          'save file button file extension bridge design files created bridge designer .bdc bridge design files' +
-          ' created bridge designer cloud edition cant read earlier versions save structural model time even in' +
-          'complete'
-  },
-  {
-    id: 'hlp_select_project',
-    title: 'Select a site configuration and load case',
-    text: 'design bridge go forward one step start bridge designer first time welcome dialog box offer followin' +
-          'g three options select create new bridge design option click ok project setup wizard displayed revie' +
-          'w design requirement familiarize project site displayed preview window click next button youre parti' +
-          'cipating local contest click yes enter local contest code. otherwise click next entered valid local ' +
-          'contest code site configuration load case automatically selected dont enter code may choose 98 site ' +
-          'configurations four load cases click next make selections site configuration site configuration cons' +
-          'ists elevation deck high water level choice standard abutments simple supports arch abutments arch s' +
-          'upports height arch abutments used choice pier pier height pier used choice zero one two cable ancho' +
-          'rages selections affects site cost displayed near bottom setup wizard see cost calculations click ar' +
-          'row lower right made selections click next select load case load case load case consists choice medi' +
-          'um strength high strength concrete deck choice two aashto h25 truck loads one traffic lane single 66' +
-          '0 kn permit loading laterally centered deck made selections may click finish complete setup go drawi' +
-          'ng board notes tips wizard finished way change site configuration load case start new design. clicki' +
-          'ng new design button display setup wizard 98 possible site configurations mentioned four possible lo' +
-          'ad cases consisting two deck materials two truck loadings overall makes 392 possible choices represe' +
-          'nts different type support loading different cost consistent design specifications total cost bridge' +
-          ' equals site cost plus truss cost picking configuration lowest site cost unlikely result lowest tota' +
-          'l cost general configurations low site cost tend require relatively high cost truss vice versa findi' +
-          'ng best balance engineers example configuration high deck elevation relatively low site cost require' +
-          's little excavation high deck elevation also greater span length requires larger heavier truss high ' +
-          'truss cost arch abutments cost standard abutments tall arch abutments cost short ones thus site conf' +
-          'igurations use arches tend higher site cost. v shape river valley arch abutments also reduce span le' +
-          'ngth given deck height taller abutment shorter span arch abutments also provide lateral restraint st' +
-          'andard abutments tend decrease truss costs building pier middle river expensive means configurations' +
-          ' piers higher site costs without pier also divides one long span two short ones two short trusses us' +
-          'ually much less expensive single long one cable anchorages also expensive provide additional support' +
-          ' e.g. cable supports cable stayed bridge reduce truss cost significantly choice deck material affect' +
-          's site cost loads applied load test medium strength concrete less expensive high strength results th' +
-          'icker deck heavier high strength concrete expensive results thinner deck lighter thus less expensive' +
-          ' deck material tends result higher truss cost expensive deck material results lower truss cost choic' +
-          'e truck loading effect site cost significant effect truss cost engineering design always involves tr' +
-          'adeoffs tradeoff cost structure cost supporting substructure critically important aspect real world ' +
-          'bridge designs site configuration load case result lowest total cost dont worry take best guess move' +
-          ' next step design process well find optimum site configuration later process'
-  },
-  {
-    id: 'hlp_select_all',
-    title: 'Select all button',
-    text: 'click select button select every member current structural model members selected change member prop' +
-          'erties simultaneously notes tips select button located main toolbar also found edit menu'
-  },
-  {
-    id: 'hlp_select_tool',
-    title: 'Select tool',
-    text: 'use select tool edit structural model need move joint delete joint change member properties delete m' +
-          'ember youll need select joint member first clicking select tool notes tips select tool located desig' +
-          'n tools palette also available tools menu select tool use mouse pointer appears arrow move select to' +
-          'ol drawing board joints members highlighted indicate pointer close enough select'
-  },
-  {
-    id: 'glos_session',
-    title: 'Session',
-    text: 'initiate new session anytime start new design load sample design open existing bridge design file wi' +
-          'thin given session design iterations preserved revert previous design iteration time session clickin' +
-          'g go back button'
-  },
-  {
-    id: 'hlp_setup_wizard',
-    title: 'Setup wizard',
-    text: 'project setup wizard automatically displayed every time start bridge designer choose create new desi' +
-          'gn display wizard time click new design button project setup wizard erase drawing board set new desi' +
-          'gn prompt read understand design requirement enter local contest code optional skip unless youre par' +
-          'ticipating local bridge design contest select deck elevation support configuration bridge select dec' +
-          'k material truck loading used design optionally select standard truss template guide design enter de' +
-          'signers name project identification name number title block step site design click next button advan' +
-          'ce click back button return previous page change selections click finish button accept selections re' +
-          'turn drawing board click cancel button reject selections return drawing board click finish button wi' +
-          'zard automatically create joints support bridge deck see design specification 3.g information also c' +
-          'reate additional supports site configuration youve selected notes tips deck elevation support config' +
-          'uration deck material choose determine site cost project cost displayed bottom setup wizard automati' +
-          'cally updated change deck elevation support configuration see details showing site cost calculated c' +
-          'lick arrow near lower right hand corner project setup wizard youve selected deck elevation support c' +
-          'onfiguration click finish button time rest setup optional'
-  },
-  {
-    id: 'hlp_show_animation',
-    title: 'Show animation check box',
-    text: 'checking menu entry tools show animation causes 3d load test animation shown immediately every load ' +
-          'test. uncheck box continue drafting immediately load test notes tips disabling animation allows quic' +
-          'ker design iterations'
-  },
-  {
-    id: 'glos_simple_supports',
-    title: 'Simple supports',
-    text: 'simple supports consist pin one end span roller end roller allows lateral expansion contraction brid' +
-          'ge due loads temperature changes bridge designer standard abutments use simple supports'
-  },
-  {
-    id: 'glos_site_cost',
-    title: 'Site cost',
-    text: 'bridge designer site cost includes cost substructure abutments piers support bridge cost concrete de' +
-          'ck site cost must added truss cost determine total project cost'
-  },
-  {
-    id: 'hlp_slenderness',
-    title: 'Slenderness check',
-    text: 'slender members difficult handle construction site. theyre easily bent buckled fabrication slenderne' +
-          'ss check reduces likelihood accidental damage occur slenderness check performed bridge designer base' +
-          'd american institute steel construction design code member passes slenderness check slenderness rati' +
-          'o l / r meets following condition l / r < 300 l length member r radius gyration member cross section' +
-          ' radius gyration r calculated moment inertia member cross sectional area member member fails slender' +
-          'ness check considered unserviceable notes tips bridge designer slenderness check performed automatic' +
-          'ally draw new member change cross section properties existing member member fails slenderness check ' +
-          'i.e. l / r greater 300 member highlighted magenta one members fail slenderness check bridge designer' +
-          ' perform load test fix member fails slenderness check decrease length increase member size given mem' +
-          'ber size hollow tubes lower l / r solid bars thus solid bar fails slenderness check might also fixed' +
-          ' changing hollow tube see maximum length member given cross section member size without failing slen' +
-          'derness check click report member properties button maximum length indicated vertical line colored m' +
-          'agenta obtain numerical values given cross section member size click report member properties button'
-  },
-  {
-    id: 'glos_slenderness',
-    title: 'Slenderness ratio',
-    text: 'slenderness ratio number describes thickness member members long comparison cross sections higher sl' +
-          'enderness ratios vice versa slender members likely buckle damaged handling slenderness check ensures' +
-          ' members slenderness ratios 300 overly slender member causes bridge fail'
-  },
-  {
-    id: 'glos_slope',
-    title: 'Slope',
-    text: 'slope roadway embankment measure steepness expressed ratio vertical horizontal distance example rive' +
-          'r bank slope 2 1 rises two meters every one meter horizontal distance'
-  },
-  {
-    id: 'glos_snap_points',
-    title: 'Snap points',
-    text: 'snap point intersection two grid lines drawing grid joints drawn snap points thus draw move joints s' +
-          'tructural model mouse pointer automatically snaps nearest one grid lines invisible locations indicat' +
-          'ed ticks vertical horizontal rulers left bottom edges drawing board'
-  },
-  {
-    id: 'hlp_bars_or_tubes',
-    title: 'Solid bar or hollow tube?',
-    text: 'optimize member properties design one important decisions make selection cross section type solid ba' +
-          'r hollow tube member structural model making decision consider effect different cross sections membe' +
-          'r strength tension compression compression members given material hollow tubes somewhat expensive so' +
-          'lid bars dollars per kilogram compared solid bar mass though hollow tube provides much larger moment' +
-          ' inertia thus hollow tube resists buckling efficiently solid bar compressive strength usually substa' +
-          'ntially greater compression members increased compressive strength tube often outweighs increased co' +
-          'st per kilogram usually economical use hollow tubes members carry load primarily compression tension' +
-          ' members given material solid bars somewhat less expensive hollow tubes dollars per kilogram however' +
-          ' tensile strength depends cross sectional area member moment inertia solid bar hollow tube mass also' +
-          ' cross sectional area therefore tensile strength since solid bar costs less hollow tube offers stren' +
-          'gth advantage tension solid bars usually better choice tension members usually economical use solid ' +
-          'bars members carry load primarily tension'
-  },
-  {
-    id: 'glos_span',
-    title: 'Span',
-    text: 'span bridge length support support'
-  },
-  {
-    id: 'glos_standard_abutments',
-    title: 'Standard abutments',
-    text: 'bridge designer standard abutments substructure elements use simple supports hold bridge transmit we' +
-          'ight soil'
-  },
-  {
-    id: 'hlp_standard_truss',
-    title: 'Standard truss configurations',
-    text: 'truss bridge deck located top chord called deck truss truss bridge deck located bottom chord called ' +
-          'truss number standard truss configurations commonly used bridge structures defined primarily geometr' +
-          'y vertical diagonal members three common configurations pictured below. named 19th century engineers' +
-          ' developed howe trusses howe truss howe deck truss pratt trusses pratt truss pratt deck truss warren' +
-          ' trusses warren truss warren deck truss regardless configuration trusses basic component parts'
-  },
-  {
-    id: 'hlp_start_new_design',
-    title: 'Start a new bridge design',
-    text: 'start new bridge design click new design button main toolbar project setup wizard displayed review d' +
-          'esign requirement click next participating local bridge design contest enter local contest code clic' +
-          'k next enter local contest code previous step site configuration automatically selected choose site ' +
-          'configuration would like use click next choose deck material determines deck thickness hence deck we' +
-          'ight also choose load configuration design want use template choose one click next desired enter nam' +
-          'e project id title block click finish notes tips chosen site configuration deck material load config' +
-          'uration click finish return drawing board immediately selecting template filling title block optiona' +
-          'l make selections deck height support configuration deck material bridge corresponding site cost aut' +
-          'omatically calculated displayed near bottom setup wizard see detailed cost calculations click arrow ' +
-          'right site cost display click finish wizard automatically create series joints level bridge deck sat' +
-          'isfy requirements design specification 3.g abutments deck wearing surface water level displayed draw' +
-          'ing board arch supports pier also created automatically included substructure selected current desig' +
-          'n saved youll prompted save start new design'
-  },
-  {
-    id: 'hlp_strengthen_failed',
-    title: 'Strengthen all unsafe members',
-    text: 'design bridge go back one step go forward one step design successful members structural model safe r' +
-          'ecent load test load test must strengthen members found unsafe determine unsafe members structural m' +
-          'odel use one following methods load test complete return drawing board look structural model member ' +
-          'highlighted red unsafe compression member highlighted blue unsafe tension members highlighted struct' +
-          'ural model safe check two load test result columns right side member list row highlighted red unsafe' +
-          ' compression highlighted blue unsafe tension strengthen unsafe member use one following methods incr' +
-          'ease member size run load test see larger member strong enough repeat member passes load test use st' +
-          'ronger material unsafe member carbon steel try high strength steel even stronger quenched tempered s' +
-          'teel run load test see new material strong enough either method changes member properties notes tips' +
-          ' best solution one makes structure strong enough support load least cost many cases increasing membe' +
-          'r size best method simply far member sizes available materials member unsafe compression using stron' +
-          'ger material may produce little increase strength compressive strength relatively slender members de' +
-          'pended yield stress material change properties unsafe member red blue highlighting disappear doesnt ' +
-          'necessarily mean member safe. true status member determined re running load test'
-  },
-  {
-    id: 'glos_structural_analysis',
-    title: 'Structural analysis',
-    text: 'structural analysis mathematical analysis structural model determine member forces resulting given s' +
-          'et loads bridge designer uses structural analysis formulation called direct stiffness method'
-  },
-  {
-    id: 'glos_structural_model',
-    title: 'Structural model',
-    text: 'structural model mathematical idealization actual structure model allows us predict actual structure' +
-          ' behave loaded structural model truss following idealized characteristics composed members interconn' +
-          'ected joints member connected exactly two joints one end joints assumed act like hinges hold members' +
-          ' together prevent rotating respect members carry axial force either compression tension bend loads a' +
-          'pplied structure joints supports placed joints'
-  },
-  {
-    id: 'hlp_structural_stability',
-    title: 'Structural stability',
-    text: 'truss stable members form rigid framework stability usually achieved making truss interconnected tri' +
-          'angles example simple truss composed six joints nine members form four interconnected triangles abf ' +
-          'bcf cef cde member cf removed however truss becomes unstable without diagonal member center panel tr' +
-          'uss consists rectangle bcef rather triangles configuration unstable nothing prevent rectangle distor' +
-          'ting parallelogram triangular arrangement members ensures truss structure rigid framework fix unstab' +
-          'le truss look panel structural model triangle add one members make notes tips trouble creating stabl' +
-          'e structural model try loading template use guide drawing joints members real bridge structure unsta' +
-          'ble collapse also turns structural analysis unstable structure mathematically impossible leads divis' +
-          'ion zero structural model unstable bridge designer detect attempt fix instability load test attempte' +
-          'd fix unsuccessful bridge designer display warning message youll return drawing board eliminate inst' +
-          'ability though trusses composed interconnected triangles possible one non triangular panels stable t' +
-          'russ particularly true complex trusses arch supports cases probably wont able tell whether truss sta' +
-          'ble looking youll need run load test'
-  },
-  {
-    id: 'glos_substructure',
-    title: 'Substructure',
-    text: 'substructure foundation bridge consists abutments piers support bridge transmit weight earth'
-  },
-  {
-    id: 'glos_supports',
-    title: 'Supports',
-    text: 'support joint structure attached foundation truss bridge two different types supports 1 pinned suppo' +
-          'rts restrain horizontal vertical movement associated joint 2 roller supports restrain vertical movem' +
-          'ent allow horizontal expansion structure'
-  },
-  {
-    id: 'glos_symmetrical',
-    title: 'Symmetrical',
-    text: 'term symmetrical apply structure loading symmetrical structure left right hand sides structure mirro' +
-          'r images symmetrical loading loads applied either side bridge centerline identical'
-  },
-  {
-    id: 'glos_template',
-    title: 'Template',
-    text: 'bridge designer template diagram depicting standard truss configuration load template displayed draw' +
-          'ing board gray template shows locate joints members create stable truss'
-  },
-  {
-    id: 'hlp_tensile_strength',
-    title: 'Tensile strength',
-    text: 'tensile strength member internal member force member becomes unsafe tension actual member force exce' +
-          'eds tensile strength member may fail bridge designer tensile strength based yielding failure mode te' +
-          'nsile strength represented symbol measured units force kilonewtons kn calculated using following equ' +
-          'ation f = 0.95 resistance factor member tension f y yield stress cross sectional area member notes t' +
-          'ips equation taken 1994 aashto lrfd bridge design specifications obtain numerical value f y given ma' +
-          'terial given cross section member size click report member properties button bridge designer calcula' +
-          'tes tensile strength member structural model load test tensile strength member always greater compre' +
-          'ssive strength member relatively long slender difference quite substantial'
-  },
-  {
-    id: 'glos_tension',
-    title: 'Tension',
-    text: 'tension internal axial member force tends <<<lengthen>>> member'
-  },
-  {
-    id: 'hlp_the_engineering',
-    title: 'The engineering design process',
-    text: 'engineering design process application math science technology create system component process meets' +
-          ' human need practice engineering design really specialized form problem solving . consider simple 7 ' +
-          'step problem solving process identify problem define problem develop alternative solutions analyze c' +
-          'ompare alternative solutions select best alternative implement solution evaluate results civil engin' +
-          'eers design bridge usually use process identify problem client hires team engineers design highway b' +
-          'ridge cross river define problem engineers investigate proposed site work client determine exactly f' +
-          'unctional requirements bridge located many lanes traffic required characteristics river width depth ' +
-          'speed current river used ships wide navigable channel much overhead clearance vessels need owns land' +
-          ' either side river sort soil rock located engineers also determine aesthetic requirements structure ' +
-          'perhaps importantly find much money client willing pay new bridge project budget develop alternative' +
-          ' solutions engineers develop several alternative concept designs new bridge perhaps truss arch suspe' +
-          'nsion bridge analyze compare alternative solutions engineers analyze design alternative determine st' +
-          'rengths weaknesses respect project requirements constraints identified step 2 also consider environm' +
-          'ental impact constructability proposed option select best alternative carefully analyzing alternativ' +
-          'es engineers select one best satisfies project requirements present selection recommendation client ' +
-          'makes final decision implement solution client approved concept design team completes final design p' +
-          'repares plans specifications hands construction contractor build evaluate results end project engine' +
-          'ers evaluate completed structure identify aspects project went well others could improved observatio' +
-          'ns help improve quality future projects design bridge bridge designer follow process identify proble' +
-          'm project design truss bridge carry two lane highway across river define problem fully define unders' +
-          'tand problem carefully read design specifications familiarize project site develop alternative solut' +
-          'ions achieve high quality design need investigate several different site configurations truss config' +
-          'urations analyze compare alternative solutions optimize alternative configuration minimum cost compa' +
-          're results select best alternative select alternative costs least still passing load test implement ' +
-          'solution finalize design record saving printing drawing printing copy load test results perhaps prin' +
-          'ting 3d model also build test cardboard model design check learning activities manual available free' +
-          ' http //bridgecontest.org/resources/file folder bridges evaluate results think learned design proces' +
-          's structural behavior designed bridge apply lessons improve efficiency effectiveness next design not' +
-          'es tips description specific procedures use design bridge bridge designer see design bridge'
-  },
-  {
-    id: 'hlp_through_truss',
-    title: 'Through truss',
-    text: 'truss one deck located level bottom chord vehicles crossing truss bridge supported two main trusses'
-  },
-  {
-    id: 'glos_through_truss',
-    title: 'Through truss',
-    text: 'truss deck located bottom chord vehicles pass two main trusses cross bridge'
-  },
-  {
-    id: 'hlp_tip_of',
-    title: 'Tip of the day',
-    text: 'tip day provides general information hints help use bridge designer covers programs advanced feature' +
-          's optimizing designs quickly effectively new tip automatically displayed every time start start fres' +
-          'h design session also view tips clicking help menu selecting tip day notes tips want see dialog ever' +
-          'y new session uncheck show tips startup box restart tips day new session click help menu tip day che' +
-          'ck show tips startup box'
-  },
-  {
-    id: 'hlp_title_bar',
-    title: 'Title bar',
-    text: 'browsers title bar tab displays words bridge designer followed name current bridge design file notes' +
-          ' tips possible run bridge designer one tab browser isnt recommended work automatically saved browser' +
-          ' local storage tab last tab closed remembered confusing resume work later'
-  },
-  {
-    id: 'hlp_titleblock',
-    title: 'Title block',
-    text: 'title block lower right hand corner drawing board shows name project name designer project id name d' +
-          'esigner optional provide included printed output notes tips project id consists two parts separated ' +
-          'dash first part local contest code entered one started design otherwise code corresponding site cond' +
-          'itions chose part project id cannot changed second part optional name number helps identify design s' +
-          'tart new design setup wizard prompt designers name project id want enter change designers name proje' +
-          'ct id begun design click appropriate box drawing boards title block cursor appears enter desired tex' +
-          't hide display title block using view title block menu entry'
-  },
-  {
-    id: 'hlp_toolbars',
-    title: 'Toolbars',
-    text: 'bridge design window includes two rows buttons menu bar theyre called toolbars also free floating to' +
-          'ol palette drawing board finally context menu dialog commonly used functions available right clickin' +
-          'g drafting panel collection includes controls needed create test optimize record bridge design edit ' +
-          'status toolbar toolbar controls creating recording bridges testing iterating design viewing reports ' +
-          'cost test results member material details new design button open file button save file button print ' +
-          'button export files 3d print button drawing board button load test button select button delete butto' +
-          'n undo controls redo controls go back iteration button go forward iteration button go iteration butt' +
-          'on current cost report cost calculations button current load test status report load test results bu' +
-          'tton report member analysis button member display properties toolbar toolbar controls choosing mater' +
-          'ials changing material sizes opting different ways display edit current design member properties lis' +
-          'ts increase member size button decrease member size button view member list button view rulers butto' +
-          'n view title block button view member numbers button view symmetry guides button view template butto' +
-          'n grid resolution buttons palettes design tools animation settings notes tips many toolbar controls ' +
-          'available quickly via context widgets'
-  },
-  {
-    id: 'hlp_truss_bridges',
-    title: 'Trusses and truss bridges',
-    text: 'truss truss arrangement structural members connected together form rigid framework trusses members a' +
-          'rranged interconnected triangles shown example result configuration truss members carry load primari' +
-          'ly axial tension compression rigid carry load efficiently trusses able span large distances minimum ' +
-          'material truss bridges trusses used extensively bridges since early 19th century early truss bridges' +
-          ' made wood. classic american covered bridges trusses though wooden truss members covered walls roof ' +
-          'protection elements later truss bridges made cast iron wrought iron modern trusses made structural s' +
-          'teel truss bridges found many different configurations virtually basic component parts many types br' +
-          'idges beam bridges arches suspension bridges cable stayed bridges'
-  },
-  {
-    id: 'hlp_undo',
-    title: 'Undo button',
-    text: 'click undo button undo recent change structural model notes tips undo button located main toolbar al' +
-          'so available edit menu undo multiple changes clicking arrow right selecting previous change undo but' +
-          'ton works conjunction redo button'
-  },
-  {
-    id: 'glos_unsafe',
-    title: 'Unsafe',
-    text: 'member unsafe internal member force exceeds strength member member unsafe tension maximum tension fo' +
-          'rce exceeds tensile strength unsafe compression maximum compression force exceeds compressive streng' +
-          'th'
-  },
-  {
-    id: 'hlp_using_undo',
-    title: 'Using undo and redo',
-    text: 'make mistake creating editing structural model click undo button undo error mistakenly undo change r' +
-          'estore using redo button undo redo multiple changes clicking respective arrow selecting previous cha' +
-          'nge notes tips following actions undone add joint member move joint change properties member delete ' +
-          'joint member move drawing labels action undone also restored using redo bridge designer allows 1000 ' +
-          'levels undo undo 1000 recent changes structural model undo changes made current design iteration rev' +
-          'ert previous design iteration use go back button detailed explanation see whats difference go back u' +
-          'ndo'
-  },
-  {
-    id: 'glos_verticals',
-    title: 'Verticals',
-    text: 'verticals truss members oriented vertically usually connect top bottom chords'
-  },
-  {
-    id: 'hlp_view_animation_settings',
-    title: 'View animation settings button',
-    text: 'show hide animation settings clicking pale gear animation controls load test animation progress alte' +
-          'rnately click animation settings button view menu notes tips wont able show animation settings drawi' +
-          'ng board use'
-  },
-  {
-    id: 'hlp_view_tools',
-    title: 'View design tools button',
-    text: 'click view design tools button view menu display hide design tools palette notes tips wont able show' +
-          ' hide design tools palette load test animation progress'
-  },
-  {
-    id: 'hlp_view_member_numbers',
-    title: 'View member numbers button',
-    text: 'click view member numbers button display hide member numbers drawing board notes tips view member nu' +
-          'mbers button located display toolbar also available view menu'
-  },
-  {
-    id: 'hlp_view_rulers',
-    title: 'View rulers button',
-    text: 'click view rulers button display hide rulers hiding increases space available draw bridge notes tips' +
-          ' view rulers button available view menu'
-  },
-  {
-    id: 'hlp_view_symmetry',
-    title: 'View symmetry guides button',
-    text: 'click view symmetry guides button display hide set two vertical one horizontal guide lines drawing b' +
-          'oard use drawing moving joints ensure structural model symmetrical move dragging handles located lef' +
-          't side bottom drawing theyre positioned joint opposite intersection shows symmetrical joint location' +
-          ' side truss notes tips view symmetry guides button located display toolbar also available view menu ' +
-          'several site configurations pier located along centerline bridge cases optimal design probably wont ' +
-          'symmetrical'
-  },
-  {
-    id: 'hlp_view_template',
-    title: 'View template button',
-    text: 'click view template button hide display current template drawing board notes tips view template butt' +
-          'on located display toolbar also available view menu whenever new template loaded view template butto' +
-          'n toggled display template always displayed behind structural model drawing board'
-  },
-  {
-    id: 'hlp_view_title',
-    title: 'View title block',
-    text: 'click view title block menu entry hide display title block notes tips computer small screen title bl' +
-          'ock interfere drawing bridge hiding fix problem'
-  },
-  {
-    id: 'glos_wearing_surface',
-    title: 'Wearing surface',
-    text: 'wearing surface layer pavement material normally asphalt concrete placed top bridge deck protect dam' +
-          'age vehicle traffic'
-  },
-  {
-    id: 'hlp_not_realistic',
-    title: 'What is  not  realistic about the Bridge Designer?',
-    text: 'one purposes bridge designer provide realistic hands experience help understand civil engineers desi' +
-          'gn real structures many aspects software accurately reflect structural design process however number' +
-          ' significant compromises made keep program getting complex bridge designer intended introduction eng' +
-          'ineering design emphasis design process rather detailed technical aspects structural design bottom l' +
-          'ine aspects bridge designer realistic important understand difference following aspects bridge desig' +
-          'ner accurately reflect process practicing civil engineers use design real bridges designing actual b' +
-          'ridge engineers must develop detailed designs cost estimates abutments piers roadway deck complete t' +
-          'hree dimensional structural system including main trusses connections concrete deck supporting steel' +
-          ' framing many secondary members engineers would also need consider environmental impact bridge effec' +
-          'ts water ice river channel integral part design bridge designer design main trusses make preliminary' +
-          ' decisions configurations roadway supports design strictly two dimensional thus account three dimens' +
-          'ional stability designing actual bridge engineers must consider effects fatigue tendency structural ' +
-          'material fail prematurely result repetitive loading caused vehicular traffic bridge designer conside' +
-          'r fatigue designing actual bridge engineers must consider many different types loading include sever' +
-          'al different forms vehicular loads self weight wind snow collision vehicles ships earthquakes must c' +
-          'onsider longitudinal lateral position vehicular loads bridge deck must also consider numerous load c' +
-          'ombinations eleven 1994 aashto bridge design specification bridge designer considers two types vehic' +
-          'ular loading self weight bridge considers longitudinal position vehicular loading lateral position d' +
-          'esigning actual bridge engineers must consider limitations deflections amount bending occurs vehicle' +
-          ' crosses bridge bridge designer calculates deflections displays load test use design criterion desig' +
-          'ning actual bridge engineers must consider many additional member failure modes considered bridge de' +
-          'signer bridge designer load test aashto truck loading represents two lanes highway traffic loading m' +
-          'oved across bridge one direction left right aashto loading heavy rear axle lighter front axle loadin' +
-          'g asymmetrical optimally bridge bridge designer might asymmetrical well however design real bridges ' +
-          'must consider movement aashto loading directions left right right left result optimally designed rea' +
-          'l world bridges generally symmetrical though bridge designer attempts accurately demonstrate cost tr' +
-          'adeoffs inherent engineering design actual costs structural materials components used software inten' +
-          'ded accurate designing actual bridge engineers must consider esthetics bridge designer include esthe' +
-          'tics design criterion though certainly set personal goal design good looking bridges important recog' +
-          'nize limitations exist equally important understand realistic bridge designer'
-  },
-  {
-    id: 'hlp_design_iteration',
-    title: 'What is a design iteration?',
-    text: 'anytime make one changes structural model run load test performed one design iteration bridge design' +
-          'er saves iterations created current session allows switching among time session notes tips switch di' +
-          'fferent design iteration click go back button go forward button go iteration button current design i' +
-          'teration number always displayed main toolbar number incremented start new iteration make first chan' +
-          'ge structural model load test design iteration numbers never duplicated associated designs never cha' +
-          'nge even revert previous iteration example suppose working iteration 10 decide go back 6 iteration n' +
-          'umber displayed toolbar change 10 6 soon make change structural model iteration number update 11 ini' +
-          'tiated new iteration iterations 1 10 remain unchanged see design iterations related using tree view ' +
-          'tab reverting previous design iteration particularly useful optimizing design optimization process s' +
-          'eldom linear always dead ends unexpected outcomes attempts successful others unsuccessful attempt si' +
-          'mply revert previous good iteration try final design iteration saved bridge design files load file d' +
-          'esign iteration browser shows iteration forward back buttons disabled'
-  },
-  {
-    id: 'hlp_realistic',
-    title: 'What is realistic about the Bridge Designer?',
-    text: 'one purposes bridge designer provide realistic hands experience help understand civil engineers desi' +
-          'gn real structures many aspects software accurately reflect structural design process however number' +
-          ' significant compromises made keep program simple bridge designer intended introduction engineering ' +
-          'design emphasis design process rather detailed technical aspects structural design result aspects br' +
-          'idge designer realistic others important understand following aspects bridge designer reflect reason' +
-          'able accuracy nature engineering design process practicing civil engineers use design real bridges d' +
-          'esign open ended process real world design problems always many possible solutions bridge designer s' +
-          'hows allowing much freedom choose refine configuration bridge though design open ended process alway' +
-          's constrained real world conditions restrictions bridge designer demonstrates limiting design three ' +
-          'ways span lengths support configurations must conform conditions project site materials member types' +
-          ' must chosen limited set minimizing cost set important goal design inherently iterative process engi' +
-          'neers usually work incomplete information must often make assumptions check revise assumptions desig' +
-          'n progresses developing high quality solution always requires engineer consider many alternatives ul' +
-          'timately select best one bridge designer clearly demonstrates aspect design process impossible achie' +
-          've truly optimal bridge design without considering many different alternative truss configurations m' +
-          'aterials cross sections member sizes design always involves trade offs usually possible find single ' +
-          'solution best satisfies design criteria making improvements one area often causes problems somewhere' +
-          ' else experience many trade offs use bridge designer example attempt optimize design discover reduci' +
-          'ng depth truss causes cost verticals diagonals decrease get shorter also causes cost top bottom chor' +
-          'ds increase member force increases larger member sizes needed preserve structural safety need find o' +
-          'ptimum balance two competing criteria structural engineering design regulated use codes codes ensure' +
-          ' engineering practiced consistent safe manner throughout country region municipality separate indust' +
-          'ry standard codes governing design steel concrete wood structures regional local building codes spec' +
-          'ify design loads fire protection standards many requirements designing buildings design highway brid' +
-          'ges us governed aashto bridge design specification bridge designer load test uses standard slightly ' +
-          'modified aashto truck loading compressive tensile strengths members computed exactly specified aasht' +
-          'o specification structures generally designed safely carry one code specified loadings minimizing co' +
-          'st also often important objective never important structural safety. cost reductions never made redu' +
-          'ctions compromise structural safety formulation bridge designer based relationship safety cost bridg' +
-          'e designer design objective minimize cost design never valid fails load test structural design often' +
-          ' characterized trade offs material cost fabrication cost construction cost structure designed minimi' +
-          'ze material cost design often include many different member types sizes variety member sizes makes h' +
-          'arder therefore expensive cut fit members fabrication assemble job site construction structural desi' +
-          'gners usually attempt achieve degree standardization selection structural elements even means design' +
-          'ing resulting increase material cost usually offset savings fabrication construction costs bridge de' +
-          'signer cost calculation simulates trade reasonably well modern structural engineering practice struc' +
-          'tural analysis generally performed using computer based method called matrix structural analysis spe' +
-          'cifically called direct stiffness method bridge designer uses method compute member forces load test' +
-          ' thats good news also important recognize bad news whats realistic bridge designer'
-  },
-  {
-    id: 'hlp_whats_new',
-    title: `What's new in the cloud edition?`,
-    text: 'welcome welcome cloud edition bridge designer millions users since 2002 bridge designer one successf' +
-          'ul educational software technologies world new edition update designed enable bridge designer learni' +
-          'ng anyone access web browser get started right introductory engineering experience working alone tea' +
-          'm team teacher new features please enjoy checking possibilities.. installation required bridge desig' +
-          'ner works recent versions browsers hit web site versions chrome edge firefox 2024 later recommended ' +
-          'export 3d model design addition beautiful blueprint style printed version bridge long part bridge de' +
-          'signer export obj files suitable favorite 3d printer member analysis report upgrade old member detai' +
-          'ls tab interactive explorer supplements members list dynamically updated engineering information mem' +
-          'ber cross sections materials lengths costs forces strength use dig deep makes bridge work late updat' +
-          'es previous bridge designer versions still 3d walk completed bridges walk fly around animation compl' +
-          'eted bridge observe performance truck load drives deck deep undo old limit 5 1000 undo redo last tho' +
-          'usand edits current design iteration iterations tree view track design iterations view shows history' +
-          ' one chronological list still click drag member list selections click drag select group members memb' +
-          'er list'
-  },
-  {
-    id: 'hlp_undo_vs_go_back',
-    title: `What's the difference between undo and go back?`,
-    text: 'first glance go back undo buttons might appear thing really use undo correct mistakes working curren' +
-          't design iteration use go back revert previous design iteration go back normally used optimize bridg' +
-          'e undo available 1000 recent changes structural model go back previous design iteration created curr' +
-          'ent session undo applies current design iteration disabled whenever go back previous iteration undo ' +
-          'enabled soon make new changes structural model'
-  },
-  {
-    id: 'glos_yield_stress',
-    title: 'Yield stress',
-    text: 'yield stress strength metal force per unit area metal fails yielding'
-  },
-  {
-    id: 'glos_yielding',
-    title: 'Yielding',
-    text: 'yielding one possible failure mode member made metal metallic material fails yielding undergoes larg' +
-          'e deformations i.e. stretches without able carry additional load'
-  },
-];
+export type HelpSearchIndex = {
+  topics: { id: string, title: string }[],
+  // Sorted terms of all fields separated by spaces.
+  terms: string,
+  fields: { title: HelpSearchField, text: HelpSearchField },
+  // Best topics of word prefixes beginning several terms, separated by semicolons. Each is the base 36 start and
+  // end of the range of terms the prefixes begin separated by a comma, then a colon and comma-separated base 36
+  // topic indices, best first.
+  typeahead: string,
+};
+
+export const HELP_SEARCH_INDEX: HelpSearchIndex = {
+  topics: [
+    { id: 'glos_aashto', title: 'AASHTO' },
+    { id: 'hlp_aashto_h20x44', title: 'AASHTO H25 truck loading' },
+    { id: 'hlp_browser', title: 'About your browser...' },
+    { id: 'glos_abutment', title: 'Abutment' },
+    { id: 'hlp_animation_controls', title: 'Animation controls' },
+    { id: 'hlp_animation_settings', title: 'Animation settings' },
+    { id: 'glos_arch_abutments', title: 'Arch abutments' },
+    { id: 'glos_arch_supports', title: 'Arch supports' },
+    { id: 'glos_asphalt', title: 'Asphalt' },
+    { id: 'hlp_3dprint_assembly', title: 'Assembling your bridge model' },
+    { id: 'glos_astm', title: 'ASTM' },
+    { id: 'hlp_auto_correct_errors', title: 'Auto-correct errors check box' },
+    { id: 'glos_bearing', title: 'Bearing' },
+    { id: 'glos_bridge_design_file', title: 'Bridge design file' },
+    { id: 'hlp_bridge_design_window', title: 'Bridge design window' },
+    { id: 'glos_buckling', title: 'Buckling' },
+    { id: 'glos_cable_anchorages', title: 'Cable anchorages' },
+    { id: 'hlp_change_member_properties', title: 'Change the properties of a member' },
+    { id: 'hlp_choose_optimum', title: 'Choose the optimum design' },
+    { id: 'glos_chords', title: 'Chords' },
+    { id: 'glos_client', title: 'Client' },
+    { id: 'hlp_component_parts', title: 'Component parts of a truss bridge' },
+    { id: 'glos_compression', title: 'Compression' },
+    { id: 'hlp_compressive_strength', title: 'Compressive strength' },
+    { id: 'glos_concrete', title: 'Concrete' },
+    { id: 'glos_connections', title: 'Connections' },
+    { id: 'hlp_context_widgets', title: 'Context widgets' },
+    { id: 'hlp_cost', title: 'Cost of the design' },
+    { id: 'hlp_crossxsection', title: 'Cross-section' },
+    { id: 'glos_cut', title: 'Cut' },
+    { id: 'hlp_truss_configuration', title: 'Decide on a truss configuration' },
+    { id: 'glos_deck', title: 'Deck' },
+    { id: 'hlp_deck_truss', title: 'Deck truss' },
+    { id: 'glos_deck_truss', title: 'Deck truss' },
+    { id: 'hlp_decrease_member', title: 'Decrease member size button' },
+    { id: 'hlp_delete_joint', title: 'Delete a joint' },
+    { id: 'hlp_delete_member', title: 'Delete a member' },
+    { id: 'hlp_delete', title: 'Delete button' },
+    { id: 'hlp_design_specifications', title: 'Design specifications' },
+    { id: 'hlp_design_tools', title: 'Design tools palette' },
+    { id: 'glos_diagonals', title: 'Diagonals' },
+    { id: 'glos_displacement', title: 'Displacement' },
+    { id: 'hlp_draw_joint', title: 'Draw joints' },
+    { id: 'hlp_draw_member', title: 'Draw members' },
+    { id: 'hlp_drawing_board', title: 'Drawing board' },
+    { id: 'hlp_drawing_board_button', title: 'Drawing board button' },
+    { id: 'glos_drawing_grid', title: 'Drawing grid' },
+    { id: 'glos_dynamic_load_allowance', title: 'Dynamic load allowance' },
+    { id: 'hlp_erase', title: 'Erase a joint or member' },
+    { id: 'hlp_erase_tool', title: 'Eraser tool' },
+    { id: 'hlp_export_to_3dprint', title: 'Export files to 3d print' },
+    { id: 'hlp_find_opt_substructure', title: 'Find the optimum site configuration and load case' },
+    { id: 'hlp_try_new_configuration', title: 'Find the optimum truss configuration' },
+    { id: 'glos_floor_beams', title: 'Floor beams' },
+    { id: 'glos_footing', title: 'Footing' },
+    { id: 'glos_forces', title: 'Forces' },
+    { id: 'glossary', title: 'Glossary' },
+    { id: 'hlp_go_back', title: 'Go back button' },
+    { id: 'hlp_go_forward', title: 'Go forward button' },
+    { id: 'hlp_go_to', title: 'Go to iteration button' },
+    { id: 'hlp_grid_resolution', title: 'Grid resolution buttons' },
+    { id: 'hlp_how_wpbd_works', title: 'How the bridge designer works' },
+    { id: 'hlp_how_to', title: 'How to design a bridge' },
+    { id: 'hlp_increase_member', title: 'Increase member size button' },
+    { id: 'hlp_joint_tool', title: 'Joint tool' },
+    { id: 'glos_joints', title: 'Joints' },
+    { id: 'glos_kilonewton', title: 'Kilonewton' },
+    { id: 'glos_kn', title: 'kN' },
+    { id: 'hlp_load_a_template', title: 'Load and display a template' },
+    { id: 'hlp_load_combinations', title: 'Load combinations' },
+    { id: 'glos_load_factors', title: 'Load factors' },
+    { id: 'hlp_load_template', title: 'Load template' },
+    { id: 'glos_load_test', title: 'Load test' },
+    { id: 'hlp_load_test3', title: 'Load test animation' },
+    { id: 'hlp_load_test_button', title: 'Load test button' },
+    { id: 'hlp_load_test_options', title: 'Load test options' },
+    { id: 'hlp_load_test_status', title: 'Load test status' },
+    { id: 'hlp_run_load_test', title: 'Load test your design' },
+    { id: 'glos_loads', title: 'Loads' },
+    { id: 'hlp_local_contest', title: 'Local contest code' },
+    { id: 'glos_mass_density', title: 'Mass density' },
+    { id: 'hlp_material_densities', title: 'Material density' },
+    { id: 'hlp_materials', title: 'Materials' },
+    { id: 'glos_member_force', title: 'Member force' },
+    { id: 'hlp_member_list', title: 'Member list' },
+    { id: 'hlp_view_member_list', title: 'Member list hide and restore' },
+    { id: 'glos_member_numbers', title: 'Member numbers' },
+    { id: 'glos_member_properties', title: 'Member properties' },
+    { id: 'hlp_member_properties', title: 'Member properties lists' },
+    { id: 'glos_member_size', title: 'Member size' },
+    { id: 'hlp_member_tool', title: 'Member tool' },
+    { id: 'glos_members', title: 'Members' },
+    { id: 'hlp_menu_bar', title: 'Menu bar' },
+    { id: 'glos_modulus_of_elasticity', title: 'Modulus of elasticity' },
+    { id: 'glos_moment_of_inertia', title: 'Moment of inertia' },
+    { id: 'hlp_move_joint', title: 'Move a joint' },
+    { id: 'hlp_multiple_selection', title: 'Multiple selection of members' },
+    { id: 'hlp_new_design', title: 'New design button' },
+    { id: 'hlp_open_sample_design', title: 'Open a sample design' },
+    { id: 'hlp_open_existing', title: 'Open an existing bridge design file' },
+    { id: 'hlp_open_file', title: 'Open file button' },
+    { id: 'hlp_optimize_member_selection', title: 'Optimize the member properties' },
+    { id: 'hlp_optimize_configuration', title: 'Optimize the shape of the truss' },
+    { id: 'glos_pier', title: 'Pier' },
+    { id: 'hlp_pinned_support', title: 'Pinned support' },
+    { id: 'hlp_print_drawing', title: 'Print a drawing' },
+    { id: 'hlp_print_load_test', title: 'Print or copy the load test results' },
+    { id: 'hlp_printer', title: 'Printers and printing' },
+    { id: 'hlp_purposes', title: 'Purposes' },
+    { id: 'hlp_record_design', title: 'Record your design' },
+    { id: 'hlp_redo', title: 'Redo button' },
+    { id: 'glos_reinforced_concrete', title: 'Reinforced concrete' },
+    { id: 'hlp_remember_my_work', title: 'Remember my work' },
+    { id: 'hlp_report_cost', title: 'Report cost calculations button' },
+    { id: 'hlp_report_load_test', title: 'Report load test results button' },
+    { id: 'hlp_member_details', title: 'Report member analysis button' },
+    { id: 'glos_resistance_factor', title: 'Resistance factor' },
+    { id: 'hlp_restrictions', title: 'Restrictions on the use of Bridge Designer' },
+    { id: 'hlp_roller_support', title: 'Roller support' },
+    { id: 'hlp_rulers', title: 'Rulers' },
+    { id: 'glos_safe', title: 'Safe' },
+    { id: 'hlp_save_as', title: 'Save as button' },
+    { id: 'hlp_save_file', title: 'Save file button' },
+    { id: 'hlp_save_your_design', title: 'Save the current design' },
+    { id: 'hlp_select_project', title: 'Select a site configuration and load case' },
+    { id: 'hlp_select_all', title: 'Select all button' },
+    { id: 'hlp_select_tool', title: 'Select tool' },
+    { id: 'glos_session', title: 'Session' },
+    { id: 'hlp_setup_wizard', title: 'Setup wizard' },
+    { id: 'hlp_show_animation', title: 'Show animation check box' },
+    { id: 'glos_simple_supports', title: 'Simple supports' },
+    { id: 'glos_site_cost', title: 'Site cost' },
+    { id: 'hlp_slenderness', title: 'Slenderness check' },
+    { id: 'glos_slenderness', title: 'Slenderness ratio' },
+    { id: 'glos_slope', title: 'Slope' },
+    { id: 'glos_snap_points', title: 'Snap points' },
+    { id: 'hlp_bars_or_tubes', title: 'Solid bar or hollow tube?' },
+    { id: 'glos_span', title: 'Span' },
+    { id: 'glos_standard_abutments', title: 'Standard abutments' },
+    { id: 'hlp_standard_truss', title: 'Standard truss configurations' },
+    { id: 'hlp_start_new_design', title: 'Start a new bridge design' },
+    { id: 'hlp_strengthen_failed', title: 'Strengthen all unsafe members' },
+    { id: 'glos_structural_analysis', title: 'Structural analysis' },
+    { id: 'glos_structural_model', title: 'Structural model' },
+    { id: 'hlp_structural_stability', title: 'Structural stability' },
+    { id: 'glos_substructure', title: 'Substructure' },
+    { id: 'glos_supports', title: 'Supports' },
+    { id: 'glos_symmetrical', title: 'Symmetrical' },
+    { id: 'glos_template', title: 'Template' },
+    { id: 'hlp_tensile_strength', title: 'Tensile strength' },
+    { id: 'glos_tension', title: 'Tension' },
+    { id: 'hlp_the_engineering', title: 'The engineering design process' },
+    { id: 'hlp_through_truss', title: 'Through truss' },
+    { id: 'glos_through_truss', title: 'Through truss' },
+    { id: 'hlp_tip_of', title: 'Tip of the day' },
+    { id: 'hlp_title_bar', title: 'Title bar' },
+    { id: 'hlp_titleblock', title: 'Title block' },
+    { id: 'hlp_toolbars', title: 'Toolbars' },
+    { id: 'hlp_truss_bridges', title: 'Trusses and truss bridges' },
+    { id: 'hlp_undo', title: 'Undo button' },
+    { id: 'glos_unsafe', title: 'Unsafe' },
+    { id: 'hlp_using_undo', title: 'Using undo and redo' },
+    { id: 'glos_verticals', title: 'Verticals' },
+    { id: 'hlp_view_animation_settings', title: 'View animation settings button' },
+    { id: 'hlp_view_tools', title: 'View design tools button' },
+    { id: 'hlp_view_member_numbers', title: 'View member numbers button' },
+    { id: 'hlp_view_rulers', title: 'View rulers button' },
+    { id: 'hlp_view_symmetry', title: 'View symmetry guides button' },
+    { id: 'hlp_view_template', title: 'View template button' },
+    { id: 'hlp_view_title', title: 'View title block' },
+    { id: 'glos_wearing_surface', title: 'Wearing surface' },
+    { id: 'hlp_not_realistic', title: 'What is  not  realistic about the Bridge Designer?' },
+    { id: 'hlp_design_iteration', title: 'What is a design iteration?' },
+    { id: 'hlp_realistic', title: 'What is realistic about the Bridge Designer?' },
+    { id: 'hlp_whats_new', title: `What's new in the cloud edition?` },
+    { id: 'hlp_undo_vs_go_back', title: `What's the difference between undo and go back?` },
+    { id: 'glos_yield_stress', title: 'Yield stress' },
+    { id: 'glos_yielding', title: 'Yielding' },
+  ],
+  terms: '0 00 000 1 10 100 1000 100mm 11 110mm 12 120 1200 120mm 130mm 14159 15 150 16 181 1994 19th 2 20 200' +
+         ' 2002 2024 20mm 220 225 2250 23 24 240 2400 25 26 3 30 300 32 33 392 3d 4 40 44 45mm 480 4mm 5 50 50' +
+         '0 50mm 55 55mm 6 60 66 660 7 75 7850 8 800 80mm 88 9 90 90mm 95 98 a aashto abbreviated abbreviation' +
+         ' abf ability able about absolute abutment abutments accept access accidental accidentally accommodat' +
+         'e accordingly account accounts accuracy accurate accurately achieve achieved achieving across act ac' +
+         'ted action actions activated activities acts actual actually add added adding addition additional ad' +
+         'ditives adhesion adjust adjusted adjustment adjustments advance advanced advantage aesthetic aesthet' +
+         'ics affect affected affects ahead aided al align all allow allowance allowed allowing allows alloy a' +
+         'lloying almost alone along already also alternately alternative alternatives always american among a' +
+         'mount amounts an analysis analyze analyzing anchorage anchorages anchored and animation animations a' +
+         'nnotated another answer anyone anytime anywhere apart appear appearance appears apple application ap' +
+         'plications applied applies apply applying appreciation approach approaches appropriate approved appr' +
+         'oximately arch arches area around arrange arranged arrangement arranging arrow arrows as ascending a' +
+         'side asking asks aspect aspects asphalt assemble assembled assembling assembly assigned associated a' +
+         'ssociation assume assumed assumptions astm asymmetrical attach attache attached attachment attained ' +
+         'attempt attempted attempts attributed authors auto auto-correct automatic automatically availability' +
+         ' available average avoid away axial axially axis axle axles b back background bad bag balance ball b' +
+         'ank banks bar bars base base_file_name based basic basis batches bcef bcf bd bdc beam beams bearing ' +
+         'beautiful become becomes bed begin begins begun behave behavior behind below bend bending bends bene' +
+         'fit bent best better between big biggest bit bitumen black blade block blue blueprint board boards b' +
+         'ody bolts bond bottom box boxes bracing break bride bridge bridgecontest bridges brigadier brighter ' +
+         'brightness brims broad browse browser browsers buckle buckled buckles buckling budget build building' +
+         ' buildings built button buttons c cable cables cad calculate calculated calculates calculation calcu' +
+         'lations calibrated called cancel cannot cant capabilities capable carbon cardboard care careful care' +
+         'fully cargo carries carry carrying cartoon case cases cast casts catastrophic cause caused causes ca' +
+         'using cde cef cement center centered centerline centimeters century certainly cf challenging chance ' +
+         'chances change changed changes changing channel character characteristic characteristics characteriz' +
+         'ed characters cheaper check checked checking checks choice choices choose choosing chord chords chos' +
+         'e chosen chrome chromium chronological civil classic clean clearance clearly click clicked clicking ' +
+         'client clipboard close closed closer cloud clouds cm code codes collapse collapses collapsing collec' +
+         'tion collision color colored colors columbium column columns combination combinations combined comma' +
+         'nd commands commercial common commonly comparatively compare compared comparison compatible competin' +
+         'g complained complete completed completely completes complex comply component components composed co' +
+         'mpressed compression compressive compromise compromises compute computed computer computers computin' +
+         'g concentrate concept conclusion conclusions concrete condition conditions conduct confident configu' +
+         'ration configurations conform confusing confusion conjunction connect connected connection connectio' +
+         'ns consider considerably considered considering considers consist consistent consisting consists con' +
+         'strained constraints constructability constructing construction consumers containing contains contes' +
+         't contests context continue continuously contraction contractor control controls copied copy corner ' +
+         'correct correction correctly corresponding corresponds cost costs could country covered covering cov' +
+         'ers crafty crazy create created creates creating creative criteria criterion critical critically cro' +
+         'okedness cross cross-section crosses crossing css ctrl cubic current currently cursor curve cut cutt' +
+         'er cutting cyanoacrylate d damage damaged darker dash data date day de dead death decide decision de' +
+         'cisions deck decks decrease decreases deep default define defined deflections deformation deformatio' +
+         'ns deforms degree delete deleted deleting delimited demonstrate demonstrates densities density depar' +
+         'tment depended depending depends depicted depicting depicts depressed depth descending described des' +
+         'cribes description design designating designed designer designers designing designs desirable desire' +
+         'd despite destruction detailed details detect determine determined determines determining develop de' +
+         'veloped developing device devices diagonal diagonally diagonals diagram dialog diameter didnt differ' +
+         'ence differences different differentiates differently differs difficult dig digit dimensional dimens' +
+         'ionless dimensions direct direction directions directly disabled disabling disappear disaster discov' +
+         'er disk displacement displacements display displayed displaying displays distance distances distorti' +
+         'ng distributed divide divides division dla doctor document doesnt dollars done dont dotted double do' +
+         'wnload downloads drafting drag dragged dragging draw drawing drawn drill drive driver drives drop dr' +
+         'y due duplicated duty dynamic dynamically e earlier early earth earthquake earthquakes ease easier e' +
+         'asiest easily easy economical edge edges edit editing edition edits educational effect effective eff' +
+         'ectively effectiveness effects efficiency efficiently efforts ei eight either elastic elasticity ele' +
+         'ments elevation elevations eleven eliminate eliminated elongate else embankment embankments embedded' +
+         ' emphasis enable enabled enclosed end ended ends engineer engineered engineering engineers enhanceme' +
+         'nt enjoy enough ensure ensures ensuring enter entered entire entirely entry environment environmenta' +
+         'l equal equally equals equation equations equivalent erase erased eraser erasing error errors especi' +
+         'ally establishes esthetics estimates eugene evaluate even event every exactly exaggerated exaggerati' +
+         'on example examples excavated excavation exceed exceeds excel except exception excessive excessively' +
+         ' exist existing exit expand expansion expected expensive experience experiment explained explanation' +
+         ' exploration explorer export exporting expressed extend extension extensively extent extra extreme e' +
+         'xtremely f fabricating fabrication fact factor factors faded fail failed failing fails failure famil' +
+         'iarize far farther fatigue favorite feature features feeling fewer file filename files fill filling ' +
+         'final finalize finally find finding fine finish finished fire firefox first fit fits fitted five fix' +
+         ' fixed fixing flat flattened flexibility floating floor fly focus folder follow followed following f' +
+         'ollows footing force forces form format formatted formed forms formulation forward found foundation ' +
+         'four fourth framework framing free freedom freely fresh frictionless front full fully function funct' +
+         'ional functions funding future g gadget gap gaps gear gene general generally generated generator geo' +
+         'metry get gets getting ghost ghosts give given gives glance glossary glue gluing gnu go goal goes go' +
+         'ing good google governed governing government grade graph graphical graphics graphs gravel gray grea' +
+         't greater greatest grey grid grit ground group grouped guaranteed guess guide guides gusset gyration' +
+         ' h25 hair half hand handle handles handling hands happens hard hardens harder hardware harm havent h' +
+         'ead heading heat heavier heaviest heavily heavy height help helps hence hidden hide hides hiding hig' +
+         'h higher highest highlight highlighted highlighting highly highway hills hinge hinges hints hires hi' +
+         'story hit hold holding hole holes hollow home horizon horizontal horizontally how howe however html ' +
+         'http human hypothetical i ice icon icons id ideal idealization idealized identical identification id' +
+         'entified identify illustrate illustrated image images immediately immovable impact implement implied' +
+         ' import importance important importantly imported impossible improve improved improvement improvemen' +
+         'ts in inches include included includes including inclusive incomplete increase increased increases i' +
+         'ncreasing increasingly incremented increments indeed independently indicate indicated individual ind' +
+         'ividually industry inelastic inertia inevitably inexpensive inexperienced influence inform informati' +
+         'on inherent inherently initiate initiated injury inside insides instability installation installed i' +
+         'nstalling instead institute instructions integral intended intense interactive interconnected interf' +
+         'ere intermediate internal intersection intersections intervals introduced introduction introductory ' +
+         'inventing investigate invisible invite invoked involved involves iron is isnt it item items iteratin' +
+         'g iteration iterations iterative j jerky job join joined joint joints k keep keeping key keyboard ke' +
+         'ys kg kilogram kilonewton kilonewtons kind kinds kn knife know l label labeled labels land lane lane' +
+         's large largely larger largest last late later lateral laterally latest lawyer layer laying leads le' +
+         'arn learned learning least leave left leftmost length lengthen lengths less lesson lessons let lets ' +
+         'letter level levels license lie lifetime light lighter like likelihood likely limit limitations limi' +
+         'ted limiting limits line linear lines list listed lists little load loaded loading loadings loads lo' +
+         'cal locate located location locations logical login long longer longitudinal look looking looks lost' +
+         ' lot low lower lowers lowest lrfd luck lump m made magenta magnitude main maintain maintenance major' +
+         ' make makes making manganese manner manual manually manufacturers manufacturing many margin marks ma' +
+         'ss massive match material materials math mathematical mathematically matrix maximized maximum maximu' +
+         'ms may mean means measure measured measurement measuring medium meets member members mentioned menu ' +
+         'menus message metal metallic meter meters method methodical methodology methods metric micro microso' +
+         'ft mid middle midpoint might millimeter millimeters millions minimize minimized minimizes minimizing' +
+         ' minimum minor mirror missing mistake mistakenly mistakes mixture mm mode model modeling models mode' +
+         'rn modes modification modifications modified modify modifying modulus moment money motion mouse mova' +
+         'ble move moved movement moves moving much multi multiple multiplied multiplying municipality must my' +
+         ' n nail name named names nature navigable near nearest nearly necessarily necessary need needed need' +
+         'le needs never new news newtons next nhs nine non none normally northampton not note noted notes not' +
+         'hing notified nozzle number numbered numbers numerical numerous obj object objective objects observa' +
+         'tions observe obtain occur occurs of offer offers officials offs offset often ok okay old on one one' +
+         's onto open opened opera operating opportunity opposite opt optimal optimally optimization optimize ' +
+         'optimized optimizing optimum opting option optional optionally options or order ordering org organiz' +
+         'ation organize oriented original others otherwise outcomes outline outlines output outside outweighs' +
+         ' overall overhead overly overview owns p pad pads page pair pale palette palettes pan panel panels p' +
+         'aper parallel parallelogram parameter parameters part participating particular particularly parts pa' +
+         'ss passes passing paste pasted patient pause pavement pay pdf pedestrians pegs pencil per perfectly ' +
+         'perform performance performed performs perhaps permissible permit permitted perpendicular person per' +
+         'sonal petroleum phones physical pick picking picture pictured pieces pier piers pillow pillows pin p' +
+         'inned pins pixels place placed placement plans plastic plates play please plus point pointer pointin' +
+         'g points poorly pops popular portion portland position positioned positions possibilities possible p' +
+         'ossibly pound pounds power practice practiced practicing pratt precisely predict predictable predict' +
+         's preliminary prematurely prepare prepares prescribed present presented preserve preserved press pre' +
+         'ssed pressing prevent prevents preview previous previously price priced primarily principal print pr' +
+         'intable printed printer printers printing prior pro probably problem problems procedure procedures p' +
+         'roceeds process processor produce product production products professional profit program programs p' +
+         'rogress progresses progressively prohibited project projects prompt prompted prompts properties prop' +
+         'erty proposed protect protected protection provide provided provides provisions prusa public publish' +
+         'es pull pure purpose purposes push qty quality quenched question quick quicker quickly quit quite r ' +
+         'radius raised range ranges rather ratio ratios razor re read ready real realistic really rear reason' +
+         ' reasonable reasonably reasoning reasons recent recently recognize recommend recommendation recommen' +
+         'ded record recording rectangle red redo redrawn reduce reduced reduces reducing reduction reductions' +
+         ' ref reference refers refine refining reflect reflects refresh refreshed regardless region regional ' +
+         'registered regulated reinforced reinforcing reject related relationship relative relatively release ' +
+         'remain remaining remains remember remembered remembers remove removed removing reopen repairs repeat' +
+         ' repetitive replace replacing report reported reports repositioned represent represented representin' +
+         'g represents reprint require required requirement requirements requires researchers resistance resis' +
+         'ts resolution resolutions resources respect respective respectively responsibility ressler rest rest' +
+         'art restarted restore restored restores restrain restraint restrictions rests result resulting resul' +
+         'ts resume retaining retired return returned reveal revert reverting review revise rewind ride right ' +
+         'rigid rise rises river road roadway rock rods roller roof room rotate rotating rough rounded row row' +
+         's ruler rulers run running sacrifice safari safe safely safety sample sand sandpaper satisfies satis' +
+         'fy satisfying save saved saves saving savings scale scene school science scoreboard screen second se' +
+         'condary section sectional sections security see seeing seem seldom select selected selecting selecti' +
+         'on selections selectively selector selects self send sent separate separated separately series servi' +
+         'ce services session set sets setting settings setup seven several shaded shadows shape shared sheets' +
+         ' shelf shift ships short shortcut shorten shortening shorter shoulder show showing shown shows si si' +
+         'de sides sideways significance significant significantly similar simple simplified simply simulated ' +
+         'simulates simulation simultaneously since single sit site sitting six size sizes skill skip sky slen' +
+         'der slenderness slicer slider slight slightly slope slot slots slow slowing small smaller smallest s' +
+         'mart smooth smoothness snap snaps snow society software soil solely solid solution solutions solving' +
+         ' something sometimes somewhat somewhere soon sorry sort sorted sorting sorts source space spaced spa' +
+         'cing span spanning spans spec special specialized specially specific specifically specification spec' +
+         'ifications specified specify speed spike spikes spills spin split splitting spreadsheet square stabi' +
+         'lity stable stage standard standardization standardizing standards standing start started starting s' +
+         'tarts startup state states stationary status stayed steadily steel steels steepness step stephen ste' +
+         'ps stiffness still stone stop storage straight strangely strength strengthen strengthened strengthen' +
+         'ing strengths stress stretches strictly strong stronger strongest structural structure structures st' +
+         'yle subdivide subdividing subjected subsequent substance substantial substantially substituted subst' +
+         'ructure succeed success successful successfully sudden sufficient suggestions suitable sum summary s' +
+         'un supplemental supplements support supported supporting supports suppose sure surface surfaces susc' +
+         'eptible suspension switch switched switching symbol symmetrical symmetry system systematic systemati' +
+         'cally systems tab table tabs tabular take taken taking tall taller tandem tapered task tax teacher t' +
+         'eam technical technique technologies technology tell tells temperature tempered template templates t' +
+         'end tendency tends tensile tension term terms terrain test tested testing text thats the theory ther' +
+         'e therefore theres theyll theyre thick thickened thicker thickness thicknesses thin thing things thi' +
+         'nk thinner third though thousand three through throughout thus tick ticking ticks tightly tightness ' +
+         'time times tiny tip tips title to together toggled tool toolbar toolbars tools top total totally tou' +
+         'ch touching toward trace track tracking trade tradeoff tradeoffs traffic transmit transmits transpor' +
+         'tation transverse traverses treating tree trial trials triangle triangles triangular tricky tried tr' +
+         'im trimmed trimming trouble truck true truly truss trusses try tube tubes tune tuning turbine turn t' +
+         'urned turning turns twice two type types typical typing u ultimately unable unattached uncertainty u' +
+         'nchanged uncheck unchecked unchecking undergoes undergoing understand understood undesired undo undo' +
+         'ne uneconomical unexpected unfortunately uniformly unique uniquely unit united units unless unlikely' +
+         ' unpause unpredictable unsafe unserviceable unstable unsuccessful unsupported update updated updates' +
+         ' upgrade upper us use used useful user users uses using usual usually v valid valley value values va' +
+         'nadium variable varies variety various vary vehicle vehicles vehicular verify versa version versions' +
+         ' vertical vertically verticals vessels via vice view viewing virtually visible visualizing volume vs' +
+         ' w wait walk wall walls want warning warnings warranty warren watch watching water way ways weak wea' +
+         `ker weakest weaknesses wearing web weigh weighs weight weights welcome welds well went what what's w` +
+         'hats whenever whether white whole whos wide widgets width wiggle willing wind window winds winning w' +
+         'ish within without wizard wont wood wooden word words work working works world worry would write wri' +
+         'tes wrong wrought xacto y yard yes yet yield yielding yields youll your youre youve zero',
+  fields: {
+    title: {
+      lengths: [
+        1, 4, 3, 1, 2, 2, 2, 2, 1, 4, 1, 4, 1, 3, 3, 1, 2, 6, 4, 1, 1, 6, 1, 2, 1, 1, 2, 4, 1, 1, 5, 1, 2, 2,
+        4, 3, 3, 2, 2, 3, 1, 1, 2, 2, 2, 3, 2, 3, 5, 2, 5, 8, 5, 2, 1, 1, 1, 3, 3, 4, 3, 5, 5, 4, 2, 1, 1, 1,
+        5, 2, 2, 2, 2, 3, 3, 3, 3, 4, 1, 3, 2, 2, 1, 2, 2, 5, 2, 2, 3, 2, 2, 1, 2, 3, 3, 3, 4, 3, 4, 6, 3, 4,
+        6, 1, 2, 3, 7, 3, 1, 3, 2, 2, 3, 4, 5, 4, 2, 7, 2, 1, 1, 3, 3, 4, 7, 3, 2, 1, 2, 4, 2, 2, 2, 2, 1, 2,
+        5, 1, 2, 3, 5, 4, 2, 2, 2, 1, 1, 1, 1, 2, 1, 4, 2, 2, 4, 2, 2, 1, 4, 2, 1, 4, 1, 4, 4, 4, 3, 4, 3, 3,
+        2, 8, 5, 7, 6, 8, 2, 1,
+      ],
+      postings: ';;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;1e;;;;;;;;;;;;;;;;;;;;;;;;;;;;;h,4,9,5,1,c,e,6,r,3,7,j,g,' +
+                'w;0,1;;;;;;2,4p,2;;3;6,3o;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;3h,g;;1b;;;;;;;;;;;;;;;;;;;' +
+                '2r;37,r;;;;g;;1f,h,h,m,h,y,3,e;4,1,1w,1k,y;;;;;;;;;;;;;;;;;;;;;;;;;6,1;;;;;;;;;;3d;;;;;;;8;;;9;;;;;;' +
+                ';;a;;;;;;;;;;;;;b;;;;;;;;;;;;;;1l,3a;;;;;;;;2k,18,j;;;;;;;;;;;;;1h;c;;;;;;;;;;;;;;;;;;;4v;;;;;;;4c,d' +
+                ';;;18,1;;;;;;b,3a;;;;;9,4,1,7,14,1,11,i,n,v,2;;4e;;;;;;;2;;;;;f;;;;;;y,3,8,c,1,1,4,b,n,3,a,3,1,1,6,1' +
+                ',3,y,4,1,1,1,1,1;1o;;g;;;;;;;35;;;;;;;;;;;;;;;;;;1f,21;;;;;;;;;;;;;;;;;;;;;;h;;;;;;;;;;;b,3a,3;;;;;;' +
+                'i;;;j;;;;;;;;;;;;;;k;;;;;4u;;;27;;;;;;;;;;;;;;1x;;;;;;;;;;;;;;;;;;;;l;;;;m;n;;;;;;;;;;;;o,2f;;;;;u,l' +
+                ',1,20;3v;;;;;;;;p;;;;;;;;;;;;;;;;;;27;;q;;;;;;4;;2y;;;;;;;r,2e,i;;;;;;;;;;;;;;;;;;;;s;;;;;;3f;;;;t;;' +
+                ';;;;;;;;;4a;;;;u;;;v,1,1;;y;;;;;;;;;;;z,1,1;;;;;;;28,1;;;;;;;;;;;;;;d,1,4,9,b,1,n,f,k,1,1,a,e,h,b,d,' +
+                '8;;;1p,1k,1i,2;;;;;;;;;;;;;;;;;;;;;;14;;;;;4v;;;;;;;;;;;;;;;;;;;;;;15;;1w;;;;;;;;;;;;;;;;;;;;;;;;;;1' +
+                '6,1;18,1,1,1n;;;;;;;;;;;1b;;;;;;;;;;;;;;;;;;4u;;;;;;;;;;;;;;;2l;;;;;;;;;;;;;;;;;;;;;47;;;;;;;;;;;;;;' +
+                ';;;;;;;1c;;1d;;;b;;;;;;;;;;;;;;;;;;;;;;;;;2r;;;;;;;;;;;;1e;;;;;;;;;;;;;;38;1y;;;;;;;;;;;;;;;;d,2e,1,' +
+                'm;;1e;;;;;;1f,1;;;;;;;;;;;;;;;;;;;1h;;;;;;;;1i;2b;1j;;;;;;;1m;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;' +
+                ';1k;;;;1l,1,1,38;;;;;;;;;;;;;;;;;;;;1a,e;;;;;;;;4n;;;1;;;;;;;;;;;;;;;;;;;;;;;;;;;2d;;;;;;;;;;;;;;;;;' +
+                ';;;;;3s;;;;;1p,1;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;4u;;;;;;;;1r;;;;;;;;;;;;;;;2m;;;;;;;;;;;;;;;;;' +
+                ';;;;;;;;;;;;;;;;;;;;;;;;;;4r,1,1;;;;;;1n,35;;;;;;;;z,d,g,v;16,n;;;;;;;;;1u;;;;1v;;;;;;;;;;;;;;;;;;;;' +
+                ';;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;2c,1;;2g;;1b,4,h,1,1,1,1,1,1,1,1,1,t,8,a;;1;;26;27;;;;;;;;;;;;' +
+                ';;;;;;;;;;;;;;;;;;;;;;;;;;;;;;28;;;29;2a;;;;;;;;;;;;;;;;;h,h,2,c,f,k,1,1,1,1,1,1,1,b,e,1e;17,1c,5,19' +
+                ';;2k;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;9,3q;;;;;;;;;;2l;2m;;;;;2n;;;;;;;2o;;;;;34;;;;;;;;;;;;;;;;;;2' +
+                'p,17,y;;;;;;;;;;4r;;;;;;;;;2e,27;;;;;;;;;;;;h,4,6,1u,1,2,6,f,11;;;;;;;;;;u,2f;;;;2q,1,1;;;;;;;;;;2t,' +
+                '1;;;i,x,1;;;;;23;1c,1m,u;;;;;;;;;;;;;;;;;;;;;;;;;;;13;;;;;;;;;;;;;;l;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;' +
+                ';;;2v;;;;;2w;;;;;;;;;;;;;;;3r;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;1e,1j,1;;;;2z;2z;;;;;;;;;47' +
+                ';;;;;;;;;;;;;;;;;;;h,1y,1,d;;;;;;;;;;;;;;;;30;;;;;;;;;;;;;;;;;3p;;;;;;;4r,2;;;;;;;;;;;;;;31;;;;32,1f' +
+                ';;;;;;;;;;;;;;;;;;;;;;33;;;;;;;;;;;34;;;;;;;;;;;;35,1,1;;;;;;;;;;;;;;;38;;1o;;;;;;;;;;;2d;;;;;39;;;;' +
+                '2y,8;;;;;;;;;;;;;;;;;;;;;;3a;;;;;;;;;;3b,1b;;;;;3c;;;2q;;;;;;3d,1,1;;;;;;;;;;;;;;;;;;;;;3g,1,1;;;2o;' +
+                ';;;;;;;;;;;;;3j;;;;5,4e;3k;;;;;2u;;;;;;;;;;;;3l;;;;;;;;;;;;3m;;;;;;;;;;1f,21,7;;;y,t,q;;;;;;3o,1;;;;' +
+                ';3q;;;;;;;;;;;3r;;;;;;;3s;;;;;;;;;;;;;;;;;;3t;;;;;;;;;;12;;;;;;;;;;;;40;;;3u,1;;;;;3w;;;;;;;;24;;;;;' +
+                ';;;;;;;;;;;n,3i;3x;;;;4w;;;;;;3y,1,1;;;;;;;;;;;;41;;;;;;;;;;;;;;2w,e;;;7,3f,g;;;4q;;;;;;;;43;4n;;;;;' +
+                ';;;;;;;;;;;;;;;;;;;;;;;1w,3,25,k;;;;;45;46;;;;20,1,1,1,1,1,t,8;;;;;h,1,9,o,1,9,14,1:2,4,b,6,s,3,h,2,' +
+                '1,1;;;;;;;;;;;;;;;;;;;;;48,1;;;;;;;;;;;4a;;4b,1,d;1e,9,3;;;1d,f,q,10;;4d;13,3h;;;;;;;;;;;;;;;;;;;;;;' +
+                ';;;;;;;;;;1;;;l,9,2,1,j,1e,11,d,1,5;4e;;3s;;;;;;;;;;;;;;;;;;;;;;;;;;;;;4f,2,e;;;;;;;;;;;;;;;3x,j;;;;' +
+                ';;;;;;;39;;;;;;4h;;;;;;;;;;;;;;;;;;;;;;;4i;;;;4j,1,1,1,1,1,1;;;;;;;;;;;;;;;;;;;;;;;;;;4q;;;;;;;;;;4r' +
+                ',1,1;4u,1;;;;;;;;q;;;;;e;;;;;;3k;;;;;;34;;1p;;;;;;;;;;;;;4w;4x;;;2,7,1w,w;;;',
+    },
+    text: {
+      lengths: [
+        17, 173, 182, 24, 89, 175, 14, 17, 16, 652, 31, 35, 9, 15, 45, 23, 27, 167, 56, 19, 12, 61, 8, 203,
+        22, 22, 73, 759, 40, 8, 54, 15, 15, 11, 74, 75, 83, 38, 608, 39, 10, 7, 152, 144, 194, 33, 49, 28, 73,
+        47, 351, 566, 438, 13, 12, 21, 106, 63, 57, 84, 121, 240, 64, 73, 28, 18, 13, 9, 58, 163, 59, 19, 32,
+        175, 54, 149, 79, 252, 24, 147, 14, 38, 161, 15, 280, 30, 25, 17, 90, 6, 27, 8, 105, 27, 21, 137, 195,
+        26, 57, 69, 21, 509, 323, 10, 11, 33, 58, 31, 76, 66, 35, 23, 40, 57, 104, 190, 31, 46, 16, 130, 10,
+        26, 44, 91, 488, 26, 57, 31, 186, 31, 26, 24, 180, 35, 24, 38, 154, 5, 14, 68, 171, 197, 23, 57, 162,
+        11, 30, 23, 22, 106, 8, 361, 15, 12, 66, 40, 100, 189, 101, 34, 25, 87, 10, 30, 25, 24, 21, 70, 39,
+        23, 16, 371, 161, 488, 180, 65, 11, 23,
+      ],
+      postings: '9,e:4,f:3,8:3,4:2,a:4,m,d:2,1i;12:5;12;1,8:7,t,8,4:2,a,9:7,1,h,f:2,w,c,q;12,z,2r:3;12;12,s,2n:2,d,1;' +
+                '1r;4s;y;n,f,d;1,16;2;y,t;1r;n;12:2;9,t;1f;1;n,f,v,c,1w,m;3v,j;9:9,e:6,r,t,8,f:2,w,c,5;5,1y;12;4u;4u;' +
+                '1e;9;1:2,1t,1;29;12:2;12:2,d:2;1;29;n:4,n,e:2,9:2,q:2;2a;9:5,c,2,12,q,f,q,c;12;12,2m:2,1;12;1,1a:2;3' +
+                'g;1e:3,16,h,k,m,6,h:3;1,8:5,i,b:5,d;2a,j:3;1,q;y;1,11;1e;9:7,t:7,8,e,9:2,8:2,2p;12,4;12;y,t;12;1r;12' +
+                ':2,c,t:2,2l:2;2t:2;n;3g;9:2,t:2,35;12,v:2,1;29;9:2,t:2;2;y;n:2;9:2;n;y,t;45;1f,21:2;;0,1:3,m,f:3,i,d' +
+                ':2,1,2,1,4,4,17,p,m:4,2:3;n;1v;40;33;9,16:2,1:3,9,2b,e,5,1,d;;25:4,11:2;3:3,6:3,i,o,3,2,1w;5:2,1,3:6' +
+                ',c,6:5,b:4,4,2,6,1:9,5:2,1w:9,6,1,7,2,5,q;3k;4u;3o;z,1,6,1,5;12:2;h,2u;5,d,1f,2u;1,m,2l;4t;2,4p;r,h,' +
+                '23,1g:3,2;r,b,e:2,1e,1d,m:2;40;r;5,x,n,c,4,12,10,k;1t,26;37;4h;25,2c;1m;47;3;1,h,5:3,4:3,p,l,1y:2,6,' +
+                'm:7;1n;9:3,x,a:6,2k,h;1e,w,t,k;2,p,h:2,v,d;2c,2i;16,9,1:3,20,4,17,6;o;1e;2:2,1c;2t;2u;1o,z;3k;4a;2t,' +
+                'z;47;i;2u;1g;1f:2,21:2;1g;1p;n;1e;;7,2,15,1f,i,r;1:2,11:2,9:2,9,d;z,28;12,1s,1z;1,t,k,1:2,9,5,h,2:2,' +
+                '19,1,d,i,b;12,18:5;2a;2t;4u;1,11:2,1l,20;9,2e;3,6,c:4,6:5,8:2,1,1:2,1:3,4,2,1,3:2,1,1,1:5,1:2,5:2,1:' +
+                '2,1:2,1,4,5,5,2,1,5,3,3,2,7,3,1,1:2,4,4,3,1,1:3,4,3,2:5,1,1,2,4,4,4:2,4,7:3,3,3,2,2,4,2,1,3:2,2:3;1n' +
+                ',p,n,1k;i:2,y,9,15,1d:d,m;2a,1x,m;n,4:2,o,1:2,8,d,3,14,8,p,j,4:2,1:4;0,a,3e,q;r:2,h,23:2,1h;r,b,3p;2' +
+                'a;;b,c:2,x,l,5,a,n:3,r:3,2,d,g:2,1;47:4;47;9:2,7,m;9:3,7:2,b:2,b:2,d,5,1w:2;9;9,g;4:4,1:5,1k,c:8,1,1' +
+                ':a,2:4,f:2,11:3,s,6:5,1,a;5;2x;9:2,3,v,7,1,p,j,c;1f,v;4u;24,1f,19;1,p,c:2,1,1l;1,8,t,8;q,o,p,2s;5,c,' +
+                'x,n;1d,f,l,5,10,u;2;47;2r;1:3,8,t,3,a,m:2,5,5,15,j,4;4v;12,13:3,1y,4;9;r;1g;3,2q;a,7,l,13,o,1j;47;1,' +
+                '29;6:2,1:2,k:3,b:2,d:7,5:2,1w:7,g,4,7;1f:2,21,y;e,9,5:2,1t,m,h,4:2,d,o,3;2,3:2,19,1a,26;1e;4e;40,e;9' +
+                ';2n,f,e,2,2,c,j,2;1o;;2c;9:2;1e;2z;1f,21,1d;47,k:4,2:4;8:2,u,6,c,d,4,4,3,1,2h;9,4k;9;9:2,15;9:5,g,p;' +
+                'h,l,5:2,17,2;9,i:3,2m,p,q;0;9;12,r,26;4t:2;a:2,1a;4r:2;9:3,g;9;c,n,7,6,4,17,1f;9;2a;b,g,g,i,e,2,1v,s' +
+                ',1:2;40;4r,1;1f;39;b:2,1s,h;;25,2;b,g,8,3:4,4:2,1:3,5,4,p,2,9,7:2,t,4:3,4,3,5:4,e,1;i;r,a,1:2,7,4,8,' +
+                '1,1,1,4,7,3,5:2,5,6,7,3,1:3,c,1,c,f,a,6:2,2,6,1:2,1,1,7;n,1a;9:2;9,15;m,3d,7,8;f;s;1:3,4q:2;1;1k,n;3' +
+                ',1:2,e,c,c,1,8,1,5:3,1,1,f,3:2,f,9:3,1,7,i,1,d,g,4:2,b:3,3:5;5;4t;9;2t,n,1d;2;3q;12:2;h,b,b,1h:3,9,v' +
+                ',4:5,j,2;r:2,b:4,1r:5,a,l,4:4;1e,4;1e:4;2:2,l,4,h,1j,2,v,h,o:2;3v,j;r,o,1r;1e;40;40;12,27;2r,o;9:6,4' +
+                '5;l,h:3,6,9,3,l;c,9:2,z;4u;n,26;3b,p,5;1e:3;9,t,m;21:2,1a;4c;3z;30,17;12,3m;3v;3z;23,j,25;f,1m;1g,1d' +
+                ';3o;2:2,9,3,d,o,9,1,e,4,3:3,j:2,1:2,a,c:2,h:2,a:4,m:2;2,10,1p,3,y;;9;1e:2;9:3,15;8;16,1r;9:2;18:2,i,' +
+                'm,8,4:6,w,c:2,g:4,1,c:3;5:2,c,b,7,1,11,2,9:2,b,1,19:3;9,4l;h,9,9,1,2,4:3,1,1:a,1:4,1:2,2,1,8,1,1:2,1' +
+                ',8:3,3,3:2,1,2:2,7:2,8,3,1:4,2:2,h,4:2,5,2,2:3,7,5:2,1,3,4,8,1:2,6,2,2,1:2;4c;0;p;9;j,2,j,4,2,6:3,w,' +
+                'i:5,3,7,7,5,4,7,4,1,c,1,9,5,4,2;5,4,1u:4,4,h:5,g,3,9,5,p:2,2;9;12;9:4;9;1:8,1:2,1:3,1:2,1:5,1:2,1,1,' +
+                '1:8,2,2:3,1:4,2:3,2:3,1,2:2,2:5,2,2:h,3:3,1:3,1,1,2,3:m,1,3,1,1:4,3:3,1,2:7,1:6,1:6,1,2,1,1,1,1,2:j,' +
+                '1:3,6,1:8,1:3,2:2,1:8,2:3,2:7,1:3,1:4,2:2,1:2,2,1,7,3,2,1,1:4,1,1:2,1:2,1:2,4:2,1:3,1:4,3,3:2,2:4,5:' +
+                '2,1:5,1:6,3,1:4,2:2,1:2,1:3,1,4,1:2,1:3,1:4,1,1,2:3,1:2,1,1,1,1:3,2:d,1,1,1,1:3,2:2,4,5,1,2,1,1:r,1:' +
+                '2,1:h,1:9,1;47;0,12,c,1,a,1,1f,12,6,1:a,d:4,2:2,1;1p:2,1b:2;5;5:2;1e;2;1q;2:4,1j,1,1:5,14,8,5,1,1,9:' +
+                '2,w:2,h,2;2:4,1c,1d,7,1d,j;n,32;3o;f,2r;f:2,8:2,t,4,h,l,l,l;47;9:3,f,3,n,n,26:2;a,h,o,21,1d;4t;12,y;' +
+                'h:5,6,3:6,1,7:6,1:3,1:4,1:3,5:2,1:4,1,1:4,3,1,1:2,1,6:5,1:5,1:3,1:2,3:6,5,3:2,2,1:4,2,1:3,2,5:5,1:2,' +
+                '3,7:2,1:3,1:3,2,1:2,1,4,1:3,1,3:4,3:4,1:4,1,4,2:3,1:4,1:4,1:2,1:2,2,1:7,4:2,8,9,8:n,2:4,2:3,2,1,1:2,' +
+                '1:2,1:2,1:3,4:3;q,i,g:2,s,j,c:2,12:2,f,3;1k,n;g:2,b:2,b:2,d:3,5,1w:4,y;g:2;1p:2;25:4;n,4,b,13,10,f,4' +
+                ',8,9;n,4:2,b:2,1r,1c,m;r,2h,1l;n,4:4,y,l,a,9,c:2,b,g,h;3b;1,k:4,5,i,2n:2,3,f,g:2;2,3i;z,7:4,1:2,5,1b' +
+                ':3,1p;2,9,v:2,2,27;2t;12;r:2,b:3,18:5,j:5,14;47;1p;9,16;1g,1e,1d:2;1;12,25;1:3,i:2,j:3,n:5,8:2,4:2,2' +
+                ',1:2,1,y,p:2,7,8,7:2,f,4;j,8,b;5;1:2,8,i,b,d:5,q,2:4,u,f:6;1,1d:2,1:4,r,t,h:2,h,3,n;4e;5;f;h:3,a,n,b' +
+                ',14;1x,9,2l;b,c,o,r,1,4,n,k,7,4,14:3;21;40;40;o;12,4:2,2u;1:2,11,2e;43,k;12:2;3v,j;2t,1y;40;9;2;2;5,' +
+                'c:9,h:3,9,8:4,c:2,a:2,2:2,1:2,8,4,8,5:7,1:3,8:2,9,2,3,1,1,2:2,4,9,f,3:2,2:3,b:4;17,1,7,c,d,28;5,6,15' +
+                ':2,1e,8,k,b,i,2:3,b,3:2;h:3,r,h:2,c,t:3,u,p;47,k;27:3;1f;3z,8;4t;27;r;2:2,1v,6:4,2,2,3,j:2,b,3:2,h:a' +
+                ',1,8,a,3,j;5:2,1g,1,1,d,11,3;b,3a,19;12;2,1d:2,v,16:7,c;3g;h:2,1,17,r,b,p,4:2,c:4,x;4d;w,1,j:7,1e:5,' +
+                '11:2,d,1;j:3,2,j,c:3,4,1a:4,1o,b;18,34;3w,x;2:2,2p,8,1v;2:3,2p;4u;12,n:2,1,1a,9,y,k:2,2:2;4e;9;12,35' +
+                ';r,1c,2q;4:9,a,3:4,9:3,1,7,1:4,1:4,1,2,3:2,1:3,2,3:3,1,1,1,6,1,1:3,1,2:2,1,5:3,3,2,1:3,2,1:3,2,5:8,1' +
+                ',3:2,7:3,1:e,1:2,1:3,1:2,1,5,1:2,4,3,1,1,6,1,1:3,1:8,1,3:8,4:2,8:9,9,5,2,3,2,2,1,1,1,1,1,1,3,2:2;2c;' +
+                '2,f:2,9,8:2,2:2,r:2,5,g:5,h,5,4,c,2,2,1,r,3,2,2,2;k,10,2n:5;2y,7:2,1:2;4,1,1a,x:2,1,r,3,b;4b;21,2;1p' +
+                ',12,o,1f;5;12;1x,4,6:7,19:3,4,4,8:2,g:2,h;0,1x,2w:4;1p,c:2,1z;1p;1p;1e,2z;4r;5,c,x:2,b,c:2,2:3;1e,2a' +
+                ';5:3,1y:2,14;2a;4,28:5;3x;r,o,i;12,d:2,i:4,4,2q;1f,i,8,2;1e;2k;39;b,f,t,r,1l;8,d,3a,i;33;1f:2,q:3,22' +
+                ':4;3s;1f,2a;2r;r:2,22,1,1z;2;9,2,1e:2,d,3,j,d,f,h,u;24,x,16,n:2;9:2,2f;47;1e:2,2m,r;12;e,7:2,6,b,6,2' +
+                'n,c,7;e,d:4,y,8,2u;2a,1p,1:2;f;5,a,4,3,1:2,t:9,4,h,2,2:2,6,1:4,h,a,3:2,1,5,g:4,5:3,2,f,2:2;n:8,4:2,b' +
+                ',e:3,l,4:2,11,2,k:2,5,8,b,d;r:2,23,1z;4r,2;4t;4t;1p:2,e,o,9,1,3:2,7,1e,4;5,30,1:2;2;1p;47:2;1f:2;1f;' +
+                '3,l:2,3:5,4,7:7,6,7:3,5:2,h,4,2,1,1,u:4,d:3,7,13,1,2;r,2x;1,26:2,25,h:2;1f;1g;9,i:6,3:5,8,6,7:d,1:b,' +
+                '9:2,i:2,m:2,1:2,3,j:8,4:5,b,1:6,4,4,3,7,f;i,3,6,f,1,8:7,1:4,9:2,y,3,4:2,m:5,f:2,c:2,7,9,4,2:2;4t;4b;' +
+                '9:2;4f;9,v,3,3b;g,r,m:2,q,f,11,f;p,2:6,b;9,g,2:3,f,e,37;9,t,c,2:4,2c,f:2,k:a,2;12;i,x,29,13;25,2o;1x' +
+                ',4,2q:2;7,v,2k;3g,1d;1f:2,21;1:2,q:3,1g,19:2,k,1,b;4t;12,35;47;r:2;i,9:3,1d:2,14,1,f:2,j,m:3;a;1e;13' +
+                ',b;27:5,19:3,4:2,c:3,g;27;q,y,2p:2;1p,c,4,o,s;r;3m;47;1o;5:9,l:4,1b,4,28:6,6;2y,7,1;1g,1i,7,1,11;18,' +
+                '2c,s;9,2,g,b:2,11,h,2b;b;u;9:2,5,d,p,8,h,2,5,b,k:2,p,g;5,1s;i,9:29,b:9,d:r,1:a,4,5:2,l:2,a,6,3:p,1:8' +
+                ',b:4,2,9:o,4:3,3:6,5,4:3,1,a,6:3,e:2,2:d;i,9:7,o:3,b,k,16:2,c,f,k,2,1;1g:2,2r;4t;18,g,2q:2;9;4a;9;9;' +
+                'e,d,f:4,1:2,1:3,g,1,1,2,4,9,9,4,c,m,4:3,c,8,3,6;d,m,3,4:2,1:2,5,14,7,4,o:2,h,w,3;2t,6;13,m,1m,p,d,4;' +
+                '1p;i,4b:2;4r:2;25;1f,21;n;9:b,8:5,6:2,4:2,1:5,5,1,4:4,b,1:2,b,2,1,6,8,6,3:2,1:2,1,5,7:3,e:5,h:5,1,3:' +
+                '4,d:2,2,2,k,1;;17,3k;v,1,t,8,2b;2;2c,c:5,r;r:2,b,17:3;2:2,p,j,e,e,2,8,4,7:2,3,1,2:3,1:5,b,2,4,2:2,1,' +
+                '1,2,f,b,4,2:3,4,7,4:2,2,1:3;y,3:2,6,k,p:2,d,e;1d,2z;37;9,k,r,39;9:2;s;9;1k,n;3o,12;3p;5;4c;2y,9:2;2:' +
+                '2;2k,1q:4;2o:4;4s;39;u:2,l,3d;3s,f;3s,z;1,4,4:p,c,6:g,4,1:3,1:2,5:f,4,2,6,1:g,1:4,1:2,3:2,d,4,4,2:2,' +
+                'n,m:c,4:7,3,8:6,1:8,c,1,h,1:3,3;8,n;h:3,9,8:6,1e,4,4,9:2,1:2,m,8,p,g;r,p;4u:2;2c;2g,1r:4;l,6,2k,k;5,' +
+                '4m:2;2l;4x;2l;2t,20;q,9:b,1:b,1:7,5,1,5:2,2,2:3,14,4,u:2,v,4;z,7,a:3;18:2,8,n;2y;30,1r;4t:2;12,17;1k' +
+                ',o:2,1,1:2,x;12;3x;1a,6,n;5,m,1g,3,1i;5;44;21;22:2;2u:9,1d,m;2c;r,n;3p;1q,2h;0,1:3,c:2,1:5,3,1:4,5,3' +
+                ',1:9,3,5:2,1,2:d,1:3,3:4,1:2,1:4,3,1:2,1,2:b,1:9,4,1:4,1:3,1:6,1,1:c,1:8,2,5:3,1,2,1,1,2:2,1:6,2:5,2' +
+                ',1:5,2,1,3,2,2:5,3:3,1:2,1:3,1:6,1:3,1,1:i,1:d,3,3:3,1:a,3,1,2,1,1,2:3,2:2,1:3,1:9,1:8,2,1:5,1:9,1,3' +
+                ',4,4:8,1:2,8,2:h,3,1,1:4,1:6,4:2,3:3,3,4:f,1:a,1:r,1:3,1:4;27;1g,2r,k,2:2,1;1:3,1:2,4,5,2,3,2,5:2,2,' +
+                '2:9,3,5,3:6,6:2,3,1,3,1:3,3,2,1,1,2:8,1,6,1:3,3,1,2,2:3,2:2,2,1,d,3,1:2,2,1,5,1:3,1,3,5:2,6:2,1,4,2,' +
+                '1,1:3,6,4,2:2,4,1:2,2:2,3,1:2,1:2,5,a:e,1,1:e,1:6;2t,r,s:2,h;39,1i:6,2:2;1,1e,a,i,j,4,7,f,r,3,h,1;i;' +
+                '2n,1,18,g;2;39;r,z,e,12,1,p,l,a:2,2;1e,26,t,h;40;r,1e:2,5:3,j:2,1,h,9,3,a,1,9:3;12,2v;q,1:3,n,2i;r;1' +
+                'p,1,2h:4,k;1p,m,p:2,v;u,3z;2:2;2:3;l:2,t,2h,5;14,a;l,j,g,1a:3,1z;9,5:2,1c:2,2e;2,2,1,l,o:4,22,u,3;9;' +
+                '2u;9,e,s:2,2q,c,a;5;9,9,9:5,7,g:2,1:5,1:3,9:4,2,6:4,1:2,c,e,3,2:2,1,l,1:2,c,a,5,6,1,d:2,1,1:2;n;1e;1' +
+                'p;e,3a;4u;27;l,6:2,40:3;n,2l;1e,13,5,b,b;3y,v;2n,24;4r;v,i,2,3,1g;2:2,4q,3;3l;3x;39;4t;2r;15,f,l;21,' +
+                '2;2,s,d,1,6:2,7:4,1:2,1:2,1,8:2,3,6:4,2,z,1,4,5,4,c,4,c,1:2,7,1:2,1,1:2,1:3,1;4,d:2,a,g,1:4,7,8,9,7,' +
+                '1,3,5,4,9,1,l,5:3,4:2,c:3,8,6,e,4:2;25;5,m,3k,g;3q:2;4e;40;1p,1b;1g;1f,21;40;1x:2;k;31;3x;2,p:3,22,z' +
+                ':2;9;2,1c,1n,f:2;37;h,a,p,7,9,u;2z;1e;3l,s;4:4,z,4,15:2,c:6,26:2;2n;2u,1t;9,l,c:3,1:5,1,7:5,9,4,q,t,' +
+                'd,3,v;e,3,9,9,1,2,4:3,1,1:d,1:4,1:3,2,1,7,1,1,1:2,1:3,1,7:3,3,3:2,1,2:2,7:2,1,7:2,3:2,1:4,2:2,7:2,4,' +
+                '6,4:4,5,2,2:3,7:2,5:2,1,3:2,4,3,5:2,1:2,4,2,2,2:3,1:2,1;5:4,11,1:4,1,1z,k;9:3;2r;4;4u;9,8,1z;9:7;3m;' +
+                '4s;1p;1:2,11:2,9:2,9,d;4u;n:2,4,n,t:2,5,3,6,v,8,19;1p,12,o;31,1d:2;3,d,3l;1x:2;26,2l;i:2;5,19,a;18,2' +
+                '3;18,1x:2,1:2,i;2u;r,23,y:2;2,7,2i,23;18,2,21,g;11,7,d:2,1:2,1:2,p,8,i,2,d,1,v:2,2;e,c:2,i,14,4,21;1' +
+                'p,12,o,1f:2;4u;12,n:2,8,13,9,1l;5,16,4:4,21:2,c;1g:2,a,14:2;4a;30,17;1,11:2,13,p,1x:2;30,17;2c,h,z,m' +
+                ';31;n;1f;1,g:2,a:2,9,2:4,z,4,6,d,5,e,q,2,4,4;n;n,x,q:2,b:3,m;6,l,1a,9,9,1b,k,f;l,6:2,2,9:5,4,9:3,s,1' +
+                '9:3,4:4;3b;1x:2,2u;1f,2l;1f;21,2;q,16,2x;3q;3;33;4r,2;b,2t,1q;4v;2o;3,4,2:7,8,35:2,d,8;4t:2;17,m,1i,' +
+                '1h;1,j,i,27,1k;1p;a,h,o,a,1,m,o,7,9,r:2,k:2,2:5,1:2;12,n:3,1,7:2,4,z:2,g,f,c:8,k:9,2:3;27;4u;r,b,e:2' +
+                ',9:3,f:2,1,1d,f:3;1,8,1,h,b,e,p,o:3,1,4,1p,6;12,2n,b;1p;27:2,19:2,4:2,c:3,g:2;27:2,19,w;1f,1f,d;21,n' +
+                ';b,6,j,w,u,e,h,r,d;e;i,3p,k;9,2l,e;4r;1f,21;n,3i:2;n:2,1e;1u,1;1c:8,1,27;1c,1;11,2,9,1:4,17;z,1;1e:2' +
+                ',1,1e:3,1,1n;b:2,13,p,h;2r;1e;4r:2;4r;1p;47:4;y,h,c,6,w:2,8,3,b,i,v,1;1x;1,q,n,2,k,3,b,a,5:4,1:2,n,3' +
+                ',1,5,k:2;11,f,2j,8,m;5,1w,2:2;5:2,1y:2;2,w,g:3,1:2,1:4,3,8,6:2,1:2,e,h,1:2,b,1,a,a,a,e,e,1;1g;r;r:5,' +
+                '2,9:4,d,21;12;n,1i,o,1c,b:3;2y;37;22,12;9;2c;4r;t,1y,1,r,5;2k;9;l,31,g;1y;r:5,o:7,v:3,j,1,m:7,c:2,11' +
+                ';1p,1,7,u,9,1r,2:2,1;1p,l,k;25;4h;1f;37,1n;1e:4,16,h,1c,h:2;9;2l,1,n,h;g;2r,o;4e;23;9,15;1x:3,1;r,17' +
+                ';n:5,x,2l:3;r:2;r,2x,15:3;n,1a:2;1,m,f,9,9,e:3,3,2,15:3,x;r:4,b,d:2,5,d,1,3:2,s,1:2;4;n,4,1a:2,1n,1,' +
+                'g,m;4,32;r:2,1a,s,e,h;2t:2,8,3,3,h:4,15,3,1;4,b:2,8:2,1e:3,2,22,m,6;3g,r;9,7,y,2j;9;4r:2;4u;9,2,13:3' +
+                ',1g,a;2:3,3,19,2w,k;9;3b;9:3,4:2,11:6,6,c,3,l:3,5,1,1:5,1:4,7,2:2,4,1,7:4,1:4,1:7,4,o,4,2:2,f;2r,n;9' +
+                ',15:3,16:2,7:3,a,e:2,y,f,2;10,c;3w;i,1p,u,16:2,l;47;9,2k,1k;r:2,n,1,1:2,1d:2,1,m,r,m:2;3g;2:3,7,32;3' +
+                'g,4:3,c:3;3g;4t;2:2,2p,23;1,8,e,j,1,6,2,1:2,9,i,5,c,5:2,1:2,h,5,2,u,g,3;9:7,15:5,3f;9:2;9;2o;2,23,1j' +
+                ',c:3,p;l,v,28;25;5,4:4,t;9;1p;13,3a;l,a,7:3,6,9,3,l;4u;37;1e,1d,1g;12,1w,h:2,s;4b;n,f:2,1,12,7:2,8,9' +
+                ':2,d,a,8,9:2,2,6,c,a,2;29;1i,2;m,1:4,o,8:3,1,a,1,8,2:6,6:3,1:2,9,9:2,c:2,1:2,5,n,6:3,1,a:3,d,3;1,4,x' +
+                ',h,1,h,4:3,1:2,n,1:2,d:3,r,v,1;1p,1,2a:2,7,7;1e:2,1j:2,1;d,2s,1;s;o,43;3y,v;4,e,c,c,1,8,1,5,1:3,j,f,' +
+                '9,1,m,h,g,f:2;21:3,11,f,g,h;c,4,12,2j,1;9,i,o,1e,n:2,k;2m;40:2,e;4r;13,27,x,6;4t;1p,1b;4a;1t;1,4q;2,' +
+                'p,y,14;47;n,c,1,1,f:2,16;e,3t;30,1d;27;d,p,15,u,16;r,n,t,8,11,4,c;2;10,c;9;4j;30;r:2,o,a:2,1b:3,g,u;' +
+                '1,1e,1,1d,1y,2:2;1;5;l,29,11;9,i,1d,p,1:2,h,1i,1;4,n,p;4r;37;37;2,p;n:2,4:3,n,1,n,3,5:2,16,3,5:3,4:2' +
+                ',6,7:2;1p;2u,21;;9:k;9;1p,1b;9:4,9:2,c:2,c:2,1:2,8:2,1:3,5:5,1:5,1:3,i:2,f:3,9:3,1:2,7,f:2,3,e:2,g:3' +
+                ',4:2,b:4,3:5;1e,3d,2;9;4;9:2,15:2,b,e,k,6,g,1i,1,1;2:2,2w,7,1;4t;0,4t;a;2a;n,2k;e,1n;5,1y;37;8,g;5,1' +
+                'r,28;31;r,o,j,e,h,n,8,4,d;5;16:2;9:3,h,i:5,2:3,a,4:a,o:2,8,3:2,o:4,g:3,m;9;5,36;37:2,1n;37;1e;1g,20;' +
+                '1g,24,g,n;18,1c,1t,a:2;9;3o:2;1:3,11:2,w,2,1,4,1b;1s;1,8:2,t,e;18,14,18,j,9;3o;4n;3p;30,17,k,2;1e;37' +
+                ';o;4t;2:2,21;b;1f;4:4;2c:4;2a;r,o:2,1e,n:2;1y;r;r,y,8,1:2,2t;9,i:4,b,d:8,21:3,g;u,e:3,6,9,2,v,g:2,b,' +
+                'w,3:3,h,2;1p,15,1i;3w;5,27,1;4,m:2,16,g,z:2,11,7,1:2,1,1,1,1,1;2d;4m,3;r:9,b:8,4,1,1:3,7:6,9:3,9,9,1' +
+                ',3:4,b,2,6:4,i,5:8,h,a,m;r:2,9,c,3:4,t,2,j,e,9:3,9;12;1e,1t;17,6,z:4,v,b,6,9:5;3x;1x;0:2,1:2,q,b:2,n' +
+                ':5,1,g,21:2,k,2;5;1t;3z;4a;k,3n;4u;4u;6,11,15,b,1:4,16,5;3,29,c;9:4;9:3,15;h,a:2,1,a,1r:2,v:2,4:8;4:' +
+                '2;5;j,p,2:2,21:2,f:2,1,b:2,l;4,2s,e;;1g:2,2f:3;1e,n,s:2,1,g,i,8,r:2,2;2;47;47;1;27,5,1c,19;1x,9,2l;4' +
+                ':4,20;4;34,s,g:5;9;3z;3z;43;18,2c;47;9,1u,4,m,1,1d:4,5;21;l;4,1;43;22,1,9,8,11:2,b;16;i,3p,k;47:3;39' +
+                ';1e:2;2a;9,t,c:2,1,i,1j,c,z:3,2:5;47;1e;40,t;30,17:2;1g,2r;23;4t;;9;i,1l,3,2l:2,2;2,2r,13,g;9,i:3,b,' +
+                'e,9,7,b,j,3,d,1,g,q:2;12:2,v,a,5,2f;2o;3f,1e;h:3,9,1:3,10:6,a,b,4,4,9:6,1:4,9,l,9:2,g,g:2;1,q,p,u,j,' +
+                'z:2;r:2,22:2,1t,7;1e,1f:2,1,13;2a;4s;1o,z:3;1p;h;z,1,d,25;1,4,15,2e,3;2j;1e,1a:2;4t;n;n,x,12,l,h,4:2' +
+                ';r;2t;u,1z;r;25;12:2,5,1,x,o:2,e,d,q,j,1;4r;2u,1z;3j;4s;39;9:2,2f:2,f;9;23:2,1x:2;4u;2r;2;1e;3o;9:3,' +
+                '2p;4r;r,n,b:2,1b,9,1i:2,2;5,1w,2;37,1n;1g,2j,1:3,e;4p;12,5,1o;m,1:2,1o,11,t,1,a;3r,w;18,2,e;12;2t;4r' +
+                ',2;4u;1g;47:2;1a,e,23;39;q;2t;1f,21,1d;2a,24:2;;4b;1x;1d,1:2,y,1,3;2g;4d;1l:5,1:3,1:8,x,a,p,u:3,4:2,' +
+                'b:g,2,1:5;1l:2,1:2,1:4,1w,2,17:3,2:2;1g,1e,1z;1k;5;5,4o;9:6,i;16;9:4,i:2,8:8,2,1:2,1,2,1:8,1:5,5:8,1' +
+                ',3:8,8:2,4:3,1:2,a,2,f,3:h,9,e:2,8:3,k:2,f:3,6:2;9:4,3,d,2:3,3,5:2,2,1:3,4:b,1:3,1:6,2,2,1,2,1:5,1,3' +
+                ',4,4,4,n,4:2,7:2,h,7,2,7:2,5,3:5,1:2,4,j;1k;9:2,5,d,p,n,q,8,3:2,1n,2;12;z,1,1,1b:3,c:4;z,1,1,n,z:4,1' +
+                ':3,6;2n;29:3;r:4,b:6,1r,z:3;1k,a:2,1;1,m,w,1n,z;39;o,q,k;1:7,m,f:2,h,1,a,1,1b:4,a,p;9;1f:2;n,x,24:5;' +
+                '9;37:2;4h;t,3e;1:3,11:2,n,1r,r;1:2,11:2,35,k;9,i:2,o:2,1e,1l,j;2a;9,8,x:2,1,1,b,l,h:3,i,5,c,5,w;2g;9' +
+                ',1v,27,j;4u;9,y,29,v,3,g;7,18,21,6,15:2;1,11,2e;2;k;4q;9;1f,2l;e,1b,1,1a;1f,2s;r,3g,n;2,g,9:3,n,8,o,' +
+                '2,1l,a;1f,1p;9,x,1,1,2,3,o,m,1:3,n,g,c,k,4:3;9;1,m:2,4:4,b:3,d:3,1:5,w:3,a,8,d:4,4,5:2,8:4,5;46;1g,3' +
+                'd,1;n,4:2,o:3,1:2,w:2,h,1:2,e,4,4:3,c:2;1f;47;9,15,1x;1g;27;9,1,m,6:4,6,23,5,g:2,c;4h;1p,1b;1a;1y;4,' +
+                'd,a,1,7,1,6,q,g,b,1;1f,21,1b;2:2,i,4,q,2:4,d,11,5,x,3;3o;2,3,19,1,1,29;4u;4r:2;16,3n;4t;3b;h:2,r,1q,' +
+                '9,h,13;4s;12,8:2,2h:2,w;h:4,9:2,8,2,g,b,d,8:e,1:3,3:2,4,4:8,5,e,q,g,h:4;r,b:4,1m;q,8,9,k,l:2,4:5,1x;' +
+                '1f,b,v,6,k,5,h;1:4,4:4,6,8,4,4,3,8:6,6,1:2,2:2,4:b,1,2,2:3,3,3,6:4,1:8,1:5,1:3,1:2,1:a,1:4,1:5,1:6,1' +
+                ':b,2:4,5:5,2,6:3,6:3,3:6,1:2,4:3,3,5:3,1:3,9:9,3,2:3,3,4:2,4:2,1:9,3:2,4,1,2:2,6:3,1:2,5,1,7:3,1:3,1' +
+                ':3,1,3;f,c,15,p,5,19,p;1:8,4:2,m:3,b:3,d:3,8,2,8:3,1:2,2,5:2,1b:3,4,g,3:2,o:9,2;12,15,19,1d;r,b:3,3,' +
+                '6,4,2,3,5:3,8:4,1:2,3,3:2,1:3,1:2,5,15:2,6,c,1,4,o:2,2;i,1p:5,19:3,4:2,c:3,f,1,h;44;w,1,1,3,1:2,7,1:' +
+                '2,3,8,1,1,1,3,1,a,e,2,2,5,3,a,3,1,8,3,1,d:2,c:2,1,1,6,6,2:3,1;1,p,d,3:4,1,6,3,17:2,7,1t;1a,v,16,g;1f' +
+                ':3;34;f,8,4:2,3,l:2,6,1,1,1t:2,9,g,p;r:3,o,1,1e;4r:2;9,1s,y,y,3;9,3r,r;5;1g,5,1,1;r;12:2,6:2,7:2,9:3' +
+                ',m:5,j,i:2,5:2;n,4:3,h,7:3,j,1i:2,4,4,o;t;i,x:3,v,j,i,5:3;n,f:2,33;9,1g;r:2;1k;r,4,7,e,w,3,s,9:2,y:3' +
+                ',3,a,2:2,4;37,h:2;23;1:2,i,8:2,a,1:4,7,8,4,1,1,f,m,1,2,1,5,5,c,1,2,f,c,1,6,c:2,1;1g;i;e,7,6,o;2,3:2,' +
+                '4:8,5,d:2,g,7:3,2,9,e,1,8,7,b,b,1,a,c,4,4,h,a,1:3,1,2;5,6,3,11,1c,2,n,h,a,m,1;5,1b,17,6:2,z,8,t;2a;4' +
+                't;47;27;a;2a;2,g:2,6,3:2,p,9,14,1,13,a,6,1:2,d:4,2:7;21:3,17;1o,1n:3;r:3,t,o:3,1,1,x,l:2;g;9:2,2k;9,' +
+                '8:5,6:2,4:j,7,4:2,c:2,1:5,c,h,1:2,1:3,2,3,1:2,5,8:a,1,d:7,1,8:3,4:2,8:2,4:3,1:4,8,8:2,1,c,1,2:3,4;a:' +
+                '3,8,9:3,b,18:4,b,8:4,e,9,h,g,e,2:2,1;47;1p,29,1;40;4t;e;16,8,r:4,11:2,1:2,4,d:2,s:2;1e;2,7,t:5,6,6:2' +
+                ',2:3,9,c,2,4,3,x,9:2,h,8;3x;9,12,25,1d;2l,1,14;n,w,2m;1j,b,1h:2;s:2;r:2,b:2,6:2,7,9:3,1n:2,5:2;3o,j;' +
+                '5:2,4:8,6:2,2:j,5:2,1:e,3:6,1:9,1:2,6:c,2:c,1,1:4,1,4:f,1,4:8,1,2,1:i,4:4,4,3:b,9,1:6,2:5,1,1:9,5,1:' +
+                '3,1:q,1:3,1:5,1,1:d,1,1:3,2:6,2,2:f,5:l,1:8,3:2,9:5,1:f,1,4:3,5:2,1:3,6:i,1:2,3:4,5:f,1,1,1:2,5:c,1:' +
+                '2,7:8,3:4,1:3,4:3,6,2:7,1:5,3;1,4,4:4,6,2:5,2,2:3,2:2,2,1,1:7,3,4,1,1,1,1:6,2,2,1:7,1:2,3,1:2,1,1:4,' +
+                '1:2,1:e,1,3,7:2,2:2,3,5:6,2:4,1:2,1:2,7:b,2,2:4,2,1,3,1:2,1:c,5:b,1:4,c:2,1:3,1,9,1,6:2,1:3,3:6,3,2:' +
+                '5,2:3,1:5,4,a:4,4,9,2:2,1:2;3g;4,7,c:2,3,b,8,4,1,7:2,1:2,1:2,1:2,4,4:2,3,3:2,1:2,7,2,6,2:2,5,1,2,a,2' +
+                ',1,1,1,6,1,1,2,1,3,p:2,2,1:2,2,4,1,1,1,1,1,1;2d;40;4w:2,1;4x;r:2,b:6,d:3,9:3,l:3,e:2,k,j;1,q,b:7,8,5' +
+                ':2,9,1n,f;1q,27:2,1,v:3;9;1q;3x:2;1u,1;9;2,2w;9:5;1f,21;1g:2;2,l,f,d:3,1:3,8,9:2,1,3:3,2:2,q:2,1:3,u' +
+                ',13,4;1e:2;1e,13;1g,3e;r:7,22:5,20:2;2t;r,22;r:5,y,34:2;2,7,x,8:3,1c,l,w,7;b,2j;43;2;4h;4h;4v;8,g;2t' +
+                ':5;2,d,8,d,6,1,2,3,c,8,5,1,1,k,3,1f,s;9:3,5,3:2,6,4:5,3,5:2,1:2,2:2,1,3:2,1,1:7,4:2,2:6,2,4,4:2,4,4,' +
+                '4,3,1:4,1:5,7:3,2,2:2,2,6,2,3:5,1:2,2,6,4:2,4,1,3:2,1,2,1,9,1,5:4,1,1:3,1:3,5,2:2,8,2:2,6,1,4:3,2,1:' +
+                '2;1g;p,p;4e,f;n,44;1g,1d:2,1;23:2,q;4t;5,c:2,1m,n;13;n,x,q:2,b:3,m;n,x,12,l,h,4:2;47;5;2:6,2,m,g:2,1' +
+                ':3,1:2,5,b,4,k,6,5:5,1:2,6,h:2,7,9;16;4,1:3,y,3,7,1,a:2,z:8,n,1,5,2:2,9,q:2,6;16,1h:3,24;7,y,10,1x:2' +
+                ',p;5,1w,m:2,k;1,11:2,6,3:2,1i,1:2,2,e,1d;r:2,n,1,1:4,9,1,8,e:2,h,n,c,f:2,m;1e,1h;h:2,i,1,e,r,j:3,5,9' +
+                ',1d,2;5,1t:2;r;4t;1:3,8,i:3,3,5,1,2:4,4:2,1:2,5,2,2:2,g,1,8,i,3,j,e,a,u:9,2:3;;n:3;9:2;9,z:3,6:3,1z:' +
+                '2,1,1,5:2,c,f,1:6;3v;18;4t;47;12,e,1r,9,4,c;3r;2u,a;h,y,2i;12:2,c;2,7:3,i:2,b,d,1:4,h,d,j,1:3,5,a,9:' +
+                '2,i,7:3,k,2;2,7:3,15,2z,g;9;q,1m:2;n,4,41:2,1:3;h:3,d,8,1,3:3,1:4,1,4,3:4,1:6,9,e,4,9:2,4,3:3,2:3,5:' +
+                '2,h,2,1,1:2,1:3,3:2,1:3,4,8:3,1,a:2,3:3,2,1,b,4:2,2:2,1;4t:2;1j,b;9,8,h,h,1,b,g,m:4,c,b:5,4,c:4,b;27' +
+                ';9,3r;40;2q;j:2,8,p:2,3a,5;27;;1g;r,f;5,4:2,2,3,3,1,3,2,7,4,1,1,1,1,1,3,1,1,1,3,1,1,2,5,1,1,1,1,2,1,' +
+                '4,1,2,2,1,1,1,1,2,3,2,1,3,2,5,1,1,1,1,1,1,1,3,1,2,1,1,3,1,1,2,2,2,1,1,1,1,1,2,1,3,8,1,3,5,2,3,1,1,1,' +
+                '2,2,2,1,1,1,1,1,1,3;40;2;1e:2;l,2,4:4,h,8:3,i,9,5,2:2,2,d:4,e,1,c,5,6,h,f,1:4,1;10,c;9,r,7:3,5,8,d,h' +
+                ':2,6,d,1g,8:3,7;n,4,1d,6,w,i,h;4r;9,15:7,3g;1e:2;12,n,1,33:2;1e:2;1g,2r;1g,1e,20;9,e,2m,f,h;1x,x,u;1' +
+                '5,3m;;3g;3s;0,a;4t:3;1g,1d,20;2,e,b:2,h,6,2,8,9,d,k,7,r,11:5;1e,9,9,u,1,f:2,a;2;4u:2;;1:6,1,1,6:6,8,' +
+                '1:4,9:4,3:2,2,2,1,1,2:6,4:2,1:3,2,1:2,2,2:4,1:b,1:5,9:2,1:2,1,6:3,1,3:2,1:2,2:2,1:2,2:2,3,2:6,b,1:2,' +
+                '5:6,1:6,7,6:3,1,8:5,6,2,2,1,1,4,1:5,2,1:2,7,1,3,1,b,4:2,1:2,1:4,1:2,3;r,b,c,1:2,21:2;9,2e;2,q,x,v:2,' +
+                '6:2,1:4,1:3,r,u,g:2;2k;2;2;30;9,2l,1t;21;1f,1,a:3,13,1,1t,6;4r:2;2u,1y;e,11:4,1:2,w,h:3,1:3,y,f,6,g,' +
+                '2;1f,1b,4;1o,15:2,d,14,i;i,x:2,1:2,1d:2,1:3,m,1d;4d;22,1:2,1d,r;3k:2,c,g:2;2c,18;5,1w,2,2,1b;9,g,11;' +
+                '5,4:2,1p,e:4,2;r;47;a,a;1e;14,a,34;1g;r,17,10,6,13,l,1;9,17,1r,9,w;4s;16:2;1w;4c;9,x;3s;r,3,k,1f,1,m' +
+                ';12,35;3p;30;47;n:3,x;2;2;2x,n;9,y,2;37,1c;h,i,1,3:3,3,1,5,1,f,q,5:2,1:2,u,v,7:2;4d;4:2;9:6,i,b:2,2y' +
+                ':2,d;9:d,3r;9:6;1a;40;n;1e;3,o:3,y,16,1h:3,f,3;3g,4,c;1f:3,b,7,w:3;9,6,3l,s;9:8,c:2,h,6,6:7,2h,h,2;1' +
+                'g,2t;1q,14,u,9;37,10;35,1;2y;9;4:2,1,1w;8,4i;47;2x,2:2,6,1;v,12;1e;1d,15;r:9,b:d,c,2,s,1:4,c,8,e,l:3' +
+                ',14;n;k,h,z,5:3,1j;4u;n,31:2,14,1;z,1,2;o,3j:3;2t;1:2,11:2,2e;16;s;k;4r;8;2:2;2e;37:2;1f,21;9,j,x;1,' +
+                '3u;9,15:2;9:6,t:2,4:2,1:2,8:2,3,2,13:2,8,l:5,g,r;9,c,6:3,f,9,21,7,e,q;9:3;9;7,2:8,1k,c,1h;g,5,2b,16;' +
+                '9:7;2:2,39;16,8,2,x;12:2,4:3,8,m,1z,r;1o;47;9;p;4,1;4u;2,1d,i,1j;9:2,t,c,1,e,11,x;16,1:2,6,f,q,5:2,v' +
+                ':2,9;2;9,x,2:2,2:2,a,1r:2,g;2;2z;2a;18,7;o;9,x,1,1:3,6,r,i:2,o,1g:3;1,12,3k;25:2;4u;2:2,g,9,b:2,c,1:' +
+                '2,1:2,9,1,b,2,1,3,m,i:2,5:3,k,b,i:2,4;r,22;r;1j,b,1;12,1k;47,m;4t;1p:3,1,31,2;1g:2,1e:2,11:3;1o;3z;1' +
+                'y;n;4r;4r;9,1w,s;47;25;1x,2a;1p;4t;3j;1e,19,c;19;1o;3z,1;2w,8,6;1n,k,s,h;1f:2,6:2,2,16,1:2,8,5,c,1,c' +
+                ',j,2:2,b:3,2,1:3;2t,9,c:2,1:3;3b;r:2;l,1p,1i:2,3,j;f,c;9:2,15:6,16:2,d,1:2,1,2:3,4,1,17:2;1e;9:2,15:' +
+                '3,1j:2,2,6,1,16,i;1e:6,1j,1:2,1,6,1,1o;1e:3;9:2,15:2,1k,19:3;1e;2;1f,1:3,w,h:3,1:2,16,n;12,13:2,22:9' +
+                ',i;2,23,2o:2;1g,1d:3;47;5;8,u,d:3,1,9:3,1:2,k:2,j:4,1:3,6:2,f,1:2,r:6,k:3,1,1:7;5;1g,r,n,13;8,j:9,b:' +
+                '2,1r:5,1;a;r,22:6;k,2p;a;1e,3d,2;35,1,14;4j,1;4t;2t;39;9,i:2,b,4:2,2:3,7,s:3,i,r:2,4:5,3,9:2,b:7,5:6' +
+                ',h;47;3k,s;2q,1,n,i;3f:2;a,7:6,9,8:2,4,5:4,1,7,1:2,4,5,2:2,l:2,2,1,1:8,8,5:5,1:2,3,a:2,a,1,6:3,4,5:2' +
+                ',8,8:2,4;h:2,1z;47:2;4q;9;4e,f;7,v,d:2,q,8,e,9:3,g:2,w,f,2;3f:2;5:2,l,x,p,8,b,d,k,i;12,n,1b;1e;1p,1b' +
+                ';0;1j;2;a;1p,1b,9,1i,2;1j;9;a,2y,z:2,m;r:2,b:3,18:2,j:2,14;1f;1p;3l;4a,3;4;n,4,o,a:2,14,1c;1k,24:6;3' +
+                'o:2;2m;2,2a:3,v:2;37;r,2g,t,r,2;2c:4,1c,1,1;2c,1d:2;9;10,c,d,28;3f,5,n;9,y,7,r;p,2:2,b,d,1,9:2,1,1j:' +
+                '2,7,k,r:4,2:4;5:2,x,c,j,4,2,x,9,1i:3,2:3;r,16:2,2a,o;1,4q;r,b,e,h:2,6,y;4t;1y,2v;1f;1x;2,1j,1,i,8,m,' +
+                '8,r,i,2,d,1;2k;4r,2;u;47;2t,1i,j;e,2n:2,16,6;4d;40:2;5,1w,2,9:2,1l:3;2k,i:4,1b,2,2:3,d;2n;1f:2,1:3,1' +
+                'd:5,1,m:2;r,p:3,l;2c,1c;e,12:4,1d:3,1:5,1z;2t,1;1g,1e,1z:2;9;9,25,n;12;1o,1,34;8;y,t,1k,1g:2,2:2;3b;' +
+                '34;1l,1,1;1o,z,18;s,41;4t;39;4t;r,4,7:4,i,p,u;33;2t,r;1n,35;4t;2a;n,4:3,o:2,21:2,h,8;5,12,1g,1:2;4s;' +
+                '9:2,2f;22;1l,1,1,x,h:2,3;4b;1l,1,1;9,r,6,1,5;b,3p;1g:2;2d;b;1f:2,x,i,13;4r;2,1e:2;1g;n:2,4,1d,6:2,a,' +
+                '9,5:5,1,6:5,1:7,1:2,h:2,h,8:3,h;2e;4d;2n;r,k,n:2;1,4,b,7,2,1c,k,1,a,e,v;25,2;1y,w,m,1b;9;r:3,o,1f,h,' +
+                '5;r:2,b:2,c,2,n,24,n;1p,1r,4,c;12,2u,b:4,m;r:4,b:2,c,1,i,1j:2,1d;a;n,f,e,4,h,k,1,m:3,x;3s;2:3,o,i:4,' +
+                '2,e:a,w,3:2,o:3,12;2,39;47;3z,8;h,17,2t;y,q,3;12;1p:2,1b:2;9,3b;21,13,16;1l,1,1;z,1,c,1f,b,1f;2c,25;' +
+                '2c,1;42:2;7,18,21;16,3n;1i;r:3,n,1:5,w,i,1,m:3,h,h,d:2,2;12,c,1g,14,v;r:2,o:6,p:2,8:4,2,6,e:2,3,5:3,' +
+                'a:3,r:5,6:2;4b;3;1p:2,1b:2;9,z,1,w:2,1f:3,c,1,3;23;2g;2u,p,y,b:2,3;4s;3g,g;4t;21;25;9:3,h:4,i,t,b:2,' +
+                '1,b:2,6,8,e,4,c,1,6,9,1,2,c:3,3;40:2,e:2;2t;3q;12:3,d:2,a,1r:2,a,h:5,k;5,13;1:2,s,2x,11:2;o,3j;33;l,' +
+                '1k,15,c:2,g;4e;1e:2;1t;3z;23,18;2u:3;12,1a,1l;2c:2,21;3b:2;18,2,e,w,r:a,g,m,9:3;12,12,1:2,o:4,1,13:2' +
+                ',3,b,h;2t,14;1e;2;1k,k,1:2,7:3,h:3,j,l:3,w;1,11:3,12:2,2p;12:4,y,1:2,s,f,1l:4;2k,6:7,t;9,f;9:2;12,o,' +
+                '2h,m;12:2,2u;9;d,1s,f:2,6,1:2,a:4,c:4,1:6,1:9,h,h;2q,1,6,h:3,1:3,h,f,h;4s;1g,2r;2t:2,20;9,15:6;5;27;' +
+                '47;27;2:5,1n,1m,1e;1,8:2,y,8:3,x,c:2,1o;4r;h:5,6,4:2,1:4,6,t,l,3:2,1:2,1,5,7:2,e:3,h:4,4,d;n,5,2f,h,' +
+                '4:2,d;9,t:3,1r,e,i,3,11,1;2r;4:2,1:2,i:2,4,b:4,5,1:2,6:2,9,2:2,8,8:2,o:3,7,7:2,2,7,4:2,4,8,1:2,a,3,7' +
+                ',b;34;2u;4s;h:5,6,3,1:4,8,1:2,3,3,1,6,2,1,7:2,1:2,8,e,2:5,8:2,3:2,1:b,2,3,e,9:2,1:3,1:7,2:3,n:5,6,g,' +
+                '1;h:4,9:2,1,3,4:4,1,1:2,1:2,7,j:4,1,k:2,4:2,2,5,1:7,j:2,9,1,3:2,c:2;4,e,1u,c,e,d,h,e,5,2;h:2,9,1:2,8' +
+                ',1,g,r,5,c:5,5,z,f,m;3g:4,4:3,c,y;2t;q;2c;20,1,4,2m:2;2y,1:2,6:2,1:2;1e;1e:2,1k,1v;4c;9;16,a,2g;k,1g' +
+                ';39;1k,1z:3,r:3,i:2,3;2,7:2,t,6,2,e,1w,e,p,4,2:2;9,11;1o:2,1n;2:2,2:3,14,v:2,h,1t,6:3;16:2,9,s:3,i,r' +
+                ':4,4:5,c:2,g;4;h,1g:2,r:2,5,1e:2,g,4;s;5:3,1y;5,n,n:2,9,1,x,7,1:9,m;34;2y,7,1;9;4,28:2,c:2;47,k;1e,1' +
+                ':3,21:3;3f;m,1f,2;1g;r:2,o,1f,m,1d;9;4,13,7,a,d,1,1:3,d,4,f,6,2,4:2,a,p:2,9:2,1;1d,c,1v;5,4:2,t:2,e:' +
+                '2,n,9,l,1,7,1,1:2,e,t;e,c:2,i,i,a,1,w,a:2,x,8,b,5,1,1;1j,b;9,c,7:2,1k,1l,6,4,g:2;9,3u;f;2e;r,o,1f,m,' +
+                '1b,2;r:2,o:2,t,2,j,1,m;1,1,1n:2,l:2;5,2,v,e,4,1w,6:2,8,6,7,m;12,n,1;r:3,p,2h,v;5,1l,f;4t;20,1;h,a,o,' +
+                'i,r:2,t;12:2,12,p,1,4,u,m,g;1:2,8,8,a:3,b,c,1:2,1,18,6,m:2,1d;25;i,9:d,3,8:3,4,1,1,7:n,5,5:2,i:3,g,t' +
+                ':j,4:4,3:2,1,8:5,b:3,5,b,6:2,1;9:2;40;9,5,3:9,6,3:2,1:4,7:7,4,6,6:6,2:2,4,7:7,l:3,3,1:5,1,3:2,9:b,1:' +
+                '2,d,h:4,9:2,8,8:2;9,i:3,7,4,c,2,1d:2,e,q,g,g:4;3b;9,3b;5:2;f,8,31,1:2,8,8;2c,v:2,h:b,1:4;9,15:4;5:2,' +
+                '19,1t;n;9,15,1x,1i;1k,26:2;9;9:2;23;5;9,15,a,m,2,b,6:2,1w;h,h,i:2,w,h,1;r,n,1f;2;9;5;16,2:2,2:2,a,1r' +
+                ':2,g:2;18,g,23;1x,9,2l;a;2,7,t,c:2,b:2,8,13,9,1i:2,2,1;6,l:2,r:2,2c,d;1p,1b;9:3,8,7,3:2,1,a,1d,e:4,v' +
+                ':2,4:9;3x,a:3,m:2;47:6,m;47:2;9;1e,2;2a,j,z:2;4t;27,2l,3;2,2p;9,23:5,1v;2c:3;2c,h;12;2,1n,e;2c:2,1,2' +
+                '9;1,11:2,8;1o:2;3,4,k:5,b,d:6,1,4,1b,g,5:4,6,7,l,f;r;9,i:2,o;37;o,1m;k,3n;d;r,b,1s,1d;4t;12,v,8:2,12' +
+                ',d,c,v,2:2;1,m,4:2,b:4,4,k,j,12,5,p,2:2;r,y:2,8,4,3:2,5,12:2,1i:2;1x,2w;5:4,l,3h;37:2;37:2;9;9;1g;1e' +
+                ';2y,7,1;9:4,j:2,a;1g:2,p:2,1v,r;u:2,e,8,g,9,l,1a:4,4;2t;l,6:2,3:2,8:3,d:4,1:4,4,e,1,1,u:2,m:3,4,2,8,' +
+                '1,9,p:2;2t:2,20;r;a:2,s,3r;4;u,c,2,6,2,l,m,1:2,1,4,n:2,3,1,c:2,e:2,2,g;z,d,1i:2,1i,i;4,1a,1f;23;2:2,' +
+                '48:2;0,12;0,24;1b;r,1d:3,1:2,t,7,1:3,r,g:2;1f,21,y;9;p,2:8,b:a,d,1,9,1,b,7,1,1:c,j:9,a,l,9:3,h,d,2;2' +
+                't:2;3q;9:4,9:2,c:2,c:2,1:2,8:2,1:2,a:2,f:2,2,m:4,1:2,7,f:2,4,c,1:2,a:2;1p,1b;9:2,16,1f:2;2l,1d,v;4,1' +
+                'l,e,r,a,6,x,n:2;3;25;4b;n;9;n:9,4:8,b:9,d:3,1:4,l:2,4:5,5:8,2:2,h:5,a,3:2,1:4,1:2,4,4:5,c:6,5:3,8:7,' +
+                'b:3,e,2;1f,a,15,13:2;12;36;47,m;n,x,q:2,j,e,q,8,r;4x;4r;12,e,9:3,8,7:2,1,7,r,u:3;r,1j:2,2,h:4,14:3;2' +
+                'a;1,d,3:2,6:3,2,2:8,3,5:2,1:2,2:5,1,3:3,1,1:7,4:2,4,4:2,4:2,1,3,4,1:3,3:2,1:2,2,1:4,1:6,5:3,2:3,2,2:' +
+                '2,2,1,5,2,3:5,1:2,2,4,2,4:2,2,2,1,3,1,2,1,9,1,5:4,1:3,1:2,1:4,5,2,7:2,1,2:2,6,1,3:5,1:3,1:c,2:2;1,b,' +
+                '4,9:2,2:5,e,2,8,3,7,8,1,3,4:3,1:2,4:2,1,i,n,h,2:3,1:3,2:2,1:3,4:2,m;l,3,3,y,8,13:2,v,w,2:3;4u;1g:4;1' +
+                'g;r,19,1;30;o;n,26,1,1b;1g,1n,p;1e;3,3,w,d:2,5,1b,l,7,7,2,5;1e;2;23,q:2,14,v,2;1p:2,1i;f;2t;25;1e,t,' +
+                '2n;r:3;24;5:2;12;4u;2:3,7:7,3,4,5:2,5,1:4,b:2,4,9:7,2,q,o,1,e,6:2,4:5,3,6:2,3,1,4,1,r;2,p,5,1,5,36;1' +
+                'f,21,1b;3,3,1:3,5,4,b:2,4,7:4,4:2,9:2,5:3,l,2,19:3,4,2:2,8,2,3,1,2:3,p;1f,1e,1:2,1y;9:7,15,1f:2;8,1:' +
+                '4,7,c,1,9,6,c,d,4,4,1r,u;5,4;f;g:2,3r,7;2,16:2,g,e,19:2,1h;23:5;4s;n,1y,1,a,e,v;18,c,2j:3,k:3,4;18,1' +
+                'c,1t,a:2;5,1e:2,b,2d,k;1g,1d;2t;2;9:4,1e,1b,1d:4,h,2;2y,7,1;9:3;2x;2,3,4:5,37;i,5,3i;1p,14;1f,21;1f,' +
+                '21;22;9;r,1g;23;4u;47:2,n:2;4r,2;2n;4u;47;9,3r;12;3m;r:2,b:3,18:2,j:2,14;u,e,c,c:8,3:3,l:2,10,c:2,4,' +
+                '4:3,9,b:6;1w;1f:3,1f,m:3;4r;m,5:2,o,21,q;n,f,e,l,4:2,11,2,k:2,d:6,b,d;5,e,x,4,h,2,2:2,6,1:3,h,a:2,3:' +
+                '2,1,5,g:5,5:2,2,6:2,1,8,2:2;43;12,6;5;4,1,4,2,3,9:2,f,6,1:3,6:2,1,4,5:2,1,a:2,1:6,1:7,1:5,1:4,1:c,7:' +
+                '5,2,6:3,6,3:5,1:2,4:3,3,5:3,1:2,9,5:3,3,9:8,3:2,5,2:3,6:5,6,1,7:2,1:2,1:3;23,1:2;a:2,d,t,u,23;d,1u,r' +
+                ',1e;2,10,c,3f;;n;18;r,31,11;9,1u,y;h,q;9,h,o,a,20,p,a;12;9;r:2,o,21;s,a:2,2n,7;27;1e:2;4v;9;47;r,o,2' +
+                '1;1e,y;2,1d,1e,z,8,e,d:2,2;4u;9,i:5,h,6,2,o,3,3:4,6,d,1,h,4,1,f,w:2,2;;4t;1:2,6,k:5,o:6,1,17,6,1:3,m' +
+                ':2,8,3,1,z;1o;9;1a,2h;1e;9;9:2,q,1,2,6,1,3,2,1,1,5,1,1,3,7:3,4,1,3,7,h,b,b:2,1,3,1:3,q,i;18;9;2k,1q:' +
+                '4;2,3,4,2,3,3,1,3,2,7,4,1,1,1,1,1,3,1,1,1,3,1,1:2,2,5,1,1,1,1,2,1,4,1,2,2,1,1,1,1,2,3,2,1,3,2,5,1,1,' +
+                '1,1,1,1,1,3,1,2,1,1,3,1,1,2,2,2,1,1,1,1,1,2,1,3,8,1,3,5,2,3:5,1,1,1,2,2,2,1,1,1,1,1,1,3;13,5:2,1c:2,' +
+                '10,c:2,f,1:4,1,c:3;;9:3,g,2:2,f,1w,x,f;4o;9:3,8,a,8,1,1,2:4,3,1,5,1:4,f:3,q:3,2:4,3:2,1:2,c:3,i:5,v;' +
+                'n,4,7,1,1,1,2,6,c,1,1,1,3,5,6,2,c,8,1,2,1,5,1,4,3,1,8,1,2,f,h:5,2,6,2,1,4:2;4d;9,2,6,9,9,1,3:3,3,1,5' +
+                ',1:2,f:2,q:2,2:2,3:2,1:2,u:2,3,s,7:3;4,5,a,2,b,1,5,2,c:6,w,8,3,7:7,d:2,o,n,8,3;1:3,h,9:b,b:2,d:4,1:2' +
+                ',h,4,s:5,n:3,7;2u;2;2o;9:2,1g;1w;2:2,1e,r,n,a,1q;2u;2t,1,1z:4;1f,21;r,o,21,1b;1:3,11:2,v,1j,r,j,1:2;' +
+                '6,l,q,2d,7;1i;0,12;12,f;4;2a;1n,35,2;1e,1:4,1e:3,1;1f:5;40;1g,2k:4,e;9,3r:2;u;1f;9;1e;9;40;1:a,3:3,1' +
+                ':4,x:2,9:2,4:3,a:2,8:2,1:4,2,1,4:5,2,10,9:3,4,17,2,1;2r,16,3;1f,1f,1z;5,4:c,9,1:2,2:2,6:c,3:3,2:2,1,' +
+                '5:7,2,3,1:2,7:e,1:i,4:2,5,1,3,3,3,2,2,g,7,3:2,1:f,3,j:9,4,3,8:b,4,1:9,2,2:2,3:3,1:2,1,5:8,4,5,6:2;1:' +
+                '2,8:3,i:2,5,1,5,c:4,1:2,1,1,1z,f:4,5:2,8,1,5:5,d:2;2:3,3,4:2,15:5,1:2,1:9,1e:6,f,o,3,s;h,b,1n,e,v,4:' +
+                '6;r:2,b:4,1r,v,4:3;9,32;9;5;4:4,d,a,8,1,13,2,i,1;22,1;5:2,1y;40;9,1g;1:6,8:4,g,2:4,7,4:5,4,1:2,3,5:7' +
+                ',1:3,9,2,2,e:4,m:6,1:2,m:6,a,1,6,2,3,5,1,1,3,1,a,4:3,2;9,i:3,7,h:3,c,c,c,11,c;r,b:2,d,i,c,1t,c,d:2,2' +
+                ':2;l,6;3f;1k;2t,20;2;23;38;4s;37,e,p;5,1g,1,1;34;4x;21;12,1r:2,7:2,9,b,n,k:3,2:2;a;b;b,o,1,6,1,5,18,' +
+                '9,9,1b,2:5,2:8,d:2,1:5;32,1f:2;1f,x:2;4s;2;a;r:2;27;r:2,14,d,1,c,2b;0;n,1y,1,1j;23,y,j;1x,1j;4;1y;n,' +
+                's,5,h:4,3,1,7:4,h:2,1,13:a,8,b:3;3o;23,2,1v:6;21,4,1v,s;2;25:2,2n,2;r,7,q,3,p,14,1a;4u;2,4s;2c,1;1j,' +
+                '2g,u;2,4,3:2,1,3,4:2,6,4:5,3,4:2,2,1:2,1:3,6:2,5:2,1:4,1:3,1:3,5:2,1,1:2,1:2,1:3,1,1:2,1,5:2,d:2,2,1' +
+                ',3,2,5,1,5:7,1:2,6:2,1,4:2,1:3,1,2:2,4,1,2,2:2,4,6:2,2,2:2,1:3,3,7:2,3,7,2,4,4:2,2:3,1,1:2;1:3,7,1,c' +
+                ',3,3:3,k,3:3,7,1,3:2,i,5,2,2:2,d,f,8:2,4,b,c,6,1,d,4;4s;23;u,2h,1j;1b,m,c,1p,v:2;9:2,e,f,6:2,6,2,8,1' +
+                ',c,4,7,4,d:4,b,7,m,8,7,5:2,b,1;1e;2,9,4,c,4,9,a,1,1,1d,n,c:4,8,7,b,b:4;1f,5,1w;1f,s,19,1d;12:3,d,21;' +
+                '1e:3,2r;n,f,c:2,w,1e;2a;1f:2;9:2,t,18;r,b,n,7,u,23;1f:2;r,2g;12:2,3o,1;v,1,1,19,22,1,i;4r:5;1g;h,a,n' +
+                ',1,1,15,v,9;2:2,1n,1m,1j;2,1n,1b:2,f,1f:3;l:2,n,2:2,1x,4:2,d,2,1,4,7:2,l;4,2s,e,18;l,v:2,4,1a:3,1o,b' +
+                ';47;4d;9,8,a,n,1,1,15,v,9;4:4,1,g:2,5:2,h,g,1,8,g,1,7,r,z,2,1:6,6,1:2,1:3,1:3,1:3,1:4,1,3,2:2;4d;4e;' +
+                '5:2;30;r,b,c:2,u,1;37:3;s:2,s,d:6;9:2,2s;4:3,21,2p:2;3:2,p;4e;h:4,i,1:2,6,6,2,2,9,r,7:2,1:4,3,m,2:2,' +
+                'h,e,2;2:3,3y;2;39;1g:3,2f:3;25;1g;5,j,e:3,6,28,g,v;9,16:2,1,9:3,1,14,m;2o,r,y,g;33;1g;2t;47;8,u,i,d,' +
+                '4,4,1r,u;2,4s:2;r;r;1:4,5,a,b:2,b:6,h,e:5,1:3,2:2,1:2,4:3,1:3,n,11,2,5,q:2;1,2s;3g,1e:2;p;9:2,17,k,1' +
+                'g,r,k,2;47;;;1p,2s,c;21,t,1u,7;5:8,1b,p,p,16;16,1r;4,1,4;27;r,b,n,2i;q,3n;h,3q;1e:2;47;5:2,4m;e:4,p,' +
+                '5,f,k,5,8,e,1,h,x;1x,9;27;3e;5,19,1a,v;4,n,m,2,1,9,c,4,j,5:2,n,8,c,t,4;r,b:2,4:2,9,s:4,i,r:4,4:6,c:3' +
+                ',g;9,8,y:2,1,2k,j,1,3;4e,f;4e;c;16,35;2:4,7:4,h,j,c,1,1,2,d,3,f,a,6,1,3:2,b,s,4:2,i,1;9,5,l,3,3q,2,1' +
+                ';30,2,1d,f;r,o,21,1b,2:2,1;3g;9,9,9:5,p:3,k,19,n,v;a;0;9,x,1;4e;9:2;n:5,x,2l:2;r;27,19;9,16:2,p;n,x,' +
+                'q:2,j,e,q,8,r;1k,h,16,y,r,1:2;36;2:2,7,16,a,i,3,p,j,e,4:2;;9:2,t,e,20,4;9,l,e,6,1,n,z,j:2;37,4,5,k',
+    },
+  },
+  typeahead: '3,m:12,1r,4s,1,y,n,1x,9,1f,1u,3v,4h,4e,29,2,4v,17,2f,3q,42;4,8:12,1r,4s,1u,4h,4v,21,4u;a,e:1r,y,2,17' +
+             ',1,n,1f,12;m,11:29,12,n,1,4u,9,1v,1u,1e,1o,2a,1a,2n,2f,3q,1x,23,42,5,1f;n,s:4u,23,5,1e,12;11,18:1e,1' +
+             '2,1b,3p,3o,2f,3l,4u,1,31,l,2k,9,3g,4d,3w,3k,n,1p,47;18,1e:1,12,y,r,2t,2a,9,1e,1f;1e,1k:12,1r,y,1a,16' +
+             ',1x,9,25,1o,4u;1k,1o:27,4s,n,2t,3g,12,1e;1r,1v:y,n,2,12,9;1v,20:45,1r,y,n,9,3g,1f;20,6m:9,1,12,4r,4t' +
+             ',3g,47,1e,1f,2a,3,6,5,25,r,a,21,4e,1g,0;22,2b:3,6,3u,2,4r,4t,1v,1f,40,9,33,1k,36,25,3g,1i,4x,4k,n,4j' +
+             ';2b,2m:4r,3b,38,4t,i,3o,4u,3k,1c,z,10,h,2,12,1,1x,n,17,5,16;2b,2z:4r,4h,3z,r,i,4t,47,3b,12,n,37,3,1t' +
+             ',1,5,1m,25,38,21,1n;2f,2j:38,i,3b,h,12,1,1x,n,5,4r;2q,2z:4h,3z,3,1t,1m,1n,37,4r,n,i,25,47,45,1,21,r,' +
+             '1g;2s,2w:4h,1m,25,47;2z,35:1g,o,16,33,3n,4x,18,4h,2g,4u,2a,23,2c,40,2,9,3k,1e,4r,3g;2z,3d:1e,2,1g,3k' +
+             ',o,16,4a,2t,33,3n,4x,1o,2n,3s,18,4h,2g,4u,2u,2a;31,35:o,4x,18,2g,4u,23,2c,1g,2,16,3k,4r,3g,r,1f;36,3' +
+             'a:2,1o,2n,2u,1e,2t;3k,43:1b,2a,3h,3x,12,4t,1,47,1e,2n,z,1o,2u,n,2t,1n,4n,4s,2c,1g;3m,3u:1b,3h,2a,3x,' +
+             '12,1,z,7,42,1e,1t,37,1k,3m,3l,3b,u,1x,3z,4h;3n,3s:1b,1,12,z,7,42,1e,1t,37,1k,3m,3l,3b,u,1x,3z,4h,2u,' +
+             '1o,2c;3n,3u:1b,2a,12,1,z,7,42,1e,1t,37,1k,3m,3l,3b,u,1x,3z,4h,2u,1o;43,47:0,a,r,3b,2a,4e,4s,3o,18,4r' +
+             ',12;47,4n:g,5,3y,4,37,21,4j,3l,2z,1f,9,2r,3g,47,4e,4h,4u,1w,2d,24;4n,54:1,4v,47,43,12,4c,25,21,9,h,3' +
+             ',2r,1e,2t,1a,2i,1s,2d,a,q;4o,54:4v,47,43,1,4c,25,21,h,3,12,2r,1e,2t,2i,1s,2d,a,9,q,2;4r,4y:43,47,4v,' +
+             '2r,25,9,2,15,2b,26,12,1,3z,21,3g,1f;4s,4w:4v,2r,15,2b,43,26,1,3z,47,21,3g,1f,12,9;4y,54:3,2t,a,2a,1,' +
+             '4c,47,1g,h,r,25,12;4z,54:3,2t,a,2a,1,4c,47,1g,h,25,12;54,5e:6,7,4e,3g,1f,40,1e,3w,1o,s,4w,4f,32,5,2l' +
+             ',1k,3i,e,3s,4h;58,5c:4e,40,1e,9;58,5e:4e,1o,4f,32,40,3i,4h,1e,2n,3w,9,3k,3g;5e,5y:9,a,8,3d,4t,1e,4r,' +
+             '1k,0,2z,12,1t,p,2e,3z,42,17,28,4q,2g;5m,5q:9,1e,p,4t;5m,5w:9,0,4t,1e,1t,p,2e,3d,3z,42,12,17,2g,4s,h,' +
+             'r;5y,62:9,p,c,42,1c,z,2n,16,1g;5y,63:9,p,c,2a,42,1c,z,2n,16,1g;5y,67:9,40,4s,p,c,2a,42,b,1c,z,2n,16,' +
+             '4r,1f,17,23,4t,1p,25,1g;67,6c:b,27,39,25,2k,23,3w,17,3r,4b,3k,2n,16,4a,1c,z,2g,12,3o,1g;68,6c:b,27,2' +
+             '5,2k,23,3w,17,3r,4b,3k,2n,16,4a,1c,z,2g,12,3o,1g,3g;6c,6g:i,1x,n,9,4m,1z,2s,4l,2p,2i,1s,19,4f,11,4o,' +
+             '1d,22,1m,35,3i;6h,6m:1,f,s,m,46,3z,4e,4r;6m,8z:9,2,f,1e,4c,18,1l,2r,4v,1o,4e,12,4b,3s,4t,2k,c,19,1h,' +
+             '5;6n,73:2k,3s,4b,1l,4v,1e,2t,3o,4t,2,12,3q,1i,r,3v,33,4e,4d,5,36;6x,72:1e,1i,3v,4e,36,r,2r,2,45,3o,1' +
+             '8,n,4t,1f,2t;77,7b:c,1h,l,1k,9,4e,4u,12,18,25;77,7t:c,1h,3z,4v,l,12,21,3b,1k,2t,9,1o,f,23,2,47,3v,4o' +
+             ',2m,1e;7l,7q:f,3z,2m,3o,21,23,1g,4r,2t;7t,7x:1e,8,9;7x,82:4c,4p,2o,9,2x,2c,16,4u,s,3x,1q,3w,18,5,z,1' +
+             '0,2k,2n,23,h;82,8a:18,3l,19,b,4c,9,0,p,34,2o,23,1a,3r,4n,4a,3g,3b,3k,37,3w;8a,8o:2,4e,1q,9,1p,2r,5,4' +
+             'r,d,e,4t,4b,4u,3w,1e,l,39,30,35,47;8c,8g:4e,9,1q,1p,4r,d,e,4t,3w,2r,l,39,47,0,35,4u,4d,1e,12,1f;8c,8' +
+             'k:4e,1p,9,1q,5,4r,d,e,4t,3w,2r,l,39,30,47,1e,0,35,4u,4d;8k,8o:2,4b,2r,1q,4u,1n,2y,3f,2z,34,1m,35,1l,' +
+             '36,4s,1e;8o,8s:f,n,3p,36,2m,3o,1k,3s,21,37,1g;8o,8z:f,1o,36,37,4f,32,11,19,1m,3e,1l,2p,3d,22,4o,2s,4' +
+             'm,3h,n,1r;8t,8x:20,4t,a,o,r,47,21,9,12,1e,3g,1f;8z,f7:r,27,4t,1f,3g,1p,47,12,35,1x,4r,1g,25,b,2,9,3v' +
+             ',21,5,3o;90,9y:g,35,3g,1f,12,r,1p,1,2t,25,4e,n,26,j,16,4t,47,5,b,2a;93,98:35,r,25,n,45,38,3w,12,2t,2' +
+             'k,2a,3o,3k,4d,4t,4r,1p,3g;93,9a:35,r,25,n,45,38,3w,4d,l,4t,3b,3v,3y,12,2t,q,2k,1,18,2a;9f,9p:12,j,47' +
+             ',1,1p,2a,r,5,2t,37,33,4x,24,4e,3x,3z,3s,2u,1x,21;9p,9t:3g,1f,1,4e,27,5,26,2z,31,4n,1e,40,3x,25,12,9,' +
+             'r;9u,9y:26,h,21,1b,3l,b,3p,1x,3e,22,1p,4r,4t,27,23,1e,n,2t,2u,r;9z,a7:12,40,o,43,3v,4n,16,1,4e,4r,2t' +
+             ',3g;a1,a6:12,43,3v,4n,16,1,4e,40,3g;a8,al:h,27,2,2u,4h,1f,4f,32,1r,24,47,18,4c,4s,3z,21,17,3o,5,4v;a' +
+             '8,b1:j,2,h,3o,b,i,3l,2u,27,2r,4u,4t,3g,4c,1g,1f,18,3w,5,47;a9,ag:h,2,2u,4h,4f,32,1r,24,18,4c,4s,21,1' +
+             '7,3o,5,4v,3x,1f,3m,b;ab,af:h,2u,4h,4f,32,1r,24,18,4c,4s,21,17,3o,5,4v,3x,1f,3m,b,1p;ag,al:27,3z,4t,4' +
+             '7,1f;al,aq:3o,3l,b,34,20,1m,1l,31,5,23,1n,4u,3p,4a,2,12,37,r,27,2a;am,aq:3o,3l,b,34,20,1m,1l,31,5,23' +
+             ',1n,4u,3p,4a,2,12,37,27,2a,1x;aq,ay:j,i,3g,3w,2u,1g,4t,x,49,w,48,14,4i,3v,4c,4d,18,l,h,2r;b2,bg:k,4u' +
+             ',2c,2y,47,23,35,5,3i,4b,36,2r,2d,3f,4,4e,21,10,4j,4f;b6,bb:k,2y,2c,35,36,47,10,4j,4f,1r,1w,y,32,1k,3' +
+             'e,q,h,4a,4h,3j;bb,bg:4u,5,4b,2r,2d,23,3f,34,21,3i,4,2c,1p,37,1f;bh,eg:27,r,4t,1f,1x,47,1g,3g,1p,4r,3' +
+             'v,q,21,p,35,33,12,25,2y,1e;bj,bo:1p,21,4d,40,4r,1e;bj,bu:1p,23,1e,21,5,2c,4,2a,3x,3o,4d,40,37,4r,h;b' +
+             'u,cs:1x,n,m,l,4t,25,r,1f,47,4r,3v,31,36,3s,f,33,2r,1p,b,2;bx,c2:3v,39,8,2k,1j,b,l,q,1e,4d,2a;c2,c6:3' +
+             '3,3p,1f,25,47,3s;c2,c7:33,3p,2r,1f,25,47,3s;c2,cs:n,m,4t,l,47,r,25,31,36,3s,4r,f,33,2r,1p,2,e,40,3z,' +
+             '3x;c8,cf:31,2o,47,9,4r,4u,2,24,b,1e,40,22,1p,12,3x,25,3g;c9,cd:31,2o,47,9,4u,24,b,22,1p,3x,25,4r,3g;' +
+             'c9,ce:31,2o,47,9,4r,4u,24,b,1e,40,22,1p,3x,25,3g;ci,cn:n,m,f,4g,4t,3s,1g,36,3x,25,r,21,38,3c,2b,j,4r' +
+             ',33,2u,45;cn,cr:4t,36,35,34,4p,5,31,2r,30,1p,3b,23;cn,cs:4t,36,35,34,2,4p,5,31,2r,30,1p,3b,23;cs,cx:' +
+             'o,33,1f,47,1p,28,v,4q,3,3n,1k,29,12,r,3g,27,21,18,25,4r;cs,e1:27,1f,p,3g,q,r,4t,47,1g,3v,o,33,4,4r,1' +
+             '2,u,3m,21,1p,i;d0,d6:3v,1g,1f,3g,u,4b,4t,9,4e,1p,2u,47,r,3w,3k,44,2x,i,2q,l;d7,db:p,r,17,14,4i,1t,2j' +
+             ',g,9,3z,2y,1k,4e,16,12,4r;db,dg:4r,4t,12,i,1x,21,1g,25,3o,3s,47,1f,1e,9;db,dk:4r,3g,4t,12,7,1f,3m,41' +
+             ',i,1,1x,21,4c,1g,25,3o,27,40,3s,47;db,dq:4t,47,4r,12,r,i,3g,3o,a,7,1f,3m,41,24,38,39,1,1x,21,4c;dg,d' +
+             'k:3g,7,3m,41,1,4c,1f,27,40,4t,r,12;dk,dp:47,4t,r,24,38,39,i,3o,12;dq,e1:q,27,4,4d,1o,3m,1e,21,13,5,2' +
+             '5,3l,3w,4j,3k,4c,3g,47,1p,r;dx,e1:4,3m,5,q,4d,1o,4j,47,21,25;e3,e9:b,4c,u,1x,5,4v,9,3k,e,18,2k,r,37,' +
+             '23,1o,2n,27,3w,12,25;e4,e9:b,u,1x,5,4v,9,e,2k,r,37,23,4c,1o,2n,27,3w,12,25,2c,1g;eg,ew:s,1p,17,9,4r,' +
+             '16,n,2z,25,1s,2g,i,v,w,48,4d,4t,13,2t,3w;ei,en:1p,16,17,2z,4d,13,3w,d,4h,3f,3b,44,4v,40,2r,2e,2i,1c,' +
+             '1s,z;en,er:i,4r,25,4t,3g,1f;er,ew:s,n,v,w,48,1p,17,1x,2f,4r,2h,h,x,3o,49,37,3s,2m,26,1s;es,ew:s,v,w,' +
+             '48,1p,17,1x,2f,4r,2h,h,x,3o,49,37,3s,2m,26,1s,2g;ey,f6:t,3f,37,29,2g,s,9,1d,11,4c,1k,r,1r,2t,y,17,3d' +
+             ',4v,3h,4o;ez,f3:3f,37,2g,1d,11,4c,1r,2t,y,17,3d,4v,3h,4o,4b,2u,4d,3e,1a,2n;f7,j5:4r,4t,r,2,47,1e,1p,' +
+             '17,39,18,4u,4a,16,5,u,4s,14,v,29,1g;f8,ff:4a,3p,4q,2,2y,4c,37,2k,5,3o;ff,h6:4r,4t,47,r,39,29,u,v,z,1' +
+             'q,28,1p,12,1g,3w,4s,y,11,10,2;fi,fp:v,u,y,w,x,3s,8,1f,r,4r,1g,3g,2u,4s,h,q,3v,47,1h,2g;fq,fx:2l,4x,4' +
+             '7,2g,l,3v,4r,5,2c,3b,r;fy,g2:z,11,10,1g,16,2y,18,3i,23,1c,q,4h,2k,17,4d,2o,1e;g6,gf:5,22,44,2u,1a,21' +
+             ',3x,23,27,3s,2a,12,47,1g,4t,r;gf,gj:3p,1q,2c,1e,47,r;gf,gu:39,4r,4t,47,i,1p,1q,31,2q,4c,r,4s,3w,12,d' +
+             ',3f,27,25,e,2p;gj,gq:4r,4t,39,1p,47,31,2q,4s,12,d,3f,27,i,25,r,1q,e,2p,13,2r;gj,gs:4r,4t,39,i,1p,47,' +
+             '31,2q,4c,4s,3w,12,d,3f,27,25,r,1q,e,2p;gu,h1:r,3x,3w,3k,1e,40,q,3y,3n,2a,1q,24,4u,4h,4d,36,47,25,3b,' +
+             '4r;gw,h1:r,3x,40,q,3y,3n,2a,3w,47,25,3b,1e,12,3k,2t,2u;gx,h1:r,3x,q,3y,3n,2a,3w,47,25,3b,1e,12,3k,2t' +
+             ',2u;h1,h6:2,1p,2b,u,30,1q,47,3v,4t,4r;h6,ha:14,l,e,1e,1q,44,3v,2u,1k,40,4t,9;h6,hc:14,l,1e,e,1q,44,9' +
+             ',3v,2u,1k,4a,q,40,4,5,2,4d,4t,3g;h6,ic:14,15,1e,1w,4r,4v,l,40,e,38,n,1f,5,1p,4t,25,3g,2,2u,27;hd,hi:' +
+             '4v,n,1e,1f,5,4r,4h,45,9,1y,1x,42,1p,i,2r,1r,y,3f,4e,1g;hd,hj:4v,n,1p,1e,1f,5,4r,4h,45,9,1y,1x,42,i,2' +
+             'r,1r,y,3f,4e,1g;hd,hk:4v,n,1p,e,1e,1f,5,4r,3o,4h,45,9,1y,1x,42,i,2r,1r,y,3f;hp,ht:4r,3y,1i,v,1d,2y,2' +
+             'n,4t,1f;ht,hx:3l,39,4v,2,3x,4s;ht,i9:15,1w,25,3q,3l,2,39,40,4s,23,4o,2r,4e,30,4b,1n,4v,18,3w,1k;hz,i' +
+             '5:15,1w,25,23,4o,4b,1n,18,3w,1k,3k,21,3b,17,27,5,r,3g,1l,4l;i1,i5:1w,25,4o,4b,1n,18,3w,3k,3b,17,27,5' +
+             ',r,3g,1l,4l,44,2p,1m,1z;i5,i9:3q,4e,30,40,1p;id,in:31,k,2z,2,1e,r,3s,37,3x,2q,1w,1n,h,3g,9,2t,1g;in,' +
+             'iu:17,16,18,1a,19,2x,3r,4n,2o,2n,3l,4,4d,5,2c,3b,1o,13,37,4u;in,j0:17,16,18,1a,19,2x,9,4,3r,4u,4n,2o' +
+             ',2n,3l,2r,4d,5,h,2c,3b;iu,iy:2r,4,4u,9;j5,mm:4u,2r,47,1e,4r,1p,1x,1f,1d,2u,2l,4t,1c,b,r,3g,12,n,23,3' +
+             '0;j6,jb:26,41,4e,1x,3,g,31,2r,3f,1p,4r;j6,jg:i,18,26,41,4e,1x,3,35,g,31,36,2r,3f,3b,1o,5,2u,3o,1p,4r' +
+             ';jb,jg:i,18,35,36,3b,1o,5,2u,3o,1e;jh,jo:4u,2r,18,1p,3r,q,1a,2c,e,39,3f,1m,30,1l,4h,2g,3b,3h,1n,4f;j' +
+             'j,jn:4u,18,q,2c,2r,e,3f,1m,1l,4h,2g,3h,1n,4f,32,11,34,3i,1p,4d;jo,jt:2u,4a,30,1b,1q,1f,1g,3s,4r,1,5,' +
+             '47,3g,25,12;jo,jw:30,3s,2u,47,31,4a,1b,1q,4e,1f,1g,4r,1,5,3g,2c,25,12,2t;jz,k9:2l,1f,n,2a,21,1x,1w,3' +
+             'b,2j,q,6,3u,t,4t,3k,23,40,r,1k,l;k1,k5:1x,3b,2j,6,3u,t,3k,r,l,4e,12,4r,3g,2a,27,16,21,1f,4t;k9,kd:33' +
+             ',3,3q,4r,4t;kd,l0:47,1p,27,4t,4c,4u,12,b,4r,34,3g,2o,a,30,1q,21,e,4v,37,h;kj,kn:47,1p,4t,30,4r,1q,k,' +
+             '39,12,a,3g,1x,3v,1,4u,21,37,2c,1f,r;kt,ky:4c,27,3g,3w,4p,3l,3k,b,34,21,2o,2q,1w,37,10,2u,h,1f;l0,l5:' +
+             'n,45,38,21,4r,2u,3g,1f,9;l0,l6:n,1v,1u,45,38,21,4r,2u,3g,1f,9;l6,la:1d,1c,z,10,11,13,2k,3k;l6,lc:1d,' +
+             '1c,b,2k,1e,z,10,11,13,4h,23,3k,2t,2u,1f;lc,lg:4r,2r,1e;lh,ll:1x,47,2t,34,4a,3q,2e,3h,3l,20,31,1r,y,3' +
+             'f,4s,3x,2u,23,1,3k;ll,lq:23,5,1g,11,3z,4t,21,1y,1j,3q,35,1x,1r,y,47,1e,4e,36,2u,4s;ll,mm:2r,1e,1y,23' +
+             ',r,1x,9,t,4u,1f,2k,5,3q,4t,37,1g,2a,3g,4e,2u;lq,lz:12,r,4g,2y,34,t,22,37,45,2c,n,25,9,3g,2t,1f;ls,lz' +
+             ':4g,2y,34,22,37,45,2c,n,12,25,9,2t;m2,mf:1e,4u,2a,1f,1y,1p,3m,9,42,4h,2m,3q,2l,2u,l,39,4t,31,3g,25;m' +
+             '4,m8:2a,1y,1p,2u,4t,3g,1f,3s,1q,2r,30,r,1x,4u,4r,2t;m8,mc:4h,4u,25,37,1f;mf,mj:g,4e,2r,3f,23;mf,mm:1' +
+             'y,g,1x,4e,2r,3f,23,1e,9,r;mm,oz:1e,9,47,2r,1i,n,1j,d,1y,1k,21,4t,1g,3o,2t,38,1h,4d,45,3e;mn,n3:1y,38' +
+             ',21,3o,4,r,n,45,4x,4r,1x,2t,1k,37,4t,23,g,f,9,4w;mt,my:21,3o,4x,4,45,n,37,f,2t,4w,36,4r,3p,r,34,31,2' +
+             '3,4t;n3,n7:1e,9,3b,b,34,2,4a,5,4u,2u;n7,nc:2r,3e,1e,2s,d,3f,2k,31,1c,4d,10,4s,3w,3d,9,1z,2p,2z,3j,4b' +
+             ';n7,nu:2r,1e,3e,9,1g,2s,d,1f,2,3g,31,47,4s,3w,4d,4t,3f,2k,3o,2t;nc,nk:1g,1f,3g,47,3w,2,3k,2t,9,i,31,' +
+             '3b,4d,27,4s,4t,2u,1e,r;nu,o0:1h,9,13,12,v,4u,1p,l,4d,5,1k,18,25;o0,ok:1i,1j,2b,1m,37,25,3y,36,2y,1k,' +
+             '47,3x,4e,40,4t,2t,21,2m,1e,29;o1,o6:29,4b,47,3f,2r,2y,12,13,3z,1e,3x,4h,36,2k,45,2c,3o,n,2t,25;o2,o6' +
+             ':29,4b,3f,2y,12,13,3z,3x,4h,47,36,2k,45,2c,3o,n,2t,25,4r,3g;o7,og:1j,2b,1m,3y,25,36,s,2x,o,2u,d,37,4' +
+             't,35,1k,2y,1q,40,26,4e;o9,of:s,2x,o,3y,d,35,2y,1q,36,40,4e,1e,4r,1p,4t,47;og,ok:2m,c,41,1i,3h,g,42,3' +
+             '2,21,4e,40,3x,3g,2t,1f,9,r;ok,os:1t,4r,4a,3a,40,30,13,4e,1,1p,4d,4t,47;om,oq:4a,3a,30,13,1p,4d,4t,47' +
+             ';os,oz:47,27,e,d,30,2m,11,31,z,4d,10,2,1p,n,1g,2t,12,r;ou,oy:e,30,2m,27,11,z,4d,10,47,n,1g;oz,qi:9,3' +
+             '7,4n,1k,5,1a,1o,4v,30,1m,1l,4t,1n,r,1p,1e,2,1g,3g,3o;p3,pd:30,1,4j,r,2u,4r,l,1g,3v,4t,4,5,1f,2t,4a,1' +
+             'p,24,3b,4u,3g;p4,p9:30,1,5,1f,4a,1p,4t,r,4r,1g,3g,2t;p5,p9:1,30,5,1f,4a,1p,4t,r,4r,1g,3g,2t;pi,pm:1k' +
+             ',9,4v,2u;pn,pw:1m,1l,1n,4v,4t,9,a,0,4s,1e,4,4r,35,2y,2,36,2t,39,u,i;pw,q3:37,5,8,o,44,e,1w,2a,23,21,' +
+             'n;pw,qc:1a,1o,37,5,3b,8,o,16,31,44,e,9,2c,1w,3r,2a,23,18,21,4u;px,q1:37,e,23,5,21,n;q3,q7:16,31,5,1y' +
+             ',45,3s,3o,2c,3g,2t,1f,r;qc,qh:4n,1g,2k,40,1e,3k,4d,18,9,3g;qi,s7:1,2d,1p,2c,4,3s,47,r,12,1f,1q,1y,3g' +
+             ',1e,37,9,4n,5,4t,18;qj,qx:o,1s,b,3p,4n,4t,43,2,3o,30,37,23,4c,1e,1,3k,18,1f,9,2c;ql,qq:3p,4n,43,3o,3' +
+             '0,4c,3k,18,2c,47,4r,4t;qr,qv:o,2,37,23,4t;qr,qw:o,b,2,37,23,4t;qx,r4:1y,4,r,2c,2a,1x,3g,1f,1p,4r,2t;' +
+             'qx,r8:1y,r,1p,4,3w,1f,3g,2c,2a,4r,4a,4c,30,18,u,1x,1n,2u,2k,3b;r0,r4:1y,r,1x,3g,1f,1p,4r,2t;r8,rc:2d' +
+             ',4m,4p,2c,4k,q,4l,4j,5,4o,3b,1w,4n,4,4c;r8,rr:2d,3x,4m,4p,2c,37,4u,5,12,26,47,1t,1x,k,r,3z,2a,3g,4a,' +
+             '1f;rc,rk:3x,37,12,26,1x,r,2a,3g,1f,17,0,28,47,2t,1d,2c,1p,3i,3p,1q;rf,rj:3x,37,1x,1d,2c,3i,17,1e,3o;' +
+             'rr,rw:3s,9,2o,3,2c,6,3u,s,3z,3o,2n,17,1e,h,2t,r,12;rr,s3:3s,1p,1q,4,3a,9,2o,3v,2w,3,2c,1e,3q,2t,42,6' +
+             ',3u,1a,j,5;s7,v5:4t,4s,4r,4u,2t,47,1e,23,1n,39,2m,9,1r,4,3z,2u,2a,3o,3r,r;sb,sj:3z,4c,47,43,34,9,3k,' +
+             '18,3w,27,23,2u,2t;sc,sj:3z,47,43,9,3k,18,4c,27,23,2u,2t;sf,sj:47,43,3k,18,4c,27,23,2u,2t,9;sl,t2:47,' +
+             '1e,4t,23,43,39,4r,3l,30,i,4,16,2a,22,40,5,2k,3w,1g,3s;sp,t2:47,1e,4t,39,4r,30,i,23,2a,40,1g,3s,1x,3g' +
+             ',1f,12,9;ss,sx:1e,2a,4t,47,4r,3s,1x,3g,1f,12,9;ss,sy:1e,4t,2a,40,47,4r,3s,1x,3g,1f,12,9;sy,t2:47,30,' +
+             '23,4t,1g;t2,uv:2t,4u,4t,2m,1r,4r,39,3r,r,1a,9,2o,3o,1o,23,12,37,1e,n,40;t3,th:1r,2t,4t,r,2a,2n,3x,27' +
+             ',2u,4r,4m,4d,26,3f,2c,4s,1o,i,9,12;t4,t8:27,4r,26,i,12,4c,2t,3n,3w,23,2,1x,2q,1w,4d,36,2c,37,4t,r;t4' +
+             ',t9:27,4r,26,i,12,2o,4c,2t,3n,3w,23,2,1x,2q,1w,4d,36,2c,37,4t;ta,tf:1r,2t,2a,r,3x,2u,4m,4t,3s,33,h,1' +
+             ',q,2g,1e,2k,21,3o,1g,4d;ta,th:1r,2t,2a,r,2n,3x,2u,4m,4s,4t,1o,3s,33,h,1,q,2g,1e,2k,21;th,to:2j,2o,1d' +
+             ',3r,3i,1a,h,z,10,1p,1,5,3o,4t,1e;tj,tn:2j,2o,1d,3r,3i,1a,z,10,1,5,3o,1e;to,tt:2m,n,2t,u,3s,1k,3o,37,' +
+             'r;u1,ua:9,2r,33,2y,23,40,2o,3o,4u,2,1e;u3,u7:2r,23,40,4u,2;u3,ua:2r,2y,23,40,3o,4u,2,9,1e;ua,ul:4p,4' +
+             'r,2v,3r,12,4n,1a,40,m,46,3c,2b,3z,4g,39,1o,4e,4u,17,37;ua,uo:4r,4u,4p,2v,3r,12,4n,1a,40,m,46,3c,4t,2' +
+             'b,3z,4g,39,1o,4e,17;ud,ul:4p,2v,3r,12,4n,1a,40,m,46,3c,2b,3z,4g,1o,4e,4u,17,37,n,18;uo,uv:39,q,3r,1a' +
+             ',47,1o,1g,2t,3g,4t,1f;uy,v5:1n,4s,1l,1m,2g,3j,4d,4u,2u,2d,4v,1d,1x,3l,4h,1e,2k,2c,1g,4t;uz,v5:1n,4s,' +
+             '1l,1m,2g,3j,4d,4u,2u,2d,4v,1d,3l,4h,1e,2k,2c,1g,4t;v1,v5:1n,4s,1l,1m,3j,4d,4u,2u,4v,3l,4h,2k,1g,4t;v' +
+             '5,vc:16,1t,1s,z,2n,1c,9,5,1k,17,3i,r,11,4n,1g,1d,1o,3a,42,15;v7,vc:16,1t,1s,z,2n,1c,9,17,3i,r,11,4n,' +
+             '1g,1d,1o,5,3a,42,15,4h;v8,vc:16,1t,1s,z,2n,1c,9,17,3i,r,11,4n,1g,1d,1o,3a,42,15,4h,12;vc,vr:1u,1v,1k' +
+             ',2n,12,1j,2o,11,36,29,1,z,10,45,39,o,n,3s,r,9;vd,vi:2n,2o,11,z,10,34,2c,e,31,1o,12,23,2u,9,4r,1g,4t,' +
+             '2t,r;vj,vo:1u,39,1v,o,3s,1j,1y,12,1k,36,45,r,1,n,1e,2t;vr,y5:1f,3g,1,2c,r,3b,12,4r,2g,27,4u,9,1g,1y,' +
+             '26,1a,47,3o,24,4t;vs,wb:9,1,3g,4u,4b,47,12,k,4e,4q,t,1f,4r,37,4h,2g,7,3m,4x,2t;vy,w2:2g,4x,2t,2a,1f,' +
+             '4e,9,1r,3b,3s,1e,h,r,3x,2c,1g,3g,4t;w3,w8:4u,3g,7,3m,4b,2,1,4e,17,4r,12,1f,9;wb,wh:47,1f,34,e,r,1q,3' +
+             '0,40,i,1m,4u,1p,2a,2,3x,2c,1e;wb,wu:1f,3b,47,1g,r,9,2c,46,4u,3g,34,4h,n,12,1e,e,18,27,2u,1q;wu,xe:2c' +
+             ',2g,2d,1a,h,2o,4r,3b,4u,3o,q,1g,16,1r,y,1f,2,12,1y,3r;x2,x7:4t,3b,4r,4u,16;xe,xj:26,1,1y,1x,25,3g,20' +
+             ',24,1b,1w,21,1z,1f,22,23,36,2y,12,43,4r;xe,y2:1f,3g,27,26,1,1y,25,1x,r,21,20,4r,1n,24,1b,1w,22,12,3b' +
+             ',1z;xj,xo:27,1a,44,4n,1d,3r,16,3w,4b,i,13,3b,2n,3k,q,4c,3g,25,17,1;xk,xo:1a,44,4n,1d,3r,16,13,3b,2n,' +
+             'q,25,17,1,x,49,w,48,3v,2s,4l;xy,y2:3g,1f,2a,t,3b,18,1o,i,2t,1y,4c,3o,3k,n,r,12;y5,115:2t,4t,2n,2a,37' +
+             ',3x,r,9,1e,2o,1g,2l,1o,3b,29,2m,23,5,17,12;y6,z2:2a,28,29,4t,37,e,r,2t,i,1g,1e,3x,a,4r,3s,47,3g,40,3' +
+             'b,4e;yg,yn:2a,a,4t,47,27,i,o,4e,4r,2,4d,3x,1p,2u,r,1g,2t;yi,ym:a,27,2a,47;yr,yy:2a,29,2t,4t,2l,3y,37' +
+             ',3z,r,3x,40,a,4d,9,47,3g,1p,i,4r,12;z2,z8:1j,s,1u,2m,3q,2l,1b,3b,45,3x,n,3g,4t,9;z2,zp:3x,2k,17,2j,2' +
+             'd,1o,2o,4x,3q,37,2i,2c,1u,3b,12,2e,1j,2g,4l,10;z4,z8:1j,s,1u,2m,3q,2l,3b,45,n;zg,zp:4x,1q,3x,3q,1o,4' +
+             'w,12,1v,1u,3y,1f,29,1a,2n,r,4t,3b,1,9,37;zk,zo:1q,3x,3y,4t,9;zp,10a:2,2t,1e,r,4h,9,1g,4v,43,2h,4t,8,' +
+             'o,2u,b,2y,1f,4u,2q,4e;zy,102:r,2t,4t,1p;zy,103:r,2t,4t,2q,1e,4e,1p,3b,16,2,47,9;zy,104:r,2t,4t,b,2q,' +
+             '1e,4e,1p,2u,3b,16,2,47,9;105,109:4h,4v,2;10b,10h:3z,9,n,p,1e,4e,1c,2q,1w,10,1g,1o,45,16,17,f,4x,23,1' +
+             '9,4r;10b,10n:2l,3z,9,23,n,2q,13,2t,1g,p,h,4t,1k,1e,4e,1c,1w,10,2a,2u;10b,10x:2n,2l,2m,3z,16,5,9,n,23' +
+             ',13,3a,1o,37,2t,2q,2u,1k,4r,3i,3r;10h,10m:23,13,2t,2q,h,5,4t,2u,1g;10r,10x:2n,16,3a,5,4n,42,15,4r,7,' +
+             '1b,2w,3i,4h,21,3r,13,37,1o,1d,2u;10s,10w:2n,5,16,42,15,4r,7,3i,3a,4h,21,3r,13,37,1o,1d,4n,25,4,3b;10' +
+             'x,114:2o,1y,1e,4t,2v,r,z,10,1g,25,5,4f,32,2t,h,4h,1q,4r,3n,1;10y,112:2o,2v,1y,1e,5,4f,32,h,z,10,4h,r' +
+             ',25,2t;115,128:2e,3w,9,4l,4r,1g,2p,27,40,4t,n,1e,3k,4s,4u,18,r,1c,47,4c;116,11c:18,3v,9,4c,3d,4b,3e,' +
+             '47,3k,3f,1e,4t,3w;11c,11q:3w,2p,4u,4t,9,1g,h,12,3k,2u,1f,3g,1u,3r,4s,1j,47,34,1e,2;11h,11l:9,2,q,2c,' +
+             '4t,3i,2z,4d,39,1g,2u,47,1e,2a,40,1x,r,4r,2t,1f;11s,123:4r,40,2q,1g,j,27,4q,1e,16,r,2,4v,1z,2s,4m,4p,' +
+             '4l,4k,2p,3d;11w,122:4r,40,16,2,1g,r,1z,2s,4m,4p,4l,4k,2p,3d,3h,2i,1s,2d,4j,3l;123,128:2e,4l,1c,10,4s' +
+             ',4r,n,r,17,24,2x,36,45,38,2a,3p,3o,2k,1k,1y;128,12c:1e,1q,4u,4t,1p,9,12;128,12f:1e,4u,1g,39,1q,9,45,' +
+             '3o,4t,47,n,1p,2u,12;128,13z:2u,1g,1e,2t,3s,2q,4t,23,1f,39,47,3g,r,9,2r,2,2s,u,i,4s;12h,12o:r,4t,2u,2' +
+             'l,2m,2o,4a,h,l,39,3s,0,a,1g,g,31,3g,1o,2t,2a;12i,12n:4t,0,a,3s,3g,1g,2t;12r,12v:u,39,2n,1f,3g,1e,9,1' +
+             '2,r,i,1,1a,22,3x,w,48,1q,2c,4x,3;12v,12z:2s,2q,2r,2,2k,3j,s,4d,4t,1p;12v,13e:2u,23,2t,2q,1f,1g,2s,i,' +
+             '2r,2,4d,2k,4n,3k,4t,21,4s,3g,30,2c;131,13e:2u,23,2t,1f,1g,i,3k,21,4s,4d,3g,4t,2c,4c,1q,2q,22,47,4r,4' +
+             'a;132,139:2u,2t,1f,1g,i,4s,4t,1q,2q,4r,4a,4n,36,e,1o,4v,3s,4d,2c,3g;132,13e:2u,23,2t,1f,1g,i,3k,4s,4' +
+             'd,3g,4t,2c,4c,1q,2q,22,47,4r,4a,4n;134,138:2u,2t,4s,1f,2q,4a,36,e,1o,4v,3s,4d,1g,2c,47,4t;13a,13e:23' +
+             ',3k,4c,22,3g,3w,2c,5,21,25,47;13e,13m:1c,3s,2y,k,1e,14,4i,a,p,2e,9,1q,2c,1y,47,5,1g,r;13o,13u:16,1w,' +
+             '4c,3s,4s,9;13u,13y:3p,30,u,47,12,2u,1e,3g,2t,r;13z,18p:9,1e,2z,47,2t,2,2x,30,12,4t,2v,16,r,25,1p,3r,' +
+             '4r,l,2y,1f;140,14t:9,13,l,40,4,4d,1q,2,4c,1e,37,3k,49,47,8,4q,17,1a,4j,2y;14b,14f:1a,40,n,1e;14b,14k' +
+             ':l,4c,40,1e,1a,9,f,2v,3,1q,n,3v,3w,2t,3k,4s,1x,1f,4e,4u;14f,14k:l,4c,9,f,2v,3,1q,1e,3v,3w,2t,3k,4s,4' +
+             '0,1x,1f,4e,4u,18,r;14k,14p:49,2y,35,36,1q,37,3o,3x,47,1g,2u;14u,15b:k,12,3o,n,8,v,s,o,2i,1d,1e,29,20' +
+             ',2t,11,1,47,z,16,10;14x,15a:k,12,3o,n,s,o,29,20,2t,11,1,47,z,16,10,4u,25,4w,28,2l;14y,153:3o,n,k,20,' +
+             '11,z,10,4u,25,4s,4t,12;14z,153:3o,k,20,11,z,10,4u,25,4s,n,4t,12;15d,15h:37,s,3v,1,1p,3g,1f,9;15d,15q' +
+             ':9,2v,2w,l,3g,1f,16,37,s,g,7,1t,42,3v,2,3m,41,3b,3n,1i;15q,15x:16,p,2d,1e,4q,1o,4,20,3z,5,47,9,12,1g' +
+             ';15q,15z:16,p,2d,1e,4q,1o,4,20,4u,3z,5,1x,47,2,9,12,1g,3g,1f;15z,163:3r,16,1a,1t,3i,2i,2,1s,9,3b,1d,' +
+             '2n,17,18,1k,2u,1e,1f,12;15z,16h:3r,18,2,3b,16,2n,25,o,17,2z,r,1f,2m,12,1v,1u,9,1e,1j,13;168,16e:25,3' +
+             'b,13,4n,4u,2t,18,2n,1e,1,r,4r,4x,4b,17,16,i,1q,2,24;16h,16l:4t,3v,1p,1q,2u,1g,47,4r;16h,18i:2z,47,1e' +
+             ',2t,2x,4t,2y,3f,2g,2u,h,4r,25,35,1p,2f,a,4c,1g,r;16l,176:3z,2z,3j,1o,32,25,1n,4r,19,47,2w,1y,3a,3e,3' +
+             'f,2x,34,n,40,1x;16t,171:3j,19,2z,1o,1x,1p,2n,25,4t,47,1e;16u,16y:3j,1x,1p,4t,47;171,176:32,1n,2w,3a,' +
+             '3e,3f,3z,34,2z,40,4v,2t,1l,27,4h,3j,4s,4f,2u,3g;176,17h:2z,1e,2x,2y,35,36,9,f,r,4u,3b,31,l,3s,3v,47,' +
+             '2k,4e,4c,4d;179,17g:2z,1e,2x,2y,35,36,9,f,4u,31,47,2k,4c,4d,r;17a,17g:2z,1e,2x,2y,35,36,9,4u,31,47,2' +
+             'k,4c,4d;17h,18h:47,2t,2g,4t,h,2f,3f,a,12,2u,30,5,4c,39,1g,25,1f,8,r,4a;17l,17q:47,5,2t,1g,8,1q,30,4t' +
+             ',1p,2a,2u,3f,4r,4s,1f,3g,12;17q,17u:2t,r,a,2u,8,27,3x,12,1g;17w,181:4k,4j,4t,35,4a,36,2t,1e,4r;18d,1' +
+             '8h:30,3f,2v,38,7,12,2d,4a,5,q,1n,2r,1p,2k,4c,3s,3g,2c,25,1f;18i,18p:30,1j,0,a,1p,39,2,4r,4t;18p,18y:' +
+             '1p,3l,4,4a,a,38,2t,1f,r,2a,4d,45,47,12,3x,n,9,4t;18q,18y:1p,3l,4,4a,a,38,2t,1f,r,2a,4d,45,47,12,3x,n' +
+             ',4t;18t,18y:1p,3l,4,4a,4d,45,n,2t,1f,r;18y,1d2:4t,3b,4r,2c,1o,31,4h,2u,33,47,36,3x,1g,12,4d,34,3g,r,' +
+             '3p,2d;18z,197:3p,2c,37,3o,2m,3q,2,40,9,4r,4t,r;197,1cf:4t,31,4h,1o,4r,36,1g,34,33,2u,r,47,3g,2d,39,3' +
+             '2,1f,12,4d,21;198,19j:4t,4r,1x,39,23,r,47,1y,12,1e,1f,4v,3f,31,1g,1,p,17,3k,5;19e,19j:1x,4t,1y,31,23' +
+             ',1f,1g,12,r;19j,19s:31,4d,u,47,4u,40,4b,2k,e,4f,1m,2y,1l,4v,24,4h,4r,36,4t,2t;19l,19r:31,4d,u,47,4b,' +
+             'e,4u,4r,4t,2t;19s,1a1:32,4h,1g,2u,2t,2c,21,4t,2n,e,3x,4f,3o,2k,23,5,4u,4d,3g,1f;19v,1a1:1g,2u,2t,4t,' +
+             'e,3o,21,2c,3g,1f,r;1a1,1aa:3b,8,34,2e,4t,9,1m,1l,31,1n,1r,y,1o,1p,4r,12;1aa,1af:4t,39,s,3v,1o,2n;1ai' +
+             ',1am:1n,2a,4s,45,4t,3x,n,3g,r,1f;1ai,1an:1n,2a,2o,4s,2n,17,45,5,4t,3x,n,3g,r,1f;1an,1aw:34,1m,1l,1n,' +
+             '4b,22,b,9,31,4s,1g,1c,40,10,2o,2k,17,16;1ax,1bb:35,36,37,1y,4d,1g,2e,b,4r,45,1b,2u,n,2n,2y,2w,27,3a,' +
+             '2m,p;1b2,1b6:35,36,37,4d,2e,2n,2y,2z,2a,3o,24,n,2k,45,4u,2t,r;1b6,1ba:1y,1b,2w,27,3a,2m,p,g,2l,25,45' +
+             ',2u,4r,1,5,21,n,3g,r;1b6,1bb:1y,1b,2w,27,3a,2m,p,g,2l,25,45,9,2u,4r,1,5,21,n,3g,r;1bb,1bg:r,3g,12,3w' +
+             ',47,1e,4t,1f,3b,3k,23,1p,1x,4u,2u,1g;1bg,1c5:1o,38,2d,36,2y,4h,39,2c,47,1f,3b,3g,42,2,1i,4t,12,a,4b,' +
+             '21;1bm,1bq:1o,3z,1r,y,4h,h,47,12;1br,1c1:2d,39,4h,42,1i,2c,7,34,1m,1l,4a,32,1n,16,2r,1c,z,3k,10,21;1' +
+             'c1,1c5:36,2y,4b,1f,3g,3y,2u,1e,r,2b,4t,24,2e,2c,47,31,4d,4e,2k,4r;1c5,1c9:3,30,23,1p,19,3k,25,40,3w,' +
+             '18,3x,9;1c9,1ce:4s,2g,3j,4v,4h,3w,4t,3g,2u;1cf,1cl:3q,4e,40,4r,47,3g,25,q,43,2d,4f,32,2t,12,1p,2o,1f' +
+             ',4c,2c,3w;1cl,1cy:3a,2c,1t,33,o,3z,3m,t,2u,3q,4e,42,1e,1,3b,l,23,5,4d,18;1cy,1d2:3b,4m,3x,2t,3r,1a,4' +
+             'b,24,2k,1o,25,4s,40,4d,18,2u,12;1d2,1di:2q,3c,3e,3f,3d,4t,12,3w,9,24,2t,2k,2r,4s,o,47,3j,25,31,38;1d' +
+             '2,1k4:9,12,2t,4t,r,5,3g,47,3x,1e,1f,1g,2c,2u,37,3k,3w,1p,2,24;1d3,1d7:3c,24,4t,12,2t,38,20,2,3x,21,2' +
+             'c,1,1k,25;1dd,1di:3e,3f,3d,2r,4s,2q,3w,31,2x,d,4b,2k,2t,47,1g,4t,4d,25;1di,1do:27,1e,2,4p,5,3b,47,1p' +
+             ',9;1do,1du:3s,37,s,3o,45,2r,n,2c,3p,9,2f,2t,2h,h,2o,2m,4c,4r,2g,17;1do,1en:3k,2o,3j,3g,3h,4j,5,3w,3i' +
+             ',2c,4,h,37,q,2t,4c,3s,9,4a,20;1dx,1e7:2o,3h,3i,3g,q,2c,3k,h,3w,10,z,2t,20,4u,r,4s,2n,47,37,4f;1dy,1e' +
+             '6:2o,3h,3i,3g,q,2c,3k,h,3w,10,z,2t,4u,r,2n,47,37,4f,32,i;1e0,1e4:2o,3w,3k,2t,2c,3g,4f,32,i,4a,4u,4h,' +
+             '4,3f,h,q,z,10,27,3s;1eg,1el:3k,4j,5,1a,1o,2,18,4,9,2p,3b,27,3y,23,16,3w,2k,3g,4c,4n;1en,1er:2u,s,5,3' +
+             '4,2m,23,1o,1p,1f,3g,2t;1en,1f5:3l,2u,23,35,5,s,2y,1f,21,37,3g,9,4,2x,36,34,m,2c,1p,1g;1ev,1f0:m,3g,1' +
+             'f,3f,23,21,1g,1e,2u,r,4t;1ev,1f5:3l,23,21,37,2x,35,m,3g,1f,1g,3f,1d,9,1e,4t,4j,q,44,3k,20;1f1,1f5:3l' +
+             ',37,2x,35,23,1d,21,4j,q,44,3k,20,4a,4k,e,2z,1p,2y,1q,4n;1f5,1fs:3m,1f,3g,y,r,3n,2h,1r,4t,12,9,2u,43,' +
+             '3x,1q,1g,1p,2t,h,2a;1fc,1fk:3m,1q,1p,5,20,r,4t,3h,2a,1g,3u,7,12,21,2o,4s,1,2,3x,25;1fg,1fk:20,1q,3h,' +
+             '21,2o,5,25,1x,h,4t,1f,r;1fv,1g6:3p,3q,3o,9,1e,5,37,n,f,23,1k,3b,45,3x,2c,4t;1fx,1g1:1e,5,9,n,3b,37,4' +
+             't;1g1,1g6:3q,9,23,1k,5;1g6,1ga:2t,1e,2c,4p,2,y,1o,h,2n,1g,2a,2u,r,9;1g6,1gc:2t,1e,2c,9,4p,5,2,y,1o,h' +
+             ',2n,1g,2a,2u,r;1gf,1gy:3s,47,2c,4t,2,1p,9,2t,30,a,12,1i,1e,6,3u,2r,4v,r,2f,o;1gi,1gn:3s,47,4t,30,2f,' +
+             'o,s,1p,3x,3o,2t,h,9,r,12;1gn,1gr:3s,2a,4t,1e,1g,9,2t;1gs,1gx:2c,2r,2,12,47,2t,9;1gt,1gx:2c,12,47,2t,' +
+             '9;1gy,1h4:3t,r,1o,4m,2d,1f,1a,12,2c,2v,7,3,1,3m,3g,4e,1k,3b,9,1g;1gy,1hm:12,3t,37,r,4t,47,1x,3b,9,29' +
+             ',d,k,1o,o,1,5,4m,2d,1f,1a;1h4,1he:12,4t,1x,47,29,d,37,3b,k,o,r,24,2a,1q,1p,25,45,3w,21,3k;1h4,1hf:12' +
+             ',47,4t,1x,29,d,37,3b,k,o,5,r,q,24,2a,1q,1p,25,45,3w;1h5,1he:12,4t,1x,47,29,d,3b,k,o,r,24,2a,1q,1p,25' +
+             ',45,3w,21,3k,2u;1h8,1hc:12,4t,47,r,29,1q,25,45,1x,3w,3b,3k,2u,37,16,1,n,4r,3g;1h8,1hd:12,4t,29,3b,1x' +
+             ',r,47,24,1q,1p,25,45,3w,21,3k,2u,37,16,1,n;1h8,1he:12,4t,1x,29,3b,r,47,24,1q,1p,25,45,3w,21,3k,2u,37' +
+             ',16,1,n;1hf,1hj:37,9;1hn,1i5:24,40,3u,3v,3w,0,u,2t,4,4a,25,1g,44,4t,12,1b,3g,a,4c,r;1hn,1iy:40,3x,24' +
+             ',2t,n,4w,25,2a,45,3y,3v,4t,1p,3z,3u,12,3w,r,1g,2u;1hq,1hu:3u,3v,4t,a,12,r,2t,u,1z,44,3m,20,1y,l,1g,1' +
+             'k,1f,3g,2u,3k;1hq,1hv:3u,3v,4t,a,4,12,r,2t,u,1z,44,3m,20,1y,l,1g,1k,1f,3g,2u;1hv,1i0:3w,4a,4c,2,23,1' +
+             'e,4,1c,z,2t,2u,2p,3j,4u,u,2o,2n,16,4s,21;1i0,1i4:24,0,1b,36,35,2y,4d,25,3x,12,r;1i5,1ic:2t,9,3q,1q,2' +
+             'u,1f,3x,1p,30,2a,1g,u,i,28,p,33,12,29,17,16;1ih,1ix:3x,n,4w,45,2a,3z,40,3y,1p,2t,36,r,25,1x,12,4t,2c' +
+             ',33,4x,4r;1ij,1io:3x,45,n,36,12,1f,4g,2a,3s,38,3c,4w,47,1p,33,37,25,4t,2u,r;1ij,1iq:4w,3x,45,n,36,2a' +
+             ',4x,37,12,2t,1f,4g,3s,38,1k,3c,47,1p,33,25;1iy,1j7:41,1g,o,33,30,20,2v,6,3u,3,3n,45,3s,21,1e,n,1k,2u' +
+             ',3w,2t;1iy,1ju:41,42,4q,2w,3a,7,3m,g,f,2t,1e,9,12,r,1g,4u,1f,2,5,1k;1j1,1j7:41,o,33,30,2v,6,3u,3,3n,' +
+             '45,3s,1e,n,1k,2u,1g,3w,2t,1f,3g;1j2,1j7:41,o,33,2v,6,3u,3,3n,45,3s,1e,n,1k,2u,1g,3w,2t,1f,3g,12;1j7,' +
+             '1jb:1p,2,37,1e,23,4s,4u,3x,2t;1ji,1jp:42,2w,3a,7,3m,1f,12,c,3g,g,2,r,x,w,48,3k,16,4u,4r,27;1jk,1jo:4' +
+             '2,2w,3a,7,3m,1f,c,3g,g,2,12,r,x,w,48,3k,16,4r,27,3w;1jk,1jp:42,2w,3a,7,3m,1f,c,3g,g,2,12,r,x,w,48,3k' +
+             ',16,4r,27,3w;1jx,1k4:43,4n,18,1j,2t,1u,2w,3a,4r,2m,2l,2,2k,1k,45,4d,5,n,1g,47;1k0,1k4:1j,2t,1u,2,5,1' +
+             'g,47,4r;1k4,1k8:2y,9,2x,4b,35,36,1n,4s,4u;1k4,1kh:9,2y,3g,2x,22,4b,1f,i,35,23,36,45,27,1n,1p,n,5,2,4' +
+             's,4u;1k4,1ns:9,1f,r,2u,40,4e,1g,4d,3g,12,1e,23,3s,2t,4t,4u,1,48,49,4r;1kh,1l5:46,45,1w,44,24,23,1z,4' +
+             'o,25,21,36,2y,4u,20,22,12,47,40,3x,4r;1kj,1kn:2n,4u,47,4r,4t;1kp,1kt:1w,44,1z,4o,3m,2a,2k,u,3w,12,3x' +
+             ',2t,1k,40,r,3k,4d,18;1kt,1ky:46,45,4g,3s,3g,36,1f,m,25,21,38,33,4r,3c,1g,2b,j,2u,3z,2c;1l5,1lu:r,4t,' +
+             '48,49,1f,1e,2u,4r,2t,4v,9,4u,47,h,1g,3f,3s,3g,12,i;1l6,1ld:h,r,4t,2u,i,2t,3f,47,4a,1g,1p,4u,2y,39,1f' +
+             ',4r,4v,31,18,17;1ld,1li:12,3p,s,27,3w,9,r,3g,1f;1ld,1lo:1e,4v,12,9,3g,3p,r,s,1f,27,47,3w,2c;1li,1ln:' +
+             '4v,1e,47,9,3g,1f,r;1lu,1m5:4a,4c,4b,4p,9,18,2k,3r,3k,1o,1a,1e,13,3w,19,3f,22,4d,1x,1m;1m5,1mi:4d,13,' +
+             '2i,1s,1d,3i,4k,1n,1e,1q,2o,9,2k,4o,r,2n,16,z,2u,10;1m8,1mc:4d,13,2i,1s,1d,3i,4k,z,10,2k,2o,2n,1c,11,' +
+             '17,16,h,30,9,3l;1mi,1mu:1h,2u,12,1i,3g,0,1w,4r,4,41,6,3u,1f,4q,34,4t,1,r,2,27;1mi,1nd:4e,40,2u,1f,1,' +
+             '1g,u,w,48,x,49,3v,1h,9,3g,1e,12,l,4t,4r;1mp,1mt:1h,1i,0,41,6,3u,12,r;1mw,1n1:40,1f,4e,2t,2u,1e,1g,9;' +
+             '1mw,1n6:40,1f,9,1e,u,4e,2t,2u,1g;1n7,1nc:4e,1,w,48,x,49,3v,2u,1g,u,l,40,1f,3g,4t,12,2r,5,9,1y;1nd,1n' +
+             'm:3s,23,5,3o,h,22,9,2f,4,40,s,3b,2t,r,12,z,10,2n,2o,25;1nh,1nm:23,5,22,4,40,z,10,2n,h,2o,25,r;1ni,1n' +
+             'm:23,22,5,4,40,z,10,2n,h,2o,25,r;1no,1ns:r,3f,l,1f,2f,42,29,1r,y,4e,23,3s,1x,4r,4t,12,3g,9;1ns,1p5:4' +
+             'h,4s,4g,4u,3x,2,4f,4v,39,23,4t,2t,2c,a,25,21,b,40,r,3k;1nu,1oq:4h,4g,4f,3x,4v,a,2,4s,23,21,b,2l,40,3' +
+             '2,25,2c,0,4x,45,38;1nw,1o1:38,34,3l,4a,1m,1l,4s,1n,37,5;1nx,1o1:34,3l,4a,1m,1l,4s,1n,37,5;1o1,1o5:4x' +
+             ',a,30,21,39,4r,3k,4t,2t,47,12;1o1,1o6:4x,a,b,30,21,39,4r,3k,4t,2t,47,12;1o1,1o8:4h,4f,4v,b,32,4x,a,3' +
+             '0,21,2t,39,4r,1c,4u,z,10,3k,2k,4t,17;1ob,1oh:2l,0,a,r,2m,1v,4w,28,27,29,45,n;1ol,1oq:4g,3x,40,25,21,' +
+             '3o,2,23,4s,2c,24,1k,45,n,2t,2u,1f;1oq,1ov:4u,2d,25,2,1r,y,4s,2g,2c,1o,3k,r;1ov,1p5:4h,39,4t,1e,1b,4s' +
+             ',2t,u,2g,3b,1j,1p,3y,3z,3s,29,23,1x,4u,1g;1ow,1p2:39,1b,u,3y,29,23,1x,4u,4s,1l,3b,4v,4t,2g,1m,1e,1p,' +
+             '8,o,2e;1p5,1q0:4i,1f,4n,1e,12,4m,4o,4p,4l,4k,37,4j,4d,2a,3g,l,4r,30,4u,1g;1p6,1pa:1e,12,3g,1f,45,27,' +
+             '2a,3o,n,4t;1p6,1pg:1f,2a,12,1e,3g,45,4t,r,2q,1w,37,27,3o,n,9,1p;1pb,1pf:1f,12,2q,1w,2a,9,1p,4t,r;1pb' +
+             ',1pg:1f,12,r,2q,1w,37,2a,9,1p,4t;1pg,1pr:4i,4r,l,1g,4u,2,3b,4q,1p,2w,3a,30,x,49,v,w,48,26,42,2l;1pj,' +
+             '1pq:4i,l,1g,4u,2,3b,1p,2w,3a,30,42,2l,1a,3p,4,3q,3f,2u,3r,1k;1pr,1py:4m,4o,4p,4l,4k,4n,4j,4d,5,30,4e' +
+             ',2l,3p,4,l,q,2d,h,1w,4a;1q0,1rt:4u,1p,1g,4t,q,e,4r,4q,3k,5,3g,4e,47,9,34,25,4v,16,2,r;1q1,1qf:1g,2,3' +
+             'f,3,25,3v,2o,39,4,1p,s,4e,31,3w,9,4u,o,3g,40,1q;1q6,1qa:2,3v,39,1g,40;1qf,1qj:33,47,1g,2t;1qf,1qk:4q' +
+             ',33,8,47,1k,1g,2t,1x,3w,21,25,12;1qf,1qt:4q,4u,47,20,1,2t,r,p,33,1x,21,25,1g,3w,3g,8,12,4r,26,2;1ql,' +
+             '1qp:1,r,2t,26,1y,20,1x,41,6,3u,1j,g,25,21,12,4r,3w;1qt,1r1:4v,4t,4u,4s,5,4r,2x,2u,4o,27,4h,4,16,21,4' +
+             '0,1p,25,1g,9;1r1,1re:q,3k,e,27,47,5,1e,3g,3e,4d,26,2o,3j,1p,r,12,2p,1x,h,3w;1r6,1ra:e,27,26,5,1x,2z,' +
+             '13,2y,1n,4r,2k,4d,18,2c,3g;1re,1rp:34,1p,4u,4e,4b,9,c,4t,30,3g,1g,4f,32,r,4r,1f,4k,4j,20,e;1rh,1ro:3' +
+             '4,1p,4u,4b,c,30,3g,4f,32,e,4t,16,9,4v,z,2,19,4s,22,1m;1rp,1rt:0,a,4e,17,16,9;1ru,1s5:4w,4x,9,31,2,45' +
+             ',25,1k,n,27,1f,3k,2a,37,36,3g,24,2z,u,22;1s1,1s5:9,31,2,25,3k,2z,u,22,1f,3i,40,27,18,2a,3w,1p,1g,3g,' +
+             '1e,12',
+};